@@ -39,23 +39,31 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, TextIO
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from ai_rpg_world.application.trace.index import load_trace_dicts  # noqa: E402
+
 SPEECH_TOOL_PREFIX = "speech_"
 SPEECH_OBSERVATION_CATEGORY = "speech"
 
 
-def iter_trace_events(paths: Sequence[Path]) -> Iterable[Dict[str, Any]]:
-    """JSONL 群を 1 件ずつ dict として yield。壊れた行は skip。"""
+# 集計に使う kind (発話 action と speech observation)
+_SPEECH_KINDS = ("action", "observation")
+
+
+def iter_trace_events(
+    paths: Sequence[Path], *, kinds: Optional[Sequence[str]] = None
+) -> Iterable[Dict[str, Any]]:
+    """JSONL 群を 1 件ずつ dict として yield。壊れた行は skip。
+
+    ``kinds`` を渡すとその kind だけ返す。sidecar index があれば該当行だけを読む。
+    """
     for p in paths:
-        with p.open("r", encoding="utf-8") as f:
-            for line_no, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    yield json.loads(line)
-                except json.JSONDecodeError:
-                    # 壊れた 1 行で集計を止めない方を優先
-                    continue
+        yield from load_trace_dicts(p, kinds=kinds)
 
 
 def extract_speech_actions(events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -206,7 +214,7 @@ def percentiles(values: List[int], pcts: Sequence[float]) -> Dict[str, Optional[
 
 
 def summarize(paths: Sequence[Path]) -> Dict[str, Any]:
-    events = list(iter_trace_events(paths))
+    events = list(iter_trace_events(paths, kinds=_SPEECH_KINDS))
     actions = extract_speech_actions(events)
     observations = extract_speech_observations(events)
     runs = consecutive_runs(actions)
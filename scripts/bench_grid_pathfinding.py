@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""AStarPathfindingStrategy と GridPathfindingStrategy を比べるベンチマーク。
+
+# 何を測るか
+
+街区状のタイルマップ (``bench_physical_map_tile_grid.build_city_tiles``) を 2 種類
+用意し、同じ始点 / 終点の組を両 strategy で解いて合計時間を比べる:
+
+- ``mixed``: 道路・草地・藪・水・壁が混在する (地形コストが混在するので整数 id の A*)
+- ``uniform``: 通行可能な地形を道路に揃えたもの (一様コストなので JPS)
+
+``data/maps/*.json`` は spot graph 定義でタイルを持たないため、bundled map の
+各 spot を seed にしてタイルマップを生成する (spot ごとに街区の配置が変わる)。
+
+十分大きな ``--max-iterations`` で解いた経路のコストが両者で一致することを確かめ、
+加えて既定の ``max_iterations=1000`` で「ゴールに届かず部分経路になった件数」も出す。
+
+# 使い方
+
+```
+python scripts/bench_grid_pathfinding.py --size 120 --paths 30
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src", _REPO_ROOT / "scripts"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from bench_physical_map_tile_grid import build_city_tiles  # noqa: E402
+
+from ai_rpg_world.domain.world.aggregate.physical_map_aggregate import (  # noqa: E402
+    PhysicalMapAggregate,
+)
+from ai_rpg_world.domain.world.entity.tile import Tile  # noqa: E402
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate  # noqa: E402
+from ai_rpg_world.domain.world.value_object.movement_capability import (  # noqa: E402
+    MovementCapability,
+)
+from ai_rpg_world.domain.world.value_object.spot_id import SpotId  # noqa: E402
+from ai_rpg_world.domain.world.value_object.terrain_type import TerrainType  # noqa: E402
+from ai_rpg_world.infrastructure.world.pathfinding import (  # noqa: E402
+    AStarPathfindingStrategy,
+    GridPathfindingStrategy,
+)
+
+_DEFAULT_MAPS = sorted((_REPO_ROOT / "data" / "maps").glob("*.json"))
+
+
+def _bundled_spot_ids(paths: List[Path]) -> List[str]:
+    spot_ids: List[str] = []
+    for path in paths:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        spot_ids.extend(str(spot["id"]) for spot in data.get("spots", []))
+    return spot_ids
+
+
+def _uniform(tiles: List[Tile]) -> List[Tile]:
+    walk = MovementCapability.normal_walk()
+    return [
+        Tile(t.coordinate, TerrainType.road() if t.terrain_type.can_pass(walk) else t.terrain_type)
+        for t in tiles
+    ]
+
+
+def _path_cost(aggregate: PhysicalMapAggregate, path: List[Coordinate], walk: MovementCapability) -> float:
+    total = 0.0
+    for a, b in zip(path, path[1:]):
+        diagonal = a.x != b.x and a.y != b.y
+        total += aggregate.get_movement_cost(b, walk) * (math.sqrt(2) if diagonal else 1.0)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=120, help="マップの一辺 (タイル数)")
+    parser.add_argument("--paths", type=int, default=30, help="1 マップあたりの経路数")
+    parser.add_argument("--spots", type=int, default=3, help="使う bundled spot の数")
+    parser.add_argument("--max-iterations", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    spot_ids = _bundled_spot_ids(_DEFAULT_MAPS)[: args.spots] or ["synthetic"]
+    walk = MovementCapability.normal_walk()
+    strategies = {"astar": AStarPathfindingStrategy(), "grid": GridPathfindingStrategy()}
+    totals: Dict[Tuple[str, str], float] = {}
+    partials: Dict[Tuple[str, str], int] = {}
+
+    for spot_index, spot_id in enumerate(spot_ids):
+        base_tiles = build_city_tiles(args.size, zlib.crc32(spot_id.encode("utf-8")))
+        for layout, tiles in (("mixed", base_tiles), ("uniform", _uniform(base_tiles))):
+            aggregate = PhysicalMapAggregate.create(SpotId(spot_index + 1), tiles)
+            rng = random.Random(args.seed + spot_index)
+            walkable = [t.coordinate for t in tiles if t.terrain_type.can_pass(walk)]
+            pairs = [(rng.choice(walkable), rng.choice(walkable)) for _ in range(args.paths)]
+
+            found: Dict[str, List[List[Coordinate]]] = {}
+            for name, strategy in strategies.items():
+                started = time.perf_counter()
+                found[name] = [
+                    strategy.find_path(a, b, aggregate, walk, max_iterations=args.max_iterations)
+                    for a, b in pairs
+                ]
+                totals[(layout, name)] = totals.get((layout, name), 0.0) + time.perf_counter() - started
+                partials[(layout, name)] = partials.get((layout, name), 0) + sum(
+                    1
+                    for (a, b) in pairs
+                    if (path := strategy.find_path(a, b, aggregate, walk, allow_partial_path=True))
+                    and path[-1] != b
+                )
+
+            for (a, b), reference, candidate in zip(pairs, found["astar"], found["grid"]):
+                if bool(reference) != bool(candidate) or not math.isclose(
+                    _path_cost(aggregate, reference, walk), _path_cost(aggregate, candidate, walk), rel_tol=1e-9
+                ):
+                    raise SystemExit(f"{spot_id}/{layout}: path cost differs for {a} -> {b}")
+
+    print(f"spots={len(spot_ids)} size={args.size} paths/spot={args.paths}")
+    for layout in ("mixed", "uniform"):
+        astar = totals[(layout, "astar")]
+        grid = totals[(layout, "grid")]
+        print(
+            f"{layout:8s}: astar {astar * 1000:9.1f} ms  grid {grid * 1000:9.1f} ms  "
+            f"({astar / max(grid, 1e-9):5.1f}x)  partial@1000: astar {partials[(layout, 'astar')]} "
+            f"grid {partials[(layout, 'grid')]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""PhysicalMapAggregate の範囲 query を spatial index と全走査で比べるベンチマーク。
+
+# 何を測るか
+
+数千の静的オブジェクト (宝箱・資源など) と数百の移動 actor を置いたマップで、
+1 tick ごとに「全 actor を 1 マス動かす → 各 actor の視界 query
+(``get_objects_in_range_bulk``) → 衝突判定相当の 1 マス query
+(``get_objects_in_range(coord, 0)``)」を繰り返し、1 tick あたりの時間を出す。
+
+比較対象の全走査は index 導入前の実装 (``_objects`` を毎回なめる) と同じ式を
+ここで再現したもの。両者の結果が一致することも毎 tick 確かめる。
+
+# 使い方
+
+```
+python scripts/bench_physical_map_spatial_index.py --static 5000 --actors 300 --ticks 20
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from ai_rpg_world.domain.common.value_object import WorldTick  # noqa: E402
+from ai_rpg_world.domain.world.aggregate.physical_map_aggregate import (  # noqa: E402
+    PhysicalMapAggregate,
+)
+from ai_rpg_world.domain.world.entity.tile import Tile  # noqa: E402
+from ai_rpg_world.domain.world.entity.world_object import WorldObject  # noqa: E402
+from ai_rpg_world.domain.world.enum.world_enum import ObjectTypeEnum  # noqa: E402
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate  # noqa: E402
+from ai_rpg_world.domain.world.value_object.spot_id import SpotId  # noqa: E402
+from ai_rpg_world.domain.world.value_object.terrain_type import TerrainType  # noqa: E402
+from ai_rpg_world.domain.world.value_object.world_object_id import WorldObjectId  # noqa: E402
+
+
+def _build_map(size: int, static: int, actors: int, seed: int) -> Tuple[PhysicalMapAggregate, List[WorldObjectId]]:
+    rng = random.Random(seed)
+    tiles = [Tile(Coordinate(x, y), TerrainType.road()) for x in range(size) for y in range(size)]
+    aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+    for object_id in range(1, static + 1):
+        aggregate.add_object(
+            WorldObject(
+                WorldObjectId(object_id),
+                Coordinate(rng.randrange(size), rng.randrange(size)),
+                ObjectTypeEnum.RESOURCE,
+                is_blocking=False,
+            )
+        )
+    actor_ids = []
+    for offset in range(actors):
+        object_id = WorldObjectId(static + 1 + offset)
+        aggregate.add_object(
+            WorldObject(
+                object_id,
+                Coordinate(rng.randrange(size), rng.randrange(size)),
+                ObjectTypeEnum.PLAYER,
+                is_blocking=False,
+            )
+        )
+        actor_ids.append(object_id)
+    aggregate.clear_events()
+    return aggregate, actor_ids
+
+
+def _brute_force(aggregate: PhysicalMapAggregate, center: Coordinate, distance: int) -> List[WorldObject]:
+    return [o for o in aggregate.get_all_objects() if center.distance_to(o.coordinate) <= distance]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200, help="マップの一辺 (タイル数)")
+    parser.add_argument("--static", type=int, default=5000, help="静的オブジェクト数")
+    parser.add_argument("--actors", type=int, default=300, help="移動 actor 数")
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--vision", type=int, default=8, help="視界 query の距離")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    aggregate, actor_ids = _build_map(args.size, args.static, args.actors, args.seed)
+    rng = random.Random(args.seed + 1)
+    indexed_total = 0.0
+    brute_total = 0.0
+    for tick in range(1, args.ticks + 1):
+        for actor_id in actor_ids:
+            current = aggregate.get_object(actor_id).coordinate
+            nx = min(args.size - 1, max(0, current.x + rng.choice((-1, 0, 1))))
+            ny = min(args.size - 1, max(0, current.y + rng.choice((-1, 0, 1))))
+            aggregate.move_object(actor_id, Coordinate(nx, ny), WorldTick(tick * 1000))
+        aggregate.clear_events()
+        queries = [(aggregate.get_object(a).coordinate, args.vision) for a in actor_ids]
+
+        started = time.perf_counter()
+        indexed = aggregate.get_objects_in_range_bulk(queries)
+        indexed_cells = [aggregate.get_objects_in_range(center, 0) for center, _ in queries]
+        indexed_total += time.perf_counter() - started
+
+        started = time.perf_counter()
+        brute = [_brute_force(aggregate, center, distance) for center, distance in queries]
+        brute_cells = [_brute_force(aggregate, center, 0) for center, _ in queries]
+        brute_total += time.perf_counter() - started
+
+        if indexed != brute or indexed_cells != brute_cells:
+            raise SystemExit(f"tick {tick}: spatial index result differs from brute force")
+
+    objects = args.static + args.actors
+    print(f"objects={objects} actors={args.actors} size={args.size} vision={args.vision}")
+    print(f"spatial index : {indexed_total / args.ticks * 1000:8.2f} ms/tick")
+    print(f"brute force   : {brute_total / args.ticks * 1000:8.2f} ms/tick")
+    print(f"speedup       : {brute_total / max(indexed_total, 1e-9):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
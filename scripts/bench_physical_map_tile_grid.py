@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""PhysicalMapAggregate のタイル配列表現 (TileGrid) と dict 実装を比べるベンチマーク。
+
+# 何を測るか
+
+- タイル索引のメモリ: ``Dict[Coordinate, Tile]`` と ``TileGrid`` それぞれを
+  同じ Tile 群から作ったときの増分 (tracemalloc)。Tile / Coordinate 実体は
+  両者で共有するので含まない
+- 単発の判定: 全タイルに ``is_passable`` / ``get_movement_cost`` /
+  ``is_sight_blocked`` を 1 回ずつ呼ぶ時間 (経路探索の内側で呼ばれる部分)
+- 経路探索: ``AStarPathfindingStrategy`` でランダムな始点 / 終点を解く時間
+- 視線判定: ``is_visible`` をランダムな座標対で回す時間
+
+同じタイル群から grid を外した集約 (``_grid = None`` / ``_tiles`` を dict に
+戻したもの) を比較対象にし、判定・経路・視線の結果が一致することも確かめる。
+
+``data/maps/*.json`` は spot graph 定義でタイルを持たないため、街区
+(道路 + 建物の壁 + 公園の草地 + 池) を模したタイルマップをここで生成する。
+
+# 使い方
+
+```
+python scripts/bench_physical_map_tile_grid.py --size 120 --paths 40
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from ai_rpg_world.domain.world.aggregate.physical_map_aggregate import (  # noqa: E402
+    PhysicalMapAggregate,
+)
+from ai_rpg_world.domain.world.aggregate.tile_grid import TileGrid  # noqa: E402
+from ai_rpg_world.domain.world.entity.tile import Tile  # noqa: E402
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate  # noqa: E402
+from ai_rpg_world.domain.world.value_object.movement_capability import (  # noqa: E402
+    MovementCapability,
+)
+from ai_rpg_world.domain.world.value_object.spot_id import SpotId  # noqa: E402
+from ai_rpg_world.domain.world.value_object.terrain_type import TerrainType  # noqa: E402
+from ai_rpg_world.infrastructure.world.pathfinding.astar_pathfinding_strategy import (  # noqa: E402
+    AStarPathfindingStrategy,
+)
+
+
+def build_city_tiles(size: int, seed: int, block: int = 12) -> List[Tile]:
+    """街区状のタイルマップ。block ごとに 2 マスの道路で区切り、区画内は建物 / 公園 / 池。"""
+    rng = random.Random(seed)
+    kinds: Dict[Tuple[int, int], str] = {}
+    tiles: List[Tile] = []
+    for y in range(size):
+        for x in range(size):
+            bx, by = x // block, y // block
+            lx, ly = x % block, y % block
+            if lx < 2 or ly < 2:
+                terrain = TerrainType.road()
+            else:
+                kind = kinds.setdefault((bx, by), rng.choice(("building", "building", "park", "pond")))
+                inner_edge = lx in (2, block - 1) or ly in (2, block - 1)
+                if kind == "building":
+                    # 外周を壁にし、1 辺の中央に入口を空ける
+                    door = (ly == 2 and lx == block // 2) or (lx == 2 and ly == block // 2)
+                    terrain = TerrainType.wall() if inner_edge and not door else TerrainType.road()
+                elif kind == "pond" and not inner_edge:
+                    terrain = TerrainType.water()
+                else:
+                    terrain = TerrainType.grass() if rng.random() < 0.8 else TerrainType.bush()
+            tiles.append(Tile(Coordinate(x, y), terrain))
+    return tiles
+
+
+def _without_grid(tiles: List[Tile]) -> PhysicalMapAggregate:
+    clones = [Tile(t.coordinate, t.terrain_type) for t in tiles]
+    aggregate = PhysicalMapAggregate.create(SpotId(2), clones)
+    # 比較用に grid を外し、導入前と同じ dict 実装で動かす
+    aggregate._grid = None
+    aggregate._tiles = {t.coordinate: t for t in clones}
+    return aggregate
+
+
+def _measure_index_bytes(tiles: List[Tile]) -> Tuple[int, int]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    as_dict = {t.coordinate: t for t in tiles}
+    dict_bytes = tracemalloc.get_traced_memory()[0] - before
+    before = tracemalloc.get_traced_memory()[0]
+    grid = TileGrid.build(as_dict)
+    grid_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # grid.build の bind_listener は Tile 側の属性を書き換えるだけなので増分に含まれる
+    del grid
+    return dict_bytes, grid_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=120, help="マップの一辺 (タイル数)")
+    parser.add_argument("--paths", type=int, default=40, help="解く経路の数")
+    parser.add_argument("--sight-pairs", type=int, default=5000, help="視線判定する座標対の数")
+    parser.add_argument("--max-iterations", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    tiles = build_city_tiles(args.size, args.seed)
+    dict_bytes, grid_bytes = _measure_index_bytes(tiles)
+    with_grid = PhysicalMapAggregate.create(SpotId(1), tiles)
+    without_grid = _without_grid(tiles)
+
+    rng = random.Random(args.seed + 1)
+    walk = MovementCapability.normal_walk()
+    walkable = [t.coordinate for t in tiles if t.terrain_type.can_pass(walk)]
+    pairs = [(rng.choice(walkable), rng.choice(walkable)) for _ in range(args.paths)]
+    strategy = AStarPathfindingStrategy()
+
+    coords = [t.coordinate for t in tiles]
+    probe_timings: Dict[str, float] = {}
+    probe_results = {}
+    for label, aggregate in (("tile grid", with_grid), ("dict", without_grid)):
+        started = time.perf_counter()
+        probe_results[label] = [
+            (
+                aggregate.is_passable(c, walk),
+                aggregate.get_movement_cost(c, walk),
+                aggregate.is_sight_blocked(c),
+            )
+            for c in coords
+        ]
+        probe_timings[label] = time.perf_counter() - started
+    if probe_results["tile grid"] != probe_results["dict"]:
+        raise SystemExit("cell probe result differs between tile grid and dict")
+
+    timings: Dict[str, float] = {}
+    results = {}
+    for label, aggregate in (("tile grid", with_grid), ("dict", without_grid)):
+        started = time.perf_counter()
+        results[label] = [
+            strategy.find_path(start, goal, aggregate, walk, max_iterations=args.max_iterations)
+            for start, goal in pairs
+        ]
+        timings[label] = time.perf_counter() - started
+    if results["tile grid"] != results["dict"]:
+        raise SystemExit("pathfinding result differs between tile grid and dict")
+
+    sight_pairs = [(rng.choice(coords), rng.choice(coords)) for _ in range(args.sight_pairs)]
+    sight_timings: Dict[str, float] = {}
+    sight_results = {}
+    for label, aggregate in (("tile grid", with_grid), ("dict", without_grid)):
+        started = time.perf_counter()
+        sight_results[label] = [aggregate.is_visible(a, b) for a, b in sight_pairs]
+        sight_timings[label] = time.perf_counter() - started
+    if sight_results["tile grid"] != sight_results["dict"]:
+        raise SystemExit("line of sight result differs between tile grid and dict")
+
+    n = len(tiles)
+    print(f"tiles={n} size={args.size} paths={args.paths} sight_pairs={args.sight_pairs}")
+    print(f"index bytes/tile: dict {dict_bytes / n:6.1f}  tile grid {grid_bytes / n:6.1f}")
+    print(
+        f"cell probes     : dict {probe_timings['dict'] * 1000:8.1f} ms  "
+        f"tile grid {probe_timings['tile grid'] * 1000:8.1f} ms  "
+        f"({probe_timings['dict'] / max(probe_timings['tile grid'], 1e-9):.2f}x)"
+    )
+    print(
+        f"A* paths        : dict {timings['dict'] * 1000:8.1f} ms  "
+        f"tile grid {timings['tile grid'] * 1000:8.1f} ms  "
+        f"({timings['dict'] / max(timings['tile grid'], 1e-9):.2f}x)"
+    )
+    print(
+        f"line of sight   : dict {sight_timings['dict'] * 1000:8.1f} ms  "
+        f"tile grid {sight_timings['tile grid'] * 1000:8.1f} ms  "
+        f"({sight_timings['dict'] / max(sight_timings['tile grid'], 1e-9):.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
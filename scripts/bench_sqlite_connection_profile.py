@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""SQLite の接続 profile / per-thread 接続プールの有無で記憶書き込みと tick 相当の処理量を比べるベンチマーク。
+
+# 何を測るか
+
+- 記憶書き込み: 1 スレッドで ``put_by_being`` (episode) と ``upsert_link_by_being``
+  (リンク) を繰り返したときの 1 秒あたり件数。どちらも 1 呼び出し 1 commit
+- tick 相当: 1 tick で Being ごとに「cue 想起 (``list_by_cues_by_being``) →
+  直近取得 → episode 保存 → リンク 3 本更新」を行い、Being をワーカースレッド
+  (Phase A 相当) に振り分けたときの 1 秒あたり tick 数
+
+比較するのは次の 2 つ。
+
+- ``before``: 接続 profile なし (rollback journal / ``synchronous=FULL``) の
+  ``sqlite3.connect(check_same_thread=False)`` 1 本を全スレッドで共有する。
+  1 本の接続を複数スレッドから同時に使うと SQLite 側のトランザクションが
+  混ざるので、ここでは lock で直列化する (従来は呼び出し側が直列に使っていた)
+- ``after``: ``SqliteConnectionPool`` (WAL / ``synchronous=NORMAL`` ほか) で、
+  スレッドごとに接続を持つ
+
+episode は ``bench_subjective_episode_payload.py`` と同じ生成器で作る。
+
+# 使い方
+
+```
+python scripts/bench_sqlite_connection_profile.py --writes 2000 --ticks 50 --beings 8 --workers 4
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from ai_rpg_world.domain.being.value_object.being_id import BeingId  # noqa: E402
+from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (  # noqa: E402
+    MemoryLink,
+    MemoryLinkType,
+)
+from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode import (  # noqa: E402
+    SubjectiveEpisode,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import (  # noqa: E402
+    SqliteConnectionPool,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_memory_link_store import (  # noqa: E402
+    SqliteMemoryLinkStore,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_subjective_episode_store import (  # noqa: E402
+    SqliteSubjectiveEpisodeStore,
+)
+from scripts.bench_subjective_episode_payload import build_episodes  # noqa: E402
+
+
+class _LockedConnection:
+    """``before`` 用: 1 本の接続への操作を lock で直列化する薄い包み。"""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self.lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn.__enter__()
+
+    def __exit__(self, *exc: Any) -> Any:
+        return self._conn.__exit__(*exc)
+
+
+def _open(mode: str, path: str) -> Any:
+    if mode == "before":
+        return _LockedConnection(sqlite3.connect(path, check_same_thread=False))
+    return SqliteConnectionPool(path)
+
+
+def _link(being_id: BeingId, player_id: int, a: SubjectiveEpisode, b: SubjectiveEpisode) -> MemoryLink:
+    return MemoryLink(
+        link_id=f"{a.episode_id}|{b.episode_id}",
+        player_id=player_id,
+        being_id=being_id,
+        episode_id_a=a.episode_id,
+        episode_id_b=b.episode_id,
+        link_type=MemoryLinkType.TEMPORAL,
+        strength=0.5,
+        co_activation_count=1,
+        created_at=a.occurred_at,
+        last_activated_at=b.occurred_at,
+        decay_rate=0.05,
+    )
+
+
+def bench_writes(mode: str, path: str, episodes: List[SubjectiveEpisode]) -> Dict[str, float]:
+    conn = _open(mode, path)
+    store = SqliteSubjectiveEpisodeStore(conn, decoded_cache_size_per_being=0)
+    links = SqliteMemoryLinkStore(conn)
+    being = episodes[0].being_id
+    t0 = time.perf_counter()
+    for ep in episodes:
+        store.put_by_being(being, ep)
+    ep_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for a, b in zip(episodes, episodes[1:]):
+        links.upsert_link_by_being(being, _link(being, 1, a, b))
+    link_s = time.perf_counter() - t0
+    conn.close()
+    return {"episodes_per_s": len(episodes) / ep_s, "links_per_s": (len(episodes) - 1) / link_s}
+
+
+def bench_ticks(
+    mode: str,
+    path: str,
+    episodes: List[SubjectiveEpisode],
+    *,
+    ticks: int,
+    beings: int,
+    workers: int,
+) -> float:
+    conn = _open(mode, path)
+    store = SqliteSubjectiveEpisodeStore(conn, decoded_cache_size_per_being=0)
+    links = SqliteMemoryLinkStore(conn)
+    being_ids = [BeingId(f"being_w1_p{i + 1}") for i in range(beings)]
+    # 各 Being に履歴を先に積んでおく
+    history = len(episodes) // 2
+    for i, bid in enumerate(being_ids):
+        for ep in episodes[:history]:
+            store.put_by_being(bid, replace(ep, being_id=bid, player_id=i + 1))
+    lock = conn.lock if mode == "before" else None
+
+    def step(tick: int, index: int) -> None:
+        bid = being_ids[index]
+        ep = episodes[history + tick % (len(episodes) - history)]
+        ep = replace(
+            ep,
+            episode_id=f"t{tick:05d}-{ep.episode_id}",
+            being_id=bid,
+            player_id=index + 1,
+            occurred_at=ep.occurred_at + timedelta(days=tick),
+        )
+
+        def body() -> None:
+            store.list_by_cues_by_being(bid, ep.cues, 10)
+            recent = store.list_recent_by_being(bid, 3)
+            store.put_by_being(bid, ep)
+            for prev in recent:
+                links.upsert_link_by_being(bid, _link(bid, index + 1, prev, ep))
+
+        if lock is None:
+            body()
+        else:
+            with lock:
+                body()
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        t0 = time.perf_counter()
+        for tick in range(ticks):
+            list(ex.map(lambda i: step(tick, i), range(beings)))
+        elapsed = time.perf_counter() - t0
+    conn.close()
+    return ticks / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--beings", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    episodes = build_episodes(args.writes, args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("before", "after"):
+            w = bench_writes(mode, os.path.join(tmp, f"w-{mode}.db"), episodes)
+            t = bench_ticks(
+                mode,
+                os.path.join(tmp, f"t-{mode}.db"),
+                episodes[: max(200, args.ticks * 2)],
+                ticks=args.ticks,
+                beings=args.beings,
+                workers=args.workers,
+            )
+            print(
+                f"{mode:>6}: put_by_being {w['episodes_per_s']:8.0f}/s, "
+                f"upsert_link {w['links_per_s']:8.0f}/s, "
+                f"ticks {t:7.1f}/s ({args.beings} beings, {args.workers} workers)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""SubjectiveEpisode の SQLite payload (v1 キー付き JSON / v2 compact 配列) を比べるベンチマーク。
+
+# 何を測るか
+
+- 保存サイズ: 同じ episode 群を v1 / v2 で書いたときの ``payload_json`` 合計
+  バイト数と DB ファイルサイズ
+- decode 時間: 全行を ``_decode_payload`` で ``SubjectiveEpisode`` に戻す時間
+  (decode 済み LRU を通さない素の decode)
+- 受動想起の cue 検索: 同じ cue 集合で ``list_cue_headers_by_being`` (payload を
+  読まない見出し) と ``list_by_cues_by_being`` (全件を組み立てる) の時間。
+  どちらも LRU を無効にした store で測る
+
+長走を模して、1 Being が tick ごとに episode を積み、場所 / 相手 / 物の cue が
+偏った分布で繰り返し現れる episode 群をここで生成する。
+
+# 使い方
+
+```
+python scripts/bench_subjective_episode_payload.py --episodes 5000 --queries 200
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from ai_rpg_world.domain.being.value_object.being_id import BeingId  # noqa: E402
+from ai_rpg_world.domain.memory.episodic.value_object.episode_action import EpisodeAction  # noqa: E402
+from ai_rpg_world.domain.memory.episodic.value_object.episode_location import EpisodeLocation  # noqa: E402
+from ai_rpg_world.domain.memory.episodic.value_object.episode_source import EpisodeSource  # noqa: E402
+from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue import EpisodicCue  # noqa: E402
+from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue_source import (  # noqa: E402
+    EpisodicCueSource,
+)
+from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode import (  # noqa: E402
+    SubjectiveEpisode,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_subjective_episode_store import (  # noqa: E402
+    SqliteSubjectiveEpisodeStore,
+    _decode_payload,
+    _episode_to_payload_dict,
+)
+
+_BEING = BeingId("being_w1_p1")
+_START = datetime(2026, 6, 1, 6, 0, tzinfo=timezone.utc)
+
+
+def build_episodes(count: int, seed: int) -> List[SubjectiveEpisode]:
+    rng = random.Random(seed)
+    spots = list(range(1, 25))
+    people = [f"npc_{i}" for i in range(30)]
+    objects = [f"item/{kind}/{i}" for kind in ("tool", "food", "key") for i in range(10)]
+    tools = ("move_to", "speak", "pick_up", "use_item", "observe")
+    out: List[SubjectiveEpisode] = []
+    for i in range(count):
+        spot = rng.choice(spots[: 4 + i % 20])
+        who = tuple(rng.sample(people[:12], rng.randint(0, 2)))
+        cues = [EpisodicCue(axis="place_spot", value=str(spot), source=EpisodicCueSource.RUNTIME_CONTEXT)]
+        cues += [EpisodicCue(axis="entity", value=w, source=EpisodicCueSource.RUNTIME_CONTEXT) for w in who]
+        if rng.random() < 0.5:
+            cues.append(EpisodicCue(axis="object", value=rng.choice(objects), source=EpisodicCueSource.OBSERVATION_STRUCTURED))
+        occurred = _START + timedelta(minutes=10 * i)
+        out.append(
+            SubjectiveEpisode(
+                episode_id=f"ep-{i:06d}",
+                player_id=1,
+                being_id=_BEING,
+                occurred_at=occurred,
+                game_time_label=f"{occurred.hour:02d}:{occurred.minute:02d}",
+                source=EpisodeSource(event_ids=tuple(f"ev-{i}-{k}" for k in range(rng.randint(1, 3)))),
+                location=EpisodeLocation(spot_id=spot, tile_area_ids=(spot * 10,), x=rng.randint(0, 40), y=rng.randint(0, 40)),
+                action=EpisodeAction(tool_name=rng.choice(tools), canonical_arguments_text='{"target": 1}'),
+                who=who,
+                co_present=who,
+                what="広場で話をした" * rng.randint(1, 3),
+                why="約束を確かめるため" if rng.random() < 0.5 else None,
+                observed="相手は少し驚いた様子だった。",
+                expected="すぐに返事がもらえる" if rng.random() < 0.3 else None,
+                outcome="返事は明日になった",
+                prediction_error=None,
+                felt="少し不安",
+                interpreted="相手は忙しいのだろう",
+                cues=tuple(cues),
+                recall_text="広場で約束の確認をしたが、返事は明日になった。",
+                recall_count=rng.randint(0, 6),
+                last_recalled_at=occurred + timedelta(hours=1) if rng.random() < 0.4 else None,
+                salience=rng.choice(("low", "low", "high")),
+            )
+        )
+    return out
+
+
+def _write_v1(store: SqliteSubjectiveEpisodeStore, episodes: List[SubjectiveEpisode]) -> None:
+    for ep in episodes:
+        store.connection.execute(
+            "UPDATE subjective_episodes_by_being SET payload_json = ? WHERE being_id_value = ? AND episode_id = ?",
+            (json.dumps(_episode_to_payload_dict(ep), ensure_ascii=False), _BEING.value, ep.episode_id),
+        )
+    store.connection.commit()
+
+
+def _payload_stats(conn: sqlite3.Connection) -> tuple[int, List[str]]:
+    rows = [str(r[0]) for r in conn.execute("SELECT payload_json FROM subjective_episodes_by_being")]
+    return sum(len(r.encode("utf-8")) for r in rows), rows
+
+
+def _decode_seconds(rows: List[str]) -> float:
+    t0 = time.perf_counter()
+    for r in rows:
+        _decode_payload(r, being_id=_BEING)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--episodes", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit-per-cue", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    episodes = build_episodes(args.episodes, args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label in ("v1", "v2"):
+            path = os.path.join(tmp, f"{label}.db")
+            store = SqliteSubjectiveEpisodeStore.connect(path, decoded_cache_size_per_being=0)
+            for ep in episodes:
+                store.put_by_being(_BEING, ep)
+            if label == "v1":
+                _write_v1(store, episodes)
+            store.connection.execute("VACUUM")
+            payload_bytes, rows = _payload_stats(store.connection)
+            results[label] = (payload_bytes, os.path.getsize(path), _decode_seconds(rows))
+            if label == "v2":
+                rng = random.Random(args.seed + 1)
+                cue_pool = sorted({c for ep in episodes for c in ep.cues}, key=lambda c: c.to_canonical())
+                queries = [rng.sample(cue_pool, 4) for _ in range(args.queries)]
+                t0 = time.perf_counter()
+                for cues in queries:
+                    store.list_cue_headers_by_being(_BEING, cues, args.limit_per_cue)
+                header_s = time.perf_counter() - t0
+                t0 = time.perf_counter()
+                for cues in queries:
+                    store.list_by_cues_by_being(_BEING, cues, args.limit_per_cue)
+                full_s = time.perf_counter() - t0
+            store.connection.close()
+
+    n = len(episodes)
+    print(f"episodes: {n}")
+    for label, (payload_bytes, file_bytes, decode_s) in results.items():
+        print(
+            f"  {label}: payload {payload_bytes / n:7.1f} B/episode, db file {file_bytes / 1024:8.1f} KiB, "
+            f"decode {decode_s / n * 1e6:6.1f} us/episode"
+        )
+    v1, v2 = results["v1"], results["v2"]
+    print(f"  v2/v1: payload {v2[0] / v1[0]:.2f}x, decode {v2[2] / v1[2]:.2f}x")
+    print(
+        f"cue query ({args.queries} x 4 cues, limit {args.limit_per_cue}/cue): "
+        f"headers {header_s / args.queries * 1e3:.2f} ms, full episodes {full_s / args.queries * 1e3:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
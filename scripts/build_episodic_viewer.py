@@ -20,13 +20,20 @@ from __future__ import annotations
 
 import argparse
 import html
-import json
 import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from ai_rpg_world.application.trace.index import load_trace_dicts  # noqa: E402
+
 
 @dataclass
 class Episode:
@@ -53,18 +60,19 @@ class Episode:
             self.recalled_in = []
 
 
-def load_events(trace_path: Path) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
-    with trace_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return out
+# aggregate_episodes が読む kind。sidecar index があればこの行だけを読む
+EPISODIC_KINDS = (
+    "episodic_chunk_written",
+    "episodic_subjective_filled",
+    "episodic_recall",
+)
+
+
+def load_events(
+    trace_path: Path, *, kinds: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """trace の行を dict で返す (壊れた行は飛ばす)。``kinds`` で絞れる。"""
+    return load_trace_dicts(trace_path, kinds=kinds)
 
 
 def aggregate_episodes(events: List[Dict[str, Any]]) -> List[Episode]:
@@ -442,7 +450,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print(f"trace.jsonl が見つかりません: {trace}", file=sys.stderr)
         return 2
 
-    events = load_events(trace)
+    events = load_events(trace, kinds=EPISODIC_KINDS)
     episodes = aggregate_episodes(events)
 
     title = args.title or args.run_dir.name
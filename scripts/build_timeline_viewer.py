@@ -19,12 +19,19 @@ from __future__ import annotations
 
 import argparse
 import html
-import json
 import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from ai_rpg_world.application.trace.index import load_trace_dicts  # noqa: E402
+
 # 表示する event kind と色 + ラベル
 EVENT_STYLES: Dict[str, Dict[str, str]] = {
     "action": {"color": "#35d4e6", "label": "ACT"},
@@ -49,18 +56,14 @@ KIND_ORDER = {
 }
 
 
-def load_events(trace_path: Path) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
-    with trace_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return out
+def load_events(
+    trace_path: Path, *, kinds: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """trace の行を dict で返す (壊れた行は飛ばす)。``kinds`` で絞れる。
+
+    sidecar index (``application.trace.index``) があれば ``kinds`` の行だけを読む。
+    """
+    return load_trace_dicts(trace_path, kinds=kinds)
 
 
 def extract_players(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -436,7 +439,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print(f"trace.jsonl が見つかりません: {trace}", file=sys.stderr)
         return 2
 
-    events = load_events(trace)
+    # 表示するのは EVENT_STYLES の kind だけなので、それ以外は読まない
+    events = load_events(trace, kinds=tuple(EVENT_STYLES))
     title = args.title or args.run_dir.name
     html_text = render_html(events, title)
 
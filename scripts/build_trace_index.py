@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""既存の trace.jsonl に sidecar index (``trace.jsonl.idx.sqlite``) を作る。
+
+# 何をするか
+
+trace を 1 パスで走査し、各行の kind / tick / player_id と byte offset を
+``application.trace.index.TraceIndex`` の形式で書く。以降
+``build_timeline_viewer.py`` / ``build_episodic_viewer.py`` /
+``analyze_conversation_mixing.py`` と ``run_scenario_experiment.py`` の report 生成は、
+必要な kind の行だけを読む。``run_scenario_experiment.py`` は無圧縮 trace なら
+記録中に index を書くので、これは index の無い古い run 向け。
+
+index は trace のサイズを覚えていて、trace が変わると無視される (作り直せばよい)。
+gzip / zstd の trace は offset で読めないので対象外。
+
+# 使い方
+
+```
+python scripts/build_trace_index.py var/runs/exp26_on_full_r1 [more run dirs or trace files ...]
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+for p in (_REPO_ROOT, _REPO_ROOT / "src"):
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+from ai_rpg_world.application.trace.index import TraceIndex, trace_index_path  # noqa: E402
+
+
+def _resolve_trace(target: Path) -> Path:
+    return target / "trace.jsonl" if target.is_dir() else target
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="+", type=Path, help="run directory or trace file")
+    args = parser.parse_args(argv)
+
+    failed: List[Path] = []
+    for target in args.targets:
+        trace = _resolve_trace(target)
+        if not trace.exists():
+            print(f"trace が見つかりません: {trace}", file=sys.stderr)
+            failed.append(trace)
+            continue
+        t0 = time.perf_counter()
+        try:
+            index = TraceIndex.build(trace)
+        except ValueError as exc:
+            print(f"[skip] {trace}: {exc}", file=sys.stderr)
+            failed.append(trace)
+            continue
+        with index:
+            counts = index.count_by_kind()
+        print(
+            f"[index] {trace_index_path(trace)} "
+            f"({sum(counts.values())} events, {len(counts)} kinds, "
+            f"{time.perf_counter() - t0:.1f}s)"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
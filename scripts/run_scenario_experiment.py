@@ -3,7 +3,7 @@
 
 特徴:
     - シナリオ非依存: ``data/scenarios/*.json`` を ``--scenario`` で指定
-    - trace 自動記録: ``JsonlTraceRecorder`` を内部で生成して runtime に inject
+    - trace 自動記録: ``AsyncJsonlTraceRecorder`` を内部で生成して runtime に inject
     - HTML 自動生成: 実行後に trace.html / viewer.html / episodic.html / timeline.html を出力
     - 汎用レポート: WIN/LOSE/tick/action 数/memo 数の最小集計を Markdown で
 
@@ -48,10 +48,17 @@ for p in (_REPO_ROOT, _REPO_ROOT / "src"):
         sys.path.insert(0, s)
 
 from ai_rpg_world.application.trace import (  # noqa: E402
-    JsonlTraceRecorder,
+    AsyncJsonlTraceRecorder,
+    ITraceRecorder,
     TraceEventKind,
 )
-from ai_rpg_world.application.trace.recorder import load_trace_events  # noqa: E402
+from ai_rpg_world.application.trace.index import query_trace_events  # noqa: E402
+from ai_rpg_world.application.trace.recorder import (  # noqa: E402
+    TRACE_COMPRESSION_GZIP,
+    TRACE_COMPRESSION_SUFFIXES,
+    TRACE_COMPRESSION_ZSTD,
+    load_trace_events,
+)
 from ai_rpg_world.domain.world_graph.value_object.game_end_result import (  # noqa: E402
     GameEndResult,
 )
@@ -85,12 +92,12 @@ def _classify_llm_run_health(
     trace_path = getattr(recorder, "path", None)
     if not isinstance(trace_path, Path):
         return outcome, end_reason, 0, 0
+    # 非同期 recorder はバッファに残っている分を書き切ってから読み戻す
+    flush = getattr(recorder, "flush", None)
+    if callable(flush):
+        flush()
 
-    calls = [
-        event
-        for event in load_trace_events(trace_path)
-        if event.kind == TraceEventKind.LLM_CALL
-    ]
+    calls = list(query_trace_events(trace_path, kinds=(TraceEventKind.LLM_CALL,)))
     total = len(calls)
     succeeded = sum(bool(event.payload.get("success")) for event in calls)
     if total == 0 or succeeded > 0:
@@ -452,148 +459,30 @@ def _write_experiment_manifest(
 def _wiring_stub_from_world_runtime(runtime: Any) -> Any:
     """``WorldRuntime`` から ``ExperimentSnapshotSession`` 用の wiring stub を作る。
 
-    Phase 6 (Issue #470): world_runtime runtime には ``LlmAgentWiringResult`` の
-    全 store ハンドルが揃わない (semantic / memory_link / recall_buffer /
-    journal は world_runtime の通常経路では作られない) ため、runtime の
-    内部 field から **拾える分だけ** 集めて wiring 風オブジェクトを返す。
-    足りない store は ``ExperimentSnapshotSession`` 側で空 in-memory に
-    fallback する。
+    本体は ``experiment_snapshot_session.wiring_stub_from_world_runtime``
+    (API server の save slot と共用)。
     """
-    from types import SimpleNamespace
-
-    # episode_store は _episodic_stack が None のときは None。
-    episodic_stack = getattr(runtime, "_episodic_stack", None)
-    episode_store = (
-        getattr(episodic_stack, "episode_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    # 注意: ``_aux_being_repository`` は private 属性 (public property なし)。
-    # ``aux_being_resolver`` の方は public property があるのでそちらを使う。
-    # 将来 ``aux_being_repository`` の public property が追加されたら同じ
-    # 形式に揃える。
-    aux_resolver = getattr(runtime, "aux_being_resolver", None)
-    aux_repo = getattr(runtime, "_aux_being_repository", None)
-    # #526 後続: SEMANTIC_PASSIVE_TOP_K / SEMANTIC_LLM_GIST_ENABLED が ON だと
-    # episodic_stack が semantic store + memory link store を持つ。あれば snapshot に
-    # 拾う (OFF なら従来どおり None = 空 in-memory fallback)。link store も拾わないと
-    # semantic entries だけ保存され、昇格根拠の link graph が空 fallback になる。
-    semantic_store = (
-        getattr(episodic_stack, "semantic_memory_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    memory_link_store = (
-        getattr(episodic_stack, "memory_link_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    # #558 レビュー反映 (MEDIUM-2): reinterpretation (段1) ON のとき episodic_stack が
-    # in-memory の recall_buffer / journal を持つ。snapshot surface で None ハードコード
-    # だと、再解釈 journal と pending recall buffer が save/load で silent に失われ、
-    # 再開時の記憶連続性 (自己の継続性) が壊れる。semantic と同じく stack から拾う
-    # (OFF なら None = 従来どおり空 in-memory fallback)。
-    recall_buffer_store = (
-        getattr(episodic_stack, "recall_buffer_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    reinterpretation_journal_store = (
-        getattr(episodic_stack, "reinterpretation_journal", None)
-        if episodic_stack is not None
-        else None
-    )
-    # U2 (証拠台帳統一設計): BELIEF_EVIDENCE_ENABLED ON のとき episodic_stack が
-    # belief evidence buffer store を持つ。checklist #27 (memory_full_003 で
-    # stub 追従漏れが実際に起きた教訓) に従い、ここで拾わないと flag ON でも
-    # evidence が save/load で silent に失われる。OFF なら None = 従来どおり
-    # 空 in-memory fallback。
-    belief_evidence_buffer_store = (
-        getattr(episodic_stack, "belief_evidence_buffer_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    # U9b (予測誤差統一設計 部品5・想起の信用割り当て): RECALL_HIT_BOOST_ENABLED
-    # ON のとき episodic_stack が的中側 sidecar store を持つ。checklist #27
-    # (memory_full_003 で stub 追従漏れが実際に起きた教訓) に従い、ここで
-    # 拾わないと flag ON でも的中回数が save/load で silent に失われる。
-    # OFF なら None = 空 in-memory fallback。
-    recall_success_store = (
-        getattr(episodic_stack, "recall_success_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    # U10a (予測誤差統一設計 部品6・pending prediction): PENDING_PREDICTION_ENABLED
-    # ON のとき episodic_stack が pending prediction store を持つ。checklist #27
-    # (memory_full_003 で stub 追従漏れが実際に起きた教訓) に従い、ここで拾わ
-    # ないと flag ON でも保留中の予測 (約束) が save/load で silent に失われる。
-    # OFF なら None = 空 in-memory fallback。
-    pending_prediction_store = (
-        getattr(episodic_stack, "pending_prediction_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    # P5 (目的層): GOAL_STORE_ENABLED ON のとき world_runtime が goal store を
-    # 構築し ``_goal_journal_store`` に保持する。checklist #27 に従い拾う。
-    # OFF なら None = 空 in-memory fallback。
-    goal_journal_store = getattr(runtime, "_goal_journal_store", None)
-    # P-U2 (停滞感 store): STAGNATION_PRESSURE_ENABLED ON のとき world_runtime が
-    # 停滞感カウンタ store を構築し ``_stagnation_pressure_store`` に保持する。
-    # checklist #27 に従い拾う。OFF なら None = 空 in-memory fallback。
-    stagnation_pressure_store = getattr(runtime, "_stagnation_pressure_store", None)
-    # PR-G (想起階層: slot / afterglow / habituation): #526 段階 3 で
-    # episodic_stack に生えた 3 store。checklist #27 の追従漏れが実際に
-    # 起きていた箇所 (ExperimentSnapshotSession 側は getattr で拾う準備が
-    # 済んでいたが、この stub がここまで一度も拾っていなかった)。ここで
-    # 拾わないと enable 時でも想起スロット / afterglow index / 慣化状態が
-    # save/load で silent に失われる。OFF なら None = 空 in-memory fallback。
-    recall_slot_store = (
-        getattr(episodic_stack, "recall_slot_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    afterglow_store = (
-        getattr(episodic_stack, "afterglow_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    recall_habituation_store = (
-        getattr(episodic_stack, "recall_habituation_store", None)
-        if episodic_stack is not None
-        else None
-    )
-    return SimpleNamespace(
-        memo_store=getattr(runtime, "_todo_store", None),
-        semantic_memory_store=semantic_store,
-        memory_link_store=memory_link_store,
-        episodic_recall_buffer_store=recall_buffer_store,
-        episodic_reinterpretation_journal_store=reinterpretation_journal_store,
-        episodic_episode_store=episode_store,
-        being_repository=aux_repo,
-        being_attachment_resolver=aux_resolver,
-        belief_evidence_buffer_store=belief_evidence_buffer_store,
-        recall_success_store=recall_success_store,
-        pending_prediction_store=pending_prediction_store,
-        goal_journal_store=goal_journal_store,
-        stagnation_pressure_store=stagnation_pressure_store,
-        recall_slot_store=recall_slot_store,
-        afterglow_store=afterglow_store,
-        recall_habituation_store=recall_habituation_store,
+    from ai_rpg_world.application.being.experiment_snapshot_session import (
+        wiring_stub_from_world_runtime,
     )
 
+    return wiring_stub_from_world_runtime(runtime)
+
 
 def _drive_scenario(
     *,
     run_id: str = "experiment",
     scenario_path: Path,
     max_world_ticks: int,
-    recorder: JsonlTraceRecorder,
+    recorder: ITraceRecorder,
     progress: Any,
     runtime_config: Optional[Any] = None,
     reporter: Optional[_ExperimentProgressReporter] = None,
     snapshot_save_dir: Optional[Path] = None,
     snapshot_load_dir: Optional[Path] = None,
     prompt_dataset_sink: Optional[Any] = None,
+    world_checkpoint_dir: Optional[Path] = None,
+    world_checkpoint_every: int = 0,
 ) -> Dict[str, Any]:
     """シナリオを 1 セッション分回し、最終ステートを dict で返す。
 
@@ -605,6 +494,9 @@ def _drive_scenario(
             この値に達するまで ``advance_tick`` を呼ぶ。旧名 ``max_ticks`` は
             外側 for ループの回数だったが、``#405`` で 1 iteration = 1 world tick
             に揃ったので world tick 基準に意味論統一する。
+        world_checkpoint_every: 0 より大きければ world_tick がこの間隔を跨ぐ
+            たびに ``world_checkpoint_dir`` へ差分 checkpoint を取る。書き出しは
+            別 thread なので tick loop が待つのは capture 分だけ。
     """
     from tempfile import TemporaryDirectory
 
@@ -676,7 +568,14 @@ def _drive_scenario(
         #   fail-fast (= 例外伝播)。
         # - save 経路は run 終了時 (= 下の try / finally) で行う。
         snapshot_session: Optional[Any] = None
-        if snapshot_save_dir is not None or snapshot_load_dir is not None:
+        checkpoint_enabled = (
+            world_checkpoint_every > 0 and world_checkpoint_dir is not None
+        )
+        if (
+            snapshot_save_dir is not None
+            or snapshot_load_dir is not None
+            or checkpoint_enabled
+        ):
             from ai_rpg_world.application.being.experiment_snapshot_session import (
                 ExperimentSnapshotSession,
             )
@@ -695,7 +594,9 @@ def _drive_scenario(
             # snapshot_load_dir から別途読む。
             snapshot_session = ExperimentSnapshotSession(
                 wiring_result=wiring_stub,
-                snapshot_dir=snapshot_save_dir or snapshot_load_dir,
+                snapshot_dir=(
+                    snapshot_save_dir or snapshot_load_dir or world_checkpoint_dir
+                ),
             )
 
             if snapshot_load_dir is not None:
@@ -756,6 +657,23 @@ def _drive_scenario(
         for pid in runtime.get_player_ids():
             state.llm_wiring.llm_turn_trigger.schedule_turn(pid)
 
+        # 定期 world checkpoint: 変化した subsystem だけを chunk として書く。
+        # capture 失敗は warning に留め、run は止めない (= 終了時 snapshot と同方針)。
+        checkpoint_writer: Optional[Any] = None
+        next_checkpoint_tick = 0
+        if checkpoint_enabled and snapshot_session is not None:
+            from ai_rpg_world.application.being.world_state_checkpoint_store import (
+                AsyncWorldCheckpointWriter,
+                WorldStateCheckpointStore,
+            )
+
+            checkpoint_writer = AsyncWorldCheckpointWriter(
+                WorldStateCheckpointStore(world_checkpoint_dir)
+            )
+            next_checkpoint_tick = (
+                int(runtime.current_tick()) // world_checkpoint_every + 1
+            ) * world_checkpoint_every
+
         outcome = "TIMEOUT"
         end_reason: Optional[str] = None
         last_tick = 0
@@ -852,6 +770,23 @@ def _drive_scenario(
                         )
                         prev_spots[pid_int] = new_spot
                 recorder.record(TraceEventKind.TICK_END, tick=last_tick)
+                if checkpoint_writer is not None and last_tick >= next_checkpoint_tick:
+                    try:
+                        snapshot_session.capture_world_checkpoint(
+                            runtime,
+                            checkpoint_writer,
+                            source_scenario=scenario_path.stem,
+                            world_tick=int(last_tick),
+                        )
+                    except Exception:
+                        logger.warning(
+                            "world checkpoint capture failed at world_tick=%d",
+                            last_tick,
+                            exc_info=True,
+                        )
+                    next_checkpoint_tick = (
+                        int(last_tick) // world_checkpoint_every + 1
+                    ) * world_checkpoint_every
                 # 進捗 reporter: tick 完了時の wall time / ETA を stderr + progress.jsonl に出す
                 # #404 P2: スパイク原因の内訳 (nested world tick / LLM 呼出 / 移動中数) を渡す。
                 llm_calls: Optional[int] = None
@@ -1018,6 +953,12 @@ def _drive_scenario(
                         exc_info=True,
                     )
 
+        world_checkpoint_metrics: Optional[Dict[str, Any]] = None
+        if checkpoint_writer is not None:
+            checkpoint_writer.close(timeout=30.0)
+            world_checkpoint_metrics = checkpoint_writer.metrics()
+            logger.info("world checkpoints: %s", world_checkpoint_metrics)
+
         # Issue #311/#325 後続: 非同期 LLM 主観文付与 scheduler (#310) の in-flight
         # ジョブを drain してから return する。これをしないと、scenario 終了
         # 直後に `with JsonlTraceRecorder` が close され、後追いで完了した worker
@@ -1051,6 +992,7 @@ def _drive_scenario(
             "max_world_ticks": max_world_ticks,
             "snapshot_save_dir": str(snapshot_save_dir) if snapshot_save_dir else None,
             "snapshot_load_dir": str(snapshot_load_dir) if snapshot_load_dir else None,
+            "world_checkpoints": world_checkpoint_metrics,
         }
 
 
@@ -1150,7 +1092,11 @@ def _build_report(
     lines.append("## 成果物")
     lines.append("")
     lines.append(f"- trace: `{trace_path}`")
-    lines.append(f"- legacy HTML viewer: `{trace_path.with_suffix('.html')}`")
+    # trace.jsonl.gz / trace.jsonl.zst でも trace.html を指す (圧縮拡張子ごと外す)
+    legacy_html_path = trace_path
+    if legacy_html_path.suffix in TRACE_COMPRESSION_SUFFIXES.values():
+        legacy_html_path = legacy_html_path.with_suffix("")
+    lines.append(f"- legacy HTML viewer: `{legacy_html_path.with_suffix('.html')}`")
     lines.append(f"- map trace viewer: `{trace_path.parent / 'viewer.html'}`")
     lines.append(f"- episodic memory viewer: `{trace_path.parent / 'episodic.html'}`")
     lines.append(f"- timeline viewer: `{trace_path.parent / 'timeline.html'}`")
@@ -1206,22 +1152,23 @@ def _render_map_viewer_html(run_dir: Path, trace_path: Path, *, title: str) -> s
 def _render_episodic_viewer_html(trace_path: Path, *, title: str) -> str:
     """episodic.html の HTML 文字列を返す。"""
     from scripts.build_episodic_viewer import (  # noqa: WPS433
+        EPISODIC_KINDS,
         aggregate_episodes,
         load_events,
     )
     from scripts.build_episodic_viewer import render_html as render_episodic_html
 
-    events = load_events(trace_path)
+    events = load_events(trace_path, kinds=EPISODIC_KINDS)
     episodes = aggregate_episodes(events)
     return render_episodic_html(episodes, title)
 
 
 def _render_timeline_viewer_html(trace_path: Path, *, title: str) -> str:
     """timeline.html の HTML 文字列を返す。"""
-    from scripts.build_timeline_viewer import load_events  # noqa: WPS433
+    from scripts.build_timeline_viewer import EVENT_STYLES, load_events  # noqa: WPS433
     from scripts.build_timeline_viewer import render_html as render_timeline_html
 
-    events = load_events(trace_path)
+    events = load_events(trace_path, kinds=tuple(EVENT_STYLES))
     return render_timeline_html(events, title)
 
 
@@ -1369,6 +1316,15 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=None,
         help="Output directory (defaults to var/runs/<scenario>-<timestamp>)",
     )
+    parser.add_argument(
+        "--trace-compression",
+        choices=("none", TRACE_COMPRESSION_GZIP, TRACE_COMPRESSION_ZSTD),
+        default="none",
+        help=(
+            "Write the trace as gzip/zstd frames (trace.jsonl.gz / trace.jsonl.zst). "
+            "Report and HTML generation read both; zstd needs the zstandard package."
+        ),
+    )
     parser.add_argument(
         "--no-html",
         action="store_true",
@@ -1431,7 +1387,19 @@ def main(argv: Optional[List[str]] = None) -> int:
             "前回の memory 状態から続きの実験が走る。"
         ),
     )
+    parser.add_argument(
+        "--world-checkpoint-every",
+        type=int,
+        default=0,
+        help=(
+            "world_tick がこの間隔を跨ぐたびに OUT/checkpoints へ world の差分 "
+            "checkpoint (変化した subsystem だけを gzip chunk で追記) を書く。"
+            "0 (既定) なら取らない。"
+        ),
+    )
     args = parser.parse_args(argv)
+    if args.world_checkpoint_every < 0:
+        parser.error("--world-checkpoint-every must be >= 0")
 
     try:
         config_source, config_source_path = _load_experiment_config_source(
@@ -1469,7 +1437,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
         out_dir = _REPO_ROOT / "var" / "runs" / f"{args.scenario.stem}-{ts}"
     out_dir.mkdir(parents=True, exist_ok=True)
-    trace_path = out_dir / "trace.jsonl"
+    trace_compression = (
+        None if args.trace_compression == "none" else args.trace_compression
+    )
+    trace_path = out_dir / (
+        "trace.jsonl" + TRACE_COMPRESSION_SUFFIXES.get(trace_compression or "", "")
+    )
     report_path = out_dir / "report.md"
     html_path = out_dir / "trace.html"
 
@@ -1571,7 +1544,14 @@ def main(argv: Optional[List[str]] = None) -> int:
             failure_policy=cfg.prompt_dataset_capture_failure_policy,
         )
 
-    with JsonlTraceRecorder(trace_path) as rec:
+    # trace の JSON 化と書き込みは writer thread に逃がす (tick / Phase A の
+    # クリティカルパスから外す)。close で書き切る。無圧縮なら sidecar index も
+    # 記録中に書き、後段の report / viewer は kind で絞って読む。
+    with AsyncJsonlTraceRecorder(
+        trace_path,
+        compression=trace_compression,
+        index=trace_compression is None,
+    ) as rec:
         # PR #448: trace payload は cfg.to_trace_dict() で一括出力 + scenario /
         # max_world_ticks を追加。**API key は cfg.to_trace_dict() 内で *** に
         # マスクされる** (= 漏洩防止)。
@@ -1623,6 +1603,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                 snapshot_save_dir=args.snapshot_save_dir,
                 snapshot_load_dir=args.snapshot_load_dir,
                 prompt_dataset_sink=prompt_dataset_sink,
+                world_checkpoint_dir=out_dir / "checkpoints",
+                world_checkpoint_every=args.world_checkpoint_every,
             )
         finally:
             # 例外で抜けても progress.jsonl は閉じる + stderr の改行を出す
@@ -34,7 +34,10 @@ if str(_REPO_ROOT / "src") not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT / "src"))
 
 from ai_rpg_world.application.trace.events import TraceEvent, TraceEventKind
-from ai_rpg_world.application.trace.recorder import load_trace_events
+from ai_rpg_world.application.trace.recorder import (
+    TRACE_COMPRESSION_SUFFIXES,
+    load_trace_events,
+)
 
 
 MERMAID_CDN = "https://cdn.jsdelivr.net/npm/mermaid@10.9.0/dist/mermaid.min.js"
@@ -322,8 +325,12 @@ def main(argv: Optional[List[str]] = None) -> int:
     events = list(load_trace_events(args.input))
     if not events:
         print(f"[warn] no events in {args.input}", file=sys.stderr)
-    title = args.title or args.input.stem
-    out_path = args.output or args.input.with_suffix(".html")
+    # trace.jsonl.gz / trace.jsonl.zst は圧縮拡張子も外して trace.html にする
+    base = args.input
+    if base.suffix in TRACE_COMPRESSION_SUFFIXES.values():
+        base = base.with_suffix("")
+    title = args.title or base.stem
+    out_path = args.output or base.with_suffix(".html")
     out_path.write_text(render_html(events, title=title), encoding="utf-8")
     print(f"wrote {out_path} ({len(events)} events)")
     return 0
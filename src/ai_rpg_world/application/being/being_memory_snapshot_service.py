@@ -342,6 +342,11 @@ class BeingMemorySnapshotService:
         """10 store から being_id 配下の全状態を読み出し、JSON 文字列で返す。"""
         if not isinstance(being_id, BeingId):
             raise TypeError("being_id must be BeingId")
+        # group commit で COMMIT 待ちの書き込みを先に確定させ、snapshot が
+        # DB に残る状態と食い違わないようにする (flush を持たない store は素通り)
+        flush = getattr(self._episodic_episode, "flush", None)
+        if callable(flush):
+            flush()
         payload: dict[str, Any] = {
             "schema_version": CURRENT_PAYLOAD_SCHEMA_VERSION,
             "memo": [
@@ -31,6 +31,7 @@ from ai_rpg_world.application.being.being_snapshot_file_gateway import (
 from ai_rpg_world.domain.being.repository.being_repository import BeingRepository
 from ai_rpg_world.domain.being.service.being_snapshot_codec import BeingSnapshotCodec
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.being.value_object.being_snapshot import BeingSnapshot
 
 
 class BeingNotFoundForSnapshotError(Exception):
@@ -76,6 +77,27 @@ class CaptureBeingSnapshotToFileUseCase:
         self._memory = memory_snapshot_service
         self._gateway = file_gateway
 
+    def capture(self, being_id: BeingId) -> BeingSnapshot:
+        """Being + memory を ``BeingSnapshot`` に固めて返す (ファイルは書かない)。
+
+        書き出しを別 thread に回したい呼出側 (= API server の save slot) 向け。
+        ``BeingSnapshot`` は不変なので、返った後に store が変わっても影響しない。
+        """
+        if not isinstance(being_id, BeingId):
+            raise TypeError(
+                f"being_id must be BeingId, got {type(being_id).__name__}"
+            )
+        being = self._repo.find_by_id(being_id)
+        if being is None:
+            raise BeingNotFoundForSnapshotError(
+                f"being not found in repository: being_id={being_id.value!r}"
+            )
+
+        memory_payload_json = self._memory.capture(being_id)
+        return BeingSnapshotCodec.encode(
+            being, memory_payload_json=memory_payload_json
+        )
+
     def execute(
         self,
         being_id: BeingId,
@@ -89,25 +111,11 @@ class CaptureBeingSnapshotToFileUseCase:
         ``_metadata`` ブロックに ``source_scenario`` / ``captured_at`` 等を
         埋め込める。cross-scenario transfer 検知用。
         """
-        if not isinstance(being_id, BeingId):
-            raise TypeError(
-                f"being_id must be BeingId, got {type(being_id).__name__}"
-            )
         if not isinstance(output_path, Path):
             raise TypeError(
                 f"output_path must be Path, got {type(output_path).__name__}"
             )
-
-        being = self._repo.find_by_id(being_id)
-        if being is None:
-            raise BeingNotFoundForSnapshotError(
-                f"being not found in repository: being_id={being_id.value!r}"
-            )
-
-        memory_payload_json = self._memory.capture(being_id)
-        snapshot = BeingSnapshotCodec.encode(
-            being, memory_payload_json=memory_payload_json
-        )
+        snapshot = self.capture(being_id)
         self._gateway.write(snapshot, output_path, metadata=metadata)
         return CaptureBeingSnapshotResult(
             being_id=being_id,
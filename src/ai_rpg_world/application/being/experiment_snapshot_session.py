@@ -1,7 +1,7 @@
 """ExperimentSnapshotSession — 実験 runner と Phase 4-5 snapshot 機構を結ぶ薄い orchestrator。
 
 Phase 6 (Issue #470): ``scripts/run_scenario_experiment.py`` が wiring stub
-(escape runtime から組む ``_wiring_stub_from_world_runtime`` の返り値) から直接
+(escape runtime から組む ``wiring_stub_from_world_runtime`` の返り値) から直接
 snapshot を取れるようにする統合層。
 
 ## 責務
@@ -33,6 +33,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Sequence
 
 from ai_rpg_world.application.being.being_memory_snapshot_service import (
@@ -44,6 +45,12 @@ from ai_rpg_world.application.being.being_snapshot_file_gateway import (
     BeingSnapshotFileMetadata,
     WorldStateSnapshotFileGateway,
 )
+from ai_rpg_world.application.being.world_state_checkpoint_store import (
+    AsyncWorldCheckpointWriter,
+    FrozenWorldState,
+    WorldStateCheckpointStore,
+    freeze_world_snapshot,
+)
 from ai_rpg_world.application.being.world_state_snapshot import (
     WorldStateSnapshot,
 )
@@ -60,6 +67,7 @@ from ai_rpg_world.application.being.world_subsystems import (
     InteractionCooldownSubsystemCodec,
     MarketBoardSubsystemCodec,
     PendingTradeOfferSubsystemCodec,
+    TimerWheelSubsystemCodec,
     ItemInstanceSubsystemCodec,
     PendingFoodSpoilageSubsystemCodec,
     PlayerActiveEffectsSubsystemCodec,
@@ -92,6 +100,7 @@ from ai_rpg_world.application.being.restore_being_snapshot_from_file_use_case im
     RestoreBeingSnapshotFromFileUseCase,
 )
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.being.value_object.being_snapshot import BeingSnapshot
 from ai_rpg_world.domain.player.value_object.player_id import PlayerId
 from ai_rpg_world.domain.world.value_object.world_id import (
     DEFAULT_SINGLE_WORLD_ID,
@@ -151,6 +160,9 @@ EXPECTED_WORLD_SUBSYSTEM_KEYS: tuple[str, ...] = (
     # (player_inventory 側) が持ち主不明のまま残る。
     "pending_trade_offer",
     "market_board",
+    # 取引の提案・板の注文・食料の腐敗の期限。落とすと再開後は期限が
+    # 二度と来ず、提案は流れず、注文は残り続け、食料は腐らなくなる。
+    "timer_wheel",
 )
 
 
@@ -306,6 +318,14 @@ class CaptureAllReport:
         return not self.failed
 
 
+@dataclass(frozen=True)
+class CapturedBeingSnapshots:
+    """``capture_being_snapshots`` の結果 (= まだファイルに書いていない snapshot)。"""
+
+    snapshots: list[BeingSnapshot]
+    failed: list[tuple[BeingId, str]]  # (being_id, error message)
+
+
 @dataclass(frozen=True)
 class RestoreAllReport:
     """``restore_all`` の集計レポート。"""
@@ -378,6 +398,9 @@ def _default_world_subsystem_codecs() -> list[WorldSubsystemCodec]:
         InteractionCooldownSubsystemCodec(),
         PendingTradeOfferSubsystemCodec(),
         MarketBoardSubsystemCodec(),
+        # 期限の共有 wheel。提案・板の codec が復元で置き直した期限ごと、
+        # 捕獲時点の wheel で差し替えるので最後に置く。
+        TimerWheelSubsystemCodec(),
     ]
 
 
@@ -608,6 +631,80 @@ class ExperimentSnapshotSession:
             )
             return None
         snapshot = self._world_gateway.read(input_dir)
+        return self._restore_world_snapshot(
+            runtime, snapshot, current_scenario=current_scenario
+        )
+
+    def capture_world_checkpoint(
+        self,
+        runtime: Any,
+        writer: AsyncWorldCheckpointWriter,
+        *,
+        source_scenario: str,
+        world_tick: int,
+    ) -> FrozenWorldState:
+        """run 途中の world checkpoint を取り、``writer`` に渡す。
+
+        capture は tick thread 上で同期的に行い (repository の read cache 付き)、
+        その場で canonical JSON bytes に固める。hash / 圧縮 / 書き込みは
+        ``writer`` の thread で行われるので、呼出側の待ちは capture 分だけ。
+        失敗時は例外伝播 (= ``capture_world`` と同じ)。
+        """
+        state = self.capture_world_frozen(
+            runtime, source_scenario=source_scenario, world_tick=world_tick
+        )
+        writer.submit(state)
+        return state
+
+    def capture_world_frozen(
+        self,
+        runtime: Any,
+        *,
+        source_scenario: str,
+        world_tick: int,
+    ) -> FrozenWorldState:
+        """world を capture して canonical JSON bytes に固めた値を返す。
+
+        repository の read cache 付きで capture し、live state への参照を
+        残さない。書き出し (``WorldStateCheckpointStore.write``) は別 thread
+        から呼んでよい。
+        """
+        from datetime import datetime, timezone
+
+        snapshot = self._world_snapshot_service.capture(
+            runtime,
+            source_scenario=source_scenario,
+            world_tick=world_tick,
+            captured_at=datetime.now(timezone.utc).isoformat(),
+            memoize_repository_reads=True,
+        )
+        return freeze_world_snapshot(snapshot)
+
+    def restore_world_from_checkpoint(
+        self,
+        runtime: Any,
+        store: WorldStateCheckpointStore,
+        *,
+        current_scenario: str,
+        name: str | None = None,
+    ) -> WorldStateSnapshot:
+        """checkpoint (``name`` 省略時は最新) を読み runtime に書き戻す。
+
+        ``restore_world_from_dir`` と同じく strict に復元する。checkpoint が
+        無ければ ``FileNotFoundError``。
+        """
+        snapshot = store.read(name)
+        return self._restore_world_snapshot(
+            runtime, snapshot, current_scenario=current_scenario
+        )
+
+    def _restore_world_snapshot(
+        self,
+        runtime: Any,
+        snapshot: WorldStateSnapshot,
+        *,
+        current_scenario: str,
+    ) -> WorldStateSnapshot:
         migrated_subsystems = migrate_legacy_recent_event_subsystems(
             snapshot.subsystems
         )
@@ -727,6 +824,59 @@ class ExperimentSnapshotSession:
                 failed.append((m.being_id, repr(exc)))
         return CaptureAllReport(succeeded=succeeded, failed=failed)
 
+    def capture_being_snapshots(
+        self, player_ids: Sequence[PlayerId]
+    ) -> CapturedBeingSnapshots:
+        """全 player の ``BeingSnapshot`` を取り、ファイルには書かずに返す。
+
+        ``capture_all`` の capture 部分だけを行う。store の読み取りは呼出側の
+        thread で済ませ、書き出しは ``write_being_snapshots`` を別 thread から
+        呼べるようにする (= API server の save slot 向け)。失敗の扱いは
+        ``capture_all`` と同じ。
+        """
+        snapshots: list[BeingSnapshot] = []
+        failed: list[tuple[BeingId, str]] = []
+        for m in self._resolve_player_being_ids(player_ids):
+            try:
+                snapshots.append(self._capture_use_case.capture(m.being_id))
+            except BeingNotFoundForSnapshotError as exc:
+                logger.warning(
+                    "snapshot capture failed for being_id=%s: %s",
+                    m.being_id.value,
+                    exc,
+                )
+                failed.append((m.being_id, str(exc)))
+            except SnapshotCoverageError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - save 失敗で run を止めない
+                logger.warning(
+                    "snapshot capture failed for being_id=%s: %s",
+                    m.being_id.value,
+                    exc,
+                    exc_info=True,
+                )
+                failed.append((m.being_id, repr(exc)))
+        return CapturedBeingSnapshots(snapshots=snapshots, failed=failed)
+
+    def write_being_snapshots(
+        self,
+        snapshots: Sequence[BeingSnapshot],
+        output_dir: Path,
+        *,
+        metadata: BeingSnapshotFileMetadata | None = None,
+    ) -> list[Path]:
+        """``capture_being_snapshots`` の結果を ``output_dir/<being_id>.json`` に書く。
+
+        ``restore_all_from_dir(output_dir)`` でそのまま読み戻せるレイアウト。
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths: list[Path] = []
+        for snapshot in snapshots:
+            path = output_dir / f"{snapshot.being_id_value}.json"
+            self._gateway.write(snapshot, path, metadata=metadata)
+            paths.append(path)
+        return paths
+
     def restore_all_from_dir(
         self,
         input_dir: Path,
@@ -815,8 +965,144 @@ class ExperimentSnapshotSession:
         )
 
 
+def wiring_stub_from_world_runtime(runtime: Any) -> Any:
+    """``WorldRuntime`` から ``ExperimentSnapshotSession`` 用の wiring stub を作る。
+
+    Phase 6 (Issue #470): world_runtime runtime には ``LlmAgentWiringResult`` の
+    全 store ハンドルが揃わない (semantic / memory_link / recall_buffer /
+    journal は world_runtime の通常経路では作られない) ため、runtime の
+    内部 field から **拾える分だけ** 集めて wiring 風オブジェクトを返す。
+    足りない store は ``ExperimentSnapshotSession`` 側で空 in-memory に
+    fallback する。
+
+    実験 runner (``scripts/run_scenario_experiment.py``) と API server の
+    save slot (``GameRuntimeManager``) が共用する。
+    """
+
+    # episode_store は _episodic_stack が None のときは None。
+    episodic_stack = getattr(runtime, "_episodic_stack", None)
+    episode_store = (
+        getattr(episodic_stack, "episode_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    # 注意: ``_aux_being_repository`` は private 属性 (public property なし)。
+    # ``aux_being_resolver`` の方は public property があるのでそちらを使う。
+    # 将来 ``aux_being_repository`` の public property が追加されたら同じ
+    # 形式に揃える。
+    aux_resolver = getattr(runtime, "aux_being_resolver", None)
+    aux_repo = getattr(runtime, "_aux_being_repository", None)
+    # #526 後続: SEMANTIC_PASSIVE_TOP_K / SEMANTIC_LLM_GIST_ENABLED が ON だと
+    # episodic_stack が semantic store + memory link store を持つ。あれば snapshot に
+    # 拾う (OFF なら従来どおり None = 空 in-memory fallback)。link store も拾わないと
+    # semantic entries だけ保存され、昇格根拠の link graph が空 fallback になる。
+    semantic_store = (
+        getattr(episodic_stack, "semantic_memory_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    memory_link_store = (
+        getattr(episodic_stack, "memory_link_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    # #558 レビュー反映 (MEDIUM-2): reinterpretation (段1) ON のとき episodic_stack が
+    # in-memory の recall_buffer / journal を持つ。snapshot surface で None ハードコード
+    # だと、再解釈 journal と pending recall buffer が save/load で silent に失われ、
+    # 再開時の記憶連続性 (自己の継続性) が壊れる。semantic と同じく stack から拾う
+    # (OFF なら None = 従来どおり空 in-memory fallback)。
+    recall_buffer_store = (
+        getattr(episodic_stack, "recall_buffer_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    reinterpretation_journal_store = (
+        getattr(episodic_stack, "reinterpretation_journal", None)
+        if episodic_stack is not None
+        else None
+    )
+    # U2 (証拠台帳統一設計): BELIEF_EVIDENCE_ENABLED ON のとき episodic_stack が
+    # belief evidence buffer store を持つ。checklist #27 (memory_full_003 で
+    # stub 追従漏れが実際に起きた教訓) に従い、ここで拾わないと flag ON でも
+    # evidence が save/load で silent に失われる。OFF なら None = 従来どおり
+    # 空 in-memory fallback。
+    belief_evidence_buffer_store = (
+        getattr(episodic_stack, "belief_evidence_buffer_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    # U9b (予測誤差統一設計 部品5・想起の信用割り当て): RECALL_HIT_BOOST_ENABLED
+    # ON のとき episodic_stack が的中側 sidecar store を持つ。checklist #27
+    # (memory_full_003 で stub 追従漏れが実際に起きた教訓) に従い、ここで
+    # 拾わないと flag ON でも的中回数が save/load で silent に失われる。
+    # OFF なら None = 空 in-memory fallback。
+    recall_success_store = (
+        getattr(episodic_stack, "recall_success_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    # U10a (予測誤差統一設計 部品6・pending prediction): PENDING_PREDICTION_ENABLED
+    # ON のとき episodic_stack が pending prediction store を持つ。checklist #27
+    # (memory_full_003 で stub 追従漏れが実際に起きた教訓) に従い、ここで拾わ
+    # ないと flag ON でも保留中の予測 (約束) が save/load で silent に失われる。
+    # OFF なら None = 空 in-memory fallback。
+    pending_prediction_store = (
+        getattr(episodic_stack, "pending_prediction_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    # P5 (目的層): GOAL_STORE_ENABLED ON のとき world_runtime が goal store を
+    # 構築し ``_goal_journal_store`` に保持する。checklist #27 に従い拾う。
+    # OFF なら None = 空 in-memory fallback。
+    goal_journal_store = getattr(runtime, "_goal_journal_store", None)
+    # P-U2 (停滞感 store): STAGNATION_PRESSURE_ENABLED ON のとき world_runtime が
+    # 停滞感カウンタ store を構築し ``_stagnation_pressure_store`` に保持する。
+    # checklist #27 に従い拾う。OFF なら None = 空 in-memory fallback。
+    stagnation_pressure_store = getattr(runtime, "_stagnation_pressure_store", None)
+    # PR-G (想起階層: slot / afterglow / habituation): #526 段階 3 で
+    # episodic_stack に生えた 3 store。checklist #27 の追従漏れが実際に
+    # 起きていた箇所 (ExperimentSnapshotSession 側は getattr で拾う準備が
+    # 済んでいたが、この stub がここまで一度も拾っていなかった)。ここで
+    # 拾わないと enable 時でも想起スロット / afterglow index / 慣化状態が
+    # save/load で silent に失われる。OFF なら None = 空 in-memory fallback。
+    recall_slot_store = (
+        getattr(episodic_stack, "recall_slot_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    afterglow_store = (
+        getattr(episodic_stack, "afterglow_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    recall_habituation_store = (
+        getattr(episodic_stack, "recall_habituation_store", None)
+        if episodic_stack is not None
+        else None
+    )
+    return SimpleNamespace(
+        memo_store=getattr(runtime, "_todo_store", None),
+        semantic_memory_store=semantic_store,
+        memory_link_store=memory_link_store,
+        episodic_recall_buffer_store=recall_buffer_store,
+        episodic_reinterpretation_journal_store=reinterpretation_journal_store,
+        episodic_episode_store=episode_store,
+        being_repository=aux_repo,
+        being_attachment_resolver=aux_resolver,
+        belief_evidence_buffer_store=belief_evidence_buffer_store,
+        recall_success_store=recall_success_store,
+        pending_prediction_store=pending_prediction_store,
+        goal_journal_store=goal_journal_store,
+        stagnation_pressure_store=stagnation_pressure_store,
+        recall_slot_store=recall_slot_store,
+        afterglow_store=afterglow_store,
+        recall_habituation_store=recall_habituation_store,
+    )
+
 __all__ = [
+    "CapturedBeingSnapshots",
     "ExperimentSnapshotSession",
+    "wiring_stub_from_world_runtime",
     "CaptureAllReport",
     "EXPECTED_WORLD_SUBSYSTEM_KEYS",
     "RestoreAllReport",
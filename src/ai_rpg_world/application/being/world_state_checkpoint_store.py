@@ -0,0 +1,428 @@
+"""world state の定期 checkpoint (差分・圧縮・非同期書き出し)。
+
+``WorldStateSnapshotFileGateway`` は run 終了時に 1 回だけ ``world.json`` を
+``indent=2`` で丸ごと書く。長い run の途中で N tick ごとに world を残すには
+それでは重いので、本 module は subsystem 単位の copy-on-write checkpoint を
+提供する。
+
+## レイアウト
+
+```
+<checkpoint_dir>/
+  chunks/<sha256>.json.gz      # 1 subsystem の canonical JSON (gzip)
+  ckpt-00000120.json           # manifest (world_tick ごとに 1 つ)
+```
+
+- chunk は内容の sha256 で名付ける (content-addressed)。前回 checkpoint から
+  変わっていない subsystem は同じ hash になり、manifest は既存 chunk を参照
+  するだけで新しいファイルを書かない (= ``reused``)。
+- manifest は snapshot の header (scenario / world_tick / schema_version /
+  captured_at) と、subsystem key → chunk hash の対応、直前 checkpoint 名
+  (``base``) を持つ。1 つの manifest だけで world 全体を復元できる
+  (= 差分の連鎖を辿る必要はない)。
+- 書き込みは tmp + ``os.replace`` で原子的。manifest は chunk を全部書いた後に
+  置くので、途中で落ちても manifest が指す chunk は必ず揃っている。
+
+## tick thread との分担
+
+repository は tick ごとに変わるため、capture そのものは tick thread 上で
+同期的に行う (``WorldStateSnapshotService.capture`` の
+``memoize_repository_reads``)。``freeze_world_snapshot`` がその場で各
+subsystem を canonical JSON bytes に固め、以降は live state を一切参照しない。
+hash / gzip / ファイル I/O は ``AsyncWorldCheckpointWriter`` の writer thread
+が受け持つ。
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ai_rpg_world.application.being.world_state_snapshot import (
+    WorldStateSnapshot,
+    WorldStateSnapshotVersionError,
+)
+
+logger = logging.getLogger(__name__)
+
+WORLD_CHECKPOINT_FORMAT_VERSION: int = 1
+_CHUNK_DIRNAME = "chunks"
+_CHUNK_SUFFIX = ".json.gz"
+_MANIFEST_RE = re.compile(r"^ckpt-(\d{8,})\.json$")
+
+
+def checkpoint_name_for_tick(world_tick: int) -> str:
+    """world_tick に対応する manifest ファイル名 (``ckpt-00000120.json``)。"""
+    return f"ckpt-{int(world_tick):08d}.json"
+
+
+@dataclass(frozen=True)
+class FrozenWorldState:
+    """capture 直後に bytes へ固めた world state。
+
+    ``payloads`` は (subsystem key, canonical JSON bytes) の tuple。live な
+    runtime への参照を持たないので、別 thread に渡してよい。
+    """
+
+    source_scenario: str
+    world_tick: int
+    schema_version: int
+    captured_at: str | None
+    payloads: tuple[tuple[str, bytes], ...]
+
+
+def freeze_world_snapshot(snapshot: WorldStateSnapshot) -> FrozenWorldState:
+    """``WorldStateSnapshot`` の各 subsystem を canonical JSON bytes にする。
+
+    ``sort_keys`` + 区切り文字固定なので、内容が同じなら bytes も同じになる
+    (= chunk hash が変化検出を兼ねる)。
+    """
+    if not isinstance(snapshot, WorldStateSnapshot):
+        raise TypeError(
+            f"snapshot must be WorldStateSnapshot, got {type(snapshot).__name__}"
+        )
+    payloads = tuple(
+        (
+            key,
+            json.dumps(
+                data, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+            ).encode("utf-8"),
+        )
+        for key, data in snapshot.subsystems.items()
+    )
+    return FrozenWorldState(
+        source_scenario=snapshot.source_scenario,
+        world_tick=snapshot.world_tick,
+        schema_version=snapshot.schema_version,
+        captured_at=snapshot.captured_at,
+        payloads=payloads,
+    )
+
+
+@dataclass(frozen=True)
+class WorldCheckpointWriteResult:
+    """1 回の checkpoint 書き出し結果。"""
+
+    name: str
+    world_tick: int
+    written_subsystems: tuple[str, ...]
+    reused_subsystems: tuple[str, ...]
+    bytes_written: int
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+class WorldStateCheckpointStore:
+    """``<directory>`` 配下に差分 checkpoint を読み書きする。
+
+    Args:
+        directory: checkpoint の置き場。無ければ作る。
+        keep_last: manifest をこの数だけ残し、古いものと誰からも参照されない
+            chunk を書き込みのたびに消す。``None`` なら全部残す。
+        compresslevel: chunk の gzip level。
+
+    1 つの store を複数 thread から同時に ``write`` しないこと
+    (= ``AsyncWorldCheckpointWriter`` が単一 writer thread で呼ぶ前提)。
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        keep_last: int | None = None,
+        compresslevel: int = 6,
+    ) -> None:
+        if not isinstance(directory, Path):
+            raise TypeError(
+                f"directory must be Path, got {type(directory).__name__}"
+            )
+        if keep_last is not None and (
+            isinstance(keep_last, bool) or not isinstance(keep_last, int) or keep_last < 1
+        ):
+            raise ValueError(f"keep_last must be positive int or None (got {keep_last!r})")
+        self._directory = directory
+        self._chunk_dir = directory / _CHUNK_DIRNAME
+        self._keep_last = keep_last
+        self._compresslevel = int(compresslevel)
+        # 直前に書いた manifest の key → hash。同じ hash なら chunk の存在確認も
+        # 省いて reused とする。
+        self._last_hashes: dict[str, str] = {}
+        self._last_name: str | None = None
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def chunk_path(self, digest: str) -> Path:
+        return self._chunk_dir / f"{digest}{_CHUNK_SUFFIX}"
+
+    def list_checkpoints(self) -> list[str]:
+        """manifest 名を world_tick 昇順で返す。"""
+        if not self._directory.is_dir():
+            return []
+        names = [p.name for p in self._directory.iterdir() if _MANIFEST_RE.match(p.name)]
+        return sorted(names, key=lambda n: int(_MANIFEST_RE.match(n).group(1)))
+
+    def latest_checkpoint(self) -> str | None:
+        names = self.list_checkpoints()
+        return names[-1] if names else None
+
+    def write(self, state: FrozenWorldState) -> WorldCheckpointWriteResult:
+        """``state`` を checkpoint として書き、manifest 名を含む結果を返す。
+
+        変化の無い subsystem (= 直前 checkpoint と同じ hash、または同じ chunk が
+        既にある) は chunk を書かずに参照だけ残す。
+        """
+        if not isinstance(state, FrozenWorldState):
+            raise TypeError(
+                f"state must be FrozenWorldState, got {type(state).__name__}"
+            )
+        self._chunk_dir.mkdir(parents=True, exist_ok=True)
+        if self._last_name is None:
+            self._last_name = self.latest_checkpoint()
+        entries: dict[str, dict[str, Any]] = {}
+        written: list[str] = []
+        reused: list[str] = []
+        bytes_written = 0
+        for key, payload in state.payloads:
+            digest = hashlib.sha256(payload).hexdigest()
+            path = self.chunk_path(digest)
+            if self._last_hashes.get(key) == digest or path.exists():
+                reused.append(key)
+            else:
+                blob = gzip.compress(
+                    payload, compresslevel=self._compresslevel, mtime=0
+                )
+                _atomic_write_bytes(path, blob)
+                bytes_written += len(blob)
+                written.append(key)
+            entries[key] = {"sha256": digest, "size": len(payload)}
+        name = checkpoint_name_for_tick(state.world_tick)
+        manifest = {
+            "format_version": WORLD_CHECKPOINT_FORMAT_VERSION,
+            "schema_version": state.schema_version,
+            "source_scenario": state.source_scenario,
+            "world_tick": state.world_tick,
+            "captured_at": state.captured_at,
+            "base": self._last_name if self._last_name != name else None,
+            "subsystems": entries,
+            "reused_subsystems": reused,
+        }
+        manifest_bytes = json.dumps(
+            manifest, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        _atomic_write_bytes(self._directory / name, manifest_bytes)
+        bytes_written += len(manifest_bytes)
+        self._last_hashes = {key: entry["sha256"] for key, entry in entries.items()}
+        self._last_name = name
+        if self._keep_last is not None:
+            self.prune(self._keep_last)
+        return WorldCheckpointWriteResult(
+            name=name,
+            world_tick=state.world_tick,
+            written_subsystems=tuple(written),
+            reused_subsystems=tuple(reused),
+            bytes_written=bytes_written,
+        )
+
+    def _read_manifest(self, name: str) -> dict[str, Any]:
+        path = self._directory / name
+        if not path.exists():
+            raise FileNotFoundError(f"world checkpoint not found: {path}")
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        version = manifest.get("format_version")
+        if version != WORLD_CHECKPOINT_FORMAT_VERSION:
+            raise WorldStateSnapshotVersionError(
+                f"world checkpoint format_version={version!r} is not supported "
+                f"(supported: {WORLD_CHECKPOINT_FORMAT_VERSION})"
+            )
+        return manifest
+
+    def read(self, name: str | None = None) -> WorldStateSnapshot:
+        """checkpoint を ``WorldStateSnapshot`` に戻す。``name`` 省略時は最新。
+
+        checkpoint が 1 つも無ければ ``FileNotFoundError``。chunk の hash が
+        manifest と合わなければ ``ValueError`` (= 壊れた checkpoint を黙って
+        読まない)。
+        """
+        if name is None:
+            name = self.latest_checkpoint()
+            if name is None:
+                raise FileNotFoundError(
+                    f"no world checkpoint in {self._directory}"
+                )
+        manifest = self._read_manifest(name)
+        subsystems: dict[str, dict[str, Any]] = {}
+        for key, entry in manifest["subsystems"].items():
+            digest = entry["sha256"]
+            payload = gzip.decompress(self.chunk_path(digest).read_bytes())
+            if hashlib.sha256(payload).hexdigest() != digest:
+                raise ValueError(
+                    f"world checkpoint chunk for {key!r} is corrupted "
+                    f"(expected sha256={digest})"
+                )
+            subsystems[key] = json.loads(payload.decode("utf-8"))
+        return WorldStateSnapshot(
+            source_scenario=str(manifest["source_scenario"]),
+            world_tick=int(manifest["world_tick"]),
+            subsystems=subsystems,
+            schema_version=int(manifest["schema_version"]),
+            captured_at=manifest.get("captured_at"),
+        )
+
+    def prune(self, keep_last: int) -> list[str]:
+        """新しい ``keep_last`` 個を残して manifest を消し、孤立 chunk も消す。
+
+        消した manifest 名を返す。
+        """
+        names = self.list_checkpoints()
+        removed = names[:-keep_last] if keep_last > 0 else names
+        if not removed:
+            return []
+        for name in removed:
+            (self._directory / name).unlink(missing_ok=True)
+        live: set[str] = set()
+        for name in names[len(removed):]:
+            live.update(
+                entry["sha256"]
+                for entry in self._read_manifest(name)["subsystems"].values()
+            )
+        if self._chunk_dir.is_dir():
+            for path in self._chunk_dir.iterdir():
+                if not path.name.endswith(_CHUNK_SUFFIX):
+                    continue
+                if path.name[: -len(_CHUNK_SUFFIX)] not in live:
+                    path.unlink(missing_ok=True)
+        return removed
+
+
+class AsyncWorldCheckpointWriter:
+    """``WorldStateCheckpointStore.write`` を単一 writer thread で回す。
+
+    ``submit`` は ``FrozenWorldState`` を置いて即座に戻る。writer がまだ前の
+    checkpoint を書いている間に次が来たら、未着手の分は新しい方で置き換える
+    (= ``coalesced``)。定期 checkpoint は最新が残れば足りるので、tick thread を
+    待たせるより古い途中経過を捨てる方を選ぶ。
+
+    書き込み失敗は warning に残して ``failed`` を数えるだけで、run は止めない。
+    """
+
+    def __init__(self, store: WorldStateCheckpointStore) -> None:
+        self._store = store
+        self._cond = threading.Condition()
+        self._pending: Optional[FrozenWorldState] = None
+        self._busy = False
+        self._closed = False
+        self.submitted = 0
+        self.written = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.last_result: Optional[WorldCheckpointWriteResult] = None
+        self._thread = threading.Thread(
+            target=self._run, name="world-checkpoint-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def store(self) -> WorldStateCheckpointStore:
+        return self._store
+
+    def submit(self, state: FrozenWorldState) -> None:
+        if not isinstance(state, FrozenWorldState):
+            raise TypeError(
+                f"state must be FrozenWorldState, got {type(state).__name__}"
+            )
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("world checkpoint writer is already closed")
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = state
+            self.submitted += 1
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """受け付け済みの checkpoint が書き終わるまで待つ。間に合えば True。"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._pending is None and not self._busy, timeout=timeout
+            )
+
+    def close(self, timeout: float | None = None) -> None:
+        """残りを書き切って writer thread を止める。二重 close は no-op。"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "written": self.written,
+                "coalesced": self.coalesced,
+                "failed": self.failed,
+                "last_checkpoint": (
+                    self.last_result.name if self.last_result is not None else None
+                ),
+            }
+
+    def __enter__(self) -> "AsyncWorldCheckpointWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                state = self._pending
+                if state is None:
+                    return
+                self._pending = None
+                self._busy = True
+            result: Optional[WorldCheckpointWriteResult] = None
+            try:
+                result = self._store.write(state)
+            except Exception:
+                logger.warning(
+                    "world checkpoint write failed (world_tick=%d, dir=%s)",
+                    state.world_tick,
+                    self._store.directory,
+                    exc_info=True,
+                )
+            with self._cond:
+                self._busy = False
+                if result is None:
+                    self.failed += 1
+                else:
+                    self.written += 1
+                    self.last_result = result
+                self._cond.notify_all()
+
+
+__all__ = [
+    "AsyncWorldCheckpointWriter",
+    "FrozenWorldState",
+    "WORLD_CHECKPOINT_FORMAT_VERSION",
+    "WorldCheckpointWriteResult",
+    "WorldStateCheckpointStore",
+    "checkpoint_name_for_tick",
+    "freeze_world_snapshot",
+]
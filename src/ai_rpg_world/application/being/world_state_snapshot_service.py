@@ -8,6 +8,16 @@ Phase 9-1 (Issue #470): **器だけ** 用意した skeleton。capture / restore
 将来 subsystem を増やすときは ``WorldSubsystemCodec`` を継承した実装を
 ``WorldStateSnapshotService`` に登録する。Phase 9-1 は登録ゼロでスタート
 (= subsystems 辞書が空のまま回る)。
+
+## capture 中の read cache
+
+多くの codec が同じ ``_player_status_repo.find_by_id(pid)`` を個別に呼ぶ
+(= 9 codec × player 数)。in-memory repository の ``find_by_id`` は毎回
+aggregate を clone するので、capture 全体のコストの大半がこの重複 clone に
+なる。``capture(..., memoize_repository_reads=True)`` は runtime を
+``CaptureRuntimeView`` で包み、1 回の capture の間だけ ``*_repo.find_by_id``
+の結果を使い回す。capture 中に runtime は変化しない (= tick thread 上で
+同期的に呼ぶ) ので、返る snapshot は素の capture と同一になる。
 """
 
 from __future__ import annotations
@@ -49,6 +59,57 @@ class WorldSubsystemCodec(ABC):
         """``data`` を runtime に書き戻す。"""
 
 
+class _MemoizedFindByIdRepository:
+    """``find_by_id`` の結果を key ごとに 1 回だけ引く repository wrapper。
+
+    それ以外の属性 (``find_all`` / ``find_graph`` 等) は素通し。
+    """
+
+    def __init__(self, repository: Any) -> None:
+        self._repository = repository
+        self._found: dict[Any, Any] = {}
+
+    def find_by_id(self, entity_id: Any) -> Any:
+        try:
+            return self._found[entity_id]
+        except KeyError:
+            found = self._repository.find_by_id(entity_id)
+            self._found[entity_id] = found
+            return found
+        except TypeError:
+            # hash 不能な id はキャッシュせず素通し
+            return self._repository.find_by_id(entity_id)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+
+class CaptureRuntimeView:
+    """1 回の capture の間だけ有効な runtime の読み取り view。
+
+    ``_xxx_repo`` 属性で ``find_by_id`` を持つものを
+    ``_MemoizedFindByIdRepository`` に差し替え、それ以外は runtime の属性を
+    そのまま返す。codec は runtime を ``getattr`` でしか触らないので、
+    view を渡しても codec 側の変更は要らない。capture 専用であり、restore
+    には使わない (= 書き込み後の再読込がキャッシュに隠れる)。
+    """
+
+    def __init__(self, runtime: Any) -> None:
+        self._runtime = runtime
+        self._repositories: dict[str, _MemoizedFindByIdRepository] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        cached = self._repositories.get(name)
+        if cached is not None:
+            return cached
+        value = getattr(self._runtime, name)
+        if name.endswith("_repo") and callable(getattr(value, "find_by_id", None)):
+            cached = _MemoizedFindByIdRepository(value)
+            self._repositories[name] = cached
+            return cached
+        return value
+
+
 class WorldStateSnapshotService:
     """runtime ↔ WorldStateSnapshot の変換を担うサービス。
 
@@ -105,16 +166,22 @@ class WorldStateSnapshotService:
         source_scenario: str,
         world_tick: int,
         captured_at: str | None = None,
+        memoize_repository_reads: bool = False,
     ) -> WorldStateSnapshot:
         """runtime から WorldStateSnapshot を構築する。
 
         各 subsystem codec の ``capture`` を呼び、結果を subsystems dict に
         詰める。1 つでも失敗すれば例外 (= partial world snapshot を作らない
         = silent failure を構造で防ぐ)。
+
+        ``memoize_repository_reads=True`` なら codec には
+        ``CaptureRuntimeView`` を渡し、同じ aggregate の重複 clone を省く
+        (= 定期 checkpoint 向け)。
         """
+        source = CaptureRuntimeView(runtime) if memoize_repository_reads else runtime
         subsystems: dict[str, dict[str, Any]] = {}
         for codec in self._codecs:
-            data = codec.capture(runtime)
+            data = codec.capture(source)
             if not isinstance(data, dict):
                 raise TypeError(
                     f"subsystem {codec.subsystem_key!r} capture must return "
@@ -231,6 +298,7 @@ class WorldStateSnapshotService:
 
 
 __all__ = [
+    "CaptureRuntimeView",
     "WorldStateSnapshotService",
     "WorldSubsystemCodec",
 ]
@@ -130,6 +130,9 @@ from ai_rpg_world.application.being.world_subsystems.short_term_memory_codec imp
 from ai_rpg_world.application.being.world_subsystems.spot_interior_codec import (
     SpotInteriorSubsystemCodec,
 )
+from ai_rpg_world.application.being.world_subsystems.timer_wheel_codec import (
+    TimerWheelSubsystemCodec,
+)
 from ai_rpg_world.application.being.world_subsystems.weather_codec import (
     WeatherSubsystemCodec,
 )
@@ -143,6 +146,7 @@ from ai_rpg_world.application.being.world_subsystems.world_tick_codec import (
 __all__ = [
     "MarketBoardSubsystemCodec",
     "PendingTradeOfferSubsystemCodec",
+    "TimerWheelSubsystemCodec",
     # Phase 9-2
     "WorldTickSubsystemCodec",
     "PlayerPositionSubsystemCodec",
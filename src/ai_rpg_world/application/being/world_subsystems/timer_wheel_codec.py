@@ -0,0 +1,86 @@
+"""共有 timer wheel (取引の提案・板の注文・食料の腐敗の期限) の subsystem codec。
+
+**wheel を足す PR で同時に入れる。** 期限を持つ store / stage は、期限切れ
+の片付けで wheel に期限の来た鍵しか見ない。wheel が保存されないと、再開後の
+世界では**期限が二度と来ない**: 提案は流れず、板の注文は残り続け、食料は
+腐らなくなる。どれも症状が出るのは再開してしばらく経ってからになる。
+
+期限は tick 基準の world 局所の状態なので、world snapshot 側に載る。
+
+**codec の並びの最後に置く。** 提案・板の codec は復元時に自分の期限を
+wheel へ置き直すが、腐敗の期限は置き直す経路が無い (初めて見た tick が
+起点なので、item の state だけからは決まらない instance がある)。最後に
+丸ごと差し替えて、捕獲した時点の wheel をそのまま戻す。
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ai_rpg_world.application.being.world_state_snapshot_service import (
+    WorldSubsystemCodec,
+)
+
+SUBSYSTEM_KEY = "timer_wheel"
+SCHEMA_VERSION = 1
+
+
+class TimerWheelSubsystemCodec(WorldSubsystemCodec):
+    """``runtime._timer_wheel`` を保存・復元する。"""
+
+    @property
+    def subsystem_key(self) -> str:
+        return SUBSYSTEM_KEY
+
+    def capture(self, runtime: Any) -> dict[str, Any]:
+        wheel = getattr(runtime, "_timer_wheel", None)
+        if wheel is None:
+            return {"schema_version": SCHEMA_VERSION, "now": 0, "timers": []}
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "now": int(wheel.now),
+            # (channel, key, due_tick) の平坦な列にする。channel ごとの dict
+            # にすると、int の鍵が JSON で文字列 key に化けて、復元後の
+            # 取り消し (int の鍵で引く) が黙って外れる。
+            "timers": [
+                [str(channel), key, int(due_tick)]
+                for channel, key, due_tick in wheel.timers()
+            ],
+        }
+
+    def restore(self, runtime: Any, data: dict[str, Any]) -> None:
+        version = data.get("schema_version")
+        if version != SCHEMA_VERSION:
+            raise ValueError(
+                f"{SUBSYSTEM_KEY} schema_version={version!r} unsupported "
+                f"(expected {SCHEMA_VERSION})"
+            )
+        wheel = getattr(runtime, "_timer_wheel", None)
+        if wheel is None:
+            return
+        raw_timers = data.get("timers", [])
+        if not isinstance(raw_timers, list):
+            raise ValueError(
+                f"{SUBSYSTEM_KEY} timers must be a list, got {type(raw_timers)}"
+            )
+        timers = []
+        for entry in raw_timers:
+            if (
+                not isinstance(entry, (list, tuple))
+                or len(entry) != 3
+                or not isinstance(entry[1], (int, str))
+                or isinstance(entry[1], bool)
+            ):
+                raise ValueError(
+                    f"{SUBSYSTEM_KEY} timer must be [channel, key, due_tick], "
+                    f"got {entry!r}"
+                )
+            timers.append((str(entry[0]), entry[1], int(entry[2])))
+        wheel.replace_all(timers, now=int(data.get("now", 0)))
+
+
+__all__ = [
+    "TimerWheelSubsystemCodec",
+    "SUBSYSTEM_KEY",
+    "SCHEMA_VERSION",
+]
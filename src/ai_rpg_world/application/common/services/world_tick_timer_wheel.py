@@ -0,0 +1,260 @@
+"""``WorldTick`` を鍵にした期限の共有置き場 (階層型 timer wheel)。
+
+取引の提案・板の注文・食料の腐敗は、どれも「その tick が来たら片付ける」
+期限を持つ。以前は各 stage が毎 tick 全件を走査して、今 tick に期限の来た
+数件を探していた。ここでは期限を**作った側が登録し、早く消えたら取り消す**。
+期限切れの処理は、その tick に期限の来た件数ぶんの仕事で済む。
+
+## channel
+
+subsystem ごとに channel を分ける (``"trade_offer"`` など)。鍵 (offer_id 等)
+は channel の中でだけ一意であればよい。片付けは stage ごとに別の時点で
+走るので、期限の来た鍵も channel ごとに取り出す。
+
+## 期限が来ても勝手に消さない
+
+``due_keys`` は期限の来た鍵を返すだけで、取り消しは登録した側が片付けを
+終えたときに ``cancel`` で行う。片付けの途中で落ちたら、鍵は期限切れの
+まま残り、次の tick にもう一度返る (提案の片付けが「次の tick で拾い直す」
+ことで自己修復するのと同じ)。
+
+## 階層
+
+1 段 64 枠 × 4 段。0 段目は現在と同じ 64 tick の区間、1 段目は同じ 4096
+tick の区間…に入る期限を持ち、区間の境目で上の段の 1 枠を下へ配り直す。
+それより先の期限は overflow に置き、最上段の境目で配り直す。時刻が大きく
+飛んだとき (snapshot 復元など) は、1 tick ずつ回さず全件を置き直す。
+
+鍵は snapshot に載るので int か str に限る。
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+TimerKey = Union[int, str]
+
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+_LEVELS = 4
+# これより大きく時刻が飛んだら 1 tick ずつ回さず全件を置き直す
+_REBUILD_GAP = _SLOTS * _SLOTS
+
+_READY = (-1, -1)
+_OVERFLOW = (-2, -2)
+
+
+class _ChannelWheel:
+    """1 channel 分の階層 wheel。"""
+
+    def __init__(self, now: int) -> None:
+        self.now = now
+        self.due: Dict[TimerKey, int] = {}
+        self._where: Dict[TimerKey, Tuple[int, int]] = {}
+        self._slots: List[List[Set[TimerKey]]] = [
+            [set() for _ in range(_SLOTS)] for _ in range(_LEVELS)
+        ]
+        self._overflow: Set[TimerKey] = set()
+        self.ready: Set[TimerKey] = set()
+
+    def schedule(self, key: TimerKey, due_tick: int) -> None:
+        self.cancel(key)
+        self.due[key] = due_tick
+        self._place(key, due_tick)
+
+    def cancel(self, key: TimerKey) -> bool:
+        if key not in self.due:
+            return False
+        del self.due[key]
+        where = self._where.pop(key)
+        if where == _READY:
+            self.ready.discard(key)
+        elif where == _OVERFLOW:
+            self._overflow.discard(key)
+        else:
+            self._slots[where[0]][where[1]].discard(key)
+        return True
+
+    def advance(self, tick: int) -> None:
+        if tick <= self.now:
+            return
+        if tick - self.now > _REBUILD_GAP:
+            self.rebuild(tick)
+            return
+        while self.now < tick:
+            self.now += 1
+            if not self.now & _SLOT_MASK:
+                self._cascade()
+            slot = self._slots[0][self.now & _SLOT_MASK]
+            if slot:
+                for key in slot:
+                    self._where[key] = _READY
+                self.ready |= slot
+                slot.clear()
+
+    def rebuild(self, now: int) -> None:
+        self.now = now
+        entries = list(self.due.items())
+        self._where.clear()
+        for level in self._slots:
+            for slot in level:
+                slot.clear()
+        self._overflow.clear()
+        self.ready.clear()
+        for key, due_tick in entries:
+            self._place(key, due_tick)
+
+    def next_due_tick(self) -> Optional[int]:
+        if self.ready:
+            return min(self.due[key] for key in self.ready)
+        for level in range(_LEVELS):
+            start = (self.now >> (_SLOT_BITS * level)) & _SLOT_MASK
+            # 0 段目の現在枠は advance で ready に移し済み、上の段の現在枠は
+            # 区間に入った時点で下へ配り済みなので、どちらも次の枠から見る。
+            for index in range(start + 1, _SLOTS):
+                slot = self._slots[level][index]
+                if slot:
+                    return min(self.due[key] for key in slot)
+        if self._overflow:
+            return min(self.due[key] for key in self._overflow)
+        return None
+
+    def _place(self, key: TimerKey, due_tick: int) -> None:
+        if due_tick <= self.now:
+            self.ready.add(key)
+            self._where[key] = _READY
+            return
+        for level in range(_LEVELS):
+            span_bits = _SLOT_BITS * (level + 1)
+            if due_tick >> span_bits == self.now >> span_bits:
+                index = (due_tick >> (_SLOT_BITS * level)) & _SLOT_MASK
+                self._slots[level][index].add(key)
+                self._where[key] = (level, index)
+                return
+        self._overflow.add(key)
+        self._where[key] = _OVERFLOW
+
+    def _cascade(self) -> None:
+        # 境目を越えた最も上の段から順に、今入った区間の枠を下へ配り直す
+        crossed = 1
+        while crossed < _LEVELS and not self.now & ((1 << (_SLOT_BITS * (crossed + 1))) - 1):
+            crossed += 1
+        if crossed == _LEVELS:
+            moved = list(self._overflow)
+            self._overflow.clear()
+            for key in moved:
+                self._place(key, self.due[key])
+            crossed -= 1
+        for level in range(crossed, 0, -1):
+            slot = self._slots[level][(self.now >> (_SLOT_BITS * level)) & _SLOT_MASK]
+            moved = list(slot)
+            slot.clear()
+            for key in moved:
+                self._place(key, self.due[key])
+
+
+class WorldTickTimerWheel:
+    """channel ごとの期限を持つ。thread safe。"""
+
+    def __init__(self, *, now: int = 0) -> None:
+        self._lock = threading.RLock()
+        self._now = int(now)
+        self._channels: Dict[str, _ChannelWheel] = {}
+
+    def schedule(self, channel: str, key: TimerKey, due_tick: int) -> None:
+        """``due_tick`` に期限を置く。同じ鍵が既にあれば置き換える。"""
+        if not isinstance(key, (int, str)) or isinstance(key, bool):
+            raise TypeError(f"timer key must be int or str, got {type(key)!r}")
+        if not isinstance(due_tick, int) or isinstance(due_tick, bool):
+            raise TypeError(f"due_tick must be int, got {type(due_tick)!r}")
+        with self._lock:
+            self._channel(channel).schedule(key, due_tick)
+
+    def cancel(self, channel: str, key: TimerKey) -> bool:
+        """期限を取り消す。無ければ何もしない (冪等)。取り消したら True。"""
+        with self._lock:
+            wheel = self._channels.get(channel)
+            return wheel.cancel(key) if wheel is not None else False
+
+    def cancel_channel(self, channel: str) -> None:
+        """channel の期限をすべて取り消す (store の丸ごと差し替え用)。"""
+        with self._lock:
+            wheel = self._channels.get(channel)
+            if wheel is not None:
+                self._channels[channel] = _ChannelWheel(wheel.now)
+
+    def due_keys(self, channel: str, current_tick: int) -> Tuple[TimerKey, ...]:
+        """``current_tick`` までに期限の来た鍵を、期限・鍵の順で返す。
+
+        返した鍵は消さない。片付け終えたら呼び出し側が ``cancel`` する。
+        """
+        with self._lock:
+            self._now = max(self._now, int(current_tick))
+            wheel = self._channels.get(channel)
+            if wheel is None:
+                return ()
+            wheel.advance(int(current_tick))
+            return tuple(sorted(wheel.ready, key=lambda k: (wheel.due[k], str(k))))
+
+    def next_due_tick(self, channel: str) -> Optional[int]:
+        """channel で最も早い期限。期限切れで残っている鍵があればその期限。"""
+        with self._lock:
+            wheel = self._channels.get(channel)
+            return wheel.next_due_tick() if wheel is not None else None
+
+    def due_tick_of(self, channel: str, key: TimerKey) -> Optional[int]:
+        with self._lock:
+            wheel = self._channels.get(channel)
+            return wheel.due.get(key) if wheel is not None else None
+
+    def is_scheduled(self, channel: str, key: TimerKey) -> bool:
+        return self.due_tick_of(channel, key) is not None
+
+    def count(self, channel: str) -> int:
+        with self._lock:
+            wheel = self._channels.get(channel)
+            return len(wheel.due) if wheel is not None else 0
+
+    @property
+    def now(self) -> int:
+        """最後に問い合わせを受けた tick (snapshot 用)。"""
+        return self._now
+
+    def timers(self) -> Tuple[Tuple[str, TimerKey, int], ...]:
+        """保存用に (channel, key, due_tick) を決まった順で読み出す。"""
+        with self._lock:
+            return tuple(
+                sorted(
+                    (
+                        (channel, key, due_tick)
+                        for channel, wheel in self._channels.items()
+                        for key, due_tick in wheel.due.items()
+                    ),
+                    key=lambda entry: (entry[0], entry[2], str(entry[1])),
+                )
+            )
+
+    def replace_all(
+        self, timers: Iterable[Tuple[str, TimerKey, int]], *, now: int
+    ) -> None:
+        """復元用にすべて差し替える。追記ではない。"""
+        entries = list(timers)
+        with self._lock:
+            self._now = int(now)
+            self._channels = {}
+            for channel, key, due_tick in entries:
+                self.schedule(channel, key, due_tick)
+
+    def _channel(self, channel: str) -> _ChannelWheel:
+        wheel = self._channels.get(channel)
+        if wheel is None:
+            if not isinstance(channel, str) or not channel:
+                raise ValueError("channel must be a non-empty str")
+            wheel = _ChannelWheel(self._now)
+            self._channels[channel] = wheel
+        return wheel
+
+
+__all__ = ["TimerKey", "WorldTickTimerWheel"]
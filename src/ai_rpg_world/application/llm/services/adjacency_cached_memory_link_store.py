@@ -0,0 +1,201 @@
+"""Being ごとのリンク隣接リストをメモリに持つ MemoryLinkRepository の包み。
+
+SQLite 版の ``SqliteMemoryLinkStore`` は接続リンクを引くたびに
+``episode_id_a = ? OR episode_id_b = ?`` の query を打つ。拡散活性化や昇格は
+1 prompt で何度も接続リンクを読むため、Being 単位で全リンクを 1 回読み込み、
+以降の読み取りはメモリ上の隣接リストで答える。
+
+- 初回の読み取りで ``list_all_links_for_being`` から組み立てる (Being ごと)
+- ``upsert_link_by_being``: 内側に書いた後、読み込み済みなら同じ変更を反映
+- ``remove_weakest_link_for_episode_by_being``: 内側がどのリンクを消したかは
+  返ってこないので、削除後の接続リンクを内側から読み直して差分を落とす
+- ``replace_all_by_being``: 渡されたリンクで組み直す
+
+リンクの書き込みが全て本クラスを通ることが前提 (wiring で内側を外に出さない)。
+インメモリ実装は既に隣接リストを持つので包まない。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import RLock
+from typing import Dict, Sequence, Set, Tuple
+
+from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.memory.episodic.repository.memory_link_repository import (
+    MemoryLinkRepository,
+)
+from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (
+    MemoryLink,
+    MemoryLinkType,
+    effective_link_strength,
+    normalize_episode_pair,
+)
+
+_LinkKey = Tuple[str, str, MemoryLinkType]
+
+
+def _key_of(link: MemoryLink) -> _LinkKey:
+    # MemoryLink.__post_init__ で a < b に正規化済み
+    return (link.episode_id_a, link.episode_id_b, link.link_type)
+
+
+@dataclass
+class _BeingAdjacency:
+    links: Dict[_LinkKey, MemoryLink] = field(default_factory=dict)
+    by_episode: Dict[str, Set[_LinkKey]] = field(default_factory=dict)
+
+    def add(self, link: MemoryLink) -> None:
+        key = _key_of(link)
+        self.links[key] = link
+        self.by_episode.setdefault(link.episode_id_a, set()).add(key)
+        self.by_episode.setdefault(link.episode_id_b, set()).add(key)
+
+    def discard(self, key: _LinkKey) -> None:
+        if self.links.pop(key, None) is None:
+            return
+        for endpoint in key[:2]:
+            keys = self.by_episode.get(endpoint)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self.by_episode[endpoint]
+
+    def incident(self, episode_id: str) -> list[MemoryLink]:
+        return [self.links[k] for k in self.by_episode.get(episode_id, ())]
+
+
+class AdjacencyCachedMemoryLinkStore(MemoryLinkRepository):
+    def __init__(self, inner: MemoryLinkRepository) -> None:
+        if not isinstance(inner, MemoryLinkRepository):
+            raise TypeError("inner must be MemoryLinkRepository")
+        self._inner = inner
+        self._lock = RLock()
+        self._by_being: Dict[BeingId, _BeingAdjacency] = {}
+
+    @property
+    def inner(self) -> MemoryLinkRepository:
+        return self._inner
+
+    def _adjacency(self, being_id: BeingId) -> _BeingAdjacency:
+        # _lock 保持中に呼ぶ
+        if not isinstance(being_id, BeingId):
+            raise TypeError("being_id must be BeingId")
+        adjacency = self._by_being.get(being_id)
+        if adjacency is None:
+            adjacency = _BeingAdjacency()
+            for link in self._inner.list_all_links_for_being(being_id):
+                adjacency.add(link)
+            self._by_being[being_id] = adjacency
+        return adjacency
+
+    def is_loaded(self, being_id: BeingId) -> bool:
+        with self._lock:
+            return being_id in self._by_being
+
+    def upsert_link_by_being(self, being_id: BeingId, link: MemoryLink) -> None:
+        with self._lock:
+            self._inner.upsert_link_by_being(being_id, link)
+            adjacency = self._by_being.get(being_id)
+            if adjacency is not None:
+                adjacency.add(link)
+
+    def get_link_by_being(
+        self,
+        being_id: BeingId,
+        episode_id_a: str,
+        episode_id_b: str,
+        link_type: MemoryLinkType,
+    ) -> MemoryLink | None:
+        a, b = normalize_episode_pair(episode_id_a, episode_id_b)
+        with self._lock:
+            return self._adjacency(being_id).links.get((a, b, link_type))
+
+    def list_links_for_episode_by_being(
+        self,
+        being_id: BeingId,
+        episode_id: str,
+        *,
+        now: datetime,
+        limit: int,
+    ) -> list[MemoryLink]:
+        if limit <= 0:
+            return []
+        with self._lock:
+            links = self._adjacency(being_id).incident(episode_id.strip())
+        links.sort(key=lambda ln: effective_link_strength(ln, now), reverse=True)
+        return links[:limit]
+
+    def list_all_incident_links_by_being(
+        self,
+        being_id: BeingId,
+        episode_id: str,
+        *,
+        now: datetime,
+    ) -> list[MemoryLink]:
+        with self._lock:
+            return self._adjacency(being_id).incident(episode_id.strip())
+
+    def list_all_incident_links_for_episodes_by_being(
+        self,
+        being_id: BeingId,
+        episode_ids: Sequence[str],
+    ) -> dict[str, list[MemoryLink]]:
+        with self._lock:
+            adjacency = self._adjacency(being_id)
+            out: dict[str, list[MemoryLink]] = {}
+            for raw in episode_ids:
+                eid = raw.strip()
+                if eid not in out:
+                    out[eid] = adjacency.incident(eid)
+            return out
+
+    def count_links_for_episode_by_being(
+        self, being_id: BeingId, episode_id: str
+    ) -> int:
+        with self._lock:
+            return len(self._adjacency(being_id).by_episode.get(episode_id.strip(), ()))
+
+    def remove_weakest_link_for_episode_by_being(
+        self,
+        being_id: BeingId,
+        episode_id: str,
+        *,
+        now: datetime,
+    ) -> bool:
+        eid = episode_id.strip()
+        with self._lock:
+            removed = self._inner.remove_weakest_link_for_episode_by_being(
+                being_id, eid, now=now
+            )
+            adjacency = self._by_being.get(being_id)
+            if removed and adjacency is not None:
+                remaining = {
+                    _key_of(ln)
+                    for ln in self._inner.list_all_incident_links_by_being(
+                        being_id, eid, now=now
+                    )
+                }
+                for key in list(adjacency.by_episode.get(eid, ())):
+                    if key not in remaining:
+                        adjacency.discard(key)
+            return removed
+
+    def list_all_links_for_being(self, being_id: BeingId) -> list[MemoryLink]:
+        with self._lock:
+            return list(self._adjacency(being_id).links.values())
+
+    def replace_all_by_being(
+        self, being_id: BeingId, links: list[MemoryLink]
+    ) -> None:
+        with self._lock:
+            self._inner.replace_all_by_being(being_id, links)
+            adjacency = _BeingAdjacency()
+            for link in links:
+                adjacency.add(link)
+            self._by_being[being_id] = adjacency
+
+
+__all__ = ["AdjacencyCachedMemoryLinkStore"]
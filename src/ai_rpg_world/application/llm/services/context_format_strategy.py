@@ -10,12 +10,34 @@ from ai_rpg_world.application.llm.contracts.interfaces import IContextFormatStra
 # 詳細根拠は docs/memory_system/short_term_memory_design.md §5。
 SECTION_ORDER_STABLE_TO_VOLATILE = "stable_to_volatile"
 SECTION_ORDER_LEGACY = "legacy"
+# 実測の変動率で並びを決め直す layout (``prompt_layout.PrefixStableContextFormatStrategy``)。
+SECTION_ORDER_PREFIX_STABLE = "prefix_stable"
 
 _VALID_SECTION_ORDERS = frozenset({
     SECTION_ORDER_STABLE_TO_VOLATILE,
     SECTION_ORDER_LEGACY,
+    SECTION_ORDER_PREFIX_STABLE,
+})
+# ``SectionBasedContextFormatStrategy`` 自身が組める順序 (prefix_stable は派生クラス)。
+_SECTION_BASED_ORDERS = frozenset({
+    SECTION_ORDER_STABLE_TO_VOLATILE,
+    SECTION_ORDER_LEGACY,
 })
 
+# stable_to_volatile の並び (= prefix_stable の初期並び) の section 名。
+STABLE_TO_VOLATILE_SECTION_NAMES = (
+    "objective",
+    "long_summary",
+    "mid_summary",
+    "recent_events",
+    "prediction_feedback",
+    "pending_predictions",
+    "learned",
+    "relevant_memories",
+    "active_memos",
+    "current_state",
+)
+
 # 実験スクリプトから A/B 切替するための env var 名。
 # 既存の他の knob (EPISODIC_PROMOTION_FORCE_FULL_SCAN, SUBJECTIVE_EPISODE_DB_PATH
 # 等) と同じ env-var パターンに揃える。
@@ -67,9 +89,14 @@ class SectionBasedContextFormatStrategy(IContextFormatStrategy):
     """
 
     def __init__(self, section_order: str = SECTION_ORDER_STABLE_TO_VOLATILE) -> None:
-        if section_order not in _VALID_SECTION_ORDERS:
+        if section_order == SECTION_ORDER_PREFIX_STABLE:
+            raise ValueError(
+                "section_order='prefix_stable' is built by "
+                "PrefixStableContextFormatStrategy (prompt_layout)"
+            )
+        if section_order not in _SECTION_BASED_ORDERS:
             raise ValueError(
-                f"section_order must be one of {sorted(_VALID_SECTION_ORDERS)}; "
+                f"section_order must be one of {sorted(_SECTION_BASED_ORDERS)}; "
                 f"got {section_order!r}"
             )
         self._section_order = section_order
@@ -182,6 +209,18 @@ def build_section_format_strategy_from_env(
     """
     order = resolve_section_order_from_env(env=env)
     _logger.info("SectionBasedContextFormatStrategy section_order=%s", order)
+    return build_section_format_strategy(order)
+
+
+def build_section_format_strategy(order: str) -> SectionBasedContextFormatStrategy:
+    """解決済みの section 順序識別子から strategy を組む。"""
+    if order == SECTION_ORDER_PREFIX_STABLE:
+        # prompt_layout は本 module を import するので関数内で import する
+        from ai_rpg_world.application.llm.services.prompt_layout import (
+            PrefixStableContextFormatStrategy,
+        )
+
+        return PrefixStableContextFormatStrategy()
     return SectionBasedContextFormatStrategy(section_order=order)
 
 
@@ -349,27 +388,78 @@ def _format_stable_to_volatile(
       11-19% 変動 (memos より少ないが non-trivial)。両方下に集約することで
       静的群 + recent_events までの prefix を完全に safe にする
     """
-    sections: list[str] = []
+    return "\n\n".join(
+        block
+        for _, block in build_section_blocks(
+            current_state_text=current_state_text,
+            recent_events_text=recent_events_text,
+            relevant_memories_text=relevant_memories_text,
+            active_memos_text=active_memos_text,
+            objective_text=objective_text,
+            inventory_text=inventory_text,
+            learned_text=learned_text,
+            mid_summary_text=mid_summary_text,
+            long_summary_text=long_summary_text,
+            prediction_feedback_text=prediction_feedback_text,
+            pending_predictions_text=pending_predictions_text,
+        )
+    )
+
+
+def build_section_blocks(
+    *,
+    current_state_text: str,
+    recent_events_text: str,
+    relevant_memories_text: str = "",
+    active_memos_text: str = "",
+    objective_text: str = "",
+    inventory_text: str = "",
+    learned_text: str = "",
+    mid_summary_text: str = "",
+    long_summary_text: str = "",
+    prediction_feedback_text: str = "",
+    pending_predictions_text: str = "",
+) -> list[tuple[str, str]]:
+    """section ごとの本文 (見出し込み) を stable_to_volatile の並びで返す。
+
+    要素は ``(section 名, block)``。空の任意 section は含めない。block 同士を
+    空行で繋ぐと ``stable_to_volatile`` の出力と byte 単位で一致する。
+    所持品は current_state に一本化済みなので ``inventory_text`` は使わない
+    (引数は interface 互換のため受ける)。
+    """
+    for name, value in (
+        ("current_state_text", current_state_text),
+        ("recent_events_text", recent_events_text),
+        ("relevant_memories_text", relevant_memories_text),
+        ("active_memos_text", active_memos_text),
+        ("objective_text", objective_text),
+        ("inventory_text", inventory_text),
+        ("learned_text", learned_text),
+        ("mid_summary_text", mid_summary_text),
+        ("long_summary_text", long_summary_text),
+        ("prediction_feedback_text", prediction_feedback_text),
+        ("pending_predictions_text", pending_predictions_text),
+    ):
+        if not isinstance(value, str):
+            raise TypeError(f"{name} must be str")
+    del inventory_text
+    blocks: list[tuple[str, str]] = []
+
+    def _add(name: str, *lines: str) -> None:
+        blocks.append((name, "\n".join(lines)))
 
     # 1. 現在の目的 (静的、空なら省略)
-    _emit_objective(sections, objective_text)
+    if objective_text.strip():
+        _add("objective", "【現在の目的】", objective_text.strip())
 
     # 2. 自己像と世界観 (L5 long summary、空なら省略)
     # 最も更新頻度が低い (= prefix cache 寿命最長) ので objective の直後
     if long_summary_text.strip():
-        sections.extend([
-            "【自己像と世界観】",
-            long_summary_text.strip(),
-            "",
-        ])
+        _add("long_summary", "【自己像と世界観】", long_summary_text.strip())
 
     # 3. 最近の流れ (L4 mid summary、空なら省略)
     if mid_summary_text.strip():
-        sections.extend([
-            "【最近の流れ】",
-            mid_summary_text.strip(),
-            "",
-        ])
+        _add("mid_summary", "【最近の流れ】", mid_summary_text.strip())
 
     # 4. 直近の出来事 (常に出す。空なら「（なし）」)
     # 末尾 append 中心で **head は完全安定** (一度 append された行は決して
@@ -377,67 +467,52 @@ def _format_stable_to_volatile(
     # recent_events の head」までを stable prefix として cache hit
     # させる。learned / memos / recall を上に置くと、それらの変動で
     # recent_events の head 安定 cache が破壊される。
-    sections.extend([
+    _add(
+        "recent_events",
         "【直近の出来事】",
         _RECENT_EVENTS_PREAMBLE,
         recent_events_text.strip() or _PLACEHOLDER_RECENT_EVENTS,
-        "",
-    ])
+    )
 
     # 5. 前回の予測と実際 (空なら省略)
     # 毎ターン直前 action 依存で volatile (= 100% 変動)。シナリオが
     # expected_result_policy=off なら常時空。
     if prediction_feedback_text.strip():
-        sections.extend([
-            "【前回の予測と実際】",
-            prediction_feedback_text.strip(),
-            "",
-        ])
+        _add("prediction_feedback", "【前回の予測と実際】", prediction_feedback_text.strip())
 
     # 5b. 保留中の予測 (U10a / 部品6、空なら省略)
     # 【前回の予測と実際】の隣に置く (計画書の配置指定)。再浮上しなければ
     # flag ON でも常に空 (= section ごと省略)。
     if pending_predictions_text.strip():
-        sections.extend([
-            "【保留中の予測】",
-            pending_predictions_text.strip(),
-            "",
-        ])
+        _add("pending_predictions", "【保留中の予測】", pending_predictions_text.strip())
 
     # 6. 関連する学び (semantic top-K、空なら省略)
     # score で top-K を選ぶが、表示順は entry_id で安定化されている。
     if learned_text.strip():
-        sections.extend([
-            "【関連する学び】",
-            learned_text.strip(),
-            "",
-        ])
+        _add("learned", "【関連する学び】", learned_text.strip())
 
     # 7. 関連する記憶 (volatile、cue 再計算で 19-32% 変動)
     # 受動想起 service が未注入なら空文字 → section ごと省略。
     # 末尾近くに置くことで「今ここで関連する記憶」への attention を強める
     # (Lost in the Middle 緩和)。
     if relevant_memories_text.strip():
-        sections.extend([
+        _add(
+            "relevant_memories",
             "【関連する記憶】(あなた自身の過去の体験として自動的に思い出されたもの)",
             relevant_memories_text.strip(),
-            "",
-        ])
+        )
 
     # 8. 進行中のメモ (high-volatile、空なら省略)
     if active_memos_text.strip():
-        sections.extend([
-            "【進行中のメモ】",
-            active_memos_text.strip(),
-            "",
-        ])
+        _add("active_memos", "【進行中のメモ】", active_memos_text.strip())
 
     # 9. 現在地と周囲 (必須、最 volatile なので末尾)
-    sections.extend([
+    _add(
+        "current_state",
         "【現在地と周囲】",
         current_state_text.strip() or _PLACEHOLDER_CURRENT_STATE,
-    ])
-    return "\n".join(sections)
+    )
+    return blocks
 
 
 def _format_legacy(
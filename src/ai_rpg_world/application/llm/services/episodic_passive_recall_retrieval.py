@@ -12,6 +12,9 @@ from ai_rpg_world.domain.being.value_object.being_id import BeingId
 from ai_rpg_world.domain.memory.episodic.repository.episodic_episode_repository import EpisodicEpisodeRepository
 from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue import EpisodicCue
 from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode import SubjectiveEpisode
+from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode_header import (
+    SubjectiveEpisodeHeader,
+)
 from ai_rpg_world.domain.memory.episodic.repository.memory_link_repository import MemoryLinkRepository
 from ai_rpg_world.application.llm.services.episodic_spreading_activation import (
     neighbor_priming_scores,
@@ -98,7 +101,7 @@ def _merged_ordered_episodes_for_cue_bucket(
     dict[str, frozenset[str]],
 ]:
     """
-    単一論理バケツ内で list_by_cue を統合する。
+    単一論理バケツ内の cue を list_by_cues でまとめて引いて統合する。
     place ファミリーはラウンドロビン・ラベルが cue:place_family、ソースは cue:{axis} のまま。
     object および place は粒度の高い一致を arm 内の並びで優先する。
 
@@ -115,7 +118,7 @@ def _merged_ordered_episodes_for_cue_bucket(
     cue_axis = cues[0].axis
     use_quality = _episode_arm_sort_quality(bucket, cue_axis)
 
-    merged: dict[str, SubjectiveEpisode] = {}
+    merged: dict[str, SubjectiveEpisodeHeader] = {}
     labels_by_ep: dict[str, set[str]] = defaultdict(set)
     cue_keys_by_ep: dict[str, set[str]] = defaultdict(set)
     max_gran: dict[str, float] = defaultdict(float)
@@ -127,31 +130,44 @@ def _merged_ordered_episodes_for_cue_bucket(
     # 切り直すため、外向きの contract は変えない。
     per_cue_fetch_limit = max(limit_per_axis, limit_per_axis * len(cues))
 
+    # cue ごとの軸ラベルと粒度重み (canonical で引く)。同じ canonical の cue は
+    # retrieve() 側で既に 1 つに畳まれている。
+    cue_meta: dict[str, tuple[str, float]] = {}
     for cue in cues:
-        ax_label = passive_recall_cue_axis_source_label(cue)
-        cue_canonical = cue.to_canonical()
         if bucket == PASSIVE_RECALL_PLACE_FAMILY_BUCKET_KEY:
             g_weight = passive_recall_place_axis_granularity_weight(cue.axis)
         elif cue.axis == "object":
             g_weight = passive_recall_object_value_granularity_weight(cue.value)
         else:
             g_weight = 0.0
-
-        cue_episodes = store.list_by_cue_by_being(
-            being_id,
-            cue,
-            per_cue_fetch_limit,
-            min_occurred_at=min_occurred_at,
+        cue_meta[cue.to_canonical()] = (
+            passive_recall_cue_axis_source_label(cue),
+            g_weight,
         )
-        for ep in cue_episodes:
-            eid = ep.episode_id
-            merged[eid] = ep
+
+    # bucket 内の cue をまとめて 1 回で引く (cue ごとの上位
+    # ``per_cue_fetch_limit`` 件の和集合 + episode ごとのマッチ cue 集合)。
+    # ここでは見出しだけを受け取り、episode 本体は並べ替えで残った
+    # ``limit_per_axis`` 件だけを組み立てる。
+    for header in store.list_cue_headers_by_being(
+        being_id,
+        cues,
+        per_cue_fetch_limit,
+        min_occurred_at=min_occurred_at,
+    ):
+        eid = header.episode_id
+        merged[eid] = header
+        for cue_canonical in header.matched_cue_canonicals:
+            meta = cue_meta.get(cue_canonical)
+            if meta is None:
+                continue
+            ax_label, g_weight = meta
             labels_by_ep[eid].add(ax_label)
             cue_keys_by_ep[eid].add(cue_canonical)
             if use_quality:
                 max_gran[eid] = max(max_gran[eid], g_weight)
 
-    def arm_sort_key(ep: SubjectiveEpisode) -> tuple[int, float, datetime, str]:
+    def arm_sort_key(header: SubjectiveEpisodeHeader) -> tuple[int, float, float, str]:
         # PR6 (R3): within-bucket での distinct cue マッチ数を最優先キーに乗せる。
         # これにより「同 bucket 内で複数 cue 値にマッチした episode」が
         # limit_per_axis の切断より前に上位化される (cross-bucket 分の score は
@@ -159,14 +175,18 @@ def _merged_ordered_episodes_for_cue_bucket(
         # 加点が limit に阻まれて反映できないケースは「両 bucket とも
         # limit_per_axis に収まる」前提に依存する — 通常運用の limit は
         # 充分大きく、現状その想定で OK)。
-        bucket_cue_hits = len(cue_keys_by_ep.get(ep.episode_id, ()))
-        gran = max_gran[ep.episode_id] if use_quality else 0.0
-        dt, eid = _occurrence_sort_key(ep)
-        return (bucket_cue_hits, gran, dt, eid)
+        bucket_cue_hits = len(cue_keys_by_ep.get(header.episode_id, ()))
+        gran = max_gran[header.episode_id] if use_quality else 0.0
+        return (bucket_cue_hits, gran, header.occurred_at_key, header.episode_id)
 
-    ordered = sorted(merged.values(), key=arm_sort_key, reverse=True)
+    ordered_headers = sorted(merged.values(), key=arm_sort_key, reverse=True)
     if limit_per_axis > 0:
-        ordered = ordered[:limit_per_axis]
+        ordered_headers = ordered_headers[:limit_per_axis]
+    episodes = store.get_many_by_being(
+        being_id, [h.episode_id for h in ordered_headers]
+    )
+    # 見出しを取ってから読むまでに消えた episode (上限 eviction 等) は落とす
+    ordered = [episodes[h.episode_id] for h in ordered_headers if h.episode_id in episodes]
 
     labels_frozen = {eid: frozenset(ls) for eid, ls in labels_by_ep.items()}
     cue_keys_frozen = {eid: frozenset(ks) for eid, ks in cue_keys_by_ep.items()}
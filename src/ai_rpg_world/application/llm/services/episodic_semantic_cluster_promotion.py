@@ -23,7 +23,7 @@ import logging
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Callable, Dict, Optional, Sequence, Set
+from typing import AbstractSet, Callable, Dict, Optional, Sequence, Set, Tuple
 from uuid import uuid4
 
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
@@ -50,6 +50,9 @@ from ai_rpg_world.application.llm.services.belief_evidence_cue_signature import
     build_belief_evidence_cue_signature,
 )
 from ai_rpg_world.application.llm.services.episodic_promotion_frontier import EpisodicPromotionFrontier
+from ai_rpg_world.application.llm.services.episodic_strong_link_components import (
+    EpisodicStrongLinkComponents,
+)
 from ai_rpg_world.application.llm.services.semantic_gist_service import (
     SemanticGistResult,
     SemanticGistService,
@@ -203,6 +206,11 @@ class EpisodicSemanticClusterPromotionService:
     # U3b: 注入時のみ FAMILIARITY 転用モード (store 直書きをやめ、evidence buffer
     # に emit する / recall_count ゲートを外す)。未注入 (default) は従来挙動。
     belief_evidence_buffer_store: Optional[BeliefEvidenceBufferRepository] = None
+    # 注入時は強リンクの disjoint-set から「前回以降に変わった成分」だけを
+    # 調べる (隣接リストの組み直し・全リンク走査をしない)。``link_store`` は
+    # 同じ components に書き込みを反映する ``StrongLinkIndexedMemoryLinkStore``
+    # であること。``force_full_scan`` が立っていれば従来の全走査を優先する。
+    strong_link_components: Optional[EpisodicStrongLinkComponents] = None
 
     def _register_signature(self, being_id: BeingId, sig: str) -> bool:
         """being_id 経路で signature 登録する。"""
@@ -223,52 +231,38 @@ class EpisodicSemanticClusterPromotionService:
     ) -> None:
         """LLM ツール実行 1 回成功後に呼び、昇格候補があればストアへ追加する。"""
         now = now or datetime.now(timezone.utc)
-        if self.force_full_scan or self.promotion_frontier is None:
-            adj = _build_strong_adjacency(being_id, self.link_store, now)
+        if self.strong_link_components is not None and not self.force_full_scan:
+            seeds: Set[str] = set()
+            if self.promotion_frontier is not None:
+                # リンクの変化は components 側が追うが、フロンティアには想起回数の
+                # 増加も載る。捨てると recall_count ゲートで一度見送った成分が
+                # 閾値を越えても二度と dirty にならず、昇格が止まる。
+                seeds = set(self.promotion_frontier.drain(being_id))
+            clusters = self._changed_strong_components(being_id, now, seeds)
         else:
-            seeds = self.promotion_frontier.drain(being_id)
-            if not seeds:
-                adj = _build_strong_adjacency(being_id, self.link_store, now)
-            else:
-                nodes = _expand_frontier_nodes(
-                    being_id,
-                    self.link_store,
-                    seeds,
-                    now,
-                    self.expansion_hops,
-                )
-                adj = _build_strong_adjacency_for_nodes(
-                    being_id,
-                    self.link_store,
-                    nodes,
-                    now,
-                )
-        if not adj:
+            adj = self._strong_adjacency(being_id, now)
+            clusters = [(comp, None) for comp in _connected_components(adj)]
+        if not clusters:
             return
         # U3b: 注入されていれば FAMILIARITY 転用モード。store 直書きをやめ
         # evidence buffer に emit するので、recall_count>=3 ゲートも外れる
         # (「学習のゲートではなくエピソード想起の spreading/優先度に純化する」
         # という設計判断)。
         familiarity_mode = self.belief_evidence_buffer_store is not None
-        for comp in _connected_components(adj):
+        for comp, cached_sig in clusters:
             if len(comp) < MIN_CLUSTER_SIZE:
                 continue
-            eps: list[SubjectiveEpisode] = []
-            cluster_ok = True
-            for eid in comp:
-                # Phase 3 Step 3e-2: episode_store も being_id 経路に統一。
-                # ここに来た時点で being_id は resolve 済 (= 先頭で early return)
-                ep = self.episode_store.get_by_being(being_id, eid)
-                if ep is None:
-                    cluster_ok = False
-                    break
-                if not familiarity_mode and ep.recall_count < MIN_RECALL_COUNT:
-                    cluster_ok = False
-                    break
-                eps.append(ep)
-            if not cluster_ok or len(eps) < MIN_CLUSTER_SIZE:
+            # Phase 3 Step 3e-2: episode_store も being_id 経路に統一。
+            # メンバーは 1 回の batched query でまとめて引く
+            found = self.episode_store.get_many_by_being(being_id, sorted(comp))
+            if len(found) < len(comp):
+                continue
+            eps: list[SubjectiveEpisode] = list(found.values())
+            if not familiarity_mode and any(
+                ep.recall_count < MIN_RECALL_COUNT for ep in eps
+            ):
                 continue
-            sig = _evidence_signature(comp)
+            sig = cached_sig or _evidence_signature(comp)
             if not self._register_signature(being_id, sig):
                 continue
             if familiarity_mode:
@@ -289,6 +283,61 @@ class EpisodicSemanticClusterPromotionService:
             )
             self._add_entry(being_id, entry)
 
+    def _strong_adjacency(self, being_id: BeingId, now: datetime) -> Dict[str, Set[str]]:
+        """フロンティア (無ければ全リンク) から強リンクの隣接リストを組む。"""
+        if self.force_full_scan or self.promotion_frontier is None:
+            return _build_strong_adjacency(being_id, self.link_store, now)
+        seeds = self.promotion_frontier.drain(being_id)
+        if not seeds:
+            return _build_strong_adjacency(being_id, self.link_store, now)
+        nodes = _expand_frontier_nodes(
+            being_id,
+            self.link_store,
+            seeds,
+            now,
+            self.expansion_hops,
+        )
+        return _build_strong_adjacency_for_nodes(
+            being_id,
+            self.link_store,
+            nodes,
+            now,
+        )
+
+    def _changed_strong_components(
+        self, being_id: BeingId, now: datetime, seeds: AbstractSet[str] = frozenset()
+    ) -> list[Tuple[Set[str], Optional[str]]]:
+        """disjoint-set の dirty な成分を、今の実効強度で確かめて返す。
+
+        成分は upsert 時点の強度で union した過大近似なので、成分内だけの
+        強リンクで連結成分を取り直す。一致すれば成分の cached signature を
+        そのまま使い、分かれていれば components 側も分け直す。初回は Being の
+        全リンクから組み立てる (= 従来の初回全走査に相当)。
+
+        ``seeds`` はフロンティアから取り出したエピソード ID。リンクが変わって
+        いなくても (想起回数が増えただけでも) その成分を dirty にして調べ直す。
+        """
+        components = self.strong_link_components
+        assert components is not None
+        if not components.is_loaded(being_id):
+            components.load(being_id, self.link_store.list_all_links_for_being(being_id))
+        for episode_id in sorted(seeds):
+            components.note_episode_touched(being_id, episode_id)
+        out: list[Tuple[Set[str], Optional[str]]] = []
+        for component in components.drain_dirty_components(
+            being_id, min_size=MIN_CLUSTER_SIZE
+        ):
+            adj = _build_strong_adjacency_for_nodes(
+                being_id, self.link_store, set(component.members), now
+            )
+            parts = _connected_components(adj)
+            if len(parts) == 1 and parts[0] == component.members:
+                out.append((parts[0], component.signature))
+                continue
+            components.split(being_id, component, parts)
+            out.extend((part, None) for part in parts)
+        return out
+
     def _emit_familiarity_evidence(
         self,
         being_id: BeingId,
@@ -6,7 +6,6 @@ Phase 3 Step 3c-3 (Issue #470): legacy player_id 経路を撤去し、being_id 
 
 from __future__ import annotations
 
-from collections import deque
 from datetime import datetime
 
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
@@ -19,6 +18,11 @@ from ai_rpg_world.domain.memory.episodic.repository.memory_link_repository impor
 )
 
 
+# 1 ノードから辿るリンクの上限 (実効強度の強い順)。旧実装の
+# ``list_links_for_episode_by_being(limit=256)`` と同じ値。
+NEIGHBOR_LINKS_PER_NODE = 256
+
+
 def neighbor_priming_scores(
     *,
     being_id: BeingId,
@@ -33,31 +37,53 @@ def neighbor_priming_scores(
     (シード自身は含めない)。
 
     Phase 3 Step 3c-3 で being_id keyed only。``being_id`` は必須引数。
+
+    hop ごとに同期して展開する。各 hop のフロンティア (= 直前の hop で
+    スコアが伸びたノードと、そのスコア) の接続リンクを
+    ``list_all_incident_links_for_episodes_by_being`` で 1 回に引き、実効強度は
+    そこで 1 リンク 1 回だけ計算する。ノードごとに強い順の上位
+    ``NEIGHBOR_LINKS_PER_NODE`` 本だけを辿る。
+
+    キューで 1 ノードずつ展開していた旧実装と結果は同じ: 同じ hop で同じ
+    ノードが複数回伸びても、後段に効くのは最大値の展開だけなので、フロンティアに
+    最大値 1 つを載せれば足りる。
     """
     if not isinstance(being_id, BeingId):
         raise TypeError("being_id must be BeingId")
     best: dict[str, float] = {}
-    q: deque[tuple[str, int, float]] = deque()
-    for sid in seed_episode_ids:
-        q.append((sid, 0, 1.0))
-
-    while q:
-        node, hop, act = q.popleft()
-        if hop >= max_hops:
-            continue
-        for link in link_store.list_links_for_episode_by_being(
-            being_id, node, now=now, limit=256
-        ):
-            other = other_episode_id(link, node)
-            if other in seed_episode_ids:
-                continue
-            eff = effective_link_strength(link, now)
-            n_score = act * eff * (hop_decay ** (hop + 1))
-            if n_score < min_score:
-                continue
-            prev = best.get(other, 0.0)
-            if n_score > prev:
-                best[other] = n_score
-                q.append((other, hop + 1, n_score))
+    frontier: dict[str, float] = {sid: 1.0 for sid in seed_episode_ids}
+
+    for hop in range(max_hops):
+        if not frontier:
+            break
+        incident = link_store.list_all_incident_links_for_episodes_by_being(
+            being_id, list(frontier)
+        )
+        # 実効強度はフロンティア全体でリンクごとに 1 回だけ計算する
+        strength_by_link: dict[int, float] = {}
+        for links in incident.values():
+            for link in links:
+                key = id(link)
+                if key not in strength_by_link:
+                    strength_by_link[key] = effective_link_strength(link, now)
+        decay = hop_decay ** (hop + 1)
+        next_frontier: dict[str, float] = {}
+        for node, act in frontier.items():
+            links = incident.get(node.strip(), ())
+            if len(links) > NEIGHBOR_LINKS_PER_NODE:
+                links = sorted(
+                    links, key=lambda ln: strength_by_link[id(ln)], reverse=True
+                )[:NEIGHBOR_LINKS_PER_NODE]
+            for link in links:
+                other = other_episode_id(link, node)
+                if other in seed_episode_ids:
+                    continue
+                n_score = act * strength_by_link[id(link)] * decay
+                if n_score < min_score:
+                    continue
+                if n_score > best.get(other, 0.0):
+                    best[other] = n_score
+                    next_frontier[other] = n_score
+        frontier = next_frontier
 
     return best
@@ -0,0 +1,248 @@
+"""強リンクで結ばれたエピソードの連結成分を Being ごとに保持する disjoint-set。
+
+セマンティック昇格 (``EpisodicSemanticClusterPromotionService``) はツール実行
+1 回ごとに強リンクの隣接リストを組み直し、BFS で連結成分を求めていた。
+フロンティアが空のときは Being の全リンクを走査する。本構造は
+
+- ``strength >= min_strength`` のリンクが upsert されたら両端を union する
+- union / 弱化 / 削除で触れた成分を dirty として覚える
+- 昇格側は dirty な成分だけを ``drain_dirty_components`` で受け取る
+
+ことで、昇格 1 回の仕事量を「前回から変わったリンク」に比例させる。
+
+実効強度 (``effective_link_strength``) は時間とともに減衰するだけなので、
+ある時点で実効強度が閾値以上のリンクは upsert 時点の ``strength`` も閾値以上
+である。したがって本構造の成分は「今の強リンクで見た連結成分」を必ず包含する
+(過大近似)。減衰や弱化で実際には分かれている成分は、昇格側が成分内だけを
+調べ直して ``split`` で分け直す。減衰だけで (リンクに触れずに) 成分が分かれた
+場合は、次にその成分のどこかに触れたときに拾われる。
+
+成分ごとに大きさ (``len(members)``) と signature (メンバー ID の整列連結) を
+持ち、signature は成分が変わるまでキャッシュする。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.memory.episodic.value_object.memory_link import MemoryLink
+
+# EpisodicSemanticClusterPromotionService.MIN_EFFECTIVE_STRENGTH と同じ値
+DEFAULT_MIN_STRENGTH = 0.5
+
+
+def component_signature(members: Iterable[str]) -> str:
+    """成分の signature。昇格側の ``_evidence_signature`` と同じ形式。"""
+    return ",".join(sorted(members))
+
+
+@dataclass
+class StrongLinkComponent:
+    """dirty として取り出された 1 成分のスナップショット。"""
+
+    members: FrozenSet[str]
+    signature: str
+
+    @property
+    def size(self) -> int:
+        return len(self.members)
+
+
+@dataclass
+class _BeingForest:
+    """1 Being 分の disjoint-set。単独のエピソードは登録しない。"""
+
+    parent: Dict[str, str] = field(default_factory=dict)
+    # root → 成分のメンバー (root 自身を含む)
+    members: Dict[str, Set[str]] = field(default_factory=dict)
+    # root → signature のキャッシュ。成分が変わったら捨てる
+    signatures: Dict[str, str] = field(default_factory=dict)
+    # 前回の drain 以降に触れたエピソード ID
+    dirty: Set[str] = field(default_factory=set)
+    loaded: bool = False
+
+    def find(self, node: str) -> Optional[str]:
+        parent = self.parent
+        if node not in parent:
+            return None
+        while parent[node] != node:
+            # path halving
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, a: str, b: str) -> None:
+        ra = self._find_or_add(a)
+        rb = self._find_or_add(b)
+        if ra == rb:
+            return
+        # 小さい方を大きい方へ寄せる (union by size)
+        if len(self.members[ra]) < len(self.members[rb]):
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.members[ra] |= self.members.pop(rb)
+        self.signatures.pop(ra, None)
+        self.signatures.pop(rb, None)
+
+    def _find_or_add(self, node: str) -> str:
+        root = self.find(node)
+        if root is None:
+            self.parent[node] = node
+            self.members[node] = {node}
+            root = node
+        return root
+
+    def signature_of(self, root: str) -> str:
+        sig = self.signatures.get(root)
+        if sig is None:
+            sig = self.signatures[root] = component_signature(self.members[root])
+        return sig
+
+    def detach(self, root: str) -> Set[str]:
+        """成分を丸ごと外し、メンバーを返す。"""
+        members = self.members.pop(root)
+        self.signatures.pop(root, None)
+        for m in members:
+            del self.parent[m]
+        return members
+
+
+class EpisodicStrongLinkComponents:
+    """Being ごとの強リンク disjoint-set。スレッドセーフ。"""
+
+    def __init__(self, min_strength: float = DEFAULT_MIN_STRENGTH) -> None:
+        self._min_strength = min_strength
+        self._lock = Lock()
+        self._forests: Dict[BeingId, _BeingForest] = {}
+
+    @property
+    def min_strength(self) -> float:
+        return self._min_strength
+
+    def _forest(self, being_id: BeingId) -> _BeingForest:
+        if not isinstance(being_id, BeingId):
+            raise TypeError("being_id must be BeingId")
+        forest = self._forests.get(being_id)
+        if forest is None:
+            forest = self._forests[being_id] = _BeingForest()
+        return forest
+
+    def is_loaded(self, being_id: BeingId) -> bool:
+        with self._lock:
+            return self._forest(being_id).loaded
+
+    def load(self, being_id: BeingId, links: Iterable[MemoryLink]) -> None:
+        """Being の既存リンクから組み直す。全成分を dirty にする。
+
+        ``links`` を読んだ後に ``note_link`` で入った union も失わないよう、
+        それまでの成分も引き継ぐ。
+        """
+        strong = [ln for ln in links if ln.strength >= self._min_strength]
+        with self._lock:
+            previous = self._forest(being_id)
+            forest = _BeingForest(loaded=True)
+            for root, members in previous.members.items():
+                for m in members:
+                    forest.union(root, m)
+            for ln in strong:
+                forest.union(ln.episode_id_a, ln.episode_id_b)
+            forest.dirty.update(forest.parent)
+            self._forests[being_id] = forest
+
+    def forget(self, being_id: BeingId) -> None:
+        """Being 分を捨てる (リンクの一括置換後など)。次の ``load`` まで未ロード扱い。"""
+        with self._lock:
+            self._forests.pop(being_id, None)
+
+    def note_link(self, being_id: BeingId, link: MemoryLink) -> None:
+        """upsert されたリンクを反映する。
+
+        閾値以上なら union し、閾値未満なら既存成分に属する端点だけ dirty に
+        する (弱化で成分が分かれたかもしれない)。どちらの端点も成分に属さない
+        弱いリンクは何もしない。
+        """
+        a, b = link.episode_id_a, link.episode_id_b
+        with self._lock:
+            forest = self._forest(being_id)
+            if link.strength >= self._min_strength:
+                forest.union(a, b)
+                forest.dirty.add(a)
+                forest.dirty.add(b)
+                return
+            for node in (a, b):
+                if node in forest.parent:
+                    forest.dirty.add(node)
+
+    def note_episode_touched(self, being_id: BeingId, episode_id: str) -> None:
+        """リンク削除など、端点しか分からない変更を dirty として記録する。"""
+        with self._lock:
+            forest = self._forest(being_id)
+            if episode_id in forest.parent:
+                forest.dirty.add(episode_id)
+
+    def drain_dirty_components(
+        self, being_id: BeingId, *, min_size: int = 1
+    ) -> List[StrongLinkComponent]:
+        """前回以降に触れた成分を返し、dirty を空にする。
+
+        ``min_size`` 未満の成分は返さない (dirty からは消える。後で union されて
+        大きくなれば再び dirty になる)。
+        """
+        with self._lock:
+            forest = self._forest(being_id)
+            dirty, forest.dirty = forest.dirty, set()
+            roots: Dict[str, None] = {}
+            for node in sorted(dirty):
+                root = forest.find(node)
+                if root is not None:
+                    roots.setdefault(root, None)
+            out: List[StrongLinkComponent] = []
+            for root in roots:
+                members = forest.members[root]
+                if len(members) < min_size:
+                    continue
+                out.append(
+                    StrongLinkComponent(
+                        members=frozenset(members),
+                        signature=forest.signature_of(root),
+                    )
+                )
+            return out
+
+    def split(
+        self,
+        being_id: BeingId,
+        component: StrongLinkComponent,
+        parts: Iterable[Set[str]],
+    ) -> None:
+        """過大近似だった成分を、実際の強リンク成分 ``parts`` で分け直す。
+
+        ``parts`` に現れないメンバーは単独 (= 登録なし) に戻る。``component`` が
+        drain 後に別成分と union されていたら (メンバーが変わっていたら) 何もしない。
+        """
+        with self._lock:
+            forest = self._forest(being_id)
+            root = forest.find(next(iter(component.members)))
+            if root is None or forest.members[root] != component.members:
+                return
+            forest.detach(root)
+            for part in parts:
+                nodes = sorted(part & component.members)
+                for other in nodes[1:]:
+                    forest.union(nodes[0], other)
+
+    def component_count(self, being_id: BeingId) -> int:
+        """2 件以上から成る成分の数 (テスト・計測用)。"""
+        with self._lock:
+            return len(self._forest(being_id).members)
+
+
+__all__ = [
+    "DEFAULT_MIN_STRENGTH",
+    "EpisodicStrongLinkComponents",
+    "StrongLinkComponent",
+    "component_signature",
+]
@@ -208,7 +208,7 @@ class EpisodicMemoryRecallToolExecutor:
         cues: List[EpisodicCue],
         min_occurred_at: Optional[datetime],
     ) -> List[SubjectiveEpisode]:
-        """cue があれば各 cue で list_by_cue + 重複除去、無ければ list_recent。
+        """cue があれば list_by_cues (各 cue の上位の和集合)、無ければ list_recent。
 
         list_by_cue / list_recent の ``min_occurred_at`` パラメタは
         「これより古い episode のみ返す」(= sliding window 範囲外フィルタ
@@ -218,14 +218,12 @@ class EpisodicMemoryRecallToolExecutor:
         """
         candidates: Dict[str, SubjectiveEpisode] = {}
         if cues:
-            for cue in cues:
-                rows = self.episode_store.list_by_cue_by_being(
-                    being_id,
-                    cue,
-                    _STORE_FETCH_OVERFETCH,
-                )
-                for ep in rows:
-                    candidates[ep.episode_id] = ep
+            for ep, _matched in self.episode_store.list_by_cues_by_being(
+                being_id,
+                cues,
+                _STORE_FETCH_OVERFETCH,
+            ):
+                candidates[ep.episode_id] = ep
         else:
             rows = self.episode_store.list_recent_by_being(
                 being_id,
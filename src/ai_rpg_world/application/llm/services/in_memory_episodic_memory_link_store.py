@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime
-from typing import DefaultDict, Dict, Set, Tuple
+from typing import DefaultDict, Dict, Sequence, Set, Tuple
 
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
 from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (
@@ -129,6 +129,26 @@ class InMemoryMemoryLinkStore(MemoryLinkRepository):
                 out.append(link)
         return out
 
+    def list_all_incident_links_for_episodes_by_being(
+        self,
+        being_id: BeingId,
+        episode_ids: Sequence[str],
+    ) -> dict[str, list[MemoryLink]]:
+        if not isinstance(being_id, BeingId):
+            raise TypeError("being_id must be BeingId")
+        by_episode = self._by_being_episode.get(being_id, {})
+        out: dict[str, list[MemoryLink]] = {}
+        for raw in episode_ids:
+            eid = raw.strip()
+            if eid in out:
+                continue
+            out[eid] = [
+                link
+                for k in by_episode.get(eid, ())
+                if (link := self._by_being_key.get(k)) is not None
+            ]
+        return out
+
     def count_links_for_episode_by_being(
         self, being_id: BeingId, episode_id: str
     ) -> int:
@@ -14,11 +14,15 @@ from __future__ import annotations
 
 import threading
 from datetime import datetime, timezone
+from typing import Sequence
 
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
 from ai_rpg_world.domain.memory.episodic.repository.episodic_episode_repository import EpisodicEpisodeRepository
 from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue import EpisodicCue
 from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode import SubjectiveEpisode
+from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode_header import (
+    SubjectiveEpisodeHeader,
+)
 
 
 def _occurrence_sort_key(ep: SubjectiveEpisode) -> tuple[datetime, str]:
@@ -128,6 +132,15 @@ class InMemorySubjectiveEpisodeStore(EpisodicEpisodeRepository):
         with self._lock:
             return self._episodes_by_being.get(being_id, {}).get(episode_id)
 
+    def get_many_by_being(
+        self, being_id: BeingId, episode_ids: Sequence[str]
+    ) -> dict[str, SubjectiveEpisode]:
+        if not isinstance(being_id, BeingId):
+            raise TypeError("being_id must be BeingId")
+        with self._lock:
+            bucket = self._episodes_by_being.get(being_id, {})
+            return {eid: bucket[eid] for eid in episode_ids if eid in bucket}
+
     def list_recent_by_being(
         self,
         being_id: BeingId,
@@ -163,21 +176,73 @@ class InMemorySubjectiveEpisodeStore(EpisodicEpisodeRepository):
             raise TypeError("being_id must be BeingId")
         if limit <= 0:
             return []
-        canonical = cue.to_canonical()
         with self._lock:
-            ids = self._cue_index_by_being.get(being_id, {}).get(canonical)
-            if not ids:
-                return []
-            bucket = self._episodes_by_being.get(being_id, {})
-            eps = [bucket[i] for i in ids if i in bucket]
-            if min_occurred_at is not None:
-                eps = [
-                    ep
-                    for ep in eps
-                    if _is_strictly_older(ep.occurred_at, min_occurred_at)
-                ]
-            ordered = sorted(eps, key=_occurrence_sort_key, reverse=True)
-            return ordered[:limit]
+            return self._list_by_canonical(
+                being_id, cue.to_canonical(), limit, min_occurred_at
+            )
+
+    def list_by_cues_by_being(
+        self,
+        being_id: BeingId,
+        cues: Sequence[EpisodicCue],
+        limit_per_cue: int,
+        min_occurred_at: datetime | None = None,
+    ) -> list[tuple[SubjectiveEpisode, frozenset[str]]]:
+        if not isinstance(being_id, BeingId):
+            raise TypeError("being_id must be BeingId")
+        if limit_per_cue <= 0:
+            return []
+        matched: dict[str, set[str]] = {}
+        episodes: dict[str, SubjectiveEpisode] = {}
+        with self._lock:
+            for canonical in dict.fromkeys(c.to_canonical() for c in cues):
+                for ep in self._list_by_canonical(
+                    being_id, canonical, limit_per_cue, min_occurred_at
+                ):
+                    episodes[ep.episode_id] = ep
+                    matched.setdefault(ep.episode_id, set()).add(canonical)
+        ordered = sorted(episodes.values(), key=_occurrence_sort_key, reverse=True)
+        return [(ep, frozenset(matched[ep.episode_id])) for ep in ordered]
+
+    def list_cue_headers_by_being(
+        self,
+        being_id: BeingId,
+        cues: Sequence[EpisodicCue],
+        limit_per_cue: int,
+        min_occurred_at: datetime | None = None,
+    ) -> list[SubjectiveEpisodeHeader]:
+        return [
+            SubjectiveEpisodeHeader(
+                episode_id=ep.episode_id,
+                occurred_at_key=_normalize_to_utc(ep.occurred_at).timestamp(),
+                matched_cue_canonicals=matched,
+            )
+            for ep, matched in self.list_by_cues_by_being(
+                being_id, cues, limit_per_cue, min_occurred_at
+            )
+        ]
+
+    def _list_by_canonical(
+        self,
+        being_id: BeingId,
+        canonical: str,
+        limit: int,
+        min_occurred_at: datetime | None,
+    ) -> list[SubjectiveEpisode]:
+        # _lock 保持中の private helper (list_by_cue / list_by_cues 共用)
+        ids = self._cue_index_by_being.get(being_id, {}).get(canonical)
+        if not ids:
+            return []
+        bucket = self._episodes_by_being.get(being_id, {})
+        eps = [bucket[i] for i in ids if i in bucket]
+        if min_occurred_at is not None:
+            eps = [
+                ep
+                for ep in eps
+                if _is_strictly_older(ep.occurred_at, min_occurred_at)
+            ]
+        ordered = sorted(eps, key=_occurrence_sort_key, reverse=True)
+        return ordered[:limit]
 
     def list_all_by_being(self, being_id: BeingId) -> list[SubjectiveEpisode]:
         if not isinstance(being_id, BeingId):
@@ -712,7 +712,7 @@ class DefaultPromptBuilder(IPromptBuilder):
             )
             long_summary_text = ""
 
-        context = self._context_format_strategy.format(
+        section_texts = dict(
             current_state_text=current_state_text,
             recent_events_text=recent_events_text,
             relevant_memories_text=relevant_memories_text,
@@ -725,6 +725,15 @@ class DefaultPromptBuilder(IPromptBuilder):
             prediction_feedback_text=prediction_feedback_text,
             pending_predictions_text=pending_predictions_text,
         )
+        # prefix_stable layout (PROMPT_SECTION_ORDER=prefix_stable) は player
+        # ごとの変動を観測しつつ、先頭の安定 section 群を切り出して返す。
+        layout_fn = getattr(self._context_format_strategy, "layout", None)
+        prompt_layout = None
+        if callable(layout_fn):
+            prompt_layout = layout_fn(player_id=int(player_id.value), **section_texts)
+            context = prompt_layout.volatile_text
+        else:
+            context = self._context_format_strategy.format(**section_texts)
 
         # Issue #227 chore β: failure_block (直前ターン失敗時の補正セクション)
         # を廃止した。理由:
@@ -750,14 +759,31 @@ class DefaultPromptBuilder(IPromptBuilder):
             instruction = loop_warning + "\n\n" + instruction
         user_content = user_context_body + "\n\n" + instruction
 
+        messages: List[Dict[str, Any]] = [{"role": "system", "content": system_content}]
+        if prompt_layout is not None and prompt_layout.stable_block_count:
+            # 安定 section 群は独立した user message にする。毎ターン byte 単位で
+            # 同じになり、provider の cache-control breakpoint を message 境界に
+            # 置ける (LLM_PROMPT_CACHE_BREAKPOINTS)。
+            messages.append({"role": "user", "content": prompt_layout.stable_text})
+        messages.append({"role": "user", "content": user_content})
+        if prompt_layout is not None:
+            context_sections = prompt_layout.section_chars()
+        else:
+            context_sections = (("context", len(user_context_body)),)
+
         result: Dict[str, Any] = {
-            "messages": [
-                {"role": "system", "content": system_content},
-                {"role": "user", "content": user_content},
-            ],
+            "messages": messages,
             "tools": tools,
             "tool_choice": "required",
         }
+        # provider へ渡る順 (system → user context → instruction) の section 別
+        # 文字数。LLM 呼び出し後に cached_tokens を section ごとに割り振る
+        # (PROMPT_CACHE_SECTIONS)。tools は呼び出し側が先頭に足す。
+        result["prompt_sections"] = (
+            ("system", len(system_content)),
+            *context_sections,
+            ("instruction", len(instruction)),
+        )
         result["overflow"] = overflow
         result["tool_runtime_context"] = ui_context.tool_runtime_context
         result["current_state_snapshot"] = current_state_text
@@ -790,7 +816,10 @@ class DefaultPromptBuilder(IPromptBuilder):
             inventory_text=inventory_text,
             instruction=instruction,
             tools=tools,
-            user_content=user_content,
+            # 安定 section を別 message に分けた場合も user 側の総量で記録する
+            user_content="\n\n".join(
+                m["content"] for m in messages if m["role"] == "user"
+            ),
         )
         return result
 
@@ -0,0 +1,381 @@
+"""prefix cache を最大化する prompt layout (``PROMPT_SECTION_ORDER=prefix_stable``)。
+
+``stable_to_volatile`` は section の並びを実測表 (Y_after_pr612) に基づいて
+手で決め打ちしていた。run やシナリオが変わると各 section の変動率も変わるので、
+本 module は **その run で実測した変動率** で並びを決め直す。
+
+仕組み:
+- ``PromptSectionVolatilityTracker`` が player ごとに前ターンの section 本文を
+  覚え、各ターンで「不変 / 末尾追記 / 書き換え」を数える。末尾追記 (直近の出来事
+  など) は自分自身の head は cache に残るが、後続 section の cache は壊す
+- 並び順は期待 cache 文字数 ``Σ len_i × (1 - rewrite_i) × Π_{j<i} (1 - change_j)``
+  を最大にする順序。隣接交換の議論から ``change / (len × (1 - rewrite))`` の
+  昇順が最適になる (長くて滅多に変わらない section ほど前)
+- 並びを毎ターン変えると、変えたこと自体で cache が全滅する。そこで
+  ``relayout_interval`` ターンごとにだけ見直し、期待値が ``relayout_margin``
+  以上良くなるときだけ採用する。実測が溜まるまでは ``stable_to_volatile`` と
+  同じ並び (= byte 単位で同一の出力) を使う
+- 【現在地と周囲】は最 volatile かつ Lost-in-the-middle 対策で末尾固定
+
+layout は先頭の「安定 section」(実測の変動率が ``stable_change_rate`` 以下) を
+``stable_text`` として切り出す。prompt builder はそれを独立した user message に
+するので、provider の cache-control breakpoint (``LLM_PROMPT_CACHE_BREAKPOINTS``)
+を message 境界に置ける。
+
+1 ターンの prompt の section 別文字数は ``prompt_sections`` として LLM 呼び出し
+metrics sink まで運ばれ、``attribute_cached_tokens`` で provider が返した
+``cached_tokens`` を section ごとの cache 率に割り振る (``PROMPT_CACHE_SECTIONS``)。
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from ai_rpg_world.application.llm.services.context_format_strategy import (
+    SECTION_ORDER_PREFIX_STABLE,
+    STABLE_TO_VOLATILE_SECTION_NAMES,
+    SectionBasedContextFormatStrategy,
+    build_section_blocks,
+)
+
+
+_logger = logging.getLogger(__name__)
+
+# section の区切り。``stable_to_volatile`` の空行区切りと同じ bytes にする。
+SECTION_SEPARATOR = "\n\n"
+
+# 末尾固定する section (最 volatile + 末尾 attention)。
+_PINNED_LAST_SECTION = "current_state"
+
+# 実測が溜まる前に「安定」と見なす section (scenario 固定の目的と L5 / L4)。
+_PRIOR_STABLE_SECTIONS: FrozenSet[str] = frozenset(
+    {"objective", "long_summary", "mid_summary"}
+)
+
+
+@dataclass(frozen=True)
+class PromptLayout:
+    """1 ターン分の user context。``blocks`` は表示順の ``(section 名, 本文)``。"""
+
+    blocks: Tuple[Tuple[str, str], ...]
+    stable_block_count: int = 0
+
+    @property
+    def text(self) -> str:
+        return SECTION_SEPARATOR.join(block for _, block in self.blocks)
+
+    @property
+    def stable_text(self) -> str:
+        """先頭の安定 section 群。毎ターン byte 単位で同じであることを狙う部分。"""
+        return SECTION_SEPARATOR.join(
+            block for _, block in self.blocks[: self.stable_block_count]
+        )
+
+    @property
+    def volatile_text(self) -> str:
+        return SECTION_SEPARATOR.join(
+            block for _, block in self.blocks[self.stable_block_count:]
+        )
+
+    def section_chars(self) -> Tuple[Tuple[str, int], ...]:
+        return tuple((name, len(block)) for name, block in self.blocks)
+
+
+class _SectionStats:
+    __slots__ = ("observations", "appended", "rewritten", "present", "chars")
+
+    def __init__(self) -> None:
+        self.observations = 0
+        self.appended = 0
+        self.rewritten = 0
+        self.present = 0
+        self.chars = 0
+
+    @property
+    def change_rate(self) -> float:
+        if not self.observations:
+            return 0.0
+        return (self.appended + self.rewritten) / self.observations
+
+    @property
+    def rewrite_rate(self) -> float:
+        if not self.observations:
+            return 0.0
+        return self.rewritten / self.observations
+
+    @property
+    def mean_chars(self) -> float:
+        if not self.present:
+            return 0.0
+        return self.chars / self.present
+
+
+class PromptSectionVolatilityTracker:
+    """section ごとの変動 (不変 / 末尾追記 / 書き換え) を全 player 分数える。
+
+    Phase A は player ごとに thread 並列で prompt を組むので lock で守る。
+    比較対象は同じ player の前ターンの本文だけ (player を跨いで比べない)。
+    """
+
+    def __init__(self, section_names: Sequence[str] = STABLE_TO_VOLATILE_SECTION_NAMES) -> None:
+        self._section_names = tuple(section_names)
+        self._lock = threading.Lock()
+        self._last: Dict[Tuple[int, str], str] = {}
+        self._seen_players: set[int] = set()
+        self._stats: Dict[str, _SectionStats] = {
+            name: _SectionStats() for name in self._section_names
+        }
+        self._turns = 0
+
+    @property
+    def turns(self) -> int:
+        """比較できたターン数 (各 player の 2 ターン目以降)。"""
+        return self._turns
+
+    def observe(self, player_id: int, blocks: Mapping[str, str]) -> None:
+        with self._lock:
+            first_turn = player_id not in self._seen_players
+            self._seen_players.add(player_id)
+            if not first_turn:
+                self._turns += 1
+            for name in self._section_names:
+                text = blocks.get(name, "")
+                stats = self._stats[name]
+                if text:
+                    stats.present += 1
+                    stats.chars += len(text)
+                key = (player_id, name)
+                previous = self._last.get(key, "")
+                self._last[key] = text
+                if first_turn:
+                    continue
+                stats.observations += 1
+                if text == previous:
+                    continue
+                if previous and text.startswith(previous):
+                    stats.appended += 1
+                else:
+                    stats.rewritten += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """section 名 → change_rate / rewrite_rate / mean_chars / observations。"""
+        with self._lock:
+            return {
+                name: {
+                    "change_rate": stats.change_rate,
+                    "rewrite_rate": stats.rewrite_rate,
+                    "mean_chars": stats.mean_chars,
+                    "observations": float(stats.observations),
+                }
+                for name, stats in self._stats.items()
+            }
+
+
+def _expected_cached_chars(
+    order: Sequence[str], stats: Mapping[str, Mapping[str, float]]
+) -> float:
+    survival = 1.0
+    expected = 0.0
+    for name in order:
+        s = stats[name]
+        expected += s["mean_chars"] * (1.0 - s["rewrite_rate"]) * survival
+        survival *= 1.0 - s["change_rate"]
+    return expected
+
+
+def _order_by_volatility(
+    stats: Mapping[str, Mapping[str, float]], prior: Sequence[str]
+) -> Tuple[str, ...]:
+    prior_index = {name: i for i, name in enumerate(prior)}
+
+    def _key(name: str) -> Tuple[bool, float, int]:
+        s = stats[name]
+        weight = s["mean_chars"] * (1.0 - s["rewrite_rate"])
+        ratio = s["change_rate"] / weight if weight > 0 else math.inf
+        return (name == _PINNED_LAST_SECTION, ratio, prior_index[name])
+
+    return tuple(sorted(prior, key=_key))
+
+
+class PrefixStableContextFormatStrategy(SectionBasedContextFormatStrategy):
+    """実測変動率で section を並べ、安定 prefix を切り出す context 戦略。
+
+    ``format`` (``IContextFormatStrategy``) は現在の並びで 1 本の文字列を返す。
+    player id が分かる呼び出し元 (``DefaultPromptBuilder``) は ``layout`` を
+    使い、変動の観測と安定 prefix の切り出しを同時に行う。
+    """
+
+    def __init__(
+        self,
+        *,
+        tracker: Optional[PromptSectionVolatilityTracker] = None,
+        min_samples: int = 16,
+        relayout_interval: int = 64,
+        relayout_margin: float = 0.05,
+        stable_change_rate: float = 0.1,
+    ) -> None:
+        super().__init__()
+        if min_samples < 1:
+            raise ValueError("min_samples must be 1 or greater")
+        if relayout_interval < 1:
+            raise ValueError("relayout_interval must be 1 or greater")
+        if relayout_margin < 0:
+            raise ValueError("relayout_margin must be 0 or greater")
+        if not 0.0 <= stable_change_rate <= 1.0:
+            raise ValueError("stable_change_rate must be between 0 and 1")
+        self._tracker = tracker or PromptSectionVolatilityTracker()
+        self._min_samples = int(min_samples)
+        self._relayout_interval = int(relayout_interval)
+        self._relayout_margin = float(relayout_margin)
+        self._stable_change_rate = float(stable_change_rate)
+        self._lock = threading.Lock()
+        self._order: Tuple[str, ...] = STABLE_TO_VOLATILE_SECTION_NAMES
+        self._stable_sections: FrozenSet[str] = _PRIOR_STABLE_SECTIONS
+        self._next_relayout_turn = self._min_samples
+
+    @property
+    def section_order(self) -> str:
+        return SECTION_ORDER_PREFIX_STABLE
+
+    @property
+    def tracker(self) -> PromptSectionVolatilityTracker:
+        return self._tracker
+
+    @property
+    def current_order(self) -> Tuple[str, ...]:
+        return self._order
+
+    def format(
+        self,
+        current_state_text: str,
+        recent_events_text: str,
+        relevant_memories_text: str = "",
+        active_memos_text: str = "",
+        objective_text: str = "",
+        inventory_text: str = "",
+        learned_text: str = "",
+        mid_summary_text: str = "",
+        long_summary_text: str = "",
+        prediction_feedback_text: str = "",
+        pending_predictions_text: str = "",
+    ) -> str:
+        return self._arrange(
+            build_section_blocks(
+                current_state_text=current_state_text,
+                recent_events_text=recent_events_text,
+                relevant_memories_text=relevant_memories_text,
+                active_memos_text=active_memos_text,
+                objective_text=objective_text,
+                inventory_text=inventory_text,
+                learned_text=learned_text,
+                mid_summary_text=mid_summary_text,
+                long_summary_text=long_summary_text,
+                prediction_feedback_text=prediction_feedback_text,
+                pending_predictions_text=pending_predictions_text,
+            )
+        ).text
+
+    def layout(self, *, player_id: int, **texts: str) -> PromptLayout:
+        """section を組み、変動を観測し、現在の並びで ``PromptLayout`` を返す。
+
+        観測で見直し時期に達していれば、次のターンから新しい並びを使う
+        (このターンの出力は観測前の並び)。
+        """
+        blocks = build_section_blocks(**texts)
+        layout = self._arrange(blocks)
+        self._tracker.observe(int(player_id), dict(blocks))
+        self._maybe_relayout()
+        return layout
+
+    def _arrange(self, blocks: Sequence[Tuple[str, str]]) -> PromptLayout:
+        with self._lock:
+            order = self._order
+            stable_sections = self._stable_sections
+        by_name = dict(blocks)
+        arranged = tuple(
+            (name, by_name[name]) for name in order if by_name.get(name)
+        )
+        stable_count = 0
+        for name, _ in arranged:
+            if name not in stable_sections:
+                break
+            stable_count += 1
+        return PromptLayout(blocks=arranged, stable_block_count=stable_count)
+
+    def _maybe_relayout(self) -> None:
+        turns = self._tracker.turns
+        with self._lock:
+            if turns < self._next_relayout_turn:
+                return
+            self._next_relayout_turn = turns + self._relayout_interval
+            current = self._order
+        stats = self._tracker.snapshot()
+        candidate = _order_by_volatility(stats, STABLE_TO_VOLATILE_SECTION_NAMES)
+        stable_sections = frozenset(
+            name
+            for name in candidate
+            if name != _PINNED_LAST_SECTION
+            and stats[name]["change_rate"] <= self._stable_change_rate
+        )
+        current_expected = _expected_cached_chars(current, stats)
+        candidate_expected = _expected_cached_chars(candidate, stats)
+        adopt = candidate != current and candidate_expected > current_expected * (
+            1.0 + self._relayout_margin
+        )
+        with self._lock:
+            self._stable_sections = stable_sections
+            if adopt:
+                self._order = candidate
+        if adopt:
+            _logger.info(
+                "prefix_stable relayout: %s (expected cached chars %.0f -> %.0f)",
+                ",".join(candidate),
+                current_expected,
+                candidate_expected,
+            )
+
+
+def attribute_cached_tokens(
+    sections: Sequence[Tuple[str, int]],
+    *,
+    prompt_tokens: int,
+    cached_tokens: int,
+) -> List[Dict[str, Any]]:
+    """provider の ``cached_tokens`` を prompt 先頭から section に割り振る。
+
+    provider は cache が効いた token 数しか返さないので、prompt 全体の
+    文字数に対する cache 率を文字数に換算し、並び順 (tools → system →
+    user sections → instruction) の先頭から埋める近似。section 内の
+    文字 / token 比の差は無視する。
+    """
+    total_chars = sum(max(0, int(chars)) for _, chars in sections)
+    if prompt_tokens <= 0 or total_chars <= 0:
+        cached_chars = 0.0
+    else:
+        ratio = min(1.0, max(0.0, cached_tokens / prompt_tokens))
+        cached_chars = total_chars * ratio
+    result: List[Dict[str, Any]] = []
+    offset = 0
+    for name, chars in sections:
+        chars = max(0, int(chars))
+        covered = min(chars, max(0.0, cached_chars - offset))
+        result.append({
+            "name": name,
+            "chars": chars,
+            "cached_ratio": round(covered / chars, 4) if chars else 0.0,
+        })
+        offset += chars
+    return result
+
+
+__all__ = [
+    "PrefixStableContextFormatStrategy",
+    "PromptLayout",
+    "PromptSectionVolatilityTracker",
+    "SECTION_SEPARATOR",
+    "attribute_cached_tokens",
+]
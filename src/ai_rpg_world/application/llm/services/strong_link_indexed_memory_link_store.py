@@ -0,0 +1,126 @@
+"""書き込みを ``EpisodicStrongLinkComponents`` に反映する MemoryLinkRepository の包み。
+
+読み取りは全て内側の store にそのまま委ねる。書き込みは内側に反映した後で
+
+- ``upsert_link_by_being``: ``note_link`` (閾値を越えたら union)
+- ``remove_weakest_link_for_episode_by_being``: 削除できたら端点を dirty に
+- ``replace_all_by_being``: Being 分を ``forget`` (次の昇格で組み直す)
+
+を呼ぶ。昇格に使う成分を、リンクを書くどの経路からも漏れなく追えるようにする
+ための層で、リンクの書き込み元 (link service / snapshot restore / テスト) は
+包まれていることを意識しない。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Sequence
+
+from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.memory.episodic.repository.memory_link_repository import (
+    MemoryLinkRepository,
+)
+from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (
+    MemoryLink,
+    MemoryLinkType,
+)
+from ai_rpg_world.application.llm.services.episodic_strong_link_components import (
+    EpisodicStrongLinkComponents,
+)
+
+
+class StrongLinkIndexedMemoryLinkStore(MemoryLinkRepository):
+    def __init__(
+        self,
+        inner: MemoryLinkRepository,
+        components: EpisodicStrongLinkComponents,
+    ) -> None:
+        if not isinstance(inner, MemoryLinkRepository):
+            raise TypeError("inner must be MemoryLinkRepository")
+        if not isinstance(components, EpisodicStrongLinkComponents):
+            raise TypeError("components must be EpisodicStrongLinkComponents")
+        self._inner = inner
+        self._components = components
+
+    @property
+    def inner(self) -> MemoryLinkRepository:
+        return self._inner
+
+    @property
+    def components(self) -> EpisodicStrongLinkComponents:
+        return self._components
+
+    def upsert_link_by_being(self, being_id: BeingId, link: MemoryLink) -> None:
+        self._inner.upsert_link_by_being(being_id, link)
+        self._components.note_link(being_id, link)
+
+    def get_link_by_being(
+        self,
+        being_id: BeingId,
+        episode_id_a: str,
+        episode_id_b: str,
+        link_type: MemoryLinkType,
+    ) -> MemoryLink | None:
+        return self._inner.get_link_by_being(being_id, episode_id_a, episode_id_b, link_type)
+
+    def list_links_for_episode_by_being(
+        self,
+        being_id: BeingId,
+        episode_id: str,
+        *,
+        now: datetime,
+        limit: int,
+    ) -> list[MemoryLink]:
+        return self._inner.list_links_for_episode_by_being(
+            being_id, episode_id, now=now, limit=limit
+        )
+
+    def list_all_incident_links_by_being(
+        self,
+        being_id: BeingId,
+        episode_id: str,
+        *,
+        now: datetime,
+    ) -> list[MemoryLink]:
+        return self._inner.list_all_incident_links_by_being(being_id, episode_id, now=now)
+
+    def list_all_incident_links_for_episodes_by_being(
+        self,
+        being_id: BeingId,
+        episode_ids: Sequence[str],
+    ) -> dict[str, list[MemoryLink]]:
+        return self._inner.list_all_incident_links_for_episodes_by_being(
+            being_id, episode_ids
+        )
+
+    def count_links_for_episode_by_being(
+        self, being_id: BeingId, episode_id: str
+    ) -> int:
+        return self._inner.count_links_for_episode_by_being(being_id, episode_id)
+
+    def remove_weakest_link_for_episode_by_being(
+        self,
+        being_id: BeingId,
+        episode_id: str,
+        *,
+        now: datetime,
+    ) -> bool:
+        removed = self._inner.remove_weakest_link_for_episode_by_being(
+            being_id, episode_id, now=now
+        )
+        if removed:
+            # 消えたリンクの反対側は分からないが、同じ成分に居るので片側で足りる
+            self._components.note_episode_touched(being_id, episode_id.strip())
+        return removed
+
+    def list_all_links_for_being(self, being_id: BeingId) -> list[MemoryLink]:
+        return self._inner.list_all_links_for_being(being_id)
+
+    def replace_all_by_being(
+        self, being_id: BeingId, links: list[MemoryLink]
+    ) -> None:
+        self._inner.replace_all_by_being(being_id, links)
+        self._components.forget(being_id)
+
+
+__all__ = ["StrongLinkIndexedMemoryLinkStore"]
@@ -19,15 +19,21 @@ from ai_rpg_world.application.llm.services.world_llm_turn.turn_trigger import (
 from ai_rpg_world.application.llm.services.world_llm_turn.types import (
     LlmPhaseAResult,
     ReasonFirstGateDecision,
+    ReasonFirstPhaseAPlan,
 )
 from ai_rpg_world.application.llm.services.world_llm_turn.wiring import WorldLlmWiring
+from ai_rpg_world.application.llm.services.world_llm_turn.world_access_gate import (
+    WorldAccessGate,
+)
 
 __all__ = [
     "ESCAPE_RUNTIME_LLM_EXCLUDED_TOOLS",
     "LlmMetricsTraceSink",
     "LlmPhaseAResult",
     "ReasonFirstGateDecision",
+    "ReasonFirstPhaseAPlan",
     "ToolHandlerConsistencyError",
+    "WorldAccessGate",
     "WorldLlmTurnTrigger",
     "WorldLlmWiring",
     "build_unsupported_tool_message",
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Sequence, Tuple
 
+from ai_rpg_world.application.llm.services.prompt_layout import attribute_cached_tokens
 from ai_rpg_world.application.trace import TraceEventKind
 from ai_rpg_world.domain.player.value_object.player_id import PlayerId
 
@@ -27,6 +28,7 @@ class LlmMetricsTraceSink:
         runtime: Any,
         player_id: PlayerId,
         tool_names: Optional[list[str]] = None,
+        prompt_sections: Optional[Sequence[Tuple[str, int]]] = None,
     ) -> None:
         self._trace_recorder = trace_recorder
         self._runtime = runtime
@@ -38,6 +40,11 @@ class LlmMetricsTraceSink:
         # 未指定 (= 既存 caller) は空 list として記録する (= 「明示的に
         # 渡さなかった」を「不在」と区別しないシンプル運用)。
         self._tool_names: list[str] = list(tool_names) if tool_names else []
+        # provider へ渡る順の section 別文字数 (tools を含む)。渡されたときだけ
+        # cached_tokens を section に割り振った PROMPT_CACHE_SECTIONS も記録する。
+        self._prompt_sections: Tuple[Tuple[str, int], ...] = (
+            tuple(prompt_sections) if prompt_sections else ()
+        )
 
     def record(self, metrics: Any) -> None:
         try:
@@ -85,6 +92,8 @@ class LlmMetricsTraceSink:
                 # PR-F: LLM 視点での「見えていた tool 一覧」。
                 tool_names=list(self._tool_names),
             )
+            if self._prompt_sections and metrics.prompt_tokens > 0:
+                self._record_cache_sections(metrics, tick)
             # #404 P2: progress.jsonl 用 LLM 呼び出しカウンタを bump。
             # runtime 側に counter が無いランタイム (presentation 単体テスト等)
             # は getattr で安全に skip する。
@@ -97,3 +106,22 @@ class LlmMetricsTraceSink:
                     pass
         except Exception:
             logger.exception("trace_recorder.record(llm_call) failed")
+
+    def _record_cache_sections(self, metrics: Any, tick: Optional[int]) -> None:
+        prompt_tokens = int(metrics.prompt_tokens)
+        cached_tokens = int(metrics.cached_tokens or 0)
+        self._trace_recorder.record(
+            TraceEventKind.PROMPT_CACHE_SECTIONS,
+            tick=tick,
+            player_id=self._player_id_value,
+            llm_call_id=getattr(metrics, "llm_call_id", None),
+            phase=getattr(metrics, "phase", "one_step"),
+            prompt_tokens=prompt_tokens,
+            cached_tokens=cached_tokens,
+            cached_ratio=round(cached_tokens / prompt_tokens, 4),
+            sections=attribute_cached_tokens(
+                self._prompt_sections,
+                prompt_tokens=prompt_tokens,
+                cached_tokens=cached_tokens,
+            ),
+        )
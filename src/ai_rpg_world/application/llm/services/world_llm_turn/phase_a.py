@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import copy
+import json
 import logging
 import uuid
-from typing import Any, Optional
+from contextlib import contextmanager, nullcontext
+from typing import Any, Iterator, Optional
 
 from ai_rpg_world.application.llm.contracts.dtos import LlmCommandResultDto
 from ai_rpg_world.application.llm.tool_constants import TOOL_NAME_ASSESS_SITUATION
@@ -21,6 +23,7 @@ from ai_rpg_world.application.llm.services.world_llm_turn.metrics_sink import (
 from ai_rpg_world.application.llm.services.world_llm_turn.types import (
     LlmPhaseAResult,
     ReasonFirstGateDecision,
+    ReasonFirstPhaseAPlan,
 )
 
 logger = logging.getLogger(__name__)
@@ -159,8 +162,20 @@ def consume_stagnation_reason_first_latch(wiring, player_id: PlayerId) -> None:
 def build_tools_payload(
     wiring, player_id: PlayerId, *, tool_schema_mode: str = "legacy"
 ) -> list[dict[str, Any]]:
-    """runtime tool 定義を LLM API の tools payload へ変換する。"""
+    """runtime tool 定義を LLM API の tools payload へ変換する。
 
+    runtime が ``get_tool_catalog`` を持てば、露出状態ごとに cache された
+    payload を使う。同じ状態のターンは同じ tool block を送るので、provider
+    の prefix cache に乗る。返す list は呼び出しごとに新しいが、中の dict は
+    共有物なので書き換えないこと。
+    """
+    get_catalog = getattr(type(wiring.runtime), "get_tool_catalog", None)
+    if callable(get_catalog):
+        return list(
+            wiring.runtime.get_tool_catalog(
+                tool_schema_mode=tool_schema_mode, player_id=player_id
+            ).payload
+        )
     definitions = (
         wiring.runtime.get_tool_definitions(player_id=player_id)
         if tool_schema_mode == "legacy"
@@ -182,6 +197,28 @@ def build_tools_payload(
         )
     ]
 
+
+@contextmanager
+def _world_read_scope(wiring) -> Iterator[None]:
+    """Phase A で世界を読む区間。
+
+    straggler 耐性 wave では他 agent の Phase B と並行し得るので、世界を
+    読む snapshot 構築だけを gate の共有区間で行う (LLM 呼び出しは外)。
+    この区間は世界を読むだけなので、prompt と tool 定義の構築で同じ player
+    snapshot を使い回す (runtime が対応していなければ従来どおり)。
+
+    区間は 1 ターンに 1 回だけ開く。wave の持ち越し task では、最初の区間を
+    抜けた時点 (``WorldAccessGate.track`` の event) で tick thread が再開する
+    ので、2 回目の区間は tick の stage と並んで世界を読んでしまう。
+    """
+    gate = getattr(wiring, "world_access_gate", None)
+    snapshot_scope = getattr(wiring.runtime, "player_snapshot_scope", None)
+    with gate.snapshot() if gate is not None else nullcontext(), (
+        snapshot_scope() if callable(snapshot_scope) else nullcontext()
+    ):
+        yield
+
+
 def run_phase_a(wiring, player_id: PlayerId) -> LlmPhaseAResult:
     """Phase A: snapshot 構築 + LLM 呼び出し。並列化可能。
 
@@ -196,45 +233,66 @@ def run_phase_a(wiring, player_id: PlayerId) -> LlmPhaseAResult:
         "llm_tool_choice",
         "required",
     )
-    # auto の補助文に載せる名前は、この呼び出しで実際に API へ渡す payload
-    # から取る。宣言一覧を別に持つと disabled_tools や状態フィルタとずれる。
-    tools_payload = build_tools_payload(wiring, player_id)
-    tool_names = [
-        t.get("function", {}).get("name")
-        for t in tools_payload
-        if t.get("function", {}).get("name")
-    ]
-    action_instruction = None
-    if tool_choice == "auto":
-        action_instruction = wiring.runtime.escape_game_action_instruction(tool_names)
-    if action_instruction is None:
-        prompt = wiring.runtime.build_full_prompt(player_id)
-    else:
-        prompt = wiring.runtime.build_full_prompt(
-            player_id,
-            action_instruction=action_instruction,
-        )
-    reason_first_gate = resolve_reason_first_gate(wiring, player_id)
+    with _world_read_scope(wiring):
+        # どちらの経路で何を組むかを先に決める (gate 自体も共有 state を読む)。
+        reason_first_gate = resolve_reason_first_gate(wiring, player_id)
+        # auto の補助文に載せる名前は、この呼び出しで実際に API へ渡す payload
+        # から取る。宣言一覧を別に持つと disabled_tools や状態フィルタとずれる。
+        tools_payload = build_tools_payload(wiring, player_id)
+        tool_names = [
+            t.get("function", {}).get("name")
+            for t in tools_payload
+            if t.get("function", {}).get("name")
+        ]
+        action_instruction = None
+        if tool_choice == "auto":
+            action_instruction = wiring.runtime.escape_game_action_instruction(
+                tool_names
+            )
+        if action_instruction is None:
+            prompt = wiring.runtime.build_full_prompt(player_id)
+        else:
+            prompt = wiring.runtime.build_full_prompt(
+                player_id,
+                action_instruction=action_instruction,
+            )
+        if reason_first_gate.enabled:
+            reason_first_plan = prepare_reason_first_phase_a(
+                wiring, player_id, prompt, gate_reason=reason_first_gate.reason
+            )
+        else:
+            # PR-A: 脱出ランタイムで恒久的に UNSUPPORTED_TOOL になる tool は LLM に
+            # 見せない。Y_after_issue621 trace で set_sub_location が 3 回叩かれて
+            # 全部失敗していた問題を入口で塞ぐ。
+            # 実験 #356 対応: LLM 1 呼び出しごとに metrics (wall_latency / tokens /
+            # TPS) を trace に流す。Phase A の中で player_id / tick の context を
+            # sink に閉じ込めて、後で集計スクリプトが per-agent / per-model 分布を
+            # 出せるようにする。
+            # PR-F: LLM がその tick で実際に prompt 経由で見た tool 名集合も渡す。
+            # tools_payload から function name を抽出する (= OpenAI function
+            # calling 形式の "type":"function" 構造から function.name を読む)。
+            metrics_sink = build_llm_metrics_sink(
+                wiring,
+                player_id,
+                tool_names=tool_names,
+                prompt_sections=prompt_cache_sections(prompt, tools_payload),
+            )
+            # 案A (band-gated thinking): 停滞 strong の局面で reflect 注入直後の
+            # 1 行動だけ reasoning を焚く。flag OFF / 対象外なら None (= 既定の
+            # まま reasoning OFF・プロンプト byte 不変)。判断と
+            # AGENT_REASONING_ENGAGED trace は runtime 側に閉じ込め、ここは
+            # effort を invoke に橋渡しし、失敗時の降格を扱う。
+            reasoning_effort = wiring.runtime.resolve_turn_reasoning_effort(
+                player_id
+            )
     if reason_first_gate.enabled:
         return run_reason_first_phase_a(
-            wiring, player_id, prompt, gate_reason=reason_first_gate.reason
+            wiring,
+            player_id,
+            prompt,
+            gate_reason=reason_first_gate.reason,
+            plan=reason_first_plan,
         )
-    # PR-A: 脱出ランタイムで恒久的に UNSUPPORTED_TOOL になる tool は LLM に
-    # 見せない。Y_after_issue621 trace で set_sub_location が 3 回叩かれて
-    # 全部失敗していた問題を入口で塞ぐ。
-    # 実験 #356 対応: LLM 1 呼び出しごとに metrics (wall_latency / tokens / TPS)
-    # を trace に流す。Phase A の中で player_id / tick の context を sink に閉
-    # じ込めて、後で集計スクリプトが per-agent / per-model 分布を出せるよう
-    # にする。
-    # PR-F: LLM がその tick で実際に prompt 経由で見た tool 名集合も渡す。
-    # tools_payload から function name を抽出する (= OpenAI function calling
-    # 形式の "type":"function" 構造から function.name を読む)。
-    metrics_sink = build_llm_metrics_sink(wiring, player_id, tool_names=tool_names)
-    # 案A (band-gated thinking): 停滞 strong の局面で reflect 注入直後の 1 行動
-    # だけ reasoning を焚く。flag OFF / 対象外なら None (= 既定のまま reasoning
-    # OFF・プロンプト byte 不変)。判断と AGENT_REASONING_ENGAGED trace は runtime
-    # 側に閉じ込め、ここは effort を invoke に橋渡しし、失敗時の降格を扱う。
-    reasoning_effort = wiring.runtime.resolve_turn_reasoning_effort(player_id)
     last_llm_call_id: Optional[str] = None
 
     def _invoke(
@@ -359,17 +417,17 @@ def run_phase_a(wiring, player_id: PlayerId) -> LlmPhaseAResult:
         wiring.runtime.commit_turn_reasoning_engaged(player_id, reasoning_effort)
     return _result(tool_call, None)
 
-def run_reason_first_phase_a(
+
+def prepare_reason_first_phase_a(
     wiring, player_id: PlayerId, prompt: dict, *, gate_reason: str,
-) -> LlmPhaseAResult:
-    """reason-first 2段階ターンの Phase A。
+) -> ReasonFirstPhaseAPlan:
+    """reason-first ターンの tool payload・metrics sink を組み、開始 trace を残す。
 
-    step1 は ``assess_situation`` を named tool_choice で強制する。成立した
-    評価だけを step2 末尾 prompt に追記し、step2 は評価 tool を除いた
-    action tool list で通常 action を required にする。契約違反時は行動
-    実行へ進めない。
+    どれも世界を読むので、``run_phase_a`` が prompt を組んだのと同じ
+    ``_world_read_scope`` の中で呼ぶ (区間を開き直さない)。
     """
 
+    reason_first_turn_id = f"reason-first-{uuid.uuid4().hex}"
     assess_tools_payload = build_tools_payload(
         wiring, player_id, tool_schema_mode="reason_first"
     )
@@ -388,18 +446,21 @@ def run_reason_first_phase_a(
         for t in action_tools_payload
         if t.get("function", {}).get("name")
     ]
-    assess_metrics_sink = build_llm_metrics_sink(
-        wiring, player_id, tool_names=assess_tool_names
-    )
-    action_metrics_sink = build_llm_metrics_sink(
-        wiring, player_id, tool_names=action_tool_names
+    plan = ReasonFirstPhaseAPlan(
+        reason_first_turn_id=reason_first_turn_id,
+        assess_tools_payload=assess_tools_payload,
+        action_tools_payload=action_tools_payload,
+        action_tool_names=action_tool_names,
+        assess_metrics_sink=build_llm_metrics_sink(
+            wiring,
+            player_id,
+            tool_names=assess_tool_names,
+            prompt_sections=prompt_cache_sections(prompt, assess_tools_payload),
+        ),
+        action_metrics_sink=build_llm_metrics_sink(
+            wiring, player_id, tool_names=action_tool_names
+        ),
     )
-    reason_first_turn_id = f"reason-first-{uuid.uuid4().hex}"
-    last_llm_call_id: Optional[str] = None
-    assess_choice = {
-        "type": "function",
-        "function": {"name": TOOL_NAME_ASSESS_SITUATION},
-    }
     record_reason_first_trace(
         wiring,
         TraceEventKind.REASON_FIRST_STARTED,
@@ -410,6 +471,37 @@ def run_reason_first_phase_a(
         action_phase_tool_count=len(action_tool_names),
         retry_limit=1,
     )
+    return plan
+
+
+def run_reason_first_phase_a(
+    wiring,
+    player_id: PlayerId,
+    prompt: dict,
+    *,
+    gate_reason: str,
+    plan: ReasonFirstPhaseAPlan,
+) -> LlmPhaseAResult:
+    """reason-first 2段階ターンの Phase A。
+
+    step1 は ``assess_situation`` を named tool_choice で強制する。成立した
+    評価だけを step2 末尾 prompt に追記し、step2 は評価 tool を除いた
+    action tool list で通常 action を required にする。契約違反時は行動
+    実行へ進めない。世界を読む部分は ``plan`` として組み済みで、ここでは
+    世界を読まない。
+    """
+
+    reason_first_turn_id = plan.reason_first_turn_id
+    assess_tools_payload = plan.assess_tools_payload
+    action_tools_payload = plan.action_tools_payload
+    action_tool_names = plan.action_tool_names
+    assess_metrics_sink = plan.assess_metrics_sink
+    action_metrics_sink = plan.action_metrics_sink
+    last_llm_call_id: Optional[str] = None
+    assess_choice = {
+        "type": "function",
+        "function": {"name": TOOL_NAME_ASSESS_SITUATION},
+    }
     if gate_reason == "stagnation_strong":
         consume_stagnation_reason_first_latch(wiring, player_id)
 
@@ -687,8 +779,28 @@ def reason_first_failed_result(error_code: str) -> LlmCommandResultDto:
         was_no_op=True,
     )
 
+
+def prompt_cache_sections(
+    prompt: dict, tools_payload: list[dict[str, Any]]
+) -> Optional[tuple[tuple[str, int], ...]]:
+    """``PROMPT_CACHE_SECTIONS`` 用に、送信順の section 別文字数を組む。
+
+    provider は tools を messages より前に並べる (Anthropic の cache 順序、
+    OpenAI 系の chat template) ので tools を先頭に置く。runtime が
+    ``prompt_sections`` を返さない (= テスト用 fake 等) なら None。
+    """
+    sections = prompt.get("prompt_sections") if isinstance(prompt, dict) else None
+    if not sections:
+        return None
+    tools_chars = len(json.dumps(tools_payload, ensure_ascii=False))
+    return (("tools", tools_chars), *sections)
+
+
 def build_llm_metrics_sink(
-    wiring, player_id: PlayerId, tool_names: Optional[list[str]] = None,
+    wiring,
+    player_id: PlayerId,
+    tool_names: Optional[list[str]] = None,
+    prompt_sections: Optional[tuple[tuple[str, int], ...]] = None,
 ) -> Optional[Any]:
     """Phase A の LLM 呼び出し metrics を trace に流す sink を構築する。
 
@@ -709,4 +821,5 @@ def build_llm_metrics_sink(
         runtime=wiring.runtime,
         player_id=player_id,
         tool_names=tool_names,
+        prompt_sections=prompt_sections,
     )
@@ -3,21 +3,41 @@
 from __future__ import annotations
 
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ai_rpg_world.application.llm.contracts.dtos import LlmCommandResultDto
+from ai_rpg_world.application.trace import TraceEventKind
 from ai_rpg_world.domain.common.value_object import WorldTick
 from ai_rpg_world.domain.player.value_object.player_id import PlayerId
 
 from ai_rpg_world.application.llm.services.world_llm_turn.types import LlmPhaseAResult
+from ai_rpg_world.application.llm.services.world_llm_turn.world_access_gate import (
+    WorldAccessGate,
+)
 
 if TYPE_CHECKING:
     from ai_rpg_world.application.llm.services.world_llm_turn.wiring import WorldLlmWiring
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class _InflightPhaseA:
+    """wave 経路で投入済みだが Phase B 未適用の Phase A 1 件分。"""
+
+    future: "Future[LlmPhaseAResult]"
+    submitted_at: float
+    # snapshot 構築を抜けたら set される (WorldAccessGate.track)。
+    snapshot_done: threading.Event
+    # 何 wave 持ち越されたか。0 = 投入した wave で commit 待ち。
+    carried_waves: int = 0
+
+
 @dataclass
 class WorldLlmTurnTrigger:
     """Queues LLM turns and runs them against the session runtime.
@@ -74,6 +94,24 @@ class WorldLlmTurnTrigger:
     変えない。Y 実走で観測された「**player 1 が 75 wave 連続活動**」は
     auto-stay の副産物ではなく **外部観測連鎖**による正当な活動だったので、
     新コードでも同じパターンが再現する。
+
+    ## straggler 耐性 wave (``llm_turn_wave_deadline_seconds``)
+
+    既定の並列経路は全員の Phase A を待ってから Phase B を流すので、provider
+    の 30〜90 s の外れ値 1 件が tick 全体を止める。deadline を設定すると
+    ``_run_wave`` に切り替わり:
+
+    - Phase A は wave を跨いで生き残る executor に投入する
+    - Phase B は **投入順** に、先頭から完了したものを即 commit する
+      (= 完了順ではなく投入順なので、同じ持ち越し集合なら commit 順は決定的)
+    - deadline までに戻らなかった agent は in-flight のまま次 wave に
+      持ち越し、次 wave の先頭で commit を待つ
+    - 持ち越し中の agent が再度 schedule_turn されても二重投入せず、
+      pending に戻して commit 後の wave で走らせる
+
+    Phase B (世界 mutation) と他 agent の Phase A (prompt 構築) が同時に走り
+    得るため、両者は ``wiring.world_access_gate`` で読み書きを分ける。LLM
+    呼び出し自体は gate の外なので並列度は落ちない。
     """
 
     wiring: "WorldLlmWiring"
@@ -83,6 +121,11 @@ class WorldLlmTurnTrigger:
     pending_player_ids: set[int] = field(default_factory=set)
     # 旧名 _turn_counts。pid → 自己 reschedule の連続回数。
     _self_reschedule_streak: dict[int, int] = field(default_factory=dict)
+    # wave 経路の状態。dict の挿入順 = 投入順 = commit 順。
+    _inflight: dict[int, _InflightPhaseA] = field(default_factory=dict)
+    _wave_executor: Optional[ThreadPoolExecutor] = None
+    _wave_index: int = 0
+    _fallback_gate: WorldAccessGate = field(default_factory=WorldAccessGate)
 
     def schedule_turn(self, player_id: PlayerId) -> None:
         """外部要因 (他者観測 / arrival / idle timer 等) による起床。
@@ -109,6 +152,9 @@ class WorldLlmTurnTrigger:
                 if check_game_end().is_ended:
                     self.pending_player_ids.clear()
                     self._self_reschedule_streak.clear()
+                    # 持ち越し中の Phase A は結果を捨てる (worker 自体は
+                    # HTTP 完了まで走るが、世界には適用しない)
+                    self._inflight.clear()
                     return
             except Exception:
                 # check_game_end 自体が落ちても turn 実行を続ける fail-safe
@@ -120,7 +166,7 @@ class WorldLlmTurnTrigger:
         # 死亡したプレイヤーが speech 観測などで起こされるケースがあるため、
         # to_run の filter は確実に必要。
         to_run = [pid for pid in to_run if self._can_player_act(pid)]
-        if not to_run:
+        if not to_run and not self._inflight:
             return
 
         cfg = getattr(runtime, "_runtime_config", None)
@@ -132,6 +178,14 @@ class WorldLlmTurnTrigger:
             runtime._game_phase_store.is_meeting()
         ):
             workers = 1
+        wave_deadline = getattr(cfg, "llm_turn_wave_deadline_seconds", None)
+        if wave_deadline is not None and (workers > 1 or self._inflight):
+            # 会議の逐次化などで workers<=1 に落ちても、持ち越し中の Phase A
+            # だけは wave 経路で回収する (放置すると結果が永久に適用されない)。
+            self._run_wave(to_run, max(workers, 1), float(wave_deadline))
+            return
+        if not to_run:
+            return
         if workers <= 1 or len(to_run) <= 1:
             # 旧シリアル経路: 並列化を OFF にした / プレイヤーが 1 人だけ。
             # 完全に従来挙動。
@@ -182,6 +236,169 @@ class WorldLlmTurnTrigger:
             result = self.wiring.run_phase_b(phase_a)
             self._account_result(pid_value, result)
 
+    def _run_wave(
+        self, to_run: list[int], workers: int, deadline_seconds: float
+    ) -> None:
+        """straggler 耐性 wave: Phase A の完了を投入順に拾って Phase B を流す。
+
+        持ち越し (= 前 wave の in-flight) を先頭に、今 wave の新規投入を
+        ``to_run`` 順に後ろへ並べ、その順に ``deadline_seconds`` を共有の
+        締め切りとして待つ。締め切りを過ぎた時点で未完了のものは in-flight
+        のまま残し、次 wave に持ち越す。
+
+        新規投入は空き worker 数までに抑える。executor の queue で待つ task
+        を作ると、その task の snapshot 構築が次 tick の世界更新と重なるため。
+        溢れた agent は pending に戻して次 wave で投入する。
+        """
+        self._wave_index += 1
+        executor = self._ensure_wave_executor(workers)
+        gate = self._world_access_gate()
+        wave_started = time.monotonic()
+        submitted: list[int] = []
+        deferred: list[int] = []
+        for pid_value in to_run:
+            if pid_value in self._inflight or len(self._inflight) >= workers:
+                # 前 wave の Phase A がまだ走っている (二重に LLM を呼ぶと同じ
+                # 観測に 2 回反応する) か、worker が持ち越しで埋まっている。
+                deferred.append(pid_value)
+                continue
+            task, snapshot_done = gate.track(
+                lambda pid_value=pid_value: self.wiring.run_phase_a(
+                    PlayerId(pid_value)
+                ),
+            )
+            self._inflight[pid_value] = _InflightPhaseA(
+                future=executor.submit(task),
+                submitted_at=time.monotonic(),
+                snapshot_done=snapshot_done,
+            )
+            submitted.append(pid_value)
+
+        deadline_at = wave_started + deadline_seconds
+        committed: list[int] = []
+        carried: list[int] = []
+        dropped: list[int] = []
+        straggler_latency_ms: dict[str, int] = {}
+        for pid_value in list(self._inflight):
+            entry = self._inflight[pid_value]
+            remaining = max(0.0, deadline_at - time.monotonic())
+            try:
+                phase_a = entry.future.result(timeout=remaining)
+            except FutureTimeoutError:
+                entry.carried_waves += 1
+                carried.append(pid_value)
+                straggler_latency_ms[str(pid_value)] = _elapsed_ms(
+                    entry.submitted_at
+                )
+                continue
+            except Exception as exc:
+                logger.exception("Phase A failed for player_id=%s", pid_value)
+                phase_a = LlmPhaseAResult(
+                    player_id=PlayerId(pid_value),
+                    prompt={},
+                    tools_payload=[],
+                    tool_call=None,
+                    exception=exc,
+                )
+            del self._inflight[pid_value]
+            if entry.carried_waves > 0:
+                straggler_latency_ms[str(pid_value)] = _elapsed_ms(
+                    entry.submitted_at
+                )
+                # 持ち越し中に死亡 / outcome 確定 / 移動開始した agent の
+                # 古い決定は適用しない (入口 filter と同じ判定)。
+                if not self._can_player_act(pid_value):
+                    dropped.append(pid_value)
+                    continue
+            with gate.exclusive():
+                result = self.wiring.run_phase_b(phase_a)
+                self._account_result(pid_value, result)
+            committed.append(pid_value)
+        # 持ち越す task がまだ snapshot 構築中なら抜けるまで待つ。待たずに
+        # 返ると次 tick の stage 更新と prompt 構築が重なる。
+        for entry in self._inflight.values():
+            entry.snapshot_done.wait()
+        self.pending_player_ids.update(deferred)
+        self._record_wave_trace(
+            deadline_seconds=deadline_seconds,
+            wave_wall_ms=_elapsed_ms(wave_started),
+            submitted=submitted,
+            committed=committed,
+            carried=carried,
+            deferred=deferred,
+            dropped=dropped,
+            straggler_latency_ms=straggler_latency_ms,
+        )
+
+    def _ensure_wave_executor(self, workers: int) -> ThreadPoolExecutor:
+        """wave 経路の executor を遅延構築する。
+
+        持ち越しのため wave を跨いで生き残る必要があり、``with`` で都度
+        作り捨てる既定経路の executor は使えない。worker 数は初回の値で
+        固定する (run 中に設定が変わる経路は無い)。
+        """
+        if self._wave_executor is None:
+            self._wave_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="llm-turn-wave"
+            )
+        return self._wave_executor
+
+    def _world_access_gate(self) -> WorldAccessGate:
+        """wiring の gate。テスト用の最小 wiring は持たないので自前の gate を使う。"""
+        gate = getattr(self.wiring, "world_access_gate", None)
+        return gate if gate is not None else self._fallback_gate
+
+    def shutdown(self) -> None:
+        """持ち越し中の Phase A を捨てて wave executor を止める (複数回呼んで安全)。
+
+        走行中の HTTP 呼び出しは中断できないので待たない。結果は世界に
+        適用されず破棄される。
+        """
+        self._inflight.clear()
+        executor = self._wave_executor
+        self._wave_executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _record_wave_trace(
+        self,
+        *,
+        deadline_seconds: float,
+        wave_wall_ms: int,
+        submitted: list[int],
+        committed: list[int],
+        carried: list[int],
+        deferred: list[int],
+        dropped: list[int],
+        straggler_latency_ms: dict[str, int],
+    ) -> None:
+        """1 wave 分の LLM_TURN_WAVE を trace に残す fail-safe ヘルパ。"""
+        runtime = self.wiring.runtime
+        recorder = getattr(runtime, "trace_recorder", None)
+        if recorder is None:
+            return
+        try:
+            current_tick = getattr(runtime, "current_tick", None)
+            tick = int(current_tick()) if callable(current_tick) else None
+            recorder.record(
+                TraceEventKind.LLM_TURN_WAVE,
+                tick=tick,
+                wave_index=self._wave_index,
+                deadline_seconds=deadline_seconds,
+                wave_wall_ms=wave_wall_ms,
+                submitted_player_ids=submitted,
+                committed_player_ids=committed,
+                carried_player_ids=carried,
+                deferred_player_ids=deferred,
+                dropped_player_ids=dropped,
+                straggler_latency_ms=straggler_latency_ms,
+                max_straggler_latency_ms=max(
+                    straggler_latency_ms.values(), default=0
+                ),
+            )
+        except Exception:
+            logger.warning("LLM_TURN_WAVE trace record failed", exc_info=True)
+
     def _account_result(
         self, player_id_value: int, result: LlmCommandResultDto
     ) -> None:
@@ -385,3 +602,7 @@ class WorldLlmTurnTrigger:
                 exc_info=True,
             )
             return True
+
+
+def _elapsed_ms(started_at: float) -> int:
+    return int((time.monotonic() - started_at) * 1000)
@@ -72,3 +72,19 @@ class ReasonFirstGateDecision:
 
     enabled: bool
     reason: str
+
+
+@dataclass(frozen=True)
+class ReasonFirstPhaseAPlan:
+    """reason-first 2段階ターンのうち、世界を読んで組む部分。
+
+    tool payload・metrics sink・開始 trace は世界を読むので、prompt と同じ
+    snapshot 区間 (``run_phase_a``) で組み、LLM 呼び出し側へ渡す。
+    """
+
+    reason_first_turn_id: str
+    assess_tools_payload: list
+    action_tools_payload: list
+    action_tool_names: list
+    assess_metrics_sink: Any
+    action_metrics_sink: Any
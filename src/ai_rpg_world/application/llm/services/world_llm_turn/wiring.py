@@ -74,6 +74,9 @@ from ai_rpg_world.application.llm.services.world_llm_turn.turn_trigger import (
     WorldLlmTurnTrigger,
 )
 from ai_rpg_world.application.llm.services.world_llm_turn.types import LlmPhaseAResult
+from ai_rpg_world.application.llm.services.world_llm_turn.world_access_gate import (
+    WorldAccessGate,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +117,10 @@ class WorldLlmWiring:
 
     def __post_init__(self) -> None:
         self.observation_appender = ObservationAppender(self.observation_buffer)
+        # straggler 耐性 wave では Phase B (世界 mutation) と他 agent の
+        # Phase A prompt 構築が同時に走り得るので、gate で読み書きを分ける。
+        # 既定経路では両者が重ならないので素通りになる。
+        self.world_access_gate = WorldAccessGate()
         self.llm_turn_trigger = WorldLlmTurnTrigger(
             wiring=self,
             max_self_reschedule_streak=self.max_self_reschedule_streak,
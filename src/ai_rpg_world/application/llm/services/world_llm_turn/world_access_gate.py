@@ -0,0 +1,94 @@
+"""Phase A の snapshot 構築と Phase B の世界 mutation を分離する gate。
+
+既定の並列経路は「全員の Phase A → 全員の Phase B」なので両者が重ならない。
+straggler 耐性 wave (``llm_turn_wave_deadline_seconds``) では Phase B が
+他 agent の Phase A と同時に走るため、次の読み書き分離を入れる:
+
+- snapshot (= prompt / tool 定義の構築) は共有。複数 worker が同時に入れる
+- exclusive (= Phase B の適用) は排他。進行中の snapshot が抜けるのを待ち、
+  その間に来た snapshot は exclusive が抜けるまで待つ
+
+LLM 呼び出しはどちらの区間にも含めないので、HTTP 待ちは並列のまま。
+
+``track`` で包んだ task は「snapshot を抜けた (または snapshot 前に終わった)」
+瞬間を ``threading.Event`` で公開する。wave 終端で持ち越す task がまだ
+snapshot 中だと、次 tick の世界更新と prompt 構築が重なるので、trigger は
+この event を待ってから tick thread に制御を返す。
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class WorldAccessGate:
+    """snapshot (共有) と exclusive (排他) の 2 区間を持つ読み書き gate。"""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._exclusive = False
+        # track() 経由の task が snapshot を抜けたことを知らせる event。
+        self._local = threading.local()
+
+    @contextmanager
+    def snapshot(self) -> Iterator[None]:
+        """世界を読むだけの区間。exclusive 中は入口で待つ。"""
+        with self._cond:
+            while self._exclusive:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                self._cond.notify_all()
+            done = getattr(self._local, "snapshot_done", None)
+            if done is not None:
+                done.set()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """世界を書き換える区間。進行中の snapshot / exclusive が抜けるまで待つ。
+
+        呼び出し thread に所有権を持たせないので、tick thread が入れ替わる
+        経路 (executor 経由の tick loop) でも使える。再入は不可。
+        """
+        with self._cond:
+            while self._exclusive or self._readers > 0:
+                self._cond.wait()
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+    def track(
+        self, fn: Callable[[], T]
+    ) -> tuple[Callable[[], T], threading.Event]:
+        """``fn`` を包み、snapshot を抜けた瞬間に set される event を返す。
+
+        ``fn`` が snapshot に入らず終わった (例外含む) 場合も終了時に set
+        するので、event を待つ側が永久に止まることはない。
+        """
+        done = threading.Event()
+
+        def _run() -> T:
+            self._local.snapshot_done = done
+            try:
+                return fn()
+            finally:
+                self._local.snapshot_done = None
+                done.set()
+
+        return _run, done
+
+
+__all__ = ["WorldAccessGate"]
@@ -20,12 +20,16 @@ def resolve_default_episodic_episode_store(
     override: EpisodicEpisodeRepository | None,
     *,
     db_path: Optional[str] = None,
+    group_commit_max_delay_ms: Optional[int] = None,
 ) -> EpisodicEpisodeRepository:
     """呼び出し元が store を渡したらそれを使い、未指定なら db_path で SQLite か in-memory を選ぶ。
 
     - ``override`` が渡されたらそのまま返す (db_path は見ない)
     - ``override`` が None で ``db_path`` があれば SQLite 永続化 store
     - どちらも無ければ in-memory store
+
+    ``group_commit_max_delay_ms`` は SQLite store のときだけ効き、書き込みを
+    group commit にまとめる (``SqliteSubjectiveEpisodeStore.connect`` 参照)。
     """
     if override is not None:
         return override
@@ -35,5 +39,7 @@ def resolve_default_episodic_episode_store(
             SqliteSubjectiveEpisodeStore,
         )
 
-        return SqliteSubjectiveEpisodeStore.connect(path)
+        return SqliteSubjectiveEpisodeStore.connect(
+            path, group_commit_max_delay_ms=group_commit_max_delay_ms
+        )
     return InMemorySubjectiveEpisodeStore()
@@ -33,7 +33,35 @@ def create_llm_client_from_config(config: "ResolvedLlmRuntimeConfig") -> ILLMCli
             DEFAULT_LLM_MODEL,
             LiteLLMClient,
         )
+        from ai_rpg_world.infrastructure.llm.llm_request_scheduler import (
+            LlmRequestSchedulerSettings,
+            shared_llm_request_scheduler,
+        )
+        from ai_rpg_world.infrastructure.llm.llm_response_cache import (
+            shared_llm_response_cache,
+        )
 
+        # 機能ごとに別 client を作るので、scheduler は設定単位の共有 instance を
+        # 渡して全経路を同じ枠に乗せる。
+        request_scheduler = None
+        if config.llm_scheduler_enabled:
+            request_scheduler = shared_llm_request_scheduler(
+                LlmRequestSchedulerSettings(
+                    max_concurrency=config.llm_scheduler_max_concurrency,
+                    reserved_agent_turn_slots=config.llm_scheduler_reserved_turn_slots,
+                    requests_per_second=config.llm_scheduler_requests_per_second,
+                    burst=config.llm_scheduler_burst,
+                    queue_limit=config.llm_scheduler_queue_limit,
+                )
+            )
+        response_cache = None
+        if config.llm_replay_mode != "off":
+            response_cache = shared_llm_response_cache(
+                config.llm_replay_cache_path,
+                mode=config.llm_replay_mode,
+                miss_policy=config.llm_replay_miss_policy,
+                latency_scale=config.llm_replay_latency_scale,
+            )
         configured = (config.llm_model or "").strip()
         return LiteLLMClient(
             model=(configured or DEFAULT_LLM_MODEL),
@@ -47,5 +75,8 @@ def create_llm_client_from_config(config: "ResolvedLlmRuntimeConfig") -> ILLMCli
             wall_cap_seconds=config.llm_wall_time_cap_seconds,
             rate_limit_retry_attempts=int(config.llm_rate_limit_retry_attempts),
             rate_limit_retry_base_sleep=float(config.llm_rate_limit_retry_base_sleep),
+            request_scheduler=request_scheduler,
+            response_cache=response_cache,
+            prompt_cache_breakpoints=config.llm_prompt_cache_breakpoints,
         )
     return StubLlmClient()
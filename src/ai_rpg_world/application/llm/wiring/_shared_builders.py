@@ -18,12 +18,25 @@ from typing import TYPE_CHECKING, Any, Callable, Optional
 from ai_rpg_world.domain.memory.episodic.repository.episodic_episode_repository import (
     EpisodicEpisodeRepository,
 )
+from ai_rpg_world.application.llm.services.adjacency_cached_memory_link_store import (
+    AdjacencyCachedMemoryLinkStore,
+)
 from ai_rpg_world.application.llm.services.episodic_promotion_frontier import (
     EpisodicPromotionFrontier,
 )
 from ai_rpg_world.application.llm.services.episodic_semantic_cluster_promotion import (
+    MIN_EFFECTIVE_STRENGTH,
     EpisodicSemanticClusterPromotionService,
 )
+from ai_rpg_world.application.llm.services.episodic_strong_link_components import (
+    EpisodicStrongLinkComponents,
+)
+from ai_rpg_world.application.llm.services.in_memory_episodic_memory_link_store import (
+    InMemoryMemoryLinkStore,
+)
+from ai_rpg_world.application.llm.services.strong_link_indexed_memory_link_store import (
+    StrongLinkIndexedMemoryLinkStore,
+)
 from ai_rpg_world.application.llm.wiring._default_episodic_episode_store import (
     resolve_default_episodic_episode_store,
 )
@@ -74,6 +87,7 @@ def build_episodic_memory_stack(
     episodic_promotion_force_full_scan: bool = False,
     episodic_promotion_expansion_hops: int = 4,
     subjective_episode_db_path: Optional[str] = None,
+    subjective_episode_group_commit_ms: Optional[int] = None,
 ) -> EpisodicMemoryStack:
     """共有 episode store と link / semantic / promotion を組み立てる。
 
@@ -95,11 +109,20 @@ def build_episodic_memory_stack(
       (「配線と有効化の分離」既存パターン)。
     """
     shared_episode_store = resolve_default_episodic_episode_store(
-        episodic_episode_store, db_path=subjective_episode_db_path
+        episodic_episode_store,
+        db_path=subjective_episode_db_path,
+        group_commit_max_delay_ms=subjective_episode_group_commit_ms,
     )
     link_store, semantic_memory_store = default_link_and_semantic_stores_for_episode_store(
         shared_episode_store
     )
+    # SQLite のリンク表は Being ごとの隣接リストをメモリに載せ、拡散活性化や
+    # 昇格の接続リンク読み取りを query 無しで返す (インメモリ実装は元から隣接リスト)
+    if not isinstance(link_store, InMemoryMemoryLinkStore):
+        link_store = AdjacencyCachedMemoryLinkStore(link_store)
+    # リンクの書き込みを強リンク disjoint-set に反映し、昇格は変わった成分だけを見る
+    strong_link_components = EpisodicStrongLinkComponents(min_strength=MIN_EFFECTIVE_STRENGTH)
+    link_store = StrongLinkIndexedMemoryLinkStore(link_store, strong_link_components)
     promotion_frontier = EpisodicPromotionFrontier()
     mem_bundle = build_episodic_memory_link_bundle(
         shared_episode_store,
@@ -116,6 +139,7 @@ def build_episodic_memory_stack(
         belief_evidence_buffer_store=belief_evidence_buffer_store,
         force_full_scan=episodic_promotion_force_full_scan,
         expansion_hops=episodic_promotion_expansion_hops,
+        strong_link_components=strong_link_components,
     )
     return EpisodicMemoryStack(
         shared_episode_store=shared_episode_store,
@@ -479,6 +479,8 @@ def build_episodic_stack(
     # None なら in-memory。semantic 有効時に build_episodic_memory_stack が store を
     # 解決する経路 (episode_store 未指定) でだけ効く。
     subjective_episode_db_path: Optional[str] = None,
+    # 上の SQLite store の group commit 遅延 (ms)。None なら 1 書き込み 1 commit。
+    subjective_episode_group_commit_ms: Optional[int] = None,
 ) -> EpisodicStack:
     """シナリオ非依存のエピソード記憶パイプラインを組み立てる。
 
@@ -550,6 +552,7 @@ def build_episodic_stack(
             episodic_promotion_force_full_scan=episodic_promotion_force_full_scan,
             episodic_promotion_expansion_hops=episodic_promotion_expansion_hops,
             subjective_episode_db_path=subjective_episode_db_path,
+            subjective_episode_group_commit_ms=subjective_episode_group_commit_ms,
         )
         # build_episodic_memory_stack が episode_store を解決して返す。以降は
         # 全コンポーネントがこの shared store を共有する (chunk write / recall /
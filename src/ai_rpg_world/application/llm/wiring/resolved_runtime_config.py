@@ -87,14 +87,26 @@ SUPPORTED_RUNTIME_CONFIG_KEYS = frozenset({
     "LLM_IDLE_TIMEOUT_TICKS",
     "LLM_MEETING_SERIAL_TURNS",
     "LLM_MODEL",
+    "LLM_PROMPT_CACHE_BREAKPOINTS",
     "LLM_RATE_LIMIT_RETRY_ATTEMPTS",
     "LLM_RATE_LIMIT_RETRY_BASE_SLEEP",
     "LLM_REASONING_EFFORT",
+    "LLM_REPLAY_CACHE_PATH",
+    "LLM_REPLAY_LATENCY_SCALE",
+    "LLM_REPLAY_MISS_POLICY",
+    "LLM_REPLAY_MODE",
     "LLM_REQUEST_TIMEOUT_SECONDS",
+    "LLM_SCHEDULER_BURST",
+    "LLM_SCHEDULER_ENABLED",
+    "LLM_SCHEDULER_MAX_CONCURRENCY",
+    "LLM_SCHEDULER_QUEUE_LIMIT",
+    "LLM_SCHEDULER_REQUESTS_PER_SECOND",
+    "LLM_SCHEDULER_RESERVED_TURN_SLOTS",
     "LLM_SESSION_ID_ENABLED",
     "LLM_TOOL_MODE",
     "LLM_TOOL_CHOICE",
     "LLM_TURN_PARALLEL_WORKERS",
+    "LLM_TURN_WAVE_DEADLINE_SECONDS",
     "LLM_WALL_TIME_CAP_SECONDS",
     "MEMO_DISTILL_ENABLED",
     "MEMO_TOOLS_ENABLED",
@@ -122,6 +134,7 @@ SUPPORTED_RUNTIME_CONFIG_KEYS = frozenset({
     "STAGNATION_REASONING_ENABLED",
     "STATE_COLLAPSE_EVIDENCE_ENABLED",
     "SUBJECTIVE_EPISODE_DB_PATH",
+    "SUBJECTIVE_EPISODE_GROUP_COMMIT_MS",
     "UNCONSCIOUS_CONTEXT_ENABLED",
 })
 
@@ -142,7 +155,8 @@ class ResolvedLlmRuntimeConfig:
         short_term_memory_scheduler_mode: ``"inline"`` | ``"thread_pool"``
 
         # === Prompt section ordering (Phase 0) ===
-        prompt_section_order: ``"stable_to_volatile"`` | ``"legacy"``
+        prompt_section_order: ``"stable_to_volatile"`` | ``"legacy"`` |
+            ``"prefix_stable"`` (実測の変動率で並びを決め直す layout)
 
         # === LLM client / model ===
         llm_client_kind: ``"stub"`` | ``"litellm"``
@@ -305,12 +319,54 @@ class ResolvedLlmRuntimeConfig:
     # 終了する。既定 OFF で、蘇生手段を実験したい profile は従来どおり猶予を残す。
     end_on_all_down: bool = False
 
+    # straggler 耐性 wave (``LLM_TURN_WAVE_DEADLINE_SECONDS``)。None なら従来の
+    # 「全員の Phase A を待ってから Phase B」経路。正の秒数を指定すると並列
+    # 経路 (workers >= 2) で Phase A の完了順に Phase B を流し、期限までに
+    # 戻らなかった agent は次 wave へ持ち越す。実験条件を変えるので DTO に残す。
+    llm_turn_wave_deadline_seconds: Optional[float] = None
+
+    # 全 LLM 呼び出し共有の優先度つき scheduler (``LLM_SCHEDULER_ENABLED``)。
+    # OFF なら各 pool が従来どおり独立に provider を叩く。ON のとき
+    # (model, api_base) ごとに同時実行 ``max_concurrency`` 本 (うち
+    # ``reserved_turn_slots`` 本は agent turn 専用)、送信レート
+    # ``requests_per_second`` (None = 無制限、bucket 容量 ``burst``)、背景系の
+    # 待ち行列長 ``queue_limit`` を強制する。provider への負荷形状を変えるので
+    # 実験条件として DTO に残す。
+    llm_scheduler_enabled: bool = False
+    llm_scheduler_max_concurrency: int = 8
+    llm_scheduler_reserved_turn_slots: int = 1
+    llm_scheduler_requests_per_second: Optional[float] = None
+    llm_scheduler_burst: int = 4
+    llm_scheduler_queue_limit: int = 32
+
+    # offline benchmark 用 LLM 応答 record / replay (``LLM_REPLAY_MODE``)。
+    # ``"off"`` (既定) / ``"record"`` (実応答を ``llm_replay_cache_path`` の
+    # SQLite へ追記) / ``"replay"`` (保存済み応答を返し provider を叩かない)。
+    # replay の miss は ``llm_replay_miss_policy`` (fail / stub / live) で解決し、
+    # ``llm_replay_latency_scale`` > 0 なら記録時 latency × scale だけ待つ。
+    # 応答の出どころを変えるので実験条件として DTO に残す。
+    llm_replay_mode: str = "off"
+    llm_replay_cache_path: Optional[str] = None
+    llm_replay_miss_policy: str = "fail"
+    llm_replay_latency_scale: float = 0.0
+
+    # provider の prompt cache breakpoint (``LLM_PROMPT_CACHE_BREAKPOINTS``)。
+    # ``"off"`` (既定) / ``"auto"`` (Anthropic 系モデルのときだけ) / ``"on"``。
+    # agent turn の system message と、``prompt_section_order=prefix_stable``
+    # が切り出した安定 user message に ``cache_control`` を置く。
+    llm_prompt_cache_breakpoints: str = "off"
+
     # Episode store の永続化先 (``SUBJECTIVE_EPISODE_DB_PATH``)。None なら in-memory。
     # 実 path 指定時は SQLite 永続化。従来 ``_default_episodic_episode_store`` が
     # os.environ を直読みしており profile/manifest の外で決まっていた
     # (PR #736 の単一窓口化で取り残されていた env)。config に載せ替えて
     # 解決経路を from_mapping の 1 本に固定し、run_start / manifest に残す。
     subjective_episode_db_path: Optional[str] = None
+    # 上の SQLite episode store (と同居する link / semantic store) の書き込みを
+    # group commit にする (``SUBJECTIVE_EPISODE_GROUP_COMMIT_MS``)。値は COMMIT を
+    # 遅らせる最長 ms。None なら従来どおり 1 書き込み 1 commit。tick 終端・
+    # shutdown・snapshot capture では待たずに flush する。
+    subjective_episode_group_commit_ms: Optional[int] = None
 
     # ──────────────────────────────────────────────────────────────
     # Invariants
@@ -387,11 +443,54 @@ class ResolvedLlmRuntimeConfig:
                 "STAGNATION_PRESSURE_ENABLED=1 / "
                 "STAGNATION_REASONING_ENABLED=1 require LLM_EPISODIC_ENABLED=1"
             )
+        if (
+            self.llm_scheduler_reserved_turn_slots
+            >= self.llm_scheduler_max_concurrency
+        ):
+            raise ValueError(
+                "LLM_SCHEDULER_RESERVED_TURN_SLOTS must be smaller than "
+                "LLM_SCHEDULER_MAX_CONCURRENCY (背景系の枠が 0 になり永久に待つ)"
+            )
+        if self.llm_replay_mode not in _VALID_LLM_REPLAY_MODES:
+            raise ValueError(
+                f"llm_replay_mode={self.llm_replay_mode!r} is not recognized. "
+                f"valid: {sorted(_VALID_LLM_REPLAY_MODES)}"
+            )
+        if self.llm_prompt_cache_breakpoints not in _VALID_PROMPT_CACHE_BREAKPOINTS:
+            raise ValueError(
+                f"llm_prompt_cache_breakpoints={self.llm_prompt_cache_breakpoints!r} "
+                f"is not recognized. valid: {sorted(_VALID_PROMPT_CACHE_BREAKPOINTS)}"
+            )
+        if self.llm_replay_miss_policy not in _VALID_LLM_REPLAY_MISS_POLICIES:
+            raise ValueError(
+                f"llm_replay_miss_policy={self.llm_replay_miss_policy!r} is not "
+                f"recognized. valid: {sorted(_VALID_LLM_REPLAY_MISS_POLICIES)}"
+            )
+        if self.llm_replay_mode != "off" and not self.llm_replay_cache_path:
+            raise ValueError(
+                f"LLM_REPLAY_MODE={self.llm_replay_mode} requires LLM_REPLAY_CACHE_PATH"
+            )
+        if self.llm_replay_mode != "off" and self.llm_client_kind != "litellm":
+            raise ValueError(
+                f"LLM_REPLAY_MODE={self.llm_replay_mode} requires LLM_CLIENT=litellm "
+                "(stub client は cache を通らないので設定が無視される)"
+            )
         # SUBJECTIVE_EPISODE_DB_PATH は episode store が組まれる経路でしか意味を
         # 持たない。episodic OFF では store 自体を作らず、subjective 経路は
         # (scheduler と共有する都合で) 常に in-memory を使うため、どちらの場合も
         # path 指定は静かに無視される。従来 env 直読み時代からの silent failure
         # なので、無視になる組み合わせは fail-fast で落とす。
+        if self.subjective_episode_group_commit_ms is not None:
+            if self.subjective_episode_group_commit_ms < 0:
+                raise ValueError(
+                    "SUBJECTIVE_EPISODE_GROUP_COMMIT_MS must be 0 or greater, "
+                    f"got {self.subjective_episode_group_commit_ms}"
+                )
+            if not self.subjective_episode_db_path:
+                raise ValueError(
+                    "SUBJECTIVE_EPISODE_GROUP_COMMIT_MS requires "
+                    "SUBJECTIVE_EPISODE_DB_PATH (in-memory store には commit が無い)"
+                )
         if self.subjective_episode_db_path:
             if not self.episodic_enabled:
                 raise ValueError(
@@ -507,9 +606,33 @@ class ResolvedLlmRuntimeConfig:
         llm_meeting_serial_turns = _parse_truthy(
             source.get("LLM_MEETING_SERIAL_TURNS"), default=False
         )
+        llm_turn_wave_deadline_seconds = _resolve_optional_positive_float(
+            source, "LLM_TURN_WAVE_DEADLINE_SECONDS"
+        )
         llm_idle_timeout_ticks = _resolve_positive_int(
             source, "LLM_IDLE_TIMEOUT_TICKS", default=6
         )
+        try:
+            llm_scheduler_enabled = _parse_truthy(
+                source.get("LLM_SCHEDULER_ENABLED"), default=False
+            )
+        except ValueError as exc:
+            raise ValueError(f"LLM_SCHEDULER_ENABLED: {exc}") from exc
+        llm_scheduler_max_concurrency = _resolve_positive_int(
+            source, "LLM_SCHEDULER_MAX_CONCURRENCY", default=8
+        )
+        llm_scheduler_reserved_turn_slots = _resolve_non_negative_int(
+            source, "LLM_SCHEDULER_RESERVED_TURN_SLOTS", default=1
+        )
+        llm_scheduler_requests_per_second = _resolve_optional_positive_float(
+            source, "LLM_SCHEDULER_REQUESTS_PER_SECOND"
+        )
+        llm_scheduler_burst = _resolve_positive_int(
+            source, "LLM_SCHEDULER_BURST", default=4
+        )
+        llm_scheduler_queue_limit = _resolve_positive_int(
+            source, "LLM_SCHEDULER_QUEUE_LIMIT", default=32
+        )
         llm_tool_choice = _resolve_tool_choice(source)
         try:
             llm_session_id_enabled = _parse_truthy(
@@ -647,6 +770,28 @@ class ResolvedLlmRuntimeConfig:
         subjective_episode_db_path = _strip_or_none(
             source.get("SUBJECTIVE_EPISODE_DB_PATH")
         )
+        subjective_episode_group_commit_ms = _resolve_optional_int(
+            source, "SUBJECTIVE_EPISODE_GROUP_COMMIT_MS"
+        )
+        llm_replay_mode = _resolve_choice(
+            source, "LLM_REPLAY_MODE", _VALID_LLM_REPLAY_MODES, default="off"
+        )
+        llm_replay_cache_path = _strip_or_none(source.get("LLM_REPLAY_CACHE_PATH"))
+        llm_replay_miss_policy = _resolve_choice(
+            source,
+            "LLM_REPLAY_MISS_POLICY",
+            _VALID_LLM_REPLAY_MISS_POLICIES,
+            default="fail",
+        )
+        llm_replay_latency_scale = _resolve_non_negative_float(
+            source, "LLM_REPLAY_LATENCY_SCALE", default=0.0
+        )
+        llm_prompt_cache_breakpoints = _resolve_choice(
+            source,
+            "LLM_PROMPT_CACHE_BREAKPOINTS",
+            _VALID_PROMPT_CACHE_BREAKPOINTS,
+            default="off",
+        )
 
         return cls(
             short_term_memory_kind=short_term_memory_kind,
@@ -721,7 +866,20 @@ class ResolvedLlmRuntimeConfig:
             distant_view_trace_enabled=distant_view_trace_enabled,
             reason_first_two_step_enabled=reason_first_two_step_enabled,
             end_on_all_down=end_on_all_down,
+            llm_turn_wave_deadline_seconds=llm_turn_wave_deadline_seconds,
+            llm_scheduler_enabled=llm_scheduler_enabled,
+            llm_scheduler_max_concurrency=llm_scheduler_max_concurrency,
+            llm_scheduler_reserved_turn_slots=llm_scheduler_reserved_turn_slots,
+            llm_scheduler_requests_per_second=llm_scheduler_requests_per_second,
+            llm_scheduler_burst=llm_scheduler_burst,
+            llm_scheduler_queue_limit=llm_scheduler_queue_limit,
+            llm_replay_mode=llm_replay_mode,
+            llm_replay_cache_path=llm_replay_cache_path,
+            llm_replay_miss_policy=llm_replay_miss_policy,
+            llm_replay_latency_scale=llm_replay_latency_scale,
+            llm_prompt_cache_breakpoints=llm_prompt_cache_breakpoints,
             subjective_episode_db_path=subjective_episode_db_path,
+            subjective_episode_group_commit_ms=subjective_episode_group_commit_ms,
         )
 
     @classmethod
@@ -816,7 +974,20 @@ class ResolvedLlmRuntimeConfig:
             distant_view_trace_enabled=False,
             reason_first_two_step_enabled=False,
             end_on_all_down=False,
+            llm_turn_wave_deadline_seconds=None,
+            llm_scheduler_enabled=False,
+            llm_scheduler_max_concurrency=8,
+            llm_scheduler_reserved_turn_slots=1,
+            llm_scheduler_requests_per_second=None,
+            llm_scheduler_burst=4,
+            llm_scheduler_queue_limit=32,
+            llm_replay_mode="off",
+            llm_replay_cache_path=None,
+            llm_replay_miss_policy="fail",
+            llm_replay_latency_scale=0.0,
+            llm_prompt_cache_breakpoints="off",
             subjective_episode_db_path=None,
+            subjective_episode_group_commit_ms=None,
         )
         unknown = set(overrides) - set(defaults)
         if unknown:
@@ -900,6 +1071,11 @@ def _parse_truthy(value: Optional[str], *, default: bool) -> bool:
 _VALID_EXPECTED_RESULT_POLICIES = frozenset({"off", "optional", "required"})
 _VALID_TOOL_MODES = frozenset({"default", "pure_spot_graph"})
 _VALID_TOOL_CHOICES = frozenset({"required", "auto"})
+# infrastructure/llm/llm_response_cache.py の定義と揃える (application 層から
+# infrastructure を import しないため値だけ複製)。
+_VALID_LLM_REPLAY_MODES = frozenset({"off", "record", "replay"})
+_VALID_LLM_REPLAY_MISS_POLICIES = frozenset({"fail", "stub", "live"})
+_VALID_PROMPT_CACHE_BREAKPOINTS = frozenset({"off", "auto", "on"})
 _VALID_REASONING_EFFORTS = frozenset({
     "",
     "none",
@@ -926,6 +1102,22 @@ def _resolve_expected_result_policy(source: Mapping[str, str]) -> str:
     return raw
 
 
+def _resolve_choice(
+    source: Mapping[str, str],
+    key: str,
+    valid: frozenset,
+    *,
+    default: str,
+) -> str:
+    """``key`` を ``valid`` のいずれかとして解決。未設定 / 空文字 → ``default``。"""
+    raw = (source.get(key) or "").strip().lower()
+    if not raw:
+        return default
+    if raw not in valid:
+        raise ValueError(f"{key}={raw!r} is not recognized. valid: {sorted(valid)}")
+    return raw
+
+
 def _resolve_tool_mode(source: Mapping[str, str]) -> str:
     """``LLM_TOOL_MODE`` を解決する。
 
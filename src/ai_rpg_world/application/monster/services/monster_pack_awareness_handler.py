@@ -20,7 +20,7 @@ pack_flee の後 / pack_reinforcement の後に呼ばれ、「同 pack の scout
   なので競合しない。
 
 実装メモ:
-- 援護と同じく BFS で距離測定 (`spot_path_finder.find_hop_distance`)
+- 援護と同じく graph の経路表で距離測定 (`SpotGraphAggregate.hop_distance_between`)
 - 上限なし: 距離内の全 follower が同 target を CHASE 開始 (群れ警戒の
   演出。`max_pack_responders` のような上限は付けない)
 - pack_members は optional 引数で外から渡せる (PR #145 と同じ最適化)
@@ -51,9 +51,6 @@ from ai_rpg_world.domain.world_graph.event.spot_graph_event import (
 from ai_rpg_world.domain.world_graph.exception.spot_graph_exception import (
     MonsterNotInGraphException,
 )
-from ai_rpg_world.domain.world_graph.service.spot_path_finder import (
-    find_hop_distance,
-)
 from ai_rpg_world.domain.world_graph.value_object.entity_id import EntityId
 
 
@@ -129,16 +126,11 @@ class MonsterPackAwarenessHandler:
             else frozenset()
         )
 
-        def _is_passable(conn) -> bool:
-            return graph.can_traverse_connection(
-                conn.connection_id, frozenset(), world_flags,
-            )
-
-        distance = find_hop_distance(
-            graph=graph,
-            from_spot=spot_id,
-            target_spot=scout_spot,
-            is_passable=_is_passable,
+        distance = graph.hop_distance_between(
+            spot_id,
+            scout_spot,
+            frozenset(),
+            world_flags,
             max_distance=template.pack_awareness_radius,
         )
         if distance is None:
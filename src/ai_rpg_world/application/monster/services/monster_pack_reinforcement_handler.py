@@ -16,8 +16,8 @@ member が CHASE で駆け付ける」挙動を実装する。
 - 既に同じ target を CHASE 中の monster は二重応答しない。
 
 重要:
-- BFS は `SpotPathFinder.find_next_hop` ではなく距離測定用に使うので、
-  ここでは graph 経由で距離を計測する小さな helper を内部で持つ。
+- 経路は `next_hop` ではなく距離測定用に使うので、graph の経路表から
+  hop 数を引く (`SpotGraphAggregate.hop_distance_between`)。
   pack_help_radius=1 なら隣接 spot のみ。
 - victim の attacker_ref が None の場合 (ref 不明) は援護できない。
 """
@@ -53,9 +53,6 @@ from ai_rpg_world.domain.world_graph.event.spot_graph_event import (
 from ai_rpg_world.domain.world_graph.exception.spot_graph_exception import (
     MonsterNotInGraphException,
 )
-from ai_rpg_world.domain.world_graph.service.spot_path_finder import (
-    find_hop_distance,
-)
 from ai_rpg_world.domain.world_graph.value_object.entity_id import EntityId
 
 
@@ -136,16 +133,11 @@ class MonsterPackReinforcementHandler:
             else frozenset()
         )
 
-        def _is_passable(conn) -> bool:
-            return graph.can_traverse_connection(
-                conn.connection_id, frozenset(), world_flags,
-            )
-
-        distance = find_hop_distance(
-            graph=graph,
-            from_spot=spot_id,
-            target_spot=victim_spot,
-            is_passable=_is_passable,
+        distance = graph.hop_distance_between(
+            spot_id,
+            victim_spot,
+            frozenset(),
+            world_flags,
             max_distance=template.pack_help_radius,
         )
         if distance is None:
@@ -283,4 +275,5 @@ class MonsterPackReinforcementHandler:
     # に統合した (HIGH #3 対応)。
 
     # `_bfs_distance` は `domain.world_graph.service.spot_path_finder.find_hop_distance`
-    # に統合された (HIGH #3 対応: BFS 実装の重複を解消)。
+    # に統合された (HIGH #3 対応: BFS 実装の重複を解消)。現在は同じ結果を
+    # `SpotGraphAggregate.hop_distance_between` の経路表から引いている。
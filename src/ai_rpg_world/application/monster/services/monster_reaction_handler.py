@@ -61,7 +61,6 @@ from ai_rpg_world.domain.world_graph.exception.spot_graph_exception import (
     EntityNotInGraphException,
     MonsterNotInGraphException,
 )
-from ai_rpg_world.domain.world_graph.service.spot_path_finder import find_next_hop
 from ai_rpg_world.domain.world_graph.value_object.entity_id import EntityId
 from ai_rpg_world.domain.world_graph.value_object.spot_attack_outcome import (
     AttackOutcome,
@@ -540,22 +539,19 @@ class MonsterReactionHandler:
         )
         owned_item_spec_ids: FrozenSet[ItemSpecId] = frozenset()
 
-        def _is_passable(conn) -> bool:
-            return graph.can_traverse_connection(
-                conn.connection_id, owned_item_spec_ids, world_flags
-            )
-
         # Phase 4b PR (c): MonsterTemplate.chase_max_distance を BFS の
         # 打ち切り基準にする。0 なら制限なし (`None` 扱い)。これにより
         # 「target が遠ざかったら諦める」挙動を distance 単位で制御できる。
         max_distance_setting = monster.template.chase_max_distance
         max_distance = max_distance_setting if max_distance_setting > 0 else None
 
-        next_hop = find_next_hop(
-            graph=graph,
-            from_spot=from_spot,
-            target_spot=target_spot,
-            is_passable=_is_passable,
+        # graph の経路表を引く (`find_next_hop` に `can_traverse_connection` を
+        # 渡したのと同じ結果)。同じ tick に同じ spot から追う monster は BFS を共有する
+        next_hop = graph.next_hop_toward(
+            from_spot,
+            target_spot,
+            owned_item_spec_ids,
+            world_flags,
             max_distance=max_distance,
         )
         if next_hop is None:
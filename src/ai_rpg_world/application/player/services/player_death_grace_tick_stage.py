@@ -64,6 +64,14 @@ class PlayerDeathGraceTickStage:
         self._grace_ticks = grace_ticks
         self._logger = logging.getLogger(self.__class__.__name__)
 
+    def next_due_tick(self, current_tick: int) -> "int | None":
+        """次に DEAD 確定が起きうる tick。pending が無ければ None (眠る)。"""
+        return self._grace_timer.next_overdue_tick(self._grace_ticks)
+
+    def work_revision(self) -> int:
+        """新しいダウン・revive で変わる。変われば期限を待たずに走る。"""
+        return self._grace_timer.revision
+
     def run(self, current_tick: WorldTick) -> None:
         """tick 毎に呼ばれる。overdue player を DEAD 確定して pending 掃除する。
 
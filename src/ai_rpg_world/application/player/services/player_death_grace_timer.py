@@ -33,6 +33,9 @@ class PlayerDeathGraceTimer:
 
     def __init__(self) -> None:
         self._downed_at: Dict[int, int] = {}
+        # register / cancel のたびに進む版。tick stage はこれが変わらない
+        # 限り、次の overdue tick まで眠ってよい。
+        self._revision = 0
 
     def register(self, player_id: PlayerId, downed_at_tick: int) -> None:
         """ダウンを記録する。既に pending なら downed_at_tick を上書き
@@ -45,6 +48,7 @@ class PlayerDeathGraceTimer:
                 f"downed_at_tick must be non-negative int, got {downed_at_tick!r}"
             )
         self._downed_at[int(player_id)] = downed_at_tick
+        self._revision += 1
 
     def cancel(self, player_id: PlayerId) -> None:
         """pending を削除する。revive 時に呼ぶ。
@@ -52,7 +56,8 @@ class PlayerDeathGraceTimer:
         """
         if not isinstance(player_id, PlayerId):
             raise TypeError("player_id must be PlayerId")
-        self._downed_at.pop(int(player_id), None)
+        if self._downed_at.pop(int(player_id), None) is not None:
+            self._revision += 1
 
     def is_pending(self, player_id: PlayerId) -> bool:
         """pending 中 (= ダウンしたが DEAD 確定前) か。"""
@@ -70,6 +75,17 @@ class PlayerDeathGraceTimer:
             raise TypeError("player_id must be PlayerId")
         return self._downed_at.get(int(player_id))
 
+    @property
+    def revision(self) -> int:
+        """pending の集合が変わるたびに増える値。"""
+        return self._revision
+
+    def next_overdue_tick(self, grace_ticks: int) -> "int | None":
+        """最も早く overdue に入る tick。pending が無ければ None。"""
+        if not self._downed_at:
+            return None
+        return min(self._downed_at.values()) + grace_ticks
+
     def overdue_players(
         self, current_tick: int, grace_ticks: int
     ) -> List[PlayerId]:
@@ -2,9 +2,10 @@
 
 LLM エージェントが世界の中で何を見て / どう考えて / 何をしたかを、後から人間が
 時系列で振り返れるように構造化イベントとして記録する。
-出力形式は JSON Lines。各行が単一の TraceEvent。
+出力形式は JSON Lines。各行が単一の TraceEvent (gzip / zstd フレーム圧縮も可)。
 
 `TraceRecorder` は demos / runtime / 実験スクリプトから呼ばれる中立な記録口。
+`TraceIndex` / `query_trace_events` は viewer・分析スクリプト向けの絞り込み読み出し。
 """
 
 from ai_rpg_world.application.trace.events import (
@@ -12,15 +13,23 @@ from ai_rpg_world.application.trace.events import (
     TraceEventKind,
 )
 from ai_rpg_world.application.trace.recorder import (
+    AsyncJsonlTraceRecorder,
     ITraceRecorder,
     JsonlTraceRecorder,
     NullTraceRecorder,
 )
+from ai_rpg_world.application.trace.index import (
+    TraceIndex,
+    query_trace_events,
+)
 
 __all__ = [
     "TraceEvent",
     "TraceEventKind",
+    "AsyncJsonlTraceRecorder",
     "ITraceRecorder",
     "JsonlTraceRecorder",
     "NullTraceRecorder",
+    "TraceIndex",
+    "query_trace_events",
 ]
@@ -92,6 +92,16 @@ class TraceEventKind:
     # ``cost_usd`` は OpenRouter 経由時のみ provider 宣告値が乗る (直結 / vLLM では 0.0)。
     # τ_sim の設定根拠データ + scenario ごとの cost 評価に使う。
     LLM_CALL = "llm_call"
+    # straggler 耐性 wave (LLM_TURN_WAVE_DEADLINE_SECONDS 指定時) の 1 wave 分の
+    # 集計。遅い provider 呼び出しが tick を止めずに次 wave へ持ち越されたかを
+    # 後から数えるための観測点。
+    # payload: wave_index / deadline_seconds / wave_wall_ms /
+    # submitted_player_ids / committed_player_ids / carried_player_ids /
+    # deferred_player_ids / dropped_player_ids /
+    # straggler_latency_ms (= {player_id: 投入からの経過 ms}。持ち越し中と、
+    # 持ち越し後にこの wave で commit されたものの両方を含む) /
+    # max_straggler_latency_ms
+    LLM_TURN_WAVE = "llm_turn_wave"
     # prompt section の文字数内訳 (実験 #356 後続: prefix cache 分析用)。
     # prompt_builder.build() が messages / tools を組み上げた直後に 1 件記録する。
     # payload: system_chars / objective_chars / current_state_chars / memos_chars /
@@ -100,11 +110,27 @@ class TraceEventKind:
     # token 数ではなく char 数で出す: 軽量 / モデル非依存 / deterministic。
     # 分析側で同 turn の prompt_tokens 比に換算する (≒ token 内訳)。
     PROMPT_SECTION_BREAKDOWN = "prompt_section_breakdown"
+    # LLM 呼び出し 1 回ごとの cache 率の section 別内訳。provider が返した
+    # cached_tokens を prompt 先頭 (tools → system → user sections →
+    # instruction) から文字数比で割り振った近似。
+    # payload: llm_call_id / phase / prompt_tokens / cached_tokens /
+    # cached_ratio / sections (= [{name, chars, cached_ratio}, ...] 送信順)
+    PROMPT_CACHE_SECTIONS = "prompt_cache_sections"
     # tool_runtime_context が「引数として渡せる」と宣言した文字列が、
     # current_state_text に引用符つきで現れなかった。起動時は即座に
     # 落とすが、run 中の状態変化で発見した場合は実験データを守るため
     # trace に残して続行する。payload: violation_count / violations[]。
     PROMPT_ARGUMENT_CONTRACT_VIOLATION = "prompt_argument_contract_violation"
+    # turn 単位の player snapshot cache の tick 内集計。tick 終端で、その tick
+    # に snapshot が 1 回でも引かれたときだけ 1 件記録する。
+    # payload: hits / misses / bypassed (= scope 外で毎回作り直した回数) /
+    # invalidations (= mutation event で捨てた回数)
+    PLAYER_SNAPSHOT_CACHE = "player_snapshot_cache"
+    # tick stage ごとの実行 / skip と所要時間。tick 終端で 1 件記録する。
+    # 期限や入力の変化を宣言した stage は、仕事の無い tick で skip される。
+    # payload: stages{name: {runs, skipped, elapsed_ms}} / skipped_count /
+    # elapsed_ms (= 走った stage の合計)
+    TICK_STAGE_TIMINGS = "tick_stage_timings"
     # Phase 1c: semantic memory passive top-K の発火結果。prompt build 時に
     # ``SemanticPassiveRecallService.retrieve`` が走ったタイミングで 1 件記録。
     # payload: situation_cues / top_k / candidate_count / candidates[].entry_id /
@@ -0,0 +1,420 @@
+"""trace.jsonl の sidecar index (kind / tick / player_id → byte offset)。
+
+viewer や分析スクリプトは ``load_trace_events`` で trace 全体を読み、kind や
+tick で Python 側で絞り込んでいた。数 GB の trace では viewer を作り直すたびに
+全行の JSON parse が走る。ここでは 1 イベント 1 行の
+``(seq, kind, tick, player_id, offset, length)`` を SQLite の sidecar
+(``<trace>.idx.sqlite``) に持ち、絞り込みを SQL で行ってから該当行だけを
+切り出して読む。
+
+- ``TraceIndex.build``: 既存の trace を 1 パスで走査して index を作る
+- ``AsyncJsonlTraceRecorder(index=True)``: 記録中に writer thread が同じ index を
+  書く (``TraceIndexWriter``)
+- ``TraceIndex.open``: index が trace と一致していれば開く (trace のサイズを
+  meta に持ち、違えば古い index とみなして None)
+- ``query_trace_events``: index があれば使い、無ければ ``load_trace_events`` を
+  同じ条件で絞り込む。呼び出し側は index の有無を気にしなくてよい
+
+index はバイト offset を持つので無圧縮 JSONL 専用。gzip / zstd の trace は
+``query_trace_events`` が全体走査に落ちる。index は trace から作り直せる派生物
+なので、SQLite は journal / fsync を切って書く。
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import sqlite3
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ai_rpg_world.application.trace.events import TraceEvent
+from ai_rpg_world.application.trace.recorder import load_trace_events, open_trace_text
+
+TRACE_INDEX_SUFFIX = ".idx.sqlite"
+_FORMAT_VERSION = "1"
+_INSERT_BATCH = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trace_index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trace_events (
+    seq INTEGER,
+    kind TEXT NOT NULL,
+    tick INTEGER,
+    player_id INTEGER,
+    offset INTEGER NOT NULL PRIMARY KEY,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_trace_events_kind_tick ON trace_events(kind, tick);
+CREATE INDEX IF NOT EXISTS idx_trace_events_tick ON trace_events(tick);
+CREATE INDEX IF NOT EXISTS idx_trace_events_player_tick ON trace_events(player_id, tick);
+"""
+
+# (seq, kind, tick, player_id, offset, length)
+TraceIndexRow = Tuple[Optional[int], str, Optional[int], Optional[int], int, int]
+
+
+def trace_index_path(trace_path: Path) -> Path:
+    """``trace.jsonl`` に対する sidecar index のパス。"""
+    return trace_path.with_name(trace_path.name + TRACE_INDEX_SUFFIX)
+
+
+def _is_compressed(trace_path: Path) -> bool:
+    with open(trace_path, "rb") as probe:
+        magic = probe.read(4)
+    return magic.startswith(b"\x1f\x8b") or magic.startswith(b"\x28\xb5\x2f\xfd")
+
+
+def _open_index_db(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    # 派生物なので journal / fsync は要らない (壊れたら作り直す)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    return conn
+
+
+class TraceIndexWriter:
+    """index への行追加と、trace サイズの確定 (``commit``) を行う書き手。
+
+    ``TraceIndex.build`` と ``AsyncJsonlTraceRecorder`` の writer thread が使う。
+    ``commit(trace_size)`` までに追加した行は、trace がそのサイズのときに限り
+    ``TraceIndex.open`` から見える。
+    """
+
+    def __init__(self, trace_path: Path, *, truncate: bool) -> None:
+        self._trace_path = trace_path
+        self._path = trace_index_path(trace_path)
+        if truncate and self._path.exists():
+            self._path.unlink()
+        self._conn = _open_index_db(self._path)
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO trace_index_meta (key, value) VALUES ('format_version', ?)",
+            (_FORMAT_VERSION,),
+        )
+        self._conn.commit()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def add_rows(self, rows: Sequence[TraceIndexRow]) -> None:
+        if rows:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO trace_events "
+                "(seq, kind, tick, player_id, offset, length) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def commit(self, trace_size: int) -> None:
+        """ここまでの行を確定し、対応する trace のバイト数を記録する。"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO trace_index_meta (key, value) VALUES ('trace_size', ?)",
+            (str(int(trace_size)),),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def index_row_for_line(line: bytes, offset: int) -> Optional[TraceIndexRow]:
+    """JSONL 1 行 (改行込み) から index 行を作る。空行・壊れた行は None。"""
+    stripped = line.strip()
+    if not stripped:
+        return None
+    try:
+        data = json.loads(stripped)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    return (
+        data.get("seq"),
+        str(data.get("kind")),
+        data.get("tick"),
+        data.get("player_id"),
+        offset,
+        len(line),
+    )
+
+
+class TraceIndex:
+    """sidecar index を使った trace の絞り込み読み出し。"""
+
+    def __init__(self, trace_path: Path, conn: sqlite3.Connection) -> None:
+        self._trace_path = trace_path
+        self._conn = conn
+
+    @property
+    def trace_path(self) -> Path:
+        return self._trace_path
+
+    @classmethod
+    def build(cls, trace_path: Path) -> "TraceIndex":
+        """trace を 1 パスで走査して index を作り直す。
+
+        空行と JSON として読めない行は index に載せない (viewer の読み込みと同じ
+        扱い)。圧縮 trace は offset で読めないので ValueError。
+        """
+        if not isinstance(trace_path, Path):
+            raise TypeError("trace_path must be Path")
+        if _is_compressed(trace_path):
+            raise ValueError(f"cannot index a compressed trace: {trace_path}")
+        writer = TraceIndexWriter(trace_path, truncate=True)
+        try:
+            offset = 0
+            rows: List[TraceIndexRow] = []
+            with open(trace_path, "rb") as fh:
+                for line in fh:
+                    row = index_row_for_line(line, offset)
+                    if row is not None:
+                        rows.append(row)
+                        if len(rows) >= _INSERT_BATCH:
+                            writer.add_rows(rows)
+                            rows = []
+                    offset += len(line)
+            writer.add_rows(rows)
+            writer.commit(offset)
+        finally:
+            writer.close()
+        index = cls.open(trace_path)
+        assert index is not None  # 直前に trace サイズで確定している
+        return index
+
+    @classmethod
+    def open(cls, trace_path: Path) -> Optional["TraceIndex"]:
+        """trace と一致する index があれば開く。無い / 古い / 形式違いなら None。"""
+        if not isinstance(trace_path, Path):
+            raise TypeError("trace_path must be Path")
+        path = trace_index_path(trace_path)
+        if not path.exists() or not trace_path.exists():
+            return None
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM trace_index_meta").fetchall())
+        except sqlite3.DatabaseError:
+            conn.close()
+            return None
+        if meta.get("format_version") != _FORMAT_VERSION or meta.get("trace_size") != str(
+            trace_path.stat().st_size
+        ):
+            conn.close()
+            return None
+        return cls(trace_path, conn)
+
+    @classmethod
+    def open_or_build(cls, trace_path: Path) -> Optional["TraceIndex"]:
+        """一致する index を開き、無ければ作る。圧縮 trace では None。"""
+        index = cls.open(trace_path)
+        if index is not None:
+            return index
+        if _is_compressed(trace_path):
+            return None
+        return cls.build(trace_path)
+
+    def _select_rows(
+        self,
+        *,
+        kinds: Optional[Iterable[str]],
+        tick_from: Optional[int],
+        tick_to: Optional[int],
+        player_ids: Optional[Iterable[int]],
+    ) -> List[Tuple[int, int]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if kinds is not None:
+            kind_list = [str(k) for k in kinds]
+            if not kind_list:
+                return []
+            clauses.append(f"kind IN ({','.join('?' * len(kind_list))})")
+            params.extend(kind_list)
+        if tick_from is not None:
+            clauses.append("tick >= ?")
+            params.append(int(tick_from))
+        if tick_to is not None:
+            clauses.append("tick <= ?")
+            params.append(int(tick_to))
+        if player_ids is not None:
+            pid_list = [int(p) for p in player_ids]
+            if not pid_list:
+                return []
+            clauses.append(f"player_id IN ({','.join('?' * len(pid_list))})")
+            params.extend(pid_list)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        # ファイル順 (= seq 順) で返す
+        return self._conn.execute(
+            f"SELECT offset, length FROM trace_events{where} ORDER BY offset", params
+        ).fetchall()
+
+    def query_jsonable(
+        self,
+        *,
+        kinds: Optional[Iterable[str]] = None,
+        tick_from: Optional[int] = None,
+        tick_to: Optional[int] = None,
+        player_ids: Optional[Iterable[int]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """条件に合う行を JSON dict のまま返す (dict を読む viewer 用)。
+
+        tick / player_id の条件は値が None の行 (run_start など) を含まない。
+        """
+        rows = self._select_rows(
+            kinds=kinds, tick_from=tick_from, tick_to=tick_to, player_ids=player_ids
+        )
+        if not rows:
+            return
+        # 行ごとの seek / read を避け、mmap から該当範囲を切り出す
+        with open(self._trace_path, "rb") as fh, mmap.mmap(
+            fh.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            for offset, length in rows:
+                yield json.loads(mm[offset : offset + length])
+
+    def query(
+        self,
+        *,
+        kinds: Optional[Iterable[str]] = None,
+        tick_from: Optional[int] = None,
+        tick_to: Optional[int] = None,
+        player_ids: Optional[Iterable[int]] = None,
+    ) -> Iterator[TraceEvent]:
+        """条件に合うイベントを seq 順で返す。"""
+        for data in self.query_jsonable(
+            kinds=kinds, tick_from=tick_from, tick_to=tick_to, player_ids=player_ids
+        ):
+            yield TraceEvent.from_jsonable(data)
+
+    def count_by_kind(self) -> Dict[str, int]:
+        return dict(
+            self._conn.execute(
+                "SELECT kind, COUNT(*) FROM trace_events GROUP BY kind"
+            ).fetchall()
+        )
+
+    def tick_range(self) -> Tuple[Optional[int], Optional[int]]:
+        lo, hi = self._conn.execute(
+            "SELECT MIN(tick), MAX(tick) FROM trace_events"
+        ).fetchone()
+        return lo, hi
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "TraceIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _matches(
+    kind: Any,
+    tick: Optional[int],
+    player_id: Optional[int],
+    *,
+    kinds: Optional[frozenset],
+    tick_from: Optional[int],
+    tick_to: Optional[int],
+    player_ids: Optional[frozenset],
+) -> bool:
+    if kinds is not None and kind not in kinds:
+        return False
+    if tick_from is not None and (tick is None or tick < tick_from):
+        return False
+    if tick_to is not None and (tick is None or tick > tick_to):
+        return False
+    if player_ids is not None and player_id not in player_ids:
+        return False
+    return True
+
+
+def query_trace_events(
+    trace_path: Path,
+    *,
+    kinds: Optional[Iterable[str]] = None,
+    tick_from: Optional[int] = None,
+    tick_to: Optional[int] = None,
+    player_ids: Optional[Iterable[int]] = None,
+) -> Iterator[TraceEvent]:
+    """kind / tick 範囲 / player_id で絞った TraceEvent を seq 順で返す。
+
+    一致する sidecar index があれば該当行だけを読み、無ければ
+    ``load_trace_events`` の全走査を同じ条件で絞り込む (結果は同じ)。
+    """
+    if not isinstance(trace_path, Path):
+        raise TypeError("trace_path must be Path")
+    index = TraceIndex.open(trace_path)
+    if index is not None:
+        with index:
+            yield from index.query(
+                kinds=kinds, tick_from=tick_from, tick_to=tick_to, player_ids=player_ids
+            )
+        return
+    kind_set = None if kinds is None else frozenset(str(k) for k in kinds)
+    pid_set = None if player_ids is None else frozenset(int(p) for p in player_ids)
+    for event in load_trace_events(trace_path):
+        if _matches(
+            event.kind,
+            event.tick,
+            event.player_id,
+            kinds=kind_set,
+            tick_from=tick_from,
+            tick_to=tick_to,
+            player_ids=pid_set,
+        ):
+            yield event
+
+
+def load_trace_dicts(
+    trace_path: Path,
+    *,
+    kinds: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """viewer 向け: 行を dict のまま返す。壊れた行は飛ばす。
+
+    一致する index があれば ``kinds`` の行だけを読む。無ければ全体を読み、
+    ``kinds`` で絞る (圧縮 trace もこちら)。
+    """
+    index = TraceIndex.open(trace_path)
+    if index is not None:
+        with index:
+            return list(index.query_jsonable(kinds=kinds))
+    kind_set = None if kinds is None else frozenset(str(k) for k in kinds)
+    out: List[Dict[str, Any]] = []
+    with open_trace_text(trace_path) as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if kind_set is not None and data.get("kind") not in kind_set:
+                continue
+            out.append(data)
+    return out
+
+
+__all__ = [
+    "TRACE_INDEX_SUFFIX",
+    "TraceIndex",
+    "TraceIndexWriter",
+    "index_row_for_line",
+    "load_trace_dicts",
+    "query_trace_events",
+    "trace_index_path",
+]
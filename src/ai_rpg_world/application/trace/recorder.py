@@ -2,6 +2,10 @@
 
 呼び出し側は ``ITraceRecorder`` 経由で kind を指定して 1 イベント記録する。
 - ``JsonlTraceRecorder``: 指定パスに 1 行ずつ JSON を append。実シナリオで使う
+- ``AsyncJsonlTraceRecorder``: 同じ JSONL を専用 writer thread がバッチで書く。
+  ``record`` は seq を振ってバッファに積むだけで、JSON 化・write・flush は
+  呼び出し元 thread (tick / Phase A worker / 非同期 scheduler) から外れる。
+  gzip / zstd のフレーム圧縮も選べる
 - ``NullTraceRecorder``: 何も記録しない no-op。テストや trace 無効時のデフォルト
 
 呼び出し側責務:
@@ -15,18 +19,33 @@
 
 from __future__ import annotations
 
+import copy
+import gzip
+import io
 import json
 import logging
+import sqlite3
 import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Optional, TextIO
+from typing import Any, BinaryIO, Callable, Deque, Iterable, List, Optional, TextIO
 
 from ai_rpg_world.application.trace.events import TraceEvent
 
 _logger = logging.getLogger(__name__)
 
+TRACE_COMPRESSION_GZIP = "gzip"
+TRACE_COMPRESSION_ZSTD = "zstd"
+# 圧縮形式ごとの慣習的な拡張子 (呼び出し側が trace のファイル名を決めるときに使う)
+TRACE_COMPRESSION_SUFFIXES = {
+    TRACE_COMPRESSION_GZIP: ".gz",
+    TRACE_COMPRESSION_ZSTD: ".zst",
+}
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 
 class ITraceRecorder(ABC):
     """シナリオ実行を「人間が振り返れるイベント列」として記録する口。"""
@@ -184,17 +203,376 @@ class JsonlTraceRecorder(ITraceRecorder):
             )
 
 
+class AsyncJsonlTraceRecorder(ITraceRecorder):
+    """``JsonlTraceRecorder`` と同じ行を、専用 writer thread がバッチで書く recorder。
+
+    ``JsonlTraceRecorder.record`` は lock の中で ``json.dumps`` → ``write`` →
+    ``flush`` を 1 イベントごとに行うため、長い run では trace I/O が tick と
+    Phase A worker のクリティカルパスに乗る。この recorder の ``record`` は
+    lock の中で seq を振ってバッファ (deque) に積むだけにし、JSON 化と書き込みは
+    writer thread が ``batch_size`` 件ごと / ``flush_interval_s`` ごとにまとめて
+    行う。seq は積んだ順に振るので、ファイル上の行順は seq 順のまま。
+
+    - バッファは ``max_pending`` 件で頭打ちにし、溢れたら ``record`` は writer が
+      追いつくまで待つ (イベントは捨てない)
+    - ``compression`` に ``"gzip"`` / ``"zstd"`` を渡すと、バッチごとに 1 フレーム
+      (gzip member / zstd frame) として追記する。フレームの連結はそれぞれの形式で
+      正しいストリームなので、途中で落ちても書けたバッチまでは読める。zstd は
+      ``zstandard`` パッケージが必要 (無ければ構築時に ValueError)
+    - ``flush()`` はその時点までに積まれたイベントが書かれるまで待つ。run 中に
+      trace を読み戻す前に呼ぶ
+    - ``index=True`` (無圧縮のみ) なら writer thread がバッチごとに sidecar index
+      (``application.trace.index``) へ kind / tick / player_id と byte offset を
+      書く。viewer は後から全体を parse せずに絞り込める
+    - ``close()`` はバッファを書き切ってから閉じる (drain-on-close)。close 後に
+      届いた ``record`` (非同期 scheduler の drain タイムアウト後に完了したジョブ
+      など) も捨てず、その場でファイル末尾へ追記する。そのため
+      ``JsonlTraceRecorder.record_dropped_after_close`` に当たるカウンタは持たず、
+      件数は ``records_written_after_close`` で観測する
+
+    payload は ``record`` 時点で deepcopy し、JSON 化は後で writer thread が
+    行う。``record`` に渡した list / dict をその後書き換えても trace には
+    ``record`` 時点の値が残る (``JsonlTraceRecorder`` と同じ)。lock などで
+    deepcopy できない payload はその場で ``default=str`` の JSON 相当へ落とす。
+    JSON 化できない payload は ``default=str`` で文字列化して書き、警告を残す
+    (呼び出し元へは例外を返さない)。
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        compression: Optional[str] = None,
+        batch_size: int = 512,
+        flush_interval_s: float = 0.2,
+        max_pending: int = 65536,
+        index: bool = False,
+    ) -> None:
+        if not isinstance(path, Path):
+            raise TypeError("path must be Path")
+        if index and compression is not None:
+            raise ValueError("index=True requires an uncompressed trace (compression=None)")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if max_pending < batch_size:
+            raise ValueError(
+                f"max_pending must be >= batch_size, got {max_pending} < {batch_size}"
+            )
+        if flush_interval_s <= 0:
+            raise ValueError(f"flush_interval_s must be > 0, got {flush_interval_s}")
+        self._path = path
+        self._compression = compression
+        self._compress_frame = _frame_compressor(compression)
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._max_pending = max_pending
+        self._fh: Optional[BinaryIO] = open(path, "wb")
+        # index 用: 書き終えたバイト数 (= 次に書く行の offset)
+        self._offset = 0
+        self._index_requested = index
+        self._index: Optional[Any] = None
+        if index:
+            from ai_rpg_world.application.trace.index import TraceIndexWriter
+
+            self._index = TraceIndexWriter(path, truncate=True)
+        self._cond = threading.Condition()
+        self._pending: Deque[TraceEvent] = deque()
+        self._seq = 0
+        # writer が書き終えた最大 seq。flush() はこれが目標 seq に届くまで待つ
+        self._written_seq = 0
+        self._closing = False
+        # writer thread が最後のバッチを書き終えて抜けたら True。以降の record は
+        # 呼び出し元 thread でその場で追記する
+        self._writer_done = False
+        self._records_written_after_close = 0
+        self._unserializable_events = 0
+        self._write_errors = 0
+        self._writer = threading.Thread(
+            target=self._run_writer, name="trace-writer", daemon=True
+        )
+        self._writer.start()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def compression(self) -> Optional[str]:
+        return self._compression
+
+    @property
+    def records_written_after_close(self) -> int:
+        """``close()`` 後に届き、呼び出し元 thread で直接追記した件数。"""
+        return self._records_written_after_close
+
+    def record(
+        self,
+        kind: str,
+        *,
+        tick: Optional[int] = None,
+        player_id: Optional[int] = None,
+        **payload: Any,
+    ) -> TraceEvent:
+        # writer が書くまでに呼び出し元が payload 内の list / dict を書き換えても
+        # record 時点の値を残す。deepcopy は lock の外で行う
+        payload = self._snapshot_payload(kind, payload)
+        with self._cond:
+            if self._writer_done:
+                return self._record_after_close_locked(kind, tick, player_id, payload)
+            # close 中 (writer が drain 中) は待たずに積む。writer は空になるまで抜けない
+            while len(self._pending) >= self._max_pending and not self._closing:
+                self._cond.wait()
+            self._seq += 1
+            event = TraceEvent(
+                seq=self._seq,
+                timestamp=_utc_now_iso(),
+                kind=str(kind),
+                tick=tick,
+                player_id=player_id,
+                payload=dict(payload),
+            )
+            self._pending.append(event)
+            if len(self._pending) >= self._batch_size:
+                self._cond.notify_all()
+            return event
+
+    def _snapshot_payload(self, kind: str, payload: dict) -> dict:
+        try:
+            return copy.deepcopy(payload)
+        except Exception:
+            # どのみち str 化して書く値なので、ここで JSON 相当へ落として切り離す
+            self._unserializable_events += 1
+            _logger.warning(
+                "trace event %s has a payload that cannot be copied; "
+                "snapshotting it with str() fallback",
+                kind,
+            )
+            return json.loads(json.dumps(payload, ensure_ascii=False, default=str))
+
+    def _record_after_close_locked(
+        self,
+        kind: str,
+        tick: Optional[int],
+        player_id: Optional[int],
+        payload: dict,
+    ) -> TraceEvent:
+        self._seq += 1
+        event = TraceEvent(
+            seq=self._seq,
+            timestamp=_utc_now_iso(),
+            kind=str(kind),
+            tick=tick,
+            player_id=player_id,
+            payload=dict(payload),
+        )
+        try:
+            lines = self._encode_lines([event])
+            with open(self._path, "ab") as fh:
+                fh.write(self._frame(lines))
+            if self._index_requested:
+                # close 済みの index を開き直して 1 行足し、trace サイズを合わせる
+                from ai_rpg_world.application.trace.index import TraceIndexWriter
+
+                writer = TraceIndexWriter(self._path, truncate=False)
+                try:
+                    self._index_lines(writer, [event], lines)
+                finally:
+                    writer.close()
+        except (OSError, sqlite3.Error):
+            self._write_errors += 1
+            _logger.exception(
+                "AsyncJsonlTraceRecorder failed to append %s after close", kind
+            )
+        else:
+            self._records_written_after_close += 1
+            self._written_seq = event.seq
+        return event
+
+    def flush(self) -> None:
+        """この呼び出しまでに ``record`` されたイベントが書かれるまで待つ。"""
+        with self._cond:
+            target = self._seq
+            self._cond.notify_all()
+            self._cond.wait_for(
+                lambda: self._written_seq >= target or self._writer_done
+            )
+
+    def close(self) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._writer is not threading.current_thread():
+            self._writer.join()
+        with self._cond:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+        if self._records_written_after_close or self._unserializable_events or self._write_errors:
+            _logger.info(
+                "AsyncJsonlTraceRecorder closed: %d records appended after close, "
+                "%d unserializable payloads, %d write errors",
+                self._records_written_after_close,
+                self._unserializable_events,
+                self._write_errors,
+            )
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait(self._flush_interval_s)
+                if not self._pending:
+                    # closing かつ空: ここで抜けると以降の record は直接追記になる
+                    self._writer_done = True
+                    self._cond.notify_all()
+                    return
+                batch: List[TraceEvent] = list(self._pending)
+                self._pending.clear()
+                # バッファ待ちの record を起こす
+                self._cond.notify_all()
+            self._write_batch(batch)
+            with self._cond:
+                self._written_seq = batch[-1].seq
+                self._cond.notify_all()
+
+    def _write_batch(self, batch: List[TraceEvent]) -> None:
+        fh = self._fh
+        if fh is None:
+            return
+        try:
+            lines = self._encode_lines(batch)
+            fh.write(self._frame(lines))
+            fh.flush()
+            if self._index is not None:
+                self._index_lines(self._index, batch, lines)
+        except Exception:
+            # writer thread を止めると record がバッファ上限で詰まるので、
+            # 書けなかったバッチを記録して続ける
+            self._write_errors += 1
+            _logger.exception(
+                "AsyncJsonlTraceRecorder failed to write %d events to %s",
+                len(batch),
+                self._path,
+            )
+
+    def _index_lines(self, writer: Any, batch: List[TraceEvent], lines: List[bytes]) -> None:
+        """書いた行の offset を index に足し、trace サイズで確定する (無圧縮のみ)。"""
+        rows = []
+        for event, line in zip(batch, lines):
+            rows.append(
+                (event.seq, event.kind, event.tick, event.player_id, self._offset, len(line))
+            )
+            self._offset += len(line)
+        writer.add_rows(rows)
+        writer.commit(self._offset)
+
+    def _frame(self, lines: List[bytes]) -> bytes:
+        data = b"".join(lines)
+        if self._compress_frame is not None:
+            data = self._compress_frame(data)
+        return data
+
+    def _encode_lines(self, batch: List[TraceEvent]) -> List[bytes]:
+        lines: List[bytes] = []
+        for event in batch:
+            jsonable = event.to_jsonable()
+            try:
+                line = json.dumps(jsonable, ensure_ascii=False)
+            except (TypeError, ValueError):
+                self._unserializable_events += 1
+                _logger.warning(
+                    "trace event %s (seq=%d) has a non-JSON payload; "
+                    "writing it with str() fallback",
+                    event.kind,
+                    event.seq,
+                )
+                line = json.dumps(jsonable, ensure_ascii=False, default=str)
+            lines.append((line + "\n").encode("utf-8"))
+        return lines
+
+
+def _frame_compressor(compression: Optional[str]) -> Optional[Callable[[bytes], bytes]]:
+    """バッチ 1 つ分を独立したフレームへ圧縮する関数 (無圧縮なら None)。"""
+    if compression is None:
+        return None
+    if compression == TRACE_COMPRESSION_GZIP:
+        return lambda data: gzip.compress(data, compresslevel=6)
+    if compression == TRACE_COMPRESSION_ZSTD:
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ValueError(
+                "compression='zstd' requires the zstandard package"
+            ) from exc
+        return zstandard.ZstdCompressor(level=3).compress
+    raise ValueError(
+        f"compression must be None, {TRACE_COMPRESSION_GZIP!r} or "
+        f"{TRACE_COMPRESSION_ZSTD!r}, got {compression!r}"
+    )
+
+
+def open_trace_text(path: Path) -> TextIO:
+    """trace ファイルをテキストとして開く。gzip / zstd は先頭の magic で判別する。
+
+    拡張子は見ない (``AsyncJsonlTraceRecorder`` の出力名は呼び出し側が決めるため)。
+    """
+    with open(path, "rb") as probe:
+        magic = probe.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic.startswith(_ZSTD_MAGIC):
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ValueError(
+                f"{path} is zstd-compressed; reading it requires the zstandard package"
+            ) from exc
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
 def load_trace_events(path: Path) -> Iterable[TraceEvent]:
-    """JSONL ファイルから TraceEvent を順次返すジェネレータ (viewer 用)。"""
+    """trace ファイルから TraceEvent を順次返すジェネレータ (viewer 用)。
+
+    無圧縮 JSONL と ``AsyncJsonlTraceRecorder`` の gzip / zstd 出力を読む。
+    圧縮 trace の末尾フレームが途中で切れている (run が落ちた) 場合は、
+    そこまでに読めたイベントを返して警告を残す。gzip は ``EOFError``、zstd は
+    ``zstandard.ZstdError`` で切れ目を知らせ、どちらも知らせずに終わった場合は
+    改行で終わらない末尾行が JSON にならないことで分かる。
+    """
     if not isinstance(path, Path):
         raise TypeError("path must be Path")
-    with open(path, "r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            data = json.loads(line)
-            yield TraceEvent.from_jsonable(data)
+    with open_trace_text(path) as fh:
+        try:
+            for raw in fh:
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    if raw.endswith("\n"):
+                        raise
+                    # 最終行の途中で切れている (書きかけのフレーム / 行)
+                    _logger.warning("trace %s ends with a truncated line", path)
+                    return
+                yield TraceEvent.from_jsonable(data)
+        except _truncated_frame_errors():
+            _logger.warning("trace %s ends with a truncated compressed frame", path)
+
+
+def _truncated_frame_errors() -> tuple:
+    """圧縮フレームの途中切れとして扱う例外 (zstandard があれば ZstdError も)。"""
+    try:
+        import zstandard
+    except ImportError:
+        return (EOFError,)
+    return (EOFError, zstandard.ZstdError)
 
 
 def _utc_now_iso() -> str:
@@ -203,8 +581,13 @@ def _utc_now_iso() -> str:
 
 
 __all__ = [
+    "AsyncJsonlTraceRecorder",
     "ITraceRecorder",
     "JsonlTraceRecorder",
     "NullTraceRecorder",
+    "TRACE_COMPRESSION_GZIP",
+    "TRACE_COMPRESSION_SUFFIXES",
+    "TRACE_COMPRESSION_ZSTD",
     "load_trace_events",
+    "open_trace_text",
 ]
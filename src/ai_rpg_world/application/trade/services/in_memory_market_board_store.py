@@ -6,13 +6,21 @@ snapshot に載せるのはそのため。ここが保存・復元されない
 
 板そのものは不変オブジェクトなので、store は「いまの板」と「次に払い出す
 注文 ID」だけを持つ。
+
+注文の期限は共有の timer wheel があればそこへ登録する。板を差し替えるたび
+に前の板と見比べて、増えた注文の期限を置き、約定・取り下げ・引き取り待ちで
+外れた注文の期限を取り消す。期限切れの片付けは、その手番に期限の来た注文
+だけを見ればよくなる。
 """
 
 from __future__ import annotations
 
 import threading
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
+from ai_rpg_world.application.common.services.world_tick_timer_wheel import (
+    WorldTickTimerWheel,
+)
 from ai_rpg_world.domain.trade.aggregate.market_board import MarketBoard, MarketTrade
 from ai_rpg_world.domain.trade.aggregate.market_order import MarketOrder
 from ai_rpg_world.domain.trade.value_object.market_order_id import MarketOrderId
@@ -22,7 +30,16 @@ from ai_rpg_world.domain.world.value_object.spot_id import SpotId
 class InMemoryMarketBoardStore:
     """掲示板 1 つと、その置き場所を保持する。"""
 
-    def __init__(self, *, board_spot_id: Optional[SpotId] = None) -> None:
+    #: 共有 timer wheel 上の channel 名。
+    TIMER_CHANNEL = "market_order"
+
+    def __init__(
+        self,
+        *,
+        board_spot_id: Optional[SpotId] = None,
+        timer_wheel: Optional[WorldTickTimerWheel] = None,
+    ) -> None:
+        self._timer_wheel = timer_wheel
         self._board = MarketBoard.empty()
         self._board_spot_id = board_spot_id
         self._next_id = 1
@@ -48,9 +65,38 @@ class InMemoryMarketBoardStore:
         if not isinstance(board, MarketBoard):
             raise TypeError("board must be MarketBoard")
         with self._lock:
+            previous = self._board
             self._board = board
             for order in board.orders:
                 self._next_id = max(self._next_id, order.order_id.value + 1)
+            if board is not previous:
+                self._sync_deadlines(previous, board)
+
+    def expired_order_ids(self, current_tick: int) -> Optional[Tuple[int, ...]]:
+        """その手番で期限の来た注文 ID。wheel が無ければ None (板を全件見る)。"""
+        if self._timer_wheel is None:
+            return None
+        return tuple(
+            sorted(self._timer_wheel.due_keys(self.TIMER_CHANNEL, current_tick))
+        )
+
+    def next_expiry_tick(self) -> Optional[int]:
+        """次に注文の期限が切れる手番。生きた注文が無ければ None。"""
+        if self._timer_wheel is None:
+            return self.board().next_expiry_tick()
+        return self._timer_wheel.next_due_tick(self.TIMER_CHANNEL)
+
+    def _sync_deadlines(self, previous: MarketBoard, board: MarketBoard) -> None:
+        wheel = self._timer_wheel
+        if wheel is None:
+            return
+        before = _live_deadlines(previous)
+        after = _live_deadlines(board)
+        for order_id in before.keys() - after.keys():
+            wheel.cancel(self.TIMER_CHANNEL, order_id)
+        for order_id, due_tick in after.items():
+            if before.get(order_id) != due_tick:
+                wheel.schedule(self.TIMER_CHANNEL, order_id, due_tick)
 
     def replace_all(
         self,
@@ -65,9 +111,24 @@ class InMemoryMarketBoardStore:
         with self._lock:
             self._board = MarketBoard.empty()
             self._next_id = 1
+            if self._timer_wheel is not None:
+                self._timer_wheel.cancel_channel(self.TIMER_CHANNEL)
             self.save(MarketBoard(
                 orders=tuple(orders), last_trades=tuple(last_trades),
             ))
 
 
+def _live_deadlines(board: MarketBoard) -> Dict[int, int]:
+    """引き取り待ちでない注文の ID → 期限切れになる手番。
+
+    期限の手番ちょうどはまだ生きているので、その次の手番。引き取り待ちは
+    既に一度流れているので、二度目の期限は置かない。
+    """
+    return {
+        order.order_id.value: order.expires_at_tick + 1
+        for order in board.orders
+        if not order.is_awaiting_collection
+    }
+
+
 __all__ = ["InMemoryMarketBoardStore"]
@@ -3,6 +3,10 @@
 提案は**二人の間にある状態**なので、per-Being の記憶ではなく world 状態と
 して持つ。world snapshot に載せるのはそのため。
 
+期限は共有の timer wheel (``WorldTickTimerWheel``) があればそこへ登録し、
+返事がついて外れた提案は取り消す。期限切れの片付けは、その tick に期限の
+来た提案だけを見ればよくなる。wheel が無いときは従来どおり全件を見る。
+
 二重提案を弾くのはこの層の仕事にする。集約は 1 件の提案の中だけを見るので、
 「同じ相手へ既に持ちかけている」「同じ品を別の提案にも出している」は集約
 からは見えない。
@@ -13,6 +17,10 @@ from __future__ import annotations
 import threading
 from typing import Dict, Iterable, Optional, Tuple
 
+from ai_rpg_world.application.common.services.world_tick_timer_wheel import (
+    WorldTickTimerWheel,
+)
+
 from ai_rpg_world.domain.player.value_object.player_id import PlayerId
 from ai_rpg_world.domain.trade.aggregate.pending_trade_offer import (
     PendingTradeOffer,
@@ -24,10 +32,17 @@ from ai_rpg_world.domain.trade.value_object.trade_offer_id import TradeOfferId
 class InMemoryPendingTradeOfferStore:
     """返事待ちの提案を保持する。返事のついた提案は保持しない。"""
 
-    def __init__(self) -> None:
+    #: 共有 timer wheel 上の channel 名。
+    TIMER_CHANNEL = "trade_offer"
+
+    def __init__(self, *, timer_wheel: Optional[WorldTickTimerWheel] = None) -> None:
+        self._timer_wheel = timer_wheel
         self._offers: Dict[int, PendingTradeOffer] = {}
         self._next_id = 1
         self._lock = threading.RLock()
+        # 提案の出入りのたびに進む版。期限切れの stage はこれが変わらない
+        # 限り、次の期限まで眠ってよい。
+        self._revision = 0
 
     def next_offer_id(self) -> TradeOfferId:
         """次に使う提案 ID を払い出す。"""
@@ -44,8 +59,17 @@ class InMemoryPendingTradeOfferStore:
             if offer.is_pending:
                 self._offers[offer.offer_id.value] = offer
                 self._next_id = max(self._next_id, offer.offer_id.value + 1)
+                if self._timer_wheel is not None:
+                    # 期限の tick ちょうどはまだ生きているので、その次の tick
+                    self._timer_wheel.schedule(
+                        self.TIMER_CHANNEL,
+                        offer.offer_id.value,
+                        offer.expires_at_tick + 1,
+                    )
             else:
                 self._offers.pop(offer.offer_id.value, None)
+                self._cancel_timer(offer.offer_id.value)
+            self._revision += 1
 
     def find(self, offer_id: TradeOfferId) -> Optional[PendingTradeOffer]:
         with self._lock:
@@ -96,21 +120,56 @@ class InMemoryPendingTradeOfferStore:
         状態遷移と観測の発火は呼び出し側 (tick stage) の仕事にする。store が
         観測を持つと、保存・復元のたびに「流れた」が二重に届きうる。
         """
-        return tuple(
-            offer for offer in self.list_all() if offer.is_expired_at(current_tick)
-        )
+        if self._timer_wheel is None:
+            return tuple(
+                offer for offer in self.list_all() if offer.is_expired_at(current_tick)
+            )
+        with self._lock:
+            due = self._timer_wheel.due_keys(self.TIMER_CHANNEL, current_tick)
+            offers = (self._offers.get(offer_id) for offer_id in sorted(due))
+            return tuple(
+                offer
+                for offer in offers
+                if offer is not None and offer.is_expired_at(current_tick)
+            )
+
+    @property
+    def revision(self) -> int:
+        """保持している提案が変わるたびに増える値。"""
+        return self._revision
+
+    def next_expiry_tick(self) -> Optional[int]:
+        """最も早く期限切れになる tick。提案が無ければ None。
+
+        期限の tick ちょうどはまだ生きているので、その次の tick を返す。
+        """
+        with self._lock:
+            if self._timer_wheel is not None:
+                return self._timer_wheel.next_due_tick(self.TIMER_CHANNEL)
+            if not self._offers:
+                return None
+            return min(offer.expires_at_tick for offer in self._offers.values()) + 1
 
     def remove(self, offer_id: TradeOfferId) -> None:
         with self._lock:
             self._offers.pop(offer_id.value, None)
+            self._cancel_timer(offer_id.value)
+            self._revision += 1
 
     def replace_all(self, offers: Iterable[PendingTradeOffer]) -> None:
         """snapshot 復元用。保持している提案を丸ごと置き換える。"""
         with self._lock:
             self._offers = {}
             self._next_id = 1
+            self._revision += 1
+            if self._timer_wheel is not None:
+                self._timer_wheel.cancel_channel(self.TIMER_CHANNEL)
             for offer in offers:
                 self.put(offer)
 
+    def _cancel_timer(self, offer_id: int) -> None:
+        if self._timer_wheel is not None:
+            self._timer_wheel.cancel(self.TIMER_CHANNEL, offer_id)
+
 
 __all__ = ["InMemoryPendingTradeOfferStore", "TradeOfferState"]
@@ -18,7 +18,7 @@ t33 に出した注文が t80 まで生きていて、値の付け直しまで
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from ai_rpg_world.domain.common.value_object import WorldTick
 
@@ -26,11 +26,23 @@ logger = logging.getLogger(__name__)
 
 
 class MarketOrderExpiryStage:
-    """毎 tick、期限を過ぎた注文を板から下げる。"""
+    """期限を過ぎた注文を板から下げる (期限の来た手番と板が動いた手番だけ走る)。"""
 
     def __init__(self, *, market_service: Any) -> None:
         self._market = market_service
 
+    def next_due_tick(self, current_tick: int) -> Optional[int]:
+        """次に注文の期限が切れる手番。生きた注文が無ければ None (眠る)。"""
+        next_expiry = getattr(self._market, "next_expiry_tick", None)
+        if not callable(next_expiry):
+            return current_tick + 1
+        return next_expiry()
+
+    def work_revision(self) -> Any:
+        """いまの板。板は不変なので、注文が動けば別の object になる。"""
+        board_of = getattr(self._market, "board", None)
+        return board_of() if callable(board_of) else None
+
     def run(self, current_tick: WorldTick) -> None:
         tick_value = int(getattr(current_tick, "value", current_tick))
         try:
@@ -824,7 +824,9 @@ class MarketService:
     def expire_orders(self, *, current_tick: int) -> Tuple[MarketOrder, ...]:
         """期限を過ぎた注文を板から下げ、預けたものを持ち主へ返す。"""
         board = self._store.board()
-        expired = board.expired_orders(current_tick)
+        expired = self._expired_orders(board, current_tick)
+        if not expired:
+            return expired
         for order in expired:
             if self._return_deposit(order):
                 board = board.cancelled(order.order_id, by=order.owner)
@@ -839,6 +841,33 @@ class MarketService:
 
     # ── 内部 ────────────────────────────────────────────────────────────
 
+    def _expired_orders(
+        self, board: MarketBoard, current_tick: int
+    ) -> Tuple[MarketOrder, ...]:
+        """期限の来た注文。store が期限を wheel で持っていれば、その分だけ見る。"""
+        expired_order_ids = getattr(self._store, "expired_order_ids", None)
+        due_ids = expired_order_ids(current_tick) if callable(expired_order_ids) else None
+        if due_ids is None:
+            return board.expired_orders(current_tick)
+        if not due_ids:
+            return ()
+        by_id = {order.order_id.value: order for order in board.orders}
+        return tuple(
+            order
+            for order in (by_id.get(order_id) for order_id in due_ids)
+            if order is not None
+            and not order.is_awaiting_collection
+            and order.is_expired_at(current_tick)
+        )
+
+    def next_expiry_tick(self) -> Optional[int]:
+        """次に注文の期限が切れる手番。生きた注文が無ければ None。"""
+        next_expiry = getattr(self._store, "next_expiry_tick", None)
+        if callable(next_expiry):
+            return next_expiry()
+        return self._store.board().next_expiry_tick()
+
+
     def _record(self, *, kind: str, item_spec_id: int, **payload: Any) -> None:
         # ``kind`` は recorder 自身の引数名なので、payload では
         # ``market_event`` に置き換える。同名で渡すと record() が TypeError に
@@ -49,6 +49,20 @@ class TradeOfferExpiryStage:
         # 保存・復元やテストのたびに観測経路を引き回すことになる。
         self._observer = expiry_observer
 
+    def next_due_tick(self, current_tick: int) -> Optional[int]:
+        """次に期限切れが起きる tick。提案が無ければ None (眠る)。
+
+        期限を答えられない store なら毎 tick 走らせる。
+        """
+        next_expiry = getattr(self._offers, "next_expiry_tick", None)
+        if not callable(next_expiry):
+            return current_tick + 1
+        return next_expiry()
+
+    def work_revision(self) -> Any:
+        """新しい提案・返事で変わる。変われば期限を待たずに走る。"""
+        return getattr(self._offers, "revision", None)
+
     def run(self, current_tick: WorldTick) -> None:
         tick_value = int(getattr(current_tick, "value", current_tick))
         for offer in self._offers.expired_offers(tick_value):
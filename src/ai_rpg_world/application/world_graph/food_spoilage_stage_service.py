@@ -19,6 +19,16 @@ acquired_at_tick として遅延書き込みする方式を採る:
 - cons: tick 飛び (skip) 中に gather しても古い tick が記録される可能性がある。
   ただし現状の tick driver はサーバ実行中は飛ばないので実害なし
 
+### 期限を timer wheel に置く
+
+共有の timer wheel (``WorldTickTimerWheel``) を渡されたときは、毎 tick 全
+instance を見て回らない。初めて見た instance に「腐る tick」
+(acquired_at_tick + spoils_after_ticks) の期限を置き、以降はその tick に
+期限の来た instance だけを判定する。新しい instance は wheel に載って
+いないので、item repository の顔ぶれが変わった tick (``population_revision``)
+だけ見て回って拾う。顔ぶれの版を答えられない repository なら毎 tick 見て
+回る (判定するのは wheel に載っていない instance だけ)。
+
 ### spoils 判定の純粋性
 
 state[spoiled] を `True` にする以外の副作用は持たない。
@@ -31,8 +41,11 @@ state[spoiled] を `True` にする以外の副作用は持たない。
 from __future__ import annotations
 
 import logging
-from typing import Callable, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
 
+from ai_rpg_world.application.common.services.world_tick_timer_wheel import (
+    WorldTickTimerWheel,
+)
 from ai_rpg_world.domain.common.value_object import WorldTick
 from ai_rpg_world.domain.item.aggregate.item_aggregate import ItemAggregate
 from ai_rpg_world.domain.item.repository.item_repository import ItemRepository
@@ -40,6 +53,7 @@ from ai_rpg_world.domain.item.value_object.item_instance_id import ItemInstanceI
 from ai_rpg_world.domain.item.value_object.item_spec_id import ItemSpecId
 from ai_rpg_world.domain.item.value_object.spoilage import (
     STATE_KEY_ACQUIRED_AT_TICK,
+    STATE_KEY_SPOILED,
     SpoilageAdvanceKind,
 )
 
@@ -68,6 +82,9 @@ class FoodSpoilageStageService:
     (シナリオ起動時に全 spec が出揃う前提)。
     """
 
+    #: 共有 timer wheel 上の channel 名。
+    TIMER_CHANNEL = "food_spoilage"
+
     def __init__(
         self,
         item_repository: ItemRepository,
@@ -76,6 +93,7 @@ class FoodSpoilageStageService:
         spec_name_lookup: Optional[Callable[[ItemSpecId], str]] = None,
         spoiled_callback: Optional[SpoiledCallback] = None,
         spoiled_batch_callback: Optional[SpoiledBatchCallback] = None,
+        timer_wheel: Optional[WorldTickTimerWheel] = None,
     ) -> None:
         """
         Args:
@@ -87,6 +105,8 @@ class FoodSpoilageStageService:
             spoiled_callback: 腐敗が走った instance ごとに 1 度だけ呼ばれる。
                 runtime 側で「[腐敗] 生魚が腐った」のような観測イベントを流すために
                 使う。None なら silent。
+            timer_wheel: 腐る tick を置く共有 wheel。None なら従来どおり毎 tick
+                全 instance を走査する。
         """
         self._item_repository = item_repository
         # tuple of (spec_id, threshold_ticks) として固定化。dict.items() の順序は
@@ -97,6 +117,12 @@ class FoodSpoilageStageService:
         self._spec_name_lookup = spec_name_lookup
         self._spoiled_callback = spoiled_callback
         self._spoiled_batch_callback = spoiled_batch_callback
+        self._timer_wheel = timer_wheel
+        # 最後に見て回ったときの repository の顔ぶれの版
+        self._seen_population: Any = None
+        self._spec_order = {
+            spec_id: index for index, (spec_id, _threshold) in enumerate(self._spoilable)
+        }
 
     def set_spoiled_callback(self, callback: Optional[SpoiledCallback]) -> None:
         """callback を後から差し替える (runtime 構築後の bind 用)。
@@ -129,13 +155,94 @@ class FoodSpoilageStageService:
             return
         # この tick で「新たに spoiled になった」instance を蓄積する。
         batch: List[Tuple[ItemInstanceId, ItemSpecId, str]] = []
-        for spec_id, _threshold in self._spoilable:
-            instances = self._item_repository.find_by_spec_id(spec_id)
-            for inst in instances:
-                self._process_instance(inst, spec_id, current_tick, batch)
+        if self._timer_wheel is None:
+            for spec_id, _threshold in self._spoilable:
+                instances = self._item_repository.find_by_spec_id(spec_id)
+                for inst in instances:
+                    self._process_instance(inst, spec_id, current_tick, batch)
+        else:
+            self._discover_new_instances(current_tick, batch)
+            self._process_due_instances(current_tick, batch)
         if batch and self._spoiled_batch_callback is not None:
             self._spoiled_batch_callback(tuple(batch))
 
+    def next_due_tick(self, current_tick: int) -> Optional[int]:
+        """次に腐る instance の tick。wheel か顔ぶれの版が無ければ毎 tick。"""
+        if self._timer_wheel is None or self._population_revision() is None:
+            return current_tick + 1
+        return self._timer_wheel.next_due_tick(self.TIMER_CHANNEL)
+
+    def work_revision(self) -> Any:
+        """item の顔ぶれの版。変われば新しい instance を拾いに走る。"""
+        return self._population_revision()
+
+    def _population_revision(self) -> Any:
+        revision_of = getattr(self._item_repository, "population_revision", None)
+        return revision_of() if callable(revision_of) else None
+
+    def _discover_new_instances(
+        self,
+        current_tick: WorldTick,
+        batch: List[Tuple[ItemInstanceId, ItemSpecId, str]],
+    ) -> None:
+        revision = self._population_revision()
+        if revision is not None and revision == self._seen_population:
+            return
+        wheel = self._timer_wheel
+        for spec_id, _threshold in self._spoilable:
+            for inst in self._item_repository.find_by_spec_id(spec_id):
+                if wheel.is_scheduled(self.TIMER_CHANNEL, inst.item_instance_id.value):
+                    continue
+                self._process_instance(inst, spec_id, current_tick, batch)
+        self._seen_population = revision
+
+    def _process_due_instances(
+        self,
+        current_tick: WorldTick,
+        batch: List[Tuple[ItemInstanceId, ItemSpecId, str]],
+    ) -> None:
+        wheel = self._timer_wheel
+        due_items = []
+        for key in wheel.due_keys(self.TIMER_CHANNEL, current_tick.value):
+            item = self._item_repository.find_by_id(ItemInstanceId(key))
+            if item is None:
+                # 食べられた・捨てられた instance の期限が残っていた
+                wheel.cancel(self.TIMER_CHANNEL, key)
+                continue
+            due_items.append(item)
+        # 全件走査のときと同じ順 (spec の宣言順 → instance 順) で観測を積む
+        due_items.sort(
+            key=lambda item: (
+                self._spec_order.get(item.item_spec.item_spec_id, len(self._spec_order)),
+                item.item_instance_id.value,
+            )
+        )
+        for item in due_items:
+            self._process_instance(item, item.item_spec.item_spec_id, current_tick, batch)
+
+    def _reschedule(self, item_aggregate: ItemAggregate, current_tick: WorldTick) -> None:
+        """判定後の instance の期限を置き直す (腐った・判定できないなら外す)。"""
+        wheel = self._timer_wheel
+        if wheel is None:
+            return
+        key = item_aggregate.item_instance_id.value
+        threshold = item_aggregate.item_spec.spoils_after_ticks
+        acquired = item_aggregate.state.get(STATE_KEY_ACQUIRED_AT_TICK)
+        if (
+            threshold is None
+            or item_aggregate.state.get(STATE_KEY_SPOILED) is True
+            or not isinstance(acquired, int)
+        ):
+            wheel.cancel(self.TIMER_CHANNEL, key)
+            return
+        # 同じ instance を同じ tick にもう一度判定しない (全件走査と同じく
+        # 早くても次の tick)
+        wheel.schedule(
+            self.TIMER_CHANNEL,
+            key,
+            max(acquired + threshold, current_tick.value + 1),
+        )
+
     def _process_instance(
         self,
         item_aggregate: ItemAggregate,
@@ -144,6 +251,7 @@ class FoodSpoilageStageService:
         batch: Optional[List[Tuple[ItemInstanceId, ItemSpecId, str]]] = None,
     ) -> None:
         result = item_aggregate.advance_spoilage(current_tick)
+        self._reschedule(item_aggregate, current_tick)
         if result.kind is SpoilageAdvanceKind.INVALID_ACQUIRED_AT:
             logger.warning(
                 "Item instance %s has non-int acquired_at_tick=%r (type=%s), "
@@ -39,3 +39,8 @@ class SpotGraphEnvironmentStageService:
         self._weather_state_setter(nxt)
         if self._on_weather_changed is not None:
             self._on_weather_changed(nxt)
+
+    def next_due_tick(self, current_tick: int) -> int:
+        """次に天候を進める tick (``update_interval_ticks`` の次の倍数)。"""
+        interval = self._update_interval_ticks
+        return (current_tick // interval + 1) * interval
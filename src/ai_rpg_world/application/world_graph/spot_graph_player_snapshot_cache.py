@@ -0,0 +1,125 @@
+"""1 ターンの間だけ、player ごとの現在状態 snapshot を使い回す。
+
+``SpotGraphCurrentStateBuilder.build_snapshot`` はグラフ・室内・所持品・市場・
+monster・遠景を全部なめる重い処理で、1 回の prompt 構築の中で
+``DefaultPromptBuilder`` 経由と ``build_llm_context`` 経由の 2 回以上呼ばれて
+いた。同じターン内で世界は動かないので、結果は同じになる。
+
+設計:
+- 効くのは ``scope()`` の中だけ。外で呼ばれたら毎回作り直す (= 導入前と同じ)。
+  世界を書き換えうる経路 (Phase B、HTTP、tick 本体) で古い snapshot を
+  見せないよう、「読むだけ」と分かっている区間に限って使い回す
+- key は ``(player_id, revision)``。世界の mutation event を受けたら
+  ``invalidate`` で revision を進めて全部捨てる。最も外側の scope を抜けた
+  ときも捨てるので、ターンを跨いで残ることはない
+- snapshot は frozen dataclass なので、同じ instance を共有してよい
+- 初回観測の通知 (見えた monster・倒れた人) は snapshot を作った 1 回目に
+  だけ飛ぶ。同じ世界を 2 回見ても「初めて見た」は 1 回なので挙動は同じ
+- Phase A は複数 player を thread 並列で組むため lock で守る。構築自体は
+  lock の外で行い、構築中に revision が進んだら結果を保存しない
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SpotGraphPlayerSnapshotCache:
+    """``(player_id, revision)`` を key にした turn 単位の snapshot cache。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[int, int], Any] = {}
+        self._revision = 0
+        self._scope_depth = 0
+        self._suspended = 0
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """この区間では世界を読むだけだと宣言し、snapshot の使い回しを許す。
+
+        入れ子・複数 thread からの同時利用が可能。最も外側の scope を抜けた
+        時点で中身を捨てる。
+        """
+        with self._lock:
+            self._scope_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._scope_depth -= 1
+                if self._scope_depth == 0:
+                    self._entries.clear()
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """区間中は使い回さない (観測通知を止めて作った snapshot を残さない用)。"""
+        with self._lock:
+            self._suspended += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._suspended -= 1
+
+    def get_or_build(self, player_id: int, build: Callable[[], T]) -> T:
+        """scope 内なら同じ revision の snapshot を返し、無ければ ``build`` する。"""
+        with self._lock:
+            if self._scope_depth == 0 or self._suspended:
+                self._counters["bypassed"] += 1
+                cacheable = False
+            else:
+                cacheable = True
+                revision = self._revision
+                key = (int(player_id), revision)
+                if key in self._entries:
+                    self._counters["hits"] += 1
+                    return self._entries[key]
+                self._counters["misses"] += 1
+        value = build()
+        if cacheable:
+            with self._lock:
+                if (
+                    self._revision == revision
+                    and self._scope_depth > 0
+                    and not self._suspended
+                ):
+                    self._entries[key] = value
+        return value
+
+    def invalidate(self) -> None:
+        """世界が変わった。他人の行も変わりうるので全 player 分をまとめて捨てる。"""
+        with self._lock:
+            self._revision += 1
+            self._entries.clear()
+            self._counters["invalidations"] += 1
+
+    def handle(self, event: Any) -> None:
+        """``PipelineEventPublisher`` の side handler として mutation event を受ける。"""
+        del event
+        self.invalidate()
+
+    def take_counters(self) -> Dict[str, int]:
+        """前回呼び出しからの hits / misses / bypassed / invalidations を返して 0 に戻す。"""
+        with self._lock:
+            counters = dict(self._counters)
+            for name in self._counters:
+                self._counters[name] = 0
+        return counters
+
+
+__all__ = ["SpotGraphPlayerSnapshotCache"]
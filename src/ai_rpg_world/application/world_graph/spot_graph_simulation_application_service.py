@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Optional, Protocol, TYPE_CHECKING
+from contextlib import ExitStack
+from typing import Callable, ContextManager, Optional, Protocol, TYPE_CHECKING
 
 from ai_rpg_world.application.common.exceptions import ApplicationException, SystemErrorException
 from ai_rpg_world.application.common.services.game_time_provider import GameTimeProvider
@@ -11,6 +12,7 @@ from ai_rpg_world.application.world_graph.exceptions import (
     SpotGraphPostTickHookFailedException,
     SpotGraphSimulationException,
 )
+from ai_rpg_world.application.world_graph.spot_graph_tick_scheduler import SpotGraphTickScheduler
 from ai_rpg_world.application.world_graph.spot_graph_travel_stage_service import SpotGraphTravelStageService
 from ai_rpg_world.domain.common.exception import DomainException
 from ai_rpg_world.domain.common.unit_of_work import UnitOfWork
@@ -46,6 +48,7 @@ class SpotGraphSimulationApplicationService:
         trade_offer_expiry_stage: Optional["_SpotGraphTickStage"] = None,
         market_order_expiry_stage: Optional["_SpotGraphTickStage"] = None,
         status_effects_stage: Optional["_SpotGraphTickStage"] = None,
+        tick_state_scope: Optional[Callable[[int], ContextManager[None]]] = None,
         llm_turn_trigger: Optional["ILlmTurnTrigger"] = None,
         heartbeat_emitter: Optional["HeartbeatObservationEmitter"] = None,
         graph_event_flusher: Optional[Callable[[], None]] = None,
@@ -78,6 +81,12 @@ class SpotGraphSimulationApplicationService:
         # 経済統合 Phase 3: 期限を過ぎた板の注文の片付け。
         self._market_order_expiry_stage = market_order_expiry_stage
         self._status_effects_stage = status_effects_stage
+        # tick 内 stage 群を囲む read snapshot / write-behind の区間
+        # (``TickScopedPlayerStatusRepository.tick_scope`` を想定)。UoW より
+        # 先に閉じるので、flush 済みの状態で commit / event 処理に進む。
+        # post_tick_hooks (LLM turn) は区間外なので、tool 実行は従来どおり
+        # 即時反映される。
+        self._tick_state_scope = tick_state_scope
         self._llm_turn_trigger = llm_turn_trigger
         self._heartbeat_emitter = heartbeat_emitter
         # PR-N (task #30): tick stage で graph.add_event された events を
@@ -87,6 +96,30 @@ class SpotGraphSimulationApplicationService:
         # ``self._process_graph_events`` が渡される想定。
         self._graph_event_flusher = graph_event_flusher
         self._logger = logging.getLogger(self.__class__.__name__)
+        # stage は ``next_due_tick`` / ``work_revision`` を宣言していれば
+        # 仕事のある tick だけ走る (宣言の無い stage は従来どおり毎 tick)。
+        # 呼び出し順は下の _tick_impl のまま。
+        self._stage_scheduler = SpotGraphTickScheduler()
+        for name, stage in (
+            ("travel", self._travel_stage),
+            ("scenario_event", self._scenario_event_stage),
+            ("reactive_object_state", self._reactive_object_state_stage),
+            ("reactive_binding", self._reactive_binding_stage),
+            ("sync_action_resolver", self._sync_action_resolver_stage),
+            ("environment", self._environment_stage),
+            ("day_night", self._day_night_stage),
+            ("needs_decay", self._needs_decay_stage),
+            ("status_effects", self._status_effects_stage),
+            ("monster_spawn", self._monster_spawn_stage),
+            ("monster_behavior", self._monster_behavior_stage),
+            ("food_spoilage", self._food_spoilage_stage),
+            ("trade_offer_expiry", self._trade_offer_expiry_stage),
+            ("market_order_expiry", self._market_order_expiry_stage),
+            ("player_outcome_rule", self._player_outcome_rule_stage),
+            ("death_grace", self._death_grace_stage),
+        ):
+            if stage is not None:
+                self._stage_scheduler.register(name, stage)
 
     def tick(self) -> WorldTick:
         """1 ティック進める（UoW 内で時間とスポット間移動を処理し、フックはトランザクション外）。"""
@@ -107,13 +140,20 @@ class SpotGraphSimulationApplicationService:
         """ティック後の heartbeat emitter を注入する（脱出デモなどプレゼン層から）。"""
         self._heartbeat_emitter = emitter
 
+    def take_stage_timings(self) -> dict:
+        """前回の呼び出し以降の stage ごとの実行回数・skip 回数・所要時間 (ms)。"""
+        return self._stage_scheduler.take_stage_timings()
+
     def _tick_impl(self) -> WorldTick:
-        with self._unit_of_work:
+        with self._unit_of_work, ExitStack() as tick_scope:
             current_tick = self._time_provider.advance_tick()
+            if self._tick_state_scope is not None:
+                tick_scope.enter_context(self._tick_state_scope(current_tick.value))
+            self._stage_scheduler.begin_tick(current_tick.value)
             if self._travel_stage is not None:
-                self._travel_stage.run(current_tick)
+                self._stage_scheduler.run("travel", current_tick)
             if self._scenario_event_stage is not None:
-                self._scenario_event_stage.run(current_tick)
+                self._stage_scheduler.run("scenario_event", current_tick)
             if self._reactive_object_state_stage is not None:
                 # Issue #188 Step 3: passage より先に object state を評価する。
                 # 旧順序 (passage → object) では、object state の変化 (例:
@@ -126,43 +166,43 @@ class SpotGraphSimulationApplicationService:
                 # が連動する」挙動になる。
                 # latch mechanism (Step 2) が正規の relay 解法を提供するので、
                 # この順序変更で scenario は依然解ける。
-                self._reactive_object_state_stage.run(current_tick)
+                self._stage_scheduler.run("reactive_object_state", current_tick)
             if self._reactive_binding_stage is not None:
                 # scenario_event の flag 更新 + reactive_object の object state
                 # 更新を同 tick で読みたいので、両者の後に走らせる。
-                self._reactive_binding_stage.run(current_tick)
+                self._stage_scheduler.run("reactive_binding", current_tick)
             if self._sync_action_resolver_stage is not None:
                 # sync group の判定はその tick の prepare（ツール実行で
                 # 既に flag 化されている）を見るため、reactive 反映の
                 # 後で走らせる。完成 / タイムアウトに伴う on_complete /
                 # on_timeout 効果は次ステージ以降に伝搬する。
-                self._sync_action_resolver_stage.run(current_tick)
+                self._stage_scheduler.run("sync_action_resolver", current_tick)
             if self._environment_stage is not None:
-                self._environment_stage.run(current_tick)
+                self._stage_scheduler.run("environment", current_tick)
             if self._day_night_stage is not None:
                 # environment_stage 後に走らせる: 仮に将来「天候が夜だけ強くなる」
                 # のような相互作用が必要になっても、weather → time_of_day の
                 # 順序で組み立てれば一貫した state が得られる。今は両者独立。
-                self._day_night_stage.run(current_tick)
+                self._stage_scheduler.run("day_night", current_tick)
             if self._needs_decay_stage is not None:
-                self._needs_decay_stage.run(current_tick)
+                self._stage_scheduler.run("needs_decay", current_tick)
             if self._status_effects_stage is not None:
                 # PR #2: active status effect の継続適用 + 期限切れ掃除。
                 # needs_decay の後に置いて、空腹からの BLEEDING 発症などの
                 # 連鎖を同 tick 内で処理しやすくする。HP 0 で DEAD outcome
                 # 連鎖は E-3a の handler に任せる (publisher 経由)。
-                self._status_effects_stage.run(current_tick)
+                self._stage_scheduler.run("status_effects", current_tick)
             if self._monster_spawn_stage is not None:
                 # 動的 spawn / despawn 判定。day_night / weather / flag を
                 # 評価し、条件付きスロットを必要に応じてスポーン or デスポーン。
                 # behavior の前に走らせることで「その tick で spawn したモンスター
                 # が同 tick の behavior に乗る」。
-                self._monster_spawn_stage.run(current_tick)
+                self._stage_scheduler.run("monster_spawn", current_tick)
             if self._monster_behavior_stage is not None:
                 # モンスター行動 tick: attack / wander / pack 行動。
                 # needs_decay 後に置くことで「同 tick でモンスターが空腹を
                 # 感じてから行動を決める」順序になる (将来の forage 連動)。
-                self._monster_behavior_stage.run(current_tick)
+                self._stage_scheduler.run("monster_behavior", current_tick)
             if self._food_spoilage_stage is not None:
                 # Phase D-2: 食料腐敗判定。pure な item state mutation で
                 # tick 内の他 stage と依存しないが、観測 callback を持つ可能性
@@ -170,32 +210,32 @@ class SpotGraphSimulationApplicationService:
                 # 順序は他 stage 後で OK: 同 tick で gather → spoilage 判定 されても
                 # acquired_at_tick が今回 tick で初期化されるだけで、閾値到達は
                 # 次回以降。
-                self._food_spoilage_stage.run(current_tick)
+                self._stage_scheduler.run("food_spoilage", current_tick)
             if self._trade_offer_expiry_stage is not None:
                 # 返事のないまま期限を過ぎた取引を片付ける。**その tick の
                 # 世界変化がすべて終わった後**に判定する: エージェントの手番は
                 # post_tick_hooks で走るので、同 tick に承諾された提案は既に
                 # store から消えており、消えたものを期限切れにする誤りが
                 # 起きない。
-                self._trade_offer_expiry_stage.run(current_tick)
+                self._stage_scheduler.run("trade_offer_expiry", current_tick)
             if self._market_order_expiry_stage is not None:
                 # 板の注文も同じ理由で、その tick の変化が終わった後に片付ける。
                 # 提案の片付けと並べておくのは、**期限は 1 か所にまとまって
                 # いる方が、次に足す人が忘れにくい**ため。
-                self._market_order_expiry_stage.run(current_tick)
+                self._stage_scheduler.run("market_order_expiry", current_tick)
             if self._player_outcome_rule_stage is not None:
                 # プレイヤー個別 outcome の宣言規則を判定する。
                 # 当 tick の travel / interaction が反映された後に走らせる
                 # ことで、「同 tick で summit に着いた → そのまま救助される」
                 # の自然な流れを実現する。DEAD は別経路 (PlayerDownedEvent
                 # ハンドラ) で確定するので、こちらは時間ベースの判定のみ。
-                self._player_outcome_rule_stage.run(current_tick)
+                self._stage_scheduler.run("player_outcome_rule", current_tick)
             if self._death_grace_stage is not None:
                 # Issue #621: ダウン後 30 tick 経過した player を DEAD 確定。
                 # player_outcome_rule_stage の **後** に置くことで、同 tick で
                 # RESCUED 確定した player に対する DEAD 上書きを set_outcome
                 # の冪等で防ぐ (= 順序が逆だと DEAD → RESCUED 試行で no-op)。
-                self._death_grace_stage.run(current_tick)
+                self._stage_scheduler.run("death_grace", current_tick)
         self._run_post_tick_hooks(current_tick)
         return current_tick
 
@@ -266,4 +306,6 @@ __all__ = ["SpotGraphSimulationApplicationService"]
 
 
 class _SpotGraphTickStage(Protocol):
+    # 任意で ``next_due_tick(current_tick: int) -> Optional[int]`` と
+    # ``work_revision()`` を持てる (spot_graph_tick_scheduler 参照)。
     def run(self, current_tick: WorldTick) -> None: ...
@@ -0,0 +1,158 @@
+"""tick stage を「やることがある tick」だけ走らせる scheduler。
+
+長い run では、ほとんどの tick でほとんどの stage が何もしない (天候は 6 tick
+おき、取引の期限は数十 tick 先、倒れている人はたいてい居ない)。それでも
+``_tick_impl`` は毎 tick 全 stage を呼び、各 stage が全件を走査して「今は
+何も無い」を確かめていた。
+
+stage は任意で次の 2 つを宣言できる。どちらも持たない stage は従来どおり
+毎 tick 走る (宣言が無いことを「いつでも仕事があるかもしれない」と読む)。
+
+- ``next_due_tick(current_tick) -> Optional[int]``: 今の入力のままなら次に
+  仕事が生じる最も早い tick。``None`` は「入力が変わるまで仕事は無い」。
+  stage を走らせた直後に 1 度だけ問い合わせて覚えておく
+- ``work_revision() -> Hashable``: 入力 (store の中身など) が変わると
+  変わる安価な値。前回問い合わせたときから変わっていたら、期限を待たずに
+  走らせる。新しい提案や新しいダウンは、これで次の tick から拾われる
+
+scheduler が「走らせない」と決めてよいのは、**前回の実行以降に入力が
+変わっておらず、期限もまだ来ていない**ときだけ。迷ったら走らせる側に倒す:
+余計な実行は遅いだけだが、抜けた実行は期限切れが来ない世界になる。
+
+tick が連続していない (snapshot 復元で巻き戻った・飛んだ) ときは、覚えて
+いる期限がもう当てにならないので全 stage を走らせ直す。
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Hashable, Optional
+
+_UNSET: Any = object()
+
+
+class _StageState:
+    """1 stage 分の期限・入力の版・計測値。"""
+
+    __slots__ = ("stage", "due_tick", "revision", "runs", "skipped", "elapsed")
+
+    def __init__(self, stage: Any) -> None:
+        self.stage = stage
+        # None = 次の入力変化まで眠る。登録直後は必ず 1 度走らせる。
+        self.due_tick: Optional[int] = 0
+        self.revision: Hashable = _UNSET
+        self.runs = 0
+        self.skipped = 0
+        self.elapsed = 0.0
+
+
+def _declares_schedule(stage: Any) -> bool:
+    # class に定義されたものだけを宣言とみなす。Mock などが属性アクセスで
+    # 生やす ``next_due_tick`` を宣言と取り違えて stage を眠らせないため。
+    return callable(getattr(type(stage), "next_due_tick", None))
+
+
+def _same_revision(previous: Hashable, current: Hashable) -> bool:
+    if previous is current:
+        return True
+    try:
+        return bool(previous == current)
+    except Exception:  # noqa: BLE001  比較できない値は「変わった」とみなす
+        return False
+
+
+class SpotGraphTickScheduler:
+    """stage ごとの次回期限を持ち、期限の来た stage だけを走らせる。"""
+
+    def __init__(self) -> None:
+        # stage は高々 20 程度なので、期限は stage ごとに持って毎 tick 比べる
+        # (heap を組むより安い)。
+        self._states: Dict[str, _StageState] = {}
+        self._last_tick: Optional[int] = None
+
+    def register(self, name: str, stage: Any) -> None:
+        """stage を名前付きで登録する。同名の再登録は置き換え。"""
+        if not isinstance(name, str) or not name:
+            raise ValueError("name must be a non-empty str")
+        self._states[name] = _StageState(stage)
+
+    def wake_all(self) -> None:
+        """覚えている期限を捨て、次の tick で全 stage を走らせる。"""
+        for state in self._states.values():
+            state.due_tick = 0
+            state.revision = _UNSET
+
+    def begin_tick(self, tick: int) -> None:
+        """tick の頭で呼ぶ。tick が連続していなければ全 stage を起こす。"""
+        if self._last_tick is not None and tick != self._last_tick + 1:
+            self.wake_all()
+        self._last_tick = tick
+
+    def run(self, name: str, current_tick: Any) -> bool:
+        """期限が来ていれば stage を走らせる。走らせたら True。
+
+        ``current_tick`` は stage にそのまま渡す (``WorldTick``)。登録されて
+        いない名前は呼び出し側の誤りなので ``KeyError`` にする。
+        """
+        state = self._states[name]
+        tick = int(getattr(current_tick, "value", current_tick))
+        if not self._is_due(state, tick):
+            state.skipped += 1
+            return False
+        started = time.perf_counter()
+        try:
+            state.stage.run(current_tick)
+        finally:
+            state.elapsed += time.perf_counter() - started
+            state.runs += 1
+        self._reschedule(state, tick)
+        return True
+
+    def take_stage_timings(self) -> Dict[str, Dict[str, Any]]:
+        """前回の呼び出し以降の stage ごとの実行回数・skip 回数・所要時間。
+
+        一度も呼ばれていない stage は含めない。返したぶんはリセットする。
+        """
+        timings: Dict[str, Dict[str, Any]] = {}
+        for name, state in self._states.items():
+            if not (state.runs or state.skipped):
+                continue
+            timings[name] = {
+                "runs": state.runs,
+                "skipped": state.skipped,
+                "elapsed_ms": round(state.elapsed * 1000.0, 3),
+            }
+            state.runs = 0
+            state.skipped = 0
+            state.elapsed = 0.0
+        return timings
+
+    def due_tick_of(self, name: str) -> Optional[int]:
+        """stage の現在の次回期限 (テスト・診断用)。"""
+        return self._states[name].due_tick
+
+    def _is_due(self, state: _StageState, tick: int) -> bool:
+        stage = state.stage
+        if not _declares_schedule(stage):
+            return True
+        if state.due_tick is not None and state.due_tick <= tick:
+            return True
+        revision_of = getattr(stage, "work_revision", None)
+        if callable(revision_of):
+            return not _same_revision(state.revision, revision_of())
+        return False
+
+    def _reschedule(self, state: _StageState, tick: int) -> None:
+        stage = state.stage
+        if not _declares_schedule(stage):
+            return
+        revision_of = getattr(stage, "work_revision", None)
+        state.revision = revision_of() if callable(revision_of) else _UNSET
+        due = stage.next_due_tick(tick)
+        if due is not None:
+            # 過去や同じ tick を返されても次の tick より前には戻さない
+            due = max(int(due), tick + 1)
+        state.due_tick = due
+
+
+__all__ = ["SpotGraphTickScheduler"]
@@ -54,7 +54,8 @@ class WorldRuntimeQueryAdapter:
         self, query: GetPlayerCurrentStateQuery
     ) -> Optional[PlayerCurrentStateDto]:
         pid = PlayerId(query.player_id)
-        snap = self._runtime._state_builder.build_snapshot(int(pid))
+        # build_full_prompt の scope 内なら build_llm_context と同じ snapshot を共有する
+        snap = self._runtime._build_player_snapshot(pid)
         if snap is None:
             return None
         return self._runtime._build_minimal_player_state_dto(pid, snap)
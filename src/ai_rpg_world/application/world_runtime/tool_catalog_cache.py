@@ -0,0 +1,110 @@
+"""LLM に見せる tool 定義を、露出状態ごとに 1 度だけ組んで使い回す。
+
+``WorldRuntime.get_tool_definitions`` は 1 ターンに 3 回以上 (prompt の tool
+名一覧・Phase A の tools payload・Phase B の露出判定) 呼ばれ、そのたびに全
+spot tool の schema 変換・フェーズ振り分け・並べ替えをやり直していた。
+結果を決めるのは次の少数の状態だけなので、それを key にする:
+
+- tool_schema_mode (legacy / reason_first)
+- 会議中か / 本人が投票済みか / 本人が幽霊か
+- run 単位の露出設定 (TODO 系・expected_result・goal_update・記憶系ツールの
+  config と実行器の有無・``ToolExposure``)
+
+entry は DTO に加えて、OpenAI tools 形式の payload とその JSON bytes を
+遅延で 1 度だけ作って持つ。同じ露出状態のターンは **同じ payload object**
+を provider に渡すので、tool block はターン間で byte 単位で一致し、
+provider 側の prefix cache (``cached_tokens``) に乗りやすい。payload は
+共有物なので、呼び出し側は中身を書き換えないこと (並べ替え・絞り込みは
+新しい list を作る)。
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ai_rpg_world.application.llm.contracts.dtos import ToolDefinitionDto
+from ai_rpg_world.application.llm.services.world_llm_turn.escape_tools import (
+    filter_definitions_for_escape_llm,
+)
+
+
+class ToolCatalogEntry:
+    """1 つの露出状態に対する tool 定義と、その送信用表現。"""
+
+    def __init__(
+        self, definitions: Tuple[ToolDefinitionDto, ...], *, pinned: Tuple[Any, ...] = ()
+    ) -> None:
+        self.definitions = definitions
+        # key に id() で入れた object を生かしておき、id の再利用で別物と
+        # 取り違えないようにする。
+        self._pinned = pinned
+        self._payload: Optional[List[Dict[str, Any]]] = None
+        self._payload_json: Optional[bytes] = None
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(definition.name for definition in self.definitions)
+
+    @property
+    def payload(self) -> List[Dict[str, Any]]:
+        """LLM API に渡す OpenAI tools 形式 (脱出ランタイムの除外 tool を除く)。"""
+        payload = self._payload
+        if payload is None:
+            payload = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": definition.name,
+                        "description": definition.description,
+                        "parameters": definition.parameters,
+                    },
+                }
+                for definition in filter_definitions_for_escape_llm(self.definitions)
+            ]
+            self._payload = payload
+        return payload
+
+    @property
+    def payload_json(self) -> bytes:
+        """``payload`` の JSON (UTF-8)。同じ entry なら常に同じ bytes。"""
+        encoded = self._payload_json
+        if encoded is None:
+            encoded = json.dumps(self.payload, ensure_ascii=False).encode("utf-8")
+            self._payload_json = encoded
+        return encoded
+
+
+class ToolCatalogCache:
+    """露出状態の key → ``ToolCatalogEntry``。thread safe。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, ToolCatalogEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self, key: Hashable, build: Callable[[], ToolCatalogEntry]
+    ) -> ToolCatalogEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            self.misses += 1
+        # 構築中の例外 (記憶系ツールの設定不整合など) はそのまま呼び出し側へ
+        entry = build()
+        with self._lock:
+            return self._entries.setdefault(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["ToolCatalogCache", "ToolCatalogEntry"]
@@ -17,7 +17,7 @@ import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, ClassVar, ContextManager, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +95,9 @@ from ai_rpg_world.application.world_graph.spot_graph_day_night_stage_service imp
 from ai_rpg_world.application.world_graph.spot_graph_needs_decay_stage_service import (
     SpotGraphNeedsDecayStageService,
 )
+from ai_rpg_world.application.common.services.world_tick_timer_wheel import (
+    WorldTickTimerWheel,
+)
 from ai_rpg_world.application.trade.services.in_memory_market_board_store import (
     InMemoryMarketBoardStore,
 )
@@ -180,6 +183,10 @@ from ai_rpg_world.application.world_graph.spot_graph_current_state_builder impor
 )
 from ai_rpg_world.application.world_graph.spot_graph_current_state_dtos import (
     SpotGraphInventoryItemEntry,
+    SpotGraphPlayerSnapshotDto,
+)
+from ai_rpg_world.application.world_graph.spot_graph_player_snapshot_cache import (
+    SpotGraphPlayerSnapshotCache,
 )
 from ai_rpg_world.application.world_graph.distant_view_service import (
     DistantViewArea,
@@ -256,6 +263,7 @@ from ai_rpg_world.application.llm.services.prediction_context_ledger import (
 )
 from ai_rpg_world.application.llm.services.context_format_strategy import (
     SectionBasedContextFormatStrategy,
+    build_section_format_strategy,
 )
 from ai_rpg_world.application.llm.services.recent_events_formatter import DefaultRecentEventsFormatter
 from ai_rpg_world.application.llm.services.in_memory_todo_store import InMemoryTodoStore
@@ -302,6 +310,10 @@ from ai_rpg_world.application.speech.services.player_speech_service import (
 )
 from ai_rpg_world.application.trace import TraceEventKind
 from ai_rpg_world.application.world_runtime.pipeline_event_publisher import PipelineEventPublisher
+from ai_rpg_world.application.world_runtime.tool_catalog_cache import (
+    ToolCatalogCache,
+    ToolCatalogEntry,
+)
 from ai_rpg_world.domain.player.enum.player_enum import SpeechChannel
 
 from ai_rpg_world.infrastructure.repository.in_memory_data_store import InMemoryDataStore
@@ -318,6 +330,9 @@ from ai_rpg_world.infrastructure.repository.in_memory_skill_loadout_repository i
 from ai_rpg_world.infrastructure.repository.in_memory_item_spec_repository import InMemoryItemSpecRepository
 from ai_rpg_world.infrastructure.repository.in_memory_player_inventory_repository import InMemoryPlayerInventoryRepository
 from ai_rpg_world.infrastructure.repository.in_memory_player_status_repository import InMemoryPlayerStatusRepository
+from ai_rpg_world.infrastructure.repository.tick_scoped_player_status_repository import (
+    TickScopedPlayerStatusRepository,
+)
 from ai_rpg_world.infrastructure.repository.in_memory_spot_graph_repository import InMemorySpotGraphRepository
 from ai_rpg_world.infrastructure.repository.in_memory_spot_interior_repository import InMemorySpotInteriorRepository
 
@@ -499,7 +514,7 @@ class WorldRuntime:
     scenario: ScenarioLoadResult
     _spot_graph_repo: InMemorySpotGraphRepository
     _spot_interior_repo: InMemorySpotInteriorRepository
-    _player_status_repo: InMemoryPlayerStatusRepository
+    _player_status_repo: TickScopedPlayerStatusRepository
     _player_life_query: PlayerLifeQuery
     _player_perception_policy: "PlayerPerceptionPolicy"
     _fallen_body_registry: "FallenBodyRegistry"
@@ -592,6 +607,12 @@ class WorldRuntime:
     _interaction_cooldown_store: "InteractionCooldownStore" = field(
         default_factory=lambda: _new_interaction_cooldown_store(), repr=False
     )
+    # 取引の提案・板の注文・食料の腐敗の期限を置く共有 timer wheel。
+    # 期限切れの片付けはその tick に期限の来た分だけを見る。期限は world
+    # snapshot に載る (TimerWheelSubsystemCodec)。
+    _timer_wheel: WorldTickTimerWheel = field(
+        default_factory=WorldTickTimerWheel, repr=False
+    )
     # 会議機構を使うシナリオか (scenario の `meeting` block 由来)。
     # False なら招集・投票の tool を出さず、runtime のメソッドも拒否する。
     # 宣言していない世界のプロンプトを 1 バイトも変えないための切り分け。
@@ -671,6 +692,15 @@ class WorldRuntime:
         default_factory=dict, repr=False
     )
     _cumulative_meeting_ticks: int = field(default=0, repr=False)
+    # prompt 構築 1 回の中で同じ player の snapshot を何度も作らないための
+    # turn 単位 cache。効くのは player_snapshot_scope() の中だけ。
+    _player_snapshot_cache: SpotGraphPlayerSnapshotCache = field(
+        default_factory=SpotGraphPlayerSnapshotCache, repr=False
+    )
+    # 露出状態ごとの tool 定義 + 送信用 payload (get_tool_catalog)。
+    _tool_catalog_cache: ToolCatalogCache = field(
+        default_factory=ToolCatalogCache, repr=False
+    )
     # B-4: LLM に提示するツールセットの mode。``True`` (既定) なら TODO 系も
     # 含む従来構成、``False`` なら純スポットグラフ + speech のみ。
     # Issue #155 (TODO 設計の再評価) の判断材料を取るための比較実験用。
@@ -833,8 +863,28 @@ class WorldRuntime:
                 self._flush_pending_food_spoiled()
         self._maybe_close_meeting_on_timeout(tick.value)
         self._record_world_spatial_metrics(tick.value)
+        self._record_player_snapshot_cache_metrics(tick.value)
+        self._record_tick_stage_timings(tick.value)
+        # group commit 有効時、tick 中に溜めた記憶書き込みを tick 境界で確定する
+        self._flush_memory_write_behind()
         return tick.value
 
+    def _flush_memory_write_behind(self) -> None:
+        """episode store が group commit で遅らせている COMMIT を今すぐ行う。
+
+        ``SUBJECTIVE_EPISODE_GROUP_COMMIT_MS`` 未設定 (store が ``flush`` を
+        持たない / in-memory) なら何もしない。flush の失敗は tick を止めず、
+        warning に残す (次の書き込みか shutdown で再度 commit を試みる)。
+        """
+        store = getattr(self._episodic_stack, "episode_store", None)
+        flush = getattr(store, "flush", None)
+        if not callable(flush):
+            return
+        try:
+            flush()
+        except Exception:
+            logger.warning("episodic memory write-behind flush failed", exc_info=True)
+
     def _record_world_spatial_metrics(self, tick: int) -> None:
         """全区画の在室数と各人の累積移動 tick を一つの trace に残す。"""
         recorder = self._trace_recorder
@@ -872,6 +922,37 @@ class WorldRuntime:
             },
         )
 
+    def _record_player_snapshot_cache_metrics(self, tick: int) -> None:
+        """この tick の snapshot cache の hit / miss を trace に残す。"""
+        counters = self._player_snapshot_cache.take_counters()
+        recorder = self._trace_recorder
+        if recorder is None:
+            return
+        if not (counters["hits"] or counters["misses"] or counters["bypassed"]):
+            return
+        from ai_rpg_world.application.trace.events import TraceEventKind
+
+        recorder.record(TraceEventKind.PLAYER_SNAPSHOT_CACHE, tick=tick, **counters)
+
+    def _record_tick_stage_timings(self, tick: int) -> None:
+        """この tick の stage ごとの実行 / skip と所要時間を trace に残す。"""
+        take = getattr(self._simulation_service, "take_stage_timings", None)
+        if not callable(take):
+            return
+        stages = take()
+        recorder = self._trace_recorder
+        if recorder is None or not stages:
+            return
+        from ai_rpg_world.application.trace.events import TraceEventKind
+
+        recorder.record(
+            TraceEventKind.TICK_STAGE_TIMINGS,
+            tick=tick,
+            stages=stages,
+            skipped_count=sum(entry["skipped"] for entry in stages.values()),
+            elapsed_ms=round(sum(entry["elapsed_ms"] for entry in stages.values()), 3),
+        )
+
     def _maybe_close_meeting_on_timeout(self, tick: int) -> None:
         """沈黙上限 / tick 上限に達した会議を閉じる。
 
@@ -927,17 +1008,35 @@ class WorldRuntime:
 
         本メソッドは複数回呼ばれても安全 (scheduler 側でも is_shutdown flag を
         持つ)。``timeout=None`` (既定) は完了まで無期限待機。
+
+        straggler 耐性 wave の持ち越し Phase A は世界に適用せず破棄する
+        (trigger が ``shutdown`` を持つ場合のみ)。
         """
+        trigger_shutdown = getattr(
+            getattr(self, "_llm_turn_trigger", None), "shutdown", None
+        )
+        if callable(trigger_shutdown):
+            try:
+                trigger_shutdown()
+            except Exception:
+                logger.exception("llm turn trigger shutdown failed")
         stack = self._episodic_stack
         if stack is None:
             return
         scheduler = stack.subjective_completion_scheduler
-        if scheduler is None:
-            return
-        try:
-            scheduler.shutdown(timeout=timeout)
-        except Exception:
-            logger.exception("episodic subjective scheduler shutdown failed")
+        if scheduler is not None:
+            try:
+                scheduler.shutdown(timeout=timeout)
+            except Exception:
+                logger.exception("episodic subjective scheduler shutdown failed")
+        # scheduler が drain 中に書いた分も含めて group commit を確定する
+        self._flush_memory_write_behind()
+        metrics_fn = getattr(
+            getattr(stack, "episode_store", None), "group_commit_metrics", None
+        )
+        metrics = metrics_fn() if callable(metrics_fn) else None
+        if metrics is not None:
+            logger.info("episodic memory group commit: %s", metrics.to_dict())
 
     def set_tool_call_loop_guard(self, guard: Any) -> None:
         """``ToolCallLoopGuardService`` を後から注入する。
@@ -960,6 +1059,8 @@ class WorldRuntime:
         プレゼン層の ``_WorldLlmWiring`` など、実際に LLM を起動するトリガに
         切り替える。単体デモの既定は :class:`WorldStandaloneNoopLlmTurnTrigger`。
         """
+        # shutdown で wave 経路の持ち越しを止めるために参照を残す。
+        self._llm_turn_trigger = trigger
         self._simulation_service.set_llm_turn_trigger(trigger)
 
     def set_simulation_heartbeat_emitter(
@@ -1064,9 +1165,27 @@ class WorldRuntime:
 
     # ── 実 LLM パイプラインによる観測構築 ──
 
+    def player_snapshot_scope(self) -> ContextManager[None]:
+        """この区間は世界を読むだけ、と宣言して player snapshot を使い回す。
+
+        Phase A の prompt 構築 (``WorldAccessGate.snapshot`` の中) と
+        ``build_full_prompt`` が開く。区間外の ``build_llm_context`` 等は
+        従来どおり毎回 snapshot を作り直す。
+        """
+        return self._player_snapshot_cache.scope()
+
+    def _build_player_snapshot(
+        self, player_id: PlayerId
+    ) -> Optional[SpotGraphPlayerSnapshotDto]:
+        """``build_snapshot`` を turn 単位 cache 越しに呼ぶ。"""
+        pid = int(player_id)
+        return self._player_snapshot_cache.get_or_build(
+            pid, lambda: self._state_builder.build_snapshot(pid)
+        )
+
     def build_llm_context(self, player_id: PlayerId) -> LlmUiContextDto:
         """実際のフォーマッタ + UiContextBuilder を通した LLM 向けコンテキストを構築する。"""
-        snap = self._state_builder.build_snapshot(int(player_id))
+        snap = self._build_player_snapshot(player_id)
         if snap is None:
             return LlmUiContextDto(
                 current_state_text="(このプレイヤーはまだグラフ上に配置されていません)",
@@ -1155,7 +1274,9 @@ class WorldRuntime:
         failures: list[str] = []
         # build_snapshot は通常、初めて見た monster や倒れた人を通知する。
         # 読み取り専用の起動時検査で「一度きり」の観測を先に消費しない。
-        with self._state_builder.suppress_observation_notifications():
+        with self._state_builder.suppress_observation_notifications(), (
+            self._player_snapshot_cache.suspended()
+        ):
             for status in self._player_status_repo.find_all():
                 player_id = status.player_id
                 result = self.build_llm_context(player_id)
@@ -1475,6 +1596,31 @@ class WorldRuntime:
         許すと、本人固有の状態を運び忘れても全体向けへ黙って縮退するため、
         ちょうど一方だけを必須にする。
         """
+        return list(
+            self.get_tool_catalog(
+                tool_schema_mode=tool_schema_mode,
+                as_meeting_phase=as_meeting_phase,
+                player_id=player_id,
+                for_every_player=for_every_player,
+            ).definitions
+        )
+
+    def get_tool_catalog(
+        self,
+        *,
+        tool_schema_mode: str = "legacy",
+        as_meeting_phase: Optional[bool] = None,
+        player_id: Optional[PlayerId] = None,
+        for_every_player: bool = False,
+    ) -> ToolCatalogEntry:
+        """``get_tool_definitions`` と同じ定義を、露出状態ごとの cache 越しに返す。
+
+        key は (schema mode, 会議中か, 投票済みか, 幽霊か, run 単位の露出
+        設定)。同じ key の呼び出しは同じ entry (= 同じ DTO・同じ OpenAI
+        payload・同じ JSON bytes) を返すので、tool block はターン間で byte
+        単位で揃う。引数の検査と記憶系ツールの fail-fast は cache の前に
+        毎回行う (初回に通った設定しか cache に載らない)。
+        """
         audience_count = int(player_id is not None) + int(for_every_player)
         if audience_count != 1:
             raise ValueError(
@@ -1483,29 +1629,92 @@ class WorldRuntime:
             )
         if tool_schema_mode not in {"legacy", "reason_first"}:
             raise ValueError("tool_schema_mode must be 'legacy' or 'reason_first'")
-        spot = self._build_spot_tool_definitions(tool_schema_mode)
         in_meeting = (
             self._game_phase_store.is_meeting()
             if as_meeting_phase is None
             else bool(as_meeting_phase)
         )
+        voting_completed = (
+            player_id is not None
+            and in_meeting
+            and self._game_phase_store.has_voted(player_id)
+        )
+        departed = bool(
+            player_id is not None
+            and self._player_perception_policy.is_departed(player_id)
+        )
+        exposure = self.tool_exposure
+        key = (
+            tool_schema_mode,
+            in_meeting,
+            voting_completed,
+            departed,
+            id(exposure),
+            self._tool_catalog_feature_flags(),
+        )
+        return self._tool_catalog_cache.get_or_build(
+            key,
+            lambda: ToolCatalogEntry(
+                tuple(
+                    self._build_tool_definitions(
+                        tool_schema_mode,
+                        in_meeting=in_meeting,
+                        voting_completed=voting_completed,
+                        departed=departed,
+                    )
+                ),
+                pinned=(exposure,),
+            ),
+        )
+
+    def _tool_catalog_feature_flags(self) -> Tuple[Any, ...]:
+        """tool 定義を変えうる run 単位の設定を 1 つの tuple にまとめる。
+
+        記憶系ツールは config と実行器の両方で決まるので、実行器の有無も
+        key に入れる (auxiliary stack を後から wire しても古い定義を返さない)。
+        """
+        memory: Tuple[Any, ...] = ()
+        if self._include_todo_tools:
+            if self._episodic_stack is not None:
+                self._wire_auxiliary_tool_stack()
+            cfg = self._runtime_config
+            memory = (
+                bool(getattr(cfg, "memo_tools_enabled", True)),
+                bool(getattr(cfg, "episodic_recall_enabled", False)),
+                self._memory_recall_tool_executor is not None,
+                bool(getattr(cfg, "episodic_explore_related_enabled", False)),
+                self._memory_explore_related_tool_executor is not None,
+                bool(getattr(cfg, "semantic_search_enabled", False)),
+                self._semantic_memory_search_tool_executor is not None,
+                self._memory_recall_by_handle_tool_executor is not None,
+            )
+        return (
+            self._include_todo_tools,
+            self._expected_result_policy,
+            self._goal_revision_enabled,
+            memory,
+        )
+
+    def _build_tool_definitions(
+        self,
+        tool_schema_mode: str,
+        *,
+        in_meeting: bool,
+        voting_completed: bool,
+        departed: bool,
+    ) -> List[ToolDefinitionDto]:
+        """露出状態が決まった後の、tool 定義の組み立て本体 (cache miss 時だけ走る)。"""
+        spot = self._build_spot_tool_definitions(tool_schema_mode)
         # 2 つの問いを両方通す入口を使う。片方だけ呼ぶと無効化が効かない。
         by_name = {d.name: d for d in spot}
         common_names, phase_names = self.tool_exposure.split_for_phase(
             by_name.keys(),
             in_meeting=in_meeting,
-            voting_completed=(
-                player_id is not None
-                and in_meeting
-                and self._game_phase_store.has_voted(player_id)
-            ),
+            voting_completed=voting_completed,
         )
         common_spot = [by_name[n] for n in common_names]
         phase_spot = [by_name[n] for n in phase_names]
-        if (
-            player_id is not None
-            and self._player_perception_policy.is_departed(player_id)
-        ):
+        if departed:
             departed_tool_names = frozenset(
                 {
                     TOOL_NAME_SPEECH,
@@ -2729,6 +2938,12 @@ class WorldRuntime:
         DefaultPromptBuilder と同じ messages 配列形式に統一 (経路統一の最終仕上げ)。
         旧 shape を期待する caller は messages[0]["content"] / messages[1]["content"]
         への参照に書き換える必要がある。
+
+        ``PROMPT_SECTION_ORDER=prefix_stable`` では安定 section 群が独立した
+        user message になり、messages は system + user 2 件になり得る。指示文は
+        常に最後の user message (``messages[-1]``) の末尾にある。
+        ``prompt_sections`` は provider へ渡る順の section 別文字数
+        (``PROMPT_CACHE_SECTIONS`` の割り振り用)。
         """
         self._wire_auxiliary_tool_stack()
         # observation buffer の drain は DefaultPromptBuilder.build() 内で行われる
@@ -2751,22 +2966,22 @@ class WorldRuntime:
         acting = self._acting_being_for(player_id)
         if acting is None:
             raise RuntimeError("Being is not attached to this player.")
-        result = builder.build(acting, action_instruction=action_instruction)
-
-        # tool_runtime_context は world_runtime 独自の build_llm_context 経由で取得
-        ctx = self.build_llm_context(player_id)
+        # builder の world query と build_llm_context は同じ snapshot を読む
+        with self.player_snapshot_scope():
+            result = builder.build(acting, action_instruction=action_instruction)
+            # tool_runtime_context は world_runtime 独自の build_llm_context 経由で取得
+            ctx = self.build_llm_context(player_id)
 
         return {
             "messages": result["messages"],
-            "tools": [
-                d.name for d in self.get_tool_definitions(player_id=player_id)
-            ],
+            "tools": list(self.get_tool_catalog(player_id=player_id).names),
             "tool_runtime_context": ctx.tool_runtime_context,
             # U1: このターンに発行された prediction_context_id をそのまま
             # 露出する (実際の consume は _record_action_result → ledger 経由
             # で player_id をキーに行われるため、呼び出し側がこの値を渡す
             # 必要は無いが、後続 PR のデバッグ・trace 突き合わせ用に残す)。
             "prediction_context_id": result.get("prediction_context_id"),
+            "prompt_sections": result.get("prompt_sections"),
         }
 
     def _format_ongoing_conditions(self) -> str:
@@ -4622,7 +4837,7 @@ def _build_context_format_strategy_from_config(
     cfg: "ResolvedLlmRuntimeConfig",
 ) -> SectionBasedContextFormatStrategy:
     """resolved config から context format strategy を組む。"""
-    return SectionBasedContextFormatStrategy(section_order=cfg.prompt_section_order)
+    return build_section_format_strategy(cfg.prompt_section_order)
 
 
 def _build_short_term_memory(
@@ -4969,7 +5184,12 @@ def create_world_runtime(
         )
         item_spec_repo.save(spec)
 
-    player_status_repo = InMemoryPlayerStatusRepository(data_store)
+    # tick 中は stage ごとの find_all / find_by_id が同じ集約を繰り返し読む。
+    # 全利用者に同じ decorator を渡し、simulation tick の区間だけ identity map
+    # + tick 末 1 回 flush にする (区間外は素通し)。
+    player_status_repo = TickScopedPlayerStatusRepository(
+        InMemoryPlayerStatusRepository(data_store)
+    )
     player_inventory_repo = InMemoryPlayerInventoryRepository(data_store)
     from ai_rpg_world.domain.player.service.player_outcome_registry import (
         PlayerOutcomeRegistry,
@@ -5256,7 +5476,9 @@ def create_world_runtime(
         item_repository=item_repo,
         item_spec_repository=item_spec_repo,
     )
-    pending_trade_offer_store = InMemoryPendingTradeOfferStore()
+    # 期限を持つ store / stage が共有する timer wheel
+    timer_wheel = WorldTickTimerWheel()
+    pending_trade_offer_store = InMemoryPendingTradeOfferStore(timer_wheel=timer_wheel)
     trade_freeze_service = TradeFreezeService(
         pending_trade_offer_store=pending_trade_offer_store,
         player_inventory_repository=player_inventory_repo,
@@ -5409,6 +5631,7 @@ def create_world_runtime(
     )
     market_board_store = InMemoryMarketBoardStore(
         board_spot_id=scenario.market.board_spot_id if scenario.market else None,
+        timer_wheel=timer_wheel,
     )
     board_delivery_overflow_sink = GroundOverflowSink(
         # 落とし先を板に固定する。買い手の居場所に依存させないことが、
@@ -6358,6 +6581,7 @@ def create_world_runtime(
             spoilable_specs=spoilable_specs,
             spec_name_lookup=_spec_name_lookup,
             # 観測 callback は runtime construction 後にバインド (runtime 参照が必要)
+            timer_wheel=timer_wheel,
         )
 
     # ── Phase E-3: 個別 outcome registry を simulation 前に作る ──
@@ -6440,6 +6664,7 @@ def create_world_runtime(
         death_grace_stage=death_grace_stage,
         trade_offer_expiry_stage=trade_offer_expiry_stage,
         market_order_expiry_stage=market_order_expiry_stage,
+        tick_state_scope=player_status_repo.tick_scope,
         llm_turn_trigger=sim_llm_trigger,
         # PR-N: tick stage で graph に積まれた events を heartbeat tick でも
         # observation pipeline 経由で flush する。これが無いと monster_behavior
@@ -6483,6 +6708,7 @@ def create_world_runtime(
         _trade_freeze_service=trade_freeze_service,
         _player_trade_service=player_trade_service,
         _market_board_store=market_board_store,
+        _timer_wheel=timer_wheel,
         _market_service=market_service,
         _ground_overflow_sink=ground_overflow_sink,
         _state_builder=state_builder,
@@ -6572,6 +6798,13 @@ def create_world_runtime(
         observers=[encounter_collector.on_observation],
     )
     pipeline_event_publisher = PipelineEventPublisher(runtime)
+    # 世界の mutation event が 1 つでも流れたら turn 単位の player snapshot を
+    # 捨てる (グラフ・室内・状態のどれが変わっても他人の行まで変わりうる)。
+    from ai_rpg_world.domain.common.domain_event import BaseDomainEvent
+
+    pipeline_event_publisher.register_handler(
+        BaseDomainEvent, runtime._player_snapshot_cache
+    )
 
     # Phase E-3: プレイヤー個別 outcome の event-driven 配線。
     # registry は既に simulation_service 構築前に作成済み。ここでは broadcast
@@ -7755,6 +7988,7 @@ def create_world_runtime(
             # config の __post_init__ が「db_path + subjective」の無視組み合わせを
             # fail-fast 済みなので、ここに来る db_path は非 subjective 経路のみ。
             subjective_episode_db_path=config.subjective_episode_db_path,
+            subjective_episode_group_commit_ms=config.subjective_episode_group_commit_ms,
         )
 
         # U9a: recall_buffer を scheduler に後から差し込む。
@@ -17,13 +17,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
 from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue import EpisodicCue
 from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode import (
     SubjectiveEpisode,
 )
+from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode_header import (
+    SubjectiveEpisodeHeader,
+)
 
 
 class EpisodicEpisodeRepository(ABC):
@@ -49,6 +52,17 @@ class EpisodicEpisodeRepository(ABC):
     ) -> SubjectiveEpisode | None:
         """being_id keyed で episode_id を引く。無ければ None。"""
 
+    @abstractmethod
+    def get_many_by_being(
+        self, being_id: BeingId, episode_ids: Sequence[str]
+    ) -> dict[str, SubjectiveEpisode]:
+        """being_id keyed で複数の episode_id をまとめて引く。
+
+        戻り値は見つかった分だけの ``episode_id → episode``。無い ID は含めない。
+        セマンティック昇格がクラスタのメンバーを 1 回で読むための API
+        (``get_by_being`` をメンバー数だけ呼ばないため)。
+        """
+
     @abstractmethod
     def list_recent_by_being(
         self,
@@ -84,6 +98,37 @@ class EpisodicEpisodeRepository(ABC):
         同じ意味で機能する。
         """
 
+    @abstractmethod
+    def list_by_cues_by_being(
+        self,
+        being_id: BeingId,
+        cues: Sequence[EpisodicCue],
+        limit_per_cue: int,
+        min_occurred_at: Optional[datetime] = None,
+    ) -> list[tuple[SubjectiveEpisode, frozenset[str]]]:
+        """複数 cue の ``list_by_cue_by_being`` を 1 回でまとめて引く。
+
+        各 cue ごとに ``list_by_cue_by_being(cue, limit_per_cue, min_occurred_at)``
+        を呼んだ結果の和集合を、episode ごとに 1 行へまとめて返す。各行の
+        2 要素目は、その episode が上位 ``limit_per_cue`` 件に入った cue の
+        canonical (``axis:value``) の集合。並びは ``list_recent_by_being`` と同じ。
+        受動想起が cue の数だけ query を打たないための API。
+        """
+
+    @abstractmethod
+    def list_cue_headers_by_being(
+        self,
+        being_id: BeingId,
+        cues: Sequence[EpisodicCue],
+        limit_per_cue: int,
+        min_occurred_at: Optional[datetime] = None,
+    ) -> list[SubjectiveEpisodeHeader]:
+        """``list_by_cues_by_being`` と同じ行を、episode を組み立てずに見出しで返す。
+
+        並べ替えてから上位だけを ``get_many_by_being`` で読む呼び出し側のための
+        API。並びは ``list_by_cues_by_being`` と同じ。
+        """
+
     @abstractmethod
     def list_all_by_being(self, being_id: BeingId) -> list[SubjectiveEpisode]:
         """being_id keyed で **全 episode** を ``occurred_at`` 昇順で返す。
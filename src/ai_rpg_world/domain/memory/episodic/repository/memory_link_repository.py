@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Sequence
 
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
 from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (
@@ -68,6 +69,19 @@ class MemoryLinkRepository(ABC):
     ) -> list[MemoryLink]:
         """being_id keyed で episode に接続する全リンク (件数上限なし)。"""
 
+    @abstractmethod
+    def list_all_incident_links_for_episodes_by_being(
+        self,
+        being_id: BeingId,
+        episode_ids: Sequence[str],
+    ) -> dict[str, list[MemoryLink]]:
+        """複数 episode の接続リンクをまとめて返す (件数上限なし)。
+
+        戻り値は ``episode_id (strip 済み) → 接続リンク``。リンクの無い ID も
+        空リストで含める。両端とも ``episode_ids`` に入っているリンクは両方の
+        リストに現れる。拡散活性化が hop ごとのフロンティアを 1 回で引くための API。
+        """
+
     @abstractmethod
     def count_links_for_episode_by_being(
         self, being_id: BeingId, episode_id: str
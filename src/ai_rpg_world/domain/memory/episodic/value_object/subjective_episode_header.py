@@ -0,0 +1,33 @@
+"""SubjectiveEpisodeHeader — 並べ替え用の episode の見出し (本体を組み立てない)。
+
+受動想起は cue 一致数・時刻・episode_id だけで候補を並べ、上位だけを prompt に
+載せる。並べ替えの段階で全候補の ``SubjectiveEpisode`` を組み立てない
+(payload を decode しない) ために、store はこの見出しを返す。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import FrozenSet
+
+
+@dataclass(frozen=True)
+class SubjectiveEpisodeHeader:
+    """cue 検索でヒットした episode の見出し。
+
+    ``occurred_at_key`` は occurred_at を UTC に寄せた unix 秒 (naive は UTC と
+    みなす)。store の並び (occurred_at 降順・同時刻は episode_id 降順) は
+    ``(occurred_at_key, episode_id)`` の降順と一致する。
+    ``matched_cue_canonicals`` は、この episode が上位件数に入った cue の
+    canonical (``axis:value``) の集合。
+    """
+
+    episode_id: str
+    occurred_at_key: float
+    matched_cue_canonicals: FrozenSet[str]
+
+    def sort_key(self) -> tuple[float, str]:
+        return (self.occurred_at_key, self.episode_id)
+
+
+__all__ = ["SubjectiveEpisodeHeader"]
@@ -237,6 +237,18 @@ class MarketBoard:
             if not order.is_awaiting_collection and order.is_expired_at(current_tick)
         )
 
+    def next_expiry_tick(self) -> Optional[int]:
+        """次に ``expired_orders`` が注文を返し始める手番。無ければ None。
+
+        期限の手番ちょうどはまだ生きているので、その次の手番になる。
+        """
+        deadlines = [
+            order.expires_at_tick
+            for order in self.orders
+            if not order.is_awaiting_collection
+        ]
+        return min(deadlines) + 1 if deadlines else None
+
     # ── 更新 (どれも新しい板を返す) ────────────────────────────────────
 
     def with_order(self, order: MarketOrder) -> "MarketBoard":
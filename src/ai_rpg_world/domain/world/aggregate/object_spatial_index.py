@@ -0,0 +1,132 @@
+"""PhysicalMapAggregate 内のオブジェクト位置を chunk 単位で引く spatial hash。
+
+``get_objects_in_range`` は全オブジェクトを走査していたため、数千オブジェクトの
+マップで数百の actor が毎 tick 視界 / 衝突判定をすると O(objects × queries) に
+なっていた。本 index は座標を ``chunk_size`` 立方の chunk に振り分けて持ち、
+マンハッタン距離 ``d`` の範囲 query を「中心から ±d の chunk だけ見る」形にする。
+
+結果の並びは従来の全走査 (``_objects`` の挿入順) と同じになるよう、挿入時の
+通し番号で整列して返す。範囲が広く chunk 数が登録数を上回るときは全走査の方が
+安いので、その場合は登録順にそのまま走査する。
+
+集約の ``add_object`` / ``move_object`` / ``remove_object`` からだけ更新する
+(``WorldObject.move_to`` を外から呼ぶ経路は無い)。
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterator, List, Tuple
+
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate
+from ai_rpg_world.domain.world.value_object.world_object_id import WorldObjectId
+
+ChunkKey = Tuple[int, int, int]
+
+DEFAULT_CHUNK_SIZE = 8
+
+
+class ObjectSpatialIndex:
+    """オブジェクト ID → 座標と、chunk → (ID → 座標) の 2 段の索引。"""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be 1 or greater: {chunk_size}")
+        self._chunk_size = chunk_size
+        self._positions: Dict[WorldObjectId, Coordinate] = {}
+        self._chunks: Dict[ChunkKey, Dict[WorldObjectId, Coordinate]] = {}
+        self._order: Dict[WorldObjectId, int] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, object_id: WorldObjectId) -> bool:
+        return object_id in self._positions
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    def _chunk_of(self, coordinate: Coordinate) -> ChunkKey:
+        size = self._chunk_size
+        return (coordinate.x // size, coordinate.y // size, coordinate.z // size)
+
+    def insert(self, object_id: WorldObjectId, coordinate: Coordinate) -> None:
+        if object_id in self._positions:
+            raise ValueError(f"object {object_id} is already indexed")
+        self._positions[object_id] = coordinate
+        self._chunks.setdefault(self._chunk_of(coordinate), {})[object_id] = coordinate
+        self._order[object_id] = self._next_order
+        self._next_order += 1
+
+    def move(self, object_id: WorldObjectId, new_coordinate: Coordinate) -> None:
+        old_coordinate = self._positions[object_id]
+        self._positions[object_id] = new_coordinate
+        old_chunk = self._chunk_of(old_coordinate)
+        new_chunk = self._chunk_of(new_coordinate)
+        if old_chunk == new_chunk:
+            self._chunks[old_chunk][object_id] = new_coordinate
+            return
+        self._discard_from_chunk(old_chunk, object_id)
+        self._chunks.setdefault(new_chunk, {})[object_id] = new_coordinate
+
+    def remove(self, object_id: WorldObjectId) -> None:
+        coordinate = self._positions.pop(object_id)
+        self._order.pop(object_id)
+        self._discard_from_chunk(self._chunk_of(coordinate), object_id)
+
+    def _discard_from_chunk(self, chunk: ChunkKey, object_id: WorldObjectId) -> None:
+        members = self._chunks[chunk]
+        del members[object_id]
+        if not members:
+            del self._chunks[chunk]
+
+    def query(self, center: Coordinate, distance: float) -> List[WorldObjectId]:
+        """``center`` からマンハッタン距離 ``distance`` 以内の ID を登録順で返す。"""
+        if distance < 0:
+            return []
+        if math.isinf(distance) or self._chunks_spanned(center, distance) >= len(
+            self._positions
+        ):
+            return [
+                object_id
+                for object_id, coordinate in self._positions.items()
+                if center.distance_to(coordinate) <= distance
+            ]
+        found: List[WorldObjectId] = []
+        for members in self._chunks_around(center, int(distance)):
+            for object_id, coordinate in members.items():
+                if center.distance_to(coordinate) <= distance:
+                    found.append(object_id)
+        found.sort(key=self._order.__getitem__)
+        return found
+
+    def _chunk_bounds(self, center: Coordinate, radius: int) -> Tuple[range, range, range]:
+        size = self._chunk_size
+        return (
+            range((center.x - radius) // size, (center.x + radius) // size + 1),
+            range((center.y - radius) // size, (center.y + radius) // size + 1),
+            range((center.z - radius) // size, (center.z + radius) // size + 1),
+        )
+
+    def _chunks_spanned(self, center: Coordinate, distance: float) -> int:
+        xs, ys, zs = self._chunk_bounds(center, int(distance))
+        return len(xs) * len(ys) * len(zs)
+
+    def _chunks_around(self, center: Coordinate, radius: int) -> Iterator[Dict[WorldObjectId, Coordinate]]:
+        xs, ys, zs = self._chunk_bounds(center, radius)
+        chunks = self._chunks
+        for cx in xs:
+            for cy in ys:
+                for cz in zs:
+                    members = chunks.get((cx, cy, cz))
+                    if members:
+                        yield members
+
+    def positions(self) -> Dict[WorldObjectId, Coordinate]:
+        """登録中の ID → 座標 (整合性検査用の複製)。"""
+        return dict(self._positions)
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "ObjectSpatialIndex"]
@@ -1,6 +1,8 @@
 import math
-from typing import List, Dict, Optional, Any, Tuple, Iterable, FrozenSet
+from typing import List, Dict, Optional, Any, Tuple, Iterable, FrozenSet, MutableMapping
 from ai_rpg_world.domain.common.aggregate_root import AggregateRoot
+from ai_rpg_world.domain.world.aggregate.object_spatial_index import ObjectSpatialIndex
+from ai_rpg_world.domain.world.aggregate.tile_grid import TileGrid
 from ai_rpg_world.domain.world.value_object.spot_id import SpotId
 from ai_rpg_world.domain.world.value_object.coordinate import Coordinate
 from ai_rpg_world.domain.world.value_object.world_object_id import WorldObjectId
@@ -113,15 +115,24 @@ class PhysicalMapAggregate(AggregateRoot):
     ):
         super().__init__()
         self._spot_id = spot_id
-        self._tiles = tiles
+        # 密なマップではタイルを配列表現 (TileGrid) で持ち、通行 / コスト / 視線の
+        # 判定を cell index で引く。疎なマップでは従来どおり dict のまま。
+        self._grid: Optional[TileGrid] = TileGrid.build(tiles)
+        self._tiles: MutableMapping[Coordinate, Tile] = self._grid if self._grid is not None else tiles
         self._objects: Dict[WorldObjectId, WorldObject] = {}
         self._object_positions: Dict[Coordinate, List[WorldObjectId]] = {}
+        # 範囲 query 用の chunk 索引。_objects / _object_positions と同じ 3 箇所
+        # (_add_object_to_internal_storage / move_object / remove_object) で更新する。
+        self._spatial_index = ObjectSpatialIndex()
         self._area_triggers: Dict[AreaTriggerId, AreaTrigger] = {t.trigger_id: t for t in (area_triggers or [])}
         self._location_areas: Dict[LocationAreaId, LocationArea] = {l.location_id: l for l in (location_areas or [])}
         self._gateways: Dict[GatewayId, Gateway] = {g.gateway_id: g for g in (gateways or [])}
         self._environment_type = environment_type
         self._weather_state = WeatherState.clear()
         self._area_traits: FrozenSet[SpotTraitEnum] = self._normalize_area_traits(area_traits)
+        # (weather_state, environment_type, 移動コスト倍率)。get_movement_cost は経路探索で
+        # セルごとに呼ばれるため、天候が変わるまで倍率を再計算しない。
+        self._cost_multiplier_cache: Optional[Tuple[WeatherState, EnvironmentTypeEnum, float]] = None
 
         if objects:
             for obj in objects:
@@ -176,6 +187,9 @@ class PhysicalMapAggregate(AggregateRoot):
         if obj.coordinate not in self._object_positions:
             self._object_positions[obj.coordinate] = []
         self._object_positions[obj.coordinate].append(obj.object_id)
+        self._spatial_index.insert(obj.object_id, obj.coordinate)
+        if self._grid is not None:
+            self._grid.add_occupant(obj.coordinate)
         
         # オブジェクトによる通行制限を反映
         if obj.is_blocking:
@@ -251,6 +265,15 @@ class PhysicalMapAggregate(AggregateRoot):
 
     def is_passable(self, coordinate: Coordinate, capability: MovementCapability, exclude_object_id: Optional[WorldObjectId] = None) -> bool:
         """指定された座標が特定のアクター能力で通行可能か判定する"""
+        grid = self._grid
+        if grid is not None:
+            idx = grid.index_of(coordinate)
+            if idx >= 0:
+                if not grid.can_pass(idx, capability):
+                    return False
+                # オブジェクトのいない cell は座標索引を引かずに確定する
+                if not grid.is_occupied(idx):
+                    return True
         try:
             tile = self.get_tile(coordinate)
             # 地形的な通行可能性
@@ -274,18 +297,56 @@ class PhysicalMapAggregate(AggregateRoot):
 
     def get_movement_cost(self, coordinate: Coordinate, capability: MovementCapability, exclude_object_id: Optional[WorldObjectId] = None) -> float:
         """指定された座標の移動コストを計算する。通行不可の場合は無限大を返す。"""
-        if not self.is_passable(coordinate, capability, exclude_object_id=exclude_object_id):
-            return float('inf')
-        
-        tile = self.get_tile(coordinate)
-        base_cost = tile.terrain_type.calculate_cost(capability).value
+        grid = self._grid
+        idx = grid.index_of(coordinate) if grid is not None else -1
+        if idx >= 0 and not grid.is_occupied(idx):
+            # オブジェクトのいない cell は地形だけで決まる（通行不可の地形は表の値が無限大）
+            base_cost = grid.movement_cost(idx, capability)
+        else:
+            if not self.is_passable(coordinate, capability, exclude_object_id=exclude_object_id):
+                return float('inf')
+            if idx >= 0:
+                base_cost = grid.movement_cost(idx, capability)
+            else:
+                tile = self.get_tile(coordinate)
+                base_cost = tile.terrain_type.calculate_cost(capability).value
         
         # 天候によるコスト増加
-        multiplier = WeatherEffectService.calculate_movement_cost_multiplier(
-            self._weather_state, 
-            self._environment_type
-        )
-        return base_cost * multiplier
+        return base_cost * self._movement_cost_multiplier()
+
+    def get_movement_cost_at(
+        self,
+        x: int,
+        y: int,
+        z: int,
+        capability: MovementCapability,
+        exclude_object_id: Optional[WorldObjectId] = None,
+    ) -> float:
+        """get_movement_cost の整数座標版（経路探索のループで Coordinate を作らないため）"""
+        grid = self._grid
+        if grid is not None:
+            idx = grid.index_of_xyz(x, y, z)
+            if idx >= 0 and not grid.is_occupied(idx):
+                return grid.movement_cost(idx, capability) * self._movement_cost_multiplier()
+        if x < 0 or y < 0:
+            return float('inf')
+        return self.get_movement_cost(Coordinate(x, y, z), capability, exclude_object_id=exclude_object_id)
+
+    def _movement_cost_multiplier(self) -> float:
+        """天候による移動コスト倍率。天候・環境が変わるまで前回値を使い回す。"""
+        cached = self._cost_multiplier_cache
+        if (
+            cached is None
+            or cached[0] is not self._weather_state
+            or cached[1] is not self._environment_type
+        ):
+            multiplier = WeatherEffectService.calculate_movement_cost_multiplier(
+                self._weather_state,
+                self._environment_type
+            )
+            cached = (self._weather_state, self._environment_type, multiplier)
+            self._cost_multiplier_cache = cached
+        return cached[2]
 
     @property
     def spot_id(self) -> SpotId:
@@ -307,6 +368,11 @@ class PhysicalMapAggregate(AggregateRoot):
                 result.append(obj)
         return result
 
+    @property
+    def tile_grid(self) -> Optional[TileGrid]:
+        """タイルの配列表現（疎なマップでは None）。経路探索などが cell index で走査するために使う。"""
+        return self._grid
+
     def get_tile(self, coordinate: Coordinate) -> Tile:
         if coordinate not in self._tiles:
             raise TileNotFoundException(f"Tile not found at {coordinate} in spot {self._spot_id}")
@@ -402,6 +468,10 @@ class PhysicalMapAggregate(AggregateRoot):
         if new_coordinate not in self._object_positions:
             self._object_positions[new_coordinate] = []
         self._object_positions[new_coordinate].append(object_id)
+        self._spatial_index.move(object_id, new_coordinate)
+        if self._grid is not None:
+            self._grid.remove_occupant(old_coordinate)
+            self._grid.add_occupant(new_coordinate)
         
         # オブジェクトの座標更新とビジー設定
         obj.move_to(new_coordinate)
@@ -437,6 +507,8 @@ class PhysicalMapAggregate(AggregateRoot):
             raise InvalidPlacementException(f"Cannot change terrain to non-walkable at {coordinate} because an object exists")
 
         tile.change_terrain(new_terrain_type)
+        if self._grid is not None:
+            self._grid.refresh(coordinate)
         
         self.add_event(TileTerrainChangedEvent.create(
             aggregate_id=self._spot_id,
@@ -450,11 +522,15 @@ class PhysicalMapAggregate(AggregateRoot):
         """指定された座標のタイルの通行可能性を上書きする"""
         tile = self.get_tile(coordinate)
         tile.override_walkable(is_walkable)
+        if self._grid is not None:
+            self._grid.refresh(coordinate)
 
     def _reset_tile_walkability(self, coordinate: Coordinate):
         """指定された座標のタイルの通行可能性の上書きを解除する"""
         tile = self.get_tile(coordinate)
         tile.reset_walkable()
+        if self._grid is not None:
+            self._grid.refresh(coordinate)
     
     def get_all_objects(self) -> List[WorldObject]:
         return list(self._objects.values())
@@ -506,12 +582,18 @@ class PhysicalMapAggregate(AggregateRoot):
             self._environment_type
         )
         effective_distance = min(effective_distance, max_dist)
-        
-        found_objects = []
-        for obj in self._objects.values():
-            if center.distance_to(obj.coordinate) <= effective_distance:
-                found_objects.append(obj)
-        return found_objects
+        return self._objects_within(center, effective_distance)
+
+    def _objects_within(self, center: Coordinate, distance: float) -> List[WorldObject]:
+        """spatial index で範囲内オブジェクトを引く（並びは _objects の挿入順）。"""
+        if distance == 0:
+            # 完全一致セルは既存の座標索引で足りる（衝突判定の 1 マス query 用）。
+            ids = self._object_positions.get(center)
+            if not ids:
+                return []
+            if len(ids) == 1:
+                return [self._objects[ids[0]]]
+        return [self._objects[oid] for oid in self._spatial_index.query(center, distance)]
 
     def is_visible(self, from_coord: Coordinate, to_coord: Coordinate) -> bool:
         """指定された座標間が互いに視認可能か判定する"""
@@ -534,7 +616,7 @@ class PhysicalMapAggregate(AggregateRoot):
     ) -> List[List[WorldObject]]:
         """
         複数の (中心座標, 距離) について、それぞれの範囲内オブジェクトを一括で取得する。
-        マップのオブジェクト走査は1回で行い、各クエリへの結果を返す。
+        各クエリは spatial index で中心付近の chunk だけを見る。
         天候による視界減衰・最大視界制限は get_objects_in_range と同様に適用する。
         """
         if not centers_with_range:
@@ -555,12 +637,10 @@ class PhysicalMapAggregate(AggregateRoot):
             effective = min(effective, max_dist)
             effective_distances.append(effective)
 
-        results: List[List[WorldObject]] = [[] for _ in centers_with_range]
-        for obj in self._objects.values():
-            for i, (center, _) in enumerate(centers_with_range):
-                if center.distance_to(obj.coordinate) <= effective_distances[i]:
-                    results[i].append(obj)
-        return results
+        return [
+            self._objects_within(center, effective_distances[i])
+            for i, (center, _) in enumerate(centers_with_range)
+        ]
 
     def is_visible_batch(
         self, pairs: List[Tuple[Coordinate, Coordinate]]
@@ -583,6 +663,14 @@ class PhysicalMapAggregate(AggregateRoot):
 
     def is_sight_blocked(self, coordinate: Coordinate) -> bool:
         """指定された座標が視線を遮るか判定する（VisibilityMapプロトコルの実装）"""
+        grid = self._grid
+        if grid is not None:
+            idx = grid.index_of(coordinate)
+            if idx >= 0:
+                if grid.is_opaque(idx):
+                    return True
+                if not grid.is_occupied(idx):
+                    return False
         if coordinate not in self._tiles:
             return False # タイルのない場所（空中など）は透明とみなす
 
@@ -598,6 +686,18 @@ class PhysicalMapAggregate(AggregateRoot):
 
         return False
 
+    def is_sight_blocked_at(self, x: int, y: int, z: int) -> bool:
+        """is_sight_blocked の整数座標版（視線判定のループで Coordinate を作らないため）"""
+        grid = self._grid
+        if grid is not None:
+            idx = grid.index_of_xyz(x, y, z)
+            if idx >= 0:
+                if grid.is_opaque(idx):
+                    return True
+                if not grid.is_occupied(idx):
+                    return False
+        return self.is_sight_blocked(Coordinate(x, y, z))
+
     def remove_object(self, object_id: WorldObjectId):
         """オブジェクトをマップから削除する"""
         obj = self.get_object(object_id)
@@ -609,6 +709,9 @@ class PhysicalMapAggregate(AggregateRoot):
         self._object_positions[coord].remove(object_id)
         if not self._object_positions[coord]:
             del self._object_positions[coord]
+        self._spatial_index.remove(object_id)
+        if self._grid is not None:
+            self._grid.remove_occupant(coord)
             
         del self._objects[object_id]
 
@@ -0,0 +1,402 @@
+"""PhysicalMapAggregate のタイルを平坦な配列で持つ grid。
+
+タイルは ``Dict[Coordinate, Tile]`` で持っていたため、``is_passable`` /
+``get_movement_cost`` / ``is_sight_blocked`` の 1 呼び出しごとに Coordinate の
+hash と Tile → TerrainType の属性参照が走り、A* や視線判定で 1 探索あたり
+数千回呼ばれるとそこが支配的になっていた。
+
+本 grid はマップの bounding box を ``(z, y, x)`` 順の平坦な cell 配列にし、
+cell ごとに次を ``array`` / ``bytearray`` で持つ:
+
+- 地形 palette id (``array('H')``、0 はタイル無し)。TerrainType は palette に
+  1 度だけ登録し、不透明度と「移動能力ごとの通行可否 / 移動コスト」は palette
+  単位の表で引く (能力ごとの表は初回参照時に作る)
+- 通行可能性の上書き (``bytearray``、0: なし / 1: 通行可 / 2: 通行不可)
+- その cell にいるオブジェクト数 (``array('I')``)。集約の add / move /
+  remove からだけ更新する。オブジェクトの blocking / 視覚遮蔽フラグは
+  DoorComponent などが WorldObject を直接書き換えるため grid には写さず、
+  「オブジェクトがいる cell だけ従来どおり実体を見る」ための占有 bitmap とする
+
+``Coordinate → Tile`` の mapping としても振る舞い (挿入順を保持)、集約の
+``_tiles`` をそのまま置き換える。Tile を ``get_tile()`` 経由で直接書き換えた
+場合も ``Tile.bind_listener`` の通知で配列を追従させる。
+
+bounding box がタイル数に比べて疎すぎるマップ (``build`` の ``max_sparsity``
+超過) では grid を作らず、集約は従来の dict 実装のまま動く。
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+from ai_rpg_world.domain.world.entity.tile import Tile
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate
+from ai_rpg_world.domain.world.value_object.movement_capability import MovementCapability
+from ai_rpg_world.domain.world.value_object.terrain_type import TerrainType
+
+# bounding box の cell 数がタイル数のこの倍数を超えるマップでは grid を作らない。
+DEFAULT_MAX_SPARSITY = 4
+
+_NO_TILE = 0
+_OVERRIDE_NONE = 0
+_OVERRIDE_WALKABLE = 1
+_OVERRIDE_BLOCKED = 2
+
+# (palette id → 通行可否, palette id → 移動コスト)
+_CapabilityTable = Tuple[bytearray, "array[float]"]
+
+
+class TileGrid(MutableMapping[Coordinate, Tile]):
+    """bounding box 内のタイルを cell index で引く配列表現。"""
+
+    def __init__(self, origin: Tuple[int, int, int], shape: Tuple[int, int, int]) -> None:
+        width, height, depth = shape
+        if width < 1 or height < 1 or depth < 1:
+            raise ValueError(f"grid shape must be positive: {shape}")
+        self._x0, self._y0, self._z0 = origin
+        self._width = width
+        self._height = height
+        self._depth = depth
+        size = width * height * depth
+        self._size = size
+        self._cells: List[Optional[Tile]] = [None] * size
+        self._terrain = array("H", bytes(2 * size))
+        self._override = bytearray(size)
+        self._occupants = array("I", bytes(4 * size))
+        # 挿入順 (get_all_tiles の並びを dict 実装と揃える)
+        self._order = array("i")
+        # bounding box の外に後から足されたタイル (grid の fast path の対象外)
+        self._overflow: Dict[Coordinate, Tile] = {}
+        # palette id 0 はタイル無しの番兵
+        self._palette: List[Optional[TerrainType]] = [None]
+        self._palette_ids: Dict[TerrainType, int] = {}
+        self._opaque_by_terrain = bytearray(1)
+        # palette id ごとの cell 数 (cost_range で「今いる地形」だけを見るため)
+        self._terrain_counts: List[int] = [size]
+        self._capability_tables: Dict[MovementCapability, _CapabilityTable] = {}
+        self._last_capability: Optional[MovementCapability] = None
+        self._last_table: Optional[_CapabilityTable] = None
+        # 全 Tile で共有する通知先 (Tile ごとに bound method を作らない)
+        self._listener = self._on_tile_changed
+
+    @classmethod
+    def build(
+        cls,
+        tiles: Mapping[Coordinate, Tile],
+        max_sparsity: int = DEFAULT_MAX_SPARSITY,
+    ) -> Optional["TileGrid"]:
+        """``tiles`` から grid を作る。空、または疎すぎる場合は None。"""
+        if not tiles:
+            return None
+        xs = [c.x for c in tiles]
+        ys = [c.y for c in tiles]
+        zs = [c.z for c in tiles]
+        origin = (min(xs), min(ys), min(zs))
+        shape = (
+            max(xs) - origin[0] + 1,
+            max(ys) - origin[1] + 1,
+            max(zs) - origin[2] + 1,
+        )
+        if shape[0] * shape[1] * shape[2] > max_sparsity * len(tiles):
+            return None
+        grid = cls(origin, shape)
+        for coordinate, tile in tiles.items():
+            grid[coordinate] = tile
+        return grid
+
+    # ------------------------------------------------------------------
+    # 形状 / index 変換
+    # ------------------------------------------------------------------
+
+    @property
+    def origin(self) -> Tuple[int, int, int]:
+        return (self._x0, self._y0, self._z0)
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """(width, height, depth)"""
+        return (self._width, self._height, self._depth)
+
+    @property
+    def size(self) -> int:
+        """cell 数 (タイルの無い cell を含む)"""
+        return self._size
+
+    def _cell_index(self, x: int, y: int, z: int) -> int:
+        x -= self._x0
+        y -= self._y0
+        z -= self._z0
+        if (
+            x < 0
+            or y < 0
+            or z < 0
+            or x >= self._width
+            or y >= self._height
+            or z >= self._depth
+        ):
+            return -1
+        return (z * self._height + y) * self._width + x
+
+    def index_of_xyz(self, x: int, y: int, z: int) -> int:
+        """タイルのある cell の index。範囲外・タイル無しは -1。"""
+        # 判定のたびに呼ばれるので _cell_index を経由せず展開している
+        x -= self._x0
+        y -= self._y0
+        z -= self._z0
+        width = self._width
+        height = self._height
+        if x < 0 or y < 0 or z < 0 or x >= width or y >= height or z >= self._depth:
+            return -1
+        idx = (z * height + y) * width + x
+        if self._terrain[idx] == _NO_TILE:
+            return -1
+        return idx
+
+    def index_of(self, coordinate: Coordinate) -> int:
+        return self.index_of_xyz(coordinate.x, coordinate.y, coordinate.z)
+
+    def xyz_of(self, idx: int) -> Tuple[int, int, int]:
+        plane = self._width * self._height
+        z, rest = divmod(idx, plane)
+        y, x = divmod(rest, self._width)
+        return (x + self._x0, y + self._y0, z + self._z0)
+
+    def coordinate_of(self, idx: int) -> Coordinate:
+        return Coordinate(*self.xyz_of(idx))
+
+    # ------------------------------------------------------------------
+    # cell 単位の参照 (idx は index_of が返した非負値)
+    # ------------------------------------------------------------------
+
+    def _table_for(self, capability: MovementCapability) -> _CapabilityTable:
+        # 経路探索は同じ capability instance で繰り返し引くので、frozen dataclass の
+        # hash (frozenset の再計算) を避けて直前の表を identity で使い回す
+        if capability is self._last_capability:
+            return self._last_table  # type: ignore[return-value]
+        table = self._capability_tables.get(capability)
+        if table is None:
+            passable = bytearray(len(self._palette))
+            costs = array("d", [float("inf")]) * len(self._palette)
+            for terrain_id, terrain in enumerate(self._palette):
+                if terrain is None:
+                    continue
+                passable[terrain_id] = 1 if terrain.can_pass(capability) else 0
+                costs[terrain_id] = terrain.calculate_cost(capability).value
+            table = (passable, costs)
+            self._capability_tables[capability] = table
+        self._last_capability = capability
+        self._last_table = table
+        return table
+
+    def can_pass(self, idx: int, capability: MovementCapability) -> bool:
+        """地形だけを見た通行可否 (TerrainType.can_pass 相当)。"""
+        return bool(self._table_for(capability)[0][self._terrain[idx]])
+
+    def movement_cost(self, idx: int, capability: MovementCapability) -> float:
+        """地形の移動コスト (TerrainType.calculate_cost 相当、天候補正なし)。"""
+        return self._table_for(capability)[1][self._terrain[idx]]
+
+    def cost_range(self, capability: MovementCapability) -> Optional[Tuple[float, float]]:
+        """grid 上に現存する地形の、有限な移動コストの (最小, 最大)。無ければ None。
+
+        経路探索が heuristic の縮尺と「一様コストか (JPS を使えるか)」の判定に使う。
+        """
+        costs = self._table_for(capability)[1]
+        finite = [
+            costs[terrain_id]
+            for terrain_id, count in enumerate(self._terrain_counts)
+            if terrain_id != _NO_TILE and count > 0 and costs[terrain_id] != float("inf")
+        ]
+        if not finite:
+            return None
+        return (min(finite), max(finite))
+
+    @property
+    def has_overflow(self) -> bool:
+        """bounding box の外に後から足されたタイルがあるか。"""
+        return bool(self._overflow)
+
+    def is_opaque(self, idx: int) -> bool:
+        return bool(self._opaque_by_terrain[self._terrain[idx]])
+
+    def is_walkable(self, idx: int) -> bool:
+        """Tile.is_walkable 相当 (上書きがあればそれを優先)。"""
+        override = self._override[idx]
+        if override != _OVERRIDE_NONE:
+            return override == _OVERRIDE_WALKABLE
+        terrain = self._palette[self._terrain[idx]]
+        return terrain is not None and terrain.is_walkable
+
+    def is_occupied(self, idx: int) -> bool:
+        return self._occupants[idx] != 0
+
+    def tile_at(self, idx: int) -> Optional[Tile]:
+        return self._cells[idx]
+
+    # ------------------------------------------------------------------
+    # 一括 mask (経路探索 / 視線判定が整数 index で回すため)
+    # ------------------------------------------------------------------
+
+    def passable_mask(self, capability: MovementCapability) -> bytearray:
+        """cell ごとの地形通行可否 (タイル無しは 0)。"""
+        passable = self._table_for(capability)[0]
+        return bytearray(passable[terrain_id] for terrain_id in self._terrain)
+
+    def opacity_mask(self) -> bytearray:
+        """cell ごとの地形不透明度。"""
+        opaque = self._opaque_by_terrain
+        return bytearray(opaque[terrain_id] for terrain_id in self._terrain)
+
+    def occupied_mask(self) -> bytearray:
+        """オブジェクトが 1 つ以上いる cell を 1 とする。"""
+        return bytearray(1 if count else 0 for count in self._occupants)
+
+    def nbytes(self) -> int:
+        """grid が索引として持つおおよその byte 数。
+
+        cell 配列に加え、``Tile`` を引くための cell list (cell ごとに 1
+        ポインタ) と bounding box 外の overflow dict を含む。Tile 実体は
+        含めない: dict 実装でも同じ Tile を保持するので、索引の差ではない。
+        """
+        return (
+            sys.getsizeof(self._cells)
+            + (sys.getsizeof(self._overflow) if self._overflow else 0)
+            + self._terrain.itemsize * len(self._terrain)
+            + len(self._override)
+            + self._occupants.itemsize * len(self._occupants)
+            + self._order.itemsize * len(self._order)
+        )
+
+    # ------------------------------------------------------------------
+    # 占有 (集約の add / move / remove から呼ぶ)
+    # ------------------------------------------------------------------
+
+    def add_occupant(self, coordinate: Coordinate) -> None:
+        idx = self.index_of(coordinate)
+        if idx >= 0:
+            self._occupants[idx] += 1
+
+    def remove_occupant(self, coordinate: Coordinate) -> None:
+        idx = self.index_of(coordinate)
+        if idx >= 0 and self._occupants[idx]:
+            self._occupants[idx] -= 1
+
+    # ------------------------------------------------------------------
+    # Tile との同期
+    # ------------------------------------------------------------------
+
+    def _terrain_id(self, terrain: TerrainType) -> int:
+        terrain_id = self._palette_ids.get(terrain)
+        if terrain_id is None:
+            terrain_id = len(self._palette)
+            self._palette.append(terrain)
+            self._palette_ids[terrain] = terrain_id
+            self._opaque_by_terrain.append(1 if terrain.is_opaque else 0)
+            self._terrain_counts.append(0)
+            # 能力ごとの表は palette の長さに依存するので作り直させる
+            self._capability_tables.clear()
+            self._last_capability = None
+            self._last_table = None
+        return terrain_id
+
+    def _sync_cell(self, idx: int, tile: Tile) -> None:
+        terrain_id = self._terrain_id(tile.terrain_type)
+        self._terrain_counts[self._terrain[idx]] -= 1
+        self._terrain_counts[terrain_id] += 1
+        self._terrain[idx] = terrain_id
+        override = tile.walkable_override
+        if override is None:
+            self._override[idx] = _OVERRIDE_NONE
+        else:
+            self._override[idx] = _OVERRIDE_WALKABLE if override else _OVERRIDE_BLOCKED
+
+    def refresh(self, coordinate: Coordinate) -> None:
+        """``coordinate`` のタイルの現在状態を配列へ写し直す。"""
+        idx = self._cell_index(coordinate.x, coordinate.y, coordinate.z)
+        if idx >= 0:
+            tile = self._cells[idx]
+            if tile is not None:
+                self._sync_cell(idx, tile)
+
+    def _on_tile_changed(self, tile: Tile) -> None:
+        self.refresh(tile.coordinate)
+
+    # ------------------------------------------------------------------
+    # MutableMapping[Coordinate, Tile]
+    # ------------------------------------------------------------------
+
+    def __contains__(self, coordinate: object) -> bool:
+        if not isinstance(coordinate, Coordinate):
+            return False
+        if self.index_of(coordinate) >= 0:
+            return True
+        return coordinate in self._overflow
+
+    def __getitem__(self, coordinate: Coordinate) -> Tile:
+        idx = self.index_of(coordinate)
+        if idx >= 0:
+            return self._cells[idx]  # type: ignore[return-value]
+        return self._overflow[coordinate]
+
+    def get(self, coordinate: Coordinate, default: Optional[Tile] = None) -> Optional[Tile]:
+        idx = self.index_of(coordinate)
+        if idx >= 0:
+            return self._cells[idx]
+        return self._overflow.get(coordinate, default)
+
+    def __setitem__(self, coordinate: Coordinate, tile: Tile) -> None:
+        idx = self._cell_index(coordinate.x, coordinate.y, coordinate.z)
+        if idx < 0:
+            self._overflow[coordinate] = tile
+            return
+        previous = self._cells[idx]
+        if previous is None:
+            self._order.append(idx)
+        elif previous is not tile:
+            previous.bind_listener(None)
+        self._cells[idx] = tile
+        self._sync_cell(idx, tile)
+        tile.bind_listener(self._listener)
+
+    def __delitem__(self, coordinate: Coordinate) -> None:
+        idx = self.index_of(coordinate)
+        if idx < 0:
+            del self._overflow[coordinate]
+            return
+        tile = self._cells[idx]
+        if tile is not None:
+            tile.bind_listener(None)
+        self._cells[idx] = None
+        self._terrain_counts[self._terrain[idx]] -= 1
+        self._terrain_counts[_NO_TILE] += 1
+        self._terrain[idx] = _NO_TILE
+        self._override[idx] = _OVERRIDE_NONE
+        self._order.remove(idx)
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        for idx in self._order:
+            yield self.coordinate_of(idx)
+        yield from self._overflow
+
+    def __len__(self) -> int:
+        return len(self._order) + len(self._overflow)
+
+    def values(self) -> List[Tile]:  # type: ignore[override]
+        """挿入順のタイル一覧 (dict の view ではなく list を返す)。"""
+        cells = self._cells
+        tiles: List[Tile] = [cells[idx] for idx in self._order]  # type: ignore[misc]
+        tiles.extend(self._overflow.values())
+        return tiles
+
+
+__all__ = ["DEFAULT_MAX_SPARSITY", "TileGrid"]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional
 from ai_rpg_world.domain.world.value_object.coordinate import Coordinate
 from ai_rpg_world.domain.world.value_object.terrain_type import TerrainType
 from ai_rpg_world.domain.world.value_object.movement_cost import MovementCost
@@ -16,6 +16,8 @@ class Tile:
         self._terrain_type = terrain_type
         # 地形タイプによる通行可能性を基本とするが、個別に上書き可能にする（例：一時的な障害物）
         self._is_walkable_override = is_walkable_override
+        # 地形 / 通行上書きの変更を所属マップの TileGrid へ伝える callback
+        self._listener: Optional[Callable[["Tile"], None]] = None
 
     @property
     def coordinate(self) -> Coordinate:
@@ -31,6 +33,11 @@ class Tile:
             return self._is_walkable_override
         return self._terrain_type.is_walkable
 
+    @property
+    def walkable_override(self) -> Optional[bool]:
+        """個別の通行可能性上書き（未設定なら None）"""
+        return self._is_walkable_override
+
     @property
     def movement_cost(self) -> MovementCost:
         return self._terrain_type.base_cost
@@ -38,11 +45,22 @@ class Tile:
     def override_walkable(self, is_walkable: bool):
         """通行可能性を上書きする"""
         self._is_walkable_override = is_walkable
+        self._notify()
 
     def reset_walkable(self):
         """通行可能性の上書きを解除する"""
         self._is_walkable_override = None
+        self._notify()
 
     def change_terrain(self, new_terrain_type: TerrainType):
         """地形を変更する"""
         self._terrain_type = new_terrain_type
+        self._notify()
+
+    def bind_listener(self, listener: Optional[Callable[["Tile"], None]]):
+        """状態変更の通知先を設定する（PhysicalMapAggregate の TileGrid が使う）"""
+        self._listener = listener
+
+    def _notify(self):
+        if self._listener is not None:
+            self._listener(self)
@@ -17,10 +17,17 @@ class MapGeometryService:
         """
         指定された座標間が互いに視認可能か判定する。
         3D Bresenham's Line Algorithm を使用して実装。
+        map_data が is_sight_blocked_at(x, y, z) を持つ場合は、途中の各 cell で
+        Coordinate を作らずにそちらで判定する。
         """
         if from_coord == to_coord:
             return True
 
+        blocked_at = getattr(map_data, "is_sight_blocked_at", None)
+        if blocked_at is None:
+            def blocked_at(x: int, y: int, z: int) -> bool:
+                return map_data.is_sight_blocked(Coordinate(x, y, z))
+
         x1, y1, z1 = from_coord.x, from_coord.y, from_coord.z
         x2, y2, z2 = to_coord.x, to_coord.y, to_coord.z
 
@@ -49,7 +56,7 @@ class MapGeometryService:
                 p2 += 2 * dz
                 if (x1, y1, z1) == (x2, y2, z2):
                     break
-                if map_data.is_sight_blocked(Coordinate(x1, y1, z1)):
+                if blocked_at(x1, y1, z1):
                     return False
         elif dy >= dx and dy >= dz:
             # y軸メイン
@@ -67,7 +74,7 @@ class MapGeometryService:
                 p2 += 2 * dz
                 if (x1, y1, z1) == (x2, y2, z2):
                     break
-                if map_data.is_sight_blocked(Coordinate(x1, y1, z1)):
+                if blocked_at(x1, y1, z1):
                     return False
         else:
             # z軸メイン
@@ -85,7 +92,7 @@ class MapGeometryService:
                 p2 += 2 * dy
                 if (x1, y1, z1) == (x2, y2, z2):
                     break
-                if map_data.is_sight_blocked(Coordinate(x1, y1, z1)):
+                if blocked_at(x1, y1, z1):
                     return False
 
         return True
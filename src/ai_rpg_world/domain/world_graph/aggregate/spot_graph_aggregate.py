@@ -40,6 +40,10 @@ from ai_rpg_world.domain.world_graph.exception.spot_graph_exception import (
 from ai_rpg_world.domain.world_graph.value_object.monster_spot_presence import (
     MonsterSpotPresence,
 )
+from ai_rpg_world.domain.world_graph.aggregate.spot_routing_table import (
+    SpotRoutingRow,
+    SpotRoutingTable,
+)
 from ai_rpg_world.domain.world_graph.service.spot_graph_navigation_service import SpotGraphNavigationService
 from ai_rpg_world.domain.world_graph.value_object.connection_id import ConnectionId
 from ai_rpg_world.domain.world_graph.value_object.entity_id import EntityId
@@ -95,6 +99,12 @@ class SpotGraphAggregate(AggregateRoot):
         self._monster_presences: Dict[SpotId, MonsterSpotPresence] = dict(monster_presences or {})
         self._monster_spot: Dict[MonsterId, SpotId] = dict(monster_spot or {})
         self._navigation = SpotGraphNavigationService()
+        # 経路表 (next-hop / hop 数)。接続の追加・削除・通行可否の変化で
+        # 影響する row だけ捨てる。永続化はしない (復元後に必要な分だけ埋め直す)
+        self._routing = SpotRoutingTable()
+        # 通行条件に現れる (item_spec_id 集合, flag 名集合)。経路表の signature を
+        # 「条件に関係する所持品 / フラグだけ」に絞るのに使う。接続の増減で None に戻す
+        self._routing_condition_keys: Optional[Tuple[FrozenSet[ItemSpecId], FrozenSet[str]]] = None
         self._validate_monster_presence_consistency()
 
     def _validate_monster_presence_consistency(self) -> None:
@@ -245,6 +255,8 @@ class SpotGraphAggregate(AggregateRoot):
     def _register_edge(self, conn: SpotConnection, *, emit_event: bool = False) -> None:
         self._connections_by_id[conn.connection_id] = conn
         self._outgoing.setdefault(conn.from_spot_id, []).append(conn.connection_id)
+        self._routing_condition_keys = None
+        self._routing.invalidate_through((conn.from_spot_id,))
         if emit_event:
             self.add_event(
                 ConnectionCreatedEvent.create(
@@ -601,6 +613,8 @@ class SpotGraphAggregate(AggregateRoot):
         new_conn = replace(conn, passage=new_passage)
         self._connections_by_id[connection_id] = new_conn
         traversability_changed = new_conn.passage.traversable != prev_traversable
+        if traversability_changed:
+            self._routing.invalidate_through((conn.from_spot_id,))
         if traversability_changed and emit_state_change_event:
             self.add_event(
                 ConnectionStateChangedEvent.create(
@@ -656,6 +670,8 @@ class SpotGraphAggregate(AggregateRoot):
                 rev_out.remove(rev_id)
             self._connections_by_id.pop(rev_id, None)
             self._reverse_connections.pop(rev_id, None)
+        self._routing_condition_keys = None
+        self._routing.invalidate_through((conn.from_spot_id, conn.to_spot_id))
         self.add_event(
             ConnectionDestroyedEvent.create(
                 aggregate_id=self._graph_id,
@@ -807,6 +823,109 @@ class SpotGraphAggregate(AggregateRoot):
         ok, _ = self._navigation.can_pass(conn, owned_item_spec_ids, world_flags)
         return ok
 
+    def next_hop_toward(
+        self,
+        from_spot_id: SpotId,
+        target_spot_id: SpotId,
+        owned_item_spec_ids: FrozenSet[ItemSpecId],
+        world_flags: FrozenSet[str],
+        *,
+        max_distance: Optional[int] = None,
+    ) -> Optional[ConnectionId]:
+        """`can_traverse_connection` を通る接続だけで target へ向かう最初の接続 ID。
+
+        `spot_path_finder.find_next_hop` に `can_traverse_connection` をフィルタ
+        として渡したときと同じ結果を、経路表の引きで返す (同 spot / 到達不可 /
+        `max_distance` 超過は None)。
+        """
+        if from_spot_id == target_spot_id:
+            return None
+        row = self._condition_routing_row(from_spot_id, owned_item_spec_ids, world_flags)
+        distance = row.distance.get(target_spot_id)
+        if distance is None or (max_distance is not None and distance > max_distance):
+            return None
+        return row.first_hop[target_spot_id]
+
+    def hop_distance_between(
+        self,
+        from_spot_id: SpotId,
+        target_spot_id: SpotId,
+        owned_item_spec_ids: FrozenSet[ItemSpecId],
+        world_flags: FrozenSet[str],
+        *,
+        max_distance: Optional[int] = None,
+    ) -> Optional[int]:
+        """`next_hop_toward` と同じ通行可否での最短 hop 数 (同 spot は 0)。
+
+        `spot_path_finder.find_hop_distance` の表引き版。到達不可 /
+        `max_distance` 超過は None。
+        """
+        if from_spot_id == target_spot_id:
+            return 0
+        row = self._condition_routing_row(from_spot_id, owned_item_spec_ids, world_flags)
+        distance = row.distance.get(target_spot_id)
+        if distance is None or (max_distance is not None and distance > max_distance):
+            return None
+        return distance
+
+    def traversable_route(self, from_spot_id: SpotId, to_spot_id: SpotId) -> List[SpotId]:
+        """`passage.traversable` な接続だけでの最短経路 (両端を含む spot 列)。
+
+        通行条件 (鍵・フラグ) は見ない。`SpotGraphNavigationService.calculate_route`
+        と同じ意味で、未登録 spot / 到達不能は空リスト、同 spot は `[spot]`。
+        """
+        if from_spot_id not in self._spots or to_spot_id not in self._spots:
+            return []
+        row = self._routing.row(
+            ("traversable",), from_spot_id, self._traversable_connections_from
+        )
+        return row.route_to(to_spot_id)
+
+    def _condition_routing_row(
+        self,
+        from_spot_id: SpotId,
+        owned_item_spec_ids: FrozenSet[ItemSpecId],
+        world_flags: FrozenSet[str],
+    ) -> SpotRoutingRow:
+        # signature は通行条件に現れる所持品 / フラグだけに絞る。条件と無関係な
+        # フラグが立っても表を作り直さずに済む
+        item_keys, flag_keys = self._condition_keys_for_routing()
+        owned = owned_item_spec_ids & item_keys
+        flags = world_flags & flag_keys
+        can_pass = self._navigation.can_pass
+
+        def passable_connections(spot_id: SpotId) -> List[SpotConnection]:
+            return [
+                conn
+                for conn in self._sorted_outgoing_connections(spot_id)
+                if can_pass(conn, owned, flags)[0]
+            ]
+
+        return self._routing.row(("conditions", owned, flags), from_spot_id, passable_connections)
+
+    def _traversable_connections_from(self, spot_id: SpotId) -> List[SpotConnection]:
+        return [c for c in self._sorted_outgoing_connections(spot_id) if c.passage.traversable]
+
+    def _sorted_outgoing_connections(self, spot_id: SpotId) -> List[SpotConnection]:
+        # find_next_hop と同じく接続 ID 昇順で展開し、同じ長さの経路の選び方を揃える
+        return sorted(
+            (self._connections_by_id[cid] for cid in self._outgoing.get(spot_id, [])),
+            key=lambda c: c.connection_id.value,
+        )
+
+    def _condition_keys_for_routing(self) -> Tuple[FrozenSet[ItemSpecId], FrozenSet[str]]:
+        if self._routing_condition_keys is None:
+            items = set()
+            flags = set()
+            for conn in self._connections_by_id.values():
+                for cond in conn.passage_conditions:
+                    if cond.item_spec_id is not None:
+                        items.add(cond.item_spec_id)
+                    if cond.flag_name:
+                        flags.add(cond.flag_name)
+            self._routing_condition_keys = (frozenset(items), frozenset(flags))
+        return self._routing_condition_keys
+
     def move_monster(
         self,
         monster_id: MonsterId,
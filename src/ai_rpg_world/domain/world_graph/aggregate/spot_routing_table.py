@@ -0,0 +1,137 @@
+"""SpotGraphAggregate が持つ、通行可否フィルタごとの next-hop / hop 数の表。
+
+``spot_path_finder.find_next_hop`` は CHASE 中のモンスター 1 体・1 query ごとに
+BFS をやり直し、展開のたびに出方向の接続を ID で並べ替えていた。グラフの形と
+通行可否は tick をまたいでほとんど変わらないので、本表は
+
+    signature (通行可否を決める入力) → 出発 spot → BFS 木
+
+を保持し、同じ出発 spot からの問い合わせを表引きにする。BFS 木 1 本 (row) から
+全到達先への「最初の 1 hop」「hop 数」「経路」が引けるので、全対 (all-pairs) の
+表を出発 spot ごとに必要になった分だけ埋めていく形になる。
+
+展開順は ``find_next_hop`` と同じ「出方向の接続 ID 昇順」で、同じ長さの経路が
+複数あるときも従来と同じ接続を返す。``max_distance`` 付き BFS は打ち切り前に
+見つかった spot について打ち切りなし BFS と同じ先行 spot を選ぶので、打ち切りは
+表引き後に hop 数で判定すれば足りる。
+
+無効化は row 単位で行う。接続 ``a → b`` の通行可否が変わる (追加・削除を含む)
+と影響を受けうるのは ``a`` に到達している row だけなので (到達していない row は
+その接続を展開しない)、変化した接続の出発 spot を含む row だけを捨てる。
+signature は数が増えすぎないよう、最近使ったものを ``max_signatures`` 個まで
+残す。
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from ai_rpg_world.domain.world.value_object.spot_id import SpotId
+from ai_rpg_world.domain.world_graph.entity.spot_connection import SpotConnection
+from ai_rpg_world.domain.world_graph.value_object.connection_id import ConnectionId
+
+# spot から、展開すべき (= フィルタを通った) 出方向接続を ID 昇順で返す callable
+PassableConnections = Callable[[SpotId], Iterable[SpotConnection]]
+
+DEFAULT_MAX_SIGNATURES = 8
+
+
+class SpotRoutingRow:
+    """1 つの出発 spot から張った BFS 木。"""
+
+    __slots__ = ("source", "first_hop", "distance", "predecessor")
+
+    def __init__(self, source: SpotId) -> None:
+        self.source = source
+        # 到達先 → 出発 spot から出る最初の接続
+        self.first_hop: Dict[SpotId, ConnectionId] = {}
+        # 到達先 → hop 数 (出発 spot 自身は 0)
+        self.distance: Dict[SpotId, int] = {source: 0}
+        # 到達先 → (1 つ手前の spot, そこから来た接続)
+        self.predecessor: Dict[SpotId, Tuple[SpotId, ConnectionId]] = {}
+
+    def reaches(self, spot_id: SpotId) -> bool:
+        return spot_id in self.distance
+
+    def route_to(self, target: SpotId) -> List[SpotId]:
+        """出発 spot から target までの spot 列 (両端を含む)。到達不能なら空。"""
+        if target not in self.distance:
+            return []
+        route = [target]
+        cursor = target
+        while cursor != self.source:
+            cursor = self.predecessor[cursor][0]
+            route.append(cursor)
+        route.reverse()
+        return route
+
+
+def build_routing_row(source: SpotId, passable_connections: PassableConnections) -> SpotRoutingRow:
+    """``source`` から BFS して row を作る。展開順は ``passable_connections`` の順。"""
+    row = SpotRoutingRow(source)
+    first_hop = row.first_hop
+    distance = row.distance
+    predecessor = row.predecessor
+    queue: deque[SpotId] = deque([source])
+    while queue:
+        current = queue.popleft()
+        depth = distance[current] + 1
+        hop = first_hop.get(current)
+        for conn in passable_connections(current):
+            nxt = conn.to_spot_id
+            if nxt in distance:
+                continue
+            distance[nxt] = depth
+            predecessor[nxt] = (current, conn.connection_id)
+            first_hop[nxt] = hop if hop is not None else conn.connection_id
+            queue.append(nxt)
+    return row
+
+
+class SpotRoutingTable:
+    """signature → 出発 spot → ``SpotRoutingRow`` のキャッシュ。"""
+
+    def __init__(self, max_signatures: int = DEFAULT_MAX_SIGNATURES) -> None:
+        if max_signatures < 1:
+            raise ValueError(f"max_signatures must be 1 or greater: {max_signatures}")
+        self._max_signatures = max_signatures
+        self._rows: "OrderedDict[Hashable, Dict[SpotId, SpotRoutingRow]]" = OrderedDict()
+
+    def row(
+        self,
+        signature: Hashable,
+        source: SpotId,
+        passable_connections: PassableConnections,
+    ) -> SpotRoutingRow:
+        """row を返す。無ければ ``passable_connections`` で BFS して登録する。"""
+        rows = self._rows.get(signature)
+        if rows is None:
+            rows = self._rows[signature] = {}
+            if len(self._rows) > self._max_signatures:
+                self._rows.popitem(last=False)
+        else:
+            self._rows.move_to_end(signature)
+        row = rows.get(source)
+        if row is None:
+            row = rows[source] = build_routing_row(source, passable_connections)
+        return row
+
+    def invalidate_through(self, spot_ids: Iterable[SpotId]) -> None:
+        """``spot_ids`` のいずれかに到達している row を全 signature から捨てる。"""
+        spots = tuple(spot_ids)
+        for rows in self._rows.values():
+            stale = [
+                source for source, row in rows.items() if any(s in row.distance for s in spots)
+            ]
+            for source in stale:
+                del rows[source]
+
+    def clear(self) -> None:
+        self._rows.clear()
+
+    def cached_row_count(self, signature: Optional[Hashable] = None) -> int:
+        """キャッシュ済みの row 数 (テスト・計測用)。signature 省略時は全体。"""
+        if signature is not None:
+            return len(self._rows.get(signature, {}))
+        return sum(len(rows) for rows in self._rows.values())
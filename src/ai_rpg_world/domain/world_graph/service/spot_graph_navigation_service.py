@@ -45,7 +45,13 @@ class SpotGraphNavigationService:
         from_spot_id: SpotId,
         to_spot_id: SpotId,
     ) -> List[SpotId]:
-        """BFS で最短経路（スポットIDのリスト）。到達不能時は空リスト。"""
+        """BFS で最短経路（スポットIDのリスト）。到達不能時は空リスト。
+
+        graph が経路表 (`traversable_route`) を持つならそれを引く。
+        """
+        traversable_route = getattr(graph, "traversable_route", None)
+        if traversable_route is not None:
+            return traversable_route(from_spot_id, to_spot_id)
         if not graph.contains_spot(from_spot_id) or not graph.contains_spot(to_spot_id):
             return []
         if from_spot_id == to_spot_id:
@@ -56,6 +56,7 @@ from ai_rpg_world.infrastructure.repository.in_memory_post_repository import InM
 from ai_rpg_world.infrastructure.repository.in_memory_sns_user_repository import InMemorySnsUserRepository
 from ai_rpg_world.infrastructure.repository.in_memory_sns_notification_repository import InMemorySnsNotificationRepository
 from ai_rpg_world.infrastructure.repository.in_memory_reply_repository import InMemoryReplyRepository
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import SqliteConnectionPool
 from ai_rpg_world.infrastructure.repository.sqlite_post_repository import SqlitePostRepository
 from ai_rpg_world.infrastructure.repository.sqlite_reply_repository import SqliteReplyRepository
 from ai_rpg_world.infrastructure.repository.sqlite_sns_notification_repository import (
@@ -157,20 +158,16 @@ class SqliteSocialDependencyInjectionContainer:
 
     def __init__(self, database: Union[str, Path]):
         self._database = Path(database)
-        self._connection: Optional[sqlite3.Connection] = None
+        self._connection: Optional[SqliteConnectionPool] = None
         self._unit_of_work_factory: Optional[SqliteUnitOfWorkFactory] = None
         self._user_repository: Optional[SqliteSnsUserRepository] = None
         self._post_repository: Optional[SqlitePostRepository] = None
         self._notification_repository: Optional[SqliteSnsNotificationRepository] = None
         self._reply_repository: Optional[SqliteReplyRepository] = None
 
-    def _get_connection(self) -> sqlite3.Connection:
+    def _get_connection(self) -> SqliteConnectionPool:
         if self._connection is None:
-            connection = sqlite3.connect(
-                str(self._database),
-                check_same_thread=False,
-            )
-            connection.row_factory = sqlite3.Row
+            connection = SqliteConnectionPool(self._database, row_factory=sqlite3.Row)
             bootstrap_social_schema(connection)
             self._connection = connection
         return self._connection
@@ -222,7 +219,7 @@ class SqliteGameDependencyInjectionContainer:
 
     def __init__(self, database: Union[str, Path]):
         self._database = Path(database)
-        self._connection: Optional[sqlite3.Connection] = None
+        self._connection: Optional[SqliteConnectionPool] = None
         self._unit_of_work_factory: Optional[SqliteUnitOfWorkFactory] = None
         self._world_state: Optional[WorldStateSqliteRepositories] = None
         self._static_master: Optional[StaticMasterSqliteRepositories] = None
@@ -234,13 +231,9 @@ class SqliteGameDependencyInjectionContainer:
         self._social: Optional[SocialSqliteRepositories] = None
         self._trade_command_repositories: Optional[tuple] = None
 
-    def _get_connection(self) -> sqlite3.Connection:
+    def _get_connection(self) -> SqliteConnectionPool:
         if self._connection is None:
-            connection = sqlite3.connect(
-                str(self._database),
-                check_same_thread=False,
-            )
-            connection.row_factory = sqlite3.Row
+            connection = SqliteConnectionPool(self._database, row_factory=sqlite3.Row)
             bootstrap_social_schema(connection)
             self._connection = connection
         return self._connection
@@ -1,5 +1,23 @@
 """LLM インフラ層（LiteLLM 等の ILLMClient 実装）"""
 
 from ai_rpg_world.infrastructure.llm.litellm_client import LiteLLMClient
+from ai_rpg_world.infrastructure.llm.llm_request_scheduler import (
+    LlmRequestPriority,
+    LlmRequestScheduler,
+    LlmRequestSchedulerSettings,
+    shared_llm_request_scheduler,
+)
+from ai_rpg_world.infrastructure.llm.llm_response_cache import (
+    LlmResponseCache,
+    shared_llm_response_cache,
+)
 
-__all__ = ["LiteLLMClient"]
+__all__ = [
+    "LiteLLMClient",
+    "LlmRequestPriority",
+    "LlmRequestScheduler",
+    "LlmRequestSchedulerSettings",
+    "LlmResponseCache",
+    "shared_llm_request_scheduler",
+    "shared_llm_response_cache",
+]
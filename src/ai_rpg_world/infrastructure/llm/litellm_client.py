@@ -17,7 +17,8 @@ import copy
 import os
 import re
 import time
-from typing import Any, Callable, Dict, List, Mapping, Optional
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Mapping, Optional
 
 import litellm
 from litellm import AuthenticationError as LitellmAuthenticationError
@@ -47,6 +48,14 @@ from ai_rpg_world.application.llm.contracts.llm_call_metrics import (
     LlmCallMetricsSink,
 )
 from ai_rpg_world.application.llm.exceptions import LlmApiCallException
+from ai_rpg_world.infrastructure.llm.llm_request_scheduler import (
+    LlmRequestPriority,
+    LlmRequestScheduler,
+)
+from ai_rpg_world.infrastructure.llm.llm_response_cache import (
+    CachedLlmResponse,
+    LlmResponseCache,
+)
 
 _DEFAULT_MODEL = "openai/gpt-5-mini"
 DEFAULT_LLM_MODEL = _DEFAULT_MODEL
@@ -137,6 +146,16 @@ _VALID_REASONING_EFFORTS = frozenset({
     "xhigh",
 })
 
+# provider の prompt cache breakpoint (``LLM_PROMPT_CACHE_BREAKPOINTS``)。
+# Anthropic 系は ``cache_control`` を置いた位置までしか prefix cache しない。
+# litellm の ``cache_control_injection_points`` で system message と、
+# prefix_stable layout が切り出した安定 user message に breakpoint を置く。
+# - "off": 付けない (既定。OpenAI / DeepSeek / vLLM は自動 prefix cache)
+# - "auto": モデル名が Anthropic 系のときだけ付ける
+# - "on": 常に付ける (cache_control を解釈する proxy / 互換 backend 向け)
+_VALID_PROMPT_CACHE_BREAKPOINTS = frozenset({"off", "auto", "on"})
+_CACHE_CONTROL_MODEL_MARKERS = ("anthropic", "claude")
+
 # 選択的リトライ (PR #X): max_retries=0 (litellm/openai SDK の透過リトライ無効化) を
 # 維持しつつ、本クラスのアプリ層で「特定の一時失敗」だけを手動 backoff で retry する。
 #
@@ -250,6 +269,42 @@ def _build_reasoning_block(effort: str) -> Optional[Dict[str, Any]]:
     }
 
 
+def _prompt_cache_breakpoints_enabled(mode: str, model: str) -> bool:
+    """``LLM_PROMPT_CACHE_BREAKPOINTS`` とモデル名から breakpoint を付けるか決める。"""
+    normalized = mode.strip().lower()
+    if normalized not in _VALID_PROMPT_CACHE_BREAKPOINTS:
+        raise ValueError(
+            f"prompt_cache_breakpoints={mode!r} is not recognized. "
+            f"valid: {sorted(_VALID_PROMPT_CACHE_BREAKPOINTS)}"
+        )
+    if normalized == "auto":
+        lowered = model.lower()
+        return any(marker in lowered for marker in _CACHE_CONTROL_MODEL_MARKERS)
+    return normalized == "on"
+
+
+def _cache_control_injection_points(
+    messages: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """system message と、直後にも user が続く最初の user message に breakpoint。
+
+    後者は prefix_stable layout が切り出した安定 section 群 (ターン間で byte
+    不変)。指示文を含む最後の user message には置かない (毎ターン変わるので
+    cache 書き込みの割増だけ払うことになる)。
+    """
+    points: List[Dict[str, Any]] = []
+    if any(message.get("role") == "system" for message in messages):
+        points.append({"location": "message", "role": "system"})
+    for index in range(len(messages) - 1):
+        if (
+            messages[index].get("role") == "user"
+            and messages[index + 1].get("role") == "user"
+        ):
+            points.append({"location": "message", "index": index})
+            break
+    return points
+
+
 def _extract_first_json_object(text: str) -> str:
     """JSON mode が崩れて前後テキストやコードフェンスを含む応答から JSON object を抜き出す。"""
     stripped = text.strip()
@@ -324,6 +379,9 @@ class LiteLLMClient(
         wall_cap_seconds: Optional[float] = None,
         rate_limit_retry_attempts: int = _DEFAULT_RATE_LIMIT_RETRY_ATTEMPTS,
         rate_limit_retry_base_sleep: float = _DEFAULT_RATE_LIMIT_RETRY_BASE_SLEEP,
+        request_scheduler: Optional[LlmRequestScheduler] = None,
+        response_cache: Optional[LlmResponseCache] = None,
+        prompt_cache_breakpoints: str = "off",
     ) -> None:
         if not isinstance(model, str) or not model.strip():
             raise ValueError("model must be a non-empty string")
@@ -400,6 +458,20 @@ class LiteLLMClient(
         if self._wall_cap_seconds <= 0:
             raise ValueError("wall_cap_seconds must be greater than 0")
 
+        # 全 client 共有の優先度つき scheduler (``LLM_SCHEDULER_ENABLED``)。
+        # None なら従来どおり各呼び出し元の pool がそのまま provider を叩く。
+        self._request_scheduler = request_scheduler
+
+        # offline benchmark 用の record / replay cache (``LLM_REPLAY_MODE``)。
+        # None なら常に実 provider を叩く。
+        self._response_cache = response_cache
+
+        # agent turn (invoke) の system / 安定 user message に cache_control を
+        # 置くか。応答内容は変えないので replay の cache key には含めない。
+        self._prompt_cache_breakpoints = _prompt_cache_breakpoints_enabled(
+            prompt_cache_breakpoints, self._model
+        )
+
         self._logger = logging.getLogger(self.__class__.__name__)
 
     def _call_with_wall_cap(self, call_fn: Callable[[], Any]) -> Any:
@@ -447,10 +519,84 @@ class LiteLLMClient(
                     llm_provider="litellm_client",
                 )
 
-    def _call_with_selective_retry(self, call_fn):
+    def _request_slot(self, priority: LlmRequestPriority) -> ContextManager[Any]:
+        """scheduler があれば 1 attempt 分の入場枠を取る (無ければ何もしない)。"""
+        if self._request_scheduler is None:
+            return nullcontext()
+        return self._request_scheduler.slot(
+            priority, model=self._model, api_base=self._api_base
+        )
+
+    def _replay_lookup(
+        self, kind: str, payload: Mapping[str, Any]
+    ) -> tuple[Optional[str], int, Optional[CachedLlmResponse]]:
+        """cache があれば (key, occurrence, 保存済み応答) を返す。
+
+        replay mode の miss は ``miss_policy`` で解決する:
+        ``fail`` は LLM_REPLAY_CACHE_MISS で失敗、``stub`` は output=None の
+        応答 (= StubLlmClient 既定と同じ「tool_call なし」)、``live`` は応答
+        None を返して実 provider 呼び出し + 追記へ進ませる。
+        """
+        cache = self._response_cache
+        if cache is None:
+            return None, 0, None
+        key = cache.key_for(kind, payload)
+        occurrence = cache.next_occurrence(key)
+        cached = cache.lookup(key, occurrence)
+        if cached is not None or cache.mode != "replay":
+            return key, occurrence, cached
+        if cache.miss_policy == "fail":
+            raise LlmApiCallException(
+                f"LLM replay cache miss ({kind}, key={key[:12]}, occurrence={occurrence})",
+                error_code="LLM_REPLAY_CACHE_MISS",
+            )
+        if cache.miss_policy == "stub":
+            self._logger.warning(
+                "LLM replay cache miss (%s, key=%s); falling back to stub response",
+                kind,
+                key[:12],
+            )
+            return key, occurrence, CachedLlmResponse(
+                output=None,
+                metrics={"success": False, "error_code": "LLM_REPLAY_CACHE_MISS"},
+            )
+        return key, occurrence, None
+
+    def _record_response(
+        self,
+        key: Optional[str],
+        occurrence: int,
+        *,
+        kind: str,
+        output: Optional[Mapping[str, Any]],
+        metrics: Mapping[str, Any],
+    ) -> None:
+        """実 provider の応答を cache に追記する。書けなくても呼び出しは倒さない。"""
+        if self._response_cache is None or key is None:
+            return
+        try:
+            self._response_cache.record(
+                key,
+                occurrence,
+                kind=kind,
+                model=self._model,
+                output=output,
+                metrics=metrics,
+            )
+        except Exception:
+            self._logger.warning("LLM response cache record failed", exc_info=True)
+
+    def _call_with_selective_retry(
+        self,
+        call_fn,
+        priority: LlmRequestPriority = LlmRequestPriority.AGENT_TURN,
+    ):
         """RateLimit / 一時 5xx のみ手動 backoff で retry し、それ以外は即 raise。
 
         各 attempt は ``_call_with_wall_cap`` で wall-time 上限を強制される。
+        scheduler 設定時は attempt ごとに ``priority`` で入場枠を取り、backoff
+        sleep 中は枠を返す。429 は scheduler にも通知して provider 全体の送信
+        レートを絞る。
 
         SDK の透過 retry を無効化 (max_retries=0) しているため、ここで補う。
         timeout / auth / bad_request は retry しない:
@@ -466,10 +612,18 @@ class LiteLLMClient(
         last_exc: Optional[BaseException] = None
         for attempt in range(self._rate_limit_retry_attempts + 1):
             try:
-                return self._call_with_wall_cap(call_fn)
+                with self._request_slot(priority):
+                    return self._call_with_wall_cap(call_fn)
             except Exception as exc:
                 if not _is_retryable_transient_error(exc):
                     raise
+                if (
+                    isinstance(exc, LitellmRateLimitError)
+                    and self._request_scheduler is not None
+                ):
+                    self._request_scheduler.note_rate_limited(
+                        model=self._model, api_base=self._api_base
+                    )
                 last_exc = exc
                 if attempt >= self._rate_limit_retry_attempts:
                     break
@@ -619,7 +773,6 @@ class LiteLLMClient(
         ``session_id`` は OpenRouter の sticky routing 用で、同じ会話中は固定する。
         OpenRouter 以外へは送らず、messages の内容にも混ぜない。
         """
-        self._assert_can_call_litellm()
         if reasoning_effort is None:
             effective_reasoning_effort = self._reasoning_effort
             reasoning_override: Any = _NO_REASONING_OVERRIDE
@@ -631,6 +784,27 @@ class LiteLLMClient(
             if effective_reasoning_effort not in {"", "none"}
             else reasoning_effort
         )
+        # replay は API key 無し (完全 offline) でも回せるよう、key 検査より先に引く。
+        cache_key, cache_occurrence, cached = self._replay_lookup(
+            "invoke",
+            {
+                "model": self._model,
+                "messages": messages,
+                "tools": tools,
+                "tool_choice": tool_choice,
+                "reasoning_effort": effective_reasoning_effort,
+            },
+        )
+        if cached is not None:
+            self._emit_cached_metrics(
+                metrics_sink,
+                cached,
+                tool_choice=tool_choice,
+                phase=call_phase,
+                llm_call_id=_extract_llm_call_id(prompt_capture_context),
+            )
+            return dict(cached.output) if cached.output is not None else None
+        self._assert_can_call_litellm()
         start_monotonic = time.monotonic()
         try:
             completion_kw: Dict[str, Any] = {
@@ -660,6 +834,10 @@ class LiteLLMClient(
             extra_body = self._build_extra_body(reasoning_override=reasoning_override)
             if extra_body is not None:
                 completion_kw["extra_body"] = extra_body
+            if self._prompt_cache_breakpoints:
+                injection_points = _cache_control_injection_points(messages)
+                if injection_points:
+                    completion_kw["cache_control_injection_points"] = injection_points
             # SDK 透過 retry は max_retries=0 で無効化済み。RateLimit / 一時 5xx の
             # みアプリ層で短い backoff retry する。
             response = self._call_with_selective_retry(
@@ -757,34 +935,74 @@ class LiteLLMClient(
             discarded_tool_calls=discarded_tool_calls,
             tool_call_combination=tool_call_combination,
         )
+        call_metrics: Dict[str, Any] = {
+            "wall_latency_ms": wall_latency_ms,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
+            "reasoning_tokens": reasoning_tokens,
+            "cost_usd": cost_usd,
+            "success": tool_call is not None,
+            "error_code": None if tool_call is not None else "NO_TOOL_CALL",
+            "reasoning_effort": recorded_reasoning_effort,
+            "tool_choice": tool_choice,
+            "phase": call_phase,
+            "discarded_tool_calls": discarded_tool_calls,
+            **(
+                {"tool_call_combination": list(tool_call_combination)}
+                if tool_call_combination is not None
+                else {}
+            ),
+        }
         self._record_prompt_capture(
             prompt_capture_context,
             request_kwargs=completion_kw,
             response=response,
             error=None,
             output=tool_call,
-            metrics={
-                "wall_latency_ms": wall_latency_ms,
-                "prompt_tokens": prompt_tokens,
-                "completion_tokens": completion_tokens,
-                "cached_tokens": cached_tokens,
-                "reasoning_tokens": reasoning_tokens,
-                "cost_usd": cost_usd,
-                "success": tool_call is not None,
-                "error_code": None if tool_call is not None else "NO_TOOL_CALL",
-                "reasoning_effort": recorded_reasoning_effort,
-                "tool_choice": tool_choice,
-                "phase": call_phase,
-                "discarded_tool_calls": discarded_tool_calls,
-                **(
-                    {"tool_call_combination": list(tool_call_combination)}
-                    if tool_call_combination is not None
-                    else {}
-                ),
-            },
+            metrics=call_metrics,
+        )
+        self._record_response(
+            cache_key,
+            cache_occurrence,
+            kind="invoke",
+            output=tool_call,
+            metrics=call_metrics,
         )
         return tool_call
 
+    def _emit_cached_metrics(
+        self,
+        sink: Optional[LlmCallMetricsSink],
+        cached: CachedLlmResponse,
+        *,
+        tool_choice: ToolChoice,
+        phase: str,
+        llm_call_id: Optional[str],
+    ) -> None:
+        """replay した応答について、記録時の計測値で LLM_CALL metrics を流す。"""
+        m = cached.metrics
+        combination = m.get("tool_call_combination")
+        self._emit_metrics(
+            sink,
+            wall_latency_ms=int(m.get("wall_latency_ms", 0) or 0),
+            prompt_tokens=int(m.get("prompt_tokens", 0) or 0),
+            completion_tokens=int(m.get("completion_tokens", 0) or 0),
+            cached_tokens=int(m.get("cached_tokens", 0) or 0),
+            reasoning_tokens=int(m.get("reasoning_tokens", 0) or 0),
+            cost_usd=float(m.get("cost_usd", 0.0) or 0.0),
+            success=bool(m.get("success", cached.output is not None)),
+            error_code=m.get("error_code"),
+            reasoning_effort=m.get("reasoning_effort"),
+            tool_choice=tool_choice,
+            phase=phase,
+            llm_call_id=llm_call_id,
+            discarded_tool_calls=int(m.get("discarded_tool_calls", 0) or 0),
+            tool_call_combination=(
+                tuple(str(name) for name in combination) if combination else None
+            ),
+        )
+
     @staticmethod
     def _extract_tool_call_combination(response: Any) -> Optional[tuple[str, ...]]:
         """複数 tool_call の名前だけを返却順で返し、通常の1件なら None にする。"""
@@ -987,6 +1205,30 @@ class LiteLLMClient(
         収集しない。τ_sim 分析対象は Phase A の意思決定 LLM のみ。subjective 系の
         metrics が必要になったら専用の sink 引数を足すこと (現状の実験 #356 では不要)。
         """
+        return self._complete_json_object(
+            messages, priority=LlmRequestPriority.BACKGROUND
+        )
+
+    def _complete_json_object(
+        self,
+        messages: List[Dict[str, Any]],
+        *,
+        priority: LlmRequestPriority,
+    ) -> Dict[str, Any]:
+        """全補助 JSON 呼び出しの共通本体。``priority`` は scheduler の入場順位。"""
+        cache_key, cache_occurrence, cached = self._replay_lookup(
+            "json_object", {"model": self._model, "messages": messages}
+        )
+        if cached is not None:
+            if cached.output is None:
+                # stub 縮退: StubLlmClient は JSON port を持たないので、呼び出し元の
+                # 既存フォールバック (草案テンプレ等) に任せる。
+                raise LlmApiCallException(
+                    "LLM replay cache miss for JSON completion",
+                    error_code="LLM_REPLAY_CACHE_MISS",
+                )
+            return dict(cached.output)
+        start_monotonic = time.monotonic()
         # JSON 抽出は行動選択ではない。agent turn の thinking 設定を継承すると
         # 費用だけでなく json_object との provider 互換性も悪化するため、
         # knob を増やさず全補助 JSON 呼び出しで明示的に止める。
@@ -999,9 +1241,19 @@ class LiteLLMClient(
                     messages=messages,
                     response_format={"type": "json_object"},
                     **kwargs,
-                )
+                ),
+                priority=priority,
             )
         except Exception as e:
+            if (
+                isinstance(e, LlmApiCallException)
+                and e.error_code == "LLM_SCHEDULER_QUEUE_FULL"
+            ):
+                # scheduler の backpressure 拒否は想定内の縮退なので stack trace
+                # を出さず error_code を保ったまま返す。wall cap 超過など他の
+                # LlmApiCallException は従来どおり失敗として記録する。
+                self._logger.warning("LiteLLM subjective completion skipped: %s", e)
+                raise
             self._logger.exception("LiteLLM subjective completion failed: %s", e)
             error_code = "LLM_API_CALL_FAILED"
             if isinstance(e, LitellmAuthenticationError):
@@ -1039,14 +1291,28 @@ class LiteLLMClient(
                 "Subjective completion JSON root must be an object",
                 error_code="LLM_EPISODE_SUBJECTIVE_INVALID_JSON",
             )
+        self._record_response(
+            cache_key,
+            cache_occurrence,
+            kind="json_object",
+            output=parsed,
+            metrics={
+                "wall_latency_ms": int((time.monotonic() - start_monotonic) * 1000)
+            },
+        )
         return parsed
 
     def complete_episodic_reinterpretation_json(
         self,
         messages: List[Dict[str, Any]],
     ) -> Dict[str, Any]:
-        """tools 無しで想起後再解釈 JSON object を返す。"""
-        return self.complete_episode_subjective_json(messages)
+        """tools 無しで想起後再解釈 JSON object を返す。
+
+        agent の次ターンに効く再解釈なので、要約系より先に scheduler を通す。
+        """
+        return self._complete_json_object(
+            messages, priority=LlmRequestPriority.REINTERPRETATION
+        )
 
     def complete_semantic_gist_json(
         self,
@@ -1057,7 +1323,9 @@ class LiteLLMClient(
         ``complete_episode_subjective_json`` と同じ json_object 強制完了を
         使う (LLM 側から見れば同じ呼び出し)。失敗ハンドリングも共通。
         """
-        return self.complete_episode_subjective_json(messages)
+        return self._complete_json_object(
+            messages, priority=LlmRequestPriority.BACKGROUND
+        )
 
     def complete_belief_consolidation_json(
         self,
@@ -1068,7 +1336,9 @@ class LiteLLMClient(
         ``complete_episode_subjective_json`` と同じ json_object 強制完了を
         使う (LLM 側から見れば同じ呼び出し)。失敗ハンドリングも共通。
         """
-        return self.complete_episode_subjective_json(messages)
+        return self._complete_json_object(
+            messages, priority=LlmRequestPriority.BACKGROUND
+        )
 
     def complete_short_term_summary_json(
         self,
@@ -1079,7 +1349,9 @@ class LiteLLMClient(
         既存の json_object 強制完了をそのまま使う (LLM 側から見れば同じ呼出)。
         prompt 構築や parse は ``ShortTermMemorySummaryService`` 側の責務。
         """
-        return self.complete_episode_subjective_json(messages)
+        return self._complete_json_object(
+            messages, priority=LlmRequestPriority.BACKGROUND
+        )
 
     def complete_short_term_long_summary_json(
         self,
@@ -1090,7 +1362,9 @@ class LiteLLMClient(
         既存の json_object 強制完了をそのまま使う (LLM 側から見れば同じ呼出)。
         prompt 構築や parse は ``ShortTermMemoryLongSummaryService`` 側の責務。
         """
-        return self.complete_episode_subjective_json(messages)
+        return self._complete_json_object(
+            messages, priority=LlmRequestPriority.BACKGROUND
+        )
 
     def _parse_tool_call(
         self,
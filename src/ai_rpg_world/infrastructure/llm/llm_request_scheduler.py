@@ -0,0 +1,318 @@
+"""全 LLM 呼び出しを 1 か所で捌く優先度つき request scheduler。
+
+背景: ``LiteLLMClient`` は turn 用 ``ThreadPoolExecutor`` /
+``ThreadPoolEpisodicSubjectiveScheduler`` / ``ThreadPoolShortTermMemoryScheduler``
+/ belief consolidation・再解釈 coordinator / ``semantic_gist_service`` から
+それぞれ独立に叩かれる。各 pool は互いを知らずに自分の worker 数を決めるので、
+memory 系を ON にすると背景の要約が agent turn と同じ provider 枠を奪い合い、
+429 を誘発して turn latency が伸びていた。
+
+本 module は provider (= ``(model, api_base)``) ごとに次を 1 か所で強制する:
+
+- 優先度: ``AGENT_TURN`` > ``REINTERPRETATION`` > ``BACKGROUND``
+  (summary / gist / subjective / belief consolidation)。待ち行列は優先度順、
+  同順位は到着順
+- 同時実行上限 ``max_concurrency``。うち ``reserved_agent_turn_slots`` 本は
+  agent turn 専用で、背景系は残りの枠しか使えない
+- token bucket (``requests_per_second`` / ``burst``) による送信レート制限。
+  provider から 429 が返ったら bucket を空にして全優先度をいったん絞る
+- 背景系の待ち行列長上限 ``queue_limit``。溢れた呼び出しは待たずに
+  ``LLM_SCHEDULER_QUEUE_FULL`` で即失敗させる (呼び出し側は既存の
+  LlmApiCallException フォールバックで縮退する)。agent turn は拒否しない
+
+呼び出し側に executor を持たせ替えるのではなく、各 pool の worker thread が
+``slot()`` で入場待ちするだけの admission control にしている。既存 pool の
+寿命管理 (shutdown / drain) に触れずに全経路を 1 本の枠へ寄せられる。
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ai_rpg_world.application.llm.exceptions import LlmApiCallException
+
+
+class LlmRequestPriority(IntEnum):
+    """LLM 呼び出しの優先度 (値が小さいほど先に入場する)。"""
+
+    AGENT_TURN = 0
+    REINTERPRETATION = 1
+    BACKGROUND = 2
+
+
+@dataclass(frozen=True)
+class LlmRequestSchedulerSettings:
+    """scheduler の枠設定。``ResolvedLlmRuntimeConfig`` の ``llm_scheduler_*`` から組む。"""
+
+    max_concurrency: int = 8
+    reserved_agent_turn_slots: int = 1
+    requests_per_second: Optional[float] = None
+    burst: int = 4
+    queue_limit: int = 32
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be 1 or greater")
+        if not 0 <= self.reserved_agent_turn_slots < self.max_concurrency:
+            raise ValueError(
+                "reserved_agent_turn_slots must satisfy "
+                "0 <= reserved_agent_turn_slots < max_concurrency"
+            )
+        if self.requests_per_second is not None and self.requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if self.burst < 1:
+            raise ValueError("burst must be 1 or greater")
+        if self.queue_limit < 1:
+            raise ValueError("queue_limit must be 1 or greater")
+
+
+class _TokenBucket:
+    """``rate`` 個/秒で補充され、最大 ``capacity`` 個まで貯まる token bucket。"""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def seconds_until_token(self, now: float) -> float:
+        """次の 1 token が取れるまでの秒数 (取れるなら 0)。"""
+        self._refill(now)
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self._rate
+
+    def take(self) -> None:
+        self._tokens -= 1.0
+
+    def drain(self, now: float) -> None:
+        """429 を受けたときに貯金を捨て、以降は補充速度でしか通さない。"""
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+
+
+@dataclass
+class _PriorityCounters:
+    submitted: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    throttled: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    total_wait_ms: int = 0
+    max_wait_ms: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "total_wait_ms": self.total_wait_ms,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+
+@dataclass
+class _ProviderState:
+    bucket: Optional[_TokenBucket]
+    in_flight: int = 0
+    background_in_flight: int = 0
+    rate_limited: int = 0
+    waiting: List[Tuple[int, int]] = field(default_factory=list)
+    counters: Dict[LlmRequestPriority, _PriorityCounters] = field(
+        default_factory=lambda: {p: _PriorityCounters() for p in LlmRequestPriority}
+    )
+
+
+class LlmRequestScheduler:
+    """provider ごとの優先度つき admission control。
+
+    ``slot()`` の ``with`` 区間が 1 回の HTTP 呼び出し (retry の 1 attempt) に
+    相当する。retry の backoff sleep 中は枠を返すので、429 で寝ている背景
+    呼び出しが agent turn の枠を塞ぐことはない。
+    """
+
+    def __init__(self, settings: Optional[LlmRequestSchedulerSettings] = None) -> None:
+        self._settings = settings or LlmRequestSchedulerSettings()
+        self._cond = threading.Condition()
+        self._providers: Dict[Tuple[str, Optional[str]], _ProviderState] = {}
+        self._seq = itertools.count()
+
+    @property
+    def settings(self) -> LlmRequestSchedulerSettings:
+        return self._settings
+
+    def _state(self, key: Tuple[str, Optional[str]]) -> _ProviderState:
+        state = self._providers.get(key)
+        if state is None:
+            rps = self._settings.requests_per_second
+            state = _ProviderState(
+                bucket=_TokenBucket(rps, self._settings.burst) if rps else None
+            )
+            self._providers[key] = state
+        return state
+
+    @contextmanager
+    def slot(
+        self,
+        priority: LlmRequestPriority,
+        *,
+        model: str,
+        api_base: Optional[str] = None,
+    ) -> Iterator[None]:
+        """入場できるまで待ち、区間を抜けたら枠を返す。
+
+        背景系の待ち行列が ``queue_limit`` に達していたら待たずに
+        ``LlmApiCallException(error_code="LLM_SCHEDULER_QUEUE_FULL")`` を送出する。
+        """
+        key = (model, api_base)
+        state = self._acquire(priority, key)
+        try:
+            yield
+        finally:
+            with self._cond:
+                state.in_flight -= 1
+                if priority != LlmRequestPriority.AGENT_TURN:
+                    state.background_in_flight -= 1
+                self._cond.notify_all()
+
+    def note_rate_limited(self, *, model: str, api_base: Optional[str] = None) -> None:
+        """provider が 429 を返したことを通知し、token bucket を空にする。"""
+        with self._cond:
+            state = self._state((model, api_base))
+            state.rate_limited += 1
+            if state.bucket is not None:
+                state.bucket.drain(time.monotonic())
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """backpressure 観測用の counter を ``"model@api_base"`` ごとに返す。"""
+        with self._cond:
+            return {
+                f"{model}@{api_base or ''}": {
+                    "in_flight": state.in_flight,
+                    "rate_limited": state.rate_limited,
+                    "priorities": {
+                        priority.name.lower(): counters.as_dict()
+                        for priority, counters in state.counters.items()
+                    },
+                }
+                for (model, api_base), state in self._providers.items()
+            }
+
+    def _acquire(
+        self, priority: LlmRequestPriority, key: Tuple[str, Optional[str]]
+    ) -> _ProviderState:
+        with self._cond:
+            state = self._state(key)
+            counters = state.counters[priority]
+            counters.submitted += 1
+            if (
+                priority != LlmRequestPriority.AGENT_TURN
+                and counters.waiting >= self._settings.queue_limit
+            ):
+                counters.rejected += 1
+                raise LlmApiCallException(
+                    f"LLM scheduler queue is full for {priority.name.lower()} "
+                    f"(limit={self._settings.queue_limit})",
+                    error_code="LLM_SCHEDULER_QUEUE_FULL",
+                )
+            entry = (int(priority), next(self._seq))
+            heapq.heappush(state.waiting, entry)
+            counters.waiting += 1
+            counters.max_waiting = max(counters.max_waiting, counters.waiting)
+            started = time.monotonic()
+            throttled = False
+            try:
+                while True:
+                    delay = self._admission_delay(state, entry, priority)
+                    if delay == 0.0:
+                        break
+                    if delay is not None:
+                        throttled = True
+                    self._cond.wait(timeout=delay)
+            except BaseException:
+                state.waiting.remove(entry)
+                heapq.heapify(state.waiting)
+                counters.waiting -= 1
+                self._cond.notify_all()
+                raise
+            heapq.heappop(state.waiting)
+            counters.waiting -= 1
+            counters.admitted += 1
+            if throttled:
+                counters.throttled += 1
+            wait_ms = int((time.monotonic() - started) * 1000)
+            counters.total_wait_ms += wait_ms
+            counters.max_wait_ms = max(counters.max_wait_ms, wait_ms)
+            state.in_flight += 1
+            if priority != LlmRequestPriority.AGENT_TURN:
+                state.background_in_flight += 1
+            # 先頭が抜けたので、次の待ち手が自分の番かを見直せるよう起こす。
+            self._cond.notify_all()
+            return state
+
+    def _admission_delay(
+        self,
+        state: _ProviderState,
+        entry: Tuple[int, int],
+        priority: LlmRequestPriority,
+    ) -> Optional[float]:
+        """0.0 = 入場 (token 消費済み) / 正の秒数 = token 待ち / None = 枠待ち。"""
+        if state.waiting[0] != entry:
+            return None
+        if state.in_flight >= self._settings.max_concurrency:
+            return None
+        if priority != LlmRequestPriority.AGENT_TURN and (
+            state.background_in_flight
+            >= self._settings.max_concurrency - self._settings.reserved_agent_turn_slots
+        ):
+            return None
+        if state.bucket is not None:
+            delay = state.bucket.seconds_until_token(time.monotonic())
+            if delay > 0.0:
+                return delay
+            state.bucket.take()
+        return 0.0
+
+
+_SHARED_LOCK = threading.Lock()
+_SHARED_SCHEDULERS: Dict[LlmRequestSchedulerSettings, LlmRequestScheduler] = {}
+
+
+def shared_llm_request_scheduler(
+    settings: LlmRequestSchedulerSettings,
+) -> LlmRequestScheduler:
+    """同じ設定の呼び出し元すべてが共有する process 内 singleton を返す。
+
+    ``create_llm_client_from_config`` は機能ごとに別の ``LiteLLMClient`` を
+    作るので、枠を共有させるには scheduler を client の外で持つ必要がある。
+    """
+    with _SHARED_LOCK:
+        scheduler = _SHARED_SCHEDULERS.get(settings)
+        if scheduler is None:
+            scheduler = LlmRequestScheduler(settings)
+            _SHARED_SCHEDULERS[settings] = scheduler
+        return scheduler
+
+
+__all__ = [
+    "LlmRequestPriority",
+    "LlmRequestScheduler",
+    "LlmRequestSchedulerSettings",
+    "shared_llm_request_scheduler",
+]
@@ -0,0 +1,262 @@
+"""LLM 応答の record / replay cache (offline benchmark 用)。
+
+``create_world_runtime`` + ``scripts/run_scenario_experiment.py`` を network 無しで
+end-to-end に回し、「model 以外の全部」の CPU コストを再現可能に測るための層。
+
+- record: ``LiteLLMClient`` が実 provider から得た結果 (tool_call / JSON object)
+  と計測値を SQLite 1 ファイルへ追記する
+- replay: 同じ request が来たら保存済み結果を返す。``latency_scale`` > 0 なら
+  記録時の wall latency × scale だけ sleep して provider 待ちを模擬する
+
+key は request 内容の content hash (model / messages / tools / tool_choice /
+reasoning 設定)。同じ key が 1 run 内で複数回呼ばれることがある (同じ状況で
+同じ prompt になる) ので、key ごとの出現順 ``occurrence`` も主キーに含め、
+record 時の N 回目の応答を replay 時の N 回目に返す。記録より多く呼ばれたら
+最後に記録した応答を返す (決定的で、miss 扱いにはしない)。
+
+失敗した呼び出し (例外) は記録しない。replay で同じ request が来ると miss
+になり、``miss_policy`` に従う。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import SqliteConnectionPool
+from ai_rpg_world.infrastructure.repository.sqlite_migration import (
+    SqliteMigration,
+    apply_migrations,
+)
+
+_SCHEMA_NAMESPACE = "llm-response-cache-v1"
+
+VALID_LLM_REPLAY_MODES = frozenset({"off", "record", "replay"})
+# fail: LLM_REPLAY_CACHE_MISS で失敗させる (完全 offline の再現性検査向け)
+# stub: StubLlmClient 相当に縮退する (tool_call なし / JSON は失敗扱い)
+# live: 実 client に落として呼び、その結果を追記する (cache の継ぎ足し)
+VALID_LLM_REPLAY_MISS_POLICIES = frozenset({"fail", "stub", "live"})
+
+
+def _init_schema_v1(conn: sqlite3.Connection) -> None:
+    conn.executescript(
+        """
+        CREATE TABLE llm_response_cache (
+            cache_key TEXT NOT NULL,
+            occurrence INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            model TEXT NOT NULL,
+            output_json TEXT NOT NULL,
+            metrics_json TEXT NOT NULL,
+            recorded_at REAL NOT NULL,
+            PRIMARY KEY (cache_key, occurrence)
+        );
+        """
+    )
+
+
+@dataclass(frozen=True)
+class CachedLlmResponse:
+    """保存済み応答 1 件。``output`` は tool_call dict / JSON object / None。"""
+
+    output: Optional[Dict[str, Any]]
+    metrics: Mapping[str, Any]
+
+
+class LlmResponseCache:
+    """content-addressed な LLM 応答 store。thread safe (connection を lock で守る)。"""
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        mode: str,
+        miss_policy: str = "fail",
+        latency_scale: float = 0.0,
+    ) -> None:
+        if mode not in VALID_LLM_REPLAY_MODES - {"off"}:
+            raise ValueError(f"mode must be 'record' or 'replay', got: {mode!r}")
+        if miss_policy not in VALID_LLM_REPLAY_MISS_POLICIES:
+            raise ValueError(
+                f"miss_policy={miss_policy!r} is not recognized. "
+                f"valid: {sorted(VALID_LLM_REPLAY_MISS_POLICIES)}"
+            )
+        if latency_scale < 0:
+            raise ValueError("latency_scale must be 0 or greater")
+        self._conn = connection
+        self._mode = mode
+        self._miss_policy = miss_policy
+        self._latency_scale = float(latency_scale)
+        self._lock = threading.Lock()
+        # key ごとの「この run で何回目の呼び出しか」。record と replay で同じ順に
+        # 数えることで、同一 prompt の 2 回目以降にも記録時の応答を対応づける。
+        self._occurrences: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._recorded = 0
+        apply_migrations(
+            connection,
+            namespace=_SCHEMA_NAMESPACE,
+            migrations=[SqliteMigration(1, _init_schema_v1)],
+        )
+        connection.commit()
+
+    @classmethod
+    def connect(
+        cls,
+        database_path: str,
+        *,
+        mode: str,
+        miss_policy: str = "fail",
+        latency_scale: float = 0.0,
+    ) -> "LlmResponseCache":
+        conn = SqliteConnectionPool(database_path)
+        return cls(
+            conn, mode=mode, miss_policy=miss_policy, latency_scale=latency_scale
+        )
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def miss_policy(self) -> str:
+        return self._miss_policy
+
+    @staticmethod
+    def key_for(kind: str, payload: Mapping[str, Any]) -> str:
+        """request 内容から content hash を作る (dict の key 順に依存しない)。"""
+        canonical = json.dumps(
+            {"kind": kind, **payload},
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def next_occurrence(self, key: str) -> int:
+        """``key`` のこの run での出現番号 (0 始まり) を払い出す。"""
+        with self._lock:
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+            return occurrence
+
+    def lookup(self, key: str, occurrence: int) -> Optional[CachedLlmResponse]:
+        """replay 用。``occurrence`` 番目 (無ければ最後) の応答を返す。
+
+        hit なら記録時 latency × ``latency_scale`` だけ sleep してから返す。
+        record mode では常に None (必ず実 provider を叩く)。
+        """
+        if self._mode != "replay":
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT output_json, metrics_json FROM llm_response_cache
+                WHERE cache_key = ? AND occurrence <= ?
+                ORDER BY occurrence DESC LIMIT 1
+                """,
+                (key, occurrence),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        entry = CachedLlmResponse(
+            output=json.loads(row[0]),
+            metrics=json.loads(row[1]),
+        )
+        if self._latency_scale > 0:
+            wall_ms = float(entry.metrics.get("wall_latency_ms", 0) or 0)
+            time.sleep(wall_ms * self._latency_scale / 1000.0)
+        return entry
+
+    def record(
+        self,
+        key: str,
+        occurrence: int,
+        *,
+        kind: str,
+        model: str,
+        output: Optional[Mapping[str, Any]],
+        metrics: Mapping[str, Any],
+    ) -> None:
+        """応答を 1 件保存する (同じ key / occurrence は上書き)。"""
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_response_cache
+                    (cache_key, occurrence, kind, model, output_json,
+                     metrics_json, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    occurrence,
+                    kind,
+                    model,
+                    json.dumps(output, ensure_ascii=False),
+                    json.dumps(dict(metrics), ensure_ascii=False, default=str),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+            self._recorded += 1
+
+    def stats(self) -> Dict[str, int]:
+        """hit / miss / 記録件数 (benchmark の取りこぼし確認用)。"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "recorded": self._recorded,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_SHARED_LOCK = threading.Lock()
+_SHARED_CACHES: Dict[Tuple[str, str, str, float], LlmResponseCache] = {}
+
+
+def shared_llm_response_cache(
+    database_path: str,
+    *,
+    mode: str,
+    miss_policy: str = "fail",
+    latency_scale: float = 0.0,
+) -> LlmResponseCache:
+    """同じ設定の client 全員で 1 つの cache (= 1 connection / 出現順 counter) を共有する。
+
+    機能ごとに別 ``LiteLLMClient`` が作られるため、client ごとに cache を開くと
+    出現順の数え方が client 単位に割れて record と replay で対応がずれる。
+    """
+    settings = (database_path, mode, miss_policy, float(latency_scale))
+    with _SHARED_LOCK:
+        cache = _SHARED_CACHES.get(settings)
+        if cache is None:
+            cache = LlmResponseCache.connect(
+                database_path,
+                mode=mode,
+                miss_policy=miss_policy,
+                latency_scale=latency_scale,
+            )
+            _SHARED_CACHES[settings] = cache
+        return cache
+
+
+__all__ = [
+    "CachedLlmResponse",
+    "LlmResponseCache",
+    "VALID_LLM_REPLAY_MISS_POLICIES",
+    "VALID_LLM_REPLAY_MODES",
+    "shared_llm_response_cache",
+]
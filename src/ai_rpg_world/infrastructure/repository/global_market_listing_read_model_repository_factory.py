@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-import sqlite3
 from pathlib import Path
 from typing import Mapping, Optional, Union
 
@@ -20,6 +19,7 @@ from ai_rpg_world.infrastructure.repository.in_memory_global_market_listing_read
 from ai_rpg_world.infrastructure.repository.sqlite_global_market_listing_read_model_repository import (
     SqliteGlobalMarketListingReadModelRepository,
 )
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import open_sqlite_connection
 
 
 def create_global_market_listing_read_model_repository_from_path(
@@ -31,7 +31,7 @@ def create_global_market_listing_read_model_repository_from_path(
         return InMemoryGlobalMarketListingReadModelRepository()
     path = str(Path(db_path).expanduser().resolve())
     ensure_parent_dir(path)
-    conn = sqlite3.connect(path)
+    conn = open_sqlite_connection(path)
     return SqliteGlobalMarketListingReadModelRepository.for_standalone_connection(conn)
 
 
@@ -106,6 +106,8 @@ class InMemoryDataStore:
         # Item Domain
         self.items: Dict[ItemInstanceId, ItemAggregate] = {}
         self.next_item_instance_id = 1
+        # items の顔ぶれ (追加・削除・丸ごと差し替え) が変わるたびに進む版
+        self.item_population_revision = 0
         
         # World Domain
         self.physical_maps: Dict[SpotId, PhysicalMapAggregate] = {}
@@ -314,6 +316,7 @@ class InMemoryDataStore:
         self.skill_deck_progresses.clear()
         self.items.clear()
         self.next_item_instance_id = 1
+        self.item_population_revision += 1
         self.physical_maps.clear()
         self.weather_zones.clear()
         self.monsters.clear()
@@ -378,6 +381,7 @@ class InMemoryDataStore:
         self.skill_loadouts = snapshot.get("skill_loadouts", {})
         self.skill_deck_progresses = snapshot.get("skill_deck_progresses", {})
         self.items = snapshot["items"]
+        self.item_population_revision += 1
         self.sns_users = snapshot["sns_users"]
         self.posts = snapshot["posts"]
         self.replies = snapshot["replies"]
@@ -35,6 +35,8 @@ class InMemoryItemRepository(ItemRepository, InMemoryRepositoryBase):
         """保存"""
         cloned_aggregate = self._clone(aggregate)
         def operation():
+            if cloned_aggregate.item_instance_id not in self._data_store.items:
+                self._data_store.item_population_revision += 1
             self._data_store.items[cloned_aggregate.item_instance_id] = cloned_aggregate
             return cloned_aggregate
             
@@ -47,10 +49,15 @@ class InMemoryItemRepository(ItemRepository, InMemoryRepositoryBase):
         def operation():
             if item_instance_id in self._data_store.items:
                 del self._data_store.items[item_instance_id]
+                self._data_store.item_population_revision += 1
                 return True
             return False
         return self._execute_operation(operation)
 
+    def population_revision(self) -> int:
+        """instance の追加・削除で変わる値。中身 (state 等) の更新では変わらない。"""
+        return self._data_store.item_population_revision
+
     def find_by_spec_id(self, item_spec_id: ItemSpecId) -> List[ItemAggregate]:
         """アイテム仕様IDで検索"""
         return [
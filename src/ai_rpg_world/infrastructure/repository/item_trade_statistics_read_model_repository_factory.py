@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-import sqlite3
 from pathlib import Path
 from typing import Mapping, Optional, Union
 
@@ -20,6 +19,7 @@ from ai_rpg_world.infrastructure.repository.in_memory_item_trade_statistics_read
 from ai_rpg_world.infrastructure.repository.sqlite_item_trade_statistics_read_model_repository import (
     SqliteItemTradeStatisticsReadModelRepository,
 )
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import open_sqlite_connection
 
 
 def create_item_trade_statistics_read_model_repository_from_path(
@@ -31,7 +31,7 @@ def create_item_trade_statistics_read_model_repository_from_path(
         return InMemoryItemTradeStatisticsReadModelRepository()
     path = str(Path(db_path).expanduser().resolve())
     ensure_parent_dir(path)
-    conn = sqlite3.connect(path)
+    conn = open_sqlite_connection(path)
     return SqliteItemTradeStatisticsReadModelRepository.for_standalone_connection(conn)
 
 
@@ -0,0 +1,77 @@
+"""SQLite 集約 repository の一括 hydration helper。
+
+正規化テーブルから集約を組み立てる repository は、親 row 1 件ごとに子テーブルを
+``WHERE owner_id = ?`` で引いていた (N+1)。``find_all`` / ``find_by_ids`` では
+子テーブルごとに 1 本の query (``WHERE owner_id IN (...)``、全件なら WHERE 無し)
+で引き、Python 側で owner ごとに振り分ける。
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# SQLITE_MAX_VARIABLE_NUMBER の旧既定値 999 を下回るよう IN 句を分割する。
+_MAX_IN_PARAMS = 500
+
+
+def chunked(values: Sequence[Any], size: int = _MAX_IN_PARAMS) -> Iterator[Sequence[Any]]:
+    """``values`` を IN 句 1 本に収まる大きさに分ける。"""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def fetch_rows_by_keys(
+    conn: sqlite3.Connection,
+    *,
+    select_sql: str,
+    key_column: str,
+    keys: Optional[Sequence[Any]],
+    order_by: str,
+) -> List[sqlite3.Row]:
+    """``select_sql`` を ``key_column IN (keys)`` で絞って引く。
+
+    ``keys`` が None なら全件 (WHERE 無し)。空 sequence なら query を発行しない。
+    ``order_by`` は chunk ごとに効くので、chunk をまたいだ並びは keys 順になる。
+    """
+    if keys is None:
+        return conn.execute(f"{select_sql} ORDER BY {order_by}").fetchall()
+    rows: List[sqlite3.Row] = []
+    for chunk in chunked(list(keys)):
+        placeholders = ", ".join("?" for _ in chunk)
+        rows.extend(
+            conn.execute(
+                f"{select_sql} WHERE {key_column} IN ({placeholders}) ORDER BY {order_by}",
+                tuple(chunk),
+            ).fetchall()
+        )
+    return rows
+
+
+def fetch_grouped_rows(
+    conn: sqlite3.Connection,
+    *,
+    select_sql: str,
+    key_column: str,
+    keys: Optional[Sequence[Any]],
+    order_by: str,
+) -> Dict[Any, List[sqlite3.Row]]:
+    """子テーブルを 1 query (chunk 単位) で引き、``key_column`` ごとに振り分ける。
+
+    ``select_sql`` の列に ``key_column`` を含めること。各 owner 内の並びは
+    ``order_by`` (通常 ``key_column, index_column``) に従う。
+    """
+    grouped: Dict[Any, List[sqlite3.Row]] = defaultdict(list)
+    for row in fetch_rows_by_keys(
+        conn,
+        select_sql=select_sql,
+        key_column=key_column,
+        keys=keys,
+        order_by=order_by,
+    ):
+        grouped[row[key_column]].append(row)
+    return grouped
+
+
+__all__ = ["chunked", "fetch_grouped_rows", "fetch_rows_by_keys"]
@@ -45,6 +45,7 @@ from ai_rpg_world.domain.being.value_object.being_id import BeingId
 from ai_rpg_world.domain.being.value_object.being_snapshot import BeingSnapshot
 from ai_rpg_world.domain.player.value_object.player_id import PlayerId
 from ai_rpg_world.domain.world.value_object.world_id import WorldId
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import SqliteConnectionPool
 from ai_rpg_world.infrastructure.repository.sqlite_migration import (
     SqliteMigration,
     apply_migrations,
@@ -159,7 +160,7 @@ class SqliteBeingRepository(BeingRepository):
         本ファクトリ側では追加の commit を打たない (= 冗長 commit を排除し、
         将来同一接続を他 store と共有した際の挙動を予測可能に保つ)。
         """
-        conn = sqlite3.connect(database_path, check_same_thread=False)
+        conn = SqliteConnectionPool(database_path)
         return cls(conn)
 
     def save(self, being: Being) -> None:
@@ -21,6 +21,7 @@ from ai_rpg_world.domain.memory.semantic.value_object.belief_evidence import (
 from ai_rpg_world.domain.memory.semantic.value_object.belief_evidence_source_kind import (
     BeliefEvidenceSourceKind,
 )
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import SqliteConnectionPool
 from ai_rpg_world.infrastructure.repository.sqlite_migration import (
     SqliteMigration,
     apply_migrations,
@@ -119,7 +120,7 @@ class SqliteBeliefEvidenceBufferStore(BeliefEvidenceBufferRepository):
 
     @classmethod
     def connect(cls, database_path: str) -> "SqliteBeliefEvidenceBufferStore":
-        conn = sqlite3.connect(database_path, check_same_thread=False)
+        conn = SqliteConnectionPool(database_path)
         store = cls(conn)
         conn.commit()
         return store
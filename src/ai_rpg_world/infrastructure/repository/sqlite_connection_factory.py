@@ -0,0 +1,239 @@
+"""SQLite 接続の一元ファクトリ (接続 profile と per-thread 接続プール)。
+
+各 store / read model / UoW が個別に ``sqlite3.connect`` を呼ぶと、journal mode や
+cache 設定は SQLite の既定 (rollback journal・``synchronous=FULL``) のままになり、
+``put_by_being`` のような 1 呼び出し 1 commit の書き込みが毎回 fsync を伴う。
+ここで接続時の PRAGMA を 1 か所に揃える。
+
+- ``SqliteConnectionProfile``: WAL / ``synchronous=NORMAL`` / mmap / page cache /
+  temp_store / busy_timeout と prepared statement cache の大きさ
+- ``open_sqlite_connection``: profile を適用した接続を 1 本開く
+- ``SqliteConnectionPool``: 同じ DB ファイルに対してスレッドごとに 1 本の接続を
+  貸し出す。``sqlite3.Connection`` と同じ操作 (``execute`` / ``commit`` /
+  ``with conn:`` など) を呼び出し元スレッドの接続へ転送するので、これまで
+  ``check_same_thread=False`` の 1 本を共有していた store はそのまま差し替えられる
+
+WAL では読み手が書き手を待たないため、Phase A のワーカースレッドや非同期
+スケジューラが別スレッドから同じ DB を読んでも、1 本の接続上で直列化されない。
+書き手同士は ``busy_timeout`` の範囲で待ち合わせる。
+
+``:memory:`` は接続ごとに別 DB になるため、プールはスレッドを問わず 1 本の接続
+を共有する (従来どおりの挙動)。
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+_MEMORY_DATABASE = ":memory:"
+
+
+@dataclass(frozen=True)
+class SqliteConnectionProfile:
+    """接続ごとに適用する PRAGMA と接続オプション。
+
+    ``synchronous=NORMAL`` は WAL と組み合わせると commit ごとの fsync を
+    checkpoint 時にまとめる。電源断で直近の commit を失い得るが DB は壊れない
+    (ゲームの記憶・read model の用途ではこれで足りる)。
+    ``cache_size_kib`` は page cache の上限 (KiB、PRAGMA には負値で渡す)。
+    ``cached_statements`` は接続ごとの prepared statement cache の件数で、同じ SQL
+    文字列の再実行で parse を省く。
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size_bytes: int = 256 * 1024 * 1024
+    cache_size_kib: int = 32 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+    cached_statements: int = 256
+
+    def pragmas(self, *, in_memory: bool) -> List[Tuple[str, Any]]:
+        """適用順の ``(pragma, value)``。``:memory:`` では journal / mmap を除く。"""
+        out: List[Tuple[str, Any]] = []
+        if not in_memory:
+            out.append(("journal_mode", self.journal_mode))
+        out.append(("synchronous", self.synchronous))
+        if not in_memory:
+            out.append(("mmap_size", int(self.mmap_size_bytes)))
+        out.append(("cache_size", -int(self.cache_size_kib)))
+        out.append(("temp_store", self.temp_store))
+        out.append(("busy_timeout", int(self.busy_timeout_ms)))
+        return out
+
+
+DEFAULT_SQLITE_PROFILE = SqliteConnectionProfile()
+
+
+def _is_memory_database(database: str) -> bool:
+    return database == _MEMORY_DATABASE or database.startswith("file::memory:")
+
+
+def apply_sqlite_profile(
+    connection: sqlite3.Connection,
+    profile: SqliteConnectionProfile = DEFAULT_SQLITE_PROFILE,
+    *,
+    in_memory: bool = False,
+) -> None:
+    """既に開いている接続へ ``profile`` の PRAGMA を適用する。"""
+    for name, value in profile.pragmas(in_memory=in_memory):
+        # PRAGMA は bind parameter を受け付けない。値は profile 由来のみ。
+        connection.execute(f"PRAGMA {name}={value}")
+
+
+def open_sqlite_connection(
+    database: Union[str, Path],
+    *,
+    profile: SqliteConnectionProfile = DEFAULT_SQLITE_PROFILE,
+    check_same_thread: bool = True,
+    row_factory: Optional[Callable[..., Any]] = None,
+) -> sqlite3.Connection:
+    """``profile`` を適用した接続を 1 本開く。
+
+    ファイル DB なら親ディレクトリを作る。``row_factory`` を渡すと接続に設定する。
+    """
+    path = str(database)
+    in_memory = _is_memory_database(path)
+    if not in_memory:
+        Path(path).expanduser().resolve().parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        path,
+        timeout=profile.busy_timeout_ms / 1000.0,
+        check_same_thread=check_same_thread,
+        cached_statements=profile.cached_statements,
+    )
+    if row_factory is not None:
+        conn.row_factory = row_factory
+    apply_sqlite_profile(conn, profile, in_memory=in_memory)
+    return conn
+
+
+class SqliteConnectionPool:
+    """1 つの DB ファイルに対する per-thread 接続プール。
+
+    ``sqlite3.Connection`` の代わりに store へ渡せる。属性アクセス・
+    ``with pool:``・``row_factory`` の読み書きは、呼び出し元スレッドの接続に
+    転送する (無ければその場で開く)。終了したスレッドの接続は、次に別スレッドが
+    接続を開くときに閉じる。
+
+    ``close()`` は全スレッドの接続を閉じる。その後に使うと接続を開き直す。
+    """
+
+    def __init__(
+        self,
+        database: Union[str, Path],
+        *,
+        profile: SqliteConnectionProfile = DEFAULT_SQLITE_PROFILE,
+        row_factory: Optional[Callable[..., Any]] = None,
+    ) -> None:
+        self._database = str(database)
+        self._profile = profile
+        self._row_factory = row_factory
+        self._in_memory = _is_memory_database(self._database)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._by_thread: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._shared: Optional[sqlite3.Connection] = None
+
+    @property
+    def database(self) -> str:
+        return self._database
+
+    @property
+    def profile(self) -> SqliteConnectionProfile:
+        return self._profile
+
+    def connection(self) -> sqlite3.Connection:
+        """呼び出し元スレッドの接続を返す (無ければ開く)。"""
+        if self._in_memory:
+            return self._shared_connection()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        # 使うのは開いたスレッドだけだが、close() と終了スレッドの片付けは
+        # 別スレッドから呼ぶので同一スレッド検査は外す。
+        conn = open_sqlite_connection(
+            self._database,
+            profile=self._profile,
+            check_same_thread=False,
+            row_factory=self._row_factory,
+        )
+        current = threading.current_thread()
+        with self._lock:
+            self._close_dead_threads_locked()
+            self._by_thread[current.ident or 0] = (current, conn)
+        self._local.conn = conn
+        return conn
+
+    def _shared_connection(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._shared is None:
+                self._shared = open_sqlite_connection(
+                    self._database,
+                    profile=self._profile,
+                    check_same_thread=False,
+                    row_factory=self._row_factory,
+                )
+            return self._shared
+
+    def _close_dead_threads_locked(self) -> None:
+        dead = [ident for ident, (th, _) in self._by_thread.items() if not th.is_alive()]
+        for ident in dead:
+            _, conn = self._by_thread.pop(ident)
+            conn.close()
+
+    def open_connection_count(self) -> int:
+        """いま開いている接続の本数 (テスト・計測用)。"""
+        with self._lock:
+            return len(self._by_thread) + (1 if self._shared is not None else 0)
+
+    def close(self) -> None:
+        with self._lock:
+            conns = [conn for _, conn in self._by_thread.values()]
+            self._by_thread.clear()
+            if self._shared is not None:
+                conns.append(self._shared)
+                self._shared = None
+            # 他スレッドの thread-local は直接消せないので世代を進めて無効化する
+            self._local = threading.local()
+        for conn in conns:
+            conn.close()
+
+    @property
+    def row_factory(self) -> Optional[Callable[..., Any]]:
+        return self._row_factory
+
+    @row_factory.setter
+    def row_factory(self, value: Optional[Callable[..., Any]]) -> None:
+        with self._lock:
+            self._row_factory = value
+            conns = [conn for _, conn in self._by_thread.values()]
+            if self._shared is not None:
+                conns.append(self._shared)
+        for conn in conns:
+            conn.row_factory = value
+
+    def __getattr__(self, name: str) -> Any:
+        # execute / executemany / cursor / commit / rollback / in_transaction など
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.connection(), name)
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self.connection().__enter__()
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> Any:
+        return self.connection().__exit__(exc_type, exc, tb)
+
+
+__all__ = [
+    "DEFAULT_SQLITE_PROFILE",
+    "SqliteConnectionPool",
+    "SqliteConnectionProfile",
+    "apply_sqlite_profile",
+    "open_sqlite_connection",
+]
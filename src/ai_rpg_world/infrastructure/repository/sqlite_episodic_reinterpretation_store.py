@@ -23,6 +23,7 @@ from ai_rpg_world.domain.memory.episodic.value_object.episodic_reinterpretation_
 from ai_rpg_world.domain.memory.episodic.value_object.episodic_reinterpretation_status import EpisodicReinterpretationStatus
 from ai_rpg_world.domain.memory.episodic.repository.episodic_recall_buffer_repository import EpisodicRecallBufferRepository
 from ai_rpg_world.domain.memory.episodic.repository.episodic_reinterpretation_journal_repository import EpisodicReinterpretationJournalRepository
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import SqliteConnectionPool
 from ai_rpg_world.infrastructure.repository.sqlite_migration import (
     SqliteMigration,
     apply_migrations,
@@ -253,7 +254,7 @@ class SqliteEpisodicReinterpretationStore(
 
     @classmethod
     def connect(cls, database_path: str) -> SqliteEpisodicReinterpretationStore:
-        conn = sqlite3.connect(database_path, check_same_thread=False)
+        conn = SqliteConnectionPool(database_path)
         store = cls(conn)
         conn.commit()
         return store
@@ -0,0 +1,455 @@
+"""記憶 store 向けの group commit 接続 (書き込みを 1 transaction にまとめて遅延 commit する)。
+
+``SqliteSubjectiveEpisodeStore.put_by_being`` / ``SqliteSemanticMemoryStore.add_by_being``
+/ ``SqliteMemoryLinkStore.upsert_link_by_being`` / belief evidence buffer は、
+1 件書くたびに ``commit()`` する。主観補完のワーカースレッドと turn 経路から
+tick あたり何度も呼ばれるので、commit (= WAL への書き出しと、
+``synchronous=FULL`` なら fsync) が書き込み件数だけ発生する。
+
+``SqliteGroupCommitConnection`` は store に ``sqlite3.Connection`` の代わりに渡す
+接続で、store 側の 1 回の ``commit()`` までを 1 単位 (unit) として SAVEPOINT で
+囲み、実際の ``COMMIT`` は次のいずれかまで遅らせる。
+
+- 溜まった unit が ``max_units`` に達した
+- 最初の未 commit unit から ``max_delay_ms`` 経った。次の unit の ``commit()``
+  で確かめるほか、書き込みが途絶えても残らないよう timer thread が確かめる
+- ``flush()`` が呼ばれた (tick 終端・shutdown・snapshot capture)
+
+store の ``rollback()`` はその unit だけを ``ROLLBACK TO`` で取り消すので、他の
+unit の書き込みは巻き込まない。
+
+**read-your-writes**: 読み出しも同じ接続を通るので、未 commit の unit も
+SQLite の transaction 内の状態 (接続の page cache が overlay になる) として
+そのまま見える。スレッドをまたいでも同じ。その代わり、この接続を使う store は
+per-thread 接続プール (``SqliteConnectionPool``) の並列読み出しは使わない。
+
+unit の途中 (最初の書き込みから ``commit()`` / ``rollback()`` まで) は接続を
+そのスレッドが占有する。他スレッドは ``lock_timeout_ms`` まで待ち、超えたら
+``sqlite3.OperationalError`` (別接続が書き込みロックを持つときの SQLite と同じ)。
+unit を開いた最初の書き込み自体が失敗したときは、何も書いていないのでその場で
+unit を閉じる。2 文目以降の失敗は store 側が ``rollback()`` で閉じること
+(閉じないと占有が残り、他スレッドの書き込みがすべて待ちで落ちる)。
+
+``BEGIN`` / ``SAVEPOINT`` などを store が自分で打つ場合 (``apply_migrations``) や
+``executescript`` は、溜まった unit を先に commit してから素通しする。
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import (
+    DEFAULT_SQLITE_PROFILE,
+    SqliteConnectionProfile,
+    open_sqlite_connection,
+)
+
+DEFAULT_GROUP_COMMIT_MAX_DELAY_MS = 50
+DEFAULT_GROUP_COMMIT_MAX_UNITS = 256
+
+_UNIT_SAVEPOINT = "group_commit_unit"
+_TRANSACTION_CONTROL = frozenset({"BEGIN", "COMMIT", "END", "ROLLBACK", "SAVEPOINT", "RELEASE"})
+_READ_ONLY = frozenset({"SELECT", "PRAGMA", "EXPLAIN", "WITH", "VALUES"})
+
+_MODE_UNIT = "unit"
+_MODE_EXPLICIT = "explicit"
+
+
+def _leading_keyword(sql: str) -> str:
+    head = sql.lstrip()[:16].split(None, 1)
+    return head[0].upper() if head else ""
+
+
+@dataclass(frozen=True)
+class SqliteGroupCommitMetrics:
+    """group commit の累計値。
+
+    ``units_committed`` は store の ``commit()`` 回数 (= group commit が無ければ
+    COMMIT していた回数)、``transactions_committed`` は実際に打った COMMIT の回数。
+    ``synchronous=FULL`` では COMMIT ごとに fsync するので、後者が fsync 回数の
+    上限になる (WAL + ``synchronous=NORMAL`` では fsync は checkpoint 時のみ)。
+    ``unit_latency_ms_*`` は unit の最初の書き込みから ``commit()`` が返るまで
+    (= store の書き込み呼び出しが待つ時間)、``flush_latency_ms_*`` は COMMIT 1 回の時間。
+    """
+
+    units_committed: int
+    units_rolled_back: int
+    transactions_committed: int
+    pending_units: int
+    max_units_per_transaction: int
+    unit_latency_ms_total: float
+    unit_latency_ms_max: float
+    flush_latency_ms_total: float
+    flush_latency_ms_max: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "units_committed": self.units_committed,
+            "units_rolled_back": self.units_rolled_back,
+            "transactions_committed": self.transactions_committed,
+            "pending_units": self.pending_units,
+            "max_units_per_transaction": self.max_units_per_transaction,
+            "unit_latency_ms_total": round(self.unit_latency_ms_total, 3),
+            "unit_latency_ms_max": round(self.unit_latency_ms_max, 3),
+            "flush_latency_ms_total": round(self.flush_latency_ms_total, 3),
+            "flush_latency_ms_max": round(self.flush_latency_ms_max, 3),
+        }
+
+
+class _GroupCommitCursor:
+    """``connection.cursor()`` 経由の execute も unit の判定を通すための cursor。"""
+
+    def __init__(self, owner: "SqliteGroupCommitConnection") -> None:
+        self._owner = owner
+        self._cur: Optional[sqlite3.Cursor] = None
+
+    def execute(self, sql: str, parameters: Any = ()) -> "_GroupCommitCursor":
+        self._cur = self._owner.execute(sql, parameters)
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> "_GroupCommitCursor":
+        self._cur = self._owner.executemany(sql, seq_of_parameters)
+        return self
+
+    def _require(self) -> sqlite3.Cursor:
+        if self._cur is None:
+            raise sqlite3.ProgrammingError("cursor has not executed a statement")
+        return self._cur
+
+    def fetchone(self) -> Any:
+        return self._require().fetchone()
+
+    def fetchmany(self, size: int = 1) -> list[Any]:
+        return self._require().fetchmany(size)
+
+    def fetchall(self) -> list[Any]:
+        return self._require().fetchall()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._require())
+
+    @property
+    def rowcount(self) -> int:
+        return -1 if self._cur is None else self._cur.rowcount
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return None if self._cur is None else self._cur.lastrowid
+
+    @property
+    def description(self) -> Any:
+        return None if self._cur is None else self._cur.description
+
+    def close(self) -> None:
+        if self._cur is not None:
+            self._cur.close()
+
+
+class SqliteGroupCommitConnection:
+    """書き込みを unit 単位で SAVEPOINT に包み、COMMIT をまとめて打つ接続。"""
+
+    def __init__(
+        self,
+        database: Union[str, Path],
+        *,
+        max_delay_ms: int = DEFAULT_GROUP_COMMIT_MAX_DELAY_MS,
+        max_units: int = DEFAULT_GROUP_COMMIT_MAX_UNITS,
+        profile: SqliteConnectionProfile = DEFAULT_SQLITE_PROFILE,
+        lock_timeout_ms: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(max_delay_ms, bool) or not isinstance(max_delay_ms, int) or max_delay_ms < 0:
+            raise ValueError("max_delay_ms must be int >= 0")
+        if isinstance(max_units, bool) or not isinstance(max_units, int) or max_units < 1:
+            raise ValueError("max_units must be int >= 1")
+        self._raw = open_sqlite_connection(database, profile=profile, check_same_thread=False)
+        # BEGIN / COMMIT はこのクラスが打つ (sqlite3 module の implicit BEGIN を止める)
+        self._raw.isolation_level = None
+        self._max_delay_s = max_delay_ms / 1000.0
+        self._max_units = max_units
+        timeout_ms = profile.busy_timeout_ms if lock_timeout_ms is None else lock_timeout_ms
+        self._lock_timeout_s = max(0.0, timeout_ms / 1000.0)
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._owner: Optional[int] = None
+        self._mode: Optional[str] = None
+        self._unit_started_at = 0.0
+        self._pending_units = 0
+        self._oldest_pending_at: Optional[float] = None
+        self._units_committed = 0
+        self._units_rolled_back = 0
+        self._transactions_committed = 0
+        self._max_units_per_transaction = 0
+        self._unit_latency_total = 0.0
+        self._unit_latency_max = 0.0
+        self._flush_latency_total = 0.0
+        self._flush_latency_max = 0.0
+        self._delay_timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    # ---- lock / unit bookkeeping ------------------------------------------
+
+    @contextmanager
+    def _guard(self) -> Iterator[None]:
+        if not self._lock.acquire(timeout=self._lock_timeout_s):
+            raise sqlite3.OperationalError(
+                "database is locked (group commit unit held by another thread)"
+            )
+        try:
+            yield
+        finally:
+            self._lock.release()
+
+    def _owned_by_me(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def _hold_locked(self, mode: str) -> None:
+        # _guard の分とは別にもう 1 段取り、commit / rollback まで占有する
+        self._lock.acquire()
+        self._owner = threading.get_ident()
+        self._mode = mode
+
+    def _release_hold_locked(self) -> None:
+        self._owner = None
+        self._mode = None
+        self._lock.release()
+
+    def _begin_unit_locked(self) -> None:
+        if not self._raw.in_transaction:
+            self._raw.execute("BEGIN")
+        self._raw.execute(f"SAVEPOINT {_UNIT_SAVEPOINT}")
+        self._unit_started_at = self._clock()
+        self._hold_locked(_MODE_UNIT)
+
+    def _enter_explicit_locked(self) -> None:
+        self._flush_locked()
+        self._hold_locked(_MODE_EXPLICIT)
+
+    def _before_statement_locked(self, sql: str) -> tuple[str, bool]:
+        """文の前処理。(先頭キーワード, この文で unit を開いたか) を返す。"""
+        keyword = _leading_keyword(sql)
+        if not self._owned_by_me():
+            if keyword in _TRANSACTION_CONTROL:
+                self._enter_explicit_locked()
+            elif keyword not in _READ_ONLY:
+                self._begin_unit_locked()
+                return keyword, True
+        return keyword, False
+
+    def _abort_unit_locked(self) -> None:
+        self._raw.execute(f"ROLLBACK TO {_UNIT_SAVEPOINT}")
+        self._raw.execute(f"RELEASE {_UNIT_SAVEPOINT}")
+        self._units_rolled_back += 1
+        self._release_hold_locked()
+
+    def _after_statement_locked(self, keyword: str) -> None:
+        if (
+            self._mode == _MODE_EXPLICIT
+            and keyword in _TRANSACTION_CONTROL
+            and not self._raw.in_transaction
+        ):
+            self._release_hold_locked()
+
+    def _maybe_flush_locked(self) -> None:
+        if self._pending_units <= 0:
+            return
+        if self._pending_units >= self._max_units:
+            self._flush_locked()
+            return
+        assert self._oldest_pending_at is not None
+        if self._clock() - self._oldest_pending_at >= self._max_delay_s:
+            self._flush_locked()
+
+    def _arm_delay_timer_locked(self) -> None:
+        # 書き込みが途絶えると次の commit() が来ないので、max_delay_ms の上限を
+        # timer で守る。unit が溜まり始めたときに 1 つだけ張る。
+        if self._delay_timer is not None or self._closed:
+            return
+        timer = threading.Timer(self._max_delay_s, self._on_delay_elapsed)
+        timer.daemon = True
+        self._delay_timer = timer
+        timer.start()
+
+    def _cancel_delay_timer_locked(self) -> None:
+        timer, self._delay_timer = self._delay_timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _on_delay_elapsed(self) -> None:
+        try:
+            with self._guard():
+                self._delay_timer = None
+                if self._closed or self._owned_by_me():
+                    return
+                self._maybe_flush_locked()
+        except sqlite3.Error:
+            # 他スレッドの unit が占有し続けている。その unit の commit() が
+            # 期限を確かめるので、ここでは諦める
+            return
+
+    def _flush_locked(self) -> None:
+        self._cancel_delay_timer_locked()
+        if self._pending_units <= 0 and not self._raw.in_transaction:
+            return
+        started = time.perf_counter()
+        self._raw.commit()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self._transactions_committed += 1
+        self._max_units_per_transaction = max(self._max_units_per_transaction, self._pending_units)
+        self._flush_latency_total += elapsed_ms
+        self._flush_latency_max = max(self._flush_latency_max, elapsed_ms)
+        self._pending_units = 0
+        self._oldest_pending_at = None
+
+    # ---- sqlite3.Connection 互換 ------------------------------------------
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        with self._guard():
+            keyword, opened_unit = self._before_statement_locked(sql)
+            try:
+                cur = self._raw.execute(sql, parameters)
+            except Exception:
+                if opened_unit:
+                    self._abort_unit_locked()
+                raise
+            self._after_statement_locked(keyword)
+            return cur
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> sqlite3.Cursor:
+        with self._guard():
+            keyword, opened_unit = self._before_statement_locked(sql)
+            try:
+                cur = self._raw.executemany(sql, seq_of_parameters)
+            except Exception:
+                if opened_unit:
+                    self._abort_unit_locked()
+                raise
+            self._after_statement_locked(keyword)
+            return cur
+
+    def executescript(self, script: str) -> sqlite3.Cursor:
+        with self._guard():
+            if not self._owned_by_me():
+                self._flush_locked()
+            return self._raw.executescript(script)
+
+    def cursor(self) -> _GroupCommitCursor:
+        return _GroupCommitCursor(self)
+
+    def commit(self) -> None:
+        """呼び出しスレッドの unit を確定する。実際の COMMIT は条件が揃ったときだけ。"""
+        with self._guard():
+            if not self._owned_by_me():
+                self._maybe_flush_locked()
+                return
+            if self._mode == _MODE_EXPLICIT:
+                self._raw.commit()
+                self._transactions_committed += 1
+                self._release_hold_locked()
+                return
+            self._raw.execute(f"RELEASE {_UNIT_SAVEPOINT}")
+            now = self._clock()
+            latency_ms = (now - self._unit_started_at) * 1000.0
+            self._units_committed += 1
+            self._unit_latency_total += latency_ms
+            self._unit_latency_max = max(self._unit_latency_max, latency_ms)
+            self._pending_units += 1
+            if self._oldest_pending_at is None:
+                self._oldest_pending_at = now
+            self._release_hold_locked()
+            self._maybe_flush_locked()
+            if self._pending_units > 0:
+                self._arm_delay_timer_locked()
+
+    def rollback(self) -> None:
+        """呼び出しスレッドの unit だけを取り消す (他 unit の書き込みは残る)。"""
+        with self._guard():
+            if not self._owned_by_me():
+                return
+            if self._mode == _MODE_EXPLICIT:
+                self._raw.rollback()
+                self._release_hold_locked()
+                return
+            self._abort_unit_locked()
+
+    def flush(self) -> None:
+        """確定済み unit を今すぐ COMMIT する。
+
+        呼び出しスレッド自身の unit が開いている間は、その unit を途中で確定
+        しないよう何もしない (unit の ``commit()`` 後に改めて呼ぶこと)。
+        """
+        with self._guard():
+            if self._owned_by_me():
+                return
+            self._flush_locked()
+
+    @property
+    def in_transaction(self) -> bool:
+        """呼び出しスレッドが unit / 明示 transaction の途中か。
+
+        溜まっている未 COMMIT の unit はこの接続の内部状態なので含めない
+        (``apply_migrations`` が自分で BEGIN を打つ判断に使う)。
+        """
+        if not self._owned_by_me():
+            return False
+        return self._mode == _MODE_UNIT or self._raw.in_transaction
+
+    @property
+    def row_factory(self) -> Any:
+        return self._raw.row_factory
+
+    @row_factory.setter
+    def row_factory(self, value: Any) -> None:
+        self._raw.row_factory = value
+
+    def metrics(self) -> SqliteGroupCommitMetrics:
+        with self._guard():
+            return SqliteGroupCommitMetrics(
+                units_committed=self._units_committed,
+                units_rolled_back=self._units_rolled_back,
+                transactions_committed=self._transactions_committed,
+                pending_units=self._pending_units,
+                max_units_per_transaction=self._max_units_per_transaction,
+                unit_latency_ms_total=self._unit_latency_total,
+                unit_latency_ms_max=self._unit_latency_max,
+                flush_latency_ms_total=self._flush_latency_total,
+                flush_latency_ms_max=self._flush_latency_max,
+            )
+
+    def close(self) -> None:
+        """溜まった unit を COMMIT してから閉じる。"""
+        with self._guard():
+            if not self._owned_by_me():
+                self._flush_locked()
+            self._closed = True
+            self._cancel_delay_timer_locked()
+            self._raw.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._raw, name)
+
+    def __enter__(self) -> "SqliteGroupCommitConnection":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+__all__ = [
+    "DEFAULT_GROUP_COMMIT_MAX_DELAY_MS",
+    "DEFAULT_GROUP_COMMIT_MAX_UNITS",
+    "SqliteGroupCommitConnection",
+    "SqliteGroupCommitMetrics",
+]
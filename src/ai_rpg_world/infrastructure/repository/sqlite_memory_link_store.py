@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import datetime, timezone
+from typing import Sequence
 
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
 from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (
@@ -19,11 +20,16 @@ from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (
 from ai_rpg_world.domain.memory.episodic.repository.memory_link_repository import (
     MemoryLinkRepository,
 )
+from ai_rpg_world.infrastructure.repository.sqlite_batch_hydration import chunked
 from ai_rpg_world.infrastructure.repository.sqlite_memory_graph_schema import (
     apply_memory_graph_migrations,
 )
 
 
+# episode_id_a IN (...) OR episode_id_b IN (...) で 1 ID あたり 2 パラメタ使う
+_INCIDENT_CHUNK_SIZE = 400
+
+
 def _dt_from_iso(raw: str) -> datetime:
     return datetime.fromisoformat(raw.replace("Z", "+00:00"))
 
@@ -171,6 +177,43 @@ class SqliteMemoryLinkStore(MemoryLinkRepository):
         )
         return [_row_to_link(r) for r in cur.fetchall()]
 
+    def list_all_incident_links_for_episodes_by_being(
+        self,
+        being_id: BeingId,
+        episode_ids: Sequence[str],
+    ) -> dict[str, list[MemoryLink]]:
+        if not isinstance(being_id, BeingId):
+            raise TypeError("being_id must be BeingId")
+        ids = list(dict.fromkeys(e.strip() for e in episode_ids))
+        out: dict[str, list[MemoryLink]] = {eid: [] for eid in ids}
+        # 両端が別 chunk に居るリンクは 2 回返るので PK で重複を落とす
+        seen: set[tuple[str, str, str]] = set()
+        for chunk in chunked(ids, _INCIDENT_CHUNK_SIZE):
+            placeholders = ", ".join("?" for _ in chunk)
+            cur = self._conn.execute(
+                f"""
+                SELECT * FROM memory_links_by_being
+                WHERE being_id_value = ?
+                  AND (episode_id_a IN ({placeholders}) OR episode_id_b IN ({placeholders}))
+                """,
+                (being_id.value, *chunk, *chunk),
+            )
+            for row in cur.fetchall():
+                pk = (
+                    str(row["episode_id_a"]),
+                    str(row["episode_id_b"]),
+                    str(row["link_type"]),
+                )
+                if pk in seen:
+                    continue
+                seen.add(pk)
+                link = _row_to_link(row)
+                for endpoint in (link.episode_id_a, link.episode_id_b):
+                    bucket = out.get(endpoint)
+                    if bucket is not None:
+                        bucket.append(link)
+        return out
+
     def count_links_for_episode_by_being(
         self, being_id: BeingId, episode_id: str
     ) -> int:
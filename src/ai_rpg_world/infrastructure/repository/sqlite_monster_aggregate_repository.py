@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-import copy
 import sqlite3
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from ai_rpg_world.domain.monster.aggregate.monster_aggregate import MonsterAggregate
 from ai_rpg_world.domain.monster.repository.monster_repository import MonsterRepository
 from ai_rpg_world.domain.monster.value_object.monster_id import MonsterId
 from ai_rpg_world.domain.world.value_object.spot_id import SpotId
+from ai_rpg_world.domain.monster.value_object.monster_template import MonsterTemplate
 from ai_rpg_world.domain.world.value_object.world_object_id import WorldObjectId
 from ai_rpg_world.infrastructure.repository.game_write_sqlite_schema import (
     allocate_sequence_value,
     init_game_write_schema,
 )
+from ai_rpg_world.infrastructure.repository.sqlite_batch_hydration import (
+    fetch_grouped_rows,
+    fetch_rows_by_keys,
+)
 from ai_rpg_world.infrastructure.repository.sqlite_monster_state_codec import build_monster
 from ai_rpg_world.infrastructure.repository.sqlite_monster_template_repository import (
     SqliteMonsterTemplateRepository,
@@ -107,30 +111,36 @@ class SqliteMonsterAggregateRepository(MonsterRepository):
             "SELECT * FROM game_monsters WHERE monster_id = ?",
             (int(entity_id),),
         )
-        row = cur.fetchone()
-        if row is None:
-            return None
-        return copy.deepcopy(self._build_monster_from_row(row))
+        monsters = self._hydrate(cur.fetchall())
+        return monsters[0] if monsters else None
 
     def find_by_ids(self, entity_ids: List[MonsterId]) -> List[MonsterAggregate]:
-        return [x for monster_id in entity_ids for x in [self.find_by_id(monster_id)] if x is not None]
+        if not entity_ids:
+            return []
+        rows = fetch_rows_by_keys(
+            self._conn,
+            select_sql="SELECT * FROM game_monsters",
+            key_column="monster_id",
+            keys=[int(monster_id) for monster_id in entity_ids],
+            order_by="monster_id ASC",
+        )
+        by_id = {int(m.monster_id): m for m in self._hydrate(rows)}
+        return [by_id[int(mid)] for mid in entity_ids if int(mid) in by_id]
 
     def find_by_world_object_id(self, world_object_id: WorldObjectId) -> Optional[MonsterAggregate]:
         cur = self._conn.execute(
             "SELECT * FROM game_monsters WHERE world_object_id = ?",
             (int(world_object_id),),
         )
-        row = cur.fetchone()
-        if row is None:
-            return None
-        return copy.deepcopy(self._build_monster_from_row(row))
+        monsters = self._hydrate(cur.fetchall())
+        return monsters[0] if monsters else None
 
     def find_by_spot_id(self, spot_id: SpotId) -> List[MonsterAggregate]:
         cur = self._conn.execute(
             "SELECT * FROM game_monsters WHERE spot_id = ? ORDER BY monster_id ASC",
             (int(spot_id),),
         )
-        return [copy.deepcopy(self._build_monster_from_row(row)) for row in cur.fetchall()]
+        return self._hydrate(cur.fetchall())
 
     def find_by_pack_id(self, pack_id) -> List[MonsterAggregate]:
         """Phase 4-O C: 同 pack の member を引く。pack_id は str (PackId.value)。"""
@@ -138,10 +148,7 @@ class SqliteMonsterAggregateRepository(MonsterRepository):
             "SELECT * FROM game_monsters WHERE pack_id = ? ORDER BY monster_id ASC",
             (str(pack_id.value),),
         )
-        return [
-            copy.deepcopy(self._build_monster_from_row(row))
-            for row in cur.fetchall()
-        ]
+        return self._hydrate(cur.fetchall())
 
     def save(self, entity: MonsterAggregate) -> MonsterAggregate:
         self._assert_shared_transaction_active()
@@ -359,7 +366,7 @@ class SqliteMonsterAggregateRepository(MonsterRepository):
             if began_local_transaction and self._conn.in_transaction:
                 self._conn.rollback()
             raise
-        return copy.deepcopy(entity)
+        return entity
 
     def delete(self, entity_id: MonsterId) -> bool:
         self._assert_shared_transaction_active()
@@ -380,56 +387,78 @@ class SqliteMonsterAggregateRepository(MonsterRepository):
 
     def find_all(self) -> List[MonsterAggregate]:
         cur = self._conn.execute("SELECT * FROM game_monsters ORDER BY monster_id ASC")
-        return [copy.deepcopy(self._build_monster_from_row(row)) for row in cur.fetchall()]
+        return self._hydrate(cur.fetchall(), all_rows=True)
+
+    def _hydrate(
+        self, rows: Sequence[sqlite3.Row], *, all_rows: bool = False
+    ) -> List[MonsterAggregate]:
+        """親 row 群から集約を組み立てる。子テーブルは table ごとに 1 query で引く。
 
-    def _build_monster_from_row(self, row: sqlite3.Row) -> MonsterAggregate:
+        template は frozen な値オブジェクトなので、同じ template_id の monster 間で
+        1 回の読み出しを共有する。``all_rows`` は全件読みのときに WHERE を省く指定。
+        """
+        if not rows:
+            return []
+        keys = None if all_rows else [int(row["monster_id"]) for row in rows]
+        active_effects = self._children(
+            "SELECT monster_id, effect_type, effect_value, expiry_tick FROM game_monster_active_effects",
+            keys,
+            "monster_id ASC, effect_index ASC",
+        )
+        feed_memories = self._children(
+            "SELECT monster_id, object_id, x, y, z FROM game_monster_feed_memories",
+            keys,
+            "monster_id ASC, memory_index ASC",
+        )
+        pursuit_targets = self._children(
+            "SELECT * FROM game_monster_pursuit_target_snapshots", keys, "monster_id ASC"
+        )
+        pursuit_last_known = self._children(
+            "SELECT * FROM game_monster_pursuit_last_known", keys, "monster_id ASC"
+        )
         template_repo = SqliteMonsterTemplateRepository.for_connection(self._conn)
-        template = template_repo.find_by_id(int(row["template_id"]))
-        if template is None:
-            raise RuntimeError(
-                "game_monsters が参照する template_id に対応する game_monster_templates が見つかりません"
-            )
         loadout_repo = SqliteSkillLoadoutRepository.for_standalone_connection(self._conn)
-        loadout = loadout_repo.find_by_id(int(row["skill_loadout_id"]))
-        if loadout is None:
-            raise RuntimeError(
-                "game_monsters が参照する skill_loadout_id に対応する game_skill_loadouts が見つかりません"
+        templates: Dict[int, Optional[MonsterTemplate]] = {}
+        monsters = []
+        for row in rows:
+            template_id = int(row["template_id"])
+            if template_id not in templates:
+                templates[template_id] = template_repo.find_by_id(template_id)
+            template = templates[template_id]
+            if template is None:
+                raise RuntimeError(
+                    "game_monsters が参照する template_id に対応する game_monster_templates が見つかりません"
+                )
+            loadout = loadout_repo.find_by_id(int(row["skill_loadout_id"]))
+            if loadout is None:
+                raise RuntimeError(
+                    "game_monsters が参照する skill_loadout_id に対応する game_skill_loadouts が見つかりません"
+                )
+            monster_id = int(row["monster_id"])
+            target_rows = pursuit_targets.get(monster_id)
+            last_known_rows = pursuit_last_known.get(monster_id)
+            monsters.append(
+                build_monster(
+                    row=row,
+                    template=template,
+                    skill_loadout=loadout,
+                    active_effect_rows=active_effects.get(monster_id, []),
+                    feed_memory_rows=feed_memories.get(monster_id, []),
+                    pursuit_target_row=target_rows[0] if target_rows else None,
+                    pursuit_last_known_row=last_known_rows[0] if last_known_rows else None,
+                )
             )
-        monster_id = int(row["monster_id"])
-        active_effect_rows = self._conn.execute(
-            """
-            SELECT effect_type, effect_value, expiry_tick
-            FROM game_monster_active_effects
-            WHERE monster_id = ?
-            ORDER BY effect_index ASC
-            """,
-            (monster_id,),
-        ).fetchall()
-        feed_memory_rows = self._conn.execute(
-            """
-            SELECT object_id, x, y, z
-            FROM game_monster_feed_memories
-            WHERE monster_id = ?
-            ORDER BY memory_index ASC
-            """,
-            (monster_id,),
-        ).fetchall()
-        pursuit_target_row = self._conn.execute(
-            "SELECT * FROM game_monster_pursuit_target_snapshots WHERE monster_id = ?",
-            (monster_id,),
-        ).fetchone()
-        pursuit_last_known_row = self._conn.execute(
-            "SELECT * FROM game_monster_pursuit_last_known WHERE monster_id = ?",
-            (monster_id,),
-        ).fetchone()
-        return build_monster(
-            row=row,
-            template=template,
-            skill_loadout=loadout,
-            active_effect_rows=list(active_effect_rows),
-            feed_memory_rows=list(feed_memory_rows),
-            pursuit_target_row=pursuit_target_row,
-            pursuit_last_known_row=pursuit_last_known_row,
+        return monsters
+
+    def _children(
+        self, select_sql: str, keys: Optional[Sequence[int]], order_by: str
+    ) -> Dict[int, List[sqlite3.Row]]:
+        return fetch_grouped_rows(
+            self._conn,
+            select_sql=select_sql,
+            key_column="monster_id",
+            keys=keys,
+            order_by=order_by,
         )
 
 
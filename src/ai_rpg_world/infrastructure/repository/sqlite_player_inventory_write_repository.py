@@ -1,15 +1,22 @@
-"""プレイヤーインベントリ集約の SQLite 実装（ゲーム書き込み DB）。"""
+"""プレイヤーインベントリ集約の SQLite 実装（ゲーム書き込み DB）。
+
+``SqlitePlayerStatusWriteRepository`` と同じく、読み出しは子テーブルごとに
+1 query で一括 hydration し、組み立てた集約をそのまま返す (deepcopy しない)。
+"""
 from __future__ import annotations
 
-import copy
 import sqlite3
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from ai_rpg_world.domain.player.aggregate.player_inventory_aggregate import PlayerInventoryAggregate
 from ai_rpg_world.domain.player.enum.equipment_slot_type import EquipmentSlotType
 from ai_rpg_world.domain.player.repository.player_inventory_repository import PlayerInventoryRepository
 from ai_rpg_world.domain.player.value_object.player_id import PlayerId
 from ai_rpg_world.infrastructure.repository.game_write_sqlite_schema import init_game_write_schema
+from ai_rpg_world.infrastructure.repository.sqlite_batch_hydration import (
+    fetch_grouped_rows,
+    fetch_rows_by_keys,
+)
 from ai_rpg_world.infrastructure.repository.sqlite_player_state_codec import build_player_inventory
 
 
@@ -67,13 +74,12 @@ class SqlitePlayerInventoryWriteRepository(PlayerInventoryRepository):
         sink.add_events_from_aggregate(aggregate)
 
     def find_by_id(self, player_id: PlayerId) -> Optional[PlayerInventoryAggregate]:
-        row = self._conn.execute("SELECT * FROM game_player_inventories WHERE player_id = ?", (int(player_id),)).fetchone()
-        if row is None:
-            return None
-        return copy.deepcopy(self._build_inventory_from_row(row))
+        inventories = self._load(keys=[int(player_id)])
+        return inventories[0] if inventories else None
 
     def find_by_ids(self, player_ids: List[PlayerId]) -> List[PlayerInventoryAggregate]:
-        return [x for pid in player_ids for x in [self.find_by_id(pid)] if x is not None]
+        by_id = {int(x.player_id): x for x in self._load(keys=[int(pid) for pid in player_ids])}
+        return [by_id[int(pid)] for pid in player_ids if int(pid) in by_id]
 
     def save(self, inventory: PlayerInventoryAggregate) -> PlayerInventoryAggregate:
         self._assert_shared_transaction_active()
@@ -124,7 +130,7 @@ class SqlitePlayerInventoryWriteRepository(PlayerInventoryRepository):
             if began_local_transaction and self._conn.in_transaction:
                 self._conn.rollback()
             raise
-        return copy.deepcopy(inventory)
+        return inventory
 
     def delete(self, player_id: PlayerId) -> bool:
         self._assert_shared_transaction_active()
@@ -148,28 +154,57 @@ class SqlitePlayerInventoryWriteRepository(PlayerInventoryRepository):
         return cur.rowcount > 0
 
     def find_all(self) -> List[PlayerInventoryAggregate]:
-        cur = self._conn.execute("SELECT * FROM game_player_inventories ORDER BY player_id ASC")
-        return [copy.deepcopy(self._build_inventory_from_row(row)) for row in cur.fetchall()]
-
-    def _build_inventory_from_row(self, row: sqlite3.Row) -> PlayerInventoryAggregate:
-        player_id = int(row["player_id"])
-        inventory_slot_rows = self._conn.execute(
-            "SELECT slot_id, item_instance_id FROM game_player_inventory_slots WHERE player_id = ? ORDER BY slot_id ASC",
-            (player_id,),
-        ).fetchall()
-        equipment_slot_rows = self._conn.execute(
-            "SELECT equipment_slot_type, item_instance_id FROM game_player_equipment_slots WHERE player_id = ? ORDER BY equipment_slot_type ASC",
-            (player_id,),
-        ).fetchall()
-        reserved_item_rows = self._conn.execute(
-            "SELECT item_instance_id FROM game_player_reserved_items WHERE player_id = ? ORDER BY item_instance_id ASC",
-            (player_id,),
-        ).fetchall()
-        return build_player_inventory(
-            row=row,
-            inventory_slot_rows=list(inventory_slot_rows),
-            equipment_slot_rows=list(equipment_slot_rows),
-            reserved_item_rows=list(reserved_item_rows),
+        return self._load(keys=None)
+
+    def _load(self, *, keys: Optional[Sequence[int]]) -> List[PlayerInventoryAggregate]:
+        """親 row と子テーブルを table ごとに 1 query で引いて組み立てる (keys=None で全件)。"""
+        if keys is not None and not keys:
+            return []
+        rows = fetch_rows_by_keys(
+            self._conn,
+            select_sql="SELECT * FROM game_player_inventories",
+            key_column="player_id",
+            keys=keys,
+            order_by="player_id ASC",
+        )
+        if not rows:
+            return []
+        if keys is not None:
+            keys = [int(row["player_id"]) for row in rows]
+        inventory_slots = self._children(
+            "SELECT player_id, slot_id, item_instance_id FROM game_player_inventory_slots",
+            keys,
+            "player_id ASC, slot_id ASC",
+        )
+        equipment_slots = self._children(
+            "SELECT player_id, equipment_slot_type, item_instance_id FROM game_player_equipment_slots",
+            keys,
+            "player_id ASC, equipment_slot_type ASC",
+        )
+        reserved_items = self._children(
+            "SELECT player_id, item_instance_id FROM game_player_reserved_items",
+            keys,
+            "player_id ASC, item_instance_id ASC",
+        )
+        return [
+            build_player_inventory(
+                row=row,
+                inventory_slot_rows=inventory_slots.get(int(row["player_id"]), []),
+                equipment_slot_rows=equipment_slots.get(int(row["player_id"]), []),
+                reserved_item_rows=reserved_items.get(int(row["player_id"]), []),
+            )
+            for row in rows
+        ]
+
+    def _children(
+        self, select_sql: str, keys: Optional[Sequence[int]], order_by: str
+    ) -> Dict[int, List[sqlite3.Row]]:
+        return fetch_grouped_rows(
+            self._conn,
+            select_sql=select_sql,
+            key_column="player_id",
+            keys=keys,
+            order_by=order_by,
         )
 
 
@@ -1,17 +1,121 @@
-"""プレイヤーステータス集約の SQLite 実装（正規化テーブル、ゲーム書き込み DB）。"""
+"""プレイヤーステータス集約の SQLite 実装（正規化テーブル、ゲーム書き込み DB）。
+
+読み出しは親 row + 子テーブル (経路 / 効果 / 追跡 / 欲求) から毎回集約を組み立てる。
+組み立てた集約は呼び出し元専用の新しい instance なので deepcopy はしない。
+``find_all`` / ``find_by_ids`` は子テーブルごとに 1 query で引いて振り分け、
+``save_all`` は 1 transaction 内の executemany でまとめて書く。
+"""
 from __future__ import annotations
 
-import copy
 import json
 import sqlite3
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from ai_rpg_world.domain.player.aggregate.player_status_aggregate import PlayerStatusAggregate
 from ai_rpg_world.domain.player.repository.player_status_repository import PlayerStatusRepository
 from ai_rpg_world.domain.player.value_object.player_id import PlayerId
 from ai_rpg_world.infrastructure.repository.game_write_sqlite_schema import init_game_write_schema
+from ai_rpg_world.infrastructure.repository.sqlite_batch_hydration import (
+    chunked,
+    fetch_grouped_rows,
+    fetch_rows_by_keys,
+)
 from ai_rpg_world.infrastructure.repository.sqlite_player_state_codec import build_player_status
 
+_CHILD_TABLES = (
+    "game_player_navigation_path",
+    "game_player_active_effects",
+    "game_player_pursuit_target_snapshots",
+    "game_player_pursuit_last_known",
+    "game_player_needs",
+)
+
+_UPSERT_STATUS_SQL = """
+INSERT INTO game_player_statuses (
+    player_id,
+    base_max_hp, base_max_mp, base_attack, base_defense, base_speed, base_critical_rate, base_evasion_rate,
+    growth_hp_factor, growth_mp_factor, growth_attack_factor, growth_defense_factor, growth_speed_factor,
+    growth_critical_rate_factor, growth_evasion_rate_factor,
+    exp_table_base_exp, exp_table_exponent, exp_table_level_offset,
+    growth_level, growth_total_exp, gold_value,
+    hp_value, hp_max, mp_value, mp_max, stamina_value, stamina_max,
+    current_spot_id, current_coordinate_x, current_coordinate_y, current_coordinate_z,
+    current_destination_x, current_destination_y, current_destination_z,
+    goal_destination_type, goal_spot_id, goal_location_area_id, goal_world_object_id,
+    is_down, attention_level, state_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(player_id) DO UPDATE SET
+    base_max_hp = excluded.base_max_hp,
+    base_max_mp = excluded.base_max_mp,
+    base_attack = excluded.base_attack,
+    base_defense = excluded.base_defense,
+    base_speed = excluded.base_speed,
+    base_critical_rate = excluded.base_critical_rate,
+    base_evasion_rate = excluded.base_evasion_rate,
+    growth_hp_factor = excluded.growth_hp_factor,
+    growth_mp_factor = excluded.growth_mp_factor,
+    growth_attack_factor = excluded.growth_attack_factor,
+    growth_defense_factor = excluded.growth_defense_factor,
+    growth_speed_factor = excluded.growth_speed_factor,
+    growth_critical_rate_factor = excluded.growth_critical_rate_factor,
+    growth_evasion_rate_factor = excluded.growth_evasion_rate_factor,
+    exp_table_base_exp = excluded.exp_table_base_exp,
+    exp_table_exponent = excluded.exp_table_exponent,
+    exp_table_level_offset = excluded.exp_table_level_offset,
+    growth_level = excluded.growth_level,
+    growth_total_exp = excluded.growth_total_exp,
+    gold_value = excluded.gold_value,
+    hp_value = excluded.hp_value,
+    hp_max = excluded.hp_max,
+    mp_value = excluded.mp_value,
+    mp_max = excluded.mp_max,
+    stamina_value = excluded.stamina_value,
+    stamina_max = excluded.stamina_max,
+    current_spot_id = excluded.current_spot_id,
+    current_coordinate_x = excluded.current_coordinate_x,
+    current_coordinate_y = excluded.current_coordinate_y,
+    current_coordinate_z = excluded.current_coordinate_z,
+    current_destination_x = excluded.current_destination_x,
+    current_destination_y = excluded.current_destination_y,
+    current_destination_z = excluded.current_destination_z,
+    goal_destination_type = excluded.goal_destination_type,
+    goal_spot_id = excluded.goal_spot_id,
+    goal_location_area_id = excluded.goal_location_area_id,
+    goal_world_object_id = excluded.goal_world_object_id,
+    is_down = excluded.is_down,
+    attention_level = excluded.attention_level,
+    state_json = excluded.state_json
+"""
+
+
+def _status_row(status: PlayerStatusAggregate) -> tuple:
+    player_id = int(status.player_id)
+    return (
+        player_id,
+        status.base_stats.max_hp, status.base_stats.max_mp, status.base_stats.attack, status.base_stats.defense, status.base_stats.speed, status.base_stats.critical_rate, status.base_stats.evasion_rate,
+        status.stat_growth_factor.hp_factor, status.stat_growth_factor.mp_factor, status.stat_growth_factor.attack_factor, status.stat_growth_factor.defense_factor, status.stat_growth_factor.speed_factor,
+        status.stat_growth_factor.critical_rate_factor, status.stat_growth_factor.evasion_rate_factor,
+        status.exp_table.base_exp, status.exp_table.exponent, status.exp_table.level_offset,
+        status.growth.level, status.growth.total_exp, status.gold.value,
+        status.hp.value, status.hp.max_hp, status.mp.value, status.mp.max_mp, status.stamina.value, status.stamina.max_stamina,
+        None if status.current_spot_id is None else int(status.current_spot_id),
+        None if status.current_coordinate is None else status.current_coordinate.x,
+        None if status.current_coordinate is None else status.current_coordinate.y,
+        None if status.current_coordinate is None else status.current_coordinate.z,
+        None if status.current_destination is None else status.current_destination.x,
+        None if status.current_destination is None else status.current_destination.y,
+        None if status.current_destination is None else status.current_destination.z,
+        status.goal_destination_type,
+        None if status.goal_spot_id is None else int(status.goal_spot_id),
+        None if status.goal_location_area_id is None else int(status.goal_location_area_id),
+        None if status.goal_world_object_id is None else int(status.goal_world_object_id),
+        1 if status.is_down else 0,
+        status.attention_level.value,
+        # Phase 4-D-2: 空 dict は NULL に保存して storage 節約 (旧行と互換)
+        json.dumps(dict(status.state), ensure_ascii=False, sort_keys=True)
+        if status.state else None,
+    )
+
 
 class SqlitePlayerStatusWriteRepository(PlayerStatusRepository):
     def __init__(
@@ -67,139 +171,90 @@ class SqlitePlayerStatusWriteRepository(PlayerStatusRepository):
         sink.add_events_from_aggregate(aggregate)
 
     def find_by_id(self, player_id: PlayerId) -> Optional[PlayerStatusAggregate]:
-        row = self._conn.execute("SELECT * FROM game_player_statuses WHERE player_id = ?", (int(player_id),)).fetchone()
-        if row is None:
-            return None
-        return copy.deepcopy(self._build_status_from_row(row))
+        statuses = self._load(keys=[int(player_id)])
+        return statuses[0] if statuses else None
 
     def find_by_ids(self, player_ids: List[PlayerId]) -> List[PlayerStatusAggregate]:
-        return [x for pid in player_ids for x in [self.find_by_id(pid)] if x is not None]
+        by_id = {int(s.player_id): s for s in self._load(keys=[int(pid) for pid in player_ids])}
+        return [by_id[int(pid)] for pid in player_ids if int(pid) in by_id]
 
     def save(self, status: PlayerStatusAggregate) -> PlayerStatusAggregate:
+        self._write([status])
+        return status
+
+    def save_all(self, statuses: List[PlayerStatusAggregate]) -> None:
+        if statuses:
+            self._write(list(statuses))
+
+    def _write(self, statuses: Sequence[PlayerStatusAggregate]) -> None:
+        """親 row の upsert と子テーブルの入れ替えを 1 transaction でまとめて行う。"""
         self._assert_shared_transaction_active()
-        self._maybe_emit_events(status)
+        for status in statuses:
+            self._maybe_emit_events(status)
+        # 同じ player が batch に複数回あれば、save を順に呼んだときと同じく
+        # 後の entry を残す (親 row の upsert は通るが子 table の INSERT が
+        # 主キー重複で落ちる)。
+        statuses = list({int(status.player_id): status for status in statuses}.values())
         began_local_transaction = False
         if self._commits_after_write and not self._conn.in_transaction:
             self._conn.execute("BEGIN")
             began_local_transaction = True
-        player_id = int(status.player_id)
+        player_ids = [int(status.player_id) for status in statuses]
         try:
-            self._conn.execute(
-                """
-                INSERT INTO game_player_statuses (
-                player_id,
-                base_max_hp, base_max_mp, base_attack, base_defense, base_speed, base_critical_rate, base_evasion_rate,
-                growth_hp_factor, growth_mp_factor, growth_attack_factor, growth_defense_factor, growth_speed_factor,
-                growth_critical_rate_factor, growth_evasion_rate_factor,
-                exp_table_base_exp, exp_table_exponent, exp_table_level_offset,
-                growth_level, growth_total_exp, gold_value,
-                hp_value, hp_max, mp_value, mp_max, stamina_value, stamina_max,
-                current_spot_id, current_coordinate_x, current_coordinate_y, current_coordinate_z,
-                current_destination_x, current_destination_y, current_destination_z,
-                goal_destination_type, goal_spot_id, goal_location_area_id, goal_world_object_id,
-                is_down, attention_level, state_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(player_id) DO UPDATE SET
-                base_max_hp = excluded.base_max_hp,
-                base_max_mp = excluded.base_max_mp,
-                base_attack = excluded.base_attack,
-                base_defense = excluded.base_defense,
-                base_speed = excluded.base_speed,
-                base_critical_rate = excluded.base_critical_rate,
-                base_evasion_rate = excluded.base_evasion_rate,
-                growth_hp_factor = excluded.growth_hp_factor,
-                growth_mp_factor = excluded.growth_mp_factor,
-                growth_attack_factor = excluded.growth_attack_factor,
-                growth_defense_factor = excluded.growth_defense_factor,
-                growth_speed_factor = excluded.growth_speed_factor,
-                growth_critical_rate_factor = excluded.growth_critical_rate_factor,
-                growth_evasion_rate_factor = excluded.growth_evasion_rate_factor,
-                exp_table_base_exp = excluded.exp_table_base_exp,
-                exp_table_exponent = excluded.exp_table_exponent,
-                exp_table_level_offset = excluded.exp_table_level_offset,
-                growth_level = excluded.growth_level,
-                growth_total_exp = excluded.growth_total_exp,
-                gold_value = excluded.gold_value,
-                hp_value = excluded.hp_value,
-                hp_max = excluded.hp_max,
-                mp_value = excluded.mp_value,
-                mp_max = excluded.mp_max,
-                stamina_value = excluded.stamina_value,
-                stamina_max = excluded.stamina_max,
-                current_spot_id = excluded.current_spot_id,
-                current_coordinate_x = excluded.current_coordinate_x,
-                current_coordinate_y = excluded.current_coordinate_y,
-                current_coordinate_z = excluded.current_coordinate_z,
-                current_destination_x = excluded.current_destination_x,
-                current_destination_y = excluded.current_destination_y,
-                current_destination_z = excluded.current_destination_z,
-                goal_destination_type = excluded.goal_destination_type,
-                goal_spot_id = excluded.goal_spot_id,
-                goal_location_area_id = excluded.goal_location_area_id,
-                goal_world_object_id = excluded.goal_world_object_id,
-                is_down = excluded.is_down,
-                attention_level = excluded.attention_level,
-                state_json = excluded.state_json
-                """,
-                (
-                    player_id,
-                    status.base_stats.max_hp, status.base_stats.max_mp, status.base_stats.attack, status.base_stats.defense, status.base_stats.speed, status.base_stats.critical_rate, status.base_stats.evasion_rate,
-                    status.stat_growth_factor.hp_factor, status.stat_growth_factor.mp_factor, status.stat_growth_factor.attack_factor, status.stat_growth_factor.defense_factor, status.stat_growth_factor.speed_factor,
-                    status.stat_growth_factor.critical_rate_factor, status.stat_growth_factor.evasion_rate_factor,
-                    status.exp_table.base_exp, status.exp_table.exponent, status.exp_table.level_offset,
-                    status.growth.level, status.growth.total_exp, status.gold.value,
-                    status.hp.value, status.hp.max_hp, status.mp.value, status.mp.max_mp, status.stamina.value, status.stamina.max_stamina,
-                    None if status.current_spot_id is None else int(status.current_spot_id),
-                    None if status.current_coordinate is None else status.current_coordinate.x,
-                    None if status.current_coordinate is None else status.current_coordinate.y,
-                    None if status.current_coordinate is None else status.current_coordinate.z,
-                    None if status.current_destination is None else status.current_destination.x,
-                    None if status.current_destination is None else status.current_destination.y,
-                    None if status.current_destination is None else status.current_destination.z,
-                    status.goal_destination_type,
-                    None if status.goal_spot_id is None else int(status.goal_spot_id),
-                    None if status.goal_location_area_id is None else int(status.goal_location_area_id),
-                    None if status.goal_world_object_id is None else int(status.goal_world_object_id),
-                    1 if status.is_down else 0,
-                    status.attention_level.value,
-                    # Phase 4-D-2: 空 dict は NULL に保存して storage 節約 (旧行と互換)
-                    json.dumps(dict(status.state), ensure_ascii=False, sort_keys=True)
-                    if status.state else None,
-                ),
-            )
-            for table_name in (
-                "game_player_navigation_path",
-                "game_player_active_effects",
-                "game_player_pursuit_target_snapshots",
-                "game_player_pursuit_last_known",
-                "game_player_needs",
-            ):
-                self._conn.execute(f"DELETE FROM {table_name} WHERE player_id = ?", (player_id,))
+            self._conn.executemany(_UPSERT_STATUS_SQL, [_status_row(status) for status in statuses])
+            for table_name in _CHILD_TABLES:
+                for chunk in chunked(player_ids):
+                    placeholders = ", ".join("?" for _ in chunk)
+                    self._conn.execute(
+                        f"DELETE FROM {table_name} WHERE player_id IN ({placeholders})",
+                        tuple(chunk),
+                    )
             self._conn.executemany(
                 "INSERT INTO game_player_navigation_path (player_id, step_index, x, y, z) VALUES (?, ?, ?, ?, ?)",
-                [(player_id, idx, coord.x, coord.y, coord.z) for idx, coord in enumerate(status.planned_path)],
+                [
+                    (int(status.player_id), idx, coord.x, coord.y, coord.z)
+                    for status in statuses
+                    for idx, coord in enumerate(status.planned_path)
+                ],
             )
             self._conn.executemany(
                 "INSERT INTO game_player_active_effects (player_id, effect_index, effect_type, effect_value, expiry_tick) VALUES (?, ?, ?, ?, ?)",
-                [(player_id, idx, effect.effect_type.name, effect.value, effect.expiry_tick.value) for idx, effect in enumerate(status.active_effects)],
+                [
+                    (int(status.player_id), idx, effect.effect_type.name, effect.value, effect.expiry_tick.value)
+                    for status in statuses
+                    for idx, effect in enumerate(status.active_effects)
+                ],
+            )
+            pursuits = [
+                (int(status.player_id), status.pursuit_state)
+                for status in statuses
+                if status.pursuit_state is not None
+            ]
+            self._conn.executemany(
+                "INSERT INTO game_player_pursuit_target_snapshots (player_id, target_id, spot_id, x, y, z) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (player_id, int(pursuit.target_snapshot.target_id), int(pursuit.target_snapshot.spot_id), pursuit.target_snapshot.coordinate.x, pursuit.target_snapshot.coordinate.y, pursuit.target_snapshot.coordinate.z)
+                    for player_id, pursuit in pursuits
+                    if pursuit.target_snapshot is not None
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO game_player_pursuit_last_known (player_id, target_id, spot_id, x, y, z, observed_at_tick) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (player_id, int(pursuit.last_known.target_id), int(pursuit.last_known.spot_id), pursuit.last_known.coordinate.x, pursuit.last_known.coordinate.y, pursuit.last_known.coordinate.z, None if pursuit.last_known.observed_at_tick is None else pursuit.last_known.observed_at_tick.value)
+                    for player_id, pursuit in pursuits
+                    if pursuit.last_known is not None
+                ],
             )
-            pursuit = status.pursuit_state
-            if pursuit is not None and pursuit.target_snapshot is not None:
-                self._conn.execute(
-                    "INSERT INTO game_player_pursuit_target_snapshots (player_id, target_id, spot_id, x, y, z) VALUES (?, ?, ?, ?, ?, ?)",
-                    (player_id, int(pursuit.target_snapshot.target_id), int(pursuit.target_snapshot.spot_id), pursuit.target_snapshot.coordinate.x, pursuit.target_snapshot.coordinate.y, pursuit.target_snapshot.coordinate.z),
-                )
-            if pursuit is not None and pursuit.last_known is not None:
-                self._conn.execute(
-                    "INSERT INTO game_player_pursuit_last_known (player_id, target_id, spot_id, x, y, z, observed_at_tick) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (player_id, int(pursuit.last_known.target_id), int(pursuit.last_known.spot_id), pursuit.last_known.coordinate.x, pursuit.last_known.coordinate.y, pursuit.last_known.coordinate.z, None if pursuit.last_known.observed_at_tick is None else pursuit.last_known.observed_at_tick.value),
-                )
             # 欲求の保存
-            if len(status.needs) > 0:
-                self._conn.executemany(
-                    "INSERT INTO game_player_needs (player_id, need_type, value, max_value) VALUES (?, ?, ?, ?)",
-                    [(player_id, need.need_type.value, need.value, need.max_value) for need in status.needs],
-                )
+            self._conn.executemany(
+                "INSERT INTO game_player_needs (player_id, need_type, value, max_value) VALUES (?, ?, ?, ?)",
+                [
+                    (int(status.player_id), need.need_type.value, need.value, need.max_value)
+                    for status in statuses
+                    for need in status.needs
+                ],
+            )
             if began_local_transaction:
                 self._conn.commit()
             else:
@@ -208,11 +263,6 @@ class SqlitePlayerStatusWriteRepository(PlayerStatusRepository):
             if began_local_transaction and self._conn.in_transaction:
                 self._conn.rollback()
             raise
-        return copy.deepcopy(status)
-
-    def save_all(self, statuses: List[PlayerStatusAggregate]) -> None:
-        for s in statuses:
-            self.save(s)
 
     def delete(self, player_id: PlayerId) -> bool:
         self._assert_shared_transaction_active()
@@ -241,38 +291,70 @@ class SqlitePlayerStatusWriteRepository(PlayerStatusRepository):
         return cur.rowcount > 0
 
     def find_all(self) -> List[PlayerStatusAggregate]:
-        cur = self._conn.execute("SELECT * FROM game_player_statuses ORDER BY player_id ASC")
-        return [copy.deepcopy(self._build_status_from_row(row)) for row in cur.fetchall()]
+        return self._load(keys=None)
+
+    def _load(self, *, keys: Optional[Sequence[int]]) -> List[PlayerStatusAggregate]:
+        """親 row と子テーブルを table ごとに 1 query で引いて組み立てる (keys=None で全件)。"""
+        if keys is not None and not keys:
+            return []
+        rows = fetch_rows_by_keys(
+            self._conn,
+            select_sql="SELECT * FROM game_player_statuses",
+            key_column="player_id",
+            keys=keys,
+            order_by="player_id ASC",
+        )
+        if not rows:
+            return []
+        if keys is not None:
+            keys = [int(row["player_id"]) for row in rows]
+        paths = self._children(
+            "SELECT player_id, step_index, x, y, z FROM game_player_navigation_path",
+            keys,
+            "player_id ASC, step_index ASC",
+        )
+        effects = self._children(
+            "SELECT player_id, effect_type, effect_value, expiry_tick FROM game_player_active_effects",
+            keys,
+            "player_id ASC, effect_index ASC",
+        )
+        pursuit_targets = self._children(
+            "SELECT * FROM game_player_pursuit_target_snapshots", keys, "player_id ASC"
+        )
+        pursuit_last_known = self._children(
+            "SELECT * FROM game_player_pursuit_last_known", keys, "player_id ASC"
+        )
+        needs = self._children(
+            "SELECT player_id, need_type, value, max_value FROM game_player_needs",
+            keys,
+            "player_id ASC",
+        )
+        statuses = []
+        for row in rows:
+            player_id = int(row["player_id"])
+            target_rows = pursuit_targets.get(player_id)
+            last_known_rows = pursuit_last_known.get(player_id)
+            statuses.append(
+                build_player_status(
+                    row=row,
+                    path_rows=paths.get(player_id, []),
+                    active_effect_rows=effects.get(player_id, []),
+                    pursuit_target_row=target_rows[0] if target_rows else None,
+                    pursuit_last_known_row=last_known_rows[0] if last_known_rows else None,
+                    need_rows=needs.get(player_id, []),
+                )
+            )
+        return statuses
 
-    def _build_status_from_row(self, row: sqlite3.Row) -> PlayerStatusAggregate:
-        player_id = int(row["player_id"])
-        path_rows = self._conn.execute(
-            "SELECT step_index, x, y, z FROM game_player_navigation_path WHERE player_id = ? ORDER BY step_index ASC",
-            (player_id,),
-        ).fetchall()
-        active_effect_rows = self._conn.execute(
-            "SELECT effect_type, effect_value, expiry_tick FROM game_player_active_effects WHERE player_id = ? ORDER BY effect_index ASC",
-            (player_id,),
-        ).fetchall()
-        pursuit_target_row = self._conn.execute(
-            "SELECT * FROM game_player_pursuit_target_snapshots WHERE player_id = ?",
-            (player_id,),
-        ).fetchone()
-        pursuit_last_known_row = self._conn.execute(
-            "SELECT * FROM game_player_pursuit_last_known WHERE player_id = ?",
-            (player_id,),
-        ).fetchone()
-        need_rows = self._conn.execute(
-            "SELECT need_type, value, max_value FROM game_player_needs WHERE player_id = ?",
-            (player_id,),
-        ).fetchall()
-        return build_player_status(
-            row=row,
-            path_rows=list(path_rows),
-            active_effect_rows=list(active_effect_rows),
-            pursuit_target_row=pursuit_target_row,
-            pursuit_last_known_row=pursuit_last_known_row,
-            need_rows=list(need_rows),
+    def _children(
+        self, select_sql: str, keys: Optional[Sequence[int]], order_by: str
+    ) -> Dict[int, List[sqlite3.Row]]:
+        return fetch_grouped_rows(
+            self._conn,
+            select_sql=select_sql,
+            key_column="player_id",
+            keys=keys,
+            order_by=order_by,
         )
 
 
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import copy
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from ai_rpg_world.domain.sns.aggregate.post_aggregate import PostAggregate
 from ai_rpg_world.domain.sns.repository.post_repository import PostRepository
@@ -15,6 +14,10 @@ from ai_rpg_world.infrastructure.repository.game_write_sqlite_schema import (
     allocate_sequence_value,
     init_game_write_schema,
 )
+from ai_rpg_world.infrastructure.repository.sqlite_batch_hydration import (
+    fetch_grouped_rows,
+    fetch_rows_by_keys,
+)
 from ai_rpg_world.infrastructure.repository.sqlite_sns_state_codec import (
     build_post_aggregate,
 )
@@ -69,72 +72,66 @@ class SqlitePostRepository(PostRepository):
             return
         sink.add_events_from_aggregate(aggregate)
 
-    def _hashtags(self, post_id: PostId) -> List[str]:
-        cur = self._conn.execute(
-            """
-            SELECT hashtag
-            FROM game_sns_post_hashtags
-            WHERE post_id = ?
-            ORDER BY hashtag ASC
-            """,
-            (int(post_id),),
-        )
-        return [str(row[0]) for row in cur.fetchall()]
+    def _hydrate_posts(
+        self, rows: Sequence[sqlite3.Row], *, all_rows: bool = False
+    ) -> List[PostAggregate]:
+        """親 row 群から集約を組み立てる。hashtag / like / mention / reply は
+        table ごとに 1 query で引いて post_id ごとに振り分ける (N+1 を避ける)。
 
-    def _likes(self, post_id: PostId) -> List[tuple[int, str]]:
-        cur = self._conn.execute(
-            """
-            SELECT user_id, created_at
-            FROM game_sns_post_likes
-            WHERE post_id = ?
-            ORDER BY user_id ASC
-            """,
-            (int(post_id),),
+        ``all_rows`` は全件読みのときに WHERE を省く指定。
+        """
+        if not rows:
+            return []
+        keys = None if all_rows else [int(row["post_id"]) for row in rows]
+        hashtags = fetch_grouped_rows(
+            self._conn,
+            select_sql="SELECT post_id, hashtag FROM game_sns_post_hashtags",
+            key_column="post_id",
+            keys=keys,
+            order_by="post_id ASC, hashtag ASC",
         )
-        return [(int(row[0]), str(row[1])) for row in cur.fetchall()]
-
-    def _mentions(self, post_id: PostId) -> List[str]:
-        cur = self._conn.execute(
-            """
-            SELECT user_name
-            FROM game_sns_post_mentions
-            WHERE post_id = ?
-            ORDER BY user_name ASC
-            """,
-            (int(post_id),),
+        likes = fetch_grouped_rows(
+            self._conn,
+            select_sql="SELECT post_id, user_id, created_at FROM game_sns_post_likes",
+            key_column="post_id",
+            keys=keys,
+            order_by="post_id ASC, user_id ASC",
         )
-        return [str(row[0]) for row in cur.fetchall()]
-
-    def _reply_ids(self, post_id: PostId) -> List[int]:
-        cur = self._conn.execute(
-            """
-            SELECT reply_id
-            FROM game_sns_replies
-            WHERE parent_post_id = ?
-            ORDER BY created_at ASC, reply_id ASC
-            """,
-            (int(post_id),),
+        mentions = fetch_grouped_rows(
+            self._conn,
+            select_sql="SELECT post_id, user_name FROM game_sns_post_mentions",
+            key_column="post_id",
+            keys=keys,
+            order_by="post_id ASC, user_name ASC",
         )
-        return [int(row[0]) for row in cur.fetchall()]
-
-    def _hydrate_post(self, row: sqlite3.Row | None) -> Optional[PostAggregate]:
-        if row is None:
-            return None
-        post_id = PostId(int(row["post_id"]))
-        return copy.deepcopy(
-            build_post_aggregate(
-                post_id=int(post_id),
-                author_user_id=int(row["author_user_id"]),
-                content=str(row["content"]),
-                visibility=str(row["visibility"]),
-                deleted=int(row["deleted"]),
-                created_at=str(row["created_at"]),
-                hashtags=self._hashtags(post_id),
-                likes=self._likes(post_id),
-                mentions=self._mentions(post_id),
-                reply_ids=self._reply_ids(post_id),
-            )
+        replies = fetch_grouped_rows(
+            self._conn,
+            select_sql="SELECT parent_post_id, reply_id FROM game_sns_replies",
+            key_column="parent_post_id",
+            keys=keys,
+            order_by="parent_post_id ASC, created_at ASC, reply_id ASC",
         )
+        posts = []
+        for row in rows:
+            post_id = int(row["post_id"])
+            posts.append(
+                build_post_aggregate(
+                    post_id=post_id,
+                    author_user_id=int(row["author_user_id"]),
+                    content=str(row["content"]),
+                    visibility=str(row["visibility"]),
+                    deleted=int(row["deleted"]),
+                    created_at=str(row["created_at"]),
+                    hashtags=[str(r["hashtag"]) for r in hashtags.get(post_id, [])],
+                    likes=[
+                        (int(r["user_id"]), str(r["created_at"]))
+                        for r in likes.get(post_id, [])
+                    ],
+                    mentions=[str(r["user_name"]) for r in mentions.get(post_id, [])],
+                    reply_ids=[int(r["reply_id"]) for r in replies.get(post_id, [])],
+                )
+            )
+        return posts
 
     def _current_max_post_id(self) -> int:
         cur = self._conn.execute("SELECT COALESCE(MAX(post_id), 0) FROM game_sns_posts")
@@ -145,14 +142,25 @@ class SqlitePostRepository(PostRepository):
             "SELECT * FROM game_sns_posts WHERE post_id = ?",
             (int(entity_id),),
         )
-        return self._hydrate_post(cur.fetchone())
+        posts = self._hydrate_posts(cur.fetchall())
+        return posts[0] if posts else None
 
     def find_by_ids(self, entity_ids: List[PostId]) -> List[PostAggregate]:
-        return [x for entity_id in entity_ids for x in [self.find_by_id(entity_id)] if x is not None]
+        if not entity_ids:
+            return []
+        rows = fetch_rows_by_keys(
+            self._conn,
+            select_sql="SELECT * FROM game_sns_posts",
+            key_column="post_id",
+            keys=[int(entity_id) for entity_id in entity_ids],
+            order_by="post_id ASC",
+        )
+        by_id = {int(post.post_id): post for post in self._hydrate_posts(rows)}
+        return [by_id[int(pid)] for pid in entity_ids if int(pid) in by_id]
 
     def find_all(self) -> List[PostAggregate]:
         cur = self._conn.execute("SELECT * FROM game_sns_posts ORDER BY post_id ASC")
-        return [x for row in cur.fetchall() for x in [self._hydrate_post(row)] if x is not None]
+        return self._hydrate_posts(cur.fetchall(), all_rows=True)
 
     def save(self, entity: PostAggregate) -> PostAggregate:
         self._assert_shared_transaction_active()
@@ -212,7 +220,7 @@ class SqlitePostRepository(PostRepository):
             if began_local_transaction and self._conn.in_transaction:
                 self._conn.rollback()
             raise
-        return copy.deepcopy(entity)
+        return entity
 
     def delete(self, entity_id: PostId) -> bool:
         self._assert_shared_transaction_active()
@@ -249,7 +257,7 @@ class SqlitePostRepository(PostRepository):
 
     def _load_query(self, sql: str, params: tuple[Any, ...]) -> List[PostAggregate]:
         cur = self._conn.execute(sql, params)
-        return [x for row in cur.fetchall() for x in [self._hydrate_post(row)] if x is not None]
+        return self._hydrate_posts(cur.fetchall())
 
     def find_by_user_id(self, user_id: UserId, limit: int = 20, offset: int = 0) -> List[PostAggregate]:
         return self._load_query(
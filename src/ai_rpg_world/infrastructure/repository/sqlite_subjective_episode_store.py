@@ -3,14 +3,29 @@
 Phase 3 Step 3e-1 (Issue #470): being_id 版 API を並走追加。書き込み先は
 ``subjective_episodes_by_being`` / ``subjective_episode_cues_by_being``
 (= schema v2)。legacy テーブルは Step 3e-3 で DROP 予定。
+
+読み出した行は ``json.loads`` + ``SubjectiveEpisode`` 組み立てが支配的なので、
+Being ごとの LRU (``_DecodedEpisodeCache``) に decode 済み episode を持ち、
+同じ episode を複数 cue / 連続 turn で引いても decode は 1 回で済ませる。
+cache は decode 元の payload も持ち、読んだ行の payload と一致するときだけ
+返す。put の書き込みと cache の破棄の間に別スレッドが古い行を読んで
+cache に戻しても、次に新しい行を読んだ時点で食い違いに気づいて decode し直す。
+
+payload は v2 (位置で並べた compact な JSON 配列) で書く。v1 (キー付き JSON
+object) の行は schema v4 の migration で v2 に書き換えるが、decode は両方を
+受け付ける。受動想起の並べ替えは payload を読まない ``SubjectiveEpisodeHeader``
+(episode_id / 時刻キー / 一致 cue) で行い、残った分だけ episode に組み立てる。
 """
 
 from __future__ import annotations
 
 import json
 import sqlite3
-from datetime import datetime, timezone
-from typing import Any
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Sequence
 
 from ai_rpg_world.domain.being.value_object.being_id import BeingId
 from ai_rpg_world.domain.memory.episodic.repository.episodic_episode_repository import EpisodicEpisodeRepository
@@ -20,13 +35,35 @@ from ai_rpg_world.domain.memory.episodic.value_object.episode_source import Epis
 from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue import EpisodicCue
 from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue_source import EpisodicCueSource
 from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode import SubjectiveEpisode
+from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode_header import (
+    SubjectiveEpisodeHeader,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_batch_hydration import chunked
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import SqliteConnectionPool
+from ai_rpg_world.infrastructure.repository.sqlite_group_commit import (
+    DEFAULT_GROUP_COMMIT_MAX_UNITS,
+    SqliteGroupCommitConnection,
+    SqliteGroupCommitMetrics,
+)
 from ai_rpg_world.infrastructure.repository.sqlite_migration import (
     SqliteMigration,
     apply_migrations,
 )
 
 _SUBJECTIVE_EPISODE_SCHEMA_NAMESPACE = "subjective-episodes-mvp-v1"
-_PAYLOAD_VERSION = 1
+# v1: キー付き JSON object (``_episode_to_payload_dict``)。
+# v2: フィールドを位置で並べた JSON 配列 (``_episode_to_compact_payload``)。
+_PAYLOAD_VERSION_OBJECT = 1
+_PAYLOAD_VERSION_COMPACT = 2
+
+# 1 Being あたりに保持する decode 済み episode 数の既定値。受動想起 1 回で
+# 触る episode (cue 数 × limit_per_axis 程度) と、InMemory 側の保有上限
+# (500) の両方に収まる大きさ。
+DEFAULT_DECODED_CACHE_SIZE_PER_BEING = 512
+
+# group_concat で cue canonical を連結するときの区切り (unit separator)。
+# canonical は ``axis:value`` で、value に ``,`` が入り得るため使わない。
+_CANONICAL_SEPARATOR = "\x1f"
 
 
 def _occurred_at_sort_key(ep: SubjectiveEpisode) -> float:
@@ -57,7 +94,7 @@ def _episode_to_payload_dict(ep: SubjectiveEpisode) -> dict[str, Any]:
     loc = ep.location
     act = ep.action
     return {
-        "v": _PAYLOAD_VERSION,
+        "v": _PAYLOAD_VERSION_OBJECT,
         "episode_id": ep.episode_id,
         "player_id": ep.player_id,
         "being_id": ep.being_id.value,
@@ -110,7 +147,7 @@ def _episode_to_payload_dict(ep: SubjectiveEpisode) -> dict[str, Any]:
 def _payload_dict_to_episode(
     data: dict[str, Any], *, being_id: BeingId
 ) -> SubjectiveEpisode:
-    if int(data.get("v", 0)) != _PAYLOAD_VERSION:
+    if int(data.get("v", 0)) != _PAYLOAD_VERSION_OBJECT:
         raise ValueError(f"unsupported subjective episode payload v={data.get('v')!r}")
     raw_being_id = data.get("being_id")
     if raw_being_id is not None:
@@ -182,6 +219,164 @@ def _payload_dict_to_episode(
     )
 
 
+_EPOCH = datetime(1970, 1, 1)
+_CUE_SOURCE_BY_VALUE = {src.value: src for src in EpisodicCueSource}
+
+
+def _datetime_to_compact(dt: datetime) -> list[Any]:
+    """``[壁時計のエポックからのマイクロ秒, UTC オフセット秒 | None]``。
+
+    naive / aware の区別とオフセットを保つ (isoformat と同じ情報量)。
+    """
+    wall = dt.replace(tzinfo=None) - _EPOCH
+    offset = dt.utcoffset()
+    return [
+        (wall.days * 86400 + wall.seconds) * 1_000_000 + wall.microseconds,
+        None if offset is None else offset.total_seconds(),
+    ]
+
+
+def _datetime_from_compact(raw: Sequence[Any]) -> datetime:
+    dt = _EPOCH + timedelta(microseconds=raw[0])
+    if raw[1] is None:
+        return dt
+    offset = raw[1]
+    return dt.replace(
+        tzinfo=timezone.utc if offset == 0 else timezone(timedelta(seconds=offset))
+    )
+
+
+def _episode_to_compact_payload(ep: SubjectiveEpisode) -> list[Any]:
+    """v2 payload。キー名を持たず、並び順がそのまま schema。
+
+    並びを変えるときは ``_PAYLOAD_VERSION_COMPACT`` を上げて decode を分ける。
+    """
+    loc = ep.location
+    act = ep.action
+    return [
+        _PAYLOAD_VERSION_COMPACT,
+        ep.episode_id,
+        ep.player_id,
+        ep.being_id.value,
+        _datetime_to_compact(ep.occurred_at),
+        ep.game_time_label,
+        list(ep.source.event_ids),
+        [loc.spot_id, list(loc.tile_area_ids), loc.sub_location_id, loc.x, loc.y, loc.z],
+        None if act is None else [act.tool_name, act.canonical_arguments_text],
+        list(ep.who),
+        list(ep.co_present),
+        ep.what,
+        ep.why,
+        ep.observed,
+        ep.expected,
+        ep.outcome,
+        ep.prediction_error,
+        ep.felt,
+        ep.interpreted,
+        [[c.axis, c.value, c.source.value] for c in ep.cues],
+        ep.recall_text,
+        ep.recall_count,
+        None
+        if ep.last_recalled_at is None
+        else _datetime_to_compact(ep.last_recalled_at),
+        ep.salience,
+    ]
+
+
+def _compact_payload_to_episode(
+    data: Sequence[Any], *, being_id: BeingId
+) -> SubjectiveEpisode:
+    (
+        version,
+        episode_id,
+        player_id,
+        raw_being_id,
+        occurred_raw,
+        game_time_label,
+        event_ids,
+        loc_raw,
+        act_raw,
+        who,
+        co_present,
+        what,
+        why,
+        observed,
+        expected,
+        outcome,
+        prediction_error,
+        felt,
+        interpreted,
+        cues_raw,
+        recall_text,
+        recall_count,
+        last_raw,
+        salience,
+    ) = data
+    if version != _PAYLOAD_VERSION_COMPACT:
+        raise ValueError(f"unsupported subjective episode payload v={version!r}")
+    if raw_being_id is not None and raw_being_id != being_id.value:
+        raise ValueError("episode.being_id must match store being_id")
+    intern = sys.intern
+    return SubjectiveEpisode(
+        episode_id=episode_id,
+        player_id=player_id,
+        being_id=being_id,
+        occurred_at=_datetime_from_compact(occurred_raw),
+        game_time_label=game_time_label,
+        source=EpisodeSource(event_ids=tuple(event_ids)),
+        location=EpisodeLocation(
+            spot_id=loc_raw[0],
+            tile_area_ids=tuple(loc_raw[1]),
+            sub_location_id=loc_raw[2],
+            x=loc_raw[3],
+            y=loc_raw[4],
+            z=loc_raw[5],
+        ),
+        action=None
+        if act_raw is None
+        else EpisodeAction(tool_name=intern(act_raw[0]), canonical_arguments_text=act_raw[1]),
+        who=tuple(who),
+        co_present=tuple(co_present),
+        what=what,
+        why=why,
+        observed=observed,
+        expected=expected,
+        outcome=outcome,
+        prediction_error=prediction_error,
+        felt=felt,
+        interpreted=interpreted,
+        # cue の axis / value は episode をまたいで同じ文字列が繰り返し出るので
+        # intern して共有する (decode 済み LRU に多数載る前提)
+        cues=tuple(
+            EpisodicCue(
+                axis=intern(axis),
+                value=intern(value),
+                source=_CUE_SOURCE_BY_VALUE[source],
+            )
+            for axis, value, source in cues_raw
+        ),
+        recall_text=recall_text,
+        recall_count=recall_count,
+        last_recalled_at=None if last_raw is None else _datetime_from_compact(last_raw),
+        salience=salience,
+    )
+
+
+def _encode_payload(ep: SubjectiveEpisode) -> str:
+    """書き込み用の payload (常に v2)。"""
+    return json.dumps(
+        _episode_to_compact_payload(ep), ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def _decode_payload(payload_json: str, *, being_id: BeingId) -> SubjectiveEpisode:
+    """v1 (JSON object) / v2 (JSON 配列) のどちらの行も episode に戻す。"""
+    data = json.loads(payload_json)
+    if isinstance(data, list):
+        return _compact_payload_to_episode(data, being_id=being_id)
+    return _payload_dict_to_episode(data, being_id=being_id)
+
+
 def _init_schema_v1(connection: sqlite3.Connection) -> None:
     connection.executescript(
         """
@@ -262,14 +457,106 @@ def _init_schema_v2_by_being(connection: sqlite3.Connection) -> None:
     )
 
 
+def _migrate_v4_compact_payload(connection: sqlite3.Connection) -> None:
+    """v1 (キー付き JSON object) の payload を v2 (compact 配列) に書き換える。
+
+    decode は両方を読めるので正しさには不要だが、既存 DB のサイズと読み出しの
+    decode 時間を新規行と揃えるため一度だけ変換する。
+    """
+    rows = connection.execute(
+        """
+        SELECT being_id_value, episode_id, payload_json
+        FROM subjective_episodes_by_being
+        WHERE substr(payload_json, 1, 1) = '{'
+        """
+    ).fetchall()
+    for being_value, episode_id, payload_json in rows:
+        ep = _payload_dict_to_episode(
+            json.loads(str(payload_json)), being_id=BeingId(str(being_value))
+        )
+        connection.execute(
+            """
+            UPDATE subjective_episodes_by_being SET payload_json = ?
+            WHERE being_id_value = ? AND episode_id = ?
+            """,
+            (_encode_payload(ep), being_value, episode_id),
+        )
+
+
+class _DecodedEpisodeCache:
+    """Being ごとの decode 済み episode の LRU。スレッドセーフ。
+
+    ``capacity`` は Being 単位の上限。0 なら何も保持しない。entry は decode
+    元の payload と組で持ち、``get`` は payload が一致するときだけ返す。
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(0, int(capacity))
+        self._by_being: dict[
+            BeingId, OrderedDict[str, tuple[str, SubjectiveEpisode]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, being_id: BeingId, episode_id: str, payload_json: str
+    ) -> SubjectiveEpisode | None:
+        with self._lock:
+            bucket = self._by_being.get(being_id)
+            if bucket is None:
+                return None
+            entry = bucket.get(episode_id)
+            if entry is None:
+                return None
+            if entry[0] != payload_json:
+                # 行が書き換わっている。古い decode 結果は捨てる
+                del bucket[episode_id]
+                return None
+            bucket.move_to_end(episode_id)
+            return entry[1]
+
+    def put(
+        self, being_id: BeingId, payload_json: str, episode: SubjectiveEpisode
+    ) -> None:
+        if self._capacity == 0:
+            return
+        with self._lock:
+            bucket = self._by_being.get(being_id)
+            if bucket is None:
+                bucket = self._by_being[being_id] = OrderedDict()
+            bucket[episode.episode_id] = (payload_json, episode)
+            bucket.move_to_end(episode.episode_id)
+            while len(bucket) > self._capacity:
+                bucket.popitem(last=False)
+
+    def discard(self, being_id: BeingId, episode_id: str) -> None:
+        with self._lock:
+            bucket = self._by_being.get(being_id)
+            if bucket is not None:
+                bucket.pop(episode_id, None)
+
+    def clear_being(self, being_id: BeingId) -> None:
+        with self._lock:
+            self._by_being.pop(being_id, None)
+
+    def size(self, being_id: BeingId) -> int:
+        with self._lock:
+            return len(self._by_being.get(being_id, ()))
+
+
 class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
     """
     SubjectiveEpisode を JSON 1 行 + cue 逆引きで保持する。
     並びは occurred_at の新しい順（UTC 正規化）・同一キーは episode_id 降順。
     """
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        decoded_cache_size_per_being: int = DEFAULT_DECODED_CACHE_SIZE_PER_BEING,
+    ) -> None:
         self._conn = connection
+        self._decoded = _DecodedEpisodeCache(decoded_cache_size_per_being)
         if connection.row_factory is not sqlite3.Row:
             connection.row_factory = sqlite3.Row
         apply_migrations(
@@ -279,6 +566,7 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
                 SqliteMigration(1, _init_schema_v1),
                 SqliteMigration(2, _init_schema_v2_by_being),
                 SqliteMigration(3, _init_schema_v3_drop_legacy),
+                SqliteMigration(4, _migrate_v4_compact_payload),
             ],
         )
 
@@ -288,12 +576,61 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
         return self._conn
 
     @classmethod
-    def connect(cls, database_path: str) -> SqliteSubjectiveEpisodeStore:
-        conn = sqlite3.connect(database_path, check_same_thread=False)
-        store = cls(conn)
+    def connect(
+        cls,
+        database_path: str,
+        *,
+        decoded_cache_size_per_being: int = DEFAULT_DECODED_CACHE_SIZE_PER_BEING,
+        group_commit_max_delay_ms: Optional[int] = None,
+        group_commit_max_units: int = DEFAULT_GROUP_COMMIT_MAX_UNITS,
+    ) -> SqliteSubjectiveEpisodeStore:
+        """``database_path`` の per-thread 接続プール (WAL 等の接続 profile 適用済み) で開く。
+
+        ``connection`` はこのプールを返すので、同居する MemoryLink / セマンティック
+        store もスレッドごとの接続を使う。
+
+        ``group_commit_max_delay_ms`` を渡すと、プールの代わりに
+        ``SqliteGroupCommitConnection`` で開く (書き込みを 1 transaction に
+        まとめ、最長その ms だけ COMMIT を遅らせる)。同居 store も同じ接続に
+        載るので、``flush()`` 1 回で全 store の未 COMMIT 分が確定する。
+        """
+        if group_commit_max_delay_ms is None:
+            conn: Any = SqliteConnectionPool(database_path)
+        else:
+            conn = SqliteGroupCommitConnection(
+                database_path,
+                max_delay_ms=group_commit_max_delay_ms,
+                max_units=group_commit_max_units,
+            )
+        store = cls(conn, decoded_cache_size_per_being=decoded_cache_size_per_being)
         conn.commit()
         return store
 
+    def flush(self) -> None:
+        """group commit で溜めている書き込みを COMMIT する (それ以外の接続では何もしない)。"""
+        flush = getattr(self._conn, "flush", None)
+        if callable(flush):
+            flush()
+
+    def group_commit_metrics(self) -> Optional[SqliteGroupCommitMetrics]:
+        """group commit の累計値。group commit で開いていなければ None。"""
+        metrics = getattr(self._conn, "metrics", None)
+        if not callable(metrics):
+            return None
+        return metrics()
+
+    def _decode(
+        self, being_id: BeingId, episode_id: str, payload_json: Any
+    ) -> SubjectiveEpisode:
+        """行を episode に戻す。同じ payload を decode 済みなら cache から返す。"""
+        payload = str(payload_json)
+        cached = self._decoded.get(being_id, episode_id, payload)
+        if cached is not None:
+            return cached
+        ep = _decode_payload(payload, being_id=being_id)
+        self._decoded.put(being_id, payload, ep)
+        return ep
+
     def put_by_being(self, being_id: BeingId, episode: SubjectiveEpisode) -> None:
         if not isinstance(being_id, BeingId):
             raise TypeError("being_id must be BeingId")
@@ -301,36 +638,43 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
             raise TypeError("episode must be SubjectiveEpisode")
         if episode.being_id != being_id:
             raise ValueError("episode.being_id must match store being_id")
-        payload = json.dumps(_episode_to_payload_dict(episode), ensure_ascii=False)
+        payload = _encode_payload(episode)
         key = _occurred_at_sort_key(episode)
         eid = episode.episode_id
         canonicals = [c.to_canonical() for c in episode.cues]
-        cur = self._conn.cursor()
-        cur.execute(
-            """
-            DELETE FROM subjective_episode_cues_by_being
-            WHERE being_id_value = ? AND episode_id = ?
-            """,
-            (being_id.value, eid),
-        )
-        cur.execute(
-            """
-            INSERT OR REPLACE INTO subjective_episodes_by_being
-                (being_id_value, episode_id, occurred_at_key, payload_json, player_id)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (being_id.value, eid, key, payload, episode.player_id),
-        )
-        for ck in canonicals:
+        # 途中の文が失敗したら rollback で閉じる。group commit 接続では閉じない
+        # と unit の占有が残り、他スレッドの書き込みがすべて待ちで落ちる。
+        try:
+            cur = self._conn.cursor()
             cur.execute(
                 """
-                INSERT OR IGNORE INTO subjective_episode_cues_by_being
-                    (being_id_value, episode_id, cue_canonical)
-                VALUES (?, ?, ?)
+                DELETE FROM subjective_episode_cues_by_being
+                WHERE being_id_value = ? AND episode_id = ?
                 """,
-                (being_id.value, eid, ck),
+                (being_id.value, eid),
             )
-        self._conn.commit()
+            cur.execute(
+                """
+                INSERT OR REPLACE INTO subjective_episodes_by_being
+                    (being_id_value, episode_id, occurred_at_key, payload_json, player_id)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (being_id.value, eid, key, payload, episode.player_id),
+            )
+            for ck in canonicals:
+                cur.execute(
+                    """
+                    INSERT OR IGNORE INTO subjective_episode_cues_by_being
+                        (being_id_value, episode_id, cue_canonical)
+                    VALUES (?, ?, ?)
+                    """,
+                    (being_id.value, eid, ck),
+                )
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        self._decoded.discard(being_id, eid)
 
     def get_by_being(
         self, being_id: BeingId, episode_id: str
@@ -339,7 +683,7 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
             raise TypeError("being_id must be BeingId")
         cur = self._conn.execute(
             """
-            SELECT payload_json FROM subjective_episodes_by_being
+            SELECT episode_id, payload_json FROM subjective_episodes_by_being
             WHERE being_id_value = ? AND episode_id = ?
             """,
             (being_id.value, episode_id),
@@ -347,7 +691,27 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
         row = cur.fetchone()
         if row is None:
             return None
-        return _payload_dict_to_episode(json.loads(str(row[0])), being_id=being_id)
+        return self._decode(being_id, str(row[0]), row[1])
+
+    def get_many_by_being(
+        self, being_id: BeingId, episode_ids: Sequence[str]
+    ) -> dict[str, SubjectiveEpisode]:
+        if not isinstance(being_id, BeingId):
+            raise TypeError("being_id must be BeingId")
+        out: dict[str, SubjectiveEpisode] = {}
+        for chunk in chunked(list(dict.fromkeys(episode_ids))):
+            placeholders = ", ".join("?" for _ in chunk)
+            cur = self._conn.execute(
+                f"""
+                SELECT episode_id, payload_json FROM subjective_episodes_by_being
+                WHERE being_id_value = ? AND episode_id IN ({placeholders})
+                """,
+                (being_id.value, *chunk),
+            )
+            for row in cur.fetchall():
+                eid = str(row[0])
+                out[eid] = self._decode(being_id, eid, row[1])
+        return out
 
     def list_recent_by_being(
         self,
@@ -362,7 +726,7 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
         if min_occurred_at is None:
             cur = self._conn.execute(
                 """
-                SELECT payload_json FROM subjective_episodes_by_being
+                SELECT episode_id, payload_json FROM subjective_episodes_by_being
                 WHERE being_id_value = ?
                 ORDER BY occurred_at_key DESC, episode_id DESC
                 LIMIT ?
@@ -373,7 +737,7 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
             border_key = _datetime_to_occurred_at_key(min_occurred_at)
             cur = self._conn.execute(
                 """
-                SELECT payload_json FROM subjective_episodes_by_being
+                SELECT episode_id, payload_json FROM subjective_episodes_by_being
                 WHERE being_id_value = ?
                   AND occurred_at_key < ?
                 ORDER BY occurred_at_key DESC, episode_id DESC
@@ -381,7 +745,7 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
                 """,
                 (being_id.value, border_key, limit),
             )
-        return [_payload_dict_to_episode(json.loads(str(r[0])), being_id=being_id) for r in cur.fetchall()]
+        return [self._decode(being_id, str(r[0]), r[1]) for r in cur.fetchall()]
 
     def list_by_cue_by_being(
         self,
@@ -398,7 +762,7 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
         if min_occurred_at is None:
             cur = self._conn.execute(
                 """
-                SELECT e.payload_json
+                SELECT e.episode_id, e.payload_json
                 FROM subjective_episode_cues_by_being c
                 JOIN subjective_episodes_by_being e
                   ON e.being_id_value = c.being_id_value AND e.episode_id = c.episode_id
@@ -412,7 +776,7 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
             border_key = _datetime_to_occurred_at_key(min_occurred_at)
             cur = self._conn.execute(
                 """
-                SELECT e.payload_json
+                SELECT e.episode_id, e.payload_json
                 FROM subjective_episode_cues_by_being c
                 JOIN subjective_episodes_by_being e
                   ON e.being_id_value = c.being_id_value AND e.episode_id = c.episode_id
@@ -423,23 +787,110 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
                 """,
                 (being_id.value, canonical, border_key, limit),
             )
-        return [_payload_dict_to_episode(json.loads(str(r[0])), being_id=being_id) for r in cur.fetchall()]
+        return [self._decode(being_id, str(r[0]), r[1]) for r in cur.fetchall()]
+
+    def list_by_cues_by_being(
+        self,
+        being_id: BeingId,
+        cues: Sequence[EpisodicCue],
+        limit_per_cue: int,
+        min_occurred_at: datetime | None = None,
+    ) -> list[tuple[SubjectiveEpisode, frozenset[str]]]:
+        headers = self.list_cue_headers_by_being(
+            being_id, cues, limit_per_cue, min_occurred_at
+        )
+        episodes = self.get_many_by_being(being_id, [h.episode_id for h in headers])
+        return [
+            (episodes[h.episode_id], h.matched_cue_canonicals)
+            for h in headers
+            if h.episode_id in episodes
+        ]
+
+    def list_cue_headers_by_being(
+        self,
+        being_id: BeingId,
+        cues: Sequence[EpisodicCue],
+        limit_per_cue: int,
+        min_occurred_at: datetime | None = None,
+    ) -> list[SubjectiveEpisodeHeader]:
+        """cue 集合を ``cue_canonical IN (...)`` の 1 文で引き、episode ごとにまとめる。
+
+        cue ごとの上位 ``limit_per_cue`` 件は window 関数 (ROW_NUMBER を
+        cue_canonical で PARTITION) で切るので、``list_by_cue_by_being`` を
+        cue 数だけ呼んだ和集合と同じ結果になる。cue が多いときは
+        ``chunked`` 単位に分けるが、上位判定は cue ごとに閉じているため
+        チャンク間で結果を足し合わせるだけでよい。payload は読まない。
+        """
+        if not isinstance(being_id, BeingId):
+            raise TypeError("being_id must be BeingId")
+        if limit_per_cue <= 0:
+            return []
+        canonicals = list(dict.fromkeys(c.to_canonical() for c in cues))
+        border_clause = ""
+        border_params: tuple[Any, ...] = ()
+        if min_occurred_at is not None:
+            border_clause = "AND e.occurred_at_key < ?"
+            border_params = (_datetime_to_occurred_at_key(min_occurred_at),)
+        keys: dict[str, float] = {}
+        matched: dict[str, set[str]] = {}
+        for chunk in chunked(canonicals):
+            placeholders = ", ".join("?" for _ in chunk)
+            cur = self._conn.execute(
+                f"""
+                SELECT episode_id, occurred_at_key,
+                       group_concat(cue_canonical, ?) AS matched
+                FROM (
+                    SELECT c.episode_id, c.cue_canonical, e.occurred_at_key,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY c.cue_canonical
+                               ORDER BY e.occurred_at_key DESC, e.episode_id DESC
+                           ) AS rank_in_cue
+                    FROM subjective_episode_cues_by_being c
+                    JOIN subjective_episodes_by_being e
+                      ON e.being_id_value = c.being_id_value AND e.episode_id = c.episode_id
+                    WHERE c.being_id_value = ? AND c.cue_canonical IN ({placeholders})
+                      {border_clause}
+                )
+                WHERE rank_in_cue <= ?
+                GROUP BY episode_id
+                """,
+                (
+                    _CANONICAL_SEPARATOR,
+                    being_id.value,
+                    *chunk,
+                    *border_params,
+                    limit_per_cue,
+                ),
+            )
+            for r in cur.fetchall():
+                eid = str(r[0])
+                keys[eid] = float(r[1])
+                matched.setdefault(eid, set()).update(
+                    str(r[2]).split(_CANONICAL_SEPARATOR)
+                )
+        headers = [
+            SubjectiveEpisodeHeader(
+                episode_id=eid,
+                occurred_at_key=key,
+                matched_cue_canonicals=frozenset(matched[eid]),
+            )
+            for eid, key in keys.items()
+        ]
+        headers.sort(key=SubjectiveEpisodeHeader.sort_key, reverse=True)
+        return headers
 
     def list_all_by_being(self, being_id: BeingId) -> list[SubjectiveEpisode]:
         if not isinstance(being_id, BeingId):
             raise TypeError("being_id must be BeingId")
         cur = self._conn.execute(
             """
-            SELECT payload_json FROM subjective_episodes_by_being
+            SELECT episode_id, payload_json FROM subjective_episodes_by_being
             WHERE being_id_value = ?
             ORDER BY occurred_at_key ASC, episode_id ASC
             """,
             (being_id.value,),
         )
-        return [
-            _payload_dict_to_episode(json.loads(str(r[0])), being_id=being_id)
-            for r in cur.fetchall()
-        ]
+        return [self._decode(being_id, str(r[0]), r[1]) for r in cur.fetchall()]
 
     def replace_all_by_being(
         self, being_id: BeingId, episodes: list[SubjectiveEpisode]
@@ -471,9 +922,7 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
                 (being_id.value,),
             )
             for ep in episodes:
-                payload = json.dumps(
-                    _episode_to_payload_dict(ep), ensure_ascii=False
-                )
+                payload = _encode_payload(ep)
                 key = _occurred_at_sort_key(ep)
                 cur.execute(
                     """
@@ -496,3 +945,5 @@ class SqliteSubjectiveEpisodeStore(EpisodicEpisodeRepository):
         except Exception:
             self._conn.rollback()
             raise
+        finally:
+            self._decoded.clear_being(being_id)
@@ -0,0 +1,214 @@
+"""tick 単位の identity map を持つ PlayerStatusRepository の decorator。
+
+tick 中は travel / scenario_event / needs_decay / status_effects などの stage、
+scenario condition 評価、観測の recipient strategy がそれぞれ
+``find_all()`` / ``find_by_id()`` を呼び直す。SQLite 実装では毎回 N+1 の子
+query + 全集約の deepcopy、in-memory 実装でも ``find_by_id`` / ``save`` ごとに
+deepcopy が走り、30 agent 規模では tick CPU の大半を占めていた。
+
+``tick_scope()`` の区間 (= simulation tick の UoW 内) だけ次の挙動になる:
+
+- 読み取り: 各集約は tick 中 1 回だけ内側の repository から load し、以降の
+  ``find_all()`` は同じ instance を返す (共有の read snapshot)
+- ``find_by_id()``: 書き換え目的の取得経路なので、呼び出しごとに共有
+  instance の独立した複製を返す (内側 repository への往復はしない)。in-memory
+  / SQLite 実装と同じく、save しなかった変更や複製側で発生した event は
+  後続の ``find_by_id()`` に持ち越されない
+- 書き込み: ``save()`` / ``save_all()`` は identity map を更新して dirty に積む
+  だけで、内側への書き込みは区間終了時に ``save_all`` 1 回へまとめる。ただし
+  未回収の domain event を持つ集約は、event 収集順 (UoW / event_sink) を
+  変えないよう即時に内側へ書く
+
+区間外・tick thread 以外からの呼び出しは内側へそのまま委譲する。区間内で
+save していない変更 (共有 instance の in-place mutation) も同 tick の後続
+stage から見える点は、in-memory 実装の ``find_all`` (live instance を返す) と
+同じ semantics。
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from ai_rpg_world.domain.player.aggregate.player_status_aggregate import (
+    PlayerStatusAggregate,
+)
+from ai_rpg_world.domain.player.repository.player_status_repository import (
+    PlayerStatusRepository,
+)
+from ai_rpg_world.domain.player.value_object.player_id import PlayerId
+
+
+@dataclass(frozen=True)
+class PlayerStatusTickStats:
+    """1 tick 分の identity map counter。
+
+    Attributes:
+        tick: 対象 tick (``tick_scope`` に渡した値)
+        loads: 内側 repository から load した集約数
+        copies: ``find_by_id`` で払い出した private copy 数
+        flushes: 区間終了時にまとめて書いた集約数 (即時書き込み分は含まない)
+        write_throughs: domain event を持つため即時に書いた回数
+    """
+
+    tick: Optional[int]
+    loads: int = 0
+    copies: int = 0
+    flushes: int = 0
+    write_throughs: int = 0
+
+
+class TickScopedPlayerStatusRepository(PlayerStatusRepository):
+    """``tick_scope`` 中だけ identity map + write-behind として振る舞う decorator。"""
+
+    def __init__(self, inner: PlayerStatusRepository) -> None:
+        self._inner = inner
+        self._owner: Optional[int] = None
+        self._tick: Optional[int] = None
+        self._identity: Dict[PlayerId, PlayerStatusAggregate] = {}
+        self._all_loaded = False
+        self._dirty: Dict[PlayerId, PlayerStatusAggregate] = {}
+        self._loads = 0
+        self._copies = 0
+        self._write_throughs = 0
+        self._last_stats: Optional[PlayerStatusTickStats] = None
+
+    @property
+    def inner(self) -> PlayerStatusRepository:
+        return self._inner
+
+    @property
+    def last_tick_stats(self) -> Optional[PlayerStatusTickStats]:
+        """直近に閉じた ``tick_scope`` の counter。1 度も閉じていなければ None。"""
+        return self._last_stats
+
+    @contextmanager
+    def tick_scope(self, tick: Optional[int] = None) -> Iterator[None]:
+        """identity map を開き、抜けるときに dirty をまとめて flush する。
+
+        stage が例外で抜けた場合も flush する: decorator 導入前は save が即時
+        反映されていたので、途中までの書き込みを捨てると挙動が変わる。
+        入れ子は不可 (tick は 1 本の thread で直列に進む前提)。
+        """
+        if self._owner is not None:
+            raise RuntimeError("tick_scope is already open")
+        self._owner = threading.get_ident()
+        self._tick = tick
+        try:
+            yield
+        finally:
+            try:
+                flushed = self._flush()
+            finally:
+                self._last_stats = PlayerStatusTickStats(
+                    tick=self._tick,
+                    loads=self._loads,
+                    copies=self._copies,
+                    flushes=flushed,
+                    write_throughs=self._write_throughs,
+                )
+                self._reset()
+
+    def _reset(self) -> None:
+        self._owner = None
+        self._tick = None
+        self._identity = {}
+        self._all_loaded = False
+        self._dirty = {}
+        self._loads = 0
+        self._copies = 0
+        self._write_throughs = 0
+
+    def _in_scope(self) -> bool:
+        return self._owner is not None and self._owner == threading.get_ident()
+
+    def _flush(self) -> int:
+        if not self._dirty:
+            return 0
+        pending = list(self._dirty.values())
+        self._dirty = {}
+        self._inner.save_all(pending)
+        return len(pending)
+
+    @staticmethod
+    def _private_copy(status: PlayerStatusAggregate) -> PlayerStatusAggregate:
+        # in-memory repository の ``_clone`` と同じく、複製側には未 publish の
+        # event を持ち越させない (原本側の回収経路を壊さない)。
+        cloned = copy.deepcopy(status)
+        cloned.clear_events()
+        return cloned
+
+    def _ensure_all_loaded(self) -> None:
+        if self._all_loaded:
+            return
+        for status in self._inner.find_all():
+            # find_by_id / save で先に入った集約の方が新しいので上書きしない。
+            if status.player_id not in self._identity:
+                self._identity[status.player_id] = status
+                self._loads += 1
+        self._all_loaded = True
+
+    def find_all(self) -> List[PlayerStatusAggregate]:
+        if not self._in_scope():
+            return self._inner.find_all()
+        self._ensure_all_loaded()
+        return list(self._identity.values())
+
+    def find_by_id(self, entity_id: PlayerId) -> Optional[PlayerStatusAggregate]:
+        if not self._in_scope():
+            return self._inner.find_by_id(entity_id)
+        status = self._identity.get(entity_id)
+        if status is None:
+            if self._all_loaded:
+                return None
+            status = self._inner.find_by_id(entity_id)
+            if status is None:
+                return None
+            self._identity[entity_id] = status
+            self._loads += 1
+        self._copies += 1
+        return self._private_copy(status)
+
+    def find_by_ids(self, entity_ids: List[PlayerId]) -> List[PlayerStatusAggregate]:
+        if not self._in_scope():
+            return self._inner.find_by_ids(entity_ids)
+        return [
+            status
+            for entity_id in entity_ids
+            for status in [self.find_by_id(entity_id)]
+            if status is not None
+        ]
+
+    def save(self, entity: PlayerStatusAggregate) -> PlayerStatusAggregate:
+        if not self._in_scope():
+            return self._inner.save(entity)
+        self._identity[entity.player_id] = entity
+        if entity.get_events():
+            self._dirty.pop(entity.player_id, None)
+            self._write_throughs += 1
+            return self._inner.save(entity)
+        self._dirty[entity.player_id] = entity
+        return entity
+
+    def save_all(self, statuses: List[PlayerStatusAggregate]) -> None:
+        if not self._in_scope():
+            self._inner.save_all(statuses)
+            return
+        for status in statuses:
+            self.save(status)
+
+    def delete(self, entity_id: PlayerId) -> bool:
+        if self._in_scope():
+            self._identity.pop(entity_id, None)
+            self._dirty.pop(entity_id, None)
+        return self._inner.delete(entity_id)
+
+    def __getattr__(self, name: str) -> Any:
+        # 実装固有の補助 API (テスト用 helper 等) は内側へ素通しする。
+        return getattr(self._inner, name)
+
+
+__all__ = ["PlayerStatusTickStats", "TickScopedPlayerStatusRepository"]
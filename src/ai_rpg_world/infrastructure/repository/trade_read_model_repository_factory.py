@@ -27,6 +27,7 @@ from ai_rpg_world.infrastructure.repository.in_memory_trade_read_model_repositor
 from ai_rpg_world.infrastructure.repository.sqlite_trade_read_model_repository import (
     SqliteTradeReadModelRepository,
 )
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import open_sqlite_connection
 
 _ENV_TRADE_READMODEL_DB_PATH = "TRADE_READMODEL_DB_PATH"
 
@@ -53,7 +54,7 @@ def create_trade_read_model_repository_from_path(
         return InMemoryTradeReadModelRepository()
     path = Path(db_path).expanduser().resolve()
     path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(path))
+    conn = open_sqlite_connection(path)
     return SqliteTradeReadModelRepository.for_standalone_connection(conn)
 
 
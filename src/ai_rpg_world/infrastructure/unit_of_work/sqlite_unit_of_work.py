@@ -18,6 +18,7 @@ import sqlite3
 from ai_rpg_world.domain.common.domain_event import BaseDomainEvent
 from ai_rpg_world.domain.common.unit_of_work import UnitOfWork
 from ai_rpg_world.domain.common.unit_of_work_factory import UnitOfWorkFactory
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import open_sqlite_connection
 
 
 class SqliteUnitOfWork(UnitOfWork):
@@ -60,11 +61,7 @@ class SqliteUnitOfWork(UnitOfWork):
             raise RuntimeError("Transaction already in progress")
         if self._owns_connection:
             assert self._database is not None
-            path = self._database
-            if path != ":memory:":
-                Path(path).expanduser().resolve().parent.mkdir(parents=True, exist_ok=True)
-            self._conn = sqlite3.connect(path)
-            self._conn.row_factory = sqlite3.Row
+            self._conn = open_sqlite_connection(self._database, row_factory=sqlite3.Row)
         else:
             self._conn = self._supplied
             if self._conn is None:
@@ -1,3 +1,4 @@
 from ai_rpg_world.infrastructure.world.pathfinding.astar_pathfinding_strategy import AStarPathfindingStrategy
+from ai_rpg_world.infrastructure.world.pathfinding.grid_pathfinding_strategy import GridPathfindingStrategy
 
-__all__ = ["AStarPathfindingStrategy"]
+__all__ = ["AStarPathfindingStrategy", "GridPathfindingStrategy"]
@@ -0,0 +1,449 @@
+"""TileGrid の整数 cell id 上で動く A* / Jump Point Search の経路探索。
+
+``AStarPathfindingStrategy`` は探索ごとに ``g_score`` / ``f_score`` /
+``came_from`` の dict を作り、隣接ノードごとに ``Coordinate`` を生成して
+``is_passable`` と ``get_movement_cost`` を別々に呼ぶ。heuristic も 8 方向移動に
+対して緩いユークリッド距離なので展開ノードが多く、既定の
+``max_iterations=1000`` に当たって大きなマップでは部分経路になりやすかった。
+
+本 strategy は ``PhysicalMapAggregate.tile_grid`` の平坦な cell id で探索する:
+
+- heuristic は octile 距離 (+ 高さの差)。現存する地形の最小コストで縮尺し、
+  admissible に保つ
+- 1 階層で、通行可能な地形のコストが一様なマップでは Jump Point Search
+  (角の擦り抜けを許す 8 方向版。既存 A* の隣接規則と同じ) で直線・斜めの
+  走査を飛ばし、ヒープに積むのは jump point だけにする
+- それ以外 (複数階層・地形コストが混在) は整数 id 上の通常の A*
+- g 値 / 親 / closed / cell コストの buffer は cell 数ぶんの ``array`` を
+  thread ごとに 1 組持ち、探索ごとに世代番号を進めて使い回す (毎回の確保・
+  初期化をしない)
+- cell コストは ``get_movement_cost_at`` を探索中 1 cell 1 回だけ引く。
+  オブジェクトのいない cell は集約側で配列だけから決まる
+
+隣接規則 (8 方向 + 上下、斜めは √2 倍)・コスト・``max_iterations`` /
+``allow_partial_path`` の意味は ``AStarPathfindingStrategy`` と同じ。同コストの
+経路が複数あるときに選ばれる経路は異なり得る。``max_iterations`` はヒープから
+取り出したノード数で数えるので、JPS では同じ上限でも遠くまで届く。
+
+``tile_grid`` を持たない map (疎なマップ・テスト用の mock 等) では
+``fallback`` (既定は ``AStarPathfindingStrategy``) に委譲する。
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from array import array
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from ai_rpg_world.domain.world.aggregate.tile_grid import TileGrid
+from ai_rpg_world.domain.world.service.pathfinding_strategy import (
+    PathfindingMap,
+    PathfindingStrategy,
+)
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate
+from ai_rpg_world.domain.world.value_object.movement_capability import MovementCapability
+from ai_rpg_world.infrastructure.world.pathfinding.astar_pathfinding_strategy import (
+    AStarPathfindingStrategy,
+)
+
+if TYPE_CHECKING:
+    from ai_rpg_world.domain.world.value_object.world_object_id import WorldObjectId
+
+_INF = float("inf")
+_SQRT2 = 1.4142135623730951
+# 2D 8 方向 (dx, dy, 倍率) と上下 (dz, 倍率 1.0)。並びは AStarPathfindingStrategy と同じ。
+_XY_MOVES: Tuple[Tuple[int, int, float], ...] = tuple(
+    (dx, dy, 1.0 if (dx == 0 or dy == 0) else _SQRT2)
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    if not (dx == 0 and dy == 0)
+)
+_Z_MOVES: Tuple[int, ...] = (-1, 1)
+_MAX_GENERATION = 0xFFFFFFFF
+
+
+class _SearchBuffers:
+    """cell 数ぶんの探索 buffer。``seen`` / ``closed`` / ``cost_seen`` が今回の世代と一致する cell の値だけが有効。"""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.generation = 0
+        self.g = array("d", bytes(8 * size))
+        self.parent = array("i", bytes(4 * size))
+        self.seen = array("I", bytes(4 * size))
+        self.closed = array("I", bytes(4 * size))
+        self.cost = array("d", bytes(8 * size))
+        self.cost_seen = array("I", bytes(4 * size))
+
+    def next_generation(self) -> int:
+        self.generation += 1
+        if self.generation > _MAX_GENERATION:
+            # 世代番号が一周したら stamp を 0 に戻してやり直す (2^32 探索に 1 回)
+            zeros = array("I", bytes(4 * self.size))
+            self.seen = array("I", zeros)
+            self.closed = array("I", zeros)
+            self.cost_seen = array("I", zeros)
+            self.generation = 1
+        return self.generation
+
+
+class GridPathfindingStrategy(PathfindingStrategy):
+    """TileGrid 上の A* / JPS。grid の無い map は ``fallback`` に委譲する。"""
+
+    def __init__(
+        self,
+        fallback: Optional[PathfindingStrategy] = None,
+        use_jump_points: bool = True,
+    ) -> None:
+        self._fallback = fallback or AStarPathfindingStrategy()
+        self._use_jump_points = use_jump_points
+        self._local = threading.local()
+
+    def _buffers(self, size: int) -> _SearchBuffers:
+        buffers: Optional[_SearchBuffers] = getattr(self._local, "buffers", None)
+        if buffers is None or buffers.size != size:
+            buffers = _SearchBuffers(size)
+            self._local.buffers = buffers
+        return buffers
+
+    def find_path(
+        self,
+        start: Coordinate,
+        goal: Coordinate,
+        map_data: PathfindingMap,
+        capability: MovementCapability,
+        max_iterations: int = 1000,
+        allow_partial_path: bool = False,
+        exclude_object_id: Optional["WorldObjectId"] = None,
+    ) -> List[Coordinate]:
+        grid = getattr(map_data, "tile_grid", None)
+        cost_at = getattr(map_data, "get_movement_cost_at", None)
+        start_idx = grid.index_of(start) if isinstance(grid, TileGrid) else -1
+        goal_idx = grid.index_of(goal) if start_idx >= 0 else -1
+        if start_idx < 0 or goal_idx < 0 or cost_at is None or grid.has_overflow:
+            return self._fallback.find_path(
+                start,
+                goal,
+                map_data,
+                capability,
+                max_iterations=max_iterations,
+                allow_partial_path=allow_partial_path,
+                exclude_object_id=exclude_object_id,
+            )
+
+        cost_range = grid.cost_range(capability)
+        if cost_range is None:
+            # どの地形も通れない: 1 歩も動けないので既存実装と同じく空
+            return []
+
+        buffers = self._buffers(grid.size)
+        generation = buffers.next_generation()
+        cell_cost = self._cell_cost_function(grid, buffers, generation, cost_at, capability, exclude_object_id)
+
+        _, _, depth = grid.shape
+        if self._use_jump_points and depth == 1 and cost_range[0] == cost_range[1]:
+            cells = self._jump_point_search(
+                grid, buffers, generation, cell_cost, start_idx, goal_idx, max_iterations, allow_partial_path
+            )
+        else:
+            cells = self._astar(
+                grid,
+                buffers,
+                generation,
+                cell_cost,
+                cost_range[0],
+                start_idx,
+                goal_idx,
+                max_iterations,
+                allow_partial_path,
+            )
+        return [grid.coordinate_of(idx) for idx in cells]
+
+    # ------------------------------------------------------------------
+    # 共通
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cell_cost_function(
+        grid: TileGrid,
+        buffers: _SearchBuffers,
+        generation: int,
+        cost_at: Callable[..., float],
+        capability: MovementCapability,
+        exclude_object_id: Optional["WorldObjectId"],
+    ) -> Callable[[int, int, int, int], float]:
+        """(idx, 局所 x, y, z) → その cell に入るコスト。探索中は 1 cell 1 回だけ引く。"""
+        cost = buffers.cost
+        cost_seen = buffers.cost_seen
+        x0, y0, z0 = grid.origin
+
+        def cell_cost(idx: int, x: int, y: int, z: int) -> float:
+            if cost_seen[idx] == generation:
+                return cost[idx]
+            value = cost_at(x + x0, y + y0, z + z0, capability, exclude_object_id)
+            cost[idx] = value
+            cost_seen[idx] = generation
+            return value
+
+        return cell_cost
+
+    @staticmethod
+    def _reconstruct(buffers: _SearchBuffers, start_idx: int, idx: int) -> List[int]:
+        parent = buffers.parent
+        path = [idx]
+        while idx != start_idx:
+            idx = parent[idx]
+            path.append(idx)
+        path.reverse()
+        return path
+
+    # ------------------------------------------------------------------
+    # 整数 id 上の A* (複数階層・地形コストが混在するマップ)
+    # ------------------------------------------------------------------
+
+    def _astar(
+        self,
+        grid: TileGrid,
+        buffers: _SearchBuffers,
+        generation: int,
+        cell_cost: Callable[[int, int, int, int], float],
+        heuristic_scale: float,
+        start_idx: int,
+        goal_idx: int,
+        max_iterations: int,
+        allow_partial_path: bool,
+    ) -> List[int]:
+        width, height, depth = grid.shape
+        plane = width * height
+        g = buffers.g
+        parent = buffers.parent
+        seen = buffers.seen
+        closed = buffers.closed
+        gz, grest = divmod(goal_idx, plane)
+        gy, gx = divmod(grest, width)
+
+        def heuristic(idx: int) -> float:
+            z, rest = divmod(idx, plane)
+            y, x = divmod(rest, width)
+            return (_octile(abs(x - gx), abs(y - gy)) + abs(z - gz)) * heuristic_scale
+
+        counter = 0
+        open_set: List[Tuple[float, int, int]] = [(0.0, counter, start_idx)]
+        g[start_idx] = 0.0
+        seen[start_idx] = generation
+        best_idx = start_idx
+        best_h = heuristic(start_idx)
+
+        iterations = 0
+        while open_set and iterations < max_iterations:
+            iterations += 1
+            _, _, current = heapq.heappop(open_set)
+            if current == goal_idx:
+                return self._reconstruct(buffers, start_idx, current)
+            if closed[current] == generation:
+                continue
+            closed[current] = generation
+
+            h = heuristic(current)
+            if h < best_h:
+                best_h = h
+                best_idx = current
+
+            z, rest = divmod(current, plane)
+            y, x = divmod(rest, width)
+            g_current = g[current]
+            for dx, dy, multiplier in _XY_MOVES:
+                nx = x + dx
+                ny = y + dy
+                if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                    continue
+                neighbor = current + dx + dy * width
+                step = cell_cost(neighbor, nx, ny, z)
+                if step == _INF:
+                    continue
+                tentative = g_current + step * multiplier
+                if seen[neighbor] != generation or tentative < g[neighbor]:
+                    seen[neighbor] = generation
+                    g[neighbor] = tentative
+                    parent[neighbor] = current
+                    counter += 1
+                    heapq.heappush(open_set, (tentative + heuristic(neighbor), counter, neighbor))
+            for dz in _Z_MOVES:
+                nz = z + dz
+                if nz < 0 or nz >= depth:
+                    continue
+                neighbor = current + dz * plane
+                step = cell_cost(neighbor, x, y, nz)
+                if step == _INF:
+                    continue
+                tentative = g_current + step
+                if seen[neighbor] != generation or tentative < g[neighbor]:
+                    seen[neighbor] = generation
+                    g[neighbor] = tentative
+                    parent[neighbor] = current
+                    counter += 1
+                    heapq.heappush(open_set, (tentative + heuristic(neighbor), counter, neighbor))
+
+        if (iterations >= max_iterations or allow_partial_path) and best_idx != start_idx:
+            return self._reconstruct(buffers, start_idx, best_idx)
+        return []
+
+    # ------------------------------------------------------------------
+    # Jump Point Search (1 階層・一様コスト)
+    # ------------------------------------------------------------------
+
+    def _jump_point_search(
+        self,
+        grid: TileGrid,
+        buffers: _SearchBuffers,
+        generation: int,
+        cell_cost: Callable[[int, int, int, int], float],
+        start_idx: int,
+        goal_idx: int,
+        max_iterations: int,
+        allow_partial_path: bool,
+    ) -> List[int]:
+        width, height, _ = grid.shape
+        g = buffers.g
+        parent = buffers.parent
+        seen = buffers.seen
+        closed = buffers.closed
+        cost = buffers.cost
+        cost_seen = buffers.cost_seen
+        gy, gx = divmod(goal_idx, width)
+
+        def walkable(x: int, y: int) -> bool:
+            if x < 0 or y < 0 or x >= width or y >= height:
+                return False
+            idx = y * width + x
+            # jump の走査はここが最内ループなので、引き済みの cell は cell_cost を呼ばない
+            if cost_seen[idx] == generation:
+                return cost[idx] != _INF
+            return cell_cost(idx, x, y, 0) != _INF
+
+        def jump(x: int, y: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+            """(x, y) から (dx, dy) 方向へ進み、最初の jump point を返す。"""
+            while True:
+                x += dx
+                y += dy
+                if not walkable(x, y):
+                    return None
+                if x == gx and y == gy:
+                    return (x, y)
+                if dx and dy:
+                    if (walkable(x - dx, y + dy) and not walkable(x - dx, y)) or (
+                        walkable(x + dx, y - dy) and not walkable(x, y - dy)
+                    ):
+                        return (x, y)
+                    # 斜め移動中は、直線方向に jump point が見つかる地点自体が jump point
+                    if jump(x, y, dx, 0) is not None or jump(x, y, 0, dy) is not None:
+                        return (x, y)
+                elif dx:
+                    if (walkable(x + dx, y + 1) and not walkable(x, y + 1)) or (
+                        walkable(x + dx, y - 1) and not walkable(x, y - 1)
+                    ):
+                        return (x, y)
+                else:
+                    if (walkable(x + 1, y + dy) and not walkable(x + 1, y)) or (
+                        walkable(x - 1, y + dy) and not walkable(x - 1, y)
+                    ):
+                        return (x, y)
+
+        def directions(x: int, y: int, current: int) -> List[Tuple[int, int]]:
+            """親からの進行方向で枝刈りした探索方向 (自然 + 強制隣接)。"""
+            if current == start_idx:
+                return [(dx, dy) for dx, dy, _ in _XY_MOVES]
+            py, px = divmod(parent[current], width)
+            dx = (x > px) - (x < px)
+            dy = (y > py) - (y < py)
+            result: List[Tuple[int, int]] = []
+            if dx and dy:
+                result.append((dx, 0))
+                result.append((0, dy))
+                result.append((dx, dy))
+                if not walkable(x - dx, y):
+                    result.append((-dx, dy))
+                if not walkable(x, y - dy):
+                    result.append((dx, -dy))
+            elif dx:
+                result.append((dx, 0))
+                if not walkable(x, y + 1):
+                    result.append((dx, 1))
+                if not walkable(x, y - 1):
+                    result.append((dx, -1))
+            else:
+                result.append((0, dy))
+                if not walkable(x + 1, y):
+                    result.append((1, dy))
+                if not walkable(x - 1, y):
+                    result.append((-1, dy))
+            return result
+
+        sy, sx = divmod(start_idx, width)
+        counter = 0
+        open_set: List[Tuple[float, int, int]] = [(0.0, counter, start_idx)]
+        g[start_idx] = 0.0
+        seen[start_idx] = generation
+        best_idx = start_idx
+        best_h = _octile(abs(sx - gx), abs(sy - gy))
+
+        iterations = 0
+        while open_set and iterations < max_iterations:
+            iterations += 1
+            _, _, current = heapq.heappop(open_set)
+            if current == goal_idx:
+                return self._expand(self._reconstruct(buffers, start_idx, current), width)
+            if closed[current] == generation:
+                continue
+            closed[current] = generation
+
+            y, x = divmod(current, width)
+            h = _octile(abs(x - gx), abs(y - gy))
+            if h < best_h:
+                best_h = h
+                best_idx = current
+
+            g_current = g[current]
+            for dx, dy in directions(x, y, current):
+                point = jump(x, y, dx, dy)
+                if point is None:
+                    continue
+                jx, jy = point
+                neighbor = jy * width + jx
+                steps = max(abs(jx - x), abs(jy - y))
+                tentative = g_current + steps * (_SQRT2 if (dx and dy) else 1.0)
+                if seen[neighbor] != generation or tentative < g[neighbor]:
+                    seen[neighbor] = generation
+                    g[neighbor] = tentative
+                    parent[neighbor] = current
+                    counter += 1
+                    f = tentative + _octile(abs(jx - gx), abs(jy - gy))
+                    heapq.heappush(open_set, (f, counter, neighbor))
+
+        if (iterations >= max_iterations or allow_partial_path) and best_idx != start_idx:
+            return self._expand(self._reconstruct(buffers, start_idx, best_idx), width)
+        return []
+
+    @staticmethod
+    def _expand(jump_points: List[int], width: int) -> List[int]:
+        """jump point 列を 1 マスずつの cell 列に展開する (区間は直線か斜め 45 度)。"""
+        cells = [jump_points[0]]
+        for a, b in zip(jump_points, jump_points[1:]):
+            ay, ax = divmod(a, width)
+            by, bx = divmod(b, width)
+            dx = (bx > ax) - (bx < ax)
+            dy = (by > ay) - (by < ay)
+            step = dx + dy * width
+            idx = a
+            while idx != b:
+                idx += step
+                cells.append(idx)
+        return cells
+
+
+def _octile(dx: int, dy: int) -> float:
+    return (dx + dy) + (_SQRT2 - 2.0) * min(dx, dy)
+
+
+__all__ = ["GridPathfindingStrategy"]
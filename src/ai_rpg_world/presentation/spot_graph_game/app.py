@@ -31,6 +31,7 @@ from ai_rpg_world.presentation.spot_graph_game.tick_loop import (
     SimulationTickLoop,
 )
 from ai_rpg_world.presentation.spot_graph_game.websocket_handler import (
+    broadcaster,
     game_event_websocket,
 )
 
@@ -130,6 +131,7 @@ def create_game_app(
             tick_loop = SimulationTickLoop(
                 manager=manager,
                 interval_seconds=tick_interval,
+                broadcaster=broadcaster,
             )
             tick_loop.start()
             logger.info(
@@ -147,6 +149,10 @@ def create_game_app(
                     await tick_loop.stop()
                 except Exception:
                     logger.exception("Tick loop stop() raised on shutdown")
+            try:
+                manager.close_saves(timeout=30.0)
+            except Exception:
+                logger.exception("Save writer close raised on shutdown")
 
     app = FastAPI(
         title="Virtual World AI Character Game",
@@ -12,6 +12,9 @@ from ai_rpg_world.presentation.spot_graph_game.dependencies import get_runtime_m
 
 router = APIRouter(prefix="/saves", tags=["saves"])
 
+# save / load は session の tick lock を取る (= 進行中の tick を待つ) ので、
+# event loop を塞がないよう sync handler (= FastAPI の thread pool) にする。
+
 
 @router.get("", response_model=SaveListResponse)
 async def list_saves() -> SaveListResponse:
@@ -20,7 +23,7 @@ async def list_saves() -> SaveListResponse:
 
 
 @router.post("", response_model=SaveSlotResponse, status_code=201)
-async def create_save(session_id: str) -> SaveSlotResponse:
+def create_save(session_id: str) -> SaveSlotResponse:
     manager = get_runtime_manager()
     save = manager.save_session(session_id)
     if save is None:
@@ -29,7 +32,7 @@ async def create_save(session_id: str) -> SaveSlotResponse:
 
 
 @router.post("/{save_id}/load", response_model=SaveSlotResponse)
-async def load_save(save_id: str) -> SaveSlotResponse:
+def load_save(save_id: str) -> SaveSlotResponse:
     manager = get_runtime_manager()
     result = manager.load_save(save_id)
     if result is None:
@@ -10,11 +10,13 @@ from __future__ import annotations
 import json
 import logging
 import threading
+import time
 import uuid
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, ContextManager, Dict, Iterator, Optional
 
 from ai_rpg_world.application.intent.action_failed_observation_emitter import (
     ActionFailedObservationEmitter,
@@ -44,6 +46,11 @@ from ai_rpg_world.application.inventory.services.player_inventory_query_service
 )
 from ai_rpg_world.domain.player.value_object.player_id import PlayerId
 from ai_rpg_world.infrastructure.scenario.scenario_id_mapper import ScenarioIdMappingError
+from ai_rpg_world.presentation.spot_graph_game.save_slots import (
+    SAVE_SLOT_STATUS_READY,
+    SAVE_SLOT_STATUS_WRITING,
+    SaveSlotStore,
+)
 from ai_rpg_world.presentation.spot_graph_game.schemas import (
     CharacterCreateRequest,
     CharacterDetailResponse,
@@ -73,6 +80,9 @@ from ai_rpg_world.presentation.spot_graph_game.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Spare sessions never ran a tick, so there is nothing in flight to drain.
+_SPARE_SESSION_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
 from ai_rpg_world.application.llm.services.failure_helpers import (  # noqa: E402
     list_destination_labels as _list_destination_labels,
     list_object_labels as _list_object_labels,
@@ -178,6 +188,10 @@ class _SessionState:
     runtime: Any = field(default=None, repr=False)
     llm_wiring: Any = field(default=None, repr=False)
     pending_llm_turns: set[int] = field(default_factory=set, repr=False)
+    # Held by the tick loop around ``advance_tick`` and by ``save_session``
+    # around capture, so a save sees a between-ticks state.
+    tick_lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    snapshot_session: Any = field(default=None, repr=False)
 
 
 @dataclass
@@ -187,6 +201,10 @@ class GameRuntimeManager:
     scenarios_dir: Path = field(default_factory=lambda: Path("data/scenarios"))
     characters_path: Path = field(default_factory=lambda: Path("var/characters.json"))
     runtime_config: Optional[Any] = field(default=None, repr=False)
+    saves_dir: Path = field(default_factory=lambda: Path("var/saves"))
+    # After each save, build a spare session for that world on the writer
+    # thread so ``load_save`` only has to restore state into it.
+    prewarm_save_loads: bool = True
 
     _scenario_cache: Dict[str, Dict[str, Any]] = field(
         default_factory=dict, repr=False
@@ -211,6 +229,11 @@ class GameRuntimeManager:
         default_factory=threading.Lock, repr=False
     )
     _CHAT_HISTORY_MAX_PER_KEY: int = 200
+    _save_slots: Optional[SaveSlotStore] = field(default=None, repr=False)
+    _spare_sessions: Dict[tuple[str, tuple[str, ...]], _SessionState] = field(
+        default_factory=dict, repr=False
+    )
+    _spare_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     # ── Worlds ──
 
@@ -374,10 +397,32 @@ class GameRuntimeManager:
     def create_session(
         self, request: SessionCreateRequest
     ) -> SessionSummaryResponse:
+        state = self._build_session_state(request.world_id, request.character_ids)
+        sid = state.session_id
+        self._sessions[sid] = state
+        logger.info("Session %s created for world %s", sid, request.world_id)
+        return SessionSummaryResponse(
+            session_id=sid,
+            world_id=request.world_id,
+            world_title=state.world_title,
+            status="running",
+            current_tick=0,
+            character_ids=request.character_ids,
+            created_at=state.created_at,
+        )
+
+    def _build_session_state(
+        self, world_id: str, character_ids: list[str]
+    ) -> _SessionState:
+        """Build a fully wired, not yet registered session for ``world_id``.
+
+        Shared by ``create_session`` and the save-slot spare pool (which builds
+        sessions ahead of time on the writer thread).
+        """
         sid = uuid.uuid4().hex[:12]
-        scenario_path = self.scenarios_dir / f"{request.world_id}.json"
+        scenario_path = self.scenarios_dir / f"{world_id}.json"
         if not scenario_path.exists():
-            raise ValueError(f"World not found: {request.world_id}")
+            raise ValueError(f"World not found: {world_id}")
 
         # PR #450: world_runtime は demos/ から application/ に移動済。
         # presentation 層が demos/ を import する旧構造を解消する。
@@ -386,8 +431,8 @@ class GameRuntimeManager:
         )
 
         world_character = None
-        if request.character_ids:
-            detail = self.get_character(request.character_ids[0])
+        if character_ids:
+            detail = self.get_character(character_ids[0])
             world_character = _character_to_prompt_input(detail)
 
         runtime = create_world_runtime(
@@ -410,7 +455,7 @@ class GameRuntimeManager:
             short_term_memory=runtime._short_term_memory,
             llm_client=create_llm_client_from_config(runtime._runtime_config),
             llm_session_run_id=sid,
-            llm_session_world_id=request.world_id,
+            llm_session_world_id=world_id,
         )
         turn_scheduler = ObservationTurnScheduler(
             turn_trigger=llm_wiring.llm_turn_trigger,
@@ -473,28 +518,16 @@ class GameRuntimeManager:
         if travel_stage is not None and hasattr(travel_stage, "set_on_arrival"):
             travel_stage.set_on_arrival(llm_wiring.llm_turn_trigger.schedule_turn)
 
-        title = runtime.metadata.title
-        state = _SessionState(
+        return _SessionState(
             session_id=sid,
-            world_id=request.world_id,
-            world_title=title,
-            character_ids=request.character_ids,
+            world_id=world_id,
+            world_title=runtime.metadata.title,
+            character_ids=list(character_ids),
             status="running",
             created_at=_utcnow_iso(),
             runtime=runtime,
             llm_wiring=llm_wiring,
         )
-        self._sessions[sid] = state
-        logger.info("Session %s created for world %s", sid, request.world_id)
-        return SessionSummaryResponse(
-            session_id=sid,
-            world_id=request.world_id,
-            world_title=title,
-            status="running",
-            current_tick=0,
-            character_ids=request.character_ids,
-            created_at=state.created_at,
-        )
 
     def get_session_state(
         self, session_id: str
@@ -564,6 +597,13 @@ class GameRuntimeManager:
         state.speed_multiplier = speed_multiplier
         return True
 
+    def session_tick_lock(self, session_id: str) -> ContextManager[Any]:
+        """Lock the tick loop holds while advancing ``session_id``."""
+        state = self._sessions.get(session_id)
+        if state is None:
+            return nullcontext()
+        return state.tick_lock
+
     def iter_running_runtimes(self) -> "Iterator[tuple[str, Any]]":
         """Yield ``(session_id, runtime)`` pairs for sessions in 'running' status.
 
@@ -831,13 +871,210 @@ class GameRuntimeManager:
     ) -> Optional[ResultRelationshipResponse]:
         return None
 
-    # ── Saves (stub) ──
+    # ── Saves ──
+
+    def _slot_store(self) -> SaveSlotStore:
+        if self._save_slots is None:
+            self._save_slots = SaveSlotStore(self.saves_dir)
+        return self._save_slots
+
+    def _snapshot_session_for(self, state: _SessionState) -> Any:
+        """Lazily build the ``ExperimentSnapshotSession`` for ``state``.
+
+        Attaches the aux Being stack first (idempotent), since Being snapshots
+        need every player resolved to a Being.
+        """
+        if state.snapshot_session is not None:
+            return state.snapshot_session
+        from ai_rpg_world.application.being.experiment_snapshot_session import (
+            ExperimentSnapshotSession,
+            wiring_stub_from_world_runtime,
+        )
+
+        runtime = state.runtime
+        wire_aux = getattr(runtime, "_wire_auxiliary_tool_stack", None)
+        if callable(wire_aux):
+            wire_aux()
+        provisioning = getattr(runtime, "_aux_being_provisioning", None)
+        if provisioning is not None:
+            for pid in runtime.get_player_ids():
+                provisioning.ensure_attached(pid)
+        state.snapshot_session = ExperimentSnapshotSession(
+            wiring_result=wiring_stub_from_world_runtime(runtime),
+            snapshot_dir=self.saves_dir,
+        )
+        return state.snapshot_session
+
+    def _prepare_spare_session(self, world_id: str, character_ids: list[str]) -> None:
+        """Build one spare session for ``(world_id, character_ids)`` if missing."""
+        key = (world_id, tuple(character_ids))
+        with self._spare_lock:
+            if key in self._spare_sessions:
+                return
+        spare = self._build_session_state(world_id, character_ids)
+        self._snapshot_session_for(spare)
+        with self._spare_lock:
+            kept = self._spare_sessions.setdefault(key, spare)
+        if kept is not spare:
+            self._close_session_state(spare)
+
+    def _close_session_state(self, state: _SessionState) -> None:
+        """Shut down an unregistered session's runtime (spare sessions)."""
+        shutdown = getattr(state.runtime, "shutdown", None)
+        if not callable(shutdown):
+            return
+        try:
+            shutdown(timeout=_SPARE_SESSION_SHUTDOWN_TIMEOUT_SECONDS)
+        except Exception:
+            logger.warning(
+                "Closing spare session %s failed", state.session_id, exc_info=True
+            )
+
+    def _take_spare_session(
+        self, world_id: str, character_ids: list[str]
+    ) -> Optional[_SessionState]:
+        with self._spare_lock:
+            return self._spare_sessions.pop((world_id, tuple(character_ids)), None)
 
     def list_saves(self) -> SaveListResponse:
-        return SaveListResponse()
+        return SaveListResponse(saves=self._slot_store().list())
 
     def save_session(self, session_id: str) -> Optional[SaveSlotResponse]:
-        return None
+        """Capture ``session_id`` into a new slot; files are written in the background.
+
+        Capture runs under the session's tick lock, so the tick loop waits at
+        most for the capture (world + Being snapshots), never for disk I/O.
+        The returned slot has ``status="writing"`` until the writer finishes.
+        """
+        state = self._sessions.get(session_id)
+        if state is None or state.runtime is None:
+            return None
+        from ai_rpg_world.application.being.being_snapshot_file_gateway import (
+            BeingSnapshotFileMetadata,
+        )
+        from ai_rpg_world.application.being.world_state_checkpoint_store import (
+            WorldStateCheckpointStore,
+        )
+
+        store = self._slot_store()
+        save_id = uuid.uuid4().hex[:12]
+        saved_at = _utcnow_iso()
+        with state.tick_lock:
+            started = time.perf_counter()
+            snapshot_session = self._snapshot_session_for(state)
+            runtime = state.runtime
+            tick = int(runtime.current_tick())
+            world_state = snapshot_session.capture_world_frozen(
+                runtime, source_scenario=state.world_id, world_tick=tick
+            )
+            beings = snapshot_session.capture_being_snapshots(
+                list(runtime.get_player_ids())
+            )
+            capture_ms = round((time.perf_counter() - started) * 1000, 3)
+        if beings.failed:
+            logger.warning(
+                "Save %s: %d Being snapshot(s) could not be captured: %s",
+                save_id,
+                len(beings.failed),
+                beings.failed,
+            )
+        slot = SaveSlotResponse(
+            save_id=save_id,
+            session_id=session_id,
+            world_title=state.world_title,
+            current_tick=tick,
+            saved_at=saved_at,
+            world_id=state.world_id,
+            character_ids=list(state.character_ids),
+            status=SAVE_SLOT_STATUS_WRITING,
+            capture_ms=capture_ms,
+        )
+
+        def _write_files() -> None:
+            WorldStateCheckpointStore(store.world_dir(save_id)).write(world_state)
+            snapshot_session.write_being_snapshots(
+                beings.snapshots,
+                store.beings_dir(save_id),
+                metadata=BeingSnapshotFileMetadata(
+                    source_scenario=state.world_id, captured_at=saved_at
+                ),
+            )
+
+        world_id, character_ids = state.world_id, list(state.character_ids)
+
+        def _prewarm() -> None:
+            self._prepare_spare_session(world_id, character_ids)
+
+        store.write_slot(
+            slot, _write_files, after=_prewarm if self.prewarm_save_loads else None
+        )
+        logger.info(
+            "Session %s saved to slot %s at tick %d (capture %.1fms)",
+            session_id,
+            save_id,
+            tick,
+            capture_ms,
+        )
+        return slot
 
     def load_save(self, save_id: str) -> Optional[SaveSlotResponse]:
-        return None
+        """Restore slot ``save_id`` into a new running session.
+
+        Uses a pre-built spare session when one is ready (see
+        ``prewarm_save_loads``), so the load itself is only the restore. The
+        returned slot carries the new session's id in ``session_id`` and the
+        measured ``restore_ms``; the stored slot keeps its original session id.
+        """
+        from ai_rpg_world.application.being.world_state_checkpoint_store import (
+            WorldStateCheckpointStore,
+        )
+
+        store = self._slot_store()
+        slot = store.get(save_id)
+        if slot is None:
+            return None
+        if slot.status == SAVE_SLOT_STATUS_WRITING:
+            # 待つのはこの slot の書き込みだけ (他 slot の書き込みや spare の
+            # pre-warm は待たない)
+            store.flush_slot(save_id)
+            slot = store.get(save_id)
+        if slot is None or slot.status != SAVE_SLOT_STATUS_READY:
+            return None
+        started = time.perf_counter()
+        state = self._take_spare_session(slot.world_id, slot.character_ids)
+        if state is None:
+            state = self._build_session_state(slot.world_id, slot.character_ids)
+        snapshot_session = self._snapshot_session_for(state)
+        snapshot_session.restore_all_from_dir(
+            store.beings_dir(save_id), current_scenario=slot.world_id
+        )
+        snapshot_session.restore_world_from_checkpoint(
+            state.runtime,
+            WorldStateCheckpointStore(store.world_dir(save_id)),
+            current_scenario=slot.world_id,
+        )
+        restore_ms = round((time.perf_counter() - started) * 1000, 3)
+        state.created_at = _utcnow_iso()
+        self._sessions[state.session_id] = state
+        updated = slot.model_copy(update={"restore_ms": restore_ms})
+        store.submit(lambda: store.put(updated))
+        if self.prewarm_save_loads:
+            world_id, character_ids = slot.world_id, list(slot.character_ids)
+            store.submit(lambda: self._prepare_spare_session(world_id, character_ids))
+        logger.info(
+            "Slot %s loaded into session %s (restore %.1fms)",
+            save_id,
+            state.session_id,
+            restore_ms,
+        )
+        return updated.model_copy(update={"session_id": state.session_id})
+
+    def close_saves(self, timeout: Optional[float] = None) -> None:
+        """Drain the save writer and close spare sessions (called on app shutdown)."""
+        if self._save_slots is not None:
+            self._save_slots.close(timeout)
+        with self._spare_lock:
+            spares = list(self._spare_sessions.values())
+            self._spare_sessions.clear()
+        for spare in spares:
+            self._close_session_state(spare)
@@ -0,0 +1,222 @@
+"""On-disk save slots for ``GameRuntimeManager``.
+
+Layout (one directory per slot)::
+
+    <saves_dir>/<save_id>/
+      slot.json            # SaveSlotResponse (metadata, incl. latencies/size)
+      world/               # WorldStateCheckpointStore (gzip chunks + manifest)
+      beings/<id>.json     # Being snapshots (restore_all_from_dir layout)
+
+Capture happens on the caller's thread while it holds the session's tick
+lock; everything after that (hashing, compression, file writes, size
+accounting) runs on a single background writer thread so that a save never
+stalls the tick loop for more than the capture itself. Slot metadata starts
+as ``status="writing"`` and becomes ``"ready"`` (or ``"failed"``) once the
+writer finishes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Callable, Optional
+
+from ai_rpg_world.presentation.spot_graph_game.schemas import SaveSlotResponse
+
+logger = logging.getLogger(__name__)
+
+SAVE_SLOT_STATUS_WRITING = "writing"
+SAVE_SLOT_STATUS_READY = "ready"
+SAVE_SLOT_STATUS_FAILED = "failed"
+
+_SLOT_METADATA_FILENAME = "slot.json"
+
+
+def _dir_size_bytes(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+class SaveSlotStore:
+    """Slot metadata registry plus the background writer thread."""
+
+    def __init__(self, saves_dir: Path) -> None:
+        self._saves_dir = saves_dir
+        self._lock = threading.Lock()
+        self._slots: dict[str, SaveSlotResponse] = {}
+        self._loaded = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: list[Future[None]] = []
+        # save_id -> that slot's file-write job (without the post-save hook)
+        self._slot_writes: dict[str, Future[None]] = {}
+
+    @property
+    def saves_dir(self) -> Path:
+        return self._saves_dir
+
+    def slot_dir(self, save_id: str) -> Path:
+        return self._saves_dir / save_id
+
+    def world_dir(self, save_id: str) -> Path:
+        return self.slot_dir(save_id) / "world"
+
+    def beings_dir(self, save_id: str) -> Path:
+        return self.slot_dir(save_id) / "beings"
+
+    # ── metadata ──
+
+    def _load_existing(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._saves_dir.is_dir():
+            return
+        for meta_path in self._saves_dir.glob(f"*/{_SLOT_METADATA_FILENAME}"):
+            try:
+                slot = SaveSlotResponse(
+                    **json.loads(meta_path.read_text(encoding="utf-8"))
+                )
+            except Exception as exc:
+                logger.warning("Skipping unreadable save slot %s: %s", meta_path, exc)
+                continue
+            self._slots.setdefault(slot.save_id, slot)
+
+    def list(self) -> list[SaveSlotResponse]:
+        """All known slots, newest first."""
+        with self._lock:
+            self._load_existing()
+            return sorted(self._slots.values(), key=lambda s: s.saved_at, reverse=True)
+
+    def get(self, save_id: str) -> Optional[SaveSlotResponse]:
+        with self._lock:
+            self._load_existing()
+            return self._slots.get(save_id)
+
+    def put(self, slot: SaveSlotResponse, *, persist: bool = True) -> None:
+        """Register ``slot``; with ``persist`` also rewrite its ``slot.json``."""
+        with self._lock:
+            self._load_existing()
+            self._slots[slot.save_id] = slot
+        if persist:
+            slot_dir = self.slot_dir(slot.save_id)
+            slot_dir.mkdir(parents=True, exist_ok=True)
+            path = slot_dir / _SLOT_METADATA_FILENAME
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_text(
+                json.dumps(slot.model_dump(), ensure_ascii=False, indent=2) + "\n",
+                encoding="utf-8",
+            )
+            tmp_path.replace(path)
+
+    # ── background writer ──
+
+    def submit(self, job: Callable[[], None]) -> Future[None]:
+        """Run ``job`` on the single writer thread (FIFO)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="save-slot-writer"
+                )
+            future = self._executor.submit(job)
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(future)
+            return future
+
+    def write_slot(
+        self,
+        slot: SaveSlotResponse,
+        write_files: Callable[[], None],
+        *,
+        after: Optional[Callable[[], None]] = None,
+    ) -> Future[None]:
+        """Persist ``slot`` as writing, then write its files in the background.
+
+        ``after`` runs on the writer thread once the slot is ready (used to
+        pre-build a spare session for fast loads); its failures are logged
+        and do not affect the slot. It is a separate job, so ``flush_slot``
+        does not wait for it.
+        """
+        self.put(slot)
+        ready = threading.Event()
+
+        def _job() -> None:
+            started = time.perf_counter()
+            try:
+                write_files()
+            except Exception:
+                logger.exception("Writing save slot %s failed", slot.save_id)
+                self.put(slot.model_copy(update={"status": SAVE_SLOT_STATUS_FAILED}))
+                return
+            self.put(
+                slot.model_copy(
+                    update={
+                        "status": SAVE_SLOT_STATUS_READY,
+                        "write_ms": round((time.perf_counter() - started) * 1000, 3),
+                        "size_bytes": _dir_size_bytes(self.slot_dir(slot.save_id)),
+                    }
+                )
+            )
+            ready.set()
+
+        def _after_job() -> None:
+            if not ready.is_set() or after is None:
+                return
+            try:
+                after()
+            except Exception:
+                logger.warning(
+                    "Post-save hook for slot %s failed", slot.save_id, exc_info=True
+                )
+
+        future = self.submit(_job)
+        with self._lock:
+            self._slot_writes = {
+                save_id: f for save_id, f in self._slot_writes.items() if not f.done()
+            }
+            self._slot_writes[slot.save_id] = future
+        if after is not None:
+            # FIFO の writer thread なので _job の後に走る
+            self.submit(_after_job)
+        return future
+
+    def flush_slot(self, save_id: str, timeout: Optional[float] = None) -> bool:
+        """Wait for ``save_id``'s file write only. Returns False on timeout."""
+        with self._lock:
+            future = self._slot_writes.get(save_id)
+        if future is None:
+            return True
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return False
+        except Exception:
+            # job 内で log 済み
+            pass
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every submitted job. Returns False on timeout."""
+        with self._lock:
+            pending = list(self._pending)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.result(timeout=remaining)
+            except FutureTimeoutError:
+                return False
+            except Exception:
+                # job 内で log 済み
+                pass
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self.flush(timeout)
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
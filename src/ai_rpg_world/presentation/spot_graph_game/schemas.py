@@ -263,6 +263,15 @@ class SaveSlotResponse(BaseModel):
     world_title: str
     current_tick: int
     saved_at: str
+    world_id: str = ""
+    character_ids: list[str] = Field(default_factory=list)
+    # "writing" until the background writer finishes, then "ready" / "failed".
+    status: str = "ready"
+    size_bytes: Optional[int] = None
+    capture_ms: Optional[float] = None
+    write_ms: Optional[float] = None
+    # Latency of the most recent load of this slot.
+    restore_ms: Optional[float] = None
 
 
 class SaveListResponse(BaseModel):
@@ -38,7 +38,15 @@ Concurrency note:
     manifest. The safe upgrade path is a per-session ``threading.Lock``
     shared between tick and route handlers — the seam is intentionally
     narrow so that the future change touches only this file plus
-    ``runtime_manager.py``.
+    ``runtime_manager.py``. Save slots already use it:
+    ``GameRuntimeManager.session_tick_lock`` is held around each
+    ``advance_tick`` and around the save capture.
+
+WebSocket push:
+    When a ``broadcaster`` (``GameEventBroadcaster``) is injected, the loop
+    awaits ``broadcaster.publish_tick`` for every session it just ticked,
+    back on the event loop thread. ``publish_tick`` only enqueues onto
+    per-connection queues, so spectators never slow the tick cadence.
 
 Executor pool sharing:
     ``run_in_executor(None, ...)`` uses the default ``ThreadPoolExecutor``
@@ -62,9 +70,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from ai_rpg_world.presentation.spot_graph_game.runtime_manager import (
@@ -95,6 +103,8 @@ class SimulationTickLoop:
 
     manager: "GameRuntimeManager"
     interval_seconds: float = 1.0
+    # GameEventBroadcaster 互換 (publish_tick(session_id, manager) を持つもの)
+    broadcaster: Optional[Any] = None
     _task: Optional[asyncio.Task[None]] = field(default=None, init=False, repr=False)
     _stop_event: Optional[asyncio.Event] = field(default=None, init=False, repr=False)
     # NOTE: mutated only from the executor thread inside
@@ -168,9 +178,10 @@ class SimulationTickLoop:
                 # advance_tick は LLM 同期 I/O を含むため event loop を直接
                 # ブロックしないよう default thread pool に offload する。
                 # これで tick 中も HTTP/WebSocket がレスポンスを返せる。
-                await loop.run_in_executor(
+                ticked = await loop.run_in_executor(
                     None, self._tick_all_running_sessions
                 )
+                await self._publish(ticked)
                 try:
                     await asyncio.wait_for(
                         stop_event.wait(),
@@ -181,19 +192,36 @@ class SimulationTickLoop:
         finally:
             logger.info("Spot graph tick loop stopped")
 
-    def _tick_all_running_sessions(self) -> None:
+    async def _publish(self, session_ids: list[str]) -> None:
+        if self.broadcaster is None:
+            return
+        for session_id in session_ids:
+            try:
+                await self.broadcaster.publish_tick(session_id, self.manager)
+            except Exception:
+                # push の失敗で tick を止めない
+                logger.exception("publish_tick failed for session %s", session_id)
+
+    def _tick_all_running_sessions(self) -> list[str]:
+        """Advance every running session once; returns the ids that ticked."""
         # Iterate via a snapshot so concurrent session creation/removal
         # during a tick does not raise RuntimeError on dict mutation.
         active_session_ids: set[str] = set()
+        ticked: list[str] = []
         for session_id, runtime in list(self.manager.iter_running_runtimes()):
             active_session_ids.add(session_id)
+            # save_session が capture 中ならその間だけ待つ (= 1 tick 未満)。
+            tick_lock = getattr(self.manager, "session_tick_lock", None)
+            lock = tick_lock(session_id) if callable(tick_lock) else nullcontext()
             try:
-                tick_value = runtime.advance_tick()
+                with lock:
+                    tick_value = runtime.advance_tick()
                 logger.debug(
                     "session=%s tick advanced to %s",
                     session_id,
                     tick_value,
                 )
+                ticked.append(session_id)
                 # 成功したら連続失敗カウントをリセット
                 if session_id in self._consecutive_failures:
                     del self._consecutive_failures[session_id]
@@ -220,3 +248,4 @@ class SimulationTickLoop:
         for stale_id in list(self._consecutive_failures.keys()):
             if stale_id not in active_session_ids:
                 del self._consecutive_failures[stale_id]
+        return ticked
@@ -1,51 +1,326 @@
-"""WebSocket handler for real-time game event streaming."""
+"""WebSocket handler for real-time game event streaming.
+
+Fan-out model:
+    ``GameEventBroadcaster.broadcast`` serialises a message once and puts the
+    resulting text on every connection's bounded queue without awaiting any
+    socket. Each connection has its own sender task that drains the queue,
+    so a slow browser only delays itself. When a queue is full the oldest
+    message is dropped. Messages sent with a ``coalesce_key`` replace a
+    still-queued message with the same key instead of piling up (a laggard
+    gets the latest tick / spot view, not every intermediate one).
+
+Spot view delta protocol (opt-in, per connection):
+    - client: ``{"action": "subscribe_spot_view", "character_id": ..., "spot_id": ...,
+      "delta": true}``
+    - server: ``{"type": "spot_view", "revision": r, "view": {...}}`` (full view)
+    - client: ``{"action": "ack", "revision": r}``
+    - server, on later changes: ``{"type": "spot_view_delta", "revision": r2,
+      "base_revision": r, "changed": {field: value, ...}}`` with only the
+      top-level ``SpotViewResponse`` fields that differ from the acknowledged
+      revision. Clients that have not acknowledged anything, or whose base has
+      aged out, get a full ``spot_view`` again. ``"delta": false`` always
+      sends full views.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 from fastapi import WebSocket, WebSocketDisconnect
 
 from ai_rpg_world.presentation.spot_graph_game.dependencies import get_runtime_manager
 
+logger = logging.getLogger(__name__)
+
+# 1 接続あたりの未送信メッセージ上限。tick は秒オーダーなので 64 あれば通常の
+# 揺らぎは吸収でき、超えるのは事実上止まっている client だけ。
+_DEFAULT_MAX_QUEUE = 64
+# spot view の revision 履歴をいくつ残すか (= これより古い ack からは full に戻す)
+_SPOT_VIEW_HISTORY = 16
+
+
+def _encode(message: dict[str, Any]) -> str:
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass
+class _SpotViewSubscription:
+    character_id: Optional[str]
+    spot_id: Optional[str]
+    delta: bool
+    acked_revision: Optional[int] = None
+
+    @property
+    def channel_key(self) -> tuple[Optional[str], Optional[str]]:
+        return (self.character_id, self.spot_id)
+
+
+@dataclass
+class _SpotViewChannel:
+    """Revision history for one ``(character_id, spot_id)`` view of a session."""
+
+    revision: int = 0
+    history: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+    def update(self, view: dict[str, Any]) -> bool:
+        """Record ``view``; returns False when it equals the latest revision."""
+        if self.revision and self.history.get(self.revision) == view:
+            return False
+        self.revision += 1
+        self.history[self.revision] = view
+        while len(self.history) > _SPOT_VIEW_HISTORY:
+            self.history.pop(min(self.history))
+        return True
+
+
+class _Connection:
+    """One WebSocket plus its bounded outbound queue and sender task."""
+
+    def __init__(self, websocket: WebSocket, max_queue: int) -> None:
+        self.websocket = websocket
+        self._max_queue = max_queue
+        self._queue: deque[tuple[Optional[str], str]] = deque()
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+        self.coalesced = 0
+        self.spot_view: Optional[_SpotViewSubscription] = None
+        self.task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def enqueue(self, text: str, coalesce_key: Optional[str] = None) -> None:
+        if self._closed:
+            return
+        if coalesce_key is not None:
+            for i, (key, _) in enumerate(self._queue):
+                if key == coalesce_key:
+                    self._queue[i] = (coalesce_key, text)
+                    self.coalesced += 1
+                    return
+        if len(self._queue) >= self._max_queue:
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append((coalesce_key, text))
+        self._wakeup.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._queue.clear()
+        self._wakeup.set()
+
+    async def run_sender(self) -> None:
+        while not self._closed:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            _, text = self._queue.popleft()
+            await self.websocket.send_text(text)
+
 
 class GameEventBroadcaster:
     """Manages WebSocket connections for a game session and broadcasts events.
 
     Clients connect via ``/api/sessions/{session_id}/events`` and receive
-    JSON messages of type ``GameEventMessage``.
+    JSON messages of type ``GameEventMessage`` (plus spot view messages when
+    subscribed).
     """
 
-    def __init__(self) -> None:
-        self._connections: dict[str, list[WebSocket]] = {}
+    def __init__(self, *, max_queue: int = _DEFAULT_MAX_QUEUE) -> None:
+        self._max_queue = max_queue
+        self._connections: dict[str, dict[WebSocket, _Connection]] = {}
+        self._spot_channels: dict[
+            str, dict[tuple[Optional[str], Optional[str]], _SpotViewChannel]
+        ] = {}
 
     async def connect(self, session_id: str, websocket: WebSocket) -> None:
         await websocket.accept()
-        self._connections.setdefault(session_id, []).append(websocket)
+        conn = _Connection(websocket, self._max_queue)
+        conn.task = asyncio.create_task(
+            self._drain(session_id, conn), name=f"ws_sender:{session_id}"
+        )
+        self._connections.setdefault(session_id, {})[websocket] = conn
+
+    async def _drain(self, session_id: str, conn: _Connection) -> None:
+        try:
+            await conn.run_sender()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("WebSocket send failed; dropping connection", exc_info=True)
+            self.disconnect(session_id, conn.websocket)
 
     def disconnect(self, session_id: str, websocket: WebSocket) -> None:
-        conns = self._connections.get(session_id, [])
-        if websocket in conns:
-            conns.remove(websocket)
+        conns = self._connections.get(session_id, {})
+        conn = conns.pop(websocket, None)
+        if conn is not None:
+            conn.close()
+            if conn.task is not None and conn.task is not asyncio.current_task():
+                conn.task.cancel()
         if not conns:
             self._connections.pop(session_id, None)
+            self._spot_channels.pop(session_id, None)
 
-    async def broadcast(self, session_id: str, message: dict[str, Any]) -> None:
-        conns = self._connections.get(session_id, [])
-        dead: list[WebSocket] = []
-        for ws in conns:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(session_id, ws)
+    async def broadcast(
+        self,
+        session_id: str,
+        message: dict[str, Any],
+        *,
+        coalesce_key: Optional[str] = None,
+    ) -> None:
+        """Queue ``message`` for every connection of ``session_id``.
+
+        Serialises once and never awaits a socket, so latency does not grow
+        with the number (or slowness) of spectators.
+        """
+        conns = self._connections.get(session_id)
+        if not conns:
+            return
+        text = _encode(message)
+        for conn in list(conns.values()):
+            conn.enqueue(text, coalesce_key)
+
+    def send(self, session_id: str, websocket: WebSocket, message: dict[str, Any]) -> None:
+        """Queue a reply for one connection (keeps order with broadcasts)."""
+        conn = self._connections.get(session_id, {}).get(websocket)
+        if conn is not None:
+            conn.enqueue(_encode(message))
 
     def session_has_listeners(self, session_id: str) -> bool:
         return bool(self._connections.get(session_id))
 
+    def connection_stats(self, session_id: str) -> list[dict[str, int]]:
+        """Per-connection ``queued`` / ``dropped`` / ``coalesced`` counters."""
+        return [
+            {"queued": c.queued, "dropped": c.dropped, "coalesced": c.coalesced}
+            for c in self._connections.get(session_id, {}).values()
+        ]
+
+    # ── spot view delta protocol ──
+
+    def subscribe_spot_view(
+        self,
+        session_id: str,
+        websocket: WebSocket,
+        *,
+        character_id: Optional[str],
+        spot_id: Optional[str],
+        delta: bool,
+        manager: Any,
+    ) -> None:
+        conn = self._connections.get(session_id, {}).get(websocket)
+        if conn is None:
+            return
+        conn.spot_view = _SpotViewSubscription(
+            character_id=character_id, spot_id=spot_id, delta=delta
+        )
+        self.publish_spot_views(session_id, manager, only=conn)
+
+    def ack_spot_view(self, session_id: str, websocket: WebSocket, revision: int) -> None:
+        conn = self._connections.get(session_id, {}).get(websocket)
+        if conn is not None and conn.spot_view is not None:
+            conn.spot_view.acked_revision = revision
+
+    def publish_spot_views(
+        self, session_id: str, manager: Any, *, only: Optional[_Connection] = None
+    ) -> None:
+        """Refresh every subscribed spot view and queue full views or deltas.
+
+        Each distinct view is computed once per call, and each distinct
+        ``(view, base revision)`` message is serialised once, however many
+        spectators share it.
+        """
+        conns = self._connections.get(session_id)
+        if not conns:
+            return
+        targets = [only] if only is not None else list(conns.values())
+        channels = self._spot_channels.setdefault(session_id, {})
+        refreshed: dict[tuple[Optional[str], Optional[str]], bool] = {}
+        encoded: dict[tuple[Any, ...], str] = {}
+        for conn in targets:
+            sub = conn.spot_view
+            if sub is None:
+                continue
+            key = sub.channel_key
+            channel = channels.setdefault(key, _SpotViewChannel())
+            if key not in refreshed:
+                try:
+                    view = manager.get_spot_view(
+                        session_id, character_id=sub.character_id, spot_id=sub.spot_id
+                    )
+                except Exception:
+                    logger.debug("get_spot_view failed for %s", key, exc_info=True)
+                    view = None
+                changed = view is not None and channel.update(view.model_dump())
+                refreshed[key] = changed
+            if not channel.revision:
+                continue
+            if only is None and not refreshed[key]:
+                continue
+            base = (
+                sub.acked_revision
+                if sub.delta and sub.acked_revision in channel.history
+                else None
+            )
+            if base == channel.revision:
+                continue
+            cache_key = (key, channel.revision, base)
+            text = encoded.get(cache_key)
+            if text is None:
+                current = channel.history[channel.revision]
+                if base is None:
+                    message = {
+                        "type": "spot_view",
+                        "revision": channel.revision,
+                        "view": current,
+                    }
+                else:
+                    previous = channel.history[base]
+                    message = {
+                        "type": "spot_view_delta",
+                        "revision": channel.revision,
+                        "base_revision": base,
+                        "changed": {
+                            name: value
+                            for name, value in current.items()
+                            if previous.get(name) != value
+                        },
+                    }
+                text = _encode(message)
+                encoded[cache_key] = text
+            conn.enqueue(text, coalesce_key=f"spot_view:{key}")
+
+    async def publish_tick(self, session_id: str, manager: Any) -> None:
+        """Push the per-tick ``game_event`` and refreshed spot views."""
+        if not self.session_has_listeners(session_id):
+            return
+        state = manager.get_session_state(session_id)
+        if state is None:
+            return
+        await self.broadcast(
+            session_id,
+            {
+                "type": "game_event",
+                "tick": state.current_tick,
+                "game_time_label": state.game_time_label,
+                "data": {"status": state.status, "is_ended": state.is_ended},
+            },
+            coalesce_key="tick",
+        )
+        self.publish_spot_views(session_id, manager)
+
 
 broadcaster = GameEventBroadcaster()
 
@@ -57,33 +332,52 @@ async def game_event_websocket(websocket: WebSocket, session_id: str) -> None:
     - Server pushes ``{"type": "game_event", ...}`` whenever game state changes
     - Client can send ``{"action": "ping"}`` → server replies ``{"type": "pong"}``
     - Client can send ``{"action": "set_speed", "speed_multiplier": 0.5}``
+    - Client can send ``{"action": "subscribe_spot_view", ...}`` /
+      ``{"action": "ack", "revision": n}`` (see module docstring)
+
+    Replies go through the same per-connection queue as broadcasts so that
+    message order is preserved and the receive loop never waits on a send.
     """
     await broadcaster.connect(session_id, websocket)
+
+    def _reply(message: dict[str, Any]) -> None:
+        broadcaster.send(session_id, websocket, message)
+
     try:
         while True:
             raw = await websocket.receive_text()
             try:
                 payload = json.loads(raw)
             except json.JSONDecodeError:
-                await websocket.send_json(
-                    {"type": "error", "detail": "Invalid JSON"}
-                )
+                _reply({"type": "error", "detail": "Invalid JSON"})
                 continue
 
             action = payload.get("action", "")
             if action == "ping":
-                await websocket.send_json({"type": "pong"})
+                _reply({"type": "pong"})
             elif action == "set_speed":
                 multiplier = payload.get("speed_multiplier", 1.0)
                 manager = get_runtime_manager()
                 manager.set_session_speed(session_id, float(multiplier))
-                await websocket.send_json(
-                    {"type": "speed_changed", "speed_multiplier": multiplier}
+                _reply({"type": "speed_changed", "speed_multiplier": multiplier})
+            elif action == "subscribe_spot_view":
+                broadcaster.subscribe_spot_view(
+                    session_id,
+                    websocket,
+                    character_id=payload.get("character_id"),
+                    spot_id=payload.get("spot_id"),
+                    delta=bool(payload.get("delta", False)),
+                    manager=get_runtime_manager(),
                 )
+            elif action == "ack":
+                try:
+                    revision = int(payload.get("revision"))
+                except (TypeError, ValueError):
+                    _reply({"type": "error", "detail": "ack needs an int revision"})
+                    continue
+                broadcaster.ack_spot_view(session_id, websocket, revision)
             else:
-                await websocket.send_json(
-                    {"type": "error", "detail": f"Unknown action: {action}"}
-                )
+                _reply({"type": "error", "detail": f"Unknown action: {action}"})
     except WebSocketDisconnect:
         pass
     finally:
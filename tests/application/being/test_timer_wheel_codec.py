@@ -0,0 +1,91 @@
+"""期限の共有 wheel は中断・再開をまたいで残る。
+
+wheel が戻らないと、再開後の世界では期限が二度と来ない。提案は流れず、板の
+注文は残り続け、食料は腐らなくなる。形だけでなく「復元後の世界で実際に
+期限切れが起きる」まで見る。
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ai_rpg_world.application.being.world_subsystems.market_board_codec import (
+    MarketBoardSubsystemCodec,
+)
+from ai_rpg_world.application.being.world_subsystems.timer_wheel_codec import (
+    TimerWheelSubsystemCodec,
+)
+from tests.application.being.test_market_board_codec import _HERB, _LENA, _build, _give
+
+
+def _round_trip(origin: Any, revived: Any) -> None:
+    """session と同じ順 (板 → wheel) で、JSON を通して捕獲・復元する。"""
+    for codec in (MarketBoardSubsystemCodec(), TimerWheelSubsystemCodec()):
+        payload = json.loads(json.dumps(codec.capture(origin)))
+        codec.restore(revived, payload)
+
+
+class TestTheDeadlinesSurviveASaveAndLoad:
+    """捕獲した時点の期限が、そのまま戻る。"""
+
+    def test_every_deadline_comes_back(self, tmp_path: Path) -> None:
+        """板の注文の期限も、置き直す経路の無い腐敗の期限も同じ形で戻る。"""
+        origin = _build(tmp_path)
+        _give(origin, _LENA, _HERB, 1)
+        origin._market_service.place_sell_order(
+            _LENA, item_label=_HERB, quantity=1, unit_price=8, current_tick=1,
+        )
+        origin._timer_wheel.schedule("food_spoilage", 7001, 9)
+
+        revived = _build(tmp_path)
+        _round_trip(origin, revived)
+
+        assert revived._timer_wheel.timers() == origin._timer_wheel.timers()
+
+    def test_an_order_still_expires_after_restore(self, tmp_path: Path) -> None:
+        """復元した世界でも、期限の次の手番に注文が流れて品が戻る。"""
+        origin = _build(tmp_path)
+        _give(origin, _LENA, _HERB, 1)
+        order = origin._market_service.place_sell_order(
+            _LENA, item_label=_HERB, quantity=1, unit_price=8, current_tick=1,
+        )
+
+        revived = _build(tmp_path)
+        _round_trip(origin, revived)
+        expired = revived._market_service.expire_orders(
+            current_tick=order.expires_at_tick + 1
+        )
+
+        assert [o.order_id for o in expired] == [order.order_id]
+        assert revived._market_service.board().find(order.order_id) is None
+
+    def test_restoring_replaces_rather_than_appends(self, tmp_path: Path) -> None:
+        """復元先に残っていた期限は消える (追記ではない)。"""
+        origin = _build(tmp_path)
+        revived = _build(tmp_path)
+        revived._timer_wheel.schedule("food_spoilage", 1, 3)
+
+        _round_trip(origin, revived)
+
+        assert revived._timer_wheel.timers() == ()
+
+
+class TestBrokenPayloadsAreRefused:
+    """壊れた payload では再開しない。"""
+
+    def test_an_unknown_schema_version_is_refused(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            TimerWheelSubsystemCodec().restore(
+                _build(tmp_path), {"schema_version": 99, "now": 0, "timers": []}
+            )
+
+    def test_a_malformed_timer_is_refused(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            TimerWheelSubsystemCodec().restore(
+                _build(tmp_path),
+                {"schema_version": 1, "now": 0, "timers": [["trade_offer", 1]]},
+            )
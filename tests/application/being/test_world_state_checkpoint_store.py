@@ -0,0 +1,178 @@
+"""world state の差分 checkpoint (content-addressed chunk + manifest)。"""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ai_rpg_world.application.being.world_state_checkpoint_store import (
+    AsyncWorldCheckpointWriter,
+    WorldStateCheckpointStore,
+    freeze_world_snapshot,
+)
+from ai_rpg_world.application.being.world_state_snapshot import WorldStateSnapshot
+from ai_rpg_world.application.being.world_state_snapshot_service import (
+    CaptureRuntimeView,
+    WorldStateSnapshotService,
+    WorldSubsystemCodec,
+)
+from tests.application.being.test_experiment_snapshot_session_runtime_roundtrip import (
+    _SCENARIO_NAME,
+    _create_runtime,
+    _session,
+)
+
+
+def _snapshot(tick: int, **subsystems: Any) -> WorldStateSnapshot:
+    return WorldStateSnapshot(
+        source_scenario="demo", world_tick=tick, subsystems=dict(subsystems)
+    )
+
+
+class _CountingRepo:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def find_by_id(self, key: int) -> dict[str, int]:
+        self.calls += 1
+        return {"id": key, "clone": self.calls}
+
+
+class _ReadTwiceCodec(WorldSubsystemCodec):
+    def __init__(self, key: str) -> None:
+        self._key = key
+
+    @property
+    def subsystem_key(self) -> str:
+        return self._key
+
+    def capture(self, runtime: Any) -> dict[str, Any]:
+        return {"a": runtime._thing_repo.find_by_id(1)["clone"], "tick": runtime.tick}
+
+    def restore(self, runtime: Any, data: dict[str, Any]) -> None:
+        pass
+
+
+class TestWorldStateCheckpointStore:
+
+    def test_unchanged_subsystems_are_reused(self, tmp_path: Path) -> None:
+        """変化の無い subsystem は chunk を書かず、前回と同じ hash を参照する。"""
+        store = WorldStateCheckpointStore(tmp_path)
+        first = store.write(freeze_world_snapshot(
+            _snapshot(10, weather={"kind": "rain"}, players={"1": {"hp": 5}})
+        ))
+        second = store.write(freeze_world_snapshot(
+            _snapshot(20, weather={"kind": "rain"}, players={"1": {"hp": 4}})
+        ))
+        assert first.written_subsystems == ("weather", "players")
+        assert second.written_subsystems == ("players",)
+        assert second.reused_subsystems == ("weather",)
+        assert store.list_checkpoints() == ["ckpt-00000010.json", "ckpt-00000020.json"]
+        assert len(list((tmp_path / "chunks").iterdir())) == 3
+        restored = store.read()
+        assert restored.world_tick == 20
+        assert restored.subsystems == {"weather": {"kind": "rain"}, "players": {"1": {"hp": 4}}}
+        assert store.read("ckpt-00000010.json").subsystems["players"] == {"1": {"hp": 5}}
+
+    def test_keep_last_prunes_manifests_and_orphan_chunks(self, tmp_path: Path) -> None:
+        store = WorldStateCheckpointStore(tmp_path, keep_last=2)
+        for tick in range(1, 5):
+            store.write(freeze_world_snapshot(
+                _snapshot(tick, static={"v": 0}, moving={"tick": tick})
+            ))
+        assert store.list_checkpoints() == ["ckpt-00000003.json", "ckpt-00000004.json"]
+        # static 1 つ + moving 2 つ (tick 3, 4) だけが残る
+        assert len(list((tmp_path / "chunks").iterdir())) == 3
+        assert store.read("ckpt-00000003.json").subsystems["moving"] == {"tick": 3}
+
+    def test_corrupted_chunk_is_rejected(self, tmp_path: Path) -> None:
+        store = WorldStateCheckpointStore(tmp_path)
+        store.write(freeze_world_snapshot(_snapshot(1, weather={"kind": "sun"})))
+        (chunk,) = (tmp_path / "chunks").iterdir()
+        chunk.write_bytes(gzip.compress(b'{"kind":"snow"}'))
+        with pytest.raises(ValueError):
+            store.read()
+
+    def test_missing_checkpoint_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            WorldStateCheckpointStore(tmp_path / "none").read()
+
+
+class TestAsyncWorldCheckpointWriter:
+
+    def test_flush_and_close_write_latest_state(self, tmp_path: Path) -> None:
+        store = WorldStateCheckpointStore(tmp_path)
+        with AsyncWorldCheckpointWriter(store) as writer:
+            for tick in range(5):
+                writer.submit(freeze_world_snapshot(_snapshot(tick, clock={"t": tick})))
+            assert writer.flush(timeout=5.0)
+            metrics = writer.metrics()
+            assert metrics["submitted"] == 5
+            assert metrics["written"] + metrics["coalesced"] == 5
+            assert metrics["last_checkpoint"] == "ckpt-00000004.json"
+        assert store.read().subsystems == {"clock": {"t": 4}}
+        with pytest.raises(RuntimeError):
+            writer.submit(freeze_world_snapshot(_snapshot(9)))
+
+
+class TestCaptureRuntimeView:
+
+    def test_find_by_id_is_cloned_once_per_capture(self) -> None:
+        """read cache 付き capture は codec 間で同じ aggregate を 1 回だけ引く。"""
+
+        class _Runtime:
+            tick = 7
+
+            def __init__(self) -> None:
+                self._thing_repo = _CountingRepo()
+
+        runtime = _Runtime()
+        service = WorldStateSnapshotService(
+            subsystem_codecs=[_ReadTwiceCodec("a"), _ReadTwiceCodec("b")]
+        )
+        plain = service.capture(runtime, source_scenario="demo", world_tick=1)
+        assert runtime._thing_repo.calls == 2
+        cached = service.capture(
+            runtime, source_scenario="demo", world_tick=1, memoize_repository_reads=True
+        )
+        assert runtime._thing_repo.calls == 3
+        assert cached.subsystems == {"a": {"a": 3, "tick": 7}, "b": {"a": 3, "tick": 7}}
+        assert plain.subsystems["b"]["a"] == 2
+        assert CaptureRuntimeView(runtime).tick == 7
+
+    def test_real_runtime_checkpoint_matches_full_capture(self, tmp_path: Path) -> None:
+        """実 runtime で checkpoint → 復元した world は world.json 経路と同じ中身になる。"""
+        runtime = _create_runtime()
+        runtime.advance_tick()
+        session = _session(runtime, tmp_path / "snap")
+        store = WorldStateCheckpointStore(tmp_path / "ckpt")
+        with AsyncWorldCheckpointWriter(store) as writer:
+            tick = int(runtime.current_tick())
+            session.capture_world_checkpoint(
+                runtime, writer, source_scenario=_SCENARIO_NAME, world_tick=tick
+            )
+            runtime.advance_tick()
+            session.capture_world_checkpoint(
+                runtime, writer, source_scenario=_SCENARIO_NAME,
+                world_tick=int(runtime.current_tick()),
+            )
+        assert writer.metrics()["failed"] == 0
+        full = session.world_snapshot_service.capture(
+            runtime, source_scenario=_SCENARIO_NAME, world_tick=int(runtime.current_tick())
+        )
+        latest = store.read()
+        assert latest.subsystems == full.subsystems
+        assert writer.last_result is not None
+        assert writer.last_result.reused_subsystems
+
+        restored = _create_runtime()
+        _session(restored, tmp_path / "snap2").restore_world_from_checkpoint(
+            restored, store, current_scenario=_SCENARIO_NAME
+        )
+        again = session.world_snapshot_service.capture(
+            restored, source_scenario=_SCENARIO_NAME, world_tick=latest.world_tick
+        )
+        assert again.subsystems == latest.subsystems
@@ -0,0 +1,131 @@
+"""tick を鍵にした期限の共有置き場 (階層型 timer wheel)。
+
+期限の来た鍵を取りこぼすと「期限が二度と来ない」世界になり、早く返すと
+生きている提案が流れる。段の境目・overflow・時刻の飛びをまたいで、全件を
+素朴に持つ model と同じ答えになることを見る。
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, Optional
+
+import pytest
+
+from ai_rpg_world.application.common.services.world_tick_timer_wheel import (
+    WorldTickTimerWheel,
+)
+
+_CHANNEL = "trade_offer"
+
+
+class TestDueKeys:
+    """期限の来た鍵だけが、期限・鍵の順で返る。"""
+
+    def test_keys_become_due_on_their_tick(self) -> None:
+        """期限の tick より前には返らず、その tick から返る。"""
+        wheel = WorldTickTimerWheel()
+        wheel.schedule(_CHANNEL, 2, 10)
+        wheel.schedule(_CHANNEL, 1, 5)
+
+        assert wheel.due_keys(_CHANNEL, 4) == ()
+        assert wheel.due_keys(_CHANNEL, 5) == (1,)
+        assert wheel.due_keys(_CHANNEL, 12) == (1, 2)
+
+    def test_due_keys_stay_until_cancelled(self) -> None:
+        """返した鍵は消さない。片付けた側が取り消すまで、次の tick にも返る。"""
+        wheel = WorldTickTimerWheel()
+        wheel.schedule(_CHANNEL, 1, 3)
+        assert wheel.due_keys(_CHANNEL, 3) == (1,)
+        assert wheel.due_keys(_CHANNEL, 4) == (1,)
+
+        assert wheel.cancel(_CHANNEL, 1) is True
+        assert wheel.due_keys(_CHANNEL, 5) == ()
+        assert wheel.cancel(_CHANNEL, 1) is False
+
+    def test_rescheduling_moves_the_deadline(self) -> None:
+        """同じ鍵を置き直すと、前の期限は消える。"""
+        wheel = WorldTickTimerWheel()
+        wheel.schedule(_CHANNEL, 1, 3)
+        wheel.schedule(_CHANNEL, 1, 300)
+
+        assert wheel.due_keys(_CHANNEL, 10) == ()
+        assert wheel.next_due_tick(_CHANNEL) == 300
+        assert wheel.count(_CHANNEL) == 1
+
+    def test_channels_are_independent(self) -> None:
+        """同じ鍵でも channel が違えば別の期限。"""
+        wheel = WorldTickTimerWheel()
+        wheel.schedule("trade_offer", 1, 3)
+        wheel.schedule("market_order", 1, 8)
+        wheel.cancel_channel("trade_offer")
+
+        assert wheel.due_keys("trade_offer", 10) == ()
+        assert wheel.due_keys("market_order", 10) == (1,)
+
+    def test_bad_keys_are_refused(self) -> None:
+        """snapshot に載らない鍵は置けない。"""
+        wheel = WorldTickTimerWheel()
+        with pytest.raises(TypeError):
+            wheel.schedule(_CHANNEL, (1, 2), 3)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            wheel.schedule(_CHANNEL, 1, 3.5)  # type: ignore[arg-type]
+
+
+class TestAgreesWithANaiveModel:
+    """段の境目・overflow・時刻の飛びをまたいでも、全件走査と同じ答え。"""
+
+    def test_random_operations(self) -> None:
+        rng = random.Random(20261017)
+        wheel = WorldTickTimerWheel()
+        model: Dict[int, int] = {}
+        tick = 0
+        for _ in range(4000):
+            action = rng.random()
+            if action < 0.45:
+                # 近い期限・段をまたぐ期限・overflow まで行く期限を混ぜる
+                span = rng.choice((3, 70, 5000, 20_000_000))
+                key = rng.randrange(200)
+                due = tick + rng.randrange(-2, span)
+                wheel.schedule(_CHANNEL, key, due)
+                model[key] = due
+            elif action < 0.6 and model:
+                key = rng.choice(sorted(model))
+                wheel.cancel(_CHANNEL, key)
+                del model[key]
+            else:
+                tick += rng.choice((1, 1, 1, 7, 64, 4096, 300_000))
+                expected = tuple(
+                    sorted(
+                        (key for key, due in model.items() if due <= tick),
+                        key=lambda key: (model[key], str(key)),
+                    )
+                )
+                assert wheel.due_keys(_CHANNEL, tick) == expected
+                for key in expected:
+                    if rng.random() < 0.8:
+                        wheel.cancel(_CHANNEL, key)
+                        del model[key]
+            expected_next: Optional[int] = min(model.values()) if model else None
+            assert wheel.next_due_tick(_CHANNEL) == expected_next
+
+
+class TestSnapshot:
+    """保存して差し替えると、同じ期限が同じ順で戻る。"""
+
+    def test_timers_round_trip_through_replace_all(self) -> None:
+        wheel = WorldTickTimerWheel()
+        wheel.schedule("trade_offer", 3, 40)
+        wheel.schedule("food_spoilage", 7001, 9)
+        wheel.due_keys("trade_offer", 12)
+
+        restored = WorldTickTimerWheel()
+        restored.schedule("market_order", 1, 2)
+        restored.replace_all(wheel.timers(), now=wheel.now)
+
+        assert restored.timers() == wheel.timers()
+        assert restored.now == 12
+        assert restored.count("market_order") == 0
+        assert restored.due_keys("food_spoilage", 12) == (7001,)
+        assert restored.due_keys("trade_offer", 39) == ()
+        assert restored.due_keys("trade_offer", 40) == (3,)
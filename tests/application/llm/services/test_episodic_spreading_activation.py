@@ -0,0 +1,202 @@
+"""拡散活性化 (hop 同期のフロンティア一括取得) と隣接リスト cache 付き link store の検証。"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ai_rpg_world.application.llm.services.adjacency_cached_memory_link_store import (
+    AdjacencyCachedMemoryLinkStore,
+)
+from ai_rpg_world.application.llm.services.episodic_spreading_activation import (
+    neighbor_priming_scores,
+)
+from ai_rpg_world.application.llm.services.in_memory_episodic_memory_link_store import (
+    InMemoryMemoryLinkStore,
+)
+from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (
+    MemoryLink,
+    MemoryLinkType,
+    effective_link_strength,
+    other_episode_id,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_memory_link_store import (
+    SqliteMemoryLinkStore,
+)
+
+_BEING = BeingId("being_w1_p1")
+_NOW = datetime(2026, 6, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _link(a: str, b: str, *, strength: float, days_ago: float = 0.0, link_type=MemoryLinkType.CO_RECALL) -> MemoryLink:
+    na, nb = sorted((a, b))
+    at = _NOW - timedelta(days=days_ago)
+    return MemoryLink(
+        link_id=f"memlink-{na}-{nb}-{link_type.value}",
+        player_id=1,
+        being_id=_BEING,
+        episode_id_a=na,
+        episode_id_b=nb,
+        link_type=link_type,
+        strength=strength,
+        co_activation_count=1,
+        created_at=at,
+        last_activated_at=at,
+        decay_rate=0.05,
+    )
+
+
+def _queue_priming_scores(*, seed_episode_ids, link_store, now, max_hops=2, hop_decay=0.5, min_score=0.02):
+    """1 ノードずつキューで展開していた旧実装 (比較用)。"""
+    best: dict[str, float] = {}
+    q = deque((sid, 0, 1.0) for sid in seed_episode_ids)
+    while q:
+        node, hop, act = q.popleft()
+        if hop >= max_hops:
+            continue
+        for link in link_store.list_links_for_episode_by_being(_BEING, node, now=now, limit=256):
+            other = other_episode_id(link, node)
+            if other in seed_episode_ids:
+                continue
+            n_score = act * effective_link_strength(link, now) * (hop_decay ** (hop + 1))
+            if n_score < min_score:
+                continue
+            if n_score > best.get(other, 0.0):
+                best[other] = n_score
+                q.append((other, hop + 1, n_score))
+    return best
+
+
+def _stores():
+    sqlite_store = SqliteMemoryLinkStore(sqlite3.connect(":memory:"))
+    return [
+        InMemoryMemoryLinkStore(),
+        sqlite_store,
+        AdjacencyCachedMemoryLinkStore(SqliteMemoryLinkStore(sqlite3.connect(":memory:"))),
+    ]
+
+
+class _CountingStore(InMemoryMemoryLinkStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_calls: list[int] = []
+        self.single_calls = 0
+
+    def list_all_incident_links_for_episodes_by_being(self, being_id, episode_ids):
+        self.batch_calls.append(len(episode_ids))
+        return super().list_all_incident_links_for_episodes_by_being(being_id, episode_ids)
+
+    def list_links_for_episode_by_being(self, being_id, episode_id, *, now, limit):
+        self.single_calls += 1
+        return super().list_links_for_episode_by_being(being_id, episode_id, now=now, limit=limit)
+
+
+@pytest.mark.parametrize("max_hops", [1, 2, 3])
+def test_matches_queue_expansion_on_random_graphs(max_hops: int) -> None:
+    rng = random.Random(max_hops)
+    for _ in range(4):
+        ids = [f"e{i:02d}" for i in range(30)]
+        links = [
+            _link(*rng.sample(ids, 2), strength=rng.choice((0.2, 0.5, 0.9, 1.0)), days_ago=rng.choice((0, 3, 20)))
+            for _ in range(80)
+        ]
+        seeds = frozenset(rng.sample(ids, 3))
+        for store in _stores():
+            for ln in links:
+                store.upsert_link_by_being(_BEING, ln)
+            expected = _queue_priming_scores(seed_episode_ids=seeds, link_store=store, now=_NOW, max_hops=max_hops)
+            got = neighbor_priming_scores(
+                being_id=_BEING, seed_episode_ids=seeds, link_store=store, now=_NOW, max_hops=max_hops
+            )
+            assert got == pytest.approx(expected)
+            assert seeds.isdisjoint(got)
+
+
+def test_one_batched_fetch_per_hop() -> None:
+    store = _CountingStore()
+    for a, b in (("s", "a"), ("s", "b"), ("a", "c"), ("b", "d"), ("c", "e")):
+        store.upsert_link_by_being(_BEING, _link(a, b, strength=1.0))
+
+    scores = neighbor_priming_scores(
+        being_id=_BEING, seed_episode_ids=frozenset({"s"}), link_store=store, now=_NOW, max_hops=3, min_score=0.0
+    )
+
+    assert set(scores) == {"a", "b", "c", "d", "e"}
+    assert store.batch_calls == [1, 2, 2]
+    assert store.single_calls == 0
+
+
+def test_only_strongest_links_per_node_are_followed(monkeypatch: pytest.MonkeyPatch) -> None:
+    import ai_rpg_world.application.llm.services.episodic_spreading_activation as mod
+
+    monkeypatch.setattr(mod, "NEIGHBOR_LINKS_PER_NODE", 2)
+    store = InMemoryMemoryLinkStore()
+    for other, strength in (("a", 0.9), ("b", 0.8), ("c", 0.7)):
+        store.upsert_link_by_being(_BEING, _link("s", other, strength=strength))
+
+    scores = neighbor_priming_scores(
+        being_id=_BEING, seed_episode_ids=frozenset({"s"}), link_store=store, now=_NOW, max_hops=1
+    )
+
+    assert set(scores) == {"a", "b"}
+
+
+class TestAdjacencyCachedMemoryLinkStore:
+    def _pair(self):
+        inner = SqliteMemoryLinkStore(sqlite3.connect(":memory:"))
+        return inner, AdjacencyCachedMemoryLinkStore(inner)
+
+    @staticmethod
+    def _incident(store, eid):
+        return sorted(ln.link_id for ln in store.list_all_incident_links_by_being(_BEING, eid, now=_NOW))
+
+    def test_writes_keep_cache_in_sync_with_inner(self) -> None:
+        rng = random.Random(11)
+        inner, cached = self._pair()
+        ids = [f"e{i}" for i in range(8)]
+        cached.upsert_link_by_being(_BEING, _link("e0", "e1", strength=0.5))
+        assert cached.is_loaded(_BEING) is False
+        cached.list_all_links_for_being(_BEING)
+        assert cached.is_loaded(_BEING) is True
+        for _ in range(60):
+            if rng.random() < 0.7:
+                cached.upsert_link_by_being(
+                    _BEING,
+                    _link(*rng.sample(ids, 2), strength=rng.random(), link_type=rng.choice(list(MemoryLinkType))),
+                )
+            else:
+                cached.remove_weakest_link_for_episode_by_being(_BEING, rng.choice(ids), now=_NOW)
+            for eid in ids:
+                assert self._incident(cached, eid) == self._incident(inner, eid)
+                assert cached.count_links_for_episode_by_being(_BEING, eid) == inner.count_links_for_episode_by_being(_BEING, eid)
+        batch = cached.list_all_incident_links_for_episodes_by_being(_BEING, ids)
+        expected = inner.list_all_incident_links_for_episodes_by_being(_BEING, ids)
+        assert {k: sorted(ln.link_id for ln in v) for k, v in batch.items()} == {
+            k: sorted(ln.link_id for ln in v) for k, v in expected.items()
+        }
+
+    def test_replace_all_rebuilds_cache(self) -> None:
+        inner, cached = self._pair()
+        cached.upsert_link_by_being(_BEING, _link("a", "b", strength=0.9))
+        assert cached.get_link_by_being(_BEING, "b", "a", MemoryLinkType.CO_RECALL) is not None
+
+        cached.replace_all_by_being(_BEING, [_link("p", "q", strength=0.9)])
+
+        assert cached.get_link_by_being(_BEING, "a", "b", MemoryLinkType.CO_RECALL) is None
+        assert [ln.link_id for ln in cached.list_all_links_for_being(_BEING)] == [
+            ln.link_id for ln in inner.list_all_links_for_being(_BEING)
+        ]
+
+    def test_reads_do_not_hit_inner_after_load(self) -> None:
+        inner, cached = self._pair()
+        cached.upsert_link_by_being(_BEING, _link("a", "b", strength=0.9))
+        cached.list_all_links_for_being(_BEING)
+        inner._conn.close()
+
+        assert [ln.episode_id_b for ln in cached.list_links_for_episode_by_being(_BEING, "a", now=_NOW, limit=5)] == ["b"]
+        assert list(cached.list_all_incident_links_for_episodes_by_being(_BEING, ["a", " b "])) == ["a", "b"]
@@ -0,0 +1,240 @@
+"""強リンク disjoint-set (EpisodicStrongLinkComponents) と、それを使う昇格経路の検証。"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from ai_rpg_world.application.llm.services.episodic_promotion_frontier import (
+    EpisodicPromotionFrontier,
+)
+from ai_rpg_world.application.llm.services.episodic_semantic_cluster_promotion import (
+    EpisodicSemanticClusterPromotionService,
+)
+from ai_rpg_world.application.llm.services.episodic_strong_link_components import (
+    EpisodicStrongLinkComponents,
+)
+from ai_rpg_world.application.llm.services.in_memory_episodic_memory_link_store import (
+    InMemoryMemoryLinkStore,
+)
+from ai_rpg_world.application.llm.services.in_memory_subjective_episode_store import (
+    InMemorySubjectiveEpisodeStore,
+)
+from ai_rpg_world.application.llm.services.strong_link_indexed_memory_link_store import (
+    StrongLinkIndexedMemoryLinkStore,
+)
+from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.memory.episodic.value_object.memory_link import (
+    MemoryLink,
+    MemoryLinkType,
+)
+from tests.application.llm._semantic_being_test_helpers import make_semantic_being_setup
+from tests.application.llm.services.test_episodic_semantic_promotion_incremental import _ep
+
+_BEING = BeingId("being_w1_p1")
+
+
+def _link(a: str, b: str, *, strength: float = 0.9, at: datetime | None = None, decay_rate: float = 0.001):
+    at = at or datetime.now(timezone.utc)
+    na, nb = (a, b) if a < b else (b, a)
+    return MemoryLink(
+        link_id=f"memlink-{uuid4().hex}",
+        player_id=1,
+        being_id=_BEING,
+        episode_id_a=na,
+        episode_id_b=nb,
+        link_type=MemoryLinkType.CO_RECALL,
+        strength=strength,
+        co_activation_count=1,
+        created_at=at,
+        last_activated_at=at,
+        decay_rate=decay_rate,
+    )
+
+
+class _CountingLinkStore(InMemoryMemoryLinkStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.incident_calls = 0
+        self.full_scans = 0
+
+    def list_all_incident_links_by_being(self, being_id, episode_id, *, now):
+        self.incident_calls += 1
+        return super().list_all_incident_links_by_being(being_id, episode_id, now=now)
+
+    def list_all_links_for_being(self, being_id):
+        self.full_scans += 1
+        return super().list_all_links_for_being(being_id)
+
+
+class TestEpisodicStrongLinkComponents:
+    def test_union_only_when_link_crosses_threshold(self) -> None:
+        comps = EpisodicStrongLinkComponents(min_strength=0.5)
+        comps.note_link(_BEING, _link("a", "b", strength=0.3))
+        assert comps.component_count(_BEING) == 0
+
+        comps.note_link(_BEING, _link("a", "b"))
+        comps.note_link(_BEING, _link("b", "c"))
+        [component] = comps.drain_dirty_components(_BEING)
+        assert component.members == {"a", "b", "c"}
+        assert component.size == 3
+        assert component.signature == "a,b,c"
+        assert comps.drain_dirty_components(_BEING) == []
+
+    def test_weak_upsert_marks_existing_component_dirty(self) -> None:
+        comps = EpisodicStrongLinkComponents()
+        comps.note_link(_BEING, _link("a", "b"))
+        comps.drain_dirty_components(_BEING)
+
+        comps.note_link(_BEING, _link("a", "b", strength=0.1))
+        assert [c.members for c in comps.drain_dirty_components(_BEING)] == [{"a", "b"}]
+
+    def test_min_size_filters_small_components(self) -> None:
+        comps = EpisodicStrongLinkComponents()
+        comps.note_link(_BEING, _link("a", "b"))
+        comps.note_link(_BEING, _link("x", "y"))
+        comps.note_link(_BEING, _link("y", "z"))
+        assert [c.members for c in comps.drain_dirty_components(_BEING, min_size=3)] == [
+            {"x", "y", "z"}
+        ]
+
+    def test_split_repartitions_component(self) -> None:
+        comps = EpisodicStrongLinkComponents()
+        for a, b in (("a", "b"), ("b", "c"), ("c", "d"), ("d", "e")):
+            comps.note_link(_BEING, _link(a, b))
+        [component] = comps.drain_dirty_components(_BEING)
+
+        comps.split(_BEING, component, [{"a", "b"}, {"d", "e"}])
+
+        assert comps.component_count(_BEING) == 2
+        comps.note_link(_BEING, _link("a", "b"))
+        assert [c.signature for c in comps.drain_dirty_components(_BEING)] == ["a,b"]
+
+    def test_indexed_store_tracks_removal_and_replace(self) -> None:
+        comps = EpisodicStrongLinkComponents()
+        store = StrongLinkIndexedMemoryLinkStore(InMemoryMemoryLinkStore(), comps)
+        store.upsert_link_by_being(_BEING, _link("a", "b"))
+        comps.drain_dirty_components(_BEING)
+
+        now = datetime.now(timezone.utc)
+        assert store.remove_weakest_link_for_episode_by_being(_BEING, "a", now=now)
+        assert [c.members for c in comps.drain_dirty_components(_BEING)] == [{"a", "b"}]
+
+        comps.load(_BEING, [])
+        store.replace_all_by_being(_BEING, [_link("p", "q")])
+        assert not comps.is_loaded(_BEING)
+
+
+def _promotion(links, comps=None):
+    setup = make_semantic_being_setup()
+    being_id = setup.provision(1)
+    assert being_id == _BEING
+    store = InMemorySubjectiveEpisodeStore()
+    promo = EpisodicSemanticClusterPromotionService(
+        episode_store=store,
+        link_store=links,
+        semantic_store=setup.semantic_store,
+        strong_link_components=comps,
+    )
+    return setup, store, promo
+
+
+def test_promotion_with_components_matches_full_scan_on_random_graphs() -> None:
+    rng = random.Random(7)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    promoted = 0
+    for _ in range(5):
+        ids = [f"e{i:02d}" for i in range(24)]
+        specs = []
+        for _ in range(40):
+            a, b = rng.sample(ids, 2)
+            # 減衰で閾値を割るリンクも混ぜる (union はされるが実効強度では弱い)
+            specs.append((a, b, rng.choice((0.3, 0.6, 0.9)), rng.choice((0.001, 2.0))))
+        now = base + timedelta(days=1)
+
+        results = []
+        for use_components in (False, True):
+            comps = EpisodicStrongLinkComponents() if use_components else None
+            inner = InMemoryMemoryLinkStore()
+            links = StrongLinkIndexedMemoryLinkStore(inner, comps) if comps else inner
+            setup, store, promo = _promotion(links, comps)
+            for eid in ids:
+                store.put_by_being(_BEING, _ep(episode_id=eid, player_id=1, recall_count=4))
+            for a, b, strength, decay in specs:
+                links.upsert_link_by_being(_BEING, _link(a, b, strength=strength, at=base, decay_rate=decay))
+            promo.on_after_tool_turn(1, _BEING, now=now)
+            results.append(sorted(e.evidence_episode_ids for e in setup.list_entries(1)))
+        assert results[0] == results[1]
+        promoted += len(results[0])
+    assert promoted > 0
+
+
+def test_unchanged_components_are_not_reevaluated() -> None:
+    comps = EpisodicStrongLinkComponents()
+    inner = _CountingLinkStore()
+    links = StrongLinkIndexedMemoryLinkStore(inner, comps)
+    setup, store, promo = _promotion(links, comps)
+    for eid in ("x", "y", "z", "p", "q", "r"):
+        store.put_by_being(_BEING, _ep(episode_id=eid, player_id=1, recall_count=4))
+    for a, b in (("x", "y"), ("y", "z"), ("p", "q"), ("q", "r")):
+        links.upsert_link_by_being(_BEING, _link(a, b))
+
+    promo.on_after_tool_turn(1, _BEING)
+    assert len(setup.list_entries(1)) == 2
+    assert inner.full_scans == 1
+
+    inner.incident_calls = 0
+    promo.on_after_tool_turn(1, _BEING)
+    assert inner.incident_calls == 0
+
+    # 片方の成分にだけ触れると、その成分だけ調べ直す
+    links.upsert_link_by_being(_BEING, _link("x", "z"))
+    promo.on_after_tool_turn(1, _BEING)
+    assert inner.incident_calls == 3
+    assert inner.full_scans == 1
+
+
+def test_components_find_cluster_beyond_frontier_hops() -> None:
+    """フロンティアの展開 hop 数に依らず、触れた成分全体を調べる。"""
+    comps = EpisodicStrongLinkComponents()
+    links = StrongLinkIndexedMemoryLinkStore(InMemoryMemoryLinkStore(), comps)
+    setup, store, promo = _promotion(links, comps)
+    promo.expansion_hops = 0
+    for eid in ("a", "b", "c", "d"):
+        store.put_by_being(_BEING, _ep(episode_id=eid, player_id=1, recall_count=4))
+    promo.on_after_tool_turn(1, _BEING)
+    for a, b in (("a", "b"), ("b", "c"), ("c", "d")):
+        links.upsert_link_by_being(_BEING, _link(a, b))
+
+    promo.on_after_tool_turn(1, _BEING)
+
+    [entry] = setup.list_entries(1)
+    assert entry.evidence_episode_ids == ("a", "b", "c", "d")
+
+
+def test_cluster_is_promoted_once_recall_counts_cross_the_gate() -> None:
+    """想起回数の不足で見送った成分も、想起で閾値を越えたら昇格する。
+
+    リンクは変わらないので components 側は dirty にしない。フロンティアに
+    載った想起回数の増加から成分を調べ直す。
+    """
+    comps = EpisodicStrongLinkComponents()
+    links = StrongLinkIndexedMemoryLinkStore(InMemoryMemoryLinkStore(), comps)
+    setup, store, promo = _promotion(links, comps)
+    promo.promotion_frontier = EpisodicPromotionFrontier()
+    for eid in ("a", "b", "c"):
+        store.put_by_being(_BEING, _ep(episode_id=eid, player_id=1, recall_count=1))
+    for a, b in (("a", "b"), ("b", "c")):
+        links.upsert_link_by_being(_BEING, _link(a, b))
+
+    promo.on_after_tool_turn(1, _BEING)
+    assert setup.list_entries(1) == []
+
+    for eid in ("a", "b", "c"):
+        store.put_by_being(_BEING, _ep(episode_id=eid, player_id=1, recall_count=4))
+        promo.promotion_frontier.add(_BEING, eid)
+    promo.on_after_tool_turn(1, _BEING)
+
+    [entry] = setup.list_entries(1)
+    assert entry.evidence_episode_ids == ("a", "b", "c")
@@ -0,0 +1,113 @@
+"""Phase A は世界を読む部分をすべて 1 回の gate 共有区間で組む。
+
+wave の持ち越し task では、最初の snapshot 区間を抜けた時点で tick thread が
+再開する。tool 定義・metrics sink・開始 trace・reasoning effort の解決を
+区間の外 (または 2 回目の区間) で行うと、tick 途中の世界を読む。
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from ai_rpg_world.application.llm.services.world_llm_turn import phase_a
+from ai_rpg_world.application.llm.services.world_llm_turn.types import (
+    ReasonFirstGateDecision,
+)
+from ai_rpg_world.application.llm.services.world_llm_turn.world_access_gate import (
+    WorldAccessGate,
+)
+from ai_rpg_world.domain.player.value_object.player_id import PlayerId
+
+
+class _Runtime:
+    def __init__(self, gate: WorldAccessGate, seen: List[tuple]) -> None:
+        self._gate = gate
+        self._seen = seen
+        self.in_snapshot_scope = False
+        self.trace_recorder = None
+        self.snapshot_done = None
+
+    def observe(self, name: str) -> None:
+        self._seen.append(
+            (
+                name,
+                self._gate._readers,
+                self.in_snapshot_scope,
+                self.snapshot_done.is_set(),
+            )
+        )
+
+    @contextmanager
+    def player_snapshot_scope(self) -> Iterator[None]:
+        self.in_snapshot_scope = True
+        try:
+            yield
+        finally:
+            self.in_snapshot_scope = False
+
+    def build_full_prompt(self, player_id: PlayerId, **_: Any) -> dict:
+        self.observe("prompt")
+        return {"messages": [{"role": "user", "content": "x"}]}
+
+    def resolve_turn_reasoning_effort(self, player_id: PlayerId) -> None:
+        self.observe("reasoning_effort")
+        return None
+
+
+@pytest.mark.parametrize(
+    ("reason_first", "expected"),
+    [
+        (
+            True,
+            ["tools", "prompt", "tools", "sink", "sink", "trace"],
+        ),
+        (False, ["tools", "prompt", "sink", "reasoning_effort"]),
+    ],
+)
+def test_phase_a_reads_the_world_inside_one_snapshot_scope(
+    monkeypatch, reason_first: bool, expected: List[str]
+) -> None:
+    gate = WorldAccessGate()
+    seen: List[tuple] = []
+    runtime = _Runtime(gate, seen)
+    llm_client = MagicMock()
+    llm_client.invoke.side_effect = RuntimeError("stop after the world reads")
+    wiring = SimpleNamespace(world_access_gate=gate, runtime=runtime, llm_client=llm_client)
+
+    def _observe(name: str, result: Any):
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            runtime.observe(name)
+            return result
+        return _call
+
+    monkeypatch.setattr(
+        phase_a,
+        "resolve_reason_first_gate",
+        lambda *a, **k: ReasonFirstGateDecision(reason_first, "test"),
+    )
+    monkeypatch.setattr(phase_a, "build_tools_payload", _observe("tools", []))
+    monkeypatch.setattr(phase_a, "build_llm_metrics_sink", _observe("sink", None))
+    monkeypatch.setattr(phase_a, "record_reason_first_trace", _observe("trace", None))
+    monkeypatch.setattr(phase_a, "build_prompt_capture_context", lambda *a, **k: None)
+    monkeypatch.setattr(phase_a, "llm_session_kwargs", lambda *a, **k: {})
+
+    # turn_trigger と同じく track で包み、snapshot を抜けた合図を観測する
+    run, runtime.snapshot_done = gate.track(
+        lambda: phase_a.run_phase_a(wiring, PlayerId(1))
+    )
+    run()
+
+    # LLM 呼び出し失敗後の STEP_FAILED trace は世界を読まないので対象外
+    reads = seen[: len(expected)]
+    assert [name for name, _, _, _ in reads] == expected
+    # どの読み取りも共有区間の中で、持ち越し task の合図 (snapshot_done) より前
+    assert all(
+        readers == 1 and scoped and not done for _, readers, scoped, done in reads
+    )
+    assert gate._readers == 0
+    assert runtime.snapshot_done.is_set()
@@ -0,0 +1,124 @@
+"""prefix_stable layout (``PROMPT_SECTION_ORDER=prefix_stable``) のテスト。
+
+- 実測が溜まるまでは ``stable_to_volatile`` と byte 単位で同じ出力
+- 実測の変動率 × 長さで並びを決め直し、安定 section を prefix に切り出す
+- provider の cached_tokens を section ごとの cache 率に割り振る
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ai_rpg_world.application.llm.services.context_format_strategy import (
+    SECTION_ORDER_PREFIX_STABLE,
+    SectionBasedContextFormatStrategy,
+    build_section_format_strategy_from_env,
+)
+from ai_rpg_world.application.llm.services.prompt_layout import (
+    PrefixStableContextFormatStrategy,
+    attribute_cached_tokens,
+)
+from ai_rpg_world.application.llm.services.world_llm_turn.metrics_sink import (
+    LlmMetricsTraceSink,
+)
+from ai_rpg_world.application.trace import TraceEventKind
+from ai_rpg_world.domain.player.value_object.player_id import PlayerId
+
+
+def _texts(turn: int) -> dict:
+    return dict(
+        current_state_text=f"現在地: 広場 (tick {turn})",
+        recent_events_text=f"- 出来事 {turn}",
+        relevant_memories_text="昔の記憶",
+        active_memos_text="",
+        objective_text="脱出する",
+        inventory_text="",
+        learned_text="学び " * 200,
+        mid_summary_text="最近の流れ",
+        long_summary_text="",
+        prediction_feedback_text="",
+        pending_predictions_text="",
+    )
+
+
+class TestPrefixStableLayout:
+
+    def test_initial_layout_matches_stable_to_volatile_bytes(self) -> None:
+        strategy = PrefixStableContextFormatStrategy()
+        baseline = SectionBasedContextFormatStrategy().format(**_texts(1))
+
+        layout = strategy.layout(player_id=1, **_texts(1))
+
+        assert layout.text == baseline
+        assert strategy.format(**_texts(1)) == baseline
+        assert [name for name, _ in layout.blocks[: layout.stable_block_count]] == [
+            "objective",
+            "mid_summary",
+        ]
+        assert layout.stable_text + "\n\n" + layout.volatile_text == baseline
+
+    def test_relayout_moves_long_stable_section_into_prefix(self) -> None:
+        strategy = PrefixStableContextFormatStrategy(min_samples=4, relayout_interval=4)
+        for turn in range(6):
+            strategy.layout(player_id=1, **_texts(turn))
+
+        # 長くて不変の「学び」が毎ターン書き換わる「直近の出来事」より前に来る
+        order = strategy.current_order
+        assert order.index("learned") < order.index("recent_events")
+        assert order[-1] == "current_state"
+        layout = strategy.layout(player_id=1, **_texts(99))
+        stable = [name for name, _ in layout.blocks[: layout.stable_block_count]]
+        assert "learned" in stable
+        assert "recent_events" not in stable
+        # 2 ターン続けて安定部分は byte 単位で同一
+        assert strategy.layout(player_id=1, **_texts(100)).stable_text == layout.stable_text
+
+    def test_players_are_compared_with_their_own_previous_turn(self) -> None:
+        strategy = PrefixStableContextFormatStrategy()
+        strategy.layout(player_id=1, **_texts(1))
+        strategy.layout(player_id=2, **_texts(2))
+        assert strategy.tracker.turns == 0
+        strategy.layout(player_id=1, **_texts(1))
+        stats = strategy.tracker.snapshot()
+        assert stats["current_state"]["change_rate"] == 0.0
+
+    def test_env_builds_prefix_stable_strategy(self) -> None:
+        strategy = build_section_format_strategy_from_env(
+            {"PROMPT_SECTION_ORDER": SECTION_ORDER_PREFIX_STABLE}
+        )
+        assert isinstance(strategy, PrefixStableContextFormatStrategy)
+        assert strategy.section_order == SECTION_ORDER_PREFIX_STABLE
+        with pytest.raises(ValueError, match="PrefixStableContextFormatStrategy"):
+            SectionBasedContextFormatStrategy(section_order=SECTION_ORDER_PREFIX_STABLE)
+
+
+class TestCachedTokenAttribution:
+
+    def test_cached_prefix_fills_sections_in_order(self) -> None:
+        sections = (("tools", 400), ("system", 400), ("objective", 200), ("current_state", 200))
+        result = attribute_cached_tokens(sections, prompt_tokens=600, cached_tokens=450)
+        assert [s["cached_ratio"] for s in result] == [1.0, 1.0, 0.5, 0.0]
+        assert attribute_cached_tokens(sections, prompt_tokens=0, cached_tokens=0)[0][
+            "cached_ratio"
+        ] == 0.0
+
+    def test_metrics_sink_records_cache_sections(self) -> None:
+        recorder = MagicMock()
+        runtime = MagicMock()
+        runtime.current_tick.return_value = 3
+        sink = LlmMetricsTraceSink(
+            trace_recorder=recorder,
+            runtime=runtime,
+            player_id=PlayerId(1),
+            prompt_sections=(("tools", 100), ("system", 100)),
+        )
+        metrics = MagicMock(prompt_tokens=100, cached_tokens=50, phase="one_step")
+        sink.record(metrics)
+
+        kinds = [call.args[0] for call in recorder.record.call_args_list]
+        assert kinds == [TraceEventKind.LLM_CALL, TraceEventKind.PROMPT_CACHE_SECTIONS]
+        payload = recorder.record.call_args_list[1].kwargs
+        assert payload["cached_ratio"] == 0.5
+        assert [s["cached_ratio"] for s in payload["sections"]] == [1.0, 0.0]
@@ -399,6 +399,22 @@ class TestSubjectiveEpisodeDbPath:
         with pytest.raises(ValueError, match='SUBJECTIVE_EPISODE_DB_PATH'):
             ResolvedLlmRuntimeConfig.from_mapping(values={'LLM_EPISODIC_ENABLED': '0', 'LLM_EPISODIC_SUBJECTIVE_ENABLED': '0', 'SUBJECTIVE_EPISODE_DB_PATH': 'var/episodes.db'})
 
+    def test_group_commit_ms_resolves_with_db_path(self) -> None:
+        """SUBJECTIVE_EPISODE_GROUP_COMMIT_MS は db_path と併せて解決する (既定は None)。"""
+        base = {'LLM_EPISODIC_ENABLED': '1', 'LLM_EPISODIC_SUBJECTIVE_ENABLED': '0', 'SUBJECTIVE_EPISODE_DB_PATH': 'var/episodes.db'}
+        assert ResolvedLlmRuntimeConfig.from_mapping(values=base).subjective_episode_group_commit_ms is None
+        cfg = ResolvedLlmRuntimeConfig.from_mapping(values={**base, 'SUBJECTIVE_EPISODE_GROUP_COMMIT_MS': '50'})
+        assert cfg.subjective_episode_group_commit_ms == 50
+
+    def test_group_commit_ms_without_db_path_raises_value_error(self) -> None:
+        """in-memory store に group commit は無いので、db_path 無しの指定は fail-fast。"""
+        with pytest.raises(ValueError, match='SUBJECTIVE_EPISODE_GROUP_COMMIT_MS'):
+            ResolvedLlmRuntimeConfig.from_mapping(values={'LLM_EPISODIC_ENABLED': '1', 'SUBJECTIVE_EPISODE_GROUP_COMMIT_MS': '50'})
+
+    def test_group_commit_ms_negative_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match='SUBJECTIVE_EPISODE_GROUP_COMMIT_MS'):
+            ResolvedLlmRuntimeConfig.from_mapping(values={'LLM_EPISODIC_ENABLED': '1', 'LLM_EPISODIC_SUBJECTIVE_ENABLED': '0', 'SUBJECTIVE_EPISODE_DB_PATH': 'var/episodes.db', 'SUBJECTIVE_EPISODE_GROUP_COMMIT_MS': '-1'})
+
 class TestFromMappingIgnoresOsEnviron:
     """引数省略時も環境変数を読まず、空設定の既定値になる。"""
 
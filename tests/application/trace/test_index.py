@@ -0,0 +1,110 @@
+"""trace の sidecar index と絞り込み読み出し。"""
+from pathlib import Path
+
+import pytest
+
+from ai_rpg_world.application.trace.events import TraceEventKind
+from ai_rpg_world.application.trace.index import (
+    TraceIndex,
+    load_trace_dicts,
+    query_trace_events,
+    trace_index_path,
+)
+from ai_rpg_world.application.trace.recorder import (
+    AsyncJsonlTraceRecorder,
+    JsonlTraceRecorder,
+    load_trace_events,
+)
+
+
+def _write_trace(path: Path) -> None:
+    with JsonlTraceRecorder(path) as rec:
+        rec.record(TraceEventKind.RUN_START, run_id='exp')
+        for tick in range(10):
+            for pid in (1, 2, 3):
+                rec.record(TraceEventKind.ACTION, tick=tick, player_id=pid, tool='wait')
+                rec.record(TraceEventKind.OBSERVATION, tick=tick, player_id=pid, prose='風が吹く')
+            rec.record(TraceEventKind.LLM_CALL, tick=tick, success=True)
+
+
+def _scan(path: Path, **filters):
+    return [(e.seq, e.kind) for e in query_trace_events(path, **filters)]
+
+
+class TestTraceIndex:
+
+    def test_indexed_query_matches_full_scan(self, tmp_path: Path) -> None:
+        """index 経由の絞り込みは全走査の絞り込みと同じ結果を seq 順で返す。"""
+        path = tmp_path / 'trace.jsonl'
+        _write_trace(path)
+        cases = [
+            {'kinds': [TraceEventKind.ACTION]},
+            {'tick_from': 3, 'tick_to': 5},
+            {'player_ids': [2], 'kinds': [TraceEventKind.OBSERVATION], 'tick_to': 4},
+            {'kinds': []},
+        ]
+        expected = [_scan(path, **c) for c in cases]
+        TraceIndex.build(path).close()
+        assert trace_index_path(path).exists()
+        assert [_scan(path, **c) for c in cases] == expected
+        assert len(expected[0]) == 30
+        assert [seq for seq, _ in expected[1]] == sorted(seq for seq, _ in expected[1])
+        with TraceIndex.open(path) as index:
+            assert index.count_by_kind()[TraceEventKind.LLM_CALL] == 10
+            assert index.tick_range() == (0, 9)
+
+    def test_stale_index_is_ignored(self, tmp_path: Path) -> None:
+        """trace が index 作成後に伸びたら index は使わず全走査に戻る。"""
+        path = tmp_path / 'trace.jsonl'
+        _write_trace(path)
+        TraceIndex.build(path).close()
+        with open(path, 'a', encoding='utf-8') as fh:
+            fh.write('{"seq": 999, "timestamp": "t", "kind": "note", "tick": 1, "player_id": null, "payload": {}}\n')
+        assert TraceIndex.open(path) is None
+        assert _scan(path, kinds=['note']) == [(999, 'note')]
+        with TraceIndex.open_or_build(path) as index:
+            assert [e.seq for e in index.query(kinds=['note'])] == [999]
+
+    def test_recorder_writes_index_while_recording(self, tmp_path: Path) -> None:
+        """AsyncJsonlTraceRecorder(index=True) は flush 時点・close 後追記とも index と一致する。"""
+        path = tmp_path / 'trace.jsonl'
+        rec = AsyncJsonlTraceRecorder(path, index=True, batch_size=4, max_pending=8)
+        for tick in range(20):
+            rec.record(TraceEventKind.ACTION, tick=tick, player_id=tick % 2)
+        rec.flush()
+        with TraceIndex.open(path) as index:
+            assert [e.tick for e in index.query(player_ids=[1], tick_from=10)] == [11, 13, 15, 17, 19]
+        rec.close()
+        rec.record(TraceEventKind.NOTE, tick=99, message='late')
+        with TraceIndex.open(path) as index:
+            assert [e.payload for e in index.query(kinds=['note'])] == [{'message': 'late'}]
+            assert [e.seq for e in index.query()] == [e.seq for e in load_trace_events(path)]
+
+    def test_compressed_trace_falls_back_to_scan(self, tmp_path: Path) -> None:
+        """gzip trace は index を作れないが、絞り込み読み出しは全走査で動く。"""
+        path = tmp_path / 'trace.jsonl.gz'
+        with AsyncJsonlTraceRecorder(path, compression='gzip') as rec:
+            rec.record(TraceEventKind.ACTION, tick=1, player_id=1)
+            rec.record(TraceEventKind.OBSERVATION, tick=1, player_id=1)
+        with pytest.raises(ValueError):
+            TraceIndex.build(path)
+        assert TraceIndex.open_or_build(path) is None
+        assert _scan(path, kinds=[TraceEventKind.OBSERVATION]) == [(2, TraceEventKind.OBSERVATION)]
+        assert [d['kind'] for d in load_trace_dicts(path)] == [TraceEventKind.ACTION, TraceEventKind.OBSERVATION]
+
+    def test_load_trace_dicts_skips_broken_lines(self, tmp_path: Path) -> None:
+        """viewer 向けの dict 読み出しは壊れた行を飛ばし、index も同じ行を載せない。"""
+        path = tmp_path / 'trace.jsonl'
+        path.write_text('{"seq": 1, "kind": "action", "tick": 0, "player_id": 1, "payload": {}}\n'
+                        '{broken\n'
+                        '\n'
+                        '{"seq": 2, "kind": "observation", "tick": 0, "player_id": 1, "payload": {}}\n',
+                        encoding='utf-8')
+        scanned = load_trace_dicts(path, kinds=['observation'])
+        TraceIndex.build(path).close()
+        assert load_trace_dicts(path, kinds=['observation']) == scanned
+        assert [d['seq'] for d in load_trace_dicts(path)] == [1, 2]
+
+    def test_index_with_compression_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            AsyncJsonlTraceRecorder(tmp_path / 'trace.jsonl.gz', compression='gzip', index=True)
@@ -10,7 +10,7 @@ import json
 from pathlib import Path
 import pytest
 from ai_rpg_world.application.trace.events import TraceEvent, TraceEventKind
-from ai_rpg_world.application.trace.recorder import JsonlTraceRecorder, NullTraceRecorder, load_trace_events
+from ai_rpg_world.application.trace.recorder import AsyncJsonlTraceRecorder, JsonlTraceRecorder, NullTraceRecorder, load_trace_events
 
 class TestTraceEvent:
     """TraceEvent の dict 化往復。"""
@@ -153,3 +153,93 @@ class TestJsonlTraceRecorderCloseRaceWithAsyncScheduler:
         recorder.close()
         time.sleep(0.5)
         assert recorder.record_dropped_after_close >= 1
+
+class TestAsyncJsonlTraceRecorder:
+    """writer thread がバッチで書く recorder の順序・flush・close・圧縮。"""
+
+    def test_concurrent_records_written_in_seq_order(self, tmp_path: Path) -> None:
+        """複数 thread から record してもファイル上の行は seq 順で欠けない。"""
+        import threading
+        path = tmp_path / 'trace.jsonl'
+        with AsyncJsonlTraceRecorder(path, batch_size=16, max_pending=32) as rec:
+
+            def emit(player_id: int) -> None:
+                for i in range(200):
+                    rec.record(TraceEventKind.NOTE, tick=i, player_id=player_id)
+            threads = [threading.Thread(target=emit, args=(p,)) for p in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        events = list(load_trace_events(path))
+        assert [e.seq for e in events] == list(range(1, 801))
+        # 無圧縮出力は JsonlTraceRecorder と同じ 1 行 1 JSON
+        assert json.loads(path.read_text(encoding='utf-8').splitlines()[0])['seq'] == 1
+
+    def test_flush_makes_events_readable_mid_run(self, tmp_path: Path) -> None:
+        """flush() 後は close 前でも読み戻せる (run 中の集計用)。"""
+        path = tmp_path / 'trace.jsonl'
+        rec = AsyncJsonlTraceRecorder(path, flush_interval_s=60.0)
+        rec.record(TraceEventKind.LLM_CALL, tick=1, success=True)
+        rec.flush()
+        assert [e.kind for e in load_trace_events(path)] == [TraceEventKind.LLM_CALL]
+        rec.close()
+
+    def test_record_after_close_is_appended_not_dropped(self, tmp_path: Path) -> None:
+        """close 後の record も捨てずに末尾へ追記し、件数を観測できる。"""
+        path = tmp_path / 'trace.jsonl.gz'
+        rec = AsyncJsonlTraceRecorder(path, compression='gzip')
+        rec.record(TraceEventKind.RUN_START, run_id='exp')
+        rec.close()
+        late = rec.record(TraceEventKind.NOTE, tick=9, message='post-close')
+        assert late.seq == 2
+        assert rec.records_written_after_close == 1
+        events = list(load_trace_events(path))
+        assert [e.seq for e in events] == [1, 2]
+        assert events[1].payload == {'message': 'post-close'}
+
+    def test_gzip_frames_round_trip(self, tmp_path: Path) -> None:
+        """gzip はバッチごとの member として書かれ、load_trace_events が magic で判別する。"""
+        import gzip
+        path = tmp_path / 'trace.jsonl.gz'
+        with AsyncJsonlTraceRecorder(path, compression='gzip', batch_size=4, max_pending=8) as rec:
+            for i in range(50):
+                rec.record(TraceEventKind.OBSERVATION, tick=i, player_id=1, prose='扉が軋む')
+        assert path.read_bytes()[:2] == b'\x1f\x8b'
+        assert len(gzip.decompress(path.read_bytes()).splitlines()) == 50
+        events = list(load_trace_events(path))
+        assert [e.tick for e in events] == list(range(50))
+        assert events[0].payload == {'prose': '扉が軋む'}
+
+    def test_unserializable_payload_falls_back_to_str(self, tmp_path: Path) -> None:
+        """JSON 化できない payload も writer thread で str 化して書く (record は失敗しない)。"""
+        path = tmp_path / 'trace.jsonl'
+        with AsyncJsonlTraceRecorder(path) as rec:
+            rec.record(TraceEventKind.NOTE, value=object())
+        (event,) = list(load_trace_events(path))
+        assert event.payload['value'].startswith('<object object')
+
+    def test_payload_mutated_after_record_keeps_recorded_value(self, tmp_path: Path) -> None:
+        """writer が書く前に呼び出し元が payload を書き換えても record 時点の値が残る。"""
+        path = tmp_path / 'trace.jsonl'
+        rec = AsyncJsonlTraceRecorder(path, flush_interval_s=60.0)
+        targets = {'ids': [1, 2]}
+        rec.record(TraceEventKind.NOTE, tick=1, targets=targets)
+        targets['ids'].append(3)
+        rec.close()
+        (event,) = list(load_trace_events(path))
+        assert event.payload == {'targets': {'ids': [1, 2]}}
+
+    def test_truncated_last_line_returns_complete_prefix(self, tmp_path: Path) -> None:
+        """末尾行の途中で切れた trace は、そこまでの完全な行だけを返す。"""
+        path = tmp_path / 'trace.jsonl'
+        with AsyncJsonlTraceRecorder(path) as rec:
+            for i in range(3):
+                rec.record(TraceEventKind.NOTE, tick=i, message='x' * 20)
+        data = path.read_bytes()
+        path.write_bytes(data[:-10])
+        assert [e.tick for e in load_trace_events(path)] == [0, 1]
+
+    def test_invalid_compression_raises_value_error(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            AsyncJsonlTraceRecorder(tmp_path / 'trace.jsonl', compression='brotli')
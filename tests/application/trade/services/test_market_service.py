@@ -473,6 +473,29 @@ class TestExpiryReturnsWhatWasDeposited:
         assert expired_again == ()
 
 
+    def test_only_live_orders_hold_a_deadline(
+        self, town: Any, market: MarketService
+    ) -> None:
+        """期限は生きた注文の分だけ置かれ、流れた・下げた注文の分は消える。"""
+        wheel = town._timer_wheel
+        channel = town._market_board_store.TIMER_CHANNEL
+        _give(town, _LENA, _HERB, 1)
+        order = market.place_sell_order(
+            _LENA, item_label=_HERB, quantity=1, unit_price=8, current_tick=1,
+        )
+        bid = market.place_buy_order(
+            _TOM, item_label=_BREAD, quantity=1, unit_price=3, current_tick=5,
+        )
+
+        assert wheel.due_tick_of(channel, order.order_id.value) == order.expires_at_tick + 1
+        assert market.next_expiry_tick() == order.expires_at_tick + 1
+
+        market.expire_orders(current_tick=order.expires_at_tick + 1)
+
+        assert wheel.is_scheduled(channel, order.order_id.value) is False
+        assert market.next_expiry_tick() == bid.expires_at_tick + 1
+
+
 class TestTheMerchantIsADoorOutOfTheWorld:
     """商人が受け取ったものは世界から消える。
 
@@ -7,6 +7,9 @@
 
 from __future__ import annotations
 
+from ai_rpg_world.application.common.services.world_tick_timer_wheel import (
+    WorldTickTimerWheel,
+)
 from ai_rpg_world.application.trade.services.in_memory_pending_trade_offer_store import (
     InMemoryPendingTradeOfferStore,
 )
@@ -202,3 +205,52 @@ class TestRestoringFromASnapshot:
         store.replace_all([restored])
 
         assert store.next_offer_id().value > restored.offer_id.value
+
+
+class TestDeadlinesLiveOnTheTimerWheel:
+    """wheel を渡すと、期限は wheel に置かれ、返事がつけば取り消される。"""
+
+    def test_expiry_is_found_through_the_wheel(self) -> None:
+        """期限の次の tick に、期限の来た提案だけが挙がる。"""
+        wheel = WorldTickTimerWheel()
+        store = InMemoryPendingTradeOfferStore(timer_wheel=wheel)
+        soon = _offer(store, expires_in_ticks=3)
+        _offer(store, target=_C, expires_in_ticks=30)
+
+        assert store.next_expiry_tick() == soon.expires_at_tick + 1
+        assert store.expired_offers(soon.expires_at_tick) == ()
+        assert store.expired_offers(soon.expires_at_tick + 1) == (soon,)
+
+    def test_an_answered_offer_leaves_the_wheel(self) -> None:
+        """返事のついた提案・消した提案の期限は残らない。"""
+        wheel = WorldTickTimerWheel()
+        store = InMemoryPendingTradeOfferStore(timer_wheel=wheel)
+        accepted = _offer(store)
+        removed = _offer(store, target=_C)
+
+        store.put(accepted.accept())
+        store.remove(removed.offer_id)
+
+        assert wheel.count(store.TIMER_CHANNEL) == 0
+        assert store.next_expiry_tick() is None
+
+    def test_replace_all_replaces_the_deadlines(self) -> None:
+        """丸ごと差し替えると、前の中身の期限は消え、新しい中身の期限が載る。"""
+        wheel = WorldTickTimerWheel()
+        store = InMemoryPendingTradeOfferStore(timer_wheel=wheel)
+        _offer(store, expires_in_ticks=3)
+        kept = PendingTradeOffer.create(
+            offer_id=store.next_offer_id(),
+            offerer_player_id=_B,
+            target_player_id=_C,
+            gives=TradeSide(gold=1),
+            asks=TradeSide(items=((10, 1),)),
+            created_tick=5,
+            expires_in_ticks=20,
+        )
+
+        store.replace_all([kept])
+
+        assert wheel.timers() == (
+            (store.TIMER_CHANNEL, kept.offer_id.value, kept.expires_at_tick + 1),
+        )
@@ -214,3 +214,21 @@ class TestTheCleanupRecoversFromAHalfDoneState:
         ).run(16)
 
         assert store.find(offer.offer_id) is None
+
+
+class TestExpiryScheduleDeclaration:
+    """tick scheduler へ「次に仕事がある tick」を正しく申告する。"""
+
+    def test_next_due_is_the_tick_after_the_deadline(self) -> None:
+        store, offer = _store_with_offer(created_tick=5)
+        stage = TradeOfferExpiryStage(
+            pending_trade_offer_store=store, trade_freeze_service=_RecordingFreeze(),
+        )
+        revision = stage.work_revision()
+        # 期限の tick ちょうどはまだ生きている
+        assert stage.next_due_tick(6) == 16
+        assert not offer.is_expired_at(15) and offer.is_expired_at(16)
+
+        stage.run(16)
+        assert stage.next_due_tick(16) is None
+        assert stage.work_revision() != revision
@@ -10,6 +10,9 @@ import logging
 
 import pytest
 
+from ai_rpg_world.application.common.services.world_tick_timer_wheel import (
+    WorldTickTimerWheel,
+)
 from ai_rpg_world.application.world_graph.food_spoilage_stage_service import (
     FoodSpoilageStageService,
 )
@@ -279,3 +282,104 @@ class TestInvalidAcquiredAtTick:
         reloaded = repo.find_by_id(inst.item_instance_id)
         assert reloaded.state[STATE_KEY_ACQUIRED_AT_TICK] == "bad"
         assert reloaded.state.get(STATE_KEY_SPOILED) is not True
+
+
+class TestTimerWheel:
+    """wheel を渡すと、腐る tick に期限を置き、その tick の分だけ判定する。"""
+
+    def _stage(self, repo, wheel, batches=None) -> FoodSpoilageStageService:
+        return FoodSpoilageStageService(
+            item_repository=repo,
+            spoilable_specs={RAW_FISH_SPEC_ID: 8},
+            spoiled_batch_callback=(
+                (lambda items: batches.append(items)) if batches is not None else None
+            ),
+            timer_wheel=wheel,
+        )
+
+    def test_first_sight_schedules_the_spoil_tick(self, repo_with_raw_fish) -> None:
+        """初めて見た tick + 閾値に期限が置かれ、その tick に腐る。"""
+        repo, inst = repo_with_raw_fish
+        wheel = WorldTickTimerWheel()
+        batches: list = []
+        stage = self._stage(repo, wheel, batches)
+
+        stage.run(WorldTick(3))
+
+        assert wheel.due_tick_of(stage.TIMER_CHANNEL, 7001) == 11
+        assert stage.next_due_tick(3) == 11
+        stage.run(WorldTick(10))
+        assert batches == []
+        stage.run(WorldTick(11))
+        assert [iid.value for iid, _, _ in batches[0]] == [7001]
+        assert repo.find_by_id(inst.item_instance_id).state[STATE_KEY_SPOILED] is True
+        # 腐ったら期限は外れる
+        assert wheel.count(stage.TIMER_CHANNEL) == 0
+        assert stage.next_due_tick(11) is None
+
+    def test_new_instances_are_picked_up_when_the_population_changes(
+        self, repo_with_raw_fish
+    ) -> None:
+        """後から入った instance も、顔ぶれの版が変わった tick に拾われる。"""
+        repo, _inst = repo_with_raw_fish
+        wheel = WorldTickTimerWheel()
+        stage = self._stage(repo, wheel)
+        stage.run(WorldTick(1))
+        revision = stage.work_revision()
+
+        repo.save(
+            ItemAggregate.create(
+                item_instance_id=ItemInstanceId(7002),
+                item_spec=_spec(RAW_FISH_SPEC_ID, "生の魚", spoils_after_ticks=8),
+                quantity=1,
+            )
+        )
+        assert stage.work_revision() != revision
+
+        stage.run(WorldTick(4))
+        assert wheel.due_tick_of(stage.TIMER_CHANNEL, 7002) == 12
+
+    def test_a_deleted_instance_drops_its_deadline(self, repo_with_raw_fish) -> None:
+        """期限の tick に item が無くなっていれば、期限だけ捨てる。"""
+        repo, inst = repo_with_raw_fish
+        wheel = WorldTickTimerWheel()
+        batches: list = []
+        stage = self._stage(repo, wheel, batches)
+        stage.run(WorldTick(0))
+
+        repo.delete(inst.item_instance_id)
+        stage.run(WorldTick(8))
+
+        assert batches == []
+        assert wheel.count(stage.TIMER_CHANNEL) == 0
+
+    def test_matches_the_full_scan(self) -> None:
+        """wheel の有無で、各 tick に腐る instance が変わらない。"""
+
+        def drive(wheel):
+            repo = InMemoryItemRepository(InMemoryDataStore())
+            spec = _spec(RAW_FISH_SPEC_ID, "生の魚", spoils_after_ticks=5)
+            batches: list = []
+            stage = FoodSpoilageStageService(
+                item_repository=repo,
+                spoilable_specs={RAW_FISH_SPEC_ID: 5},
+                spoiled_batch_callback=lambda items: batches.append(
+                    (tick_box[0], tuple(iid.value for iid, _, _ in items))
+                ),
+                timer_wheel=wheel,
+            )
+            tick_box = [0]
+            for tick in range(1, 30):
+                tick_box[0] = tick
+                if tick % 3 == 0:
+                    repo.save(
+                        ItemAggregate.create(
+                            item_instance_id=ItemInstanceId(8000 + tick),
+                            item_spec=spec,
+                            quantity=1,
+                        )
+                    )
+                stage.run(WorldTick(tick))
+            return batches
+
+        assert drive(WorldTickTimerWheel()) == drive(None)
@@ -0,0 +1,111 @@
+"""turn 単位の player snapshot cache。"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ai_rpg_world.application.trace.events import TraceEventKind
+from ai_rpg_world.application.world_graph.spot_graph_player_snapshot_cache import (
+    SpotGraphPlayerSnapshotCache,
+)
+from tests.application.being.test_experiment_snapshot_session_runtime_roundtrip import (
+    _create_runtime,
+)
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> object:
+        self.calls += 1
+        return object()
+
+
+class _RecordingTraceRecorder:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Any, dict]] = []
+
+    def record(self, kind: str, *, tick=None, player_id=None, **payload):
+        self.events.append((kind, tick, payload))
+
+
+class TestSpotGraphPlayerSnapshotCache:
+
+    def test_reuses_only_inside_scope(self) -> None:
+        cache = SpotGraphPlayerSnapshotCache()
+        build = _Builder()
+        cache.get_or_build(1, build)
+        cache.get_or_build(1, build)
+        assert build.calls == 2
+
+        with cache.scope():
+            first = cache.get_or_build(1, build)
+            with cache.scope():
+                assert cache.get_or_build(1, build) is first
+            assert cache.get_or_build(1, build) is first
+            cache.get_or_build(2, build)
+        assert build.calls == 4
+        # 最も外側の scope を抜けたら捨てる
+        with cache.scope():
+            assert cache.get_or_build(1, build) is not first
+        assert cache.take_counters() == {
+            "hits": 2, "misses": 3, "bypassed": 2, "invalidations": 0,
+        }
+        assert cache.take_counters()["misses"] == 0
+
+    def test_mutation_event_invalidates(self) -> None:
+        cache = SpotGraphPlayerSnapshotCache()
+        build = _Builder()
+        with cache.scope():
+            first = cache.get_or_build(1, build)
+            cache.handle(object())
+            assert cache.get_or_build(1, build) is not first
+            with cache.suspended():
+                cache.get_or_build(1, build)
+        assert build.calls == 3
+        assert cache.revision == 1
+
+    def test_revision_change_during_build_is_not_stored(self) -> None:
+        cache = SpotGraphPlayerSnapshotCache()
+        build = _Builder()
+
+        def _build_while_world_changes() -> object:
+            cache.invalidate()
+            return build()
+
+        with cache.scope():
+            cache.get_or_build(1, _build_while_world_changes)
+            cache.get_or_build(1, build)
+        assert build.calls == 2
+
+
+class TestWorldRuntimePlayerSnapshotCache:
+
+    def test_full_prompt_builds_each_snapshot_once_and_traces_counters(self) -> None:
+        runtime = _create_runtime()
+        recorder = _RecordingTraceRecorder()
+        runtime.set_trace_recorder(recorder)
+        state_builder = runtime._state_builder
+        original = state_builder.build_snapshot
+        built: list[int] = []
+
+        def _counting_build(player_id: int):
+            built.append(player_id)
+            return original(player_id)
+
+        state_builder.build_snapshot = _counting_build
+        player_id = runtime.get_player_ids()[0]
+
+        uncached_text = runtime.build_observation(player_id)
+        built.clear()
+        runtime.build_full_prompt(player_id)
+        assert built == [int(player_id)]
+        # scope 外は従来どおり毎回作り直し、中身も変わらない
+        assert runtime.build_observation(player_id) == uncached_text
+
+        runtime.advance_tick()
+        (event,) = [e for e in recorder.events if e[0] == TraceEventKind.PLAYER_SNAPSHOT_CACHE]
+        assert event[2]["hits"] == 1
+        assert event[2]["misses"] == 1
+        assert event[2]["bypassed"] >= 2
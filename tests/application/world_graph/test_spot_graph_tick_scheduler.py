@@ -0,0 +1,173 @@
+"""tick stage の scheduler: 期限の来た stage / 入力の変わった stage だけ走らせる。"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from ai_rpg_world.application.player.services.player_death_grace_tick_stage import (
+    PlayerDeathGraceTickStage,
+)
+from ai_rpg_world.application.player.services.player_death_grace_timer import (
+    PlayerDeathGraceTimer,
+)
+from ai_rpg_world.application.trace.events import TraceEventKind
+from ai_rpg_world.application.world_graph.spot_graph_environment_stage_service import (
+    SpotGraphEnvironmentStageService,
+)
+from ai_rpg_world.application.world_graph.spot_graph_simulation_application_service import (
+    SpotGraphSimulationApplicationService,
+)
+from ai_rpg_world.application.world_graph.spot_graph_tick_scheduler import (
+    SpotGraphTickScheduler,
+)
+from ai_rpg_world.domain.common.value_object import WorldTick
+from ai_rpg_world.domain.player.enum.player_outcome_enum import PlayerOutcomeEnum
+from ai_rpg_world.domain.player.service.player_outcome_registry import (
+    PlayerOutcomeRegistry,
+)
+from ai_rpg_world.domain.player.value_object.player_id import PlayerId
+from ai_rpg_world.infrastructure.services.in_memory_game_time_provider import (
+    InMemoryGameTimeProvider,
+)
+from ai_rpg_world.infrastructure.unit_of_work.in_memory_unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tests.application.being.test_experiment_snapshot_session_runtime_roundtrip import (
+    _create_runtime,
+)
+
+
+class _DeadlineStage:
+    """``deadline`` の tick だけ仕事がある stage。入力の版は ``revision``。"""
+
+    def __init__(self, deadline: Optional[int]) -> None:
+        self.deadline = deadline
+        self.revision = 0
+        self.ran_at: List[int] = []
+
+    def run(self, current_tick: WorldTick) -> None:
+        self.ran_at.append(current_tick.value)
+        if self.deadline is not None and current_tick.value >= self.deadline:
+            self.deadline = None
+
+    def next_due_tick(self, current_tick: int) -> Optional[int]:
+        return self.deadline
+
+    def work_revision(self) -> int:
+        return self.revision
+
+
+class _EveryTickStage:
+    def __init__(self) -> None:
+        self.ran_at: List[int] = []
+
+    def run(self, current_tick: WorldTick) -> None:
+        self.ran_at.append(current_tick.value)
+
+
+def _drive(scheduler: SpotGraphTickScheduler, names: List[str], ticks: range) -> None:
+    for tick in ticks:
+        scheduler.begin_tick(tick)
+        for name in names:
+            scheduler.run(name, WorldTick(tick))
+
+
+class TestSpotGraphTickScheduler:
+
+    def test_runs_once_then_sleeps_until_deadline(self) -> None:
+        scheduler = SpotGraphTickScheduler()
+        deadline = _DeadlineStage(deadline=5)
+        every = _EveryTickStage()
+        scheduler.register("deadline", deadline)
+        scheduler.register("every", every)
+
+        _drive(scheduler, ["deadline", "every"], range(1, 9))
+
+        # 登録直後の 1 回と期限の tick だけ
+        assert deadline.ran_at == [1, 5]
+        assert every.ran_at == list(range(1, 9))
+        timings = scheduler.take_stage_timings()
+        assert timings["deadline"]["runs"] == 2
+        assert timings["deadline"]["skipped"] == 6
+        assert timings["every"]["skipped"] == 0
+        assert scheduler.take_stage_timings() == {}
+
+    def test_input_change_wakes_sleeping_stage(self) -> None:
+        scheduler = SpotGraphTickScheduler()
+        stage = _DeadlineStage(deadline=None)
+        scheduler.register("stage", stage)
+        _drive(scheduler, ["stage"], range(1, 4))
+        assert stage.ran_at == [1]
+
+        stage.revision += 1
+        stage.deadline = 7
+        _drive(scheduler, ["stage"], range(4, 8))
+        assert stage.ran_at == [1, 4, 7]
+        assert scheduler.due_tick_of("stage") is None
+
+    def test_non_consecutive_tick_wakes_everything(self) -> None:
+        scheduler = SpotGraphTickScheduler()
+        stage = _DeadlineStage(deadline=50)
+        scheduler.register("stage", stage)
+        _drive(scheduler, ["stage"], range(1, 3))
+        # snapshot 復元で巻き戻った
+        _drive(scheduler, ["stage"], range(1, 2))
+        assert stage.ran_at == [1, 1]
+
+
+class TestStageDeclarations:
+
+    def test_environment_stage_is_due_on_interval_multiples(self) -> None:
+        stage = SpotGraphEnvironmentStageService(
+            weather_state_provider=lambda: None,
+            weather_state_setter=lambda _: None,
+            update_interval_ticks=6,
+        )
+        assert stage.next_due_tick(0) == 6
+        assert stage.next_due_tick(5) == 6
+        assert stage.next_due_tick(6) == 12
+
+    def test_death_grace_stage_skips_until_overdue_and_wakes_on_new_downed(self) -> None:
+        registry = PlayerOutcomeRegistry()
+        timer = PlayerDeathGraceTimer()
+        stage = PlayerDeathGraceTickStage(
+            outcome_registry=registry, grace_timer=timer, grace_ticks=3
+        )
+        time_provider = InMemoryGameTimeProvider(initial_tick=0)
+        simulation = SpotGraphSimulationApplicationService(
+            time_provider=time_provider,
+            unit_of_work=InMemoryUnitOfWork(),
+            death_grace_stage=stage,
+        )
+        simulation.tick()
+        simulation.tick()
+        assert simulation.take_stage_timings()["death_grace"]["skipped"] == 1
+
+        timer.register(PlayerId(1), downed_at_tick=2)
+        for _ in range(3):
+            simulation.tick()
+        assert registry.get_outcome(PlayerId(1)) == PlayerOutcomeEnum.DEAD
+        timings = simulation.take_stage_timings()["death_grace"]
+        # 起こされた tick 3 と期限の tick 5 だけ走る
+        assert (timings["runs"], timings["skipped"]) == (2, 1)
+
+
+class TestWorldRuntimeStageTimings:
+
+    def test_advance_tick_traces_stage_timings(self) -> None:
+        runtime = _create_runtime()
+        events: list = []
+
+        class _Recorder:
+            def record(self, kind, *, tick=None, player_id=None, **payload):
+                events.append((kind, tick, payload))
+
+        runtime.set_trace_recorder(_Recorder())
+        for _ in range(3):
+            runtime.advance_tick()
+        timing_events = [e for e in events if e[0] == TraceEventKind.TICK_STAGE_TIMINGS]
+        assert len(timing_events) == 3
+        stages = timing_events[-1][2]["stages"]
+        assert "environment" in stages
+        assert stages["environment"]["runs"] + stages["environment"]["skipped"] == 1
+        assert timing_events[-1][2]["skipped_count"] >= 1
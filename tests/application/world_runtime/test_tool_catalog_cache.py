@@ -0,0 +1,59 @@
+"""露出状態ごとの tool 定義 cache (``WorldRuntime.get_tool_catalog``)。"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from ai_rpg_world.application.llm.services.world_llm_turn.phase_a import (
+    build_tools_payload,
+)
+from tests.application.being.test_experiment_snapshot_session_runtime_roundtrip import (
+    _create_runtime,
+)
+
+
+class TestToolCatalogCache:
+
+    def test_same_exposure_state_reuses_identical_payload(self) -> None:
+        runtime = _create_runtime()
+        player_id = runtime.get_player_ids()[0]
+        first = runtime.get_tool_catalog(player_id=player_id)
+        second = runtime.get_tool_catalog(player_id=player_id)
+        assert first is second
+        assert first.payload is second.payload
+        assert first.payload_json == json.dumps(first.payload, ensure_ascii=False).encode()
+
+        wiring = SimpleNamespace(runtime=runtime)
+        payload = build_tools_payload(wiring, player_id)
+        assert payload == first.payload
+        assert payload is not first.payload
+        assert all(a is b for a, b in zip(payload, first.payload))
+
+    def test_cached_definitions_match_a_fresh_build(self) -> None:
+        runtime = _create_runtime()
+        player_id = runtime.get_player_ids()[0]
+        for mode in ("legacy", "reason_first"):
+            for meeting in (False, True):
+                cached = runtime.get_tool_definitions(
+                    tool_schema_mode=mode, as_meeting_phase=meeting, player_id=player_id
+                )
+                fresh = runtime._build_tool_definitions(
+                    mode, in_meeting=meeting, voting_completed=False, departed=False
+                )
+                assert cached == fresh
+        assert runtime._tool_catalog_cache.misses == 4
+
+    def test_exposure_state_changes_select_another_entry(self) -> None:
+        runtime = _create_runtime()
+        player_id = runtime.get_player_ids()[0]
+        normal = runtime.get_tool_catalog(player_id=player_id, as_meeting_phase=False)
+        meeting = runtime.get_tool_catalog(player_id=player_id, as_meeting_phase=True)
+        everyone = runtime.get_tool_catalog(for_every_player=True, as_meeting_phase=False)
+        assert normal is not meeting
+        assert everyone.names == normal.names
+
+        runtime._include_todo_tools = not runtime._include_todo_tools
+        toggled = runtime.get_tool_catalog(player_id=player_id, as_meeting_phase=False)
+        assert toggled is not normal
+        assert toggled.names != normal.names
@@ -73,6 +73,25 @@ class TestResolveLlmParallelWorkers:
         cfg = ResolvedLlmRuntimeConfig.from_mapping(values={})
         assert cfg.llm_meeting_serial_turns is False
 
+    def test_wave_deadline_is_disabled_by_default(self) -> None:
+        """未設定なら全員の Phase A を待つ従来経路を使う。"""
+        cfg = ResolvedLlmRuntimeConfig.from_mapping(values={})
+        assert cfg.llm_turn_wave_deadline_seconds is None
+
+    def test_wave_deadline_config_value(self) -> None:
+        """正の秒数なら straggler 耐性 wave の締め切りとして使う。"""
+        cfg = ResolvedLlmRuntimeConfig.from_mapping(
+            values={"LLM_TURN_WAVE_DEADLINE_SECONDS": "12.5"}
+        )
+        assert cfg.llm_turn_wave_deadline_seconds == 12.5
+
+    def test_wave_deadline_zero_raises_value_error(self) -> None:
+        """0 秒は全員持ち越しになるので profile ミスとして止める。"""
+        with pytest.raises(ValueError, match="LLM_TURN_WAVE_DEADLINE_SECONDS"):
+            ResolvedLlmRuntimeConfig.from_mapping(
+                values={"LLM_TURN_WAVE_DEADLINE_SECONDS": "0"}
+            )
+
     def test_meeting_serial_turns_can_be_enabled_by_profile(self) -> None:
         """profile が true を宣言したときだけ会議の逐次化を有効にする。"""
         cfg = ResolvedLlmRuntimeConfig.from_mapping(
@@ -0,0 +1,156 @@
+"""ObjectSpatialIndex と PhysicalMapAggregate の範囲 query の整合性テスト。
+
+index 経由の結果が従来の全走査 (``get_all_objects`` を距離で絞ったもの) と
+要素・並びとも一致することを、ランダムな追加 / 移動 / 削除の後に確かめる。
+"""
+
+import random
+
+import pytest
+
+from ai_rpg_world.domain.common.value_object import WorldTick
+from ai_rpg_world.domain.world.aggregate.object_spatial_index import ObjectSpatialIndex
+from ai_rpg_world.domain.world.aggregate.physical_map_aggregate import PhysicalMapAggregate
+from ai_rpg_world.domain.world.entity.tile import Tile
+from ai_rpg_world.domain.world.entity.world_object import WorldObject
+from ai_rpg_world.domain.world.enum.world_enum import ObjectTypeEnum
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate
+from ai_rpg_world.domain.world.value_object.spot_id import SpotId
+from ai_rpg_world.domain.world.value_object.terrain_type import TerrainType
+from ai_rpg_world.domain.world.value_object.world_object_id import WorldObjectId
+
+_SIZE = 40
+
+
+def _brute_force(aggregate: PhysicalMapAggregate, center: Coordinate, distance: int):
+    return [
+        obj
+        for obj in aggregate.get_all_objects()
+        if center.distance_to(obj.coordinate) <= distance
+    ]
+
+
+def _assert_index_consistent(aggregate: PhysicalMapAggregate) -> None:
+    assert aggregate._spatial_index.positions() == {
+        obj.object_id: obj.coordinate for obj in aggregate.get_all_objects()
+    }
+
+
+@pytest.fixture
+def aggregate() -> PhysicalMapAggregate:
+    tiles = [
+        Tile(Coordinate(x, y), TerrainType.road())
+        for x in range(_SIZE)
+        for y in range(_SIZE)
+    ]
+    return PhysicalMapAggregate.create(SpotId(1), tiles)
+
+
+class TestRangeQueryMatchesBruteForce:
+    def test_random_add_move_remove(self, aggregate: PhysicalMapAggregate) -> None:
+        rng = random.Random(20261017)
+        next_id = 1
+        for _ in range(300):
+            aggregate.add_object(
+                WorldObject(
+                    WorldObjectId(next_id),
+                    Coordinate(rng.randrange(_SIZE), rng.randrange(_SIZE)),
+                    ObjectTypeEnum.PLAYER,
+                    is_blocking=False,
+                )
+            )
+            next_id += 1
+
+        for step in range(600):
+            objects = aggregate.get_all_objects()
+            op = rng.random()
+            if op < 0.7:
+                target = rng.choice(objects)
+                aggregate.move_object(
+                    target.object_id,
+                    Coordinate(rng.randrange(_SIZE), rng.randrange(_SIZE)),
+                    WorldTick(10_000 * (step + 1)),
+                )
+            elif op < 0.85:
+                aggregate.remove_object(rng.choice(objects).object_id)
+            else:
+                aggregate.add_object(
+                    WorldObject(
+                        WorldObjectId(next_id),
+                        Coordinate(rng.randrange(_SIZE), rng.randrange(_SIZE)),
+                        ObjectTypeEnum.PLAYER,
+                        is_blocking=False,
+                    )
+                )
+                next_id += 1
+
+            center = Coordinate(rng.randrange(_SIZE + 5), rng.randrange(_SIZE + 5))
+            distance = rng.choice([0, 1, 3, 7, 15, 100])
+            assert aggregate.get_objects_in_range(center, distance) == _brute_force(
+                aggregate, center, distance
+            )
+        _assert_index_consistent(aggregate)
+
+    def test_bulk_matches_single_queries(self, aggregate: PhysicalMapAggregate) -> None:
+        rng = random.Random(7)
+        for object_id in range(1, 200):
+            aggregate.add_object(
+                WorldObject(
+                    WorldObjectId(object_id),
+                    Coordinate(rng.randrange(_SIZE), rng.randrange(_SIZE)),
+                    ObjectTypeEnum.PLAYER,
+                    is_blocking=False,
+                )
+            )
+        queries = [
+            (Coordinate(rng.randrange(_SIZE), rng.randrange(_SIZE)), rng.choice([0, 2, 5, 9]))
+            for _ in range(50)
+        ]
+
+        bulk = aggregate.get_objects_in_range_bulk(queries)
+
+        assert bulk == [aggregate.get_objects_in_range(c, d) for c, d in queries]
+        assert bulk == [_brute_force(aggregate, c, d) for c, d in queries]
+
+    def test_exact_cell_keeps_insertion_order(self, aggregate: PhysicalMapAggregate) -> None:
+        cell = Coordinate(3, 3)
+        aggregate.add_object(WorldObject(WorldObjectId(2), Coordinate(0, 0), ObjectTypeEnum.PLAYER, is_blocking=False))
+        aggregate.add_object(WorldObject(WorldObjectId(1), cell, ObjectTypeEnum.PLAYER, is_blocking=False))
+        # 後から同じマスに入ってきても、並びは追加順 (= 全走査と同じ)
+        aggregate.move_object(WorldObjectId(2), cell, WorldTick(1))
+
+        assert [o.object_id for o in aggregate.get_objects_in_range(cell, 0)] == [
+            WorldObjectId(2),
+            WorldObjectId(1),
+        ]
+
+
+class TestObjectSpatialIndex:
+    def test_queries_across_chunk_edges(self) -> None:
+        index = ObjectSpatialIndex(chunk_size=4)
+        index.insert(WorldObjectId(1), Coordinate(3, 3))
+        index.insert(WorldObjectId(2), Coordinate(4, 4))
+        index.insert(WorldObjectId(3), Coordinate(8, 4))
+
+        assert index.query(Coordinate(4, 3), 1) == [WorldObjectId(1), WorldObjectId(2)]
+        index.move(WorldObjectId(3), Coordinate(5, 4))
+        assert index.query(Coordinate(4, 4), 1) == [WorldObjectId(2), WorldObjectId(3)]
+        index.remove(WorldObjectId(2))
+        assert index.query(Coordinate(4, 4), 1) == [WorldObjectId(3)]
+        assert len(index) == 2
+
+    def test_duplicate_insert_is_rejected(self) -> None:
+        index = ObjectSpatialIndex()
+        index.insert(WorldObjectId(1), Coordinate(0, 0))
+        with pytest.raises(ValueError):
+            index.insert(WorldObjectId(1), Coordinate(1, 1))
+
+    def test_infinite_distance_returns_everything(self) -> None:
+        index = ObjectSpatialIndex()
+        for object_id in (3, 1, 2):
+            index.insert(WorldObjectId(object_id), Coordinate(object_id * 100, 0))
+        assert index.query(Coordinate(0, 0), float("inf")) == [
+            WorldObjectId(3),
+            WorldObjectId(1),
+            WorldObjectId(2),
+        ]
@@ -0,0 +1,211 @@
+"""TileGrid と PhysicalMapAggregate の配列 fast path の整合性テスト。
+
+grid 経由の is_passable / get_movement_cost / is_sight_blocked が、Tile と
+WorldObject を直接見る判定 (grid 無しの dict 実装) と一致することを確かめる。
+"""
+
+import random
+import tracemalloc
+
+import pytest
+
+from ai_rpg_world.domain.common.value_object import WorldTick
+from ai_rpg_world.domain.world.aggregate.physical_map_aggregate import PhysicalMapAggregate
+from ai_rpg_world.domain.world.aggregate.tile_grid import TileGrid
+from ai_rpg_world.domain.world.entity.tile import Tile
+from ai_rpg_world.domain.world.entity.world_object import WorldObject
+from ai_rpg_world.domain.world.enum.world_enum import ObjectTypeEnum
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate
+from ai_rpg_world.domain.world.value_object.movement_capability import MovementCapability
+from ai_rpg_world.domain.world.value_object.spot_id import SpotId
+from ai_rpg_world.domain.world.value_object.terrain_type import TerrainType
+from ai_rpg_world.domain.world.value_object.world_object_id import WorldObjectId
+
+_SIZE = 16
+_TERRAINS = [
+    TerrainType.road(),
+    TerrainType.grass(),
+    TerrainType.swamp(),
+    TerrainType.water(),
+    TerrainType.wall(),
+    TerrainType.glass_wall(),
+]
+_CAPABILITIES = [
+    MovementCapability.normal_walk(),
+    MovementCapability.ghost(),
+    MovementCapability.normal_walk().with_speed_modifier(2.0),
+]
+
+
+def _tiles(rng: random.Random):
+    return [
+        Tile(Coordinate(x, y, z), rng.choice(_TERRAINS))
+        for z in range(2)
+        for y in range(_SIZE)
+        for x in range(_SIZE)
+    ]
+
+
+def _build_pair(seed: int):
+    """同じ内容の (grid 有り, grid 無し) 集約を作る。"""
+    rng = random.Random(seed)
+    tiles = _tiles(rng)
+    with_grid = PhysicalMapAggregate.create(SpotId(1), tiles)
+    clones = [Tile(t.coordinate, t.terrain_type) for t in tiles]
+    without_grid = PhysicalMapAggregate.create(SpotId(1), clones)
+    without_grid._grid = None
+    without_grid._tiles = {t.coordinate: t for t in clones}
+    object_id = 1
+    for tile in tiles:
+        if not tile.terrain_type.is_walkable or rng.random() > 0.15:
+            continue
+        blocking = rng.random() < 0.5
+        for aggregate in (with_grid, without_grid):
+            aggregate.add_object(
+                WorldObject(
+                    WorldObjectId(object_id),
+                    tile.coordinate,
+                    ObjectTypeEnum.PLAYER,
+                    is_blocking=blocking,
+                )
+            )
+        object_id += 1
+    return with_grid, without_grid
+
+
+def _assert_same_answers(with_grid: PhysicalMapAggregate, without_grid: PhysicalMapAggregate) -> None:
+    for z in range(3):
+        for y in range(_SIZE + 1):
+            for x in range(_SIZE + 1):
+                coord = Coordinate(x, y, z)
+                for capability in _CAPABILITIES:
+                    assert with_grid.is_passable(coord, capability) == without_grid.is_passable(coord, capability)
+                    assert with_grid.get_movement_cost(coord, capability) == without_grid.get_movement_cost(
+                        coord, capability
+                    )
+                assert with_grid.is_sight_blocked(coord) == without_grid.is_sight_blocked(coord)
+                assert with_grid.is_sight_blocked_at(x, y, z) == without_grid.is_sight_blocked(coord)
+                assert with_grid.is_walkable(coord) == without_grid.is_walkable(coord)
+
+
+class TestGridMatchesDictImplementation:
+    def test_random_map_with_objects(self) -> None:
+        with_grid, without_grid = _build_pair(seed=7)
+        assert with_grid.tile_grid is not None
+        _assert_same_answers(with_grid, without_grid)
+
+    def test_after_moves_removals_and_terrain_changes(self) -> None:
+        with_grid, without_grid = _build_pair(seed=11)
+        rng = random.Random(3)
+        objects = with_grid.get_all_objects()
+        for i, obj in enumerate(objects[: len(objects) // 2]):
+            target = Coordinate(rng.randrange(_SIZE), rng.randrange(_SIZE), obj.coordinate.z)
+            for aggregate in (with_grid, without_grid):
+                try:
+                    aggregate.move_object(obj.object_id, target, WorldTick(i * 100))
+                except Exception:
+                    pass
+        for obj in objects[len(objects) // 2 :: 2]:
+            with_grid.remove_object(obj.object_id)
+            without_grid.remove_object(obj.object_id)
+        for aggregate in (with_grid, without_grid):
+            aggregate.change_tile_terrain(Coordinate(0, 0, 1), TerrainType.wall())
+        _assert_same_answers(with_grid, without_grid)
+
+    def test_exclude_object_id_on_occupied_cell(self) -> None:
+        tiles = [Tile(Coordinate(x, 0), TerrainType.road()) for x in range(3)]
+        aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+        aggregate.add_object(
+            WorldObject(WorldObjectId(1), Coordinate(1, 0), ObjectTypeEnum.PLAYER, is_blocking=True)
+        )
+        walk = MovementCapability.normal_walk()
+        assert aggregate.is_passable(Coordinate(1, 0), walk) is False
+        assert aggregate.is_passable(Coordinate(1, 0), walk, exclude_object_id=WorldObjectId(1)) is True
+        assert aggregate.is_passable(Coordinate(1, 0), MovementCapability.ghost()) is True
+
+
+class TestTileGridSync:
+    def test_direct_tile_mutation_is_reflected(self) -> None:
+        tiles = [Tile(Coordinate(x, 0), TerrainType.road()) for x in range(3)]
+        aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+        walk = MovementCapability.normal_walk()
+
+        aggregate.get_tile(Coordinate(1, 0)).change_terrain(TerrainType.wall())
+
+        assert aggregate.is_passable(Coordinate(1, 0), walk) is False
+        assert aggregate.is_sight_blocked(Coordinate(1, 0)) is True
+
+    def test_replacing_tile_in_mapping_is_reflected(self) -> None:
+        tiles = [Tile(Coordinate(x, 0), TerrainType.road()) for x in range(3)]
+        aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+        old_tile = aggregate.get_tile(Coordinate(2, 0))
+
+        aggregate._tiles[Coordinate(2, 0)] = Tile(Coordinate(2, 0), TerrainType.wall())
+        old_tile.change_terrain(TerrainType.road())
+
+        assert aggregate.is_sight_blocked(Coordinate(2, 0)) is True
+
+    def test_values_keep_insertion_order_and_overflow(self) -> None:
+        tiles = {
+            Coordinate(1, 0): Tile(Coordinate(1, 0), TerrainType.road()),
+            Coordinate(0, 0): Tile(Coordinate(0, 0), TerrainType.grass()),
+        }
+        grid = TileGrid.build(tiles)
+        extra = Tile(Coordinate(5, 5), TerrainType.road())
+        grid[Coordinate(5, 5)] = extra
+
+        assert grid.values() == list(tiles.values()) + [extra]
+        assert list(grid) == [Coordinate(1, 0), Coordinate(0, 0), Coordinate(5, 5)]
+        assert Coordinate(5, 5) in grid
+        assert grid.index_of(Coordinate(5, 5)) == -1
+        assert len(grid) == 3
+
+    def test_sparse_map_keeps_dict(self) -> None:
+        tiles = [Tile(Coordinate(0, 0), TerrainType.road()), Tile(Coordinate(50, 50), TerrainType.road())]
+        aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+
+        assert aggregate.tile_grid is None
+        assert aggregate.is_passable(Coordinate(50, 50), MovementCapability.normal_walk()) is True
+
+    def test_masks(self) -> None:
+        tiles = [
+            Tile(Coordinate(0, 0), TerrainType.road()),
+            Tile(Coordinate(1, 0), TerrainType.wall()),
+            Tile(Coordinate(2, 0), TerrainType.water()),
+        ]
+        grid = TileGrid.build({t.coordinate: t for t in tiles})
+
+        assert list(grid.passable_mask(MovementCapability.normal_walk())) == [1, 0, 0]
+        assert list(grid.opacity_mask()) == [0, 1, 0]
+        grid.add_occupant(Coordinate(2, 0))
+        assert list(grid.occupied_mask()) == [0, 0, 1]
+        assert grid.coordinate_of(grid.index_of(Coordinate(2, 0))) == Coordinate(2, 0)
+
+
+@pytest.mark.parametrize("capability", _CAPABILITIES)
+def test_movement_cost_table_matches_terrain(capability: MovementCapability) -> None:
+    tiles = {Coordinate(i, 0): Tile(Coordinate(i, 0), t) for i, t in enumerate(_TERRAINS)}
+    grid = TileGrid.build(tiles)
+    for coordinate, tile in tiles.items():
+        idx = grid.index_of(coordinate)
+        assert grid.can_pass(idx, capability) == tile.terrain_type.can_pass(capability)
+        assert grid.movement_cost(idx, capability) == tile.terrain_type.calculate_cost(capability).value
+
+
+def test_nbytes_accounts_for_what_build_allocates() -> None:
+    """nbytes は Tile を引く cell list も含めた索引の実測と揃う。"""
+    tiles = {
+        Coordinate(x, y, 0): Tile(Coordinate(x, y, 0), _TERRAINS[(x + y) % len(_TERRAINS)])
+        for y in range(40)
+        for x in range(40)
+    }
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        grid = TileGrid.build(tiles)
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert grid is not None
+    assert 0.8 * allocated <= grid.nbytes() <= allocated
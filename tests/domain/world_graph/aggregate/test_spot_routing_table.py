@@ -0,0 +1,207 @@
+"""SpotGraphAggregate の経路表 (next_hop_toward / hop_distance_between / traversable_route)。
+
+ランダムなグラフで `find_next_hop` / `find_hop_distance` / BFS と同じ結果を返すこと、
+接続の追加・削除・通行可否の変化で影響する row だけが捨てられることを確かめる。
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ai_rpg_world.domain.item.value_object.item_spec_id import ItemSpecId
+from ai_rpg_world.domain.world.enum.world_enum import SpotCategoryEnum
+from ai_rpg_world.domain.world.value_object.spot_id import SpotId
+from ai_rpg_world.domain.world_graph.aggregate.spot_graph_aggregate import (
+    SpotGraphAggregate,
+)
+from ai_rpg_world.domain.world_graph.entity.spot_connection import SpotConnection
+from ai_rpg_world.domain.world_graph.entity.spot_node import SpotNode
+from ai_rpg_world.domain.world_graph.enum.passage_condition_type import (
+    PassageConditionTypeEnum,
+)
+from ai_rpg_world.domain.world_graph.enum.passage_kind import DoorStateEnum
+from ai_rpg_world.domain.world_graph.service.spot_graph_navigation_service import (
+    SpotGraphNavigationService,
+)
+from ai_rpg_world.domain.world_graph.service.spot_path_finder import (
+    find_hop_distance,
+    find_next_hop,
+)
+from ai_rpg_world.domain.world_graph.value_object.connection_id import ConnectionId
+from ai_rpg_world.domain.world_graph.value_object.passage import Passage
+from ai_rpg_world.domain.world_graph.value_object.passage_condition import (
+    PassageCondition,
+)
+from ai_rpg_world.domain.world_graph.value_object.spot_graph_id import SpotGraphId
+
+
+def _node(spot_id: int) -> SpotNode:
+    return SpotNode(
+        spot_id=SpotId.create(spot_id),
+        name=f"spot{spot_id}",
+        description="",
+        category=SpotCategoryEnum.OTHER,
+        parent_id=None,
+    )
+
+
+def _conn(connection_id, from_id, to_id, *, passage=None, conditions=()):
+    return SpotConnection(
+        connection_id=ConnectionId.create(connection_id),
+        from_spot_id=SpotId.create(from_id),
+        to_spot_id=SpotId.create(to_id),
+        name="edge",
+        description="",
+        travel_ticks=1,
+        is_bidirectional=False,
+        passage_conditions=list(conditions),
+        passage=passage or Passage.open(),
+    )
+
+
+def _line_graph(n: int) -> SpotGraphAggregate:
+    """1 → 2 → ... → n の一本道 (接続 ID = 出発 spot の ID)。"""
+    g = SpotGraphAggregate.empty(SpotGraphId.create(1))
+    for i in range(1, n + 1):
+        g.add_spot(_node(i))
+    for i in range(1, n):
+        g.add_connection(_conn(i, i, i + 1))
+    return g
+
+
+_KEY = PassageCondition(PassageConditionTypeEnum.ITEM_REQUIRED, item_spec_id=ItemSpecId(7))
+_FLAG = PassageCondition(PassageConditionTypeEnum.FLAG_SET, flag_name="gate_open")
+
+
+def _random_graph(rng: random.Random, spots: int, edges: int) -> SpotGraphAggregate:
+    g = SpotGraphAggregate.empty(SpotGraphId.create(1))
+    for i in range(1, spots + 1):
+        g.add_spot(_node(i))
+    # ID を登録順と食い違わせて、展開順が接続 ID 昇順であることも確かめる
+    ids = rng.sample(range(1, edges * 3), edges)
+    for cid in ids:
+        a, b = rng.sample(range(1, spots + 1), 2)
+        roll = rng.random()
+        if roll < 0.15:
+            g.add_connection(_conn(cid, a, b, passage=Passage.door(DoorStateEnum.CLOSED)))
+        elif roll < 0.25:
+            g.add_connection(_conn(cid, a, b, conditions=[_KEY]))
+        elif roll < 0.35:
+            g.add_connection(_conn(cid, a, b, conditions=[_FLAG]))
+        else:
+            g.add_connection(_conn(cid, a, b))
+    return g
+
+
+@pytest.mark.parametrize(
+    "owned, flags",
+    [
+        (frozenset(), frozenset()),
+        (frozenset({ItemSpecId(7)}), frozenset()),
+        (frozenset(), frozenset({"gate_open", "unrelated"})),
+    ],
+)
+def test_matches_path_finder_on_random_graphs(owned, flags) -> None:
+    rng = random.Random(len(owned) * 10 + len(flags))
+    for _ in range(5):
+        g = _random_graph(rng, 14, 30)
+
+        def is_passable(conn):
+            return g.can_traverse_connection(conn.connection_id, owned, flags)
+
+        for a in range(1, 15):
+            for b in range(1, 15):
+                for max_distance in (None, 1, 2, 3):
+                    src, dst = SpotId.create(a), SpotId.create(b)
+                    assert g.next_hop_toward(
+                        src, dst, owned, flags, max_distance=max_distance
+                    ) == find_next_hop(g, src, dst, is_passable, max_distance=max_distance)
+                    assert g.hop_distance_between(
+                        src, dst, owned, flags, max_distance=max_distance
+                    ) == find_hop_distance(g, src, dst, is_passable, max_distance=max_distance)
+
+
+def test_traversable_route_matches_navigation_bfs() -> None:
+    class _RoutingViewOnly:
+        """経路表を持たない view (従来の BFS を通す)。"""
+
+        def __init__(self, graph):
+            self.contains_spot = graph.contains_spot
+            self.neighbor_spot_ids_for_routing = graph.neighbor_spot_ids_for_routing
+
+    rng = random.Random(5)
+    nav = SpotGraphNavigationService()
+    for _ in range(5):
+        g = _random_graph(rng, 12, 26)
+        for a in range(1, 13):
+            for b in range(1, 13):
+                src, dst = SpotId.create(a), SpotId.create(b)
+                expected = nav.calculate_route(_RoutingViewOnly(g), src, dst)
+                actual = nav.calculate_route(g, src, dst)
+                assert len(actual) == len(expected)
+                if actual:
+                    assert actual[0] == src and actual[-1] == dst
+    assert nav.calculate_route(g, SpotId.create(1), SpotId.create(99)) == []
+
+
+def test_rows_are_reused_between_queries() -> None:
+    g = _line_graph(5)
+    owned, flags = frozenset(), frozenset()
+    g.next_hop_toward(SpotId.create(1), SpotId.create(5), owned, flags)
+    g.hop_distance_between(SpotId.create(1), SpotId.create(3), owned, flags)
+    assert g._routing.cached_row_count() == 1
+
+
+def test_flags_unrelated_to_conditions_share_rows() -> None:
+    g = _line_graph(4)
+    g.next_hop_toward(SpotId.create(1), SpotId.create(4), frozenset(), frozenset())
+    g.next_hop_toward(SpotId.create(1), SpotId.create(4), frozenset(), frozenset({"anything"}))
+    assert g._routing.cached_row_count() == 1
+
+
+def test_passage_change_invalidates_only_rows_reaching_it() -> None:
+    g = _line_graph(5)
+    owned, flags = frozenset(), frozenset()
+    for source in (1, 3, 4):
+        g.next_hop_toward(SpotId.create(source), SpotId.create(5), owned, flags)
+
+    # 3 → 4 を閉じる: 3 に到達している row (出発 1, 3) だけ捨てる
+    g.set_connection_passage(ConnectionId.create(3), Passage.door(DoorStateEnum.CLOSED))
+
+    assert g._routing.cached_row_count() == 1
+    assert g.next_hop_toward(SpotId.create(1), SpotId.create(5), owned, flags) is None
+    assert g.next_hop_toward(SpotId.create(4), SpotId.create(5), owned, flags) == ConnectionId.create(4)
+
+    g.set_connection_passage(ConnectionId.create(3), Passage.door(DoorStateEnum.OPEN))
+    assert g.hop_distance_between(SpotId.create(1), SpotId.create(5), owned, flags) == 4
+
+
+def test_dynamic_add_and_remove_update_routes() -> None:
+    g = _line_graph(5)
+    owned, flags = frozenset(), frozenset()
+    assert g.hop_distance_between(SpotId.create(1), SpotId.create(5), owned, flags) == 4
+
+    g.add_connection_dynamic(_conn(10, 2, 5))
+    assert g.hop_distance_between(SpotId.create(1), SpotId.create(5), owned, flags) == 2
+    assert g.traversable_route(SpotId.create(1), SpotId.create(5)) == [
+        SpotId.create(1),
+        SpotId.create(2),
+        SpotId.create(5),
+    ]
+
+    g.remove_connection(ConnectionId.create(1))
+    assert g.next_hop_toward(SpotId.create(1), SpotId.create(5), owned, flags) is None
+    assert g.traversable_route(SpotId.create(1), SpotId.create(5)) == []
+
+
+def test_conditions_added_later_are_part_of_signature() -> None:
+    g = _line_graph(3)
+    gate_flags = frozenset({"gate_open"})
+    assert g.hop_distance_between(SpotId.create(1), SpotId.create(3), frozenset(), gate_flags) == 2
+
+    # 条件付きの近道を足すと "gate_open" が signature に入り、フラグの有無で表が分かれる
+    g.add_connection_dynamic(_conn(10, 1, 3, conditions=[_FLAG]))
+    assert g.hop_distance_between(SpotId.create(1), SpotId.create(3), frozenset(), gate_flags) == 1
+    assert g.hop_distance_between(SpotId.create(1), SpotId.create(3), frozenset(), frozenset()) == 2
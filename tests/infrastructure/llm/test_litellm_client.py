@@ -248,6 +248,34 @@ class TestLiteLLMClientInvoke:
 
         assert "session_id" not in mock_completion.call_args.kwargs
 
+    def test_cache_breakpoints_mark_system_and_stable_user_message(self) -> None:
+        """auto は Anthropic 系だけ、system と安定 user message に cache_control を置く。"""
+        messages = [
+            {"role": "system", "content": "不変の指示"},
+            {"role": "user", "content": "【現在の目的】\n脱出する"},
+            {"role": "user", "content": "【現在地と周囲】\n広場"},
+        ]
+        calls = {}
+        for model in ("anthropic/claude-sonnet-4-5", "openai/gpt-5-mini"):
+            client = LiteLLMClient(
+                model=model, api_key="sk-dummy", prompt_cache_breakpoints="auto"
+            )
+            with patch(
+                "ai_rpg_world.infrastructure.llm.litellm_client.litellm.completion"
+            ) as mock_completion:
+                mock_completion.return_value = _make_tool_call_response("wait", {})
+                client.invoke(messages=messages, tools=[])
+            calls[model] = mock_completion.call_args.kwargs
+
+        assert calls["anthropic/claude-sonnet-4-5"]["cache_control_injection_points"] == [
+            {"location": "message", "role": "system"},
+            {"location": "message", "index": 1},
+        ]
+        assert calls["anthropic/claude-sonnet-4-5"]["messages"] is messages
+        assert "cache_control_injection_points" not in calls["openai/gpt-5-mini"]
+        with pytest.raises(ValueError, match="prompt_cache_breakpoints"):
+            LiteLLMClient(model="x", api_key="k", prompt_cache_breakpoints="always")
+
     @pytest.mark.parametrize(
         ("session_id", "expected_present"),
         [("run037:wstation_drill:p4", True), (None, False)],
@@ -0,0 +1,321 @@
+"""LlmRequestScheduler のテスト（優先度・予約枠・token bucket・backpressure・client 連携）"""
+
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ai_rpg_world.application.llm.exceptions import LlmApiCallException
+from ai_rpg_world.application.llm.wiring._llm_client_factory import (
+    create_llm_client_from_config,
+)
+from ai_rpg_world.application.llm.wiring.resolved_runtime_config import (
+    ResolvedLlmRuntimeConfig,
+)
+from ai_rpg_world.infrastructure.llm.litellm_client import LiteLLMClient
+from ai_rpg_world.infrastructure.llm.llm_request_scheduler import (
+    LlmRequestPriority,
+    LlmRequestScheduler,
+    LlmRequestSchedulerSettings,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolate_litellm_dotenv(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OPENAI_API_BASE", raising=False)
+    monkeypatch.delenv("LLM_REASONING_EFFORT", raising=False)
+    monkeypatch.setattr(
+        "ai_rpg_world.infrastructure.llm.litellm_client._load_dotenv_if_available",
+        lambda: None,
+    )
+
+
+def _enter_in_thread(
+    scheduler: LlmRequestScheduler,
+    priority: LlmRequestPriority,
+    order: list,
+    release: threading.Event,
+) -> threading.Thread:
+    def _run() -> None:
+        with scheduler.slot(priority, model="m"):
+            order.append(priority)
+            release.wait(timeout=5.0)
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    return thread
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def _priority_metrics(scheduler: LlmRequestScheduler, name: str) -> dict:
+    return scheduler.metrics_snapshot()["m@"]["priorities"][name]
+
+
+class TestPriorityOrder:
+    def test_agent_turn_overtakes_queued_background(self) -> None:
+        """枠が空いたら、先に並んでいた背景系より agent turn が先に入る。"""
+        scheduler = LlmRequestScheduler(
+            LlmRequestSchedulerSettings(max_concurrency=1, reserved_agent_turn_slots=0)
+        )
+        order: list = []
+        holder = threading.Event()
+        with scheduler.slot(LlmRequestPriority.BACKGROUND, model="m"):
+            threads = [
+                _enter_in_thread(scheduler, LlmRequestPriority.BACKGROUND, order, holder)
+            ]
+            _wait_until(lambda: _priority_metrics(scheduler, "background")["waiting"] == 1)
+            threads.append(
+                _enter_in_thread(scheduler, LlmRequestPriority.AGENT_TURN, order, holder)
+            )
+            _wait_until(lambda: _priority_metrics(scheduler, "agent_turn")["waiting"] == 1)
+        holder.set()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        assert order == [LlmRequestPriority.AGENT_TURN, LlmRequestPriority.BACKGROUND]
+
+    def test_reserved_slot_is_kept_for_agent_turns(self) -> None:
+        """背景系は予約枠を使えず、agent turn は背景で埋まっていても即入場できる。"""
+        scheduler = LlmRequestScheduler(
+            LlmRequestSchedulerSettings(max_concurrency=2, reserved_agent_turn_slots=1)
+        )
+        order: list = []
+        release = threading.Event()
+        with scheduler.slot(LlmRequestPriority.BACKGROUND, model="m"):
+            blocked = _enter_in_thread(
+                scheduler, LlmRequestPriority.REINTERPRETATION, order, release
+            )
+            _wait_until(
+                lambda: _priority_metrics(scheduler, "reinterpretation")["waiting"] == 1
+            )
+            with scheduler.slot(LlmRequestPriority.AGENT_TURN, model="m"):
+                order.append(LlmRequestPriority.AGENT_TURN)
+        release.set()
+        blocked.join(timeout=5.0)
+
+        assert order == [LlmRequestPriority.AGENT_TURN, LlmRequestPriority.REINTERPRETATION]
+
+    def test_providers_have_independent_budgets(self) -> None:
+        """(model, api_base) が違えば枠は共有しない。"""
+        scheduler = LlmRequestScheduler(
+            LlmRequestSchedulerSettings(max_concurrency=1, reserved_agent_turn_slots=0)
+        )
+        with scheduler.slot(LlmRequestPriority.AGENT_TURN, model="m", api_base="http://a"):
+            with scheduler.slot(
+                LlmRequestPriority.AGENT_TURN, model="m", api_base="http://b"
+            ):
+                snapshot = scheduler.metrics_snapshot()
+        assert snapshot["m@http://a"]["in_flight"] == 1
+        assert snapshot["m@http://b"]["in_flight"] == 1
+
+
+class TestBackpressure:
+    def test_background_queue_overflow_is_rejected(self) -> None:
+        """背景系の待ち行列が上限なら待たずに LLM_SCHEDULER_QUEUE_FULL で失敗する。"""
+        scheduler = LlmRequestScheduler(
+            LlmRequestSchedulerSettings(
+                max_concurrency=1, reserved_agent_turn_slots=0, queue_limit=1
+            )
+        )
+        order: list = []
+        release = threading.Event()
+        with scheduler.slot(LlmRequestPriority.BACKGROUND, model="m"):
+            waiting = _enter_in_thread(
+                scheduler, LlmRequestPriority.BACKGROUND, order, release
+            )
+            _wait_until(lambda: _priority_metrics(scheduler, "background")["waiting"] == 1)
+            with pytest.raises(LlmApiCallException) as exc_info:
+                with scheduler.slot(LlmRequestPriority.BACKGROUND, model="m"):
+                    pass
+        release.set()
+        waiting.join(timeout=5.0)
+
+        assert exc_info.value.error_code == "LLM_SCHEDULER_QUEUE_FULL"
+        metrics = _priority_metrics(scheduler, "background")
+        assert metrics["submitted"] == 3
+        assert metrics["rejected"] == 1
+        assert metrics["admitted"] == 2
+        assert metrics["max_waiting"] == 1
+
+    def test_token_bucket_throttles_beyond_burst(self) -> None:
+        """burst を使い切ると補充速度まで待たされ、throttled に数えられる。"""
+        scheduler = LlmRequestScheduler(
+            LlmRequestSchedulerSettings(requests_per_second=20.0, burst=1)
+        )
+        started = time.monotonic()
+        for _ in range(3):
+            with scheduler.slot(LlmRequestPriority.AGENT_TURN, model="m"):
+                pass
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.08
+        assert _priority_metrics(scheduler, "agent_turn")["throttled"] == 2
+
+    def test_rate_limit_drains_bucket(self) -> None:
+        """429 通知で貯金が消え、次の入場は補充を待つ。"""
+        scheduler = LlmRequestScheduler(
+            LlmRequestSchedulerSettings(requests_per_second=20.0, burst=5)
+        )
+        scheduler.note_rate_limited(model="m")
+        with scheduler.slot(LlmRequestPriority.AGENT_TURN, model="m"):
+            pass
+
+        snapshot = scheduler.metrics_snapshot()["m@"]
+        assert snapshot["rate_limited"] == 1
+        assert snapshot["priorities"]["agent_turn"]["throttled"] == 1
+
+
+class TestSettings:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_concurrency": 0},
+            {"max_concurrency": 2, "reserved_agent_turn_slots": 2},
+            {"requests_per_second": 0.0},
+            {"burst": 0},
+            {"queue_limit": 0},
+        ],
+    )
+    def test_invalid_settings_fail_fast(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            LlmRequestSchedulerSettings(**kwargs)
+
+    def test_config_resolves_scheduler_keys(self) -> None:
+        config = ResolvedLlmRuntimeConfig.from_mapping(
+            values={
+                "LLM_SCHEDULER_ENABLED": "1",
+                "LLM_SCHEDULER_MAX_CONCURRENCY": "4",
+                "LLM_SCHEDULER_RESERVED_TURN_SLOTS": "2",
+                "LLM_SCHEDULER_REQUESTS_PER_SECOND": "1.5",
+            }
+        )
+        assert config.llm_scheduler_enabled is True
+        assert config.llm_scheduler_max_concurrency == 4
+        assert config.llm_scheduler_reserved_turn_slots == 2
+        assert config.llm_scheduler_requests_per_second == 1.5
+
+    def test_config_rejects_reserved_slots_covering_all(self) -> None:
+        with pytest.raises(ValueError, match="LLM_SCHEDULER_RESERVED_TURN_SLOTS"):
+            ResolvedLlmRuntimeConfig.for_tests(
+                llm_scheduler_max_concurrency=2,
+                llm_scheduler_reserved_turn_slots=2,
+            )
+
+    def test_factory_shares_one_scheduler_across_clients(self) -> None:
+        """機能ごとに作られる client が同じ scheduler を共有する。"""
+        config = ResolvedLlmRuntimeConfig.for_tests(
+            llm_client_kind="litellm",
+            llm_api_key="sk-x",
+            llm_scheduler_enabled=True,
+            llm_scheduler_max_concurrency=3,
+        )
+        first = create_llm_client_from_config(config)
+        second = create_llm_client_from_config(config)
+
+        assert isinstance(first, LiteLLMClient)
+        assert first._request_scheduler is not None
+        assert first._request_scheduler is second._request_scheduler
+
+    def test_factory_without_scheduler_by_default(self) -> None:
+        config = ResolvedLlmRuntimeConfig.for_tests(
+            llm_client_kind="litellm", llm_api_key="sk-x"
+        )
+        assert create_llm_client_from_config(config)._request_scheduler is None
+
+
+class TestLiteLLMClientRouting:
+    def _client(self) -> tuple[LiteLLMClient, MagicMock]:
+        scheduler = MagicMock()
+        scheduler.slot.return_value.__enter__ = MagicMock(return_value=None)
+        scheduler.slot.return_value.__exit__ = MagicMock(return_value=False)
+        client = LiteLLMClient(
+            model="m",
+            api_key="sk-x",
+            request_scheduler=scheduler,
+            rate_limit_retry_base_sleep=0.0,
+        )
+        return client, scheduler
+
+    @staticmethod
+    def _json_response() -> Any:
+        message = MagicMock()
+        message.content = '{"ok": true}'
+        choice = MagicMock()
+        choice.message = message
+        response = MagicMock()
+        response.choices = [choice]
+        return response
+
+    def test_each_call_kind_uses_its_priority(self) -> None:
+        client, scheduler = self._client()
+        messages = [{"role": "user", "content": "x"}]
+        with patch(
+            "ai_rpg_world.infrastructure.llm.litellm_client.litellm.completion",
+            return_value=self._json_response(),
+        ):
+            client.complete_episodic_reinterpretation_json(messages)
+            client.complete_short_term_summary_json(messages)
+            client.complete_semantic_gist_json(messages)
+
+        priorities = [call.args[0] for call in scheduler.slot.call_args_list]
+        assert priorities == [
+            LlmRequestPriority.REINTERPRETATION,
+            LlmRequestPriority.BACKGROUND,
+            LlmRequestPriority.BACKGROUND,
+        ]
+
+    def test_rate_limit_is_reported_to_scheduler(self) -> None:
+        import litellm as _ll
+
+        client, scheduler = self._client()
+        with patch(
+            "ai_rpg_world.infrastructure.llm.litellm_client.litellm.completion",
+            side_effect=[
+                _ll.RateLimitError("rate limited", "openai", "m"),
+                self._json_response(),
+            ],
+        ):
+            client.complete_episode_subjective_json([{"role": "user", "content": "x"}])
+
+        scheduler.note_rate_limited.assert_called_once_with(model="m", api_base=None)
+        assert scheduler.slot.call_count == 2
+
+    def test_queue_full_keeps_error_code(self) -> None:
+        client, scheduler = self._client()
+        scheduler.slot.side_effect = LlmApiCallException(
+            "full", error_code="LLM_SCHEDULER_QUEUE_FULL"
+        )
+        with pytest.raises(LlmApiCallException) as exc_info:
+            client.complete_semantic_gist_json([{"role": "user", "content": "x"}])
+        assert exc_info.value.error_code == "LLM_SCHEDULER_QUEUE_FULL"
+
+    def test_queue_full_is_logged_without_stack_trace(self, caplog) -> None:
+        client, scheduler = self._client()
+        scheduler.slot.side_effect = LlmApiCallException(
+            "full", error_code="LLM_SCHEDULER_QUEUE_FULL"
+        )
+        with caplog.at_level("WARNING"), pytest.raises(LlmApiCallException):
+            client.complete_semantic_gist_json([{"role": "user", "content": "x"}])
+        records = [r for r in caplog.records if "subjective completion" in r.getMessage()]
+        assert [r.levelname for r in records] == ["WARNING"]
+        assert records[0].exc_info is None
+
+    def test_other_llm_api_errors_are_logged_as_failures(self, caplog) -> None:
+        client, scheduler = self._client()
+        scheduler.slot.side_effect = LlmApiCallException(
+            "wall cap", error_code="LLM_WALL_CAP_EXCEEDED"
+        )
+        with caplog.at_level("WARNING"), pytest.raises(LlmApiCallException) as exc_info:
+            client.complete_semantic_gist_json([{"role": "user", "content": "x"}])
+        records = [r for r in caplog.records if "subjective completion" in r.getMessage()]
+        assert [r.levelname for r in records] == ["ERROR"]
+        assert records[0].exc_info is not None
+        assert exc_info.value.error_code == "LLM_API_CALL_FAILED"
@@ -0,0 +1,194 @@
+"""LlmResponseCache のテスト（record → replay・出現順・miss policy・latency 模擬）"""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ai_rpg_world.application.llm.contracts.llm_call_metrics import LlmCallMetrics
+from ai_rpg_world.application.llm.exceptions import LlmApiCallException
+from ai_rpg_world.application.llm.wiring._llm_client_factory import (
+    create_llm_client_from_config,
+)
+from ai_rpg_world.application.llm.wiring.resolved_runtime_config import (
+    ResolvedLlmRuntimeConfig,
+)
+from ai_rpg_world.infrastructure.llm.litellm_client import LiteLLMClient
+from ai_rpg_world.infrastructure.llm.llm_response_cache import LlmResponseCache
+
+_COMPLETION = "ai_rpg_world.infrastructure.llm.litellm_client.litellm.completion"
+_MESSAGES = [{"role": "user", "content": "どうする?"}]
+_TOOLS = [{"type": "function", "function": {"name": "world_no_op"}}]
+
+
+@pytest.fixture(autouse=True)
+def isolate_litellm_dotenv(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OPENAI_API_BASE", raising=False)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("LLM_REASONING_EFFORT", raising=False)
+    monkeypatch.setattr(
+        "ai_rpg_world.infrastructure.llm.litellm_client._load_dotenv_if_available",
+        lambda: None,
+    )
+
+
+def _tool_call_response(name: str, arguments: dict) -> MagicMock:
+    func = MagicMock()
+    func.name = name
+    func.arguments = json.dumps(arguments)
+    tool_call = MagicMock()
+    tool_call.function = func
+    message = MagicMock()
+    message.tool_calls = [tool_call]
+    choice = MagicMock()
+    choice.message = message
+    response = MagicMock()
+    response.choices = [choice]
+    response.usage = MagicMock(prompt_tokens=120, completion_tokens=8)
+    return response
+
+
+def _json_response(content: str) -> MagicMock:
+    message = MagicMock()
+    message.content = content
+    choice = MagicMock()
+    choice.message = message
+    response = MagicMock()
+    response.choices = [choice]
+    return response
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.records: list[LlmCallMetrics] = []
+
+    def record(self, metrics: LlmCallMetrics) -> None:
+        self.records.append(metrics)
+
+
+def _client(path: Path, mode: str, **kwargs) -> LiteLLMClient:
+    cache = LlmResponseCache.connect(str(path), mode=mode, **kwargs)
+    api_key = "sk-x" if mode == "record" else ""
+    return LiteLLMClient(model="m", api_key=api_key, response_cache=cache)
+
+
+class TestRecordReplay:
+    def test_replay_serves_recorded_tool_calls_without_network(self, tmp_path: Path) -> None:
+        """record した応答を、API key 無しの replay が呼び出し順どおりに返す。"""
+        db = tmp_path / "llm.sqlite"
+        recorder = _client(db, "record")
+        with patch(
+            _COMPLETION,
+            side_effect=[
+                _tool_call_response("move", {"to": "森"}),
+                _tool_call_response("world_no_op", {}),
+            ],
+        ):
+            first = recorder.invoke(_MESSAGES, _TOOLS)
+            second = recorder.invoke(_MESSAGES, _TOOLS)
+
+        replayer = _client(db, "replay")
+        sink = _Sink()
+        with patch(_COMPLETION) as completion:
+            replayed = [
+                replayer.invoke(_MESSAGES, _TOOLS, metrics_sink=sink) for _ in range(3)
+            ]
+
+        completion.assert_not_called()
+        # 記録より多く呼ばれたら最後の応答を返す
+        assert replayed == [first, second, second]
+        assert [m.prompt_tokens for m in sink.records] == [120, 120, 120]
+        assert replayer._response_cache.stats()["hits"] == 3
+
+    def test_key_includes_reasoning_and_tools(self, tmp_path: Path) -> None:
+        """reasoning 設定や tools が違う request は別 key (= miss) になる。"""
+        db = tmp_path / "llm.sqlite"
+        recorder = _client(db, "record")
+        with patch(_COMPLETION, return_value=_tool_call_response("move", {})):
+            recorder.invoke(_MESSAGES, _TOOLS)
+
+        replayer = _client(db, "replay")
+        with pytest.raises(LlmApiCallException) as exc_info:
+            replayer.invoke(_MESSAGES, _TOOLS, reasoning_effort="low")
+        assert exc_info.value.error_code == "LLM_REPLAY_CACHE_MISS"
+        with pytest.raises(LlmApiCallException):
+            replayer.invoke(_MESSAGES, [])
+
+    def test_json_completion_round_trip(self, tmp_path: Path) -> None:
+        db = tmp_path / "llm.sqlite"
+        recorder = _client(db, "record")
+        with patch(_COMPLETION, return_value=_json_response('{"gist": "森は危険"}')):
+            recorded = recorder.complete_semantic_gist_json(_MESSAGES)
+
+        replayer = _client(db, "replay")
+        assert replayer.complete_semantic_gist_json(_MESSAGES) == recorded
+
+
+class TestMissPolicy:
+    def test_stub_policy_returns_no_tool_call(self, tmp_path: Path) -> None:
+        replayer = _client(tmp_path / "llm.sqlite", "replay", miss_policy="stub")
+        sink = _Sink()
+
+        assert replayer.invoke(_MESSAGES, _TOOLS, metrics_sink=sink) is None
+        assert sink.records[0].error_code == "LLM_REPLAY_CACHE_MISS"
+        with pytest.raises(LlmApiCallException) as exc_info:
+            replayer.complete_short_term_summary_json(_MESSAGES)
+        assert exc_info.value.error_code == "LLM_REPLAY_CACHE_MISS"
+
+    def test_live_policy_calls_provider_and_appends(self, tmp_path: Path) -> None:
+        db = tmp_path / "llm.sqlite"
+        cache = LlmResponseCache.connect(str(db), mode="replay", miss_policy="live")
+        client = LiteLLMClient(model="m", api_key="sk-x", response_cache=cache)
+        with patch(_COMPLETION, return_value=_tool_call_response("move", {})) as completion:
+            result = client.invoke(_MESSAGES, _TOOLS)
+
+        assert completion.call_count == 1
+        assert result == {"name": "move", "arguments": {}}
+        assert cache.stats() == {"hits": 0, "misses": 1, "recorded": 1}
+        assert _client(db, "replay").invoke(_MESSAGES, _TOOLS) == result
+
+
+class TestLatencySimulation:
+    def test_replay_sleeps_recorded_latency_times_scale(self, tmp_path: Path) -> None:
+        cache = LlmResponseCache.connect(
+            str(tmp_path / "llm.sqlite"), mode="replay", latency_scale=0.5
+        )
+        key = cache.key_for("invoke", {"x": 1})
+        cache.record(
+            key, 0, kind="invoke", model="m", output=None,
+            metrics={"wall_latency_ms": 200},
+        )
+        started = time.monotonic()
+        assert cache.lookup(key, 0) is not None
+        assert time.monotonic() - started >= 0.09
+
+
+class TestConfig:
+    def test_replay_requires_cache_path(self) -> None:
+        with pytest.raises(ValueError, match="LLM_REPLAY_CACHE_PATH"):
+            ResolvedLlmRuntimeConfig.from_mapping(
+                values={"LLM_CLIENT": "litellm", "LLM_REPLAY_MODE": "replay"}
+            )
+
+    def test_unknown_miss_policy_fails_fast(self) -> None:
+        with pytest.raises(ValueError, match="LLM_REPLAY_MISS_POLICY"):
+            ResolvedLlmRuntimeConfig.from_mapping(
+                values={"LLM_REPLAY_MISS_POLICY": "ignore"}
+            )
+
+    def test_factory_attaches_shared_cache(self, tmp_path: Path) -> None:
+        config = ResolvedLlmRuntimeConfig.from_mapping(
+            values={
+                "LLM_CLIENT": "litellm",
+                "LLM_REPLAY_MODE": "record",
+                "LLM_REPLAY_CACHE_PATH": str(tmp_path / "llm.sqlite"),
+            }
+        )
+        first = create_llm_client_from_config(config)
+        second = create_llm_client_from_config(config)
+
+        assert first._response_cache is not None
+        assert first._response_cache is second._response_cache
+        assert first._response_cache.mode == "record"
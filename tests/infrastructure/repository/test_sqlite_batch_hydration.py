@@ -0,0 +1,150 @@
+"""SQLite 集約 repository の一括 hydration のテスト（子テーブルは table ごとに 1 query）"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import List
+
+import pytest
+
+from ai_rpg_world.domain.combat.enum.combat_enum import StatusEffectType
+from ai_rpg_world.domain.combat.value_object.status_effect import StatusEffect
+from ai_rpg_world.domain.common.value_object import WorldTick
+from ai_rpg_world.domain.player.value_object.player_id import PlayerId
+from ai_rpg_world.infrastructure.repository.game_write_sqlite_schema import (
+    init_game_write_schema,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_batch_hydration import (
+    fetch_grouped_rows,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_player_status_write_repository import (
+    SqlitePlayerStatusWriteRepository,
+)
+from tests.domain.player.aggregate.test_player_status_aggregate import (
+    create_test_status_aggregate,
+)
+
+
+@pytest.fixture
+def sqlite_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    init_game_write_schema(conn)
+    conn.commit()
+    return conn
+
+
+def _record_selects(conn: sqlite3.Connection) -> List[str]:
+    statements: List[str] = []
+    conn.set_trace_callback(
+        lambda sql: statements.append(sql)
+        if sql.lstrip().upper().startswith("SELECT")
+        else None
+    )
+    return statements
+
+
+def _seed(repo: SqlitePlayerStatusWriteRepository, count: int) -> None:
+    statuses = []
+    for player_id in range(1, count + 1):
+        status = create_test_status_aggregate(player_id=player_id, hp=100)
+        status.add_status_effect(
+            StatusEffect(
+                effect_type=StatusEffectType.POISON,
+                value=float(player_id),
+                expiry_tick=WorldTick(10 + player_id),
+            )
+        )
+        status.clear_events()
+        statuses.append(status)
+    repo.save_all(statuses)
+
+
+class TestPlayerStatusBatchHydration:
+    def test_find_all_issues_one_query_per_table(self, sqlite_conn) -> None:
+        repo = SqlitePlayerStatusWriteRepository.for_standalone_connection(sqlite_conn)
+        _seed(repo, 12)
+        selects = _record_selects(sqlite_conn)
+
+        statuses = repo.find_all()
+
+        assert [int(s.player_id) for s in statuses] == list(range(1, 13))
+        assert [s.active_effects[0].value for s in statuses] == [float(i) for i in range(1, 13)]
+        # 親 + 子 5 table。player 数に比例しない。
+        assert len(selects) == 6
+
+    def test_find_by_ids_keeps_request_order_and_skips_missing(
+        self, sqlite_conn
+    ) -> None:
+        repo = SqlitePlayerStatusWriteRepository.for_standalone_connection(sqlite_conn)
+        _seed(repo, 4)
+        selects = _record_selects(sqlite_conn)
+
+        statuses = repo.find_by_ids([PlayerId(3), PlayerId(99), PlayerId(1)])
+
+        assert [int(s.player_id) for s in statuses] == [3, 1]
+        assert statuses[0].active_effects[0].expiry_tick == WorldTick(13)
+        assert len(selects) == 6
+
+    def test_reads_return_independent_instances(self, sqlite_conn) -> None:
+        """deepcopy をやめても、読み出しごとに別 instance が組み立てられる。"""
+        repo = SqlitePlayerStatusWriteRepository.for_standalone_connection(sqlite_conn)
+        _seed(repo, 1)
+
+        first = repo.find_by_id(PlayerId(1))
+        second = repo.find_by_id(PlayerId(1))
+
+        assert first is not second
+        first.apply_damage(10)
+        assert second.hp.value == 100
+
+    def test_save_all_replaces_children_in_one_transaction(self, sqlite_conn) -> None:
+        repo = SqlitePlayerStatusWriteRepository.for_standalone_connection(sqlite_conn)
+        _seed(repo, 3)
+        statuses = repo.find_all()
+        for status in statuses:
+            status.cleanup_expired_effects(WorldTick(1000))
+            status.clear_events()
+
+        repo.save_all(statuses)
+
+        assert all(s.active_effects == [] for s in repo.find_all())
+        assert not sqlite_conn.in_transaction
+
+    def test_save_all_keeps_last_entry_for_duplicate_player(self, sqlite_conn) -> None:
+        """同じ player が 2 回ある batch も、save を順に呼んだときと同じく後勝ち。"""
+        repo = SqlitePlayerStatusWriteRepository.for_standalone_connection(sqlite_conn)
+        _seed(repo, 2)
+        older = repo.find_by_id(PlayerId(1))
+        newer = repo.find_by_id(PlayerId(1))
+        newer.apply_damage(30)
+        newer.cleanup_expired_effects(WorldTick(1000))
+        newer.clear_events()
+
+        repo.save_all([older, repo.find_by_id(PlayerId(2)), newer])
+
+        saved = repo.find_by_id(PlayerId(1))
+        assert saved.hp.value == 70
+        assert saved.active_effects == []
+        assert repo.find_by_id(PlayerId(2)).active_effects[0].value == 2.0
+        assert not sqlite_conn.in_transaction
+
+
+class TestFetchGroupedRows:
+    def test_splits_large_key_lists_into_chunks(self, sqlite_conn) -> None:
+        sqlite_conn.execute("CREATE TABLE t (owner INTEGER, idx INTEGER)")
+        sqlite_conn.executemany(
+            "INSERT INTO t (owner, idx) VALUES (?, ?)",
+            [(owner, idx) for owner in range(1200) for idx in (1, 0)],
+        )
+
+        grouped = fetch_grouped_rows(
+            sqlite_conn,
+            select_sql="SELECT owner, idx FROM t",
+            key_column="owner",
+            keys=list(range(1200)),
+            order_by="owner ASC, idx ASC",
+        )
+
+        assert len(grouped) == 1200
+        assert [row["idx"] for row in grouped[1100]] == [0, 1]
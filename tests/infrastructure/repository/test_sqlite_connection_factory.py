@@ -0,0 +1,123 @@
+"""SQLite 接続 profile と per-thread 接続プール。"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.infrastructure.repository.sqlite_connection_factory import (
+    DEFAULT_SQLITE_PROFILE,
+    SqliteConnectionPool,
+    SqliteConnectionProfile,
+    open_sqlite_connection,
+)
+from ai_rpg_world.infrastructure.repository.sqlite_subjective_episode_store import (
+    SqliteSubjectiveEpisodeStore,
+)
+from tests.infrastructure.repository import test_sqlite_subjective_episode_store_by_being as by_being
+
+
+def _pragma(conn, name: str):
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def test_open_applies_profile_and_creates_parent_dir(tmp_path: Path) -> None:
+    db = tmp_path / "nested" / "game.db"
+    conn = open_sqlite_connection(db, row_factory=sqlite3.Row)
+
+    assert db.parent.is_dir()
+    assert conn.row_factory is sqlite3.Row
+    assert _pragma(conn, "journal_mode") == "wal"
+    assert _pragma(conn, "synchronous") == 1  # NORMAL
+    assert _pragma(conn, "temp_store") == 2  # MEMORY
+    assert _pragma(conn, "busy_timeout") == DEFAULT_SQLITE_PROFILE.busy_timeout_ms
+    assert _pragma(conn, "cache_size") == -DEFAULT_SQLITE_PROFILE.cache_size_kib
+    conn.close()
+
+
+def test_open_memory_database_skips_file_only_pragmas() -> None:
+    profile = SqliteConnectionProfile(busy_timeout_ms=1234)
+    conn = open_sqlite_connection(":memory:", profile=profile)
+    assert _pragma(conn, "journal_mode") == "memory"
+    assert _pragma(conn, "busy_timeout") == 1234
+
+
+def test_pool_hands_out_one_connection_per_thread(tmp_path: Path) -> None:
+    pool = SqliteConnectionPool(tmp_path / "p.db")
+    pool.execute("CREATE TABLE t (v INTEGER)")
+    pool.commit()
+    main_conn = pool.connection()
+    assert pool.connection() is main_conn
+
+    def work(v: int) -> int:
+        with pool:
+            pool.execute("INSERT INTO t (v) VALUES (?)", (v,))
+        return id(pool.connection())
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        worker_ids = set(ex.map(work, range(40)))
+
+    assert id(main_conn) not in worker_ids
+    assert pool.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 40
+    pool.close()
+    assert pool.open_connection_count() == 0
+    # close 後は開き直す
+    assert pool.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 40
+
+
+def test_pool_closes_connections_of_finished_threads(tmp_path: Path) -> None:
+    pool = SqliteConnectionPool(tmp_path / "p.db")
+    for _ in range(3):
+        t = threading.Thread(target=lambda: pool.execute("SELECT 1").fetchone())
+        t.start()
+        t.join()
+    pool.connection()
+    # 終了済みスレッドの接続は、新しい接続を開くたびに片付く
+    assert pool.open_connection_count() == 1
+
+
+def test_pool_memory_database_shares_single_connection() -> None:
+    pool = SqliteConnectionPool(":memory:")
+    pool.execute("CREATE TABLE t (v INTEGER)")
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(pool.connection()))
+    t.start()
+    t.join()
+    assert seen == [pool.connection()]
+    assert pool.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_pool_row_factory_applies_to_open_and_new_connections(tmp_path: Path) -> None:
+    pool = SqliteConnectionPool(tmp_path / "p.db")
+    conn = pool.connection()
+    pool.row_factory = sqlite3.Row
+    assert conn.row_factory is sqlite3.Row
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(pool.connection().row_factory))
+    t.start()
+    t.join()
+    assert seen == [sqlite3.Row]
+
+
+def test_subjective_store_accepts_writes_from_worker_threads(tmp_path: Path) -> None:
+    store = SqliteSubjectiveEpisodeStore.connect(str(tmp_path / "ep.db"))
+    beings = [BeingId(f"being_w1_p{i}") for i in range(1, 5)]
+
+    def write(i: int) -> None:
+        player_id = i % len(beings) + 1
+        ep = by_being._episode(
+            episode_id=f"e{i:03d}",
+            player_id=player_id,
+            occurred_at=by_being._NOW + timedelta(minutes=i),
+        )
+        store.put_by_being(ep.being_id, ep)
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(write, range(80)))
+
+    assert sum(len(store.list_all_by_being(b)) for b in beings) == 80
+    assert store.connection.connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
@@ -0,0 +1,247 @@
+"""記憶 store 向け group commit 接続 (SqliteGroupCommitConnection)。"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.memory.episodic.value_object.memory_link import MemoryLink, MemoryLinkType
+from ai_rpg_world.infrastructure.repository.sqlite_group_commit import SqliteGroupCommitConnection
+from ai_rpg_world.infrastructure.repository.sqlite_memory_link_store import SqliteMemoryLinkStore
+from ai_rpg_world.infrastructure.repository.sqlite_subjective_episode_store import (
+    SqliteSubjectiveEpisodeStore,
+)
+from tests.infrastructure.repository import test_sqlite_subjective_episode_store_by_being as by_being
+
+_BEING = BeingId("being_w1_p1")
+_T = datetime(2026, 6, 14, 12, 0, tzinfo=timezone.utc)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _committed_count(db: Path, table: str) -> int:
+    """別接続から見た (= COMMIT 済みの) 行数。"""
+    other = sqlite3.connect(str(db))
+    try:
+        return other.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        other.close()
+
+
+def _link(a: str, b: str) -> MemoryLink:
+    return MemoryLink(
+        link_id=f"{a}|{b}",
+        player_id=1,
+        being_id=_BEING,
+        episode_id_a=a,
+        episode_id_b=b,
+        link_type=MemoryLinkType.TEMPORAL,
+        strength=0.5,
+        co_activation_count=1,
+        created_at=_T,
+        last_activated_at=_T,
+        decay_rate=0.1,
+    )
+
+
+def test_writes_are_visible_before_commit_and_batched(tmp_path: Path) -> None:
+    db = tmp_path / "ep.db"
+    clock = _Clock()
+    conn = SqliteGroupCommitConnection(db, max_delay_ms=1000, max_units=100, clock=clock)
+    store = SqliteSubjectiveEpisodeStore(conn)
+    links = SqliteMemoryLinkStore(conn)
+
+    for i in range(5):
+        store.put_by_being(_BEING, by_being._episode(episode_id=f"e{i}"))
+    links.upsert_link_by_being(_BEING, _link("e0", "e1"))
+
+    # read-your-writes: 同じ接続からは未 COMMIT の unit が見える
+    assert [ep.episode_id for ep in store.list_recent_by_being(_BEING, 10)] == [
+        "e4", "e3", "e2", "e1", "e0"
+    ]
+    assert links.get_link_by_being(_BEING, "e0", "e1", MemoryLinkType.TEMPORAL) is not None
+    assert _committed_count(db, "subjective_episodes_by_being") == 0
+
+    conn.flush()
+    assert _committed_count(db, "subjective_episodes_by_being") == 5
+    assert _committed_count(db, "memory_links_by_being") == 1
+    m = conn.metrics()
+    assert m.units_committed == 6
+    assert m.pending_units == 0
+    assert m.max_units_per_transaction == 6
+    # migration の明示 transaction 2 本 + flush 1 本
+    assert m.transactions_committed == 3
+
+
+def test_commit_after_max_delay_or_max_units(tmp_path: Path) -> None:
+    db = tmp_path / "ep.db"
+    clock = _Clock()
+    conn = SqliteGroupCommitConnection(db, max_delay_ms=50, max_units=3, clock=clock)
+    store = SqliteSubjectiveEpisodeStore(conn)
+    base = conn.metrics().transactions_committed
+
+    store.put_by_being(_BEING, by_being._episode(episode_id="e0"))
+    clock.now = 0.049
+    store.put_by_being(_BEING, by_being._episode(episode_id="e1"))
+    assert _committed_count(db, "subjective_episodes_by_being") == 0
+    clock.now = 0.050
+    store.put_by_being(_BEING, by_being._episode(episode_id="e2"))
+    assert _committed_count(db, "subjective_episodes_by_being") == 3
+
+    for i in range(3, 6):
+        store.put_by_being(_BEING, by_being._episode(episode_id=f"e{i}"))
+    assert _committed_count(db, "subjective_episodes_by_being") == 6
+    assert conn.metrics().transactions_committed - base == 2
+
+
+def test_rollback_discards_only_the_failed_unit(tmp_path: Path) -> None:
+    db = tmp_path / "ep.db"
+    conn = SqliteGroupCommitConnection(db, max_delay_ms=1000)
+    store = SqliteSubjectiveEpisodeStore(conn)
+    store.put_by_being(_BEING, by_being._episode(episode_id="keep"))
+
+    conn.execute(
+        "INSERT INTO subjective_episodes_by_being "
+        "(being_id_value, episode_id, occurred_at_key, payload_json, player_id) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (_BEING.value, "drop", 0.0, "[]", 1),
+    )
+    assert conn.in_transaction
+    conn.rollback()
+    assert not conn.in_transaction
+
+    conn.flush()
+    assert [ep.episode_id for ep in store.list_all_by_being(_BEING)] == ["keep"]
+    assert _committed_count(db, "subjective_episodes_by_being") == 1
+    assert conn.metrics().units_rolled_back == 1
+
+
+def test_concurrent_writers_serialise_units(tmp_path: Path) -> None:
+    db = tmp_path / "ep.db"
+    conn = SqliteGroupCommitConnection(db, max_delay_ms=1000, max_units=1000)
+    store = SqliteSubjectiveEpisodeStore(conn)
+
+    def write(i: int) -> None:
+        store.put_by_being(_BEING, by_being._episode(episode_id=f"e{i:03d}", cues=()))
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(write, range(60)))
+
+    assert len(store.list_all_by_being(_BEING)) == 60
+    conn.close()
+    assert _committed_count(db, "subjective_episodes_by_being") == 60
+
+
+def test_other_thread_times_out_while_unit_is_open(tmp_path: Path) -> None:
+    conn = SqliteGroupCommitConnection(tmp_path / "x.db", lock_timeout_ms=50)
+    conn.execute("CREATE TABLE t (v INTEGER)")
+    conn.commit()
+    conn.execute("INSERT INTO t (v) VALUES (1)")
+    errors: list[Exception] = []
+
+    def other() -> None:
+        try:
+            conn.execute("SELECT COUNT(*) FROM t").fetchone()
+        except sqlite3.OperationalError as exc:
+            errors.append(exc)
+
+    t = threading.Thread(target=other)
+    t.start()
+    t.join()
+    assert errors and "locked" in str(errors[0])
+    conn.commit()
+
+
+def test_store_connect_with_group_commit_exposes_flush_and_metrics(tmp_path: Path) -> None:
+    db = tmp_path / "ep.db"
+    store = SqliteSubjectiveEpisodeStore.connect(str(db), group_commit_max_delay_ms=10_000)
+    store.put_by_being(_BEING, by_being._episode(episode_id="e1"))
+    assert _committed_count(db, "subjective_episodes_by_being") == 0
+    store.flush()
+    assert _committed_count(db, "subjective_episodes_by_being") == 1
+    metrics = store.group_commit_metrics()
+    assert metrics is not None and metrics.units_committed == 1
+
+    plain = SqliteSubjectiveEpisodeStore.connect(str(tmp_path / "plain.db"))
+    plain.flush()  # group commit なしでも呼べる
+    assert plain.group_commit_metrics() is None
+
+
+def test_invalid_limits_raise(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_units"):
+        SqliteGroupCommitConnection(tmp_path / "x.db", max_units=0)
+    with pytest.raises(ValueError, match="max_delay_ms"):
+        SqliteGroupCommitConnection(tmp_path / "x.db", max_delay_ms=-1)
+
+
+def _write_from_other_thread(store: SqliteSubjectiveEpisodeStore, episode_id: str) -> list[Exception]:
+    errors: list[Exception] = []
+
+    def other() -> None:
+        try:
+            store.put_by_being(_BEING, by_being._episode(episode_id=episode_id))
+        except sqlite3.Error as exc:
+            errors.append(exc)
+
+    t = threading.Thread(target=other)
+    t.start()
+    t.join()
+    return errors
+
+
+def test_failed_first_statement_releases_the_unit(tmp_path: Path) -> None:
+    conn = SqliteGroupCommitConnection(tmp_path / "ep.db", lock_timeout_ms=200)
+    store = SqliteSubjectiveEpisodeStore(conn)
+
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("INSERT INTO no_such_table (v) VALUES (1)")
+
+    assert not conn.in_transaction
+    assert _write_from_other_thread(store, "e1") == []
+
+
+def test_failed_put_mid_unit_rolls_back_and_releases(tmp_path: Path) -> None:
+    """put の 2 文目が落ちても unit は閉じ、他スレッドは書き込める。"""
+    conn = SqliteGroupCommitConnection(tmp_path / "ep.db", lock_timeout_ms=200)
+    store = SqliteSubjectiveEpisodeStore(conn)
+    store.put_by_being(_BEING, by_being._episode(episode_id="keep"))
+    conn.execute(
+        "CREATE TRIGGER refuse_bad BEFORE INSERT ON subjective_episodes_by_being "
+        "WHEN NEW.episode_id = 'bad' BEGIN SELECT RAISE(ABORT, 'refused'); END"
+    )
+    conn.commit()
+
+    with pytest.raises(sqlite3.IntegrityError):
+        store.put_by_being(_BEING, by_being._episode(episode_id="bad"))
+
+    assert not conn.in_transaction
+    assert _write_from_other_thread(store, "e2") == []
+    assert sorted(ep.episode_id for ep in store.list_all_by_being(_BEING)) == ["e2", "keep"]
+
+
+def test_quiet_writer_is_flushed_by_the_delay_timer(tmp_path: Path) -> None:
+    """次の書き込みが来なくても、max_delay_ms 後に COMMIT される。"""
+    db = tmp_path / "ep.db"
+    conn = SqliteGroupCommitConnection(db, max_delay_ms=20, max_units=100)
+    store = SqliteSubjectiveEpisodeStore(conn)
+    store.put_by_being(_BEING, by_being._episode(episode_id="e1"))
+
+    deadline = time.monotonic() + 5.0
+    while _committed_count(db, "subjective_episodes_by_being") == 0:
+        assert time.monotonic() < deadline, "delay timer did not flush"
+        time.sleep(0.01)
+    assert conn.metrics().pending_units == 0
+    conn.close()
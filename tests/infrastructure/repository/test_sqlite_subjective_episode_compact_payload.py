@@ -0,0 +1,123 @@
+"""SubjectiveEpisode の v2 (compact 配列) payload と、schema v4 の v1 → v2 変換・見出し API。"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from ai_rpg_world.application.llm.services.in_memory_subjective_episode_store import (
+    InMemorySubjectiveEpisodeStore,
+)
+from ai_rpg_world.domain.being.value_object.being_id import BeingId
+from ai_rpg_world.domain.memory.episodic.value_object.episode_location import EpisodeLocation
+from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue import EpisodicCue
+from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue_source import EpisodicCueSource
+from ai_rpg_world.infrastructure.repository.sqlite_subjective_episode_store import (
+    SqliteSubjectiveEpisodeStore,
+    _compact_payload_to_episode,
+    _decode_payload,
+    _encode_payload,
+    _episode_to_payload_dict,
+)
+from tests.infrastructure.repository import test_sqlite_subjective_episode_store_by_being as by_being
+
+_BEING = BeingId("being_w1_p1")
+_NOW = datetime(2026, 6, 14, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+def _cue(axis: str, value: str) -> EpisodicCue:
+    return EpisodicCue(axis=axis, value=value, source=EpisodicCueSource.RUNTIME_CONTEXT)
+
+
+def _variants():
+    base = by_being._episode(episode_id="e1", occurred_at=_NOW, cues=(_cue("entity", "アリス"), _cue("object", "a,b")))
+    return [
+        base,
+        replace(base, occurred_at=datetime(2026, 6, 14, 12, 0, 0, 7)),
+        replace(base, occurred_at=_NOW.astimezone(timezone(timedelta(hours=9, minutes=30)))),
+        replace(base, action=None, why="理由", expected="e", prediction_error="p", felt="f", game_time_label=None),
+        replace(
+            base,
+            location=EpisodeLocation(spot_id=None, tile_area_ids=(3, 4), sub_location_id=8, x=1, y=-2, z=0),
+            last_recalled_at=_NOW + timedelta(days=2),
+            recall_count=5,
+            recall_text=None,
+            who=("bob",),
+            co_present=("carol", "dave"),
+            salience="high",
+        ),
+    ]
+
+
+@pytest.mark.parametrize("episode", _variants())
+def test_compact_payload_round_trips(episode) -> None:
+    payload = _encode_payload(episode)
+    assert payload.startswith("[2,")
+    decoded = _decode_payload(payload, being_id=_BEING)
+    assert decoded == episode
+    assert decoded.occurred_at.utcoffset() == episode.occurred_at.utcoffset()
+    # v1 と同じ episode を表し、サイズは小さい
+    v1 = json.dumps(_episode_to_payload_dict(episode), ensure_ascii=False)
+    assert _decode_payload(v1, being_id=_BEING) == episode
+    assert len(payload) < len(v1)
+
+
+def test_compact_payload_being_id_mismatch_fails() -> None:
+    data = json.loads(_encode_payload(_variants()[0]))
+    data[3] = "being_w1_p99"
+    with pytest.raises(ValueError, match="episode.being_id must match"):
+        _compact_payload_to_episode(data, being_id=_BEING)
+
+
+def test_migration_rewrites_object_payloads(tmp_path: Path) -> None:
+    db = str(tmp_path / "ep.db")
+    store = SqliteSubjectiveEpisodeStore.connect(db)
+    episodes = _variants()
+    for i, ep in enumerate(episodes):
+        ep = replace(ep, episode_id=f"e{i}")
+        store.put_by_being(_BEING, ep)
+        # schema v4 以前に書かれた v1 行を模す
+        store.connection.execute(
+            "UPDATE subjective_episodes_by_being SET payload_json = ? WHERE episode_id = ?",
+            (json.dumps(_episode_to_payload_dict(ep), ensure_ascii=False), ep.episode_id),
+        )
+    store.connection.execute(
+        "UPDATE schema_migrations SET version = 3 WHERE namespace = 'subjective-episodes-mvp-v1'"
+    )
+    store.connection.commit()
+    store.connection.close()
+
+    reopened = SqliteSubjectiveEpisodeStore.connect(db)
+
+    payloads = [r[0] for r in reopened.connection.execute("SELECT payload_json FROM subjective_episodes_by_being")]
+    assert payloads and all(p.startswith("[2,") for p in payloads)
+    got = {ep.episode_id: ep for ep in reopened.list_all_by_being(_BEING)}
+    assert got == {f"e{i}": replace(ep, episode_id=f"e{i}") for i, ep in enumerate(episodes)}
+
+
+def test_cue_headers_match_full_query_for_both_stores(tmp_path: Path) -> None:
+    sqlite_store = SqliteSubjectiveEpisodeStore.connect(str(tmp_path / "ep.db"))
+    memory_store = InMemorySubjectiveEpisodeStore()
+    cues = [_cue("entity", v) for v in ("a", "b", "c")]
+    for i in range(12):
+        ep = by_being._episode(
+            episode_id=f"e{i:02d}",
+            occurred_at=_NOW - timedelta(minutes=i % 5),
+            cues=tuple(cues[j] for j in range(3) if (i >> j) & 1) or (cues[0],),
+        )
+        sqlite_store.put_by_being(_BEING, ep)
+        memory_store.put_by_being(_BEING, ep)
+
+    for store in (sqlite_store, memory_store):
+        headers = store.list_cue_headers_by_being(_BEING, cues, 4)
+        full = store.list_by_cues_by_being(_BEING, cues, 4)
+        assert [(h.episode_id, h.matched_cue_canonicals) for h in headers] == [
+            (ep.episode_id, keys) for ep, keys in full
+        ]
+    assert [h.episode_id for h in sqlite_store.list_cue_headers_by_being(_BEING, cues, 4)] == [
+        h.episode_id for h in memory_store.list_cue_headers_by_being(_BEING, cues, 4)
+    ]
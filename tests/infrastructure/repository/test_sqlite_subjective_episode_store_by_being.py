@@ -16,7 +16,7 @@ from ai_rpg_world.domain.memory.episodic.value_object.episode_source import Epis
 from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue import EpisodicCue
 from ai_rpg_world.domain.memory.episodic.value_object.episodic_cue_source import EpisodicCueSource
 from ai_rpg_world.domain.memory.episodic.value_object.subjective_episode import SubjectiveEpisode
-from ai_rpg_world.infrastructure.repository.sqlite_subjective_episode_store import SqliteSubjectiveEpisodeStore
+from ai_rpg_world.infrastructure.repository.sqlite_subjective_episode_store import SqliteSubjectiveEpisodeStore, _episode_to_payload_dict
 _NOW = datetime(2026, 6, 14, 12, 0, tzinfo=timezone.utc)
 
 def _episode(*, episode_id: str, player_id: int=1, occurred_at: datetime=_NOW, cues: tuple[EpisodicCue, ...]=(), salience: str='low') -> SubjectiveEpisode:
@@ -80,6 +80,17 @@ class TestSqliteByBeingBasic:
         assert store.list_recent_by_being(being, limit=-1) == []
         assert store.list_by_cue_by_being(being, cue, limit=0) == []
 
+    def test_get_many_returns_found_only(self, store: SqliteSubjectiveEpisodeStore, being: BeingId) -> None:
+        """get_many は見つかった ID だけを dict で返す (チャンク境界をまたいでも同じ)。"""
+        ids = [f'e{i:04d}' for i in range(1200)]
+        for eid in ids:
+            store.put_by_being(being, _episode(episode_id=eid))
+        got = store.get_many_by_being(being, ids + ['missing'])
+        assert sorted(got) == ids
+        assert got['e0007'].episode_id == 'e0007'
+        assert store.get_many_by_being(BeingId('being_w1_p2'), ids[:3]) == {}
+        assert store.get_many_by_being(being, []) == {}
+
 class TestSqliteSalience:
     """U6 (予測誤差統一設計 / salience): payload_json 経由の round-trip と
     旧行 (salience キー無し) の後方互換。JSON blob 永続化なので
@@ -96,11 +107,10 @@ class TestSqliteSalience:
         assert got is not None and got.salience == 'high'
 
     def test_old_row_without_salience_key_defaults_low(self, store: SqliteSubjectiveEpisodeStore, being: BeingId) -> None:
-        """U6 導入前に書かれた行を模して payload_json から salience キーを
-        直接削り、読み出しが壊れず "low" にフォールバックすることを見る。"""
+        """U6 導入前に書かれた行を模して v1 (キー付き JSON) payload から
+        salience キーを削り、読み出しが壊れず "low" にフォールバックすることを見る。"""
         store.put_by_being(being, _episode(episode_id='e1'))
-        cur = store.connection.execute('SELECT payload_json FROM subjective_episodes_by_being WHERE being_id_value = ? AND episode_id = ?', (being.value, 'e1'))
-        payload = json.loads(cur.fetchone()[0])
+        payload = _episode_to_payload_dict(_episode(episode_id='e1'))
         del payload['salience']
         store.connection.execute('UPDATE subjective_episodes_by_being SET payload_json = ? WHERE being_id_value = ? AND episode_id = ?', (json.dumps(payload), being.value, 'e1'))
         store.connection.commit()
@@ -123,13 +133,9 @@ class TestSqliteByBeingBeingId:
     def test_old_row_without_being_id_key_uses_store_key(
         self, store: SqliteSubjectiveEpisodeStore, being: BeingId
     ) -> None:
-        """payload に being_id キーが無い旧行は行の store キーで復元できる。"""
+        """payload (v1) に being_id キーが無い旧行は行の store キーで復元できる。"""
         store.put_by_being(being, _episode(episode_id='e1'))
-        cur = store.connection.execute(
-            'SELECT payload_json FROM subjective_episodes_by_being WHERE being_id_value = ? AND episode_id = ?',
-            (being.value, 'e1'),
-        )
-        payload = json.loads(cur.fetchone()[0])
+        payload = _episode_to_payload_dict(_episode(episode_id='e1'))
         del payload['being_id']
         store.connection.execute(
             'UPDATE subjective_episodes_by_being SET payload_json = ? WHERE being_id_value = ? AND episode_id = ?',
@@ -144,11 +150,7 @@ class TestSqliteByBeingBeingId:
     ) -> None:
         """payload の being_id と store キーが違うと decode が失敗する。"""
         store.put_by_being(being, _episode(episode_id='e1'))
-        cur = store.connection.execute(
-            'SELECT payload_json FROM subjective_episodes_by_being WHERE being_id_value = ? AND episode_id = ?',
-            (being.value, 'e1'),
-        )
-        payload = json.loads(cur.fetchone()[0])
+        payload = _episode_to_payload_dict(_episode(episode_id='e1'))
         payload['being_id'] = BeingId('being_w1_p99').value
         store.connection.execute(
             'UPDATE subjective_episodes_by_being SET payload_json = ? WHERE being_id_value = ? AND episode_id = ?',
@@ -183,3 +185,83 @@ class TestSqliteByBeingPersistence:
         got = reopened.get_by_being(being, 'persistent')
         assert got is not None
         assert got.episode_id == 'persistent'
+
+class TestSqliteMultiCueAndDecodedCache:
+    """list_by_cues_by_being (1 文で複数 cue) と decode 済み episode の LRU。"""
+
+    def test_list_by_cues_matches_per_cue_union(self, store: SqliteSubjectiveEpisodeStore, being: BeingId) -> None:
+        """cue ごとの list_by_cue の和集合・マッチ集合と一致し、InMemory とも一致する。"""
+        import random
+        from ai_rpg_world.application.llm.services.in_memory_subjective_episode_store import InMemorySubjectiveEpisodeStore
+        rng = random.Random(3)
+        pool = [EpisodicCue(axis=axis, value=v, source=EpisodicCueSource.RUNTIME_CONTEXT) for axis in ('entity', 'object') for v in ('a', 'b,c', 'd', 'e')]
+        memory = InMemorySubjectiveEpisodeStore()
+        for i in range(60):
+            ep = _episode(episode_id=f'e{i:02d}', occurred_at=_NOW - timedelta(minutes=rng.randint(0, 20)), cues=tuple(rng.sample(pool, rng.randint(1, 4))))
+            store.put_by_being(being, ep)
+            memory.put_by_being(being, ep)
+        for min_occurred_at in (None, _NOW - timedelta(minutes=10)):
+            cues = rng.sample(pool, 5)
+            expected: dict[str, set[str]] = {}
+            order: dict[str, SubjectiveEpisode] = {}
+            for cue in cues:
+                for ep in store.list_by_cue_by_being(being, cue, 6, min_occurred_at=min_occurred_at):
+                    expected.setdefault(ep.episode_id, set()).add(cue.to_canonical())
+                    order[ep.episode_id] = ep
+            got = store.list_by_cues_by_being(being, cues, 6, min_occurred_at=min_occurred_at)
+            assert {ep.episode_id: set(keys) for ep, keys in got} == expected
+            assert [ep.episode_id for ep, _ in got] == [ep.episode_id for ep in memory.list_recent_by_being(being, 100) if ep.episode_id in expected]
+            assert [(ep.episode_id, keys) for ep, keys in got] == [(ep.episode_id, keys) for ep, keys in memory.list_by_cues_by_being(being, cues, 6, min_occurred_at=min_occurred_at)]
+        assert store.list_by_cues_by_being(being, pool, 0) == []
+        assert store.list_by_cues_by_being(being, [], 5) == []
+
+    def test_repeated_reads_decode_once_and_put_invalidates(self, store: SqliteSubjectiveEpisodeStore, being: BeingId, monkeypatch: pytest.MonkeyPatch) -> None:
+        """同じ episode を何度引いても decode は 1 回。put 後は新しい内容を返す。"""
+        import ai_rpg_world.infrastructure.repository.sqlite_subjective_episode_store as mod
+        calls: list[str] = []
+        original = mod._decode_payload
+
+        def counting(payload_json, *, being_id):
+            ep = original(payload_json, being_id=being_id)
+            calls.append(ep.episode_id)
+            return ep
+        monkeypatch.setattr(mod, '_decode_payload', counting)
+        cue = EpisodicCue(axis='entity', value='alice', source=EpisodicCueSource.RUNTIME_CONTEXT)
+        store.put_by_being(being, _episode(episode_id='e1', cues=(cue,)))
+        store.get_by_being(being, 'e1')
+        store.list_by_cue_by_being(being, cue, limit=5)
+        store.list_by_cues_by_being(being, [cue], 5)
+        store.list_recent_by_being(being, limit=5)
+        assert calls == ['e1']
+
+        store.put_by_being(being, _episode(episode_id='e1', cues=(cue,), salience='high'))
+        got = store.get_by_being(being, 'e1')
+        assert got is not None and got.salience == 'high'
+        assert calls == ['e1', 'e1']
+
+        store.replace_all_by_being(being, [_episode(episode_id='e1', cues=(cue,))])
+        got = store.get_by_being(being, 'e1')
+        assert got is not None and got.salience == 'low'
+
+    def test_stale_decode_recached_during_put_is_not_served(self, store: SqliteSubjectiveEpisodeStore, being: BeingId) -> None:
+        """put の書き込みと cache 破棄の間に古い行を読んだ reader が cache に戻しても、新しい行を返す。"""
+        store.put_by_being(being, _episode(episode_id='e1'))
+        old_payload = store.connection.execute("SELECT payload_json FROM subjective_episodes_by_being WHERE episode_id = 'e1'").fetchone()[0]
+        store.put_by_being(being, _episode(episode_id='e1', salience='high'))
+        # 競合した reader が古い行を decode して cache に戻した状態
+        assert store._decode(being, 'e1', old_payload).salience == 'low'
+
+        got = store.get_by_being(being, 'e1')
+        assert got is not None and got.salience == 'high'
+        assert store.get_many_by_being(being, ['e1'])['e1'].salience == 'high'
+
+    def test_cache_is_bounded_per_being(self, db_path: Path, being: BeingId) -> None:
+        """LRU は Being ごとに上限で切る。0 なら保持しない。"""
+        bounded = SqliteSubjectiveEpisodeStore.connect(str(db_path), decoded_cache_size_per_being=3)
+        for i in range(5):
+            bounded.put_by_being(being, _episode(episode_id=f'e{i}'))
+        bounded.list_recent_by_being(being, limit=10)
+        assert bounded._decoded.size(being) == 3
+        disabled = SqliteSubjectiveEpisodeStore.connect(str(db_path), decoded_cache_size_per_being=0)
+        disabled.list_recent_by_being(being, limit=10)
+        assert disabled._decoded.size(being) == 0
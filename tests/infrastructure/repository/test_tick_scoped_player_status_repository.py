@@ -0,0 +1,164 @@
+"""TickScopedPlayerStatusRepository のテスト（tick 内 1 回 load・private copy・tick 末 flush）"""
+
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from ai_rpg_world.domain.player.aggregate.player_status_aggregate import (
+    PlayerStatusAggregate,
+)
+from ai_rpg_world.domain.player.value_object.player_id import PlayerId
+from ai_rpg_world.infrastructure.repository.in_memory_player_status_repository import (
+    InMemoryPlayerStatusRepository,
+)
+from ai_rpg_world.infrastructure.repository.tick_scoped_player_status_repository import (
+    TickScopedPlayerStatusRepository,
+)
+from tests.domain.player.aggregate.test_player_status_aggregate import (
+    create_test_status_aggregate,
+)
+
+
+class _CountingRepository(InMemoryPlayerStatusRepository):
+    """内側 repository への往復回数を数える。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.find_all_calls = 0
+        self.find_by_id_calls = 0
+        self.saved: List[List[int]] = []
+
+    def find_all(self) -> List[PlayerStatusAggregate]:
+        self.find_all_calls += 1
+        return super().find_all()
+
+    def find_by_id(self, player_id: PlayerId):
+        self.find_by_id_calls += 1
+        return super().find_by_id(player_id)
+
+    def save(self, status: PlayerStatusAggregate) -> PlayerStatusAggregate:
+        self.saved.append([status.player_id.value])
+        return super().save(status)
+
+    def save_all(self, statuses: List[PlayerStatusAggregate]) -> None:
+        self.saved.append([s.player_id.value for s in statuses])
+        super().save_all(statuses)
+
+
+@pytest.fixture
+def inner() -> _CountingRepository:
+    repo = _CountingRepository()
+    for player_id in (1, 2, 3):
+        repo.save(create_test_status_aggregate(player_id=player_id, hp=100))
+    repo.saved.clear()
+    return repo
+
+
+class TestTickScope:
+    def test_find_all_loads_once_per_tick(self, inner: _CountingRepository) -> None:
+        repo = TickScopedPlayerStatusRepository(inner)
+        with repo.tick_scope(5):
+            first = repo.find_all()
+            second = repo.find_all()
+            assert repo.find_by_id(PlayerId(2)) is not None
+
+        assert inner.find_all_calls == 1
+        assert inner.find_by_id_calls == 0
+        assert [a is b for a, b in zip(first, second)] == [True, True, True]
+        stats = repo.last_tick_stats
+        assert (stats.tick, stats.loads, stats.copies, stats.flushes) == (5, 3, 1, 0)
+
+    def test_find_by_id_returns_private_copy(self, inner: _CountingRepository) -> None:
+        """書き換え用の取得は共有 instance を汚さない。"""
+        repo = TickScopedPlayerStatusRepository(inner)
+        with repo.tick_scope():
+            shared = {s.player_id: s for s in repo.find_all()}
+            copy = repo.find_by_id(PlayerId(1))
+            assert copy is not shared[PlayerId(1)]
+            copy.apply_damage(10)
+            copy.clear_events()
+            assert shared[PlayerId(1)].hp.value == 100
+
+    def test_unsaved_mutation_is_not_visible_to_next_find_by_id(
+        self, inner: _CountingRepository
+    ) -> None:
+        """save しなかった変更と event は後続の find_by_id に持ち越されない。"""
+        repo = TickScopedPlayerStatusRepository(inner)
+        with repo.tick_scope(2):
+            discarded = repo.find_by_id(PlayerId(1))
+            discarded.apply_damage(9999)
+            assert discarded.get_events()
+
+            fresh = repo.find_by_id(PlayerId(1))
+            assert fresh is not discarded
+            assert fresh.hp.value == 100
+            assert fresh.get_events() == []
+
+        assert repo.last_tick_stats.copies == 2
+
+    def test_saves_are_flushed_once_at_scope_end(
+        self, inner: _CountingRepository
+    ) -> None:
+        repo = TickScopedPlayerStatusRepository(inner)
+        with repo.tick_scope(1):
+            for player_id in (1, 2):
+                status = repo.find_by_id(PlayerId(player_id))
+                status.apply_damage(10)
+                status.clear_events()
+                repo.save(status)
+            # 後続 stage からは保存済みの値が見える
+            hp = {s.player_id.value: s.hp.value for s in repo.find_all()}
+            assert hp == {1: 90, 2: 90, 3: 100}
+            assert inner.saved == []
+
+        assert inner.saved == [[1, 2]]
+        assert inner.find_by_id(PlayerId(1)).hp.value == 90
+        assert repo.last_tick_stats.flushes == 2
+
+    def test_aggregate_with_events_is_written_through(
+        self, inner: _CountingRepository
+    ) -> None:
+        """未回収の domain event を持つ集約は event 回収順を保つため即時に書く。"""
+        repo = TickScopedPlayerStatusRepository(inner)
+        with repo.tick_scope():
+            status = repo.find_by_id(PlayerId(1))
+            status.apply_damage(9999)
+            assert status.get_events()
+            repo.save(status)
+            assert inner.saved == [[1]]
+
+        assert inner.saved == [[1]]
+        assert repo.last_tick_stats.write_throughs == 1
+        assert repo.last_tick_stats.flushes == 0
+
+    def test_flushes_even_when_stage_raises(self, inner: _CountingRepository) -> None:
+        repo = TickScopedPlayerStatusRepository(inner)
+        with pytest.raises(RuntimeError, match="stage failed"):
+            with repo.tick_scope():
+                status = repo.find_by_id(PlayerId(3))
+                status.apply_damage(5)
+                status.clear_events()
+                repo.save(status)
+                raise RuntimeError("stage failed")
+
+        assert inner.find_by_id(PlayerId(3)).hp.value == 95
+
+    def test_passthrough_outside_scope(self, inner: _CountingRepository) -> None:
+        repo = TickScopedPlayerStatusRepository(inner)
+        repo.find_all()
+        repo.find_all()
+        status = repo.find_by_id(PlayerId(1))
+        repo.save(status)
+
+        assert inner.find_all_calls == 2
+        assert inner.saved == [[1]]
+        assert repo.last_tick_stats is None
+
+    def test_nested_scope_is_rejected(self, inner: _CountingRepository) -> None:
+        repo = TickScopedPlayerStatusRepository(inner)
+        with repo.tick_scope():
+            with pytest.raises(RuntimeError):
+                with repo.tick_scope():
+                    pass
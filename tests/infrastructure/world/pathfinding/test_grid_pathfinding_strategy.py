@@ -0,0 +1,171 @@
+"""GridPathfindingStrategy のテスト。
+
+既存 A* のテスト (TestAStarPathfindingStrategy) をそのまま本 strategy でも流し、
+加えてランダムなマップで A* と経路コストが一致すること、buffer の使い回し、
+grid を持たない map での委譲を確かめる。
+"""
+
+import random
+
+import pytest
+
+from ai_rpg_world.domain.common.value_object import WorldTick
+from ai_rpg_world.domain.world.aggregate.physical_map_aggregate import PhysicalMapAggregate
+from ai_rpg_world.domain.world.entity.tile import Tile
+from ai_rpg_world.domain.world.entity.world_object import WorldObject
+from ai_rpg_world.domain.world.enum.world_enum import ObjectTypeEnum
+from ai_rpg_world.domain.world.value_object.coordinate import Coordinate
+from ai_rpg_world.domain.world.value_object.movement_capability import MovementCapability
+from ai_rpg_world.domain.world.value_object.spot_id import SpotId
+from ai_rpg_world.domain.world.value_object.terrain_type import TerrainType
+from ai_rpg_world.domain.world.value_object.world_object_id import WorldObjectId
+from ai_rpg_world.infrastructure.world.pathfinding import (
+    AStarPathfindingStrategy,
+    GridPathfindingStrategy,
+)
+# クラスを名前で import すると本 module でも A* 版が収集されるので module 経由で参照する
+from tests.infrastructure.world.pathfinding import test_astar_pathfinding_strategy as astar_cases
+
+
+class TestGridPathfindingStrategyMatchesAStarCases(astar_cases.TestAStarPathfindingStrategy):
+    """既存 A* の各ケースを GridPathfindingStrategy で実行する。"""
+
+    @pytest.fixture
+    def strategy(self):
+        return GridPathfindingStrategy()
+
+    def test_find_path_with_limit_returns_partial(self, strategy, capability, simple_map):
+        """探索制限に達した場合に部分経路を返す (距離は octile + 高さの差で測る)"""
+        start = Coordinate(0, 0)
+        goal = Coordinate(4, 4)
+
+        path = strategy.find_path(start, goal, simple_map, capability, max_iterations=2)
+
+        assert len(path) > 0
+        assert path[0] == start
+        assert path[-1] != goal
+        assert _octile_distance(path[-1], goal) <= _octile_distance(start, goal)
+
+
+def _octile_distance(a, b):
+    dx, dy = abs(a.x - b.x), abs(a.y - b.y)
+    return max(dx, dy) + (2 ** 0.5 - 1) * min(dx, dy) + abs(a.z - b.z)
+
+
+def _path_cost(aggregate, path, capability, exclude_object_id=None):
+    total = 0.0
+    for a, b in zip(path, path[1:]):
+        assert a.chebyshev_distance_to(b) == 1
+        multiplier = 1.4142135623730951 if (a.x != b.x and a.y != b.y) else 1.0
+        total += aggregate.get_movement_cost(b, capability, exclude_object_id=exclude_object_id) * multiplier
+    return total
+
+
+def _random_map(rng, size, terrains, depth=1, obstacle_ratio=0.25):
+    tiles = []
+    for z in range(depth):
+        for y in range(size):
+            for x in range(size):
+                terrain = TerrainType.wall() if rng.random() < obstacle_ratio else rng.choice(terrains)
+                tiles.append(Tile(Coordinate(x, y, z), terrain))
+    return PhysicalMapAggregate.create(SpotId(1), tiles)
+
+
+def _walkable(aggregate, capability):
+    return [t.coordinate for t in aggregate.get_all_tiles() if aggregate.is_passable(t.coordinate, capability)]
+
+
+@pytest.mark.parametrize(
+    "terrains, depth",
+    [
+        ([TerrainType.road()], 1),  # JPS
+        ([TerrainType.road(), TerrainType.grass(), TerrainType.swamp()], 1),  # 整数 id の A*
+        ([TerrainType.road()], 2),  # 複数階層は A*
+    ],
+)
+def test_path_cost_matches_astar_on_random_maps(terrains, depth):
+    rng = random.Random(1234 + depth + len(terrains))
+    capability = MovementCapability.normal_walk()
+    reference = AStarPathfindingStrategy()
+    strategy = GridPathfindingStrategy()
+    for _ in range(6):
+        aggregate = _random_map(rng, 18, terrains, depth=depth)
+        walkable = _walkable(aggregate, capability)
+        for _ in range(10):
+            start, goal = rng.choice(walkable), rng.choice(walkable)
+            expected = reference.find_path(start, goal, aggregate, capability, max_iterations=100000)
+            actual = strategy.find_path(start, goal, aggregate, capability, max_iterations=100000)
+            if not expected:
+                assert actual == []
+                continue
+            assert actual[0] == start and actual[-1] == goal
+            assert all(aggregate.is_passable(c, capability) for c in actual[1:])
+            assert _path_cost(aggregate, actual, capability) == pytest.approx(
+                _path_cost(aggregate, expected, capability)
+            )
+
+
+def test_blocking_objects_and_exclude_object_id():
+    tiles = [Tile(Coordinate(x, y), TerrainType.road()) for y in range(3) for x in range(5)]
+    aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+    for oid, y in ((1, 0), (2, 1), (3, 2)):
+        aggregate.add_object(
+            WorldObject(WorldObjectId(oid), Coordinate(2, y), ObjectTypeEnum.PLAYER, is_blocking=True)
+        )
+    strategy = GridPathfindingStrategy()
+    walk = MovementCapability.normal_walk()
+
+    assert strategy.find_path(Coordinate(0, 1), Coordinate(4, 1), aggregate, walk) == []
+    path = strategy.find_path(
+        Coordinate(0, 1), Coordinate(4, 1), aggregate, walk, exclude_object_id=WorldObjectId(2)
+    )
+    assert path[-1] == Coordinate(4, 1)
+    assert Coordinate(2, 1) in path
+
+    # 障害物が動けば次の探索に反映される (buffer は使い回しても cell コストは毎回引き直す)
+    aggregate.move_object(WorldObjectId(1), Coordinate(3, 0), WorldTick(0))
+    path = strategy.find_path(Coordinate(0, 1), Coordinate(4, 1), aggregate, walk)
+    assert Coordinate(2, 0) in path
+
+
+def test_buffers_are_reused_between_searches():
+    tiles = [Tile(Coordinate(x, y), TerrainType.road()) for y in range(10) for x in range(10)]
+    aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+    strategy = GridPathfindingStrategy()
+    walk = MovementCapability.normal_walk()
+
+    strategy.find_path(Coordinate(0, 0), Coordinate(9, 9), aggregate, walk)
+    buffers = strategy._local.buffers
+    strategy.find_path(Coordinate(9, 0), Coordinate(0, 9), aggregate, walk)
+
+    assert strategy._local.buffers is buffers
+    assert buffers.generation == 2
+
+
+def test_jump_point_search_reaches_far_goal_within_default_iterations():
+    size = 120
+    tiles = [Tile(Coordinate(x, y), TerrainType.road()) for y in range(size) for x in range(size)]
+    aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+    walk = MovementCapability.normal_walk()
+
+    path = GridPathfindingStrategy().find_path(Coordinate(0, 0), Coordinate(size - 1, size - 7), aggregate, walk)
+
+    assert path[0] == Coordinate(0, 0)
+    assert path[-1] == Coordinate(size - 1, size - 7)
+    assert len(path) == size
+
+
+def test_falls_back_without_tile_grid():
+    tiles = [
+        Tile(Coordinate(0, 0), TerrainType.road()),
+        Tile(Coordinate(1, 0), TerrainType.road()),
+        Tile(Coordinate(40, 40), TerrainType.road()),
+    ]
+    aggregate = PhysicalMapAggregate.create(SpotId(1), tiles)
+    assert aggregate.tile_grid is None
+
+    path = GridPathfindingStrategy().find_path(
+        Coordinate(0, 0), Coordinate(1, 0), aggregate, MovementCapability.normal_walk()
+    )
+
+    assert path == [Coordinate(0, 0), Coordinate(1, 0)]
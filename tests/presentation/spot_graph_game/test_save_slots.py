@@ -0,0 +1,167 @@
+"""GameRuntimeManager の save slot (save_session / list_saves / load_save)。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ai_rpg_world.presentation.spot_graph_game.runtime_manager import GameRuntimeManager
+from ai_rpg_world.presentation.spot_graph_game.schemas import (
+    CharacterCreateRequest,
+    SessionCreateRequest,
+)
+from tests.runtime_config_helpers import runtime_config
+
+
+_WORLD_ID = "forbidden_library_demo"
+
+
+def _manager(tmp_path: Path, *, prewarm: bool = False) -> GameRuntimeManager:
+    return GameRuntimeManager(
+        scenarios_dir=Path("data/scenarios"),
+        characters_path=tmp_path / "characters.json",
+        runtime_config=runtime_config(),
+        saves_dir=tmp_path / "saves",
+        prewarm_save_loads=prewarm,
+    )
+
+
+def _start_session(manager: GameRuntimeManager, ticks: int) -> str:
+    character = manager.create_character(CharacterCreateRequest(name="少女"))
+    summary = manager.create_session(
+        SessionCreateRequest(world_id=_WORLD_ID, character_ids=[character.id])
+    )
+    runtime = manager._sessions[summary.session_id].runtime
+    for _ in range(ticks):
+        runtime.advance_tick()
+    return summary.session_id
+
+
+def _world_state(manager: GameRuntimeManager, session_id: str) -> dict:
+    state = manager._sessions[session_id]
+    service = manager._snapshot_session_for(state).world_snapshot_service
+    return service.capture(
+        state.runtime, source_scenario=_WORLD_ID, world_tick=0
+    ).subsystems
+
+
+class _RacingSpares(dict):
+    """prepare の存在確認をすり抜け、組み終えたときには同じ key が埋まっている。"""
+
+    def __contains__(self, key: object) -> bool:
+        return False
+
+
+class TestSaveSlots:
+
+    def test_save_then_load_restores_world_into_new_session(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        session_id = _start_session(manager, ticks=4)
+
+        slot = manager.save_session(session_id)
+        assert slot is not None
+        assert slot.status == "writing"
+        assert slot.current_tick == 4
+        assert slot.capture_ms is not None
+        manager._slot_store().flush(timeout=30.0)
+
+        (listed,) = manager.list_saves().saves
+        assert listed.save_id == slot.save_id
+        assert listed.status == "ready"
+        assert listed.size_bytes and listed.size_bytes > 0
+        assert listed.write_ms is not None
+        saved_world = _world_state(manager, session_id)
+
+        # 保存後に元 session を進めても slot の中身は変わらない
+        manager._sessions[session_id].runtime.advance_tick()
+        loaded = manager.load_save(slot.save_id)
+        assert loaded is not None
+        assert loaded.session_id != session_id
+        assert loaded.restore_ms is not None
+        restored = manager._sessions[loaded.session_id]
+        assert restored.status == "running"
+        assert restored.runtime.current_tick() == 4
+        assert _world_state(manager, loaded.session_id) == saved_world
+
+        manager.close_saves(timeout=30.0)
+        reopened = _manager(tmp_path)
+        (persisted,) = reopened.list_saves().saves
+        assert persisted.session_id == session_id
+        assert persisted.restore_ms == loaded.restore_ms
+
+    def test_prewarmed_spare_session_is_used_for_load(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path, prewarm=True)
+        session_id = _start_session(manager, ticks=2)
+        slot = manager.save_session(session_id)
+        assert slot is not None
+        manager._slot_store().flush(timeout=60.0)
+        (spare,) = manager._spare_sessions.values()
+
+        loaded = manager.load_save(slot.save_id)
+        assert loaded is not None
+        assert loaded.session_id == spare.session_id
+        assert manager._sessions[loaded.session_id].runtime.current_tick() == 2
+        manager.close_saves(timeout=60.0)
+
+    def test_spare_sessions_are_shut_down_on_close_and_when_discarded(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        manager = _manager(tmp_path, prewarm=True)
+        session_id = _start_session(manager, ticks=1)
+        slot = manager.save_session(session_id)
+        assert slot is not None
+        manager._slot_store().flush(timeout=60.0)
+        (spare,) = manager._spare_sessions.values()
+        closed: list[str] = []
+        monkeypatch.setattr(
+            manager,
+            "_close_session_state",
+            lambda state: closed.append(state.session_id),
+        )
+
+        # 組んでいる間に同じ key の spare が入っていたら、捨てる方を閉じる
+        monkeypatch.setattr(
+            manager, "_spare_sessions", _RacingSpares(manager._spare_sessions)
+        )
+        manager._prepare_spare_session(spare.world_id, list(spare.character_ids))
+        (discarded,) = closed
+        assert discarded != spare.session_id
+        assert list(manager._spare_sessions.values()) == [spare]
+
+        manager.close_saves(timeout=60.0)
+        assert closed == [discarded, spare.session_id]
+        assert not manager._spare_sessions
+
+    def test_load_waits_only_for_its_own_slot(self, tmp_path: Path) -> None:
+        """書き込み中の slot の load は、後ろに積まれた job を待たない。"""
+        import threading
+
+        manager = _manager(tmp_path)
+        session_id = _start_session(manager, ticks=1)
+        store = manager._slot_store()
+        # slot の書き込みを writer の待ち行列に残したまま load させる
+        before, after = threading.Event(), threading.Event()
+        store.submit(lambda: before.wait(timeout=5.0))
+        slot = manager.save_session(session_id)
+        assert slot is not None
+        trailing = store.submit(lambda: after.wait(timeout=5.0))
+        threading.Timer(0.1, before.set).start()
+        try:
+            loaded = manager.load_save(slot.save_id)
+            assert loaded is not None
+            assert not trailing.done()
+        finally:
+            after.set()
+            manager.close_saves(timeout=60.0)
+
+    def test_unknown_session_or_slot_returns_none(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        assert manager.save_session("missing") is None
+        assert manager.load_save("missing") is None
+        assert manager.list_saves().saves == []
+
+    def test_session_tick_lock_is_per_session(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        session_id = _start_session(manager, ticks=0)
+        assert manager.session_tick_lock(session_id) is manager._sessions[session_id].tick_lock
+        with manager.session_tick_lock("missing"):
+            pass
@@ -150,6 +150,35 @@ class TestSimulationTickLoop:
         # good は影響を受けず複数回 tick されるはず
         assert good.advance_calls >= 2
 
+    def test_broadcaster_is_published_for_ticked_sessions(self) -> None:
+        """tick が進んだセッションだけ publish_tick され、push の失敗で loop は止まらない。"""
+        manager = GameRuntimeManager()
+        running = _FakeRuntime("running")
+        _add_session(manager, "r", running)
+        _add_session(manager, "p", _FakeRuntime("paused"), status="paused")
+        published: list[str] = []
+
+        class _Broadcaster:
+            async def publish_tick(self, session_id: str, mgr: object) -> None:
+                assert mgr is manager
+                published.append(session_id)
+                raise RuntimeError("client gone")
+
+        async def scenario() -> None:
+            loop = SimulationTickLoop(
+                manager=manager, interval_seconds=0.02, broadcaster=_Broadcaster()
+            )
+            loop.start()
+            try:
+                await _wait_until(lambda: len(published) >= 2, timeout=2.0)
+            finally:
+                await loop.stop()
+
+        asyncio.run(scenario())
+
+        assert len(published) >= 2
+        assert set(published) == {"r"}
+
     def test_stop_is_idempotent_and_fast(self) -> None:
         """stop() を二度呼んでも安全で、ループ終了は速やかに完了する。"""
         manager = GameRuntimeManager()
@@ -0,0 +1,200 @@
+"""straggler 耐性 wave (``llm_turn_wave_deadline_seconds``) の挙動を保証する。
+
+- deadline までに戻らなかった Phase A は次 wave に持ち越され、他の agent の
+  Phase B を止めない
+- Phase B は投入順 (= 持ち越しが先頭) で commit される
+- 持ち越し中の agent は二重投入されず pending に戻る
+- 1 wave ごとに LLM_TURN_WAVE trace が残る
+"""
+
+import threading
+from types import SimpleNamespace
+
+from ai_rpg_world.application.llm.contracts.dtos import LlmCommandResultDto
+from ai_rpg_world.application.llm.services.sliding_window_memory import (
+    DefaultSlidingWindowMemory,
+)
+from ai_rpg_world.application.llm.services.world_llm_turn.world_access_gate import (
+    WorldAccessGate,
+)
+from ai_rpg_world.application.player.services.player_life_query import (
+    PlayerLifeQuery,
+)
+from ai_rpg_world.application.trace import TraceEventKind
+from ai_rpg_world.domain.player.value_object.player_id import PlayerId
+from ai_rpg_world.presentation.spot_graph_game.runtime_manager import (
+    _WorldLlmTurnTrigger,
+)
+
+
+class _RecorderStub:
+    def __init__(self) -> None:
+        self.records: list[tuple[str, dict]] = []
+
+    def record(self, kind, *, tick=None, player_id=None, **payload):
+        self.records.append((kind, dict(payload, tick=tick)))
+
+
+class _GamePhaseStoreStub:
+    def is_meeting(self) -> bool:
+        return False
+
+
+class _RuntimeStub:
+    _episodic_stack = None
+
+    def __init__(self, deadline: float) -> None:
+        self._runtime_config = SimpleNamespace(
+            llm_turn_parallel_workers=4,
+            llm_meeting_serial_turns=False,
+            llm_turn_wave_deadline_seconds=deadline,
+        )
+        self._game_phase_store = _GamePhaseStoreStub()
+        self._player_life_query = PlayerLifeQuery(
+            player_status_repository=None,
+            player_outcome_registry=None,
+        )
+        self.trace_recorder = _RecorderStub()
+        self.tick = 0
+
+    def current_tick(self) -> int:
+        return self.tick
+
+
+class _WiringStub:
+    """player ごとに Phase A の完了を event で制御できる wiring 代役。"""
+
+    def __init__(self, deadline: float) -> None:
+        self.runtime = _RuntimeStub(deadline)
+        self.short_term_memory = DefaultSlidingWindowMemory(
+            turn_cap=10,
+            compact_turn_count=5,
+        )
+        self.world_access_gate = WorldAccessGate()
+        self.release: dict[int, threading.Event] = {}
+        self.phase_a_calls: list[int] = []
+        self.committed: list[int] = []
+
+    def run_phase_a(self, player_id: PlayerId) -> PlayerId:
+        self.phase_a_calls.append(player_id.value)
+        gate = self.release.get(player_id.value)
+        if gate is not None:
+            gate.wait(timeout=5.0)
+        return player_id
+
+    def run_phase_b(self, phase_a: PlayerId) -> LlmCommandResultDto:
+        self.committed.append(phase_a.value)
+        return LlmCommandResultDto(success=True, message="完了した。")
+
+
+def _make(deadline: float = 0.05) -> tuple[_WorldLlmTurnTrigger, _WiringStub]:
+    wiring = _WiringStub(deadline)
+    return _WorldLlmTurnTrigger(wiring=wiring), wiring
+
+
+def _wave_events(wiring: _WiringStub) -> list[dict]:
+    return [
+        payload
+        for kind, payload in wiring.runtime.trace_recorder.records
+        if kind == TraceEventKind.LLM_TURN_WAVE
+    ]
+
+
+class TestWaveDeadline:
+    def test_straggler_is_carried_and_others_commit(self) -> None:
+        """遅い 1 人を待たずに残りの Phase B を commit する。"""
+        trigger, wiring = _make()
+        wiring.release[2] = threading.Event()
+        for pid in (1, 2, 3):
+            trigger.schedule_turn(PlayerId(pid))
+
+        trigger.run_scheduled_turns()
+
+        assert sorted(wiring.committed) == [1, 3]
+        assert list(trigger._inflight) == [2]
+        (event,) = _wave_events(wiring)
+        assert event["carried_player_ids"] == [2]
+        assert "2" in event["straggler_latency_ms"]
+        wiring.release[2].set()
+        trigger.shutdown()
+
+    def test_carried_result_commits_first_in_next_wave(self) -> None:
+        """持ち越した agent は次 wave の先頭で commit される。"""
+        trigger, wiring = _make()
+        wiring.release[2] = threading.Event()
+        trigger.schedule_turn(PlayerId(1))
+        trigger.schedule_turn(PlayerId(2))
+        trigger.run_scheduled_turns()
+        wiring.committed.clear()
+
+        wiring.release[2].set()
+        trigger.schedule_turn(PlayerId(4))
+        trigger.run_scheduled_turns()
+
+        assert wiring.committed == [2, 4]
+        assert trigger._inflight == {}
+        second = _wave_events(wiring)[-1]
+        assert second["committed_player_ids"] == [2, 4]
+        assert "2" in second["straggler_latency_ms"]
+        trigger.shutdown()
+
+    def test_inflight_player_is_not_submitted_twice(self) -> None:
+        """持ち越し中に再起床した agent は pending に戻り、LLM を二重に呼ばない。"""
+        trigger, wiring = _make()
+        wiring.release[1] = threading.Event()
+        trigger.schedule_turn(PlayerId(1))
+        trigger.run_scheduled_turns()
+
+        trigger.schedule_turn(PlayerId(1))
+        trigger.run_scheduled_turns()
+
+        assert wiring.phase_a_calls == [1]
+        assert 1 in trigger.pending_player_ids
+        assert _wave_events(wiring)[-1]["deferred_player_ids"] == [1]
+        wiring.release[1].set()
+        trigger.shutdown()
+
+    def test_without_deadline_uses_blocking_parallel_path(self) -> None:
+        """deadline 未設定なら従来どおり全員の Phase A を待つ (trace も出ない)。"""
+        trigger, wiring = _make()
+        wiring.runtime._runtime_config.llm_turn_wave_deadline_seconds = None
+        for pid in (1, 2):
+            trigger.schedule_turn(PlayerId(pid))
+
+        trigger.run_scheduled_turns()
+
+        assert sorted(wiring.committed) == [1, 2]
+        assert _wave_events(wiring) == []
+
+
+class TestWorldAccessGate:
+    def test_exclusive_waits_for_running_snapshot(self) -> None:
+        """Phase B (exclusive) は進行中の snapshot 構築が抜けるまで待つ。"""
+        gate = WorldAccessGate()
+        inside = threading.Event()
+        leave = threading.Event()
+        order: list[str] = []
+
+        def _reader() -> None:
+            with gate.snapshot():
+                inside.set()
+                leave.wait(timeout=5.0)
+                order.append("snapshot")
+
+        thread = threading.Thread(target=_reader)
+        thread.start()
+        inside.wait(timeout=5.0)
+        threading.Timer(0.05, leave.set).start()
+        with gate.exclusive():
+            order.append("exclusive")
+        thread.join(timeout=5.0)
+
+        assert order == ["snapshot", "exclusive"]
+
+    def test_track_sets_event_even_without_snapshot(self) -> None:
+        """snapshot に入らず終わった task でも待つ側が止まらない。"""
+        gate = WorldAccessGate()
+        task, done = gate.track(lambda: 42)
+
+        assert task() == 42
+        assert done.is_set()
@@ -0,0 +1,161 @@
+"""GameEventBroadcaster の per-connection queue fan-out と spot view delta。"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from ai_rpg_world.presentation.spot_graph_game.websocket_handler import (
+    GameEventBroadcaster,
+)
+
+
+class _FakeWebSocket:
+    def __init__(self, *, delay: float = 0.0, block: Optional[asyncio.Event] = None) -> None:
+        self.delay = delay
+        self.block = block
+        self.sent: list[dict[str, Any]] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        if self.block is not None:
+            await self.block.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+
+class _FakeView:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+
+    def model_dump(self) -> dict[str, Any]:
+        return dict(self.payload)
+
+
+class _FakeManager:
+    def __init__(self) -> None:
+        self.tick = 0
+        self.view: dict[str, Any] = {"spot_name": "書庫", "tick": 0, "npcs": []}
+        self.view_calls = 0
+
+    def get_session_state(self, session_id: str) -> Any:
+        return SimpleNamespace(
+            current_tick=self.tick, game_time_label=f"t{self.tick}",
+            status="running", is_ended=False,
+        )
+
+    def get_spot_view(self, session_id: str, *, character_id: Any, spot_id: Any) -> Any:
+        self.view_calls += 1
+        return _FakeView(self.view)
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+class TestBroadcastFanOut:
+
+    def test_slow_client_does_not_delay_others(self) -> None:
+        async def scenario() -> None:
+            hub = GameEventBroadcaster()
+            slow = _FakeWebSocket(delay=0.5)
+            fast = [_FakeWebSocket() for _ in range(120)]
+            await hub.connect("s", slow)
+            for ws in fast:
+                await hub.connect("s", ws)
+
+            started = asyncio.get_running_loop().time()
+            await hub.broadcast("s", {"type": "game_event", "tick": 1})
+            assert asyncio.get_running_loop().time() - started < 0.05
+            await _wait_until(lambda: all(ws.sent for ws in fast), timeout=0.3)
+            assert slow.sent == []
+            hub.disconnect("s", slow)
+            for ws in fast:
+                hub.disconnect("s", ws)
+            assert not hub.session_has_listeners("s")
+
+        asyncio.run(scenario())
+
+    def test_stalled_client_queue_is_bounded_and_coalesced(self) -> None:
+        async def scenario() -> None:
+            hub = GameEventBroadcaster(max_queue=3)
+            gate = asyncio.Event()
+            stalled = _FakeWebSocket(block=gate)
+            await hub.connect("s", stalled)
+            for tick in range(10):
+                await hub.broadcast("s", {"type": "game_event", "tick": tick}, coalesce_key="tick")
+            for n in range(5):
+                await hub.broadcast("s", {"type": "chat", "n": n})
+            (stats,) = hub.connection_stats("s")
+            # tick 10 件は 1 件に畳まれ、溢れた古いもの (tick, chat 0, 1) が捨てられる
+            assert stats == {"queued": 3, "dropped": 3, "coalesced": 9}
+
+            gate.set()
+            await _wait_until(lambda: len(stalled.sent) == 3)
+            assert [m.get("n") for m in stalled.sent] == [2, 3, 4]
+            hub.disconnect("s", stalled)
+
+        asyncio.run(scenario())
+
+    def test_failing_socket_is_disconnected(self) -> None:
+        class _Broken(_FakeWebSocket):
+            async def send_text(self, text: str) -> None:
+                raise RuntimeError("closed")
+
+        async def scenario() -> None:
+            hub = GameEventBroadcaster()
+            await hub.connect("s", _Broken())
+            await hub.broadcast("s", {"type": "game_event"})
+            await _wait_until(lambda: not hub.session_has_listeners("s"))
+
+        asyncio.run(scenario())
+
+
+class TestSpotViewDelta:
+
+    def test_delta_after_ack_and_full_without_delta(self) -> None:
+        async def scenario() -> None:
+            hub = GameEventBroadcaster()
+            manager = _FakeManager()
+            delta_ws, full_ws = _FakeWebSocket(), _FakeWebSocket()
+            await hub.connect("s", delta_ws)
+            await hub.connect("s", full_ws)
+            hub.subscribe_spot_view("s", delta_ws, character_id="c", spot_id=None,
+                                    delta=True, manager=manager)
+            hub.subscribe_spot_view("s", full_ws, character_id="c", spot_id=None,
+                                    delta=False, manager=manager)
+            await _wait_until(lambda: delta_ws.sent and full_ws.sent)
+            first = delta_ws.sent[0]
+            assert first["type"] == "spot_view" and first["revision"] == 1
+            hub.ack_spot_view("s", delta_ws, first["revision"])
+
+            # 変化が無い tick では spot view を送らない
+            await hub.publish_tick("s", manager)
+            await _wait_until(lambda: len(delta_ws.sent) == 2)
+            assert delta_ws.sent[-1]["type"] == "game_event"
+
+            manager.tick = 1
+            manager.view = {**manager.view, "tick": 1}
+            calls = manager.view_calls
+            await hub.publish_tick("s", manager)
+            await _wait_until(lambda: len(delta_ws.sent) == 4 and len(full_ws.sent) == 4)
+            assert manager.view_calls == calls + 1
+            assert delta_ws.sent[-1] == {
+                "type": "spot_view_delta", "revision": 2, "base_revision": 1,
+                "changed": {"tick": 1},
+            }
+            assert full_ws.sent[-1]["type"] == "spot_view"
+            assert full_ws.sent[-1]["view"]["tick"] == 1
+            hub.disconnect("s", delta_ws)
+            hub.disconnect("s", full_ws)
+
+        asyncio.run(scenario())
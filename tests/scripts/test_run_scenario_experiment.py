@@ -6,6 +6,7 @@ from pathlib import Path
 from types import SimpleNamespace
 
 from ai_rpg_world.application.trace import (
+    AsyncJsonlTraceRecorder,
     JsonlTraceRecorder,
     TraceEventKind,
 )
@@ -281,6 +282,26 @@ class TestBuildReport:
         assert "| 1 | 1 | 1 | 0 | 0 | 0 | 0 |" in report
         assert "| 2 | 1 | 0 | 1 | 1 | 0 | 0 |" in report
 
+    def test_legacy_html_link_strips_compression_suffix(self, tmp_path: Path) -> None:
+        """圧縮 trace (trace.jsonl.gz / .zst) の run でも legacy viewer は trace.html を指す。"""
+        scenario = tmp_path / "demo.json"
+        scenario.write_text("{}", encoding="utf-8")
+        trace_path = tmp_path / "trace.jsonl.gz"
+        with AsyncJsonlTraceRecorder(trace_path, compression="gzip") as recorder:
+            recorder.record(TraceEventKind.RUN_END, outcome="WIN", last_tick=1)
+
+        report = _build_report(
+            scenario_path=scenario,
+            trace_path=trace_path,
+            summary={
+                "outcome": "WIN",
+                "last_tick": 1,
+                "max_world_ticks": 30,
+                "elapsed_sec": 0.1,
+            },
+        )
+        assert f"- legacy HTML viewer: `{tmp_path / 'trace.html'}`" in report
+
     def test_includes_distinct_end_reason(self, tmp_path: Path) -> None:
         """世界内終了と外的停止を区別できるよう、終了理由をreportへ残す。"""
         scenario = tmp_path / "demo.json"
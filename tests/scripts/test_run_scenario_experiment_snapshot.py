@@ -394,5 +394,7 @@ class TestSnapshotArgs:
         # 受け取った drive 引数に snapshot_save_dir が乗っている。
         assert captured["snapshot_save_dir"] == save_dir
         assert captured["snapshot_load_dir"] is None
+        # --world-checkpoint-every 未指定なら定期 checkpoint は取らない。
+        assert captured["world_checkpoint_every"] == 0
         # --snapshot-save-dir 指定時は事前に mkdir される。
         assert save_dir.exists()